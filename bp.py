@@ -19,7 +19,7 @@ class BP:
         self.timeout = 0
 
     def _controlRead_mem(self, req, max_read, addr, dump_len):
-        ret = ''
+        ret = bytearray(dump_len)
         i = 0
         while i < dump_len:
             l_this = min(dump_len - i, max_read)
@@ -30,14 +30,14 @@ class BP:
                                        addr + i,
                                        l_this,
                                        timeout=self.timeout)
-            ret += res
             if len(res) != l_this:
                 raise Exception("wanted 0x%04X bytes but got 0x%04X" % (
                     l_this,
                     len(res),
                 ))
+            ret[i:i + l_this] = res
             i += max_read
-        return ret
+        return bytes(ret)
 
     def _controlWrite_mem(self, req, max_write, addr, buff):
         i = 0
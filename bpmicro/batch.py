@@ -0,0 +1,203 @@
+'''
+Production batch programming: program / verify a run of parts unattended
+
+Part insertion and removal are detected by polling the programmer
+(see Station.sense) instead of waiting for an operator to press enter
+
+Manifest (JSON):
+{"jobs": [
+    {"device": "pic16f84", "image": "code.bin", "count": 100},
+    {"device": "i87c51", "op": "read", "count": 5}
+]}
+-op: program (default) or read
+-image: code file to program, relative to the manifest
+-data: optional data (ex: EEPROM) file to program
+-count: parts to do. 0 => until interrupted
+-cont: continuity check during the operation (default true)
+
+Each part is logged as one JSON line:
+{"part": 1, "job": 0, "device": "...", "ok": true, "times": {"program": 1.2, ...}, ...}
+'''
+
+from bpmicro import cmd
+from bpmicro import devices
+from bpmicro.usb import ValidateError
+
+import hashlib
+import json
+import os
+import time
+
+import libusb1
+
+# Seconds between presence polls
+POLL = 0.25
+# Consecutive identical polls before a presence change is accepted
+DEBOUNCE = 3
+
+
+class VerifyError(Exception):
+    pass
+
+
+# Errors that fail a part but leave the station running
+part_errors = (cmd.BusError, cmd.Overcurrent, cmd.ContFail, cmd.BadPrefix,
+               VerifyError)
+
+
+def load_manifest(fn):
+    j = json.load(open(fn))
+    base = os.path.dirname(os.path.abspath(fn))
+    jobs = []
+    for job in j['jobs']:
+        job = dict(job)
+        job.setdefault('op', 'program')
+        job.setdefault('count', 0)
+        job.setdefault('cont', True)
+        if job['op'] not in ('program', 'read'):
+            raise ValueError("Bad job op %s" % job['op'])
+        for k in ('image', 'data'):
+            if job.get(k):
+                job[k] = os.path.join(base, job[k])
+        if job['op'] == 'program' and not job.get('image'):
+            raise ValueError("%s: program job needs an image" % job['device'])
+        jobs.append(job)
+    return jobs
+
+
+def job_devcfg(job):
+    devcfg = {'code': open(job['image'], 'rb').read()}
+    if job.get('data'):
+        devcfg['data'] = open(job['data'], 'rb').read()
+    return devcfg
+
+
+class Station(object):
+    '''
+    bp: programmer (see startup.get)
+    log_fn: per part JSON lines log, appended to
+    '''
+    def __init__(self, bp, log_fn=None, verbose=False):
+        self.bp = bp
+        self.verbose = verbose
+        self.log_f = open(log_fn, 'a') if log_fn else None
+        self.parts = 0
+        self.fails = 0
+        # phase => total seconds
+        self.phase_times = {}
+        self.tstart = None
+
+    def sense(self):
+        '''
+        Return True if a part looks inserted
+        SM missing (gpio) or continuity failing (check_cont) => no part
+        The continuity check times out with nothing in the socket
+        Odd replies while a part is being seated also count as no part
+        '''
+        try:
+            if not cmd.sm_is_inserted(cmd.gpio_readi(self.bp)):
+                return False
+            cmd.check_cont(self.bp)
+        except (cmd.ContFail, cmd.BadPrefix, ValidateError,
+                libusb1.USBError):
+            return False
+        return True
+
+    def wait_part(self, present):
+        '''Block until sense() has returned present DEBOUNCE times in a row'''
+        n = 0
+        while n < DEBOUNCE:
+            if self.sense() == present:
+                n += 1
+            else:
+                n = 0
+            if n < DEBOUNCE:
+                time.sleep(POLL)
+
+    def phase(self, times, name, f, *args):
+        tstart = time.time()
+        try:
+            return f(*args)
+        finally:
+            dt = time.time() - tstart
+            times[name] = dt
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + dt
+
+    def do_part(self, jobi, job, device, devcfg):
+        times = {}
+        entry = {
+            'part': self.parts + 1,
+            'job': jobi,
+            'device': job['device'],
+            'op': job['op'],
+            'time': time.time(),
+            'times': times,
+        }
+        opts = {'cont': job['cont'], 'verbose': self.verbose}
+        try:
+            if job['op'] == 'program':
+                self.phase(times, 'program', device.program, devcfg,
+                           dict(opts, verify=False))
+                readback = self.phase(times, 'verify', device.read, opts)
+                if bytes(readback['code'][0:len(devcfg['code'])]) != bytes(
+                        devcfg['code']):
+                    raise VerifyError('code readback mismatch')
+            else:
+                readback = self.phase(times, 'read', device.read, opts)
+            entry['md5'] = hashlib.md5(bytes(readback['code'])).hexdigest()
+            entry['ok'] = True
+        except part_errors as e:
+            entry['ok'] = False
+            entry['error'] = type(e).__name__
+            entry['msg'] = str(e)
+            self.fails += 1
+        self.parts += 1
+        self.log(entry)
+        return entry
+
+    def log(self, entry):
+        if self.log_f:
+            self.log_f.write(json.dumps(entry, sort_keys=True) + '\n')
+            self.log_f.flush()
+        print(('Part %u: %s%s' %
+               (entry['part'], 'PASS' if entry['ok'] else 'FAIL',
+                '' if entry['ok'] else
+                ' (%s: %s)' % (entry['error'], entry['msg']))))
+
+    def run(self, jobs):
+        self.tstart = time.time()
+        try:
+            for jobi, job in enumerate(jobs):
+                device = devices.get(self.bp,
+                                     job['device'],
+                                     verbose=self.verbose)
+                devcfg = job_devcfg(job) if job['op'] == 'program' else None
+                done = 0
+                while not job['count'] or done < job['count']:
+                    print(('Job %u (%s): insert part %u' %
+                           (jobi, job['device'], done + 1)))
+                    self.wait_part(True)
+                    self.do_part(jobi, job, device, devcfg)
+                    done += 1
+                    print('Remove part')
+                    self.wait_part(False)
+        except KeyboardInterrupt:
+            print('Interrupted')
+        finally:
+            self.report()
+            if self.log_f:
+                self.log_f.close()
+                self.log_f = None
+
+    def report(self):
+        dt = time.time() - self.tstart
+        print("")
+        print(('Parts: %u, pass: %u, fail: %u' %
+               (self.parts, self.parts - self.fails, self.fails)))
+        if dt > 0:
+            print(('Elapsed: %0.1f sec, %0.1f parts / hour' %
+                   (dt, self.parts * 3600.0 / dt)))
+        if not self.parts:
+            return
+        for name, total in sorted(self.phase_times.items()):
+            print(('  %-8s %0.2f sec / part' % (name, total / self.parts)))
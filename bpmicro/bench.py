@@ -0,0 +1,228 @@
+'''
+Throughput benchmark against the replay simulator (see sim.py)
+
+Captures are looked up in a directory by name:
+-<device>_read.json: Device.read()
+-<device>_program.json + <device>_program.bin: Device.program()
+-bp1410_init_cold.json, bp1410_init_warm.json: bp1410.init_dev()
+Missing captures are skipped. No captures ship with bpmicro: record them with
+usbrply -j (see README.txt). A directory with none of them is an error
+
+Results are saved as JSON so a later run can be compared against them
+fast (see cmd.readonly) runs are checked against normal runs: the part must
+see the same writes and reads must return the same data
+'''
+
+from bpmicro import startup
+from bpmicro import devices
+from bpmicro import bp1410
+from bpmicro import cmd
+
+import datetime
+import hashlib
+import json
+import os
+import sys
+import time
+
+# Relative slowdown before a result is flagged
+TOLERANCE = 0.10
+
+
+class NoCaptures(Exception):
+    pass
+
+
+class NullIO(object):
+    def write(self, data):
+        pass
+
+    def flush(self):
+        pass
+
+
+def cpu_time():
+    t = os.times()
+    return t[0] + t[1]
+
+
+def result_digest(ret):
+    '''Digest of what a job returned (ex: devcfg from read)'''
+    h = hashlib.md5()
+    if isinstance(ret, dict):
+        for k in sorted(ret.keys()):
+            v = ret[k]
+            h.update(k.encode('ascii'))
+            if isinstance(v, (bytes, bytearray)):
+                h.update(bytes(v))
+            else:
+                h.update(json.dumps(v, sort_keys=True).encode('ascii'))
+    return h.hexdigest()
+
+
+def measure(bp, f, iters):
+    '''Run f(bp) iters times, rewinding the capture before each run'''
+    dev = bp.dev
+    wall = 0.0
+    cpu = 0.0
+    ret = None
+    for _i in range(iters):
+        dev.reset()
+        stdout = sys.stdout
+        sys.stdout = NullIO()
+        try:
+            tstart = time.time()
+            cstart = cpu_time()
+            ret = f(bp)
+            cend = cpu_time()
+            tend = time.time()
+        finally:
+            sys.stdout = stdout
+        wall += tend - tstart
+        cpu += cend - cstart
+    return {
+        'wall': wall / iters,
+        'cpu': cpu / iters,
+        'transactions': dev.transactions,
+        'bytes_in': dev.bytes_in,
+        'bytes_out': dev.bytes_out,
+        'result': result_digest(ret),
+        'writes': dev.write_digest.hexdigest(),
+    }
+
+
+def jobs(capture_dir, device_names=None, opts=None):
+    '''Yield (name, capture file name, function to benchmark)'''
+    opts = opts or {}
+    if device_names is None:
+        device_names = sorted(devices.class_s2c.keys())
+    for boot in ('cold', 'warm'):
+        fn = os.path.join(capture_dir, 'bp1410_init_%s.json' % boot)
+        if os.path.exists(fn):
+            yield ('bp1410.init_%s' % boot, fn,
+                   lambda bp: bp1410.init_dev(bp))
+    for device in device_names:
+        fn = os.path.join(capture_dir, '%s_read.json' % device)
+        if os.path.exists(fn):
+            yield ('%s.read' % device, fn,
+                   lambda bp, device=device: devices.get(bp, device).read(
+                       dict(opts)))
+        fn = os.path.join(capture_dir, '%s_program.json' % device)
+        code_fn = os.path.join(capture_dir, '%s_program.bin' % device)
+        if os.path.exists(fn) and os.path.exists(code_fn):
+            devcfg = {'code': open(code_fn, 'rb').read()}
+            yield ('%s.program' % device, fn,
+                   lambda bp, device=device, devcfg=devcfg: devices.get(
+                       bp, device).program(devcfg, dict(opts)))
+
+
+def run(capture_dir,
+        device_names=None,
+        iters=3,
+        opts=None,
+        verbose=False,
+        fast=False):
+    '''fast: skip read only steps (see cmd.readonly)'''
+    results = {}
+    if not list(jobs(capture_dir, device_names, opts=opts)):
+        raise NoCaptures("%s: no benchmark captures (see bench.py)" %
+                         capture_dir)
+    fast_orig = cmd.fast
+    cmd.fast = fast
+    try:
+        for name, fn, f in jobs(capture_dir, device_names, opts=opts):
+            bp = startup.get_replay(fn)
+            try:
+                results[name] = measure(bp, f, iters)
+            except Exception as e:
+                results[name] = {'error': '%s: %s' % (type(e).__name__, e)}
+            if verbose:
+                print_result(name, results[name])
+    finally:
+        cmd.fast = fast_orig
+    return {
+        'date': datetime.datetime.utcnow().isoformat(),
+        'iters': iters,
+        'opts': opts or {},
+        'fast': fast,
+        'results': results,
+    }
+
+
+def run_fast(capture_dir, device_names=None, iters=3, opts=None,
+             verbose=False):
+    '''
+    Run normally and with fast set
+    Return (normal results, fast results, list of (name, key) output differences)
+    '''
+    # Coalescing would fold unrelated writes into read only steps
+    coalesce_orig = cmd.coalesce
+    cmd.coalesce = False
+    try:
+        normal = run(capture_dir, device_names, iters, opts, verbose=verbose)
+        if verbose:
+            print('fast:')
+        fast = run(capture_dir,
+                   device_names,
+                   iters,
+                   opts,
+                   verbose=verbose,
+                   fast=True)
+    finally:
+        cmd.coalesce = coalesce_orig
+    diffs = []
+    for name, cur in sorted(fast['results'].items()):
+        base = normal['results'].get(name)
+        if base is None or 'error' in base:
+            continue
+        if 'error' in cur:
+            diffs.append((name, 'error'))
+            continue
+        for k in ('result', 'writes'):
+            if cur[k] != base[k]:
+                diffs.append((name, k))
+        if verbose:
+            print(('%-24s fast: %u => %u xfers, %0.4f => %0.4f s' %
+                   (name, base['transactions'], cur['transactions'],
+                    base['wall'], cur['wall'])))
+    return normal, fast, diffs
+
+
+def print_result(name, result):
+    if 'error' in result:
+        print(('%-24s ERROR %s' % (name, result['error'])))
+        return
+    print(('%-24s wall %8.4f s, cpu %8.4f s, %6u xfers, %8u B in, %8u B out'
+           % (name, result['wall'], result['cpu'], result['transactions'],
+              result['bytes_in'], result['bytes_out'])))
+
+
+def compare(baseline, current, tolerance=TOLERANCE):
+    '''Return list of (name, key, baseline value, current value) regressions'''
+    ret = []
+    for name, cur in sorted(current['results'].items()):
+        base = baseline['results'].get(name)
+        if base is None or 'error' in base:
+            continue
+        if 'error' in cur:
+            ret.append((name, 'error', None, cur['error']))
+            continue
+        for k in ('wall', 'cpu'):
+            if cur[k] > base[k] * (1.0 + tolerance):
+                ret.append((name, k, base[k], cur[k]))
+        for k in ('transactions', 'bytes_in', 'bytes_out'):
+            if cur[k] > base[k]:
+                ret.append((name, k, base[k], cur[k]))
+    return ret
+
+
+def save(results, fn):
+    json.dump(results,
+              open(fn, 'w'),
+              sort_keys=True,
+              indent=4,
+              separators=(',', ': '))
+
+
+def load(fn):
+    return json.load(open(fn))
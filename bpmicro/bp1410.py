@@ -63,6 +63,7 @@ def boot_warm(dev):
     #cmd.cmd_01(dev)
 
 
+@cmd.batched
 def init_dev(dev, verbose=False):
     bulkRead, bulkWrite, controlRead, controlWrite = usb_wraps(dev)
 
@@ -2,7 +2,7 @@
 Functionality based on bulk 0x02 write + optional bulk 0x86 read 
 '''
 
-from bpmicro.usb import usb_wraps
+from bpmicro.usb import usb_wraps, transport
 from bpmicro.usb import validate_read, validate_readv
 from bpmicro.util import hexdump, where
 from bpmicro import util
@@ -11,7 +11,7 @@ import binascii
 import struct
 import libusb1
 import time
-from collections import namedtuple, OrderedDict
+from collections import namedtuple, OrderedDict, deque
 
 bulk86_dbg = 0
 splits = [0]
@@ -47,9 +47,50 @@ class SMNotFound(Exception):
     pass
 
 
+def frame_decode(p):
+    '''
+    Split a raw bulk 0x86 transfer into (prefix, payload, size)
+    payload is a memoryview into p: no copy is made
+
+    Ex: need to read 4096 bytes
+    Max buffer packet size is 512 bytes
+    but for some reason only uses up to 256 bytes of real data
+    + 3 framing bytes and 0 fills the rest to form 512 byte transfer
+    '''
+    prefix = struct.unpack_from('<B', p, 0)[0]
+    size = struct.unpack_from('<H', p, len(p) - 2)[0]
+    # No harm seen in always truncating
+    return prefix, memoryview(p)[1:1 + size], size
+
+
+class FrameAssembler(object):
+    '''
+    Collect bulk 0x86 payloads into a single bytearray
+    Each payload byte is copied exactly once, from the USB buffer into the result
+    If the final size is known the result is allocated up front
+    '''
+    def __init__(self, target=None):
+        self.buff = bytearray(target or 0)
+        self.pos = 0
+
+    def __len__(self):
+        return self.pos
+
+    def add(self, payload):
+        end = self.pos + len(payload)
+        # Grows the buffer if we run past the preallocated size
+        self.buff[self.pos:end] = payload
+        self.pos = end
+
+    def getvalue(self):
+        if self.pos != len(self.buff):
+            del self.buff[self.pos:]
+        return self.buff
+
+
 # prefix: leave to external logic to packetize
 def bulk86(dev, target=None, donef=None, prefix=None):
-    bulkRead, _bulkWrite, _controlRead, _controlWrite = usb_wraps(dev)
+    bulkRead = transport(dev).bulkRead
 
     dbg = bulk86_dbg
 
@@ -65,44 +106,14 @@ def bulk86(dev, target=None, donef=None, prefix=None):
     # AFAIK certain packets have no way of knowing done
     # other than knowing in advance how many bytes you should expect
     # Strange since there are continue markers
-    if donef is None and target is not None:
+    # If no donef is given, done is when we have target bytes
 
-        def donef(buff):
-            return len(buff) == target
-
-    '''
-    Ex: need to read 4096 bytes
-    Max buffer packet size is 512 bytes
-    but for some reason only uses up to 256 bytes of real data
-    + 3 framing bytes and 0 fills the rest to form 512 byte transfer
-    So to transfer the data 
-    '''
-    def nxt_buff():
-        if dbg:
-            print('  nxt_buff: reading')
-        p = bytearray(bulkRead(0x86, 0x0200))
-        if dbg:
-            hexdump(p, label='  nxt_buff', indent='    ')
-        #print(str2hex(p))
-        prefix_this = p[0]
-        size = (p[-1] << 8) | p[-2]
-        '''
-        if size != len(p) - 3:
-            if truncate and size < len(p) - 3:
-                return prefix_this, p[1:1 + size], suffix_this
-            else:
-                print('Truncate: %s' % truncate)
-                print(size, len(p) - 3, len(p))
-                hexdump(p)
-                raise Exception("Bad length (enable truncation?)")
-        return prefix_this, p[1:-2], suffix_this
-        '''
-        # No harm seen in always truncating
-        return prefix_this, p[1:1 + size]
-
-    buff = ''
+    buff = FrameAssembler(target)
     while True:
-        if donef and donef(buff):
+        if donef is not None:
+            if donef(buff):
+                break
+        elif target is not None and len(buff) == target:
             break
 
         # Test on "packet 152/153" (0x64 byte response)
@@ -111,21 +122,25 @@ def bulk86(dev, target=None, donef=None, prefix=None):
         if dbg and buff:
             print(('  NOTE: split packet.  Have %d / %s bytes' %
                    (len(buff), target)))
-            hexdump(buff, indent='    ')
+            hexdump(buff.buff[:len(buff)], indent='    ')
             splits[0] += 1
         try:
             # Ignore suffix continue until we have a reason to care
             if dbg:
                 tstart = time.time()
-            prefix_this, buff_this = nxt_buff()
+                print('  nxt_buff: reading')
+            p = bulkRead(0x86, 0x0200)
+            if dbg:
+                hexdump(p, label='  nxt_buff', indent='    ')
+            prefix_this, buff_this, _size = frame_decode(p)
             if dbg:
                 tend = time.time()
                 print(('  time: %0.3f' % (tend - tstart, )))
-            buff += buff_this
+            buff.add(buff_this)
 
             if prefix is not None:
                 if prefix != prefix_this:
-                    hexdump(buff_this)
+                    hexdump(buff_this.tobytes())
                     raise BadPrefix('Wanted prefix 0x%02X, got 0x%02X' %
                                     (prefix, prefix_this))
             elif prefix_this == 0x08:
@@ -133,7 +148,12 @@ def bulk86(dev, target=None, donef=None, prefix=None):
             else:
                 raise BadPrefix('Unknown prefix 0x%02X' % prefix_this)
 
-            if donef and not donef(buff):
+            if donef is not None:
+                if not donef(buff):
+                    if dbg:
+                        print('  continue: not done')
+                    continue
+            elif target is not None and len(buff) != target:
                 if dbg:
                     print('  continue: not done')
                 continue
@@ -146,10 +166,11 @@ def bulk86(dev, target=None, donef=None, prefix=None):
             #if prefix is None:
             #    return buff
             raise
+    buff = buff.getvalue()
     #print('Done w/ buff len %d' % len(buff))
     if target is not None and len(buff) != target:
         hexdump(buff, label='Wrong size', indent='  ')
-        prefix_this, buff_this = nxt_buff()
+        bulkRead(0x86, 0x0200)
         raise Exception('Target len: buff %d != target %d' %
                         (len(buff), target))
     if dbg:
@@ -161,51 +182,324 @@ def bulk86(dev, target=None, donef=None, prefix=None):
 # FIXME: with target set small but not truncate will happily truncate
 # FIXME: suffix 1 means continue read.  Make higher level func
 def bulk2(dev, cmd, target=None, donef=None, prefix=None):
-    _bulkRead, bulkWrite, _controlRead, _controlWrite = usb_wraps(dev)
-
-    bulkWrite(0x02, cmd)
+    dev = transport(dev)
+    dev.bulkWrite(0x02, cmd)
     return bulk86(dev, target=target, donef=donef, prefix=prefix)
 
 
-def bulk86_next_read(dev):
-    bulkRead, _bulkWrite, _controlRead, _controlWrite = usb_wraps(dev)
+def upload_chunks(data, chunk_size=0xCC):
     '''
-    Ex: need to read 4096 bytes
-    Max buffer packet size is 512 bytes
-    but for some reason only uses up to 256 bytes of real data
-    + 3 framing bytes and 0 fills the rest to form 512 byte transfer
-    So to transfer the data 
+    Split data into length prefixed upload chunks
+    Return list of (command, ack prefix, ack)
+    -Intermediate chunks are acked "\x0B" with prefix 0x18 (continue)
+    -The final chunk is acked "\x00" with prefix 0x08
     '''
-    p = bytearray(bulkRead(0x86, 0x0200))
-    #print(str2hex(p))
-    prefix_this = p[0]
-    size = (p[-1] << 8) | p[-2]
-    # No harm seen in always truncating
-    return prefix_this, p[1:1 + size], size
+    ret = []
+    pos = 0
+    while pos < len(data):
+        chunk = data[pos:pos + chunk_size]
+        pos += len(chunk)
+        if pos == len(data):
+            ret.append((chr(len(chunk)) + '\x00' + chunk, 0x08, "\x00"))
+        else:
+            ret.append((chr(len(chunk)) + '\x00' + chunk, 0x18, "\x0B"))
+    return ret
 
 
-def bulk2b(dev, cmd):
+def upload_windowed(dev, data, window=1, chunk_size=0xCC, msg="upload",
+                    verbose=False):
     '''
-    Issue bulk 0x02 command and collate / return bulk 0x86 responses
-    prefix is always 0x08?
+    Upload data as upload_chunks(), keeping up to window chunks in flight
+    Acks are checked in order against the chunk that produced them
+    window=1 is stop-and-wait (as BPWin does)
+
+    Larger windows rely on the adapter queuing acks until they are read
+    On a bad ack the transfer is abandoned with acks still pending
     '''
-    _bulkRead, bulkWrite, _controlRead, _controlWrite = usb_wraps(dev)
+    if window < 1:
+        raise ValueError("Bad window %s" % window)
+    bulkWrite = transport(dev).bulkWrite
+    chunks = upload_chunks(data, chunk_size)
+    # Chunk indexes written but not yet acked
+    inflight = deque()
+    chunki = 0
+    while chunki < len(chunks) or inflight:
+        while chunki < len(chunks) and len(inflight) < window:
+            out, prefix, _ack = chunks[chunki]
+            if verbose:
+                print(('  chunk %u, len 0x%02X, prefix 0x%02X' %
+                       (chunki, len(out) - 2, prefix)))
+            bulkWrite(0x02, out)
+            inflight.append(chunki)
+            chunki += 1
+        acki = inflight.popleft()
+        _out, prefix, ack = chunks[acki]
+        buff = bulk86(dev, target=0x01, prefix=prefix)
+        validate_read(ack, buff, "%s: chunk %u ack" % (msg, acki))
+
+
+def bulk86_next_read(dev):
+    prefix_this, payload, size = frame_decode(
+        transport(dev).bulkRead(0x86, 0x0200))
+    return prefix_this, bytearray(payload), size
+
+
+def bulk2b_stream(dev, cmd):
+    '''
+    bulk2b() that yields each bulk 0x86 payload (memoryview) as it arrives
+    A payload is only valid until the next one is requested
+    '''
+    bulkRead, bulkWrite, _controlRead, _controlWrite = usb_wraps(dev)
 
     bulkWrite(0x02, cmd)
-    ret = ''
     while True:
         # When is prefix not 0x08?
-        _prefix, this, size = bulk86_next_read(dev)
-        ret += this
+        _prefix, this, size = frame_decode(bulkRead(0x86, 0x0200))
+        yield this
         # FIXME: hack
         # Originally I thought this was end of stream flag, but its actually size upper bit
         # What is the proper check?
         # Possibly this...next would return 0 bytes?
         if size < 0x1fd:
             break
+
+
+def bulk2b(dev, cmd):
+    '''
+    Issue bulk 0x02 command and collate / return bulk 0x86 responses
+    prefix is always 0x08?
+    '''
+    ret = FrameAssembler()
+    for this in bulk2b_stream(dev, cmd):
+        ret.add(this)
+    return ret.getvalue()
+
+
+# Set to coalesce write only commands (see Batch)
+coalesce = False
+
+# Upload chunks device code keeps in flight (see upload_windowed)
+# 1: stop-and-wait, as BPWin. Larger windows are not yet validated on hardware
+upload_window = 1
+
+# Set to skip read only verification steps (see readonly)
+fast = False
+# Step name => times skipped
+ro_skipped = {}
+# Nonzero while a read only step is executing
+ro_depth = 0
+
+
+def readonly(f):
+    '''
+    Tag a read only verification step
+    These only confirm state BPWin saw in the original capture
+    and can be skipped (returning None) when running trusted (fast set)
+    Only tag steps whose result generated code doesn't use
+    Keep gpio_readi() out of tagged steps: eeprom_cache relies on it
+    '''
+    def wrapper(*args, **kwargs):
+        global ro_depth
+
+        if fast:
+            ro_skipped[f.__name__] = ro_skipped.get(f.__name__, 0) + 1
+            return None
+        ro_depth += 1
+        try:
+            return f(*args, **kwargs)
+        finally:
+            ro_depth -= 1
+
+    wrapper.__name__ = f.__name__
+    wrapper.__doc__ = f.__doc__
+    wrapper.readonly = True
+    return wrapper
+
+# Commands known to have no bulk 0x86 reply: opcode => command length
+wo_cmd_lens = {
+    # cmd_09
+    0x09: 5,
+    # led_mask. The 3 byte 0x0C ... 0x30 form replies
+    0x0C: 2,
+    # cmd_20
+    0x20: 3,
+    # cmd_41
+    0x41: 3,
+    # cmd_43
+    0x43: 5,
+    # cmd_4C
+    0x4C: 3,
+    # cmd_50: announces a payload in the next transfer
+    0x50: 5,
+}
+
+
+def wo_split(cmd):
+    '''
+    Split a bulk 0x02 transfer into write only commands
+    Return None if anything in it may produce a reply
+    '''
+    cmd = bytearray(cmd)
+    ret = []
+    pos = 0
+    while pos < len(cmd):
+        n = wo_cmd_lens.get(cmd[pos])
+        if n is None or pos + n > len(cmd):
+            return None
+        ret.append(cmd[pos])
+        pos += n
     return ret
 
 
+class Batch(object):
+    '''
+    Coalesce write only bulk 0x02 commands (cmd_50, cmd_41, cmd_4C, cmd_43, cmd_09...)
+    Same interface as the USB device it wraps
+
+    BPWin chains commands in a single transfer
+    ex: "\x57\x82\x00 \x20\x01\x00 \x2B\x3B..."
+    so write only commands are held back and sent in front of the next
+    command, whose reply is then read as usual
+    Anything else touching the bus flushes them as one transfer first
+    A cmd_50 payload is never merged with its announcement
+    As a context manager (or see batched) held back commands are sent on exit
+    USBStats charges a merged transfer to the command after the held back ones
+    '''
+
+    # Keep merged transfers to a single USB packet
+    max_size = 0x200
+
+    def __init__(self, dev, enabled=None):
+        # Transport: takes cmd_pos
+        self.dev = transport(dev)
+        self.enabled = coalesce if enabled is None else enabled
+        self.timeout = 1000
+        self.pending = []
+        self.pending_len = 0
+        # Next transfer is a raw payload, not a command
+        self.pending_payload = False
+        # Statistics
+        self.cmds = 0
+        self.transfers = 0
+        self.wraps = (self.bulkRead, self.bulkWrite, self.controlRead,
+                      self.controlWrite)
+
+    def _take(self):
+        if not self.pending:
+            return b''
+        data = self.pending[0][:0].join(self.pending)
+        self.pending = []
+        self.pending_len = 0
+        return data
+
+    def flush(self, timeout=None):
+        timeout = timeout if timeout is not None else self.timeout
+        if self.pending:
+            self.transfers += 1
+            self.dev.bulkWrite(0x02, self._take(), timeout=timeout)
+
+    def discard(self):
+        '''Drop held back commands'''
+        self._take()
+        self.pending_payload = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.flush()
+            return
+        # Uncoalesced, these would have reached the device before the error
+        # Don't let a second failure hide the first one
+        try:
+            self.flush()
+        except Exception:
+            self.discard()
+
+    def bulkWrite(self, endpoint, data, timeout=None, cmd_pos=0):
+        timeout = timeout if timeout is not None else self.timeout
+        if not self.enabled:
+            return self.dev.bulkWrite(endpoint,
+                                      data,
+                                      timeout=timeout,
+                                      cmd_pos=cmd_pos)
+
+        self.cmds += 1
+        wo = None
+        if endpoint == 0x02 and not self.pending_payload:
+            wo = wo_split(data)
+        if wo:
+            if self.pending_len + len(data) > self.max_size:
+                self.flush(timeout=timeout)
+            self.pending.append(data)
+            self.pending_len += len(data)
+            self.pending_payload = wo[-1] == 0x50
+            return
+        if (endpoint == 0x02 and not self.pending_payload
+                and self.pending_len + len(data) <= self.max_size):
+            cmd_pos += self.pending_len
+            self.pending.append(data)
+            data = self._take()
+        else:
+            self.flush(timeout=timeout)
+        self.pending_payload = False
+        self.transfers += 1
+        self.dev.bulkWrite(endpoint, data, timeout=timeout, cmd_pos=cmd_pos)
+
+    def bulkRead(self, endpoint, length, timeout=None):
+        timeout = timeout if timeout is not None else self.timeout
+        self.flush(timeout=timeout)
+        return self.dev.bulkRead(endpoint, length, timeout=timeout)
+
+    def controlRead(self,
+                    request_type,
+                    request,
+                    value,
+                    index,
+                    length,
+                    timeout=None):
+        timeout = timeout if timeout is not None else self.timeout
+        self.flush(timeout=timeout)
+        return self.dev.controlRead(request_type,
+                                    request,
+                                    value,
+                                    index,
+                                    length,
+                                    timeout=timeout)
+
+    def controlWrite(self,
+                     request_type,
+                     request,
+                     value,
+                     index,
+                     data,
+                     timeout=None):
+        timeout = timeout if timeout is not None else self.timeout
+        self.flush(timeout=timeout)
+        self.dev.controlWrite(request_type,
+                              request,
+                              value,
+                              index,
+                              data,
+                              timeout=timeout)
+
+
+def batched(f):
+    '''
+    Run f(dev, ...) with dev wrapped in a Batch
+    Held back commands are sent when f returns or raises
+    '''
+    def wrapper(dev, *args, **kwargs):
+        with Batch(dev) as batch:
+            return f(batch, *args, **kwargs)
+
+    wrapper.__name__ = f.__name__
+    wrapper.__doc__ = f.__doc__
+    wrapper.__wrapped__ = f
+    return wrapper
+
+
 # 0x40 words
 SM_FMT, SM = util.mkstruct(
     'SM',
@@ -304,16 +598,78 @@ def periph_r(dev, periph, start, end):
 
 # Teach adapter (ex: TA84VLV_FX4) EEPROM
 def ta_r(dev, start=0, end=0x3F):
+    if cache_eeprom:
+        return eeprom_cache.ta_r(dev, start, end)
     # bulk2(dev, "\x22\x01" + chr(start) + "\x00" + chr(end) + "\x00\x06"
     return periph_r(dev, 0x01, start, end)
 
 
 # Read socket module (ex: SM84) EEPROM
 def sm_r(dev, start=0, end=0x3F):
+    if cache_eeprom:
+        return eeprom_cache.sm_r(dev, start, end)
     # bulk2(dev, "\x22\x02" + chr(start) + "\x00" + chr(end) + "\x00\x06"
     return periph_r(dev, 0x02, start, end)
 
 
+# Set to serve SM / TA EEPROM reads from eeprom_cache
+cache_eeprom = False
+
+
+class EepromCache(object):
+    '''
+    Whole SM and TA EEPROM images, each read in one transfer on first use
+    Sub-range reads (sm_r, ta_r, sm_info3...) are then sliced from memory
+    Dropped when gpio_readi() sees the smn (SM present) bit change
+
+    The SM insertion counters (0x10:0x13) are only as fresh as the last
+    SM change. They are informational
+    '''
+    def __init__(self):
+        self.sm = None
+        self.ta = None
+        # Last seen smn bit, None => not yet seen
+        self.smn = None
+
+    def invalidate(self):
+        self.sm = None
+        self.ta = None
+        self.smn = None
+
+    def gpio(self, gpio):
+        smn = gpio & gpio_i2s['smn']
+        if self.smn is not None and smn != self.smn:
+            self.sm = None
+            self.ta = None
+        self.smn = smn
+
+    def sm_get(self, dev):
+        if self.sm is None:
+            self.sm = periph_r(dev, 0x02, 0x00, 0x3F)
+        return self.sm
+
+    def ta_get(self, dev):
+        if self.ta is None:
+            self.ta = periph_r(dev, 0x01, 0x00, 0x3F)
+        return self.ta
+
+    def sm_r(self, dev, start=0, end=0x3F):
+        # Addresses are inclusive 16 bit words
+        return self.sm_get(dev)[start * 2:(end + 1) * 2]
+
+    def ta_r(self, dev, start=0, end=0x3F):
+        return self.ta_get(dev)[start * 2:(end + 1) * 2]
+
+    def sm_decode(self, dev):
+        return sm_decode(self.sm_get(dev))
+
+    def ta_decode(self, dev):
+        return ta_decode(self.ta_get(dev))
+
+
+eeprom_cache = EepromCache()
+
+
 # 0x40 words
 TA_FMT, TA = util.mkstruct(
     'TA',
@@ -418,7 +774,11 @@ def cmd_sm_0e02(dev):
 
 
 def sm_info3(dev):
-    buff = cmd_sm_0e02(dev)
+    if cache_eeprom:
+        # 0x0E02 replies with the first 32 bytes of the SM EEPROM
+        buff = eeprom_cache.sm_r(dev, 0x00, 0x0F)
+    else:
+        buff = cmd_sm_0e02(dev)
     if 0:
         validate_readv((
                   "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"
@@ -441,7 +801,11 @@ def sm_info3(dev):
 
 def sm_info1(dev):
     sm_info0(dev)
+    return sm_info1_check(dev)
+
 
+@readonly
+def sm_info1_check(dev):
     # Generated from packet 23/24
     cmd_49(dev)
 
@@ -453,9 +817,14 @@ def sm_info1(dev):
 
 def sm_info0(dev):
     # Original code is likely check if SM is inserted before reading
+    # Not skipped by fast: eeprom_cache watches these for SM swaps
     gpio_readi(dev)
     gpio_readi(dev)
+    sm_info0_check(dev)
+
 
+@readonly
+def sm_info0_check(dev):
     sm_info22(dev)
     sm_info24(dev)
     sm_info3(dev)
@@ -465,6 +834,7 @@ def sm_is_inserted(gpio):
     return not bool(gpio & gpio_i2s['smn'])
 
 
+@readonly
 def sm_insert(dev, verbose=True):
     buff = sm_r(dev, 0x10, 0x1F)
     #hexdump(buff, label="sm_insert", indent='  ')
@@ -479,6 +849,7 @@ def sm_insert(dev, verbose=True):
     return sm2
 
 
+@readonly
 def sm_info10(dev, verbose=True):
     # Generated from packet 35/36
     buff = sm_r(dev, 0x10, 0x13)
@@ -553,6 +924,7 @@ def cmd_01(dev):
 # happens once during startup and a few times during programming write/read cycles
 
 
+@readonly
 def cmd_02(dev, exp, msg='cmd_2'):
     # Generated from packet 188/189
     buff = bulk2(dev, "\x02", target=6)
@@ -586,7 +958,9 @@ def gpio_readi(dev):
         ),
         buff,
         "packet 128/129")
-    return struct.unpack('<H', buff)[0]
+    gpio = struct.unpack('<H', buff)[0]
+    eeprom_cache.gpio(gpio)
+    return gpio
 
 
 def cmd_08(dev, cmd):
@@ -739,6 +1113,7 @@ def cmd_45(dev):
 
 # Common (GPIO/status?)
 # Oddly sometimes this requires truncation and sometimes doesn't
+@readonly
 def cmd_49(dev):
     # Generated from packet 156/157
     buff = bulk2(dev, "\x49", target=2)
@@ -808,6 +1183,46 @@ def cmd_57s(dev, cmds, exp, msg="cmd_57"):
     return buff
 
 
+def cmd_57s_batch(dev, groups, reply_len=None, max_size=None,
+                  msg="cmd_57"):
+    '''
+    Issue a sequence of cmd_57s() sub command groups
+    packing as many groups as fit into each bulk 0x02 transfer
+    Return a list with the reply of each group
+
+    Replies come back concatenated in group order
+    reply_len: bytes each group replies with. None => split evenly
+    max_size: transfer size limit
+        None => one USB packet with coalesce set, otherwise 0
+        0 => one group per transfer, as BPWin does
+    Packing is not yet validated on hardware, so it follows coalesce
+    '''
+    if max_size is None:
+        max_size = Batch.max_size if coalesce else 0
+    ret = []
+    pos = 0
+    while pos < len(groups):
+        out = ''
+        n = 0
+        while pos + n < len(groups):
+            this = ''.join([cmd_57_mk(c) for c in groups[pos + n]])
+            if n and len(out) + len(this) > max_size:
+                break
+            out += this
+            n += 1
+        buff = bulk2b(dev, out)
+        this_len = reply_len
+        if this_len is None:
+            this_len = len(buff) // n
+        if this_len * n != len(buff):
+            raise Exception("%s: expected %u group replies, got %u bytes" %
+                            (msg, n, len(buff)))
+        for i in range(n):
+            ret.append(buff[i * this_len:(i + 1) * this_len])
+        pos += n
+    return ret
+
+
 def cmd_57_94(dev):
     cmd_57s(dev, '\x94', "\x62", "cmd_57_94")
     # Seems to get paired with this
@@ -889,6 +1304,8 @@ def sm_name(dev):
     if not sm_is_inserted(gpio):
         raise SMNotFound()
 
+    if cache_eeprom:
+        return eeprom_cache.sm_decode(dev).name
     sm_eeprom = sm_r(dev, 0x00, 0x3F)
     sm = sm_decode(sm_eeprom)
     return sm.name
@@ -0,0 +1,211 @@
+'''
+Programmer daemon: open and initialize the BP1410 once, then serve jobs
+
+Adapter firmware load, POST and bp1410.init_dev only happen at startup
+instead of once per part
+
+Protocol: one JSON object per line over a Unix socket, one reply line per request
+Binary buffers (code, data) are base64 encoded
+Requests:
+-{"op": "read", "device": "pic16f84", "opts": {...}}
+-{"op": "program", "device": "pic16f84", "devcfg": {"code": ...}, "opts": {...}}
+-{"op": "list_device"}
+-{"op": "init"}: redo programmer init (ex: after a bus error)
+-{"op": "shutdown"}
+Replies:
+-{"ok": true, ...}
+-{"ok": false, "error": "ContFail", "msg": "..."}
+'''
+
+from bpmicro import startup
+from bpmicro import devices
+
+import base64
+import json
+import os
+import socket
+import time
+import traceback
+
+DEFAULT_SOCKET = '/tmp/bpmicro.sock'
+
+# devcfg keys holding raw buffers. Others (ex: config) are sent as is
+bin_keys = ('code', 'data')
+
+
+def b64enc(buff):
+    return base64.b64encode(bytes(buff)).decode('ascii')
+
+
+def b64dec(s):
+    return base64.b64decode(s)
+
+
+def devcfg_enc(devcfg):
+    ret = {}
+    for k, v in devcfg.items():
+        if k in bin_keys and v is not None:
+            v = b64enc(v)
+        ret[k] = v
+    return ret
+
+
+def devcfg_dec(devcfg):
+    ret = {}
+    for k, v in devcfg.items():
+        if k in bin_keys and v is not None:
+            v = b64dec(v)
+        ret[k] = v
+    return ret
+
+
+class Server(object):
+    def __init__(self, fn=DEFAULT_SOCKET, verbose=False, **kwargs):
+        self.fn = fn
+        self.verbose = verbose
+        # Passed through to startup.get
+        self.kwargs = kwargs
+        self.bp = None
+        # device name => Device
+        self.devices = {}
+        self.running = False
+
+    def init(self):
+        tstart = time.time()
+        self.devices = {}
+        # Re-init: the interface must be free to claim it again
+        self.close_bp()
+        self.bp = startup.get(verbose=self.verbose, **self.kwargs)
+        print(('Programmer ready after %0.1f sec' % (time.time() - tstart, )))
+
+    def close_bp(self):
+        if self.bp is not None:
+            bp, self.bp = self.bp, None
+            startup.close(bp)
+
+    def get_device(self, name):
+        device = self.devices.get(name)
+        if device is None:
+            device = devices.get(self.bp, name, verbose=self.verbose)
+            self.devices[name] = device
+        return device
+
+    def handle(self, req):
+        op = req.get('op')
+        opts = req.get('opts', {})
+        if op == 'read':
+            devcfg = self.get_device(req['device']).read(opts)
+            return {'devcfg': devcfg_enc(devcfg)}
+        elif op == 'program':
+            self.get_device(req['device']).program(
+                devcfg_dec(req['devcfg']), opts)
+            return {}
+        elif op == 'list_device':
+            return {'devices': sorted(devices.class_s2c.keys())}
+        elif op == 'init':
+            self.init()
+            return {}
+        elif op == 'shutdown':
+            self.running = False
+            return {}
+        else:
+            raise ValueError("Bad operation %s" % op)
+
+    def handle_line(self, line):
+        tstart = time.time()
+        try:
+            req = json.loads(line)
+            ret = self.handle(req)
+            ret['ok'] = True
+        except Exception as e:
+            traceback.print_exc()
+            ret = {'ok': False, 'error': type(e).__name__, 'msg': str(e)}
+        ret['time'] = time.time() - tstart
+        return ret
+
+    def listen(self):
+        '''Socket is only accessible to the user running the daemon'''
+        if os.path.exists(self.fn):
+            os.unlink(self.fn)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            sock.bind(self.fn)
+        finally:
+            os.umask(umask)
+        sock.listen(1)
+        return sock
+
+    def serve(self):
+        sock = self.listen()
+        self.init()
+        self.running = True
+        print(('Listening on %s' % self.fn))
+        try:
+            while self.running:
+                conn, _addr = sock.accept()
+                try:
+                    self.serve_conn(conn)
+                finally:
+                    conn.close()
+        finally:
+            sock.close()
+            os.unlink(self.fn)
+            self.close_bp()
+
+    def serve_conn(self, conn):
+        # Jobs are serviced one at a time: there is only one programmer
+        f = conn.makefile('rw')
+        while self.running:
+            line = f.readline()
+            if not line:
+                break
+            f.write(json.dumps(self.handle_line(line)) + '\n')
+            f.flush()
+
+
+class DaemonError(Exception):
+    pass
+
+
+class Client(object):
+    def __init__(self, fn=DEFAULT_SOCKET):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(fn)
+        self.f = self.sock.makefile('rw')
+
+    def close(self):
+        self.f.close()
+        self.sock.close()
+
+    def request(self, req):
+        self.f.write(json.dumps(req) + '\n')
+        self.f.flush()
+        line = self.f.readline()
+        if not line:
+            raise DaemonError("Daemon closed connection")
+        ret = json.loads(line)
+        if not ret['ok']:
+            raise DaemonError('%s: %s' % (ret['error'], ret['msg']))
+        return ret
+
+    def read(self, device, opts=None):
+        ret = self.request({'op': 'read', 'device': device, 'opts': opts or {}})
+        return devcfg_dec(ret['devcfg'])
+
+    def program(self, device, devcfg, opts=None):
+        self.request({
+            'op': 'program',
+            'device': device,
+            'devcfg': devcfg_enc(devcfg),
+            'opts': opts or {}
+        })
+
+    def list_device(self):
+        return self.request({'op': 'list_device'})['devices']
+
+    def init(self):
+        self.request({'op': 'init'})
+
+    def shutdown(self):
+        self.request({'op': 'shutdown'})
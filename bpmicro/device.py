@@ -1,5 +1,8 @@
 from bpmicro.cmd import Unsupported
 
+# devcfg buffers yielded by read_stream(), in order
+stream_regions = ('code', 'data')
+
 
 class Device(object):
     def read(self, opts):
@@ -10,6 +13,27 @@ class Device(object):
         '''
         raise Unsupported()
 
+    def read_stream(self, opts, extra=None):
+        '''
+        Generator version of read()
+        Yields (region, offset, memoryview) chunks of the devcfg buffers
+        (code, data) in order as they are read
+        A chunk is only valid until the next one is requested
+
+        extra: dict that receives the other devcfg entries (ex: config)
+
+        Default: whole regions once read() returns
+        Devices that can stream their readback override this
+        '''
+        devcfg = self.read(opts)
+        if extra is not None:
+            for k, v in devcfg.items():
+                if k not in stream_regions:
+                    extra[k] = v
+        for k in stream_regions:
+            if devcfg.get(k) is not None:
+                yield k, 0, memoryview(devcfg[k])
+
     def program(self, devcfg, opts):
         '''
         devcfg: device configuration. A dict containining areas to configure
@@ -1,16 +1,76 @@
-from bpmicro.mcs51 import i87c51
-from bpmicro.pic import pic16c554, pic17c43
-from bpmicro.pic import pic16f84
-from bpmicro.mcs51 import at89c51, s87c751
+'''
+Supported device registry
 
-class_s2c = {
-    'i87c51': i87c51.I87C51,
-    'pic16c554': pic16c554.PIC16C554,
-    'pic17c43': pic17c43.PIC17C43,
-    'pic16f84': pic16f84.PIC16F84,
-    'at89c51': at89c51.AT89C51,
-    's87c751': s87c751.Device,
-}
+Device modules (and the firmware tables they pull in) are only imported
+when a device is actually selected
+Listing devices uses the metadata below and imports nothing
+'''
+
+import importlib
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+class DeviceInfo(object):
+    def __init__(self, name, module, class_name, desc, ops):
+        self.name = name
+        # Module / class to import on first use
+        self.module = module
+        self.class_name = class_name
+        self.desc = desc
+        # Supported operations (Device methods implemented)
+        self.ops = ops
+
+    def load(self):
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+
+device_s2info = dict((info.name, info) for info in (
+    DeviceInfo('i87c51', 'bpmicro.mcs51.i87c51', 'I87C51',
+               'Intel 87C51 MCS-51 EPROM MCU', ('read', 'program')),
+    DeviceInfo('pic16c554', 'bpmicro.pic.pic16c554', 'PIC16C554',
+               'Microchip PIC16C554 OTP MCU', ('read', )),
+    DeviceInfo('pic17c43', 'bpmicro.pic.pic17c43', 'PIC17C43',
+               'Microchip PIC17C43 OTP MCU', ('read', )),
+    DeviceInfo('pic16f84', 'bpmicro.pic.pic16f84', 'PIC16F84',
+               'Microchip PIC16F84 flash MCU', ('read', )),
+    DeviceInfo('at89c51', 'bpmicro.mcs51.at89c51', 'AT89C51',
+               'Atmel AT89C51 MCS-51 flash MCU', ('read', 'program')),
+    DeviceInfo('s87c751', 'bpmicro.mcs51.s87c751', 'Device',
+               'Signetics / Philips S87C751 MCS-51 EPROM MCU', ('read', )),
+))
+
+
+class LazyClasses(Mapping):
+    '''
+    name => Device class, importing the device module on first lookup
+    Iteration / len / membership only use device_s2info
+    '''
+    def __init__(self, infos):
+        self.infos = infos
+        self.loaded = {}
+
+    def __getitem__(self, name):
+        c = self.loaded.get(name)
+        if c is None:
+            c = self.infos[name].load()
+            self.loaded[name] = c
+        return c
+
+    def __iter__(self):
+        return iter(self.infos)
+
+    def __len__(self):
+        return len(self.infos)
+
+    def __contains__(self, name):
+        return name in self.infos
+
+
+class_s2c = LazyClasses(device_s2info)
 
 
 def get(bp, device, verbose=False):
@@ -18,4 +78,5 @@ def get(bp, device, verbose=False):
         c = class_s2c[device]
     except KeyError:
         raise Exception("Unsupported device %s" % device)
-    return c(bp.dev, verbose=verbose)
+    # Pass the adapter (not the raw handle) so transport options apply
+    return c(bp, verbose=verbose)
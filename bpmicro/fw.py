@@ -1,31 +1,200 @@
+'''
+Firmware / algorithm blobs, looked up by hash (see fwhash)
+
+Sources under FW_DIR:
+-*.pack: packed blob store, memory mapped. Blobs are only paged in when used
+-*.bin: one blob per file
+
+The directory index is built on first use, not on import
+.bin files are hashed once and remembered in INDEX_FN by (path, size, mtime)
+Their contents are only read when the hash is looked up
+
+Pack format (little endian):
+-header: magic "BPFWPAK1", u32 entry count
+-index: per entry 8 byte ASCII hash, u32 offset, u32 length
+-blob data
+'''
+
 import fnmatch
 import os
 import hashlib
 import binascii
+import json
+import mmap
+import struct
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
 
 FW_DIR = os.path.join(os.path.dirname(__file__), 'fw')
+# Persisted .bin index. Not required: rebuilt if missing or unwritable
+INDEX_FN = os.path.join(FW_DIR, '.index.json')
+INDEX_VERSION = 1
 
-# md5 hash to file content
-hash2bin = {}
-# absolute paths
-hash2fns = {}
+PACK_MAGIC = b'BPFWPAK1'
+pack_hdr = struct.Struct('<8sI')
+pack_ent = struct.Struct('<8sII')
 
 
-def fn2rel(fn):
-    return fn.replace(FW_DIR + '/', '')
+class Pack(object):
+    '''Read only, memory mapped blob store'''
+    def __init__(self, fn):
+        self.fn = fn
+        self.f = open(fn, 'rb')
+        self.mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n = pack_hdr.unpack_from(self.mm, 0)
+        if magic != PACK_MAGIC:
+            raise Exception("%s: bad pack magic" % fn)
+        # hash => (offset, length)
+        self.index = {}
+        for i in range(n):
+            h, offset, size = pack_ent.unpack_from(
+                self.mm, pack_hdr.size + i * pack_ent.size)
+            if offset + size > len(self.mm):
+                raise Exception("%s: truncated pack" % fn)
+            self.index[str(h.decode('ascii'))] = (offset, size)
 
+    def __contains__(self, h):
+        return h in self.index
 
-def hash2fns_get_rel(h, default=None):
-    fns = hash2fns.get(h, default)
-    if fns is None:
-        return None
-    return [fn2rel(fn) for fn in fns]
+    def __getitem__(self, h):
+        offset, size = self.index[h]
+        return self.mm[offset:offset + size]
+
+    def view(self, h):
+        '''Zero copy read only view'''
+        offset, size = self.index[h]
+        try:
+            return memoryview(self.mm)[offset:offset + size]
+        except TypeError:
+            # Python 2 mmap has no new style buffer interface: copy
+            return memoryview(self.mm[offset:offset + size])
+
+    def close(self):
+        self.mm.close()
+        self.f.close()
+
+
+def write_pack(fn, blobs):
+    '''Write dict of hash => data as a pack file'''
+    hashes = sorted(blobs.keys())
+    offset = pack_hdr.size + len(hashes) * pack_ent.size
+    with open(fn, 'wb') as f:
+        f.write(pack_hdr.pack(PACK_MAGIC, len(hashes)))
+        for h in hashes:
+            f.write(pack_ent.pack(h.encode('ascii'), offset, len(blobs[h])))
+            offset += len(blobs[h])
+        for h in hashes:
+            f.write(blobs[h])
+
+
+class FwStore(MutableMapping):
+    '''
+    hash => blob
+    Reads are served from loose blobs (.bin files, runtime additions) then packs
+    Assignment only adds loose blobs. Packs are read only
+
+    index: called once, on first access, to populate the store
+    '''
+    def __init__(self, index=None):
+        self.packs = []
+        self.loose = {}
+        # hash => .bin file name, read on first lookup
+        self.files = {}
+        self.index = index
+
+    def ensure(self):
+        if self.index:
+            index, self.index = self.index, None
+            index()
+
+    def add_pack(self, pack):
+        self.packs.append(pack)
+
+    def add_file(self, h, fn):
+        self.files[h] = fn
+
+    def load_file(self, h):
+        fn = self.files[h]
+        b = open(fn, 'rb').read()
+        if hstr(fwhash(b)) != h:
+            # Changed without size / mtime changing
+            raise Exception("%s: stale firmware index, hash %s" % (fn, h))
+        self.loose[h] = b
+        return b
+
+    def __getitem__(self, h):
+        self.ensure()
+        try:
+            return self.loose[h]
+        except KeyError:
+            pass
+        if h in self.files:
+            return self.load_file(h)
+        for pack in self.packs:
+            if h in pack:
+                return pack[h]
+        raise KeyError(h)
+
+    def view(self, h):
+        '''Like [] but zero copy when the blob is packed'''
+        self.ensure()
+        if h not in self.loose and h not in self.files:
+            for pack in self.packs:
+                if h in pack:
+                    return pack.view(h)
+        return memoryview(self[h])
+
+    def __setitem__(self, h, data):
+        self.ensure()
+        self.loose[h] = data
+
+    def __delitem__(self, h):
+        self.ensure()
+        if h in self.files:
+            del self.files[h]
+            self.loose.pop(h, None)
+        else:
+            del self.loose[h]
+
+    def __contains__(self, h):
+        self.ensure()
+        return (h in self.loose or h in self.files
+                or any(h in pack for pack in self.packs))
+
+    def __iter__(self):
+        self.ensure()
+        seen = set()
+        for hs in [self.loose, self.files] + [pack.index for pack in self.packs]:
+            for h in hs:
+                if h not in seen:
+                    seen.add(h)
+                    yield h
+
+    def __len__(self):
+        return len(set(iter(self)))
+
+    def clear(self):
+        for pack in self.packs:
+            pack.close()
+        self.packs = []
+        self.loose.clear()
+        self.files.clear()
 
 
 def fwhash(data):
     return binascii.hexlify(hashlib.md5(data).digest())[0:8]
 
 
+def hstr(h):
+    '''fwhash() as a native string (dict key, index)'''
+    if not isinstance(h, str):
+        h = h.decode('ascii')
+    return str(h)
+
+
 def files_of_ext(srcdir, ext):
     matches = []
     for root, dirnames, filenames in os.walk(srcdir):
@@ -34,17 +203,89 @@ def files_of_ext(srcdir, ext):
     return matches
 
 
+def index_load(fn=None):
+    '''Return dict of relative path => (size, mtime, hash)'''
+    fn = fn or INDEX_FN
+    try:
+        j = json.load(open(fn))
+    except (IOError, OSError, ValueError):
+        return {}
+    if j.get('version') != INDEX_VERSION:
+        return {}
+    return dict((k, tuple(v)) for k, v in j['files'].items())
+
+
+def index_save(index, fn=None):
+    '''Best effort: FW_DIR may be read only (ex: installed package)'''
+    fn = fn or INDEX_FN
+    tmp = fn + '.tmp'
+    try:
+        j = {'version': INDEX_VERSION, 'files': index}
+        with open(tmp, 'w') as f:
+            json.dump(j, f, sort_keys=True, indent=0)
+        os.rename(tmp, fn)
+    except (IOError, OSError):
+        pass
+
+
 def reindex():
+    '''
+    Rebuild hash2bin / hash2fns from FW_DIR
+    Only .bin files that are new or changed (size, mtime) since the last index are read
+    '''
+    hash2bin.index = None
     hash2bin.clear()
+    hash2fns.clear()
+    for f in sorted(files_of_ext(FW_DIR, 'pack')):
+        pack = Pack(f)
+        hash2bin.add_pack(pack)
+        for h in pack.index:
+            hash2fns.setdefault(h, set()).add(f)
+
+    index_old = index_load()
+    index = {}
+    # Hashes with a file hashed this time: duplicates are compared
+    # Files known from the index were compared when they were hashed
+    fresh = set()
     for f in files_of_ext(FW_DIR, 'bin'):
-        b = open(f, 'rb').read()
-        h = fwhash(b)
-        if h in hash2bin:
-            assert hash2bin[h] == b, 'Hash collision!'
-            #print('WARNING: duplicate firmware w/ hash %s' % h)
+        rel = fn2rel(f)
+        st = os.stat(f)
+        ent = index_old.get(rel)
+        data = None
+        if ent and ent[0] == st.st_size and ent[1] == st.st_mtime:
+            h = str(ent[2])
         else:
-            hash2bin[h] = b
+            data = open(f, 'rb').read()
+            h = hstr(fwhash(data))
+            fresh.add(h)
+        index[rel] = (st.st_size, st.st_mtime, h)
+        if h not in hash2bin:
+            hash2bin.add_file(h, f)
+        elif h in fresh:
+            if data is None:
+                data = open(f, 'rb').read()
+            if data != hash2bin[h]:
+                raise Exception("Hash collision! %s: %s vs %s" %
+                                (h, f, ', '.join(sorted(hash2fns[h]))))
         hash2fns.setdefault(h, set()).add(f)
+    if index != index_old:
+        index_save(index)
 
 
-reindex()
+# md5 hash to file content
+# Populated by reindex() on first access
+hash2bin = FwStore(index=reindex)
+# absolute paths
+hash2fns = {}
+
+
+def fn2rel(fn):
+    return fn.replace(FW_DIR + '/', '')
+
+
+def hash2fns_get_rel(h, default=None):
+    hash2bin.ensure()
+    fns = hash2fns.get(h, default)
+    if fns is None:
+        return None
+    return [fn2rel(fn) for fn in fns]
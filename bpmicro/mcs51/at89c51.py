@@ -10,8 +10,7 @@ from bpmicro.usb import validate_read
 from bpmicro.cmd import cmd_01
 from bpmicro import cmd
 import bpmicro.device
-from . import at89c51_fw
-import bpmicro.mcs51.at89c51_fw
+from bpmicro import fw
 
 import usb1
 import sys
@@ -162,7 +161,7 @@ def dev_read(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x20\x01\x00\x50\x7D\x02\x00\x00")
     # Generated from packet 2171/2172
     # bulk2 aggregate: packet W: 2171/2172, 1 to R 2173/2174
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p7497e05e)
+    buff = cmd.bulk2b(dev, fw.hash2bin["7497e05e"])
     validate_read("\x82\x00", buff, "packet W: 2171/2172, R 1 to 2173/2174")
     # Generated from packet 2175/2176
     # bulk2 aggregate: packet W: 2175/2176, 1 to R 2177/2178
@@ -230,7 +229,7 @@ def dev_read(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x57\x86\x00\x50\x4F\x08\x00\x00")
     # Generated from packet 2225/2226
     # bulk2 aggregate: packet W: 2225/2226, 1 to R 2227/2228
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pb765d18a)
+    buff = cmd.bulk2b(dev, fw.hash2bin["b765d18a"])
     validate_read("\x87\x00", buff, "packet W: 2225/2226, R 1 to 2227/2228")
     # Generated from packet 2229/2230
     # bulk2 aggregate: packet W: 2229/2230, 1 to R 2231/2232
@@ -242,7 +241,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\xCB\x02")
     # Generated from packet 2245/2246
     # bulk2 aggregate: packet W: 2245/2246, 1 to R 2249/2250
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pe1244dd0)
+    buff = cmd.bulk2b(dev, fw.hash2bin["e1244dd0"])
     validate_read("\x88\x00", buff, "packet W: 2245/2246, R 1 to 2249/2250")
     # Generated from packet 2251/2252
     # bulk2 aggregate: packet W: 2251/2252, 1 to R 2253/2254
@@ -254,7 +253,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x8E\x04")
     # Generated from packet 2333/2334
     # bulk2 aggregate: packet W: 2333/2334, 1 to R 2335/2336
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p99f93b18)
+    buff = cmd.bulk2b(dev, fw.hash2bin["99f93b18"])
     validate_read("\x89\x00", buff, "packet W: 2333/2334, R 1 to 2335/2336")
     # Generated from packet 2337/2338
     # bulk2 aggregate: packet W: 2337/2338, 1 to R 2339/2340
@@ -445,7 +444,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x20\x01\x00\x50\x7D\x02\x00\x00")
     # Generated from packet 2287/2288
     # bulk2 aggregate: packet W: 2287/2288, 1 to R 2289/2290
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p7497e05e)
+    buff = cmd.bulk2b(dev, fw.hash2bin["7497e05e"])
     validate_read("\x82\x00", buff, "packet W: 2287/2288, R 1 to 2289/2290")
     # Generated from packet 2291/2292
     # bulk2 aggregate: packet W: 2291/2292, 1 to R 2293/2294
@@ -466,7 +465,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x57\x83\x00\x50\x18\x3A\x00\x00")
     # Generated from packet 2307/2308
     # bulk2 aggregate: packet W: 2307/2308, 1 to R 2309/2310
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p06a7b55f)
+    buff = cmd.bulk2b(dev, fw.hash2bin["06a7b55f"])
     validate_read("\x84\x00", buff, "packet W: 2307/2308, R 1 to 2309/2310")
     # Generated from packet 2311/2312
     # bulk2 aggregate: packet W: 2311/2312, 1 to R 2313/2314
@@ -482,7 +481,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\xDE\x03")
     # Generated from packet 2319/2320
     # bulk2 aggregate: packet W: 2319/2320, 1 to R 2321/2322
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pf127b9be)
+    buff = cmd.bulk2b(dev, fw.hash2bin["f127b9be"])
     validate_read("\x85\x00", buff, "packet W: 2319/2320, R 1 to 2321/2322")
     # Generated from packet 2323/2324
     # bulk2 aggregate: packet W: 2323/2324, 1 to R 2325/2326
@@ -494,7 +493,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x71\x1B")
     # Generated from packet 2333/2334
     # bulk2 aggregate: packet W: 2333/2334, 1 to R 2335/2336
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pccc4c386)
+    buff = cmd.bulk2b(dev, fw.hash2bin["ccc4c386"])
     validate_read("\x86\x00", buff, "packet W: 2333/2334, R 1 to 2335/2336")
     # Generated from packet 2337/2338
     # bulk2 aggregate: packet W: 2337/2338, 1 to R 2339/2340
@@ -543,7 +542,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
         )
     # Generated from packet 2363/2364
     # bulk2 aggregate: packet W: 2363/2364, 1 to R 2367/2368
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p41a6e1af)
+    buff = cmd.bulk2b(dev, fw.hash2bin["41a6e1af"])
     validate_read("\x88\x00", buff, "packet W: 2363/2364, R 1 to 2367/2368")
     # Generated from packet 2369/2370
     # bulk2 aggregate: packet W: 2369/2370, 1 to R 2371/2372
@@ -567,7 +566,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x57\x89\x00\x50\x4F\x08\x00\x00")
     # Generated from packet 2391/2392
     # bulk2 aggregate: packet W: 2391/2392, 1 to R 2393/2394
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pb765d18a)
+    buff = cmd.bulk2b(dev, fw.hash2bin["b765d18a"])
     validate_read("\x8A\x00", buff, "packet W: 2391/2392, R 1 to 2393/2394")
     # Generated from packet 2395/2396
     # bulk2 aggregate: packet W: 2395/2396, 1 to R 2397/2398
@@ -579,7 +578,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x96\x04")
     # Generated from packet 2407/2408
     # bulk2 aggregate: packet W: 2407/2408, 1 to R 2409/2410
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p040c7668)
+    buff = cmd.bulk2b(dev, fw.hash2bin["040c7668"])
     validate_read("\x8B\x00", buff, "packet W: 2407/2408, R 1 to 2409/2410")
     # Generated from packet 2411/2412
     # bulk2 aggregate: packet W: 2411/2412, 1 to R 2413/2414
@@ -606,7 +605,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x8E\x04")
     # Generated from packet 2435/2436
     # bulk2 aggregate: packet W: 2435/2436, 1 to R 2437/2438
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p99f93b18)
+    buff = cmd.bulk2b(dev, fw.hash2bin["99f93b18"])
     validate_read("\x8D\x00", buff, "packet W: 2435/2436, R 1 to 2437/2438")
     # Generated from packet 2439/2440
     # bulk2 aggregate: packet W: 2439/2440, 1 to R 2441/2442
@@ -633,7 +632,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\xCB\x02")
     # Generated from packet 2467/2468
     # bulk2 aggregate: packet W: 2467/2468, 1 to R 2469/2470
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pe1244dd0)
+    buff = cmd.bulk2b(dev, fw.hash2bin["e1244dd0"])
     validate_read("\x8F\x00", buff, "packet W: 2467/2468, R 1 to 2469/2470")
     # Generated from packet 2471/2472
     # bulk2 aggregate: packet W: 2471/2472, 1 to R 2473/2474
@@ -679,6 +678,7 @@ def dev_read_id_cont(dev, cont=False, verbose=False):
     return {'code': code}
 
 
+@cmd.batched
 def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
     bulkRead, bulkWrite, controlRead, controlWrite = usb_wraps(dev)
 
@@ -827,7 +827,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
     bulkWrite(0x02, "\x20\x01\x00\x50\x7D\x02\x00\x00")
     # Generated from packet 2287/2288
     # bulk2 aggregate: packet W: 2287/2288, 1 to R 2289/2290
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p7497e05e)
+    buff = cmd.bulk2b(dev, fw.hash2bin["7497e05e"])
     validate_read("\x82\x00", buff, "packet W: 2287/2288, R 1 to 2289/2290")
     # Generated from packet 2291/2292
     # bulk2 aggregate: packet W: 2291/2292, 1 to R 2293/2294
@@ -848,7 +848,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
     bulkWrite(0x02, "\x57\x83\x00\x50\x18\x3A\x00\x00")
     # Generated from packet 2307/2308
     # bulk2 aggregate: packet W: 2307/2308, 1 to R 2309/2310
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p06a7b55f)
+    buff = cmd.bulk2b(dev, fw.hash2bin["06a7b55f"])
     validate_read("\x84\x00", buff, "packet W: 2307/2308, R 1 to 2309/2310")
     # Generated from packet 2311/2312
     # bulk2 aggregate: packet W: 2311/2312, 1 to R 2313/2314
@@ -864,7 +864,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
     cmd.cmd_50(dev, "\xDE\x03")
     # Generated from packet 2319/2320
     # bulk2 aggregate: packet W: 2319/2320, 1 to R 2321/2322
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pf127b9be)
+    buff = cmd.bulk2b(dev, fw.hash2bin["f127b9be"])
     validate_read("\x85\x00", buff, "packet W: 2319/2320, R 1 to 2321/2322")
     # Generated from packet 2323/2324
     # bulk2 aggregate: packet W: 2323/2324, 1 to R 2325/2326
@@ -876,7 +876,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
     cmd.cmd_50(dev, "\x71\x1B")
     # Generated from packet 2333/2334
     # bulk2 aggregate: packet W: 2333/2334, 1 to R 2335/2336
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pccc4c386)
+    buff = cmd.bulk2b(dev, fw.hash2bin["ccc4c386"])
     validate_read("\x86\x00", buff, "packet W: 2333/2334, R 1 to 2335/2336")
     # Generated from packet 2337/2338
     # bulk2 aggregate: packet W: 2337/2338, 1 to R 2339/2340
@@ -925,7 +925,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
         )
     # Generated from packet 2363/2364
     # bulk2 aggregate: packet W: 2363/2364, 1 to R 2367/2368
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p41a6e1af)
+    buff = cmd.bulk2b(dev, fw.hash2bin["41a6e1af"])
     validate_read("\x88\x00", buff, "packet W: 2363/2364, R 1 to 2367/2368")
     # Generated from packet 2369/2370
     # bulk2 aggregate: packet W: 2369/2370, 1 to R 2371/2372
@@ -949,7 +949,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
     bulkWrite(0x02, "\x57\x89\x00\x50\x4F\x08\x00\x00")
     # Generated from packet 2391/2392
     # bulk2 aggregate: packet W: 2391/2392, 1 to R 2393/2394
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pb765d18a)
+    buff = cmd.bulk2b(dev, fw.hash2bin["b765d18a"])
     validate_read("\x8A\x00", buff, "packet W: 2391/2392, R 1 to 2393/2394")
     # Generated from packet 2395/2396
     # bulk2 aggregate: packet W: 2395/2396, 1 to R 2397/2398
@@ -961,7 +961,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
     cmd.cmd_50(dev, "\x96\x04")
     # Generated from packet 2407/2408
     # bulk2 aggregate: packet W: 2407/2408, 1 to R 2409/2410
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p040c7668)
+    buff = cmd.bulk2b(dev, fw.hash2bin["040c7668"])
     validate_read("\x8B\x00", buff, "packet W: 2407/2408, R 1 to 2409/2410")
     # Generated from packet 2411/2412
     # bulk2 aggregate: packet W: 2411/2412, 1 to R 2413/2414
@@ -988,7 +988,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
     cmd.cmd_50(dev, "\x8E\x04")
     # Generated from packet 2435/2436
     # bulk2 aggregate: packet W: 2435/2436, 1 to R 2437/2438
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.p99f93b18)
+    buff = cmd.bulk2b(dev, fw.hash2bin["99f93b18"])
     validate_read("\x8D\x00", buff, "packet W: 2435/2436, R 1 to 2437/2438")
     # Generated from packet 2439/2440
     # bulk2 aggregate: packet W: 2439/2440, 1 to R 2441/2442
@@ -1015,7 +1015,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True, erase=True):
     cmd.cmd_50(dev, "\xCB\x02")
     # Generated from packet 2467/2468
     # bulk2 aggregate: packet W: 2467/2468, 1 to R 2469/2470
-    buff = cmd.bulk2b(dev, bpmicro.mcs51.at89c51_fw.pe1244dd0)
+    buff = cmd.bulk2b(dev, fw.hash2bin["e1244dd0"])
     validate_read("\x8F\x00", buff, "packet W: 2467/2468, R 1 to 2469/2470")
     # Generated from packet 2471/2472
     # bulk2 aggregate: packet W: 2471/2472, 1 to R 2473/2474
@@ -10,7 +10,7 @@ from bpmicro.usb import validate_read
 from bpmicro.cmd import cmd_01
 from bpmicro import cmd
 import bpmicro.device
-from . import i87c51_fw
+from bpmicro import fw
 
 import usb1
 import sys
@@ -32,6 +32,7 @@ def fw_read(dev, target=4096):
     return buff
 
 
+@cmd.batched
 def dev_read(dev, cont, verbose=False):
     read_replay1(dev, cont)
     return read_replay2(dev, cont)
@@ -205,7 +206,7 @@ def read_replay1(dev, cont=True):
     bulkWrite(0x02, cmd_20_mk() + cmd_50_mk("\x7D\x02"))
 
     # Generated from packet 201/202
-    buff = bulk2(dev, i87c51_fw.p201, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["7497e05e"], target=0x02)
 
     validate_read("\x82\x00", buff, "packet W: 201/202, R: 203/204")
 
@@ -235,7 +236,7 @@ def read_replay1(dev, cont=True):
     cmd_57_50(dev, "\x83", "\x18\x3A")
     # p221.bin: DOS executable (COM)
     # Generated from packet 221/222
-    buff = bulk2(dev, i87c51_fw.p221, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["88f9baa0"], target=0x02)
 
     validate_read("\x84\x00", buff, "packet W: 221/222, R: 223/224")
 
@@ -254,7 +255,7 @@ def read_replay1(dev, cont=True):
     # Generated from packet 231/232
     cmd_50(dev, "\xDE\x03")
     # Generated from packet 233/234
-    buff = bulk2(dev, i87c51_fw.p233, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["941e9ec9"], target=0x02)
 
     validate_read("\x85\x00", buff, "packet W: 233/234, R: 235/236")
 
@@ -314,7 +315,7 @@ def read_replay1(dev, cont=True):
         "\x00\x50\x71\x09\x00\x00")
 
     # Generated from packet 257/258
-    buff = bulk2(dev, i87c51_fw.p257, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["61b34709"], target=0x02)
 
     validate_read("\x87\x00", buff, "packet W: 257/258, R: 259/260")
 
@@ -342,7 +343,7 @@ def read_replay1(dev, cont=True):
     # Generated from packet 279/280
     cmd_57_50(dev, "\x88", "\x32\x07")
     # Generated from packet 281/282
-    buff = bulk2(dev, i87c51_fw.p281, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["52aee908"], target=0x02)
 
     validate_read("\x89\x00", buff, "packet W: 281/282, R: 283/284")
 
@@ -356,7 +357,7 @@ def read_replay1(dev, cont=True):
     # Generated from packet 293/294
     cmd_50(dev, "\x3D\x03")
     # Generated from packet 295/296
-    buff = bulk2(dev, i87c51_fw.p295, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["8aad9e16"], target=0x02)
 
     validate_read("\x8A\x00", buff, "packet W: 295/296, R: 297/298")
 
@@ -393,7 +394,7 @@ def read_replay1(dev, cont=True):
     # Generated from packet 321/322
     cmd_50(dev, "\xF8\x04")
     # Generated from packet 323/324
-    buff = bulk2(dev, i87c51_fw.p323, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["7fe17823"], target=0x02)
 
     validate_read("\x8C\x00", buff, "packet W: 323/324, R: 325/326")
 
@@ -424,7 +425,7 @@ def read_replay1(dev, cont=True):
     # Generated from packet 349/350
     cmd_50(dev, "\xFA\x01")
     # Generated from packet 351/352
-    buff = bulk2(dev, i87c51_fw.p351, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["9e22133c"], target=0x02)
     validate_read("\x8E\x00", buff, "packet W: 351/352, R: 353/354")
 
     # Generated from packet 355/356
@@ -445,7 +446,7 @@ def read_replay2(dev, cont):
     # Generated from packet 371/372
     cmd_50(dev, "\xDD\x05")
     # Generated from packet 373/374
-    buff = bulk2(dev, i87c51_fw.p373, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["7fa4d0a5"], target=0x02)
 
     validate_read("\x8F\x00", buff, "packet W: 373/374, R: 375/376")
 
@@ -510,28 +511,18 @@ with reply  \x63\x01
 '''
 
 
-def fw_w(dev, fw, verbose=False):
-    pos = 0
+def fw_w(dev, code, verbose=False, window=None):
+    '''window: upload chunks in flight. None => cmd.upload_window'''
+    if window is None:
+        window = cmd.upload_window
     print('FW load: begin')
     tstart = time.time()
-    while pos < len(fw):
-        remain = len(fw) - pos
-        chunk = fw[pos:pos + min(remain, 0xCC)]
-        if len(chunk) == remain:
-            prefix = 0x08
-            reply = "\x00"
-        else:
-            prefix = 0x18
-            reply = "\x0B"
-        if verbose:
-            print(('  pos 0X%04X, len 0x%02X, prefix 0x%02X' %
-                   (pos, len(chunk), prefix)))
-        buff = bulk2(dev,
-                     chr(len(chunk)) + '\x00' + chunk,
-                     target=0x01,
-                     prefix=prefix)
-        validate_read(reply, buff, "packet W: 429/430, R: 431/432")
-        pos += len(chunk)
+    # Generated from packet 429/430, R: 431/432
+    cmd.upload_windowed(dev,
+                        code,
+                        window=window,
+                        msg="fw_w",
+                        verbose=verbose)
     tend = time.time()
     print(('FW load : end.  Took %0.1f sec' % (tend - tstart, )))
 
@@ -548,9 +539,10 @@ FW load : end.  Took 0.1 sec
 
 
 #def replay(dev, fw, cont=True, blank=True):
+@cmd.batched
 def dev_write(dev, devcfg, cont=True, verbose=False, blank=True):
     bulkRead, bulkWrite, controlRead, controlWrite = usb_wraps(dev)
-    fw = devcfg['code']
+    code = devcfg['code']
 
     # Generated by uvusbreplay 0.1
     # uvusbreplay copyright 2011 John McMaster <JohnDMcMaster@gmail.com>
@@ -586,7 +578,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True):
     cmd_50(dev, "\x0A\x06")
 
     # Generated from packet 383/384
-    buff = bulk2(dev, i87c51_fw.p383, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["5ec4fcce"], target=0x02)
 
     validate_read("\x90\x00", buff, "packet W: 383/384, R: 385/386")
     # Generated from packet 387/388
@@ -637,7 +629,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True):
     cmd_50(dev, "\x9F\x09")
 
     # Generated from packet 415/416
-    buff = bulk2(dev, i87c51_fw.p415, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["f1202142"], target=0x02)
 
     validate_read("\x92\x00", buff, "packet W: 415/416, R: 417/418")
     # Generated from packet 419/420
@@ -656,7 +648,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True):
     validate_read("\x0B", buff, "packet 427/428")
 
     # Generated from packet 429/430
-    fw_w(dev, fw, verbose=True)
+    fw_w(dev, code, verbose=True)
 
     # Generated from packet 513/514
     cmd_57s(dev, '\x8C', "\x00\x00")
@@ -685,7 +677,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True):
     cmd_50(dev, "\xE0\x08")
 
     # Generated from packet 533/534
-    buff = bulk2(dev, i87c51_fw.p533, target=0x02)
+    buff = bulk2(dev, fw.hash2bin["9c369a26"], target=0x02)
 
     validate_read("\x94\x00", buff, "packet W: 533/534, R: 535/536")
     # Generated from packet 537/538
@@ -698,7 +690,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True):
     cmd.cmd_57_94(dev)
 
     # Generated from packet 547/548
-    fw_w(dev, fw)
+    fw_w(dev, code)
 
     # Generated from packet 631/632
     cmd_57s(dev, '\x8C', "\x00\x00")
@@ -727,7 +719,7 @@ def dev_write(dev, devcfg, cont=True, verbose=False, blank=True):
     cmd.cmd_57_94(dev)
 
     # Generated from packet 655/656
-    fw_w(dev, fw)
+    fw_w(dev, code)
 
     # Generated from packet 739/740
     cmd_57s(dev, '\x8C', "\x00\x00")
@@ -1,2026 +0,0 @@
-# Generated from packet 201/202
-p201 = \
-    "\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00" \
-    "\x05\x00\x00\x00\xBB\x01\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83" \
-    "\x74\x46\x00\x00\x0F\x00\x00\x00\xBB\x02\x00\x00\x00\xC1\xE3\x02" \
-    "\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x03\x00\x00" \
-    "\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00" \
-    "\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00" \
-    "\x00\x00\x00\x00\xFF\x15\x38\x11\x00\x00\x88\x05\x00\x24\x00\x40" \
-    "\x66\xB8\x00\xD4\x66\xBA\x30\x00\x66\x4A\x78\x1B\xFB\x90\xFA\x66" \
-    "\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05\x04\x22\x00" \
-    "\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-    "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-    "\x04\x22\x00\xC0\x76\xF7\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53\x5B" \
-    "\xC7\x83\x74\x46\x00\x00\x06\x00\x00\x00\xBB\x01\x00\x00\x00\xC1" \
-    "\xE3\x02\x53\x66\xB8\x0F\x00\x66\xF7\xD0\x5B\x81\xE0\xFF\xFF\x00" \
-    "\x00\x89\x83\x74\x46\x00\x00\xBB\x02\x00\x00\x00\xC1\xE3\x02\x53" \
-    "\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x03\x00\x00\x00" \
-    "\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB" \
-    "\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00" \
-    "\x00\x00\x00\xFF\x15\x38\x11\x00\x00\xBB\x00\x00\x00\x00\xC1\xE3" \
-    "\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x04\x00\x00\x00\xBB\x01\x00" \
-    "\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x0F\x00\x00" \
-    "\x00\xBB\x02\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00" \
-    "\x00\x00\x00\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7" \
-    "\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3" \
-    "\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38" \
-    "\x11\x00\x00\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74" \
-    "\x46\x00\x00\x07\x00\x00\x00\xBB\x01\x00\x00\x00\xC1\xE3\x02\x53" \
-    "\x5B\xC7\x83\x74\x46\x00\x00\x0F\x00\x00\x00\xBB\x02\x00\x00\x00" \
-    "\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB" \
-    "\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00" \
-    "\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74" \
-    "\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11\x00\x00\xBB\x00\x00" \
-    "\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x08\x00\x00" \
-    "\x00\xBB\x01\x00\x00\x00\xC1\xE3\x02\x53\x66\xB8\x0F\x00\x66\xF7" \
-    "\xD0\x5B\x81\xE0\xFF\xFF\x00\x00\x89\x83\x74\x46\x00\x00\xBB\x02" \
-    "\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00" \
-    "\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46" \
-    "\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B" \
-    "\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11\x00\x00" \
-    "\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-
-# Generated from packet 221/222
-p221 = \
-    "\xE9\x03\x00\x00\x00\x90\x00\x00\xE9\x03\x00\x00\x00\x90\x00\x00" \
-    "\xE9\x1F\x00\x00\x00\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\xE9\x1F\x00\x00\x00\x90\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\xE9\x1F\x00\x00\x00\x90\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xFB\x66\x53\xFF" \
-    "\x15\xC4\x1E\x00\x00\x66\x5B\xFA\xB4\x00\x66\x89\x05\xC6\x03\x09" \
-    "\x00\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\x8B\x05\xC6\x03\x09" \
-    "\x00\x66\x89\x05\x56\x04\x09\x00\x66\x81\x05\x56\x04\x09\x00\x07" \
-    "\x00\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\x8B\x05\x56\x04\x09" \
-    "\x00\x66\x89\x05\x76\x04\x09\x00\x66\xB9\x08\x00\x66\x8B\x05\x76" \
-    "\x04\x09\x00\x66\xBA\x00\x00\x66\xF7\xF1\x66\x89\x05\x76\x04\x09" \
-    "\x00\x66\x8B\x05\x76\x04\x09\x00\x66\x89\x05\xCE\x03\x09\x00\x66" \
-    "\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81" \
-    "\xE3\xFF\xFF\x00\x00\x53\x5B\xFB\x66\x53\xFF\x15\xC4\x1E\x00\x00" \
-    "\x66\x5B\xFA\x88\x83\xD6\x03\x09\x00\x66\xFF\x05\x28\x24\x00\x00" \
-    "\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66" \
-    "\x8B\x05\xCE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x77" \
-    "\xB7\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D\x28\x24\x00" \
-    "\x00\x81\xE3\xFF\xFF\x00\x00\x53\x5B\xFB\x66\x53\xFF\x15\xC4\x1E" \
-    "\x00\x00\x66\x5B\xFA\x88\x83\xFA\x03\x09\x00\x66\xFF\x05\x28\x24" \
-    "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF" \
-    "\xF0\x66\x8B\x05\xCE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59\x39" \
-    "\xC8\x77\xB7\xE9\xCD\x00\x00\x00\x55\x8B\xEC\x81\xEC\x00\x00\x00" \
-    "\x00\x66\x50\xB0\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x40\x11" \
-    "\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x8B\x9D\x08\x00\x00\x00\x66" \
-    "\x50\x8A\x83\x00\x00\x00\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15" \
-    "\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x8B\x85\x08\x00\x00" \
-    "\x00\xFF\x85\x08\x00\x00\x00\x8B\xD8\x8A\x83\x00\x00\x00\x00\xB4" \
-    "\x00\x66\x3D\x00\x00\x75\xC2\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53" \
-    "\x5B\xC7\x83\x74\x46\x00\x00\x0E\x00\x00\x00\xBB\x01\x00\x00\x00" \
-    "\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB" \
-    "\x02\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00" \
-    "\x00\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74" \
-    "\x46\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53" \
-    "\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11\x00" \
-    "\x00\x8B\xE5\x5D\xC3\xE9\x95\x11\x00\x00\x55\x8B\xEC\x81\xEC\x5B" \
-    "\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x85\x09\x00\x00" \
-    "\x00\xB8\x00\x00\x00\x00\x8B\xE5\x5D\xC3\xE9\x01\x04\x00\x00\x90" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\xE9\x0B\x00\x00\x00\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-    "\xB8\x50\x06\x09\x00\x89\x85\xFC\xFF\xFF\xFF\x66\xC7\x85\xF1\xFF" \
-    "\xFF\xFF\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00" \
-    "\xB4\x00\x66\x3D\x00\x00\x0F\x84\xF0\x0C\x00\x00\x8B\x9D\x08\x00" \
-    "\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0" \
-    "\xB8\x25\x00\x00\x00\x59\x39\xC8\x0F\x85\x9F\x0C\x00\x00\x8B\x85" \
-    "\x08\x00\x00\x00\xFF\x85\x08\x00\x00\x00\x66\xC7\x85\xED\xFF\xFF" \
-    "\xFF\x00\x00\x66\x8B\x85\xED\xFF\xFF\xFF\x66\x89\x85\xEF\xFF\xFF" \
-    "\xFF\x66\x8B\x85\xEF\xFF\xFF\xFF\x88\x85\xF3\xFF\xFF\xFF\x8A\x85" \
-    "\xF3\xFF\xFF\xFF\x88\x85\xF4\xFF\xFF\xFF\x8A\x85\xF4\xFF\xFF\xFF" \
-    "\x88\x85\xF5\xFF\xFF\xFF\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00" \
-    "\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x30\x00\x00\x00\x59" \
-    "\x39\xC8\x0F\x85\x15\x00\x00\x00\x66\xC7\x85\xEF\xFF\xFF\xFF\x01" \
-    "\x00\x8B\x85\x08\x00\x00\x00\xFF\x85\x08\x00\x00\x00\x8B\x9D\x08" \
-    "\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF" \
-    "\xF0\xB8\x30\x00\x00\x00\x59\x39\xC8\x0F\x87\x2F\x00\x00\x00\x8B" \
-    "\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00" \
-    "\x00\xFF\xF0\xB8\x39\x00\x00\x00\x59\x39\xC8\x0F\x82\x0D\x00\x00" \
-    "\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\xE9\x08\x00\x00\x00\x66\xB8" \
-    "\x00\x00\x66\x3D\x00\x00\x0F\x84\x46\x00\x00\x00\xB0\x0A\xF6\xA5" \
-    "\xF4\xFF\xFF\xFF\x88\x85\xF4\xFF\xFF\xFF\x8B\x85\x08\x00\x00\x00" \
-    "\xFF\x85\x08\x00\x00\x00\x8B\xD8\x8A\x83\x00\x00\x00\x00\xB4\x00" \
-    "\x66\x89\x85\xE5\xFF\xFF\xFF\x66\x81\xAD\xE5\xFF\xFF\xFF\x30\x00" \
-    "\x66\x8B\x85\xE5\xFF\xFF\xFF\x00\x85\xF4\xFF\xFF\xFF\xE9\x5B\xFF" \
-    "\xFF\xFF\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0" \
-    "\xFF\x00\x00\x00\xFF\xF0\xB8\x2E\x00\x00\x00\x59\x39\xC8\x0F\x85" \
-    "\xB6\x00\x00\x00\x8B\x85\x08\x00\x00\x00\xFF\x85\x08\x00\x00\x00" \
-    "\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00" \
-    "\x00\x00\xFF\xF0\xB8\x30\x00\x00\x00\x59\x39\xC8\x0F\x87\x2F\x00" \
-    "\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0" \
-    "\xFF\x00\x00\x00\xFF\xF0\xB8\x39\x00\x00\x00\x59\x39\xC8\x0F\x82" \
-    "\x0D\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\xE9\x08\x00\x00" \
-    "\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\x0F\x84\x46\x00\x00\x00\xB0" \
-    "\x0A\xF6\xA5\xF3\xFF\xFF\xFF\x88\x85\xF3\xFF\xFF\xFF\x8B\x85\x08" \
-    "\x00\x00\x00\xFF\x85\x08\x00\x00\x00\x8B\xD8\x8A\x83\x00\x00\x00" \
-    "\x00\xB4\x00\x66\x89\x85\xE1\xFF\xFF\xFF\x66\x81\xAD\xE1\xFF\xFF" \
-    "\xFF\x30\x00\x66\x8B\x85\xE1\xFF\xFF\xFF\x00\x85\xF3\xFF\xFF\xFF" \
-    "\xE9\x5B\xFF\xFF\xFF\xE9\x29\x00\x00\x00\x8B\x9D\x08\x00\x00\x00" \
-    "\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x76" \
-    "\x00\x00\x00\x59\x39\xC8\x0F\x85\x07\x00\x00\x00\xC6\x85\xF3\xFF" \
-    "\xFF\xFF\x02\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81" \
-    "\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x75\x00\x00\x00\x59\x39\xC8\x0F" \
-    "\x84\x2F\x00\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00" \
-    "\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x64\x00\x00\x00\x59\x39" \
-    "\xC8\x0F\x84\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9" \
-    "\x08\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x85\x2F\x00" \
-    "\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0" \
-    "\xFF\x00\x00\x00\xFF\xF0\xB8\x69\x00\x00\x00\x59\x39\xC8\x0F\x84" \
-    "\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9\x08\x00\x00" \
-    "\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x84\x0C\x00\x00\x00\xC6" \
-    "\x85\xF5\xFF\xFF\xFF\x0A\xE9\x06\x02\x00\x00\x8B\x9D\x08\x00\x00" \
-    "\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8" \
-    "\x6F\x00\x00\x00\x59\x39\xC8\x0F\x85\x0C\x00\x00\x00\xC6\x85\xF5" \
-    "\xFF\xFF\xFF\x08\xE9\xD8\x01\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A" \
-    "\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x78\x00" \
-    "\x00\x00\x59\x39\xC8\x0F\x85\x0C\x00\x00\x00\xC6\x85\xF5\xFF\xFF" \
-    "\xFF\x03\xE9\xAA\x01\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00" \
-    "\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x58\x00\x00\x00" \
-    "\x59\x39\xC8\x0F\x85\x0C\x00\x00\x00\xC6\x85\xF5\xFF\xFF\xFF\x04" \
-    "\xE9\x7C\x01\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00" \
-    "\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x76\x00\x00\x00\x59\x39" \
-    "\xC8\x0F\x85\x0C\x00\x00\x00\xC6\x85\xF5\xFF\xFF\xFF\x05\xE9\x4E" \
-    "\x01\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81" \
-    "\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x73\x00\x00\x00\x59\x39\xC8\x0F" \
-    "\x85\x77\x00\x00\x00\x66\x8B\x85\xF1\xFF\xFF\xFF\x66\xFF\x85\xF1" \
-    "\xFF\xFF\xFF\x66\x8B\xD8\x81\xE3\xFF\xFF\x00\x00\x81\xC3\x03\x00" \
-    "\x00\x00\xC1\xE3\x02\x03\xDD\x8B\x83\x00\x00\x00\x00\x89\x85\xF8" \
-    "\xFF\xFF\xFF\x8B\x9D\xF8\xFF\xFF\xFF\x8A\x83\x00\x00\x00\x00\xB4" \
-    "\x00\x66\x3D\x00\x00\x0F\x84\x2C\x00\x00\x00\x8B\x85\xFC\xFF\xFF" \
-    "\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\x8B\x85\xF8\xFF\xFF\xFF" \
-    "\xFF\x85\xF8\xFF\xFF\xFF\x8B\xD8\x8A\x83\x00\x00\x00\x00\x5B\x88" \
-    "\x83\x00\x00\x00\x00\xEB\xBC\xE9\xB5\x00\x00\x00\x8B\x9D\x08\x00" \
-    "\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0" \
-    "\xB8\x63\x00\x00\x00\x59\x39\xC8\x0F\x85\x43\x00\x00\x00\x8B\x85" \
-    "\xFC\xFF\xFF\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\x66\x8B\x85" \
-    "\xF1\xFF\xFF\xFF\x66\xFF\x85\xF1\xFF\xFF\xFF\x66\x8B\xD8\x81\xE3" \
-    "\xFF\xFF\x00\x00\x81\xC3\x03\x00\x00\x00\xC1\xE3\x02\x03\xDD\x8B" \
-    "\x83\x00\x00\x00\x00\x5B\x88\x83\x00\x00\x00\x00\xE9\x50\x00\x00" \
-    "\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF" \
-    "\x00\x00\x00\xFF\xF0\xB8\x25\x00\x00\x00\x59\x39\xC8\x0F\x85\x2E" \
-    "\x00\x00\x00\x8B\x85\xFC\xFF\xFF\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B" \
-    "\xD8\x53\x5B\xC6\x83\x00\x00\x00\x00\x25\x8B\x85\xFC\xFF\xFF\xFF" \
-    "\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\x5B\xC6\x83\x00\x00\x00\x00" \
-    "\x25\x8A\x85\xF5\xFF\xFF\xFF\xB4\x00\x66\x3D\x00\x00\x0F\x84\xA9" \
-    "\x07\x00\x00\x66\x8B\x85\xF1\xFF\xFF\xFF\x66\xFF\x85\xF1\xFF\xFF" \
-    "\xFF\x66\x8B\xD8\x81\xE3\xFF\xFF\x00\x00\x81\xC3\x03\x00\x00\x00" \
-    "\xC1\xE3\x02\x03\xDD\x8B\x83\x00\x00\x00\x00\x89\x85\xE9\xFF\xFF" \
-    "\xFF\xC6\x85\xF7\xFF\xFF\xFF\x00\x8A\x85\xF5\xFF\xFF\xFF\x81\xE0" \
-    "\xFF\x00\x00\x00\xFF\xF0\xB8\x05\x00\x00\x00\x59\x39\xC8\x0F\x85" \
-    "\x11\x03\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\xB4\x00\x66\x89\x85\xDD" \
-    "\xFF\xFF\xFF\x66\x81\x85\xDD\xFF\xFF\xFF\x02\x00\x66\x8B\x85\xDD" \
-    "\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x8A\x85\xF3\xFF\xFF" \
-    "\xFF\x81\xE0\xFF\x00\x00\x00\x59\x39\xC8\x0F\x86\x1F\x00\x00\x00" \
-    "\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81\xE3" \
-    "\xFF\x00\x00\x00\x53\x5B\xC6\x83\x56\x0A\x09\x00\x30\xEB\xA5\xC6" \
-    "\x85\xF5\xFF\xFF\xFF\x0A\x8B\x85\xE9\xFF\xFF\xFF\x89\x85\xD9\xFF" \
-    "\xFF\xFF\xC1\xAD\xD9\xFF\xFF\xFF\x04\x8B\x85\xD9\xFF\xFF\xFF\x89" \
-    "\x85\xD5\xFF\xFF\xFF\xB8\x05\x00\x00\x00\xF7\xA5\xD5\xFF\xFF\xFF" \
-    "\x89\x85\xD5\xFF\xFF\xFF\x8B\x85\xD5\xFF\xFF\xFF\x89\x85\xD1\xFF" \
-    "\xFF\xFF\x81\x85\xD1\xFF\xFF\xFF\x04\x00\x00\x00\x8B\x85\xD1\xFF" \
-    "\xFF\xFF\x89\x85\xCD\xFF\xFF\xFF\xB9\x08\x00\x00\x00\x8B\x85\xCD" \
-    "\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7\xF1\x89\x85\xCD\xFF\xFF\xFF" \
-    "\x8B\x85\xCD\xFF\xFF\xFF\x89\x85\xE9\xFF\xFF\xFF\x8A\x85\xF3\xFF" \
-    "\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x02\x00\x00\x00\x59" \
-    "\x39\xC8\x0F\x86\xBF\x00\x00\x00\x8A\x85\xF3\xFF\xFF\xFF\xB4\x00" \
-    "\x66\x3D\x00\x00\x0F\x85\x1F\x00\x00\x00\x8A\x8D\xF5\xFF\xFF\xFF" \
-    "\x81\xE1\xFF\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00" \
-    "\x00\xF7\xF1\x89\x85\xE9\xFF\xFF\xFF\x8B\x85\xE9\xFF\xFF\xFF\x89" \
-    "\x85\xC9\xFF\xFF\xFF\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1\xFF\x00\x00" \
-    "\x00\x8B\x85\xC9\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7\xF1\x89\x95" \
-    "\xC9\xFF\xFF\xFF\xFF\xB5\xC9\xFF\xFF\xFF\xB8\x05\x00\x00\x00\x59" \
-    "\x39\xC8\x0F\x87\x30\x00\x00\x00\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1" \
-    "\xFF\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7" \
-    "\xF1\x89\x85\xE9\xFF\xFF\xFF\x8B\x85\xE9\xFF\xFF\xFF\xFF\x85\xE9" \
-    "\xFF\xFF\xFF\xE9\x1F\x00\x00\x00\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1" \
-    "\xFF\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7" \
-    "\xF1\x89\x85\xE9\xFF\xFF\xFF\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7" \
-    "\xFF\xFF\xFF\x8A\xD8\x81\xE3\xFF\x00\x00\x00\x53\x8B\x85\xE9\xFF" \
-    "\xFF\xFF\x89\x85\xC5\xFF\xFF\xFF\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1" \
-    "\xFF\x00\x00\x00\x8B\x85\xC5\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7" \
-    "\xF1\x89\x95\xC5\xFF\xFF\xFF\x8B\x85\xC5\xFF\xFF\xFF\x89\x85\xC1" \
-    "\xFF\xFF\xFF\x81\x85\xC1\xFF\xFF\xFF\x30\x00\x00\x00\x5B\x8B\x85" \
-    "\xC1\xFF\xFF\xFF\x88\x83\x56\x0A\x09\x00\x8A\x85\xF7\xFF\xFF\xFF" \
-    "\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF3\xFF\xFF\xFF\x81\xE0" \
-    "\xFF\x00\x00\x00\x59\x39\xC8\x0F\x85\x1D\x00\x00\x00\x8A\x85\xF7" \
-    "\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81\xE3\xFF\x00\x00" \
-    "\x00\x53\x5B\xC6\x83\x56\x0A\x09\x00\x2E\x8A\x8D\xF5\xFF\xFF\xFF" \
-    "\x81\xE1\xFF\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00" \
-    "\x00\xF7\xF1\x89\x85\xE9\xFF\xFF\xFF\x8B\x85\xE9\xFF\xFF\xFF\x3D" \
-    "\x00\x00\x00\x00\x0F\x85\x2D\xFF\xFF\xFF\x8A\x85\xF7\xFF\xFF\xFF" \
-    "\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF3\xFF\xFF\xFF\xB4\x00" \
-    "\x66\x89\x85\xBD\xFF\xFF\xFF\x66\x81\x85\xBD\xFF\xFF\xFF\x01\x00" \
-    "\x66\x8B\x85\xBD\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8" \
-    "\x0F\x85\x1F\x00\x00\x00\x8A\x85\xF3\xFF\xFF\xFF\xB4\x00\x66\x3D" \
-    "\x00\x00\x0F\x84\x0D\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00" \
-    "\xE9\x08\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\x0F\x84\x1D" \
-    "\x00\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A" \
-    "\xD8\x81\xE3\xFF\x00\x00\x00\x53\x5B\xC6\x83\x56\x0A\x09\x00\x30" \
-    "\xE9\x1D\x03\x00\x00\x8A\x85\xF5\xFF\xFF\xFF\x81\xE0\xFF\x00\x00" \
-    "\x00\xFF\xF0\xB8\x03\x00\x00\x00\x59\x39\xC8\x0F\x84\x29\x00\x00" \
-    "\x00\x8A\x85\xF5\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8" \
-    "\x04\x00\x00\x00\x59\x39\xC8\x0F\x84\x0D\x00\x00\x00\x66\xB8\x00" \
-    "\x00\x66\x3D\x00\x00\xE9\x08\x00\x00\x00\x66\xB8\x01\x00\x66\x3D" \
-    "\x00\x00\x0F\x84\xF6\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\x89\x85" \
-    "\xB9\xFF\xFF\xFF\x81\xA5\xB9\xFF\xFF\xFF\x0F\x00\x00\x00\x8B\x85" \
-    "\xB9\xFF\xFF\xFF\x88\x85\xF6\xFF\xFF\xFF\x8A\x85\xF6\xFF\xFF\xFF" \
-    "\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x0A\x00\x00\x00\x59\x39\xC8" \
-    "\x0F\x86\x0C\x00\x00\x00\x80\x85\xF6\xFF\xFF\xFF\x30\xE9\x2F\x00" \
-    "\x00\x00\x8A\x85\xF5\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0" \
-    "\xB8\x03\x00\x00\x00\x59\x39\xC8\x0F\x85\x0C\x00\x00\x00\x80\x85" \
-    "\xF6\xFF\xFF\xFF\x57\xE9\x07\x00\x00\x00\x80\x85\xF6\xFF\xFF\xFF" \
-    "\x37\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81" \
-    "\xE3\xFF\x00\x00\x00\x53\x5B\x8A\x85\xF6\xFF\xFF\xFF\x88\x83\x56" \
-    "\x0A\x09\x00\xC1\xAD\xE9\xFF\xFF\xFF\x04\x8B\x85\xE9\xFF\xFF\xFF" \
-    "\x3D\x00\x00\x00\x00\x0F\x85\x30\x00\x00\x00\x8A\x85\xF7\xFF\xFF" \
-    "\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF3\xFF\xFF\xFF\x81" \
-    "\xE0\xFF\x00\x00\x00\x59\x39\xC8\x0F\x87\x0D\x00\x00\x00\x66\xB8" \
-    "\x00\x00\x66\x3D\x00\x00\xE9\x08\x00\x00\x00\x66\xB8\x01\x00\x66" \
-    "\x3D\x00\x00\x0F\x85\x0F\xFF\xFF\xFF\xE9\xD4\x01\x00\x00\x8A\x85" \
-    "\xF5\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x0A\x00\x00" \
-    "\x00\x59\x39\xC8\x0F\x84\x29\x00\x00\x00\x8A\x85\xF5\xFF\xFF\xFF" \
-    "\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x08\x00\x00\x00\x59\x39\xC8" \
-    "\x0F\x84\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9\x08" \
-    "\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x84\x81\x01\x00" \
-    "\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF" \
-    "\x00\x00\x00\xFF\xF0\xB8\x64\x00\x00\x00\x59\x39\xC8\x0F\x84\x2F" \
-    "\x00\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81" \
-    "\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x69\x00\x00\x00\x59\x39\xC8\x0F" \
-    "\x84\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9\x08\x00" \
-    "\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x84\x51\x00\x00\x00" \
-    "\x8B\x85\xE9\xFF\xFF\xFF\x89\x85\xB5\xFF\xFF\xFF\xC1\xAD\xB5\xFF" \
-    "\xFF\xFF\x1F\x8B\x85\xB5\xFF\xFF\xFF\x3D\x00\x00\x00\x00\x0F\x84" \
-    "\x2D\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xF7\xD0\x89\x85\xB1\xFF" \
-    "\xFF\xFF\x81\x85\xB1\xFF\xFF\xFF\x01\x00\x00\x00\x8B\x85\xB1\xFF" \
-    "\xFF\xFF\x89\x85\xE9\xFF\xFF\xFF\x66\xC7\x85\xED\xFF\xFF\xFF\x01" \
-    "\x00\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81" \
-    "\xE3\xFF\x00\x00\x00\x53\x8B\x85\xE9\xFF\xFF\xFF\x89\x85\xAD\xFF" \
-    "\xFF\xFF\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1\xFF\x00\x00\x00\x8B\x85" \
-    "\xAD\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7\xF1\x89\x95\xAD\xFF\xFF" \
-    "\xFF\x8B\x85\xAD\xFF\xFF\xFF\x89\x85\xA9\xFF\xFF\xFF\x81\x85\xA9" \
-    "\xFF\xFF\xFF\x30\x00\x00\x00\x5B\x8B\x85\xA9\xFF\xFF\xFF\x88\x83" \
-    "\x56\x0A\x09\x00\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1\xFF\x00\x00\x00" \
-    "\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7\xF1\x89\x85\xE9" \
-    "\xFF\xFF\xFF\x8B\x85\xE9\xFF\xFF\xFF\x3D\x00\x00\x00\x00\x0F\x85" \
-    "\x30\x00\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00" \
-    "\xFF\xF0\x8A\x85\xF3\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\x59\x39" \
-    "\xC8\x0F\x87\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9" \
-    "\x08\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x85\x2F\xFF" \
-    "\xFF\xFF\x66\x8B\x85\xEF\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\xFF" \
-    "\xF0\xB8\x01\x00\x00\x00\x59\x39\xC8\x0F\x85\x42\x00\x00\x00\x8A" \
-    "\x85\xF7\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF4" \
-    "\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\x59\x39\xC8\x0F\x86\x1F\x00" \
-    "\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8" \
-    "\x81\xE3\xFF\x00\x00\x00\x53\x5B\xC6\x83\x56\x0A\x09\x00\x30\xEB" \
-    "\xBE\x66\x8B\x85\xED\xFF\xFF\xFF\x66\x3D\x00\x00\x0F\x84\x1D\x00" \
-    "\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8" \
-    "\x81\xE3\xFF\x00\x00\x00\x53\x5B\xC6\x83\x56\x0A\x09\x00\x2D\x66" \
-    "\x8B\x85\xEF\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x01" \
-    "\x00\x00\x00\x59\x39\xC8\x0F\x84\x42\x00\x00\x00\x8A\x85\xF7\xFF" \
-    "\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF4\xFF\xFF\xFF" \
-    "\x81\xE0\xFF\x00\x00\x00\x59\x39\xC8\x0F\x86\x1F\x00\x00\x00\x8A" \
-    "\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81\xE3\xFF" \
-    "\x00\x00\x00\x53\x5B\xC6\x83\x56\x0A\x09\x00\x20\xEB\xBE\x8B\x85" \
-    "\xFC\xFF\xFF\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\xFE\x8D\xF7" \
-    "\xFF\xFF\xFF\x8A\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81\xE3\xFF\x00\x00" \
-    "\x00\x8A\x83\x56\x0A\x09\x00\x5B\x88\x83\x00\x00\x00\x00\x8A\x85" \
-    "\xF7\xFF\xFF\xFF\xB4\x00\x66\x3D\x00\x00\x75\xC2\x8B\x85\x08\x00" \
-    "\x00\x00\xFF\x85\x08\x00\x00\x00\xE9\x2A\x00\x00\x00\x8B\x85\xFC" \
-    "\xFF\xFF\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\x8B\x85\x08\x00" \
-    "\x00\x00\xFF\x85\x08\x00\x00\x00\x8B\xD8\x8A\x83\x00\x00\x00\x00" \
-    "\x5B\x88\x83\x00\x00\x00\x00\xE9\xF8\xF2\xFF\xFF\x8B\x9D\xFC\xFF" \
-    "\xFF\xFF\x53\x5B\xC6\x83\x00\x00\x00\x00\x00\x68\x50\x06\x09\x00" \
-    "\xE8\xC3\xED\xFF\xFF\x81\xC4\x04\x00\x00\x00\x8B\x85\xFC\xFF\xFF" \
-    "\xFF\x89\x85\xA5\xFF\xFF\xFF\x81\xAD\xA5\xFF\xFF\xFF\x50\x06\x09" \
-    "\x00\x8B\x85\xA5\xFF\xFF\xFF\x8B\xE5\x5D\xC3\x8B\xE5\x5D\xC3\xE9" \
-    "\xE1\x25\x00\x00\x55\x8B\xEC\x81\xEC\x26\x00\x00\x00\x66\x8B\x85" \
-    "\x08\x00\x00\x00\x66\x3D\x00\x00\x0F\x84\xB3\x00\x00\x00\x66\xB8" \
-    "\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30" \
-    "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-    "\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00" \
-    "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-    "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-    "\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00" \
-    "\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-    "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-    "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-    "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-    "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-    "\x40\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-    "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x1E\x00\x00\x00\x59\x39" \
-    "\xC8\x0F\x87\x15\x00\x00\x00\xE9\x28\x00\x00\x00\x66\x8B\x05\x28" \
-    "\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\x66\x8B\x1D\x28" \
-    "\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x53\x5B\xC6\x83\x1E\x04\x09" \
-    "\x00\x00\xEB\xD8\x66\xC7\x85\xFE\xFF\xFF\xFF\x00\x00\x66\xB8\x01" \
-    "\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40" \
-    "\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00" \
-    "\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0" \
-    "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-    "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-    "\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00" \
-    "\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB" \
-    "\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07" \
-    "\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03" \
-    "\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A" \
-    "\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40" \
-    "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-    "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xC6\x03\x09\x00\x81" \
-    "\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x48" \
-    "\x02\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00" \
-    "\x00\xEB\xC6\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00" \
-    "\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00" \
-    "\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00" \
-    "\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00" \
-    "\x07\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00" \
-    "\x27\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00" \
-    "\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01" \
-    "\x01\x01\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01" \
-    "\x09\x01\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01" \
-    "\x11\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01" \
-    "\x19\x01\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01" \
-    "\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01" \
-    "\x29\x01\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01" \
-    "\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01" \
-    "\x39\x01\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01" \
-    "\x41\x01\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01" \
-    "\x49\x01\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01" \
-    "\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01" \
-    "\x59\x01\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01" \
-    "\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01" \
-    "\x69\x01\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01" \
-    "\x71\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01" \
-    "\x79\x01\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01" \
-    "\x81\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01" \
-    "\x89\x01\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01" \
-    "\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01" \
-    "\x99\x01\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01" \
-    "\xA1\x01\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01" \
-    "\xA9\x01\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01" \
-    "\xB1\x01\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01" \
-    "\xB9\x01\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3" \
-    "\xFF\xFF\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B" \
-    "\xEE\x19\x09\x00\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00" \
-    "\x00\x00\x89\xD1\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8" \
-    "\x0D\x00\x00\x00\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3" \
-    "\x00\x00\x00\x40\x88\x03\xE9\xB8\xFD\xFF\xFF\x66\xB8\x01\x04\x81" \
-    "\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-    "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-    "\x66\x03\x05\xCC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-    "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-    "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-    "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-    "\x05\xCC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-    "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-    "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-    "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-    "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-    "\x01\x04\x66\x89\x05\x0E\x00\x09\x00\x66\xB8\x01\x00\x81\xE3\xFF" \
-    "\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-    "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03" \
-    "\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-    "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-    "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89" \
-    "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC" \
-    "\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00" \
-    "\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03" \
-    "\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3" \
-    "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1" \
-    "\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7\x05\x28" \
-    "\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF" \
-    "\x00\x00\xFF\xF0\x66\x8B\x05\xC6\x03\x09\x00\x81\xE0\xFF\xFF\x00" \
-    "\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x8E\x07\x00\x00\x66" \
-    "\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6\x81" \
-    "\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00" \
-    "\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00" \
-    "\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00" \
-    "\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00" \
-    "\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00" \
-    "\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00" \
-    "\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01" \
-    "\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01" \
-    "\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01" \
-    "\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01" \
-    "\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01" \
-    "\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01" \
-    "\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01" \
-    "\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01" \
-    "\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01" \
-    "\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01" \
-    "\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01" \
-    "\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01" \
-    "\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01" \
-    "\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01" \
-    "\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01" \
-    "\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01" \
-    "\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01" \
-    "\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01" \
-    "\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01" \
-    "\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01" \
-    "\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01" \
-    "\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01" \
-    "\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01" \
-    "\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01" \
-    "\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00" \
-    "\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\xDA\x1D\x09\x00" \
-    "\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1" \
-    "\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00\x00\x00" \
-    "\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40" \
-    "\x88\x03\x66\xB8\x40\x06\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66" \
-    "\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0" \
-    "\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x81\xE3\xFF" \
-    "\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00" \
-    "\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00" \
-    "\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00" \
-    "\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00" \
-    "\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00" \
-    "\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00" \
-    "\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01" \
-    "\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01" \
-    "\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01" \
-    "\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01" \
-    "\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01" \
-    "\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01" \
-    "\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01" \
-    "\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01" \
-    "\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01" \
-    "\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01" \
-    "\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01" \
-    "\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01" \
-    "\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01" \
-    "\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01" \
-    "\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01" \
-    "\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01" \
-    "\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01" \
-    "\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01" \
-    "\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01" \
-    "\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01" \
-    "\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01" \
-    "\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01" \
-    "\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01" \
-    "\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01" \
-    "\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B" \
-    "\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\x38\x20\x09\x00\x66\x50" \
-    "\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1" \
-    "\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00\x00\x00" \
-    "\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x66\x58\x81\xC3\x00\x00" \
-    "\x00\x80\x66\x0B\x03\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x01\x00" \
-    "\x00\x00\x59\x39\xC8\x0F\x85\x71\x00\x00\x00\x66\x8B\x05\x28\x24" \
-    "\x00\x00\x66\x89\x85\xFA\xFF\xFF\xFF\x66\xB9\x08\x00\x66\x8B\x85" \
-    "\xFA\xFF\xFF\xFF\x66\xBA\x00\x00\x66\xF7\xF1\x66\x89\x85\xFA\xFF" \
-    "\xFF\xFF\x66\x8B\x9D\xFA\xFF\xFF\xFF\x81\xE3\xFF\xFF\x00\x00\x53" \
-    "\x66\xC7\x85\xF6\xFF\xFF\xFF\x01\x00\x66\x8B\x05\x28\x24\x00\x00" \
-    "\x66\x89\x85\xF2\xFF\xFF\xFF\x66\x81\xA5\xF2\xFF\xFF\xFF\x07\x00" \
-    "\x66\x8B\x8D\xF2\xFF\xFF\xFF\x66\xD3\xA5\xF6\xFF\xFF\xFF\x5B\x66" \
-    "\x8B\x85\xF6\xFF\xFF\xFF\x08\x83\x1E\x04\x09\x00\x81\xE3\xFF\xFF" \
-    "\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D" \
-    "\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F" \
-    "\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F" \
-    "\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02" \
-    "\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22" \
-    "\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20" \
-    "\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04" \
-    "\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C" \
-    "\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14" \
-    "\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C" \
-    "\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24" \
-    "\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C" \
-    "\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34" \
-    "\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C" \
-    "\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44" \
-    "\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C" \
-    "\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54" \
-    "\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C" \
-    "\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64" \
-    "\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C" \
-    "\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74" \
-    "\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C" \
-    "\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84" \
-    "\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C" \
-    "\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94" \
-    "\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C" \
-    "\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4" \
-    "\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC" \
-    "\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4" \
-    "\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC" \
-    "\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D" \
-    "\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\xF7\x22\x09\x00\x81\xE3\xFF" \
-    "\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1\xC1\xE1\x02" \
-    "\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x0D\x00\x00\x00\xD3\xE0\x81" \
-    "\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40\x88\x03\x66" \
-    "\xB8\x40\x06\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80" \
-    "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-    "\x39\x05\x04\x22\x00\xC0\x76\xF7\xE9\x72\xF8\xFF\xFF\x66\xB8\x01" \
-    "\x11\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00\x66\xC7\x05\x30\x40" \
-    "\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00" \
-    "\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0" \
-    "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-    "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-    "\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00" \
-    "\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB" \
-    "\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07" \
-    "\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03" \
-    "\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A" \
-    "\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40" \
-    "\x66\xB8\x01\x11\x66\x89\x05\x0E\x00\x09\x00\x66\xB8\x01\x14\x81" \
-    "\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-    "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-    "\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-    "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-    "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-    "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-    "\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-    "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-    "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-    "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-    "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7" \
-    "\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-    "\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xC6\x03\x09\x00\x81\xE0\xFF" \
-    "\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x48\x02\x00" \
-    "\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB" \
-    "\xC6\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00" \
-    "\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00" \
-    "\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00" \
-    "\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00" \
-    "\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00" \
-    "\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00" \
-    "\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01" \
-    "\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01" \
-    "\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01" \
-    "\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01" \
-    "\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01" \
-    "\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01" \
-    "\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01" \
-    "\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01" \
-    "\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01" \
-    "\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01" \
-    "\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01" \
-    "\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01" \
-    "\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01" \
-    "\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01" \
-    "\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01" \
-    "\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01" \
-    "\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01" \
-    "\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01" \
-    "\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01" \
-    "\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01" \
-    "\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01" \
-    "\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01" \
-    "\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01" \
-    "\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01" \
-    "\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF" \
-    "\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\x0C\x27" \
-    "\x09\x00\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00" \
-    "\x89\xD1\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00" \
-    "\x00\x00\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00" \
-    "\x00\x40\x88\x03\xE9\xB8\xFD\xFF\xFF\x66\xB8\x01\x00\x81\xE3\xFF" \
-    "\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-    "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03" \
-    "\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-    "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-    "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89" \
-    "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC" \
-    "\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00" \
-    "\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03" \
-    "\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3" \
-    "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1" \
-    "\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7\x05\x28" \
-    "\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF" \
-    "\x00\x00\xFF\xF0\x66\x8B\x05\xC6\x03\x09\x00\x81\xE0\xFF\xFF\x00" \
-    "\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x48\x02\x00\x00\x66" \
-    "\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6\x81" \
-    "\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00" \
-    "\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00" \
-    "\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00" \
-    "\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00" \
-    "\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00" \
-    "\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00" \
-    "\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01" \
-    "\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01" \
-    "\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01" \
-    "\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01" \
-    "\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01" \
-    "\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01" \
-    "\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01" \
-    "\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01" \
-    "\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01" \
-    "\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01" \
-    "\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01" \
-    "\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01" \
-    "\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01" \
-    "\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01" \
-    "\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01" \
-    "\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01" \
-    "\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01" \
-    "\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01" \
-    "\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01" \
-    "\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01" \
-    "\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01" \
-    "\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01" \
-    "\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01" \
-    "\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01" \
-    "\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00" \
-    "\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\x3A\x2A\x09\x00" \
-    "\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1" \
-    "\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x09\x00\x00\x00" \
-    "\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40" \
-    "\x88\x03\xE9\xB8\xFD\xFF\xFF\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00" \
-    "\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9" \
-    "\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC" \
-    "\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-    "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-    "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-    "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00" \
-    "\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89" \
-    "\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81" \
-    "\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3" \
-    "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03" \
-    "\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7\x05\x28\x24\x00" \
-    "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00" \
-    "\xFF\xF0\x66\x8B\x05\xC6\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59" \
-    "\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x8E\x07\x00\x00\x66\x8B\x05" \
-    "\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6\x81\xE3\xFF" \
-    "\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00" \
-    "\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00" \
-    "\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00" \
-    "\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00" \
-    "\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00" \
-    "\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00" \
-    "\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01" \
-    "\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01" \
-    "\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01" \
-    "\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01" \
-    "\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01" \
-    "\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01" \
-    "\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01" \
-    "\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01" \
-    "\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01" \
-    "\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01" \
-    "\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01" \
-    "\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01" \
-    "\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01" \
-    "\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01" \
-    "\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01" \
-    "\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01" \
-    "\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01" \
-    "\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01" \
-    "\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01" \
-    "\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01" \
-    "\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01" \
-    "\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01" \
-    "\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01" \
-    "\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01" \
-    "\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B" \
-    "\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\x68\x2D\x09\x00\x81\xE3" \
-    "\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1\xC1\xE1" \
-    "\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00\x00\x00\xD3\xE0" \
-    "\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40\x88\x03" \
-    "\x66\xB8\x40\x06\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9" \
-    "\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4" \
-    "\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x81\xE3\xFF\xFF\x00" \
-    "\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00" \
-    "\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00" \
-    "\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00" \
-    "\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00" \
-    "\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00" \
-    "\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00" \
-    "\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04\x01" \
-    "\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01" \
-    "\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14\x01" \
-    "\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01" \
-    "\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24\x01" \
-    "\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C\x01" \
-    "\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34\x01" \
-    "\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C\x01" \
-    "\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44\x01" \
-    "\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C\x01" \
-    "\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01" \
-    "\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C\x01" \
-    "\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01" \
-    "\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C\x01" \
-    "\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74\x01" \
-    "\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C\x01" \
-    "\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84\x01" \
-    "\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C\x01" \
-    "\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01" \
-    "\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C\x01" \
-    "\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4\x01" \
-    "\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC\x01" \
-    "\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4\x01" \
-    "\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC\x01" \
-    "\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D\x28" \
-    "\x24\x00\x00\xD1\xE3\x66\x8B\x9B\xC6\x2F\x09\x00\x66\x50\x81\xE3" \
-    "\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1\xC1\xE1" \
-    "\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00\x00\x00\xD3\xE0" \
-    "\x81\xE3\xFC\x03\x00\x00\x03\xD8\x66\x58\x81\xC3\x00\x00\x00\x80" \
-    "\x66\x0B\x03\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x00\x00\x00\x00" \
-    "\x59\x39\xC8\x0F\x85\x71\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-    "\x66\x89\x85\xEE\xFF\xFF\xFF\x66\xB9\x08\x00\x66\x8B\x85\xEE\xFF" \
-    "\xFF\xFF\x66\xBA\x00\x00\x66\xF7\xF1\x66\x89\x85\xEE\xFF\xFF\xFF" \
-    "\x66\x8B\x9D\xEE\xFF\xFF\xFF\x81\xE3\xFF\xFF\x00\x00\x53\x66\xC7" \
-    "\x85\xEA\xFF\xFF\xFF\x01\x00\x66\x8B\x05\x28\x24\x00\x00\x66\x89" \
-    "\x85\xE6\xFF\xFF\xFF\x66\x81\xA5\xE6\xFF\xFF\xFF\x07\x00\x66\x8B" \
-    "\x8D\xE6\xFF\xFF\xFF\x66\xD3\xA5\xEA\xFF\xFF\xFF\x5B\x66\x8B\x85" \
-    "\xEA\xFF\xFF\xFF\x08\x83\x1E\x04\x09\x00\x81\xE3\xFF\xFF\x00\x00" \
-    "\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39" \
-    "\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B" \
-    "\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B" \
-    "\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00\x06" \
-    "\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00\x26" \
-    "\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24" \
-    "\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04\x01\x05" \
-    "\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01\x0D" \
-    "\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14\x01\x15" \
-    "\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01\x1D" \
-    "\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24\x01\x25" \
-    "\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C\x01\x2D" \
-    "\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34\x01\x35" \
-    "\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C\x01\x3D" \
-    "\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44\x01\x45" \
-    "\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C\x01\x4D" \
-    "\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55" \
-    "\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C\x01\x5D" \
-    "\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65" \
-    "\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C\x01\x6D" \
-    "\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74\x01\x75" \
-    "\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C\x01\x7D" \
-    "\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84\x01\x85" \
-    "\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C\x01\x8D" \
-    "\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95" \
-    "\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C\x01\x9D" \
-    "\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4\x01\xA5" \
-    "\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC\x01\xAD" \
-    "\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4\x01\xB5" \
-    "\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC\x01\xBD" \
-    "\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D\x28\x24" \
-    "\x00\x00\xD1\xE3\x66\x8B\x9B\x85\x32\x09\x00\x81\xE3\xFF\x03\x00" \
-    "\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1\xC1\xE1\x02\x03\xCA" \
-    "\x81\xC1\x0A\x00\x00\x00\xB8\x09\x00\x00\x00\xD3\xE0\x81\xE3\xFC" \
-    "\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40\x88\x03\x66\xB8\x40" \
-    "\x06\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-    "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-    "\x04\x22\x00\xC0\x76\xF7\xE9\x72\xF8\xFF\xFF\x66\xC7\x05\x28\x24" \
-    "\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00" \
-    "\x00\xFF\xF0\x66\x8B\x05\xCE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00" \
-    "\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x12\x01\x00\x00\x66\x8B" \
-    "\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6\x66\x8B" \
-    "\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xD6\x03\x09" \
-    "\x00\xB4\x00\x66\x89\x85\xE2\xFF\xFF\xFF\x66\x8B\x1D\x28\x24\x00" \
-    "\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\x1E\x04\x09\x00\xF6\xD0\xB4" \
-    "\x00\x66\x21\x85\xE2\xFF\xFF\xFF\x66\x8B\x85\xE2\xFF\xFF\xFF\x66" \
-    "\x3D\x00\x00\x0F\x84\x0E\x00\x00\x00\x66\x81\x8D\xFE\xFF\xFF\xFF" \
-    "\x02\x00\xE9\x52\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3" \
-    "\xFF\xFF\x00\x00\x8A\x83\xD6\x03\x09\x00\xB4\x00\x66\x89\x85\xDE" \
-    "\xFF\xFF\xFF\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00" \
-    "\x8A\x83\x1E\x04\x09\x00\xB4\x00\x66\x21\x85\xDE\xFF\xFF\xFF\x66" \
-    "\x8B\x85\xDE\xFF\xFF\xFF\x66\x3D\x00\x00\x0F\x84\x09\x00\x00\x00" \
-    "\x66\x81\x8D\xFE\xFF\xFF\xFF\x01\x00\x66\x8B\x1D\x28\x24\x00\x00" \
-    "\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xFA\x03\x09\x00\xB4\x00\x66\x89" \
-    "\x85\xDA\xFF\xFF\xFF\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF" \
-    "\x00\x00\x8A\x83\x1E\x04\x09\x00\xB4\x00\x66\x21\x85\xDA\xFF\xFF" \
-    "\xFF\x66\x8B\x85\xDA\xFF\xFF\xFF\x66\x3D\x00\x00\x0F\x84\x09\x00" \
-    "\x00\x00\x66\x81\x8D\xFE\xFF\xFF\xFF\x04\x00\xE9\xEE\xFE\xFF\xFF" \
-    "\x66\xB8\x00\x00\x66\x3D\x00\x00\x0F\x84\x2A\x00\x00\x00\x66\x8B" \
-    "\x85\xFE\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x01\x00" \
-    "\x00\x00\x59\x39\xC8\x0F\x84\x0D\x00\x00\x00\x66\xB8\x01\x00\x66" \
-    "\x3D\x00\x00\xE9\x08\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00" \
-    "\x0F\x84\x7A\x02\x00\x00\xE9\x23\x00\x00\x00\x90\x0A\x43\x6F\x6E" \
-    "\x74\x69\x6E\x75\x69\x74\x79\x20\x46\x61\x69\x6C\x75\x72\x65\x20" \
-    "\x6F\x6E\x20\x53\x6F\x63\x6B\x65\x74\x20\x25\x64\x0A\x00\x66\x8B" \
-    "\x05\x24\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x68\x6C\x36" \
-    "\x09\x00\xE8\x83\xCF\xFF\xFF\x81\xC4\x08\x00\x00\x00\xE9\x13\x00" \
-    "\x00\x00\x43\x4F\x4E\x54\x20\x3D\x20\x20\x20\x20\x20\x20\x20\x20" \
-    "\x20\x20\x30\x78\x00\x68\xB2\x36\x09\x00\xE8\x5B\xCF\xFF\xFF\x81" \
-    "\xC4\x04\x00\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B" \
-    "\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05" \
-    "\xCE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15" \
-    "\x00\x00\x00\xE9\x48\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66" \
-    "\xFF\x05\x28\x24\x00\x00\xEB\xC6\xE9\x06\x00\x00\x00\x90\x25\x30" \
-    "\x32\x58\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00" \
-    "\x8A\x83\x1E\x04\x09\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x68\x1E" \
-    "\x37\x09\x00\xE8\xE2\xCE\xFF\xFF\x81\xC4\x08\x00\x00\x00\xEB\xB8" \
-    "\xE9\x03\x00\x00\x00\x90\x0A\x00\x68\x56\x37\x09\x00\xE8\xC8\xCE" \
-    "\xFF\xFF\x81\xC4\x04\x00\x00\x00\xE9\x14\x00\x00\x00\x90\x4D\x55" \
-    "\x53\x54\x20\x43\x4F\x4E\x4E\x20\x3D\x20\x20\x20\x20\x20\x30\x78" \
-    "\x00\x68\x6E\x37\x09\x00\xE8\x9F\xCE\xFF\xFF\x81\xC4\x04\x00\x00" \
-    "\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-    "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xCE\x03\x09\x00" \
-    "\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9" \
-    "\x48\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24" \
-    "\x00\x00\xEB\xC6\xE9\x06\x00\x00\x00\x90\x25\x30\x32\x58\x00\x66" \
-    "\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xD6\x03" \
-    "\x09\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x68\xDA\x37\x09\x00\xE8" \
-    "\x26\xCE\xFF\xFF\x81\xC4\x08\x00\x00\x00\xEB\xB8\xE9\x03\x00\x00" \
-    "\x00\x90\x0A\x00\x68\x12\x38\x09\x00\xE8\x0C\xCE\xFF\xFF\x81\xC4" \
-    "\x04\x00\x00\x00\xE9\x14\x00\x00\x00\x90\x4D\x55\x53\x54\x20\x4E" \
-    "\x4F\x54\x20\x43\x4F\x4E\x4E\x20\x3D\x20\x30\x78\x00\x68\x2A\x38" \
-    "\x09\x00\xE8\xE3\xCD\xFF\xFF\x81\xC4\x04\x00\x00\x00\x66\xC7\x05" \
-    "\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF" \
-    "\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xCE\x03\x09\x00\x81\xE0\xFF\xFF" \
-    "\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x48\x00\x00\x00" \
-    "\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6" \
-    "\xE9\x06\x00\x00\x00\x90\x25\x30\x32\x58\x00\x66\x8B\x1D\x28\x24" \
-    "\x00\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xFA\x03\x09\x00\x81\xE0" \
-    "\xFF\x00\x00\x00\xFF\xF0\x68\x96\x38\x09\x00\xE8\x6A\xCD\xFF\xFF" \
-    "\x81\xC4\x08\x00\x00\x00\xEB\xB8\xE9\x03\x00\x00\x00\x90\x0A\x00" \
-    "\x68\xCE\x38\x09\x00\xE8\x50\xCD\xFF\xFF\x81\xC4\x04\x00\x00\x00" \
-    "\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7" \
-    "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-    "\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90" \
-    "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-    "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-    "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-    "\x00\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-    "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-    "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-    "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-    "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-    "\x00\x00\x40\x66\xB8\x01\x10\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C" \
-    "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-    "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66" \
-    "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-    "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-    "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-    "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14" \
-    "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-    "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-    "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-    "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-    "\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x10\x66\x89\x05\x0E\x00\x09" \
-    "\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-    "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xC6\x03\x09\x00" \
-    "\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9" \
-    "\x48\x02\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24" \
-    "\x00\x00\xEB\xC6\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C" \
-    "\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E" \
-    "\x00\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E" \
-    "\x00\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03" \
-    "\x00\x07\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23" \
-    "\x00\x27\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21" \
-    "\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00" \
-    "\x01\x01\x01\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08" \
-    "\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10" \
-    "\x01\x11\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18" \
-    "\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20" \
-    "\x01\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28" \
-    "\x01\x29\x01\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30" \
-    "\x01\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38" \
-    "\x01\x39\x01\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40" \
-    "\x01\x41\x01\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48" \
-    "\x01\x49\x01\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50" \
-    "\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58" \
-    "\x01\x59\x01\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60" \
-    "\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68" \
-    "\x01\x69\x01\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70" \
-    "\x01\x71\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78" \
-    "\x01\x79\x01\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80" \
-    "\x01\x81\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88" \
-    "\x01\x89\x01\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90" \
-    "\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98" \
-    "\x01\x99\x01\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0" \
-    "\x01\xA1\x01\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8" \
-    "\x01\xA9\x01\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0" \
-    "\x01\xB1\x01\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8" \
-    "\x01\xB9\x01\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81" \
-    "\xE3\xFF\xFF\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B" \
-    "\x9B\x9F\x3A\x09\x00\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03" \
-    "\x00\x00\x00\x89\xD1\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00" \
-    "\xB8\x01\x00\x00\x00\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81" \
-    "\xC3\x00\x00\x00\x40\x88\x03\xE9\xB8\xFD\xFF\xFF\x66\x8B\x85\x08" \
-    "\x00\x00\x00\x66\x3D\x00\x00\x0F\x84\xB3\x00\x00\x00\x66\xB8\x01" \
-    "\x2D\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30\x40" \
-    "\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00" \
-    "\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0" \
-    "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-    "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-    "\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00" \
-    "\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB" \
-    "\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07" \
-    "\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03" \
-    "\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A" \
-    "\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40" \
-    "\x66\x8B\x85\xFE\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\x8B\xE5\x5D" \
-    "\xC3\x8B\xE5\x5D\xC3\xE9\x21\x00\x00\x00\x55\x8B\xEC\x81\xEC\x00" \
-    "\x00\x00\x00\x68\x01\x00\x00\x00\xE8\x07\xDA\xFF\xFF\x81\xC4\x04" \
-    "\x00\x00\x00\x8B\xE5\x5D\xC3\x8B\xE5\x5D\xC3\x66\xB9\x00\x00\xB2" \
-    "\x00\xFB\xFF\x25\x44\x11\x00\x00"
-
-# Generated from packet 233/234
-p233 = \
-    "\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7" \
-    "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-    "\x00\x00\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90" \
-    "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-    "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-    "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-    "\x00\x00\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-    "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-    "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-    "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-    "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-    "\x00\x00\x40\xE9\x02\x00\x00\x00\x00\x00\x66\xC7\x05\x98\x3E\x09" \
-    "\x00\x0A\x00\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\xA8" \
-    "\x3E\x09\x00\x00\x00\x68\x00\x00\x00\x00\xE8\x05\xD9\xFF\xFF\x81" \
-    "\xC4\x04\x00\x00\x00\x66\x89\xC6\x66\x8B\xC6\x81\xE0\xFF\xFF\x00" \
-    "\x00\xFF\xF0\xB8\x01\x00\x00\x00\x59\x39\xC8\x0F\x85\x0E\x00\x00" \
-    "\x00\x66\xC7\x05\x98\x3E\x09\x00\x00\x00\xE9\x0E\x00\x00\x00\x66" \
-    "\x8B\x05\x98\x3E\x09\x00\x66\xFF\x0D\x98\x3E\x09\x00\x66\x8B\x05" \
-    "\x98\x3E\x09\x00\x66\x3D\x00\x00\x75\x99\x66\x8B\xC6\x81\xE0\xFF" \
-    "\xFF\x00\x00\xFF\xF0\xB8\x01\x00\x00\x00\x59\x39\xC8\x0F\x84\x4F" \
-    "\x01\x00\x00\x66\x8B\x05\x36\x00\x09\x00\x66\x3D\x00\x00\x0F\x84" \
-    "\x3E\x01\x00\x00\x66\x50\xB0\x10\xFB\x66\x53\x66\x51\x8A\xC8\xFF" \
-    "\x15\x40\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\x50\xB0\x00" \
-    "\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66" \
-    "\x5B\xFA\x66\x58\x66\x50\x66\x8B\xC6\xFB\x66\x53\x66\x51\x8A\xC8" \
-    "\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\x50\x66" \
-    "\x8B\x05\xCE\x03\x09\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C" \
-    "\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\xC7\x05\x28\x24\x00" \
-    "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00" \
-    "\xFF\xF0\x66\x8B\x05\xCE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59" \
-    "\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x3B\x00\x00\x00\x66\xFF\x05" \
-    "\x28\x24\x00\x00\x66\x8B\x05\x28\x24\x00\x00\xEB\xC6\x66\x8B\x1D" \
-    "\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x66\x50\x8A\x83\x1E\x04" \
-    "\x09\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66" \
-    "\x59\x66\x5B\xFA\x66\x58\xEB\xC5\xBB\x00\x00\x00\x00\xC1\xE3\x02" \
-    "\x53\x5B\xC7\x83\x74\x46\x00\x00\x0E\x00\x00\x00\xBB\x01\x00\x00" \
-    "\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00" \
-    "\xBB\x02\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00" \
-    "\x00\x00\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83" \
-    "\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02" \
-    "\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11" \
-    "\x00\x00\x66\x50\x66\x8B\xC6\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15" \
-    "\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\x8B\xC6\x81\xE0" \
-    "\xFF\xFF\x00\x00\xFF\xF0\xB8\x01\x00\x00\x00\x59\x39\xC8\x0F\x84" \
-    "\x5A\x00\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D" \
-    "\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x66\x50\x8A\x83\x1E\x04" \
-    "\x09\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66" \
-    "\x59\x66\x5B\xFA\x66\x58\x66\xFF\x05\x28\x24\x00\x00\x66\x8B\x05" \
-    "\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xCE" \
-    "\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x77\xAF\x66\xB8" \
-    "\x01\x2D\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30" \
-    "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-    "\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00" \
-    "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-    "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-    "\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00" \
-    "\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-    "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-    "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-    "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-    "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-    "\x40\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-
-# Generated from packet 257/258
-p257 = \
-    "\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7" \
-    "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-    "\x00\x00\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90" \
-    "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-    "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-    "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-    "\x00\x00\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-    "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-    "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-    "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-    "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-    "\x00\x00\x40\x66\xB8\x58\x02\x66\x8B\x15\x3E\x25\x00\x00\x66\xF7" \
-    "\xE2\x66\x81\xFA\x01\x00\x73\x15\x66\x03\x05\x3C\x25\x00\x00\x72" \
-    "\x0C\x66\x81\xE0\xF0\xFF\x66\x81\xC8\x01\x00\xEB\x05\x66\xC7\xC0" \
-    "\xF1\xFF\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x14\x00\x66\xC7\x05\x30" \
-    "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-    "\x00\xF0\xFF\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-    "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-    "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-    "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-    "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-    "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-    "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-    "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-    "\x00\x00\x40\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04" \
-    "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-    "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66" \
-    "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-    "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-    "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-    "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14" \
-    "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-    "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-    "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-    "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-    "\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00" \
-    "\x66\xBB\x1C\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C\x66" \
-    "\x50\x66\x52\x66\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7\x35\x40\x25" \
-    "\x00\x00\x66\x5A\x66\x81\xF8\x00\x00\x75\x04\x66\xB8\x01\x00\x66" \
-    "\x81\xE0\xF0\xFF\x66\x81\xC8\x01\x00\x66\x89\x05\x90\x40\x00\xC0" \
-    "\x66\x58\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\xC6\x05\x14\x22\x00" \
-    "\xC0\x7B\x66\xC7\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00" \
-    "\xC0\xBB\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\x66\xC7\x05\x30\x40" \
-    "\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00" \
-    "\xF0\xFF\x66\x03\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00" \
-    "\xD0\x07\x72\x15\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00\x00" \
-    "\x66\x89\x0D\x90\x40\x00\xC0\xEB\x07\x66\x89\x05\x90\x40\x00\xC0" \
-    "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-    "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-    "\x40\x00\xC0\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05" \
-    "\x14\x22\x00\xC0\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40" \
-    "\x00\xC0\x66\x89\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-    "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D" \
-    "\x40\x25\x00\x00\xD0\x07\x72\x24\x66\x50\x66\x29\xC8\x73\x00\xC6" \
-    "\x05\x14\x22\x00\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00" \
-    "\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x58\xC6\x05\x14\x22" \
-    "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-    "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-    "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-    "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-    "\x82\x00\x00\x00\x40\x66\xB8\x80\x0C\x66\x2D\x07\x00\x72\x1F\x66" \
-    "\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04" \
-    "\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\xE9\x05" \
-    "\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x24\x46\x09\x00\x00" \
-    "\x00\x66\xB8\x01\x11\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00\x66" \
-    "\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81" \
-    "\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89\x05" \
-    "\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-    "\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00" \
-    "\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81" \
-    "\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22\x00" \
-    "\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89" \
-    "\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89" \
-    "\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-    "\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82" \
-    "\x00\x00\x00\x40\x31\xC0\x66\x0B\x05\x1C\x04\x00\x80\x66\x50\x66" \
-    "\x8B\x05\x0E\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00" \
-    "\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7" \
-    "\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89" \
-    "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-    "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-    "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-    "\x81\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22" \
-    "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-    "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-    "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-    "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-    "\x82\x00\x00\x00\x40\x66\x58\xB4\x00\x66\x89\xC7\x66\xB8\x01\x00" \
-    "\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00" \
-    "\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0" \
-    "\xFF\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89" \
-    "\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05" \
-    "\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40" \
-    "\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66" \
-    "\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00" \
-    "\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00" \
-    "\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00" \
-    "\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89" \
-    "\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66" \
-    "\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C\x00\x66\x81\x3D" \
-    "\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52\x66\xBA\xD0\x07" \
-    "\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66\x5A\x66\x81\xF8" \
-    "\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0\xFF\x66\x81\xC8" \
-    "\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66\xC7\x05\x50\x40" \
-    "\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66\xC7\x05\x50\x40" \
-    "\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66\xC7\x05\x50\x40" \
-    "\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1" \
-    "\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xEC\x46" \
-    "\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x15\x89\xD9\xC1" \
-    "\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D\x90\x40\x00\xC0" \
-    "\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00" \
-    "\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81" \
-    "\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x81\x3D\x40" \
-    "\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00\xC0\x02\x81\xE2" \
-    "\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66\x89\x05\x90\x40" \
-    "\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66" \
-    "\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72" \
-    "\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22\x00\xC0\x1B\x66" \
-    "\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-    "\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-    "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-    "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-    "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-    "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-    "\xB8\x0B\x66\x8B\x15\x3E\x25\x00\x00\x66\xF7\xE2\x66\x81\xFA\x01" \
-    "\x00\x73\x15\x66\x03\x05\x3C\x25\x00\x00\x72\x0C\x66\x81\xE0\xF0" \
-    "\xFF\x66\x81\xC8\x01\x00\xEB\x05\x66\xC7\xC0\xF1\xFF\x81\xE3\xFF" \
-    "\xFF\x00\x00\x66\xBB\x14\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-    "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x89" \
-    "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-    "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-    "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-    "\x81\x00\x00\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-    "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-    "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-    "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-    "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-    "\x01\x2D\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30" \
-    "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-    "\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00" \
-    "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-    "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-    "\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00" \
-    "\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-    "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-    "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-    "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-    "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-    "\x40\x66\x8B\xC7\x66\x3D\x00\x00\x0F\x85\x09\x00\x00\x00\x66\xB9" \
-    "\x01\x00\xE9\x04\x00\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25" \
-    "\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00" \
-    "\x00"
-
-# Generated from packet 281/282
-p281 = \
-    "\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x00\x00\x66\xC7" \
-    "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-    "\x00\x00\x00\xF0\xFF\x66\x03\x05\xB4\x46\x00\x00\x66\x89\x05\x90" \
-    "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-    "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-    "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-    "\x00\x00\x00\x66\x2B\x05\xB4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-    "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-    "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-    "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-    "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-    "\x00\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C" \
-    "\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52" \
-    "\x66\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66" \
-    "\x5A\x66\x81\xF8\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0" \
-    "\xFF\x66\x81\xC8\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66" \
-    "\xC7\x05\x50\x40\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66" \
-    "\xC7\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66" \
-    "\xC7\x05\x50\x40\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0" \
-    "\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66" \
-    "\x03\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72" \
-    "\x15\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D" \
-    "\x90\x40\x00\xC0\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81" \
-    "\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22" \
-    "\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-    "\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00" \
-    "\xC0\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66" \
-    "\x89\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-    "\x00\x00\x00\x66\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00" \
-    "\x00\xD0\x07\x72\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22" \
-    "\x00\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00" \
-    "\x66\x89\x15\x50\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB" \
-    "\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81" \
-    "\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81" \
-    "\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1" \
-    "\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00" \
-    "\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A\x00" \
-    "\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7" \
-    "\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66\x89" \
-    "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-    "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-    "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-    "\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14\x22" \
-    "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-    "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-    "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-    "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-    "\x82\x00\x00\x00\x40\x66\xB8\x00\xD4\x66\xBA\x30\x00\x66\x4A\x78" \
-    "\x1B\xFB\x90\xFA\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66" \
-    "\xF7\x05\x04\x22\x00\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66" \
-    "\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0" \
-    "\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x06\x00" \
-    "\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C\x00\x66\x81\x3D\x40" \
-    "\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52\x66\xBA\xD0\x07\x66" \
-    "\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66\x5A\x66\x81\xF8\x00" \
-    "\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0\xFF\x66\x81\xC8\x01" \
-    "\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66\xC7\x05\x50\x40\x00" \
-    "\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66\xC7\x05\x50\x40\x00" \
-    "\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66\xC7\x05\x50\x40\x00" \
-    "\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1" \
-    "\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xEC\x46\x00" \
-    "\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x15\x89\xD9\xC1\xE1" \
-    "\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D\x90\x40\x00\xC0\xEB" \
-    "\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00" \
-    "\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA" \
-    "\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x81\x3D\x40\x25" \
-    "\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00\xC0\x02\x81\xE2\xFF" \
-    "\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66\x89\x05\x90\x40\x00" \
-    "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-    "\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x24" \
-    "\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22\x00\xC0\x1B\x66\x81" \
-    "\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-    "\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00" \
-    "\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00" \
-    "\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00" \
-    "\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81" \
-    "\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x40" \
-    "\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-    "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-    "\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF" \
-    "\xFF\x00\x00\x66\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-    "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03" \
-    "\x05\x08\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-    "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-    "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89" \
-    "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08" \
-    "\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00" \
-    "\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03" \
-    "\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3" \
-    "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1" \
-    "\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x40\x01" \
-    "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-    "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-    "\x22\x00\xC0\x76\xF7\x88\x05\x3C\x00\xD0\x40\x66\xB8\x01\x1E\x81" \
-    "\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-    "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-    "\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-    "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-    "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-    "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-    "\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-    "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-    "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-    "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-    "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-    "\x80\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A" \
-    "\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39" \
-    "\x05\x04\x22\x00\xC0\x76\xF7\x66\xC7\x05\x10\x22\x00\xC0\x05\x00" \
-    "\x66\xC7\x05\x12\x22\x00\xC0\x01\x86\x66\xC7\x05\x1E\x00\x09\x00" \
-    "\x01\x86\x66\xB8\x00\xD4\x66\xBA\x30\x00\x66\x4A\x78\x1B\xFB\x90" \
-    "\xFA\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05\x04" \
-    "\x22\x00\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9\x80" \
-    "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-    "\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\xB9\x00\x00\xB2\x02\xFB\xFF" \
-    "\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11" \
-    "\x00\x00"
-
-# Generated from packet 295/296
-p295 = \
-    "\x66\xC7\x05\x1A\x24\x00\x00\xFF\xFF\x66\x8B\x05\x1A\x24\x00\x00" \
-    "\x66\x89\x05\x18\x24\x00\x00\x88\x05\x1C\x00\xD0\x40\x88\x05\x24" \
-    "\x00\xD0\x40\x88\x05\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88" \
-    "\x05\x3C\x00\xD0\x40\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF" \
-    "\x00\x00\x66\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89" \
-    "\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05" \
-    "\x08\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00" \
-    "\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0" \
-    "\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9" \
-    "\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47" \
-    "\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66" \
-    "\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2" \
-    "\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2" \
-    "\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC" \
-    "\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90" \
-    "\x52\x88\x05\x24\x00\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05" \
-    "\x4E\x00\x09\x00\x66\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05" \
-    "\x30\x00\x00\x52\x66\xC7\x05\x30\x24\x00\x00\x19\x00\x88\x05\x1C" \
-    "\x00\x90\x40\x88\x05\x28\x00\x00\x52\x88\x05\x2C\x00\x00\x52\x88" \
-    "\x05\x30\x00\x00\x52\x88\x05\x3C\x00\x00\x52\x51\x8B\x0D\x04\x02" \
-    "\x00\x00\x88\x05\x00\x00\x90\x40\x81\xE1\xFF\xFE\xFF\xFF\x88\x05" \
-    "\x04\x00\x90\x40\x81\xE1\xFF\xFD\xFF\xFF\x88\x05\x08\x00\x90\x40" \
-    "\x81\xE1\xFF\xFB\xFF\xFF\x88\x05\x0C\x00\x90\x40\x81\xE1\xFF\xF7" \
-    "\xFF\xFF\x88\x05\x30\xA4\x04\x40\x81\xE1\xF7\xFF\xFF\xFF\x81\xE1" \
-    "\x7F\xFF\xFF\xFF\x88\x05\x34\xA4\x04\x40\x81\xE1\xFB\xFF\xFF\xFF" \
-    "\x81\xE1\xBF\xFF\xFF\xFF\x88\x05\x38\xA4\x06\x40\x81\xE1\xFD\xFF" \
-    "\xFF\xFF\x81\xC9\x20\x00\x00\x00\x88\x05\x3C\xA4\x06\x40\x81\xE1" \
-    "\xFE\xFF\xFF\xFF\x81\xC9\x10\x00\x00\x00\x89\x0D\x04\x02\x00\x00" \
-    "\x59\x66\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81" \
-    "\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72" \
-    "\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x20" \
-    "\x94\x06\x80\x66\x0B\x05\x24\x8C\x05\x80\x66\x0B\x05\x28\x84\x04" \
-    "\x80\x66\x0B\x05\x2C\x80\xF3\x80\xB4\x00\x66\x89\x05\x18\x24\x00" \
-    "\x00\x8B\x05\x04\x02\x00\x00\x8B\xC8\x40\x31\xC1\x89\x05\x04\x02" \
-    "\x00\x00\x88\x05\x3C\x04\x00\x80\xC1\xE9\x01\x0F\x84\x9F\x00\x00" \
-    "\x00\x88\x05\x38\x0C\x00\x80\xC1\xE9\x01\x0F\x84\x90\x00\x00\x00" \
-    "\x88\x05\x34\x14\x00\x80\xC1\xE9\x01\x0F\x84\x81\x00\x00\x00\x88" \
-    "\x05\x30\x1C\x00\x80\xC1\xE9\x01\x0F\x84\x72\x00\x00\x00\x88\x05" \
-    "\x3C\x80\x04\x80\xC1\xE9\x01\x0F\x84\x63\x00\x00\x00\x88\x05\x38" \
-    "\x80\x05\x80\xC1\xE9\x01\x0F\x84\x54\x00\x00\x00\x88\x05\x34\x80" \
-    "\x06\x80\xC1\xE9\x01\x0F\x84\x45\x00\x00\x00\x88\x05\x30\x80\x07" \
-    "\x80\xC1\xE9\x01\x0F\x84\x36\x00\x00\x00\x88\x05\x00\x00\x10\x81" \
-    "\xC1\xE9\x01\x0F\x84\x27\x00\x00\x00\x88\x05\x04\x00\x30\x81\xC1" \
-    "\xE9\x01\x0F\x84\x18\x00\x00\x00\x88\x05\x08\x00\x50\x81\xC1\xE9" \
-    "\x01\x0F\x84\x09\x00\x00\x00\x88\x05\x0C\x00\x70\x81\xC1\xE9\x01" \
-    "\x66\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9" \
-    "\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4" \
-    "\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x20\x94" \
-    "\x06\x80\x66\x0B\x05\x24\x8C\x05\x80\x66\x0B\x05\x28\x84\x04\x80" \
-    "\x66\x0B\x05\x2C\x80\xF3\x80\xB4\x00\x66\x89\x05\x1A\x24\x00\x00" \
-    "\x66\x8B\x0D\x18\x24\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00" \
-    "\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-# Generated from packet 323/324
-p323 = \
-    "\x66\x8B\x05\x1E\x00\x09\x00\x66\x81\xE0\xFF\xF3\x66\x89\x05\x12" \
-    "\x22\x00\xC0\x66\x8B\x05\x1E\x00\x09\x00\x66\x81\xE0\xFF\xF3\x66" \
-    "\x89\x05\x12\x22\x00\xC0\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF" \
-    "\xFF\x00\x00\x66\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-    "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03" \
-    "\x05\x08\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-    "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-    "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89" \
-    "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08" \
-    "\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00" \
-    "\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03" \
-    "\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3" \
-    "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1" \
-    "\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x80\x0C" \
-    "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-    "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-    "\x22\x00\xC0\x76\xF7\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66" \
-    "\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1" \
-    "\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00" \
-    "\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00" \
-    "\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA" \
-    "\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1" \
-    "\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6" \
-    "\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50" \
-    "\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01" \
-    "\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3" \
-    "\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00" \
-    "\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x80\x0C\x66\x2D\x07\x00" \
-    "\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66" \
-    "\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76" \
-    "\xF7\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66" \
-    "\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81" \
-    "\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05" \
-    "\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-    "\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00" \
-    "\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81" \
-    "\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00" \
-    "\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89" \
-    "\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89" \
-    "\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-    "\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82" \
-    "\x00\x00\x00\x40\x51\x8B\x0D\x04\x02\x00\x00\x88\x05\x00\x00\x10" \
-    "\x40\x88\x05\x04\x00\x10\x40\x88\x05\x08\x00\x10\x40\x88\x05\x0C" \
-    "\x00\x10\x40\x88\x05\x14\x00\x10\x40\x88\x05\x18\x00\x10\x40\x88" \
-    "\x05\x1C\x00\x10\x40\x88\x05\x20\x84\x10\x42\x88\x05\x24\x84\x10" \
-    "\x42\x88\x05\x28\x84\x10\x42\x88\x05\x2C\x80\x10\x42\x88\x05\x30" \
-    "\x84\x10\x42\x88\x05\x34\x84\x10\x42\x88\x05\x38\x84\x10\x42\x88" \
-    "\x05\x3C\x84\x10\x42\x89\x0D\x04\x02\x00\x00\x59\x66\xB8\x01\x00" \
-    "\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C\x00\x66\x81\x3D\x40\x25\x00" \
-    "\x00\xD0\x07\x72\x5C\x66\x50\x66\x52\x66\xBA\xD0\x07\x66\xB8\x00" \
-    "\x00\x66\xF7\x35\x40\x25\x00\x00\x66\x5A\x66\x81\xF8\x00\x00\x75" \
-    "\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0\xFF\x66\x81\xC8\x01\x00\x66" \
-    "\x89\x05\x90\x40\x00\xC0\x66\x58\x66\xC7\x05\x50\x40\x00\xC0\x08" \
-    "\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66\xC7\x05\x50\x40\x00\xC0\x08" \
-    "\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66\xC7\x05\x50\x40\x00\xC0\x08" \
-    "\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-    "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xEC\x46\x00\x00\x66" \
-    "\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x15\x89\xD9\xC1\xE1\x02\x66" \
-    "\x8B\x89\x00\x00\x00\x00\x66\x89\x0D\x90\x40\x00\xC0\xEB\x07\x66" \
-    "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-    "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-    "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x81\x3D\x40\x25\x00\x00" \
-    "\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00\xC0\x02\x81\xE2\xFF\x7F\xFF" \
-    "\xFF\x66\x89\x15\x50\x40\x00\xC0\x66\x89\x05\x90\x40\x00\xC0\x89" \
-    "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xEC" \
-    "\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x24\x66\x50" \
-    "\x66\x29\xC8\x73\x00\xC6\x05\x14\x22\x00\xC0\x1B\x66\x81\xE8\x00" \
-    "\x12\x73\xF2\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-    "\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66" \
-    "\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2" \
-    "\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2" \
-    "\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC" \
-    "\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x00\x71\x66" \
-    "\xBA\x02\x00\x66\x4A\x78\x1B\xFB\x90\xFA\x66\xF7\x05\x04\x22\x00" \
-    "\xC0\x00\x80\x74\xF2\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x75\xF5" \
-    "\xEB\xE1\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66" \
-    "\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76" \
-    "\xF7\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9" \
-    "\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2" \
-    "\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-# Generated from packet 351/352
-p351 = \
-    "\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05\x2C\x00" \
-    "\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40\x66\x8B" \
-    "\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A\x00\x66" \
-    "\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81" \
-    "\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66\x89\x05" \
-    "\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-    "\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00" \
-    "\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81" \
-    "\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14\x22\x00" \
-    "\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89" \
-    "\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89" \
-    "\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-    "\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82" \
-    "\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00\x00\x52" \
-    "\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66\x3D\x00" \
-    "\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66\xC7\x05" \
-    "\x30\x24\x00\x00\x19\x00\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00" \
-    "\xD0\x40\x88\x05\x28\x00\xD0\x40\x88\x05\x34\x00\xD0\x40\x88\x05" \
-    "\x3C\x00\xD0\x40\x88\x05\x20\x00\x90\x40\x88\x05\x28\x00\x00\x52" \
-    "\x88\x05\x2C\x00\x00\x52\x88\x05\x30\x00\x00\x52\x88\x05\x3C\x00" \
-    "\x00\x52\x66\xB8\x80\x02\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66" \
-    "\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0" \
-    "\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05" \
-    "\x2C\x00\x10\x80\xB4\x00\x66\x3D\x00\x00\x0F\x85\x12\x00\x00\x00" \
-    "\x66\xB9\x01\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\xE9\x5B\x00" \
-    "\x00\x00\x31\xC0\x66\x0B\x05\x20\x80\x00\x80\xB4\x00\x66\x3D\x00" \
-    "\x00\x0F\x85\x12\x00\x00\x00\x66\xB9\x01\x00\xB2\x02\xFB\xFF\x25" \
-    "\x44\x11\x00\x00\xE9\x34\x00\x00\x00\x31\xC0\x66\x0B\x05\x2C\x80" \
-    "\x00\x80\xB4\x00\x66\x3D\x00\x00\x0F\x85\x12\x00\x00\x00\x66\xB9" \
-    "\x01\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\xE9\x0D\x00\x00\x00" \
-    "\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00" \
-    "\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-# Generated from packet 373/374
-p373 = \
-    "\x66\xC7\x05\x36\x24\x00\x00\x00\x00\x66\xC7\x05\x20\x24\x00\x00" \
-    "\x00\x00\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05" \
-    "\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40" \
-    "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A" \
-    "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-    "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66" \
-    "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-    "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-    "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-    "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14" \
-    "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-    "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-    "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-    "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-    "\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00" \
-    "\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66" \
-    "\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66" \
-    "\xC7\x05\x30\x24\x00\x00\x19\x00\x88\x05\x20\x84\x00\x40\x88\x05" \
-    "\x24\x84\x00\x40\x88\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40" \
-    "\x66\x8B\x05\x36\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8" \
-    "\x01\x00\x00\x00\x59\x39\xC8\x0F\x86\x2E\x03\x00\x00\x51\x8B\x0D" \
-    "\x04\x02\x00\x00\x88\x05\x00\x00\x90\x40\x81\xE1\xFF\xFE\xFF\xFF" \
-    "\x88\x05\x04\x00\x90\x40\x81\xE1\xFF\xFD\xFF\xFF\x88\x05\x08\x00" \
-    "\x90\x40\x81\xE1\xFF\xFB\xFF\xFF\x88\x05\x0C\x00\x90\x40\x81\xE1" \
-    "\xFF\xF7\xFF\xFF\x88\x05\x30\xA4\x04\x40\x81\xE1\xF7\xFF\xFF\xFF" \
-    "\x81\xE1\x7F\xFF\xFF\xFF\x88\x05\x34\xA4\x04\x40\x81\xE1\xFB\xFF" \
-    "\xFF\xFF\x81\xE1\xBF\xFF\xFF\xFF\x88\x05\x38\xA4\x04\x40\x81\xE1" \
-    "\xFD\xFF\xFF\xFF\x81\xE1\xDF\xFF\xFF\xFF\x88\x05\x3C\xA4\x04\x40" \
-    "\x81\xE1\xFE\xFF\xFF\xFF\x81\xE1\xEF\xFF\xFF\xFF\x89\x0D\x04\x02" \
-    "\x00\x00\x59\x88\x05\x20\x84\x00\x40\x88\x05\x24\x84\x00\x40\x88" \
-    "\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40\x66\xB8\x40\x01\x66" \
-    "\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-    "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-    "\x00\xC0\x76\xF7\x88\x05\x2C\x00\x00\x52\x66\xB8\xE0\x01\x66\x2D" \
-    "\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90" \
-    "\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00" \
-    "\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x20\x94\x06\x80\x66\x0B\x05\x24" \
-    "\x8C\x05\x80\x66\x0B\x05\x28\x84\x04\x80\x66\x0B\x05\x2C\x80\xF3" \
-    "\x80\xB4\x00\x66\x89\xC7\x88\x05\x2C\x00\x00\x5A\x66\x50\x66\x8B" \
-    "\xC7\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59" \
-    "\x66\x5B\xFA\x66\x58\x8B\x05\x04\x02\x00\x00\x8B\xC8\x40\x31\xC1" \
-    "\x89\x05\x04\x02\x00\x00\x88\x05\x3C\x04\x00\x80\xC1\xE9\x01\x0F" \
-    "\x84\x9F\x00\x00\x00\x88\x05\x38\x0C\x00\x80\xC1\xE9\x01\x0F\x84" \
-    "\x90\x00\x00\x00\x88\x05\x34\x14\x00\x80\xC1\xE9\x01\x0F\x84\x81" \
-    "\x00\x00\x00\x88\x05\x30\x1C\x00\x80\xC1\xE9\x01\x0F\x84\x72\x00" \
-    "\x00\x00\x88\x05\x3C\x80\x04\x80\xC1\xE9\x01\x0F\x84\x63\x00\x00" \
-    "\x00\x88\x05\x38\x80\x05\x80\xC1\xE9\x01\x0F\x84\x54\x00\x00\x00" \
-    "\x88\x05\x34\x80\x06\x80\xC1\xE9\x01\x0F\x84\x45\x00\x00\x00\x88" \
-    "\x05\x30\x80\x07\x80\xC1\xE9\x01\x0F\x84\x36\x00\x00\x00\x88\x05" \
-    "\x00\x00\x10\x81\xC1\xE9\x01\x0F\x84\x27\x00\x00\x00\x88\x05\x04" \
-    "\x00\x30\x81\xC1\xE9\x01\x0F\x84\x18\x00\x00\x00\x88\x05\x08\x00" \
-    "\x50\x81\xC1\xE9\x01\x0F\x84\x09\x00\x00\x00\x88\x05\x0C\x00\x70" \
-    "\x81\xC1\xE9\x01\x0F\x84\xCA\xFE\xFF\xFF\x88\x05\x20\x84\x00\x40" \
-    "\x88\x05\x24\x84\x00\x40\x88\x05\x28\x84\x00\x40\x88\x05\x2C\x80" \
-    "\x10\x40\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05" \
-    "\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40" \
-    "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A" \
-    "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-    "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66" \
-    "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-    "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-    "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-    "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14" \
-    "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-    "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-    "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-    "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-    "\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00" \
-    "\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66" \
-    "\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66" \
-    "\xC7\x05\x30\x24\x00\x00\x19\x00\x66\xFF\x05\x36\x24\x00\x00\x66" \
-    "\x8B\x05\x36\x24\x00\x00\xE9\xB5\xFC\xFF\xFF\x66\xC7\x05\x36\x24" \
-    "\x00\x00\x00\x00\x66\x8B\x05\x36\x24\x00\x00\x81\xE0\xFF\xFF\x00" \
-    "\x00\xFF\xF0\xB8\x00\x00\x00\x00\x59\x39\xC8\x0F\x86\x29\x00\x00" \
-    "\x00\x66\x50\x66\x8B\xC7\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C" \
-    "\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\x8B\x05\x36\x24\x00" \
-    "\x00\x66\xFF\x05\x36\x24\x00\x00\xEB\xBA\x88\x05\x1C\x00\xD0\x40" \
-    "\x88\x05\x24\x00\xD0\x40\x88\x05\x2C\x00\x00\x5A\x88\x05\x30\x00" \
-    "\x00\x5A\x88\x05\x3C\x00\xD0\x40\x66\x8B\x05\x06\x00\x09\x00\x81" \
-    "\xE3\xFF\xFF\x00\x00\x66\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-    "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-    "\x66\x03\x05\x08\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-    "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-    "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-    "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-    "\x05\x08\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-    "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-    "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-    "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-    "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x88\x05" \
-    "\x20\x00\x90\x52\x88\x05\x24\x00\x00\x52\x88\x05\x28\x00\x00\x52" \
-    "\x66\x8B\x05\x4E\x00\x09\x00\x66\x3D\x00\x00\x0F\x84\x06\x00\x00" \
-    "\x00\x88\x05\x30\x00\x00\x52\x66\xC7\x05\x30\x24\x00\x00\x19\x00" \
-    "\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-
-p_p2n = {}
-for k, v in dict(globals()).items():
-    if k[0] != 'p' or k == 'p_p2n':
-        continue
-    p_p2n[v] = k
-
-if __name__ == '__main__':
-    for k, v in dict(globals()).items():
-        if k[0] != 'p' or type(v) is not str:
-            continue
-        open('i87c51_read_fw/%s.bin' % k, 'w').write(v)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-p383 = \
-        "\x66\xC7\x05\x36\x24\x00\x00\x00\x00\x66\xC7\x05\x20\x24\x00\x00" \
-        "\x00\x00\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05" \
-        "\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40" \
-        "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00" \
-        "\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66" \
-        "\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66" \
-        "\xC7\x05\x30\x24\x00\x00\x19\x00\x88\x05\x20\x84\x00\x40\x88\x05" \
-        "\x24\x84\x00\x40\x88\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40" \
-        "\x66\x8B\x05\x36\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8" \
-        "\x01\x00\x00\x00\x59\x39\xC8\x0F\x86\x3E\x03\x00\x00\x51\x8B\x0D" \
-        "\x04\x02\x00\x00\x88\x05\x00\x00\x90\x40\x81\xE1\xFF\xFE\xFF\xFF" \
-        "\x88\x05\x04\x00\x90\x40\x81\xE1\xFF\xFD\xFF\xFF\x88\x05\x08\x00" \
-        "\x90\x40\x81\xE1\xFF\xFB\xFF\xFF\x88\x05\x0C\x00\x90\x40\x81\xE1" \
-        "\xFF\xF7\xFF\xFF\x88\x05\x30\xA4\x04\x40\x81\xE1\xF7\xFF\xFF\xFF" \
-        "\x81\xE1\x7F\xFF\xFF\xFF\x88\x05\x34\xA4\x04\x40\x81\xE1\xFB\xFF" \
-        "\xFF\xFF\x81\xE1\xBF\xFF\xFF\xFF\x88\x05\x38\xA4\x04\x40\x81\xE1" \
-        "\xFD\xFF\xFF\xFF\x81\xE1\xDF\xFF\xFF\xFF\x88\x05\x3C\xA4\x04\x40" \
-        "\x81\xE1\xFE\xFF\xFF\xFF\x81\xE1\xEF\xFF\xFF\xFF\x89\x0D\x04\x02" \
-        "\x00\x00\x59\x88\x05\x20\x84\x00\x40\x88\x05\x24\x84\x00\x40\x88" \
-        "\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40\x66\xB8\x40\x01\x66" \
-        "\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-        "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-        "\x00\xC0\x76\xF7\xFB\x90\xFA\x88\x05\x2C\x00\x00\x52\x66\xB8\xE0" \
-        "\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x20\x94\x06\x80\x66" \
-        "\x0B\x05\x24\x8C\x05\x80\x66\x0B\x05\x28\x84\x04\x80\x66\x0B\x05" \
-        "\x2C\x80\xF3\x80\xB4\x00\x66\x89\xC7\x88\x05\x2C\x00\x00\x5A\x66" \
-        "\x8B\xC7\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\xFF\x00\x00\x00\x59" \
-        "\x39\xC8\x0F\x84\x0D\x00\x00\x00\x66\xB9\x01\x00\xB2\x02\xFB\xFF" \
-        "\x25\x44\x11\x00\x00\x8B\x05\x04\x02\x00\x00\x8B\xC8\x40\x31\xC1" \
-        "\x89\x05\x04\x02\x00\x00\x88\x05\x3C\x04\x00\x80\xC1\xE9\x01\x0F" \
-        "\x84\x9F\x00\x00\x00\x88\x05\x38\x0C\x00\x80\xC1\xE9\x01\x0F\x84" \
-        "\x90\x00\x00\x00\x88\x05\x34\x14\x00\x80\xC1\xE9\x01\x0F\x84\x81" \
-        "\x00\x00\x00\x88\x05\x30\x1C\x00\x80\xC1\xE9\x01\x0F\x84\x72\x00" \
-        "\x00\x00\x88\x05\x3C\x80\x04\x80\xC1\xE9\x01\x0F\x84\x63\x00\x00" \
-        "\x00\x88\x05\x38\x80\x05\x80\xC1\xE9\x01\x0F\x84\x54\x00\x00\x00" \
-        "\x88\x05\x34\x80\x06\x80\xC1\xE9\x01\x0F\x84\x45\x00\x00\x00\x88" \
-        "\x05\x30\x80\x07\x80\xC1\xE9\x01\x0F\x84\x36\x00\x00\x00\x88\x05" \
-        "\x00\x00\x10\x81\xC1\xE9\x01\x0F\x84\x27\x00\x00\x00\x88\x05\x04" \
-        "\x00\x30\x81\xC1\xE9\x01\x0F\x84\x18\x00\x00\x00\x88\x05\x08\x00" \
-        "\x50\x81\xC1\xE9\x01\x0F\x84\x09\x00\x00\x00\x88\x05\x0C\x00\x70" \
-        "\x81\xC1\xE9\x01\x0F\x84\xBA\xFE\xFF\xFF\x88\x05\x20\x84\x00\x40" \
-        "\x88\x05\x24\x84\x00\x40\x88\x05\x28\x84\x00\x40\x88\x05\x2C\x80" \
-        "\x10\x40\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05" \
-        "\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40" \
-        "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00" \
-        "\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66" \
-        "\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66" \
-        "\xC7\x05\x30\x24\x00\x00\x19\x00\x66\xFF\x05\x36\x24\x00\x00\x66" \
-        "\x8B\x05\x36\x24\x00\x00\xE9\xA5\xFC\xFF\xFF\x66\xC7\x05\x36\x24" \
-        "\x00\x00\x00\x00\x66\x8B\x05\x36\x24\x00\x00\x81\xE0\xFF\xFF\x00" \
-        "\x00\xFF\xF0\xB8\x00\x00\x00\x00\x59\x39\xC8\x0F\x86\x39\x00\x00" \
-        "\x00\xFB\x90\xFA\x66\x8B\xC7\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8" \
-        "\xFF\x00\x00\x00\x59\x39\xC8\x0F\x84\x0D\x00\x00\x00\x66\xB9\x01" \
-        "\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\x8B\x05\x36\x24\x00" \
-        "\x00\x66\xFF\x05\x36\x24\x00\x00\xEB\xAA\x88\x05\x1C\x00\xD0\x40" \
-        "\x88\x05\x24\x00\xD0\x40\x88\x05\x2C\x00\x00\x5A\x88\x05\x30\x00" \
-        "\x00\x5A\x88\x05\x3C\x00\xD0\x40\x66\x8B\x05\x06\x00\x09\x00\x81" \
-        "\xE3\xFF\xFF\x00\x00\x66\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-        "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-        "\x66\x03\x05\x08\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-        "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-        "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-        "\x05\x08\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x88\x05" \
-        "\x20\x00\x90\x52\x88\x05\x24\x00\x00\x52\x88\x05\x28\x00\x00\x52" \
-        "\x66\x8B\x05\x4E\x00\x09\x00\x66\x3D\x00\x00\x0F\x84\x06\x00\x00" \
-        "\x00\x88\x05\x30\x00\x00\x52\x66\xC7\x05\x30\x24\x00\x00\x19\x00" \
-        "\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00" \
-        "\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-p415 = \
-        "\x66\xC7\x05\x36\x24\x00\x00\x00\x00\x66\xC7\x05\x20\x24\x00\x00" \
-        "\x00\x00\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05" \
-        "\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40" \
-        "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00" \
-        "\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66" \
-        "\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66" \
-        "\xC7\x05\x30\x24\x00\x00\x19\x00\x88\x05\x20\x84\x00\x40\x88\x05" \
-        "\x24\x84\x00\x40\x88\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40" \
-        "\xE8\x1B\xF0\xF7\xFF\x66\x3D\x00\x00\x0F\x84\x18\x00\x00\x00\x66" \
-        "\x50\xB0\x62\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00" \
-        "\x66\x59\x66\x5B\xFA\x66\x58\x66\x8B\x05\x36\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x01\x00\x00\x00\x59\x39\xC8\x0F\x86" \
-        "\xB5\x06\x00\x00\x51\x8B\x0D\x04\x02\x00\x00\x88\x05\x00\x00\x90" \
-        "\x40\x81\xE1\xFF\xFE\xFF\xFF\x88\x05\x04\x00\x90\x40\x81\xE1\xFF" \
-        "\xFD\xFF\xFF\x88\x05\x08\x00\x90\x40\x81\xE1\xFF\xFB\xFF\xFF\x88" \
-        "\x05\x0C\x00\x90\x40\x81\xE1\xFF\xF7\xFF\xFF\x88\x05\x30\xA4\x04" \
-        "\x40\x81\xE1\xF7\xFF\xFF\xFF\x81\xE1\x7F\xFF\xFF\xFF\x88\x05\x34" \
-        "\xA4\x04\x40\x81\xE1\xFB\xFF\xFF\xFF\x81\xE1\xBF\xFF\xFF\xFF\x88" \
-        "\x05\x38\xA4\x04\x40\x81\xE1\xFD\xFF\xFF\xFF\x81\xE1\xDF\xFF\xFF" \
-        "\xFF\x88\x05\x3C\xA4\x04\x40\x81\xE1\xFE\xFF\xFF\xFF\x81\xE1\xEF" \
-        "\xFF\xFF\xFF\x89\x0D\x04\x02\x00\x00\x59\xFB\x66\x53\xFF\x15\xD0" \
-        "\x1E\x00\x00\x66\x5B\xFA\xB4\x00\x66\x89\x05\x1E\x24\x00\x00\x66" \
-        "\x8B\x05\x20\x24\x00\x00\x66\x3D\x00\x00\x0F\x85\x13\x04\x00\x00" \
-        "\x66\x8B\x05\x1E\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x20" \
-        "\x94\x06\x80\x88\x05\x24\x8C\x05\x80\x88\x05\x28\x84\x04\x80\x88" \
-        "\x05\x2C\x80\xF3\x80\x66\xB8\x81\x7F\x81\xE3\xFF\xFF\x00\x00\x66" \
-        "\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1" \
-        "\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00" \
-        "\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA" \
-        "\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1" \
-        "\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6" \
-        "\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50" \
-        "\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01" \
-        "\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00" \
-        "\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\xE0\x01\x66\x2D\x07\x00" \
-        "\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66" \
-        "\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76" \
-        "\xF7\x66\xC7\xC6\x05\x00\x88\x05\x24\x00\x90\x40\x66\xB8\x80\x0C" \
-        "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-        "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-        "\x22\x00\xC0\x76\xF7\x88\x05\x24\x00\xD0\x40\x66\xB8\xE0\x01\x66" \
-        "\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-        "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-        "\x00\xC0\x76\xF7\x66\xFF\xCE\x66\x8B\xC6\x66\x3D\x00\x00\x75\x96" \
-        "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x88\x05\x20\x84\x00\x40\x88\x05\x24\x84" \
-        "\x00\x40\x88\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40\x66\x8B" \
-        "\x05\x4E\x00\x09\x00\x66\x3D\x00\x00\x0F\x84\x0C\x00\x00\x00\x66" \
-        "\x8B\x3D\x1E\x24\x00\x00\xE9\x58\x00\x00\x00\x88\x05\x2C\x00\x00" \
-        "\x52\x66\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81" \
-        "\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72" \
-        "\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x20" \
-        "\x94\x06\x80\x66\x0B\x05\x24\x8C\x05\x80\x66\x0B\x05\x28\x84\x04" \
-        "\x80\x66\x0B\x05\x2C\x80\xF3\x80\xB4\x00\x66\x89\xC7\x88\x05\x2C" \
-        "\x00\x00\x5A\x66\x8B\xC7\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B" \
-        "\x05\x1E\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x84" \
-        "\x3F\x01\x00\x00\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40" \
-        "\x88\x05\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00" \
-        "\xD0\x40\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66" \
-        "\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1" \
-        "\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00" \
-        "\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA" \
-        "\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1" \
-        "\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6" \
-        "\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50" \
-        "\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01" \
-        "\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00" \
-        "\x09\xCA\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05" \
-        "\x24\x00\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09" \
-        "\x00\x66\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00" \
-        "\x52\x66\xC7\x05\x30\x24\x00\x00\x19\x00\x66\x50\xB0\x63\xFB\x66" \
-        "\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA" \
-        "\x66\x58\x66\x50\xB0\x01\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C" \
-        "\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\xB2\x00\xFB\xFF\x25\x44" \
-        "\x11\x00\x00\x8B\x05\x04\x02\x00\x00\x8B\xC8\x40\x31\xC1\x89\x05" \
-        "\x04\x02\x00\x00\x88\x05\x3C\x04\x00\x80\xC1\xE9\x01\x0F\x84\x9F" \
-        "\x00\x00\x00\x88\x05\x38\x0C\x00\x80\xC1\xE9\x01\x0F\x84\x90\x00" \
-        "\x00\x00\x88\x05\x34\x14\x00\x80\xC1\xE9\x01\x0F\x84\x81\x00\x00" \
-        "\x00\x88\x05\x30\x1C\x00\x80\xC1\xE9\x01\x0F\x84\x72\x00\x00\x00" \
-        "\x88\x05\x3C\x80\x04\x80\xC1\xE9\x01\x0F\x84\x63\x00\x00\x00\x88" \
-        "\x05\x38\x80\x05\x80\xC1\xE9\x01\x0F\x84\x54\x00\x00\x00\x88\x05" \
-        "\x34\x80\x06\x80\xC1\xE9\x01\x0F\x84\x45\x00\x00\x00\x88\x05\x30" \
-        "\x80\x07\x80\xC1\xE9\x01\x0F\x84\x36\x00\x00\x00\x88\x05\x00\x00" \
-        "\x10\x81\xC1\xE9\x01\x0F\x84\x27\x00\x00\x00\x88\x05\x04\x00\x30" \
-        "\x81\xC1\xE9\x01\x0F\x84\x18\x00\x00\x00\x88\x05\x08\x00\x50\x81" \
-        "\xC1\xE9\x01\x0F\x84\x09\x00\x00\x00\x88\x05\x0C\x00\x70\x81\xC1" \
-        "\xE9\x01\x0F\x84\x02\xFB\xFF\xFF\x88\x05\x20\x84\x00\x40\x88\x05" \
-        "\x24\x84\x00\x40\x88\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40" \
-        "\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05\x2C\x00" \
-        "\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40\x66\x8B" \
-        "\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A\x00\x66" \
-        "\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81" \
-        "\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66\x89\x05" \
-        "\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81" \
-        "\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14\x22\x00" \
-        "\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89" \
-        "\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89" \
-        "\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82" \
-        "\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00\x00\x52" \
-        "\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66\x3D\x00" \
-        "\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66\xC7\x05" \
-        "\x30\x24\x00\x00\x19\x00\x66\xFF\x05\x36\x24\x00\x00\x66\x8B\x05" \
-        "\x36\x24\x00\x00\xE9\x2E\xF9\xFF\xFF\x66\xC7\x05\x36\x24\x00\x00" \
-        "\x00\x00\x66\x8B\x05\x36\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF" \
-        "\xF0\xB8\x00\x00\x00\x00\x59\x39\xC8\x0F\x86\x25\x00\x00\x00\xFB" \
-        "\x66\x53\xFF\x15\xD0\x1E\x00\x00\x66\x5B\xFA\xB4\x00\x66\x89\x05" \
-        "\x1E\x24\x00\x00\x66\x8B\x05\x36\x24\x00\x00\x66\xFF\x05\x36\x24" \
-        "\x00\x00\xEB\xBE\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40" \
-        "\x88\x05\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00" \
-        "\xD0\x40\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66" \
-        "\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1" \
-        "\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00" \
-        "\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA" \
-        "\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1" \
-        "\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6" \
-        "\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50" \
-        "\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01" \
-        "\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00" \
-        "\x09\xCA\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05" \
-        "\x24\x00\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09" \
-        "\x00\x66\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00" \
-        "\x52\x66\xC7\x05\x30\x24\x00\x00\x19\x00\x66\x50\xB0\x00\xFB\x66" \
-        "\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA" \
-        "\x66\x58\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-
-p533 = \
-        "\x66\xC7\x05\x36\x24\x00\x00\x00\x00\x66\xC7\x05\x20\x24\x00\x00" \
-        "\x00\x00\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05" \
-        "\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40" \
-        "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00" \
-        "\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66" \
-        "\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66" \
-        "\xC7\x05\x30\x24\x00\x00\x19\x00\x88\x05\x20\x84\x00\x40\x88\x05" \
-        "\x24\x84\x00\x40\x88\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40" \
-        "\xE8\x5B\xE6\xF7\xFF\x66\x3D\x00\x00\x0F\x84\x18\x00\x00\x00\x66" \
-        "\x50\xB0\x62\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00" \
-        "\x66\x59\x66\x5B\xFA\x66\x58\x66\xC7\x05\x20\x24\x00\x00\x00\x00" \
-        "\x66\x8B\x05\x36\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8" \
-        "\x01\x00\x00\x00\x59\x39\xC8\x0F\x86\x8A\x04\x00\x00\x51\x8B\x0D" \
-        "\x04\x02\x00\x00\x88\x05\x00\x00\x90\x40\x81\xE1\xFF\xFE\xFF\xFF" \
-        "\x88\x05\x04\x00\x90\x40\x81\xE1\xFF\xFD\xFF\xFF\x88\x05\x08\x00" \
-        "\x90\x40\x81\xE1\xFF\xFB\xFF\xFF\x88\x05\x0C\x00\x90\x40\x81\xE1" \
-        "\xFF\xF7\xFF\xFF\x88\x05\x30\xA4\x04\x40\x81\xE1\xF7\xFF\xFF\xFF" \
-        "\x81\xE1\x7F\xFF\xFF\xFF\x88\x05\x34\xA4\x04\x40\x81\xE1\xFB\xFF" \
-        "\xFF\xFF\x81\xE1\xBF\xFF\xFF\xFF\x88\x05\x38\xA4\x04\x40\x81\xE1" \
-        "\xFD\xFF\xFF\xFF\x81\xE1\xDF\xFF\xFF\xFF\x88\x05\x3C\xA4\x04\x40" \
-        "\x81\xE1\xFE\xFF\xFF\xFF\x81\xE1\xEF\xFF\xFF\xFF\x89\x0D\x04\x02" \
-        "\x00\x00\x59\x88\x05\x20\x84\x00\x40\x88\x05\x24\x84\x00\x40\x88" \
-        "\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40\x66\xB8\x40\x01\x66" \
-        "\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-        "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-        "\x00\xC0\x76\xF7\xFB\x66\x53\xFF\x15\xD0\x1E\x00\x00\x66\x5B\xFA" \
-        "\xB4\x00\x66\x89\x05\x1E\x24\x00\x00\x88\x05\x2C\x00\x00\x52\x66" \
-        "\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80" \
-        "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-        "\x39\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x20\x94\x06" \
-        "\x80\x66\x0B\x05\x24\x8C\x05\x80\x66\x0B\x05\x28\x84\x04\x80\x66" \
-        "\x0B\x05\x2C\x80\xF3\x80\xB4\x00\x66\x89\xC7\x88\x05\x2C\x00\x00" \
-        "\x5A\x66\x8B\x05\x1E\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0" \
-        "\x66\x8B\xC7\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x84\x3F\x01" \
-        "\x00\x00\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05" \
-        "\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40" \
-        "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00" \
-        "\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66" \
-        "\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66" \
-        "\xC7\x05\x30\x24\x00\x00\x19\x00\x66\x50\xB0\x63\xFB\x66\x53\x66" \
-        "\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58" \
-        "\x66\x50\xB0\x01\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00" \
-        "\x00\x66\x59\x66\x5B\xFA\x66\x58\xB2\x00\xFB\xFF\x25\x44\x11\x00" \
-        "\x00\x8B\x05\x04\x02\x00\x00\x8B\xC8\x40\x31\xC1\x89\x05\x04\x02" \
-        "\x00\x00\x88\x05\x3C\x04\x00\x80\xC1\xE9\x01\x0F\x84\x9F\x00\x00" \
-        "\x00\x88\x05\x38\x0C\x00\x80\xC1\xE9\x01\x0F\x84\x90\x00\x00\x00" \
-        "\x88\x05\x34\x14\x00\x80\xC1\xE9\x01\x0F\x84\x81\x00\x00\x00\x88" \
-        "\x05\x30\x1C\x00\x80\xC1\xE9\x01\x0F\x84\x72\x00\x00\x00\x88\x05" \
-        "\x3C\x80\x04\x80\xC1\xE9\x01\x0F\x84\x63\x00\x00\x00\x88\x05\x38" \
-        "\x80\x05\x80\xC1\xE9\x01\x0F\x84\x54\x00\x00\x00\x88\x05\x34\x80" \
-        "\x06\x80\xC1\xE9\x01\x0F\x84\x45\x00\x00\x00\x88\x05\x30\x80\x07" \
-        "\x80\xC1\xE9\x01\x0F\x84\x36\x00\x00\x00\x88\x05\x00\x00\x10\x81" \
-        "\xC1\xE9\x01\x0F\x84\x27\x00\x00\x00\x88\x05\x04\x00\x30\x81\xC1" \
-        "\xE9\x01\x0F\x84\x18\x00\x00\x00\x88\x05\x08\x00\x50\x81\xC1\xE9" \
-        "\x01\x0F\x84\x09\x00\x00\x00\x88\x05\x0C\x00\x70\x81\xC1\xE9\x01" \
-        "\x0F\x84\x6E\xFD\xFF\xFF\x88\x05\x20\x84\x00\x40\x88\x05\x24\x84" \
-        "\x00\x40\x88\x05\x28\x84\x00\x40\x88\x05\x2C\x80\x10\x40\x88\x05" \
-        "\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88\x05\x2C\x00\x00\x5A" \
-        "\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0\x40\x66\x8B\x05\x06" \
-        "\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2A\x00\x66\xC7\x05" \
-        "\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00" \
-        "\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00\x66\x89\x05\x90\x40" \
-        "\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00" \
-        "\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB" \
-        "\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81" \
-        "\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81" \
-        "\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1" \
-        "\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00" \
-        "\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24\x00\x00\x52\x88\x05" \
-        "\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00\x66\x3D\x00\x00\x0F" \
-        "\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52\x66\xC7\x05\x30\x24" \
-        "\x00\x00\x19\x00\x66\xFF\x05\x36\x24\x00\x00\x66\x8B\x05\x36\x24" \
-        "\x00\x00\xE9\x59\xFB\xFF\xFF\x66\xC7\x05\x36\x24\x00\x00\x00\x00" \
-        "\x66\x8B\x05\x36\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8" \
-        "\x00\x00\x00\x00\x59\x39\xC8\x0F\x86\x88\x01\x00\x00\xFB\x66\x53" \
-        "\xFF\x15\xD0\x1E\x00\x00\x66\x5B\xFA\xB4\x00\x66\x89\x05\x1E\x24" \
-        "\x00\x00\x66\x8B\x05\x1E\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF" \
-        "\xF0\x66\x8B\xC7\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x84\x3F" \
-        "\x01\x00\x00\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0\x40\x88" \
-        "\x05\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C\x00\xD0" \
-        "\x40\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB" \
-        "\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02" \
-        "\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47\x00\x00" \
-        "\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00" \
-        "\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02" \
-        "\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00\xC6\x05" \
-        "\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40" \
-        "\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00" \
-        "\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09" \
-        "\xCA\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88\x05\x24" \
-        "\x00\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00\x09\x00" \
-        "\x66\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00\x00\x52" \
-        "\x66\xC7\x05\x30\x24\x00\x00\x19\x00\x66\x50\xB0\x63\xFB\x66\x53" \
-        "\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66" \
-        "\x58\x66\x50\xB0\x01\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11" \
-        "\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\xB2\x00\xFB\xFF\x25\x44\x11" \
-        "\x00\x00\x66\x8B\x05\x36\x24\x00\x00\x66\xFF\x05\x36\x24\x00\x00" \
-        "\xE9\x5B\xFE\xFF\xFF\x88\x05\x1C\x00\xD0\x40\x88\x05\x24\x00\xD0" \
-        "\x40\x88\x05\x2C\x00\x00\x5A\x88\x05\x30\x00\x00\x5A\x88\x05\x3C" \
-        "\x00\xD0\x40\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00" \
-        "\x66\xBB\x2A\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1" \
-        "\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x08\x47" \
-        "\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81" \
-        "\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1" \
-        "\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x08\x47\x00\x00" \
-        "\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D" \
-        "\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA" \
-        "\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00" \
-        "\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x88\x05\x20\x00\x90\x52\x88" \
-        "\x05\x24\x00\x00\x52\x88\x05\x28\x00\x00\x52\x66\x8B\x05\x4E\x00" \
-        "\x09\x00\x66\x3D\x00\x00\x0F\x84\x06\x00\x00\x00\x88\x05\x30\x00" \
-        "\x00\x52\x66\xC7\x05\x30\x24\x00\x00\x19\x00\x66\x50\xB0\x00\xFB" \
-        "\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B" \
-        "\xFA\x66\x58\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-
-p_p2n = {}
-for k, v in dict(globals()).items():
-    if k[0] != 'p' or k == 'p_p2n':
-        continue
-    p_p2n[v] = k
-
-if __name__ == '__main__':
-    for k, v in dict(globals()).items():
-        if k[0] != 'p' or type(v) is not str:
-            continue
-        open('i87c51_write_fw/%s.bin' % k, 'w').write(v)
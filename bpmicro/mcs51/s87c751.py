@@ -1,855 +1,15 @@
-# Generated from scrape_dev.py
-from bpmicro.cmd import bulk2, bulk86
-from bpmicro import cmd
-from bpmicro.usb import usb_wraps
-from bpmicro.usb import validate_read
-from bpmicro import fw
+from bpmicro import proto
 import bpmicro.device
-import usb1
+import os
 
+READ_SCRIPT = os.path.join(os.path.dirname(__file__), 's87c751_read.json')
 
-def dev_read(dev, cont, verbose=False):
-    bulkRead, bulkWrite, controlRead, controlWrite = usb_wraps(dev)
-
-    # Selected device 6
-    # Generated by usbrply
-    # cmd: /home/mcmaster/bin/usbrply --no-setup --comment --fx2 --device-hi -j bp1410-84_2020-03-31_s87c751/2020-03-31_06_win_s87c751_read_pat-cnt_cont-n_id-n.pcapng
-    #
-    # WARNING: Packet 188 missing submit.  URB ID: 0xFFFFFA801E92EB80
-    # Generated from packet 189/190
-    # NOTE:: req max 4096 but got 3
-    buff = controlRead(0xC0, 0xB0, 0x0000, 0x0000, 4096)
-    validate_read("\x00\x00\x00", buff, "packet 189/190")
-    # Generated from packet 191/192
-    _prefix, buff, _size = cmd.bulk86_next_read(dev)
-    validate_read("\x16", buff, "packet 191/192")
-    # Generated from packet 197/198
-    # bulk2 aggregate: packet W: 197/198, 1 to R 199/200
-    buff = cmd.bulk2b(dev,
-        "\x43\x19\x08\x00\x00\x3B\x7E\x25\x00\x00\xFE\xFF\x3B\x7C\x25\x00" \
-        "\x00\xFE\xFF\x00"
-        )
-    validate_read("\xA4\x06", buff, "packet W: 197/198, R 1 to 199/200")
-    # Generated from packet 209/210
-    # bulk2 aggregate: packet W: 209/210, 1 to R 211/212
-    buff = cmd.bulk2b(dev,
-        "\x14\x38\x25\x00\x00\x04\x00\x90\x32\x90\x00\xA7\x02\x1F\x00\x14" \
-        "\x40\x25\x00\x00\x01\x00\x3C\x36\x0E\x01"
-        )
-    validate_read(
-        "\x14\x00\x54\x41\x38\x34\x56\x4C\x56\x5F\x46\x58\x34\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3E\x2C"
-        , buff, "packet W: 209/210, R 1 to 211/212")
-    # Generated from packet 237/238
-    bulkWrite(0x02, "\x43\x19\x08\x00\x00")
-    # Generated from packet 239/240
-    bulkWrite(0x02, "\x20\x01\x00\x0C\x04")
-    # Generated from packet 241/242
-    cmd.cmd_41(dev)
-    # Generated from packet 243/244
-    # bulk2 aggregate: packet W: 243/244, 1 to R 245/246
-    cmd.cmd_10(dev)
-    # Generated from packet 285/286
-    # bulk2 aggregate: packet W: 285/286, 1 to R 287/294
-    cmd.cmd_45(dev)
-    # Generated from packet 295/296
-    # bulk2 aggregate: packet W: 295/296, 1 to R 297/298
-    cmd.cmd_49(dev)
-    # Generated from packet 321/322
-    # bulk2 aggregate: packet W: 321/322, 1 to R 323/324
-    cmd.cmd_49(dev)
-    # Generated from packet 341/342
-    cmd.cmd_3B(dev)
-    # Generated from packet 343/344
-    # bulk2 aggregate: packet W: 343/344, 1 to R 345/346
-    cmd.cmd_4A(dev)
-    # Generated from packet 347/348
-    cmd.cmd_4C(dev)
-    # Generated from packet 349/350
-    buff = controlWrite(0x40, 0xB2, 0x0000, 0x0000, "")
-    # Generated from packet 351/352
-    cmd.cmd_50(dev, "\x45\x00")
-    # Generated from packet 353/354
-    # bulk2 aggregate: packet W: 353/354, 1 to R 355/356
-    buff = cmd.bulk2b(dev,
-        "\xE9\x03\x00\x00\x00\x90\x00\x00\xE9\x03\x00\x00\x00\x90\x01\x10" \
-        "\xE9\x03\x00\x00\x00\x90\x00\x00\xE9\x03\x00\x00\x00\x90\x01\x80" \
-        "\xE9\x02\x00\x00\x00\x90\x00\xE9\x04\x00\x00\x00\x00\x00\x00\x00" \
-        "\xE9\x03\x00\x00\x00\x90\x00\x00\x66\xB9\x00\x00\xB2\x00\xFB\xFF" \
-        "\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x80\x00", buff, "packet W: 353/354, R 1 to 355/356")
-    # Generated from packet 357/358
-    # bulk2 aggregate: packet W: 357/358, 1 to R 359/360
-    cmd.cmd_02(dev, "\x81\x00\x50\x00\x09\x00")
-    # Generated from packet 361/362
-    cmd.cmd_50(dev, "\xC0\x00")
-    # Generated from packet 363/364
-    # bulk2 aggregate: packet W: 363/364, 1 to R 365/366
-    buff = cmd.bulk2b(dev,
-        "\x66\xB8\x01\x2D\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x81\x00", buff, "packet W: 363/364, R 1 to 365/366")
-    # Generated from packet 367/368
-    # bulk2 aggregate: packet W: 367/368, 1 to R 369/370
-    cmd.cmd_02(dev, "\x82\x00\x10\x01\x09\x00")
-    # Generated from packet 371/372
-    bulkWrite(0x02, "\x09\x08\x57\x81\x00")
-    # Generated from packet 375/376
-    # bulk2 aggregate: packet W: 375/376, 1 to R 377/378
-    cmd.cmd_02(dev, "\x82\x00\x10\x01\x09\x00")
-    # Generated from packet 379/380
-    # bulk2 aggregate: packet W: 379/380, 1 to R 381/384
-    cmd.led_mask(dev, "active")
-    # Generated from packet 385/386
-    cmd.cmd_50(dev, "\x18\x00")
-    # Generated from packet 387/388
-    # bulk2 aggregate: packet W: 387/388, 1 to R 389/390
-    buff = cmd.bulk2b(dev,
-        "\x66\xB8\x01\x32\x66\x89\x05\x06\x00\x09\x00\x66\xB9\x00\x00\xB2" \
-        "\x00\xFB\xFF\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x82\x00", buff, "packet W: 387/388, R 1 to 389/390")
-    # Generated from packet 391/392
-    # bulk2 aggregate: packet W: 391/392, 1 to R 393/394
-    cmd.cmd_02(dev, "\x83\x00\x30\x01\x09\x00")
-    # Generated from packet 395/396
-    # bulk2 aggregate: packet W: 395/396, 1 to R 397/412
-    buff = cmd.bulk2b(dev,
-        "\x57\x82\x00\x20\x01\x00\x2B\x3B\x0C\x22\x00\xC0\x40\x00\x3B\x0E" \
-        "\x22\x00\xC0\x00\x00\x3B\x1A\x22\x00\xC0\x18\x00\x0E\x01"
-        )
-    validate_read(
-        "\x14\x00\x54\x41\x38\x34\x56\x4C\x56\x5F\x46\x58\x34\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3E\x2C"
-        , buff, "packet W: 395/396, R 1 to 397/412")
-    # Generated from packet 435/436
-    # bulk2 aggregate: packet W: 435/436, 1 to R 437/438
-    buff = cmd.bulk2b(dev, "\x48\x00\x10\x82\x02")
-    validate_read("\x82\x00\x10\x01\x09\x00", buff,
-                  "packet W: 435/436, R 1 to 437/438")
-    # Generated from packet 441/442
-    bulkWrite(0x02, "\x20\x01\x00\x50\x7D\x02\x00\x00")
-    # Generated from packet 443/446
-    # bulk2 aggregate: packet W: 443/446, 1 to R 447/448
-    buff = cmd.bulk2b(dev,
-        "\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00" \
-        "\x05\x00\x00\x00\xBB\x01\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83" \
-        "\x74\x46\x00\x00\x0F\x00\x00\x00\xBB\x02\x00\x00\x00\xC1\xE3\x02" \
-        "\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x03\x00\x00" \
-        "\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00" \
-        "\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00" \
-        "\x00\x00\x00\x00\xFF\x15\x38\x11\x00\x00\x88\x05\x00\x24\x00\x40" \
-        "\x66\xB8\x00\xD4\x66\xBA\x30\x00\x66\x4A\x78\x1B\xFB\x90\xFA\x66" \
-        "\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05\x04\x22\x00" \
-        "\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53\x5B" \
-        "\xC7\x83\x74\x46\x00\x00\x06\x00\x00\x00\xBB\x01\x00\x00\x00\xC1" \
-        "\xE3\x02\x53\x66\xB8\x0F\x00\x66\xF7\xD0\x5B\x81\xE0\xFF\xFF\x00" \
-        "\x00\x89\x83\x74\x46\x00\x00\xBB\x02\x00\x00\x00\xC1\xE3\x02\x53" \
-        "\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x03\x00\x00\x00" \
-        "\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB" \
-        "\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00" \
-        "\x00\x00\x00\xFF\x15\x38\x11\x00\x00\xBB\x00\x00\x00\x00\xC1\xE3" \
-        "\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x04\x00\x00\x00\xBB\x01\x00" \
-        "\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x0F\x00\x00" \
-        "\x00\xBB\x02\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00" \
-        "\x00\x00\x00\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7" \
-        "\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3" \
-        "\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38" \
-        "\x11\x00\x00\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74" \
-        "\x46\x00\x00\x07\x00\x00\x00\xBB\x01\x00\x00\x00\xC1\xE3\x02\x53" \
-        "\x5B\xC7\x83\x74\x46\x00\x00\x0F\x00\x00\x00\xBB\x02\x00\x00\x00" \
-        "\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB" \
-        "\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00" \
-        "\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74" \
-        "\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11\x00\x00\xBB\x00\x00" \
-        "\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x08\x00\x00" \
-        "\x00\xBB\x01\x00\x00\x00\xC1\xE3\x02\x53\x66\xB8\x0F\x00\x66\xF7" \
-        "\xD0\x5B\x81\xE0\xFF\xFF\x00\x00\x89\x83\x74\x46\x00\x00\xBB\x02" \
-        "\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00" \
-        "\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46" \
-        "\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B" \
-        "\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11\x00\x00" \
-        "\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x82\x00", buff, "packet W: 443/446, R 1 to 447/448")
-    # Generated from packet 449/450
-    # bulk2 aggregate: packet W: 449/450, 1 to R 451/452
-    cmd.cmd_02(dev, "\x83\x00\x90\x03\x09\x00")
-    # Generated from packet 453/454
-    bulkWrite(0x02, "\x57\x82\x00\x50\x1D\x00\x00\x00")
-    # Generated from packet 455/456
-    # bulk2 aggregate: packet W: 455/456, 1 to R 457/484
-    buff = cmd.bulk2b(dev,
-        "\xC7\x05\x74\x46\x00\x00\x0B\x00\x00\x00\xFF\x15\x38\x11\x00\x00" \
-        "\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x83\x00", buff, "packet W: 455/456, R 1 to 457/484")
-    # Generated from packet 485/486
-    # bulk2 aggregate: packet W: 485/486, 1 to R 487/488
-    cmd.cmd_02(dev, "\x84\x00\xB0\x03\x09\x00")
-    # Generated from packet 491/492
-    bulkWrite(0x02, "\x57\x83\x00\x50\x42\x00\x00\x00")
-    # Generated from packet 493/494
-    # bulk2 aggregate: packet W: 493/494, 1 to R 495/512
-    buff = cmd.bulk2b(dev,
-        "\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00" \
-        "\x31\x00\x3E\x00\x3A\x00\x36\x00\x00\x00\x22\x00\x26\x00\x2A\x00" \
-        "\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00" \
-        "\x1C\x00\x00\x00\x04\x00\x08\x00\x0C\x00\x10\x00\x14\x00\x18\x00" \
-        "\x1C\x00"
-        )
-    validate_read("\x84\x00", buff, "packet W: 493/494, R 1 to 495/512")
-    # Generated from packet 513/514
-    # bulk2 aggregate: packet W: 513/514, 1 to R 515/516
-    cmd.cmd_02(dev, "\x85\x00\x00\x04\x09\x00")
-    # Generated from packet 517/518
-    bulkWrite(0x02,
-        "\x1D\xB0\x03\x09\x00\x18\x00\x15\x60\x00\x00\x00\x00\x01\x00\x00" \
-        "\x00\x00\x01\x00\x00\x00\x1C\x30\x00\x00\x08\x00\x00\x00\x00\x48" \
-        "\x00"
-        )
-    # Generated from packet 519/520
-    cmd.cmd_50(dev, "\x17\x00")
-    # Generated from packet 521/522
-    # bulk2 aggregate: packet W: 521/522, 1 to R 523/524
-    buff = cmd.bulk2b(dev,
-        "\xC7\x05\x2C\x00\x09\x00\x24\x04\x00\x00\x66\xB9\x00\x00\xB2\x00" \
-        "\xFB\xFF\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x85\x00", buff, "packet W: 521/522, R 1 to 523/524")
-    # Generated from packet 525/526
-    # bulk2 aggregate: packet W: 525/526, 1 to R 527/530
-    cmd.cmd_02(dev, "\x86\x00\x20\x04\x09\x00")
-    # Generated from packet 531/532
-    bulkWrite(0x02, "\x57\x85\x00\x50\x18\x00\x00\x00")
-    # Generated from packet 533/534
-    # bulk2 aggregate: packet W: 533/534, 1 to R 535/536
-    buff = cmd.bulk2b(dev,
-        "\x66\xB8\x01\x32\x66\x89\x05\x06\x00\x09\x00\x66\xB9\x00\x00\xB2" \
-        "\x00\xFB\xFF\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x86\x00", buff, "packet W: 533/534, R 1 to 535/536")
-    # Generated from packet 537/538
-    # bulk2 aggregate: packet W: 537/538, 1 to R 539/540
-    cmd.cmd_02(dev, "\x87\x00\x40\x04\x09\x00")
-    # Generated from packet 541/542
-    bulkWrite(0x02, "\x57\x86\x00\x50\x23\x07\x00\x00")
-    # Generated from packet 543/544
-    # bulk2 aggregate: packet W: 543/544, 1 to R 545/546
-    buff = cmd.bulk2b(dev,
-        "\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x00\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\xB4\x46\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\xB4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C" \
-        "\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52" \
-        "\x66\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66" \
-        "\x5A\x66\x81\xF8\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0" \
-        "\xFF\x66\x81\xC8\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66" \
-        "\xC7\x05\x50\x40\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66" \
-        "\xC7\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66" \
-        "\xC7\x05\x50\x40\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0" \
-        "\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66" \
-        "\x03\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72" \
-        "\x15\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D" \
-        "\x90\x40\x00\xC0\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81" \
-        "\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22" \
-        "\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-        "\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00" \
-        "\xC0\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00" \
-        "\x00\xD0\x07\x72\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22" \
-        "\x00\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB" \
-        "\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81" \
-        "\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81" \
-        "\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1" \
-        "\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00" \
-        "\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x39\x00" \
-        "\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7" \
-        "\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x26\x47\x00\x00\x66\x89" \
-        "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-        "\x81\x00\x00\x00\x00\x66\x2B\x05\x26\x47\x00\x00\xC6\x05\x14\x22" \
-        "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-        "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-        "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-        "\x82\x00\x00\x00\x40\x66\xB8\x00\xD4\x66\xBA\x30\x00\x66\x4A\x78" \
-        "\x1B\xFB\x90\xFA\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66" \
-        "\xF7\x05\x04\x22\x00\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66" \
-        "\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0" \
-        "\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x06\x00" \
-        "\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C\x00\x66\x81\x3D\x40" \
-        "\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52\x66\xBA\xD0\x07\x66" \
-        "\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66\x5A\x66\x81\xF8\x00" \
-        "\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0\xFF\x66\x81\xC8\x01" \
-        "\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66\xC7\x05\x50\x40\x00" \
-        "\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66\xC7\x05\x50\x40\x00" \
-        "\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66\xC7\x05\x50\x40\x00" \
-        "\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1" \
-        "\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xEC\x46\x00" \
-        "\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x15\x89\xD9\xC1\xE1" \
-        "\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D\x90\x40\x00\xC0\xEB" \
-        "\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA" \
-        "\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x81\x3D\x40\x25" \
-        "\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00\xC0\x02\x81\xE2\xFF" \
-        "\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66\x89\x05\x90\x40\x00" \
-        "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-        "\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x24" \
-        "\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22\x00\xC0\x1B\x66\x81" \
-        "\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00" \
-        "\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00" \
-        "\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00" \
-        "\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81" \
-        "\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x80" \
-        "\x0C\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF" \
-        "\xFF\x00\x00\x66\xBB\x39\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-        "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03" \
-        "\x05\x26\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-        "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-        "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89" \
-        "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x26" \
-        "\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00" \
-        "\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03" \
-        "\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1" \
-        "\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x80\x0C" \
-        "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-        "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-        "\x22\x00\xC0\x76\xF7\x66\xB8\x01\x32\x81\xE3\xFF\xFF\x00\x00\x66" \
-        "\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1" \
-        "\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00" \
-        "\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA" \
-        "\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1" \
-        "\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6" \
-        "\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50" \
-        "\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01" \
-        "\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00" \
-        "\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x80\x01\x66\x2D\x07\x00" \
-        "\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66" \
-        "\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76" \
-        "\xF7\x88\x05\x30\x80\x06\x40\x88\x05\x34\x80\x06\x40\x88\x05\x3C" \
-        "\x00\xD0\x40\x66\xB8\x00\x6A\x66\xBA\x18\x00\x66\x4A\x78\x1B\xFB" \
-        "\x90\xFA\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05" \
-        "\x04\x22\x00\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9" \
-        "\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4" \
-        "\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\xB9\x00\x00\xB2\x02\xFB" \
-        "\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44" \
-        "\x11\x00\x00"
-        )
-    validate_read("\x87\x00", buff, "packet W: 543/544, R 1 to 545/546")
-    # Generated from packet 547/548
-    # bulk2 aggregate: packet W: 547/548, 1 to R 549/550
-    cmd.cmd_02(dev, "\x88\x00\x70\x0B\x09\x00")
-    # Generated from packet 551/552
-    # bulk2 aggregate: packet W: 551/552, 1 to R 553/584
-    cmd.cmd_57s(dev, "\x87", "\x00\x00")
-    # Generated from packet 587/588
-    cmd.cmd_50(dev, "\x0A\x02")
-    # Generated from packet 589/590
-    # bulk2 aggregate: packet W: 589/590, 1 to R 591/592
-    buff = cmd.bulk2b(dev,
-        "\x66\xC7\xC7\x9A\x02\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF" \
-        "\x00\x00\x66\xBB\x39\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89" \
-        "\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05" \
-        "\x26\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00" \
-        "\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0" \
-        "\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9" \
-        "\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x26\x47" \
-        "\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66" \
-        "\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2" \
-        "\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2" \
-        "\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC" \
-        "\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x88\x05\x34\x80\x06" \
-        "\x40\x88\x05\x30\x80\x04\x40\x88\x05\x3C\x00\xD0\x40\x66\xC7\x05" \
-        "\x10\x22\x00\xC0\x0D\x00\x66\xC7\x05\x12\x22\x00\xC0\x03\x86\x66" \
-        "\xC7\x05\x1E\x00\x09\x00\x03\x86\x66\xB8\xE0\x01\x66\x2D\x07\x00" \
-        "\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66" \
-        "\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76" \
-        "\xF7\x66\x8B\x05\x1E\x00\x09\x00\x66\x81\xE0\xFF\xF3\x66\x89\x05" \
-        "\x12\x22\x00\xC0\x88\x05\x34\x00\x90\x40\x66\xC7\xC6\x0A\x00\x66" \
-        "\x8B\xC7\x81\xE0\xFF\xFF\x00\x00\x88\x05\x3C\x00\x10\x80\x66\xB9" \
-        "\x02\x00\x66\x8B\xC7\x66\xBA\x00\x00\x66\xF7\xF1\x66\x8B\xF8\x88" \
-        "\x05\x34\x00\xD0\x40\x88\x05\x34\x00\x90\x40\x66\xFF\xCE\x66\x8B" \
-        "\xC6\x66\x3D\x00\x00\x75\xC8\x88\x05\x3C\x00\x90\x40\x66\xC7\x05" \
-        "\x10\x22\x00\xC0\x0D\x00\x66\xC7\x05\x12\x22\x00\xC0\x03\x86\x66" \
-        "\xC7\x05\x1E\x00\x09\x00\x03\x86\x66\xB8\xE0\x01\x66\x2D\x07\x00" \
-        "\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66" \
-        "\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76" \
-        "\xF7\x88\x05\x00\x24\x00\x40\x66\xB8\xE0\x01\x66\x2D\x07\x00\x72" \
-        "\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39" \
-        "\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7" \
-        "\x31\xC0\x66\x0B\x05\x28\x80\x01\x80\x66\x0B\x05\x2C\x80\x00\x80" \
-        "\x8A\xC8\xB5\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00" \
-        "\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x88\x00", buff, "packet W: 589/590, R 1 to 591/592")
-    # Generated from packet 593/594
-    # bulk2 aggregate: packet W: 593/594, 1 to R 595/596
-    cmd.cmd_02(dev, "\x89\x00\x80\x0D\x09\x00")
-
-    # Generated from packet 597/598
-    # bulk2 aggregate: packet W: 597/598, 1 to R 599/600
-    buff = cmd.bulk2b(dev, "\x08\x02\x57\x88\x00")
-    # validate_read("\x00\x00", buff, "XXX continuity? packet W: 597/598, R 1 to 599/600")
-    if buff != "\x00\x00":
-        print("WARNING: continuity or security issue")
 
-    # Generated from packet 601/602
-    cmd.cmd_50(dev, "\x00\x03")
-    # Generated from packet 603/604
-    # bulk2 aggregate: packet W: 603/604, 1 to R 605/606
-    buff = cmd.bulk2b(dev,
-        "\x66\x8B\x05\x1E\x00\x09\x00\x66\x81\xE0\xFF\xF3\x66\x89\x05\x12" \
-        "\x22\x00\xC0\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x51\x8B\x0D\x04\x02\x00\x00\x88\x05\x20" \
-        "\x84\x10\x40\x88\x05\x24\x84\x10\x40\x88\x05\x28\x84\x10\x40\x88" \
-        "\x05\x2C\x80\x10\x40\x88\x05\x30\x84\x00\x40\x88\x05\x34\x84\x10" \
-        "\x40\x88\x05\x38\x84\x10\x40\x88\x05\x3C\x84\x10\x40\x89\x0D\x04" \
-        "\x02\x00\x00\x59\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB" \
-        "\x1C\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66" \
-        "\x52\x66\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00" \
-        "\x66\x5A\x66\x81\xF8\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0" \
-        "\xF0\xFF\x66\x81\xC8\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58" \
-        "\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x66\xC7\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB" \
-        "\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0" \
-        "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-        "\x66\x03\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07" \
-        "\x72\x15\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89" \
-        "\x0D\x90\x40\x00\xC0\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-        "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-        "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22" \
-        "\x00\xC0\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0" \
-        "\x66\x89\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81" \
-        "\x00\x00\x00\x00\x66\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25" \
-        "\x00\x00\xD0\x07\x72\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB8\x00\x71\x66\xBA\x02\x00\x66\x4A\x78\x1B\xFB" \
-        "\x90\xFA\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05" \
-        "\x04\x22\x00\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9" \
-        "\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4" \
-        "\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\xB9\x00\x00\xB2\x02\xFB" \
-        "\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44" \
-        "\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x89\x00", buff, "packet W: 603/604, R 1 to 605/606")
-    # Generated from packet 607/608
-    # bulk2 aggregate: packet W: 607/608, 1 to R 609/610
-    cmd.cmd_02(dev, "\x8A\x00\x80\x10\x09\x00")
-    # Generated from packet 611/612
-    # bulk2 aggregate: packet W: 611/612, 1 to R 613/616
-    cmd.cmd_57s(dev, "\x89", "\x00\x00")
-    # Generated from packet 617/618
-    # bulk2 aggregate: packet W: 617/618, 1 to R 619/654
-    cmd.cmd_57s(dev, "\x86\x87", "\x00\x00")
-    # Generated from packet 655/656
-    cmd.cmd_50(dev, "\x55\x09")
-    # Generated from packet 657/658
-    # bulk2 aggregate: packet W: 657/658, 1 to R 659/660
-    buff = cmd.bulk2b(dev,
-        "\x66\xC7\x05\x36\x24\x00\x00\x00\x00\x66\xC7\x05\x20\x24\x00\x00" \
-        "\x00\x00\x66\xC7\x05\x30\x24\x00\x00\x19\x00\x66\xC7\xC7\x96\x02" \
-        "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x39" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x26\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x26\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x88\x05\x34\x80\x06\x40\x88\x05\x30\x80" \
-        "\x04\x40\x88\x05\x3C\x00\xD0\x40\x66\xC7\x05\x10\x22\x00\xC0\x0D" \
-        "\x00\x66\xC7\x05\x12\x22\x00\xC0\x03\x86\x66\xC7\x05\x1E\x00\x09" \
-        "\x00\x03\x86\x66\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8" \
-        "\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00" \
-        "\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x1E" \
-        "\x00\x09\x00\x66\x81\xE0\xFF\xF3\x66\x89\x05\x12\x22\x00\xC0\x88" \
-        "\x05\x34\x00\x90\x40\x66\xC7\xC6\x0A\x00\x66\x8B\xC7\x81\xE0\xFF" \
-        "\xFF\x00\x00\x88\x05\x3C\x00\x10\x80\x66\xB9\x02\x00\x66\x8B\xC7" \
-        "\x66\xBA\x00\x00\x66\xF7\xF1\x66\x8B\xF8\x88\x05\x34\x00\xD0\x40" \
-        "\x88\x05\x34\x00\x90\x40\x66\xFF\xCE\x66\x8B\xC6\x66\x3D\x00\x00" \
-        "\x75\xC8\x88\x05\x3C\x00\x90\x40\x66\xC7\x05\x10\x22\x00\xC0\x0D" \
-        "\x00\x66\xC7\x05\x12\x22\x00\xC0\x03\x86\x66\xC7\x05\x1E\x00\x09" \
-        "\x00\x03\x86\x66\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8" \
-        "\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00" \
-        "\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x88\x05\x20\x80" \
-        "\x10\x40\x88\x05\x24\x80\x10\x40\x88\x05\x28\x80\x10\x40\x88\x05" \
-        "\x2C\x80\x10\x40\x66\x8B\x05\x36\x24\x00\x00\x81\xE0\xFF\xFF\x00" \
-        "\x00\xFF\xF0\xB8\x08\x00\x00\x00\x59\x39\xC8\x0F\x86\x3E\x05\x00" \
-        "\x00\x51\x8B\x0D\x04\x02\x00\x00\x88\x05\x20\x24\x00\x40\x81\xE1" \
-        "\x7F\xFF\xFF\xFF\x88\x05\x24\x24\x00\x40\x81\xE1\xBF\xFF\xFF\xFF" \
-        "\x88\x05\x28\x24\x00\x40\x81\xE1\xDF\xFF\xFF\xFF\x88\x05\x30\x24" \
-        "\x00\x40\x81\xE1\xFD\xFF\xFF\xFF\x88\x05\x34\x24\x00\x40\x81\xE1" \
-        "\xFB\xFF\xFF\xFF\x88\x05\x38\x24\x00\x40\x81\xE1\xF7\xFF\xFF\xFF" \
-        "\x88\x05\x3C\xA4\x04\x40\x81\xE1\xEF\xFF\xFF\xFF\x81\xE1\xFE\xFF" \
-        "\xFF\xFF\x89\x0D\x04\x02\x00\x00\x59\x88\x05\x20\x80\x10\x40\x88" \
-        "\x05\x24\x80\x10\x40\x88\x05\x28\x80\x10\x40\x88\x05\x2C\x80\x10" \
-        "\x40\x88\x05\x00\x24\x00\x40\x66\xB8\xE0\x01\x66\x2D\x07\x00\x72" \
-        "\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39" \
-        "\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7" \
-        "\x31\xC0\x66\x0B\x05\x20\x3C\x00\x80\x66\x0B\x05\x24\x34\x00\x80" \
-        "\x66\x0B\x05\x28\x2C\x00\x80\x66\x0B\x05\x30\x0C\x00\x80\x66\x0B" \
-        "\x05\x34\x14\x00\x80\x66\x0B\x05\x38\x1C\x00\x80\x66\x0B\x05\x3C" \
-        "\xA4\x00\x80\xB4\x00\x66\x89\x05\x22\x24\x00\x00\x66\x8B\x05\x36" \
-        "\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\x51\x8B\x0D\x04\x02\x00\x00" \
-        "\x88\x05\x30\x0C\x00\x80\x89\xC3\x81\xE3\x02\x00\x00\x00\x81\xE1" \
-        "\xFD\xFF\xFF\xFF\x09\xD9\x88\x05\x34\x14\x00\x80\x89\xC3\x81\xE3" \
-        "\x04\x00\x00\x00\x81\xE1\xFB\xFF\xFF\xFF\x09\xD9\x88\x05\x3C\x80" \
-        "\x00\x80\x89\xC3\x81\xE3\x01\x00\x00\x00\x81\xE1\xFE\xFF\xFF\xFF" \
-        "\x09\xD9\x89\x0D\x04\x02\x00\x00\x59\x88\x05\x30\x80\x06\x40\x66" \
-        "\xB8\x20\x03\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80" \
-        "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-        "\x39\x05\x04\x22\x00\xC0\x76\xF7\x88\x05\x30\x80\x04\x40\x66\xB8" \
-        "\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A" \
-        "\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39" \
-        "\x05\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x22\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\x51\x8B\x0D\x04\x02\x00\x00\x88\x05\x20\x3C\x00" \
-        "\x80\x89\xC3\x81\xE3\x80\x00\x00\x00\x81\xE1\x7F\xFF\xFF\xFF\x09" \
-        "\xD9\x88\x05\x24\x34\x00\x80\x89\xC3\x81\xE3\x40\x00\x00\x00\x81" \
-        "\xE1\xBF\xFF\xFF\xFF\x09\xD9\x88\x05\x28\x2C\x00\x80\x89\xC3\x81" \
-        "\xE3\x20\x00\x00\x00\x81\xE1\xDF\xFF\xFF\xFF\x09\xD9\x88\x05\x30" \
-        "\x0C\x00\x80\x89\xC3\x81\xE3\x02\x00\x00\x00\x81\xE1\xFD\xFF\xFF" \
-        "\xFF\x09\xD9\x88\x05\x34\x14\x00\x80\x89\xC3\x81\xE3\x04\x00\x00" \
-        "\x00\x81\xE1\xFB\xFF\xFF\xFF\x09\xD9\x88\x05\x38\x1C\x00\x80\x89" \
-        "\xC3\x81\xE3\x08\x00\x00\x00\x81\xE1\xF7\xFF\xFF\xFF\x09\xD9\x88" \
-        "\x05\x3C\xA4\x00\x80\x89\xC3\x81\xE3\x10\x00\x00\x00\x81\xE1\xEF" \
-        "\xFF\xFF\xFF\x09\xD9\x89\xC3\x81\xE3\x01\x00\x00\x00\x81\xE1\xFE" \
-        "\xFF\xFF\xFF\x09\xD9\x89\x0D\x04\x02\x00\x00\x59\x66\xB8\xE0\x01" \
-        "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-        "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-        "\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x20\x80\x14\x80\x66\x0B" \
-        "\x05\x24\x80\x35\x80\x66\x0B\x05\x28\x80\x56\x80\x66\x0B\x05\x2C" \
-        "\x80\x77\x80\xB4\x00\x66\x89\xC7\x66\x50\x66\x8B\xC7\xFB\x66\x53" \
-        "\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66" \
-        "\x58\x8B\x05\x04\x02\x00\x00\x8B\xC8\x40\x31\xC1\x89\x05\x04\x02" \
-        "\x00\x00\x88\x05\x3C\x80\x00\x80\xC1\xE9\x01\x0F\x84\x63\x00\x00" \
-        "\x00\x88\x05\x30\x0C\x00\x80\xC1\xE9\x01\x0F\x84\x54\x00\x00\x00" \
-        "\x88\x05\x34\x14\x00\x80\xC1\xE9\x01\x0F\x84\x45\x00\x00\x00\x88" \
-        "\x05\x38\x1C\x00\x80\xC1\xE9\x01\x0F\x84\x36\x00\x00\x00\x88\x05" \
-        "\x3C\x24\x00\x80\xC1\xE9\x01\x0F\x84\x27\x00\x00\x00\x88\x05\x28" \
-        "\x2C\x00\x80\xC1\xE9\x01\x0F\x84\x18\x00\x00\x00\x88\x05\x24\x34" \
-        "\x00\x80\xC1\xE9\x01\x0F\x84\x09\x00\x00\x00\x88\x05\x20\x3C\x00" \
-        "\x80\xC1\xE9\x01\x0F\x84\x27\xFD\xFF\xFF\x88\x05\x20\x80\x10\x40" \
-        "\x88\x05\x24\x80\x10\x40\x88\x05\x28\x80\x10\x40\x88\x05\x2C\x80" \
-        "\x10\x40\x66\xC7\x05\x30\x24\x00\x00\x19\x00\x66\xC7\xC7\x96\x02" \
-        "\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x39" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x26\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x26\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x88\x05\x34\x80\x06\x40\x88\x05\x30\x80" \
-        "\x04\x40\x88\x05\x3C\x00\xD0\x40\x66\xC7\x05\x10\x22\x00\xC0\x0D" \
-        "\x00\x66\xC7\x05\x12\x22\x00\xC0\x03\x86\x66\xC7\x05\x1E\x00\x09" \
-        "\x00\x03\x86\x66\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8" \
-        "\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00" \
-        "\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x1E" \
-        "\x00\x09\x00\x66\x81\xE0\xFF\xF3\x66\x89\x05\x12\x22\x00\xC0\x88" \
-        "\x05\x34\x00\x90\x40\x66\xC7\xC6\x0A\x00\x66\x8B\xC7\x81\xE0\xFF" \
-        "\xFF\x00\x00\x88\x05\x3C\x00\x10\x80\x66\xB9\x02\x00\x66\x8B\xC7" \
-        "\x66\xBA\x00\x00\x66\xF7\xF1\x66\x8B\xF8\x88\x05\x34\x00\xD0\x40" \
-        "\x88\x05\x34\x00\x90\x40\x66\xFF\xCE\x66\x8B\xC6\x66\x3D\x00\x00" \
-        "\x75\xC8\x88\x05\x3C\x00\x90\x40\x66\xC7\x05\x10\x22\x00\xC0\x0D" \
-        "\x00\x66\xC7\x05\x12\x22\x00\xC0\x03\x86\x66\xC7\x05\x1E\x00\x09" \
-        "\x00\x03\x86\x66\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8" \
-        "\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00" \
-        "\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\xFF\x05\x36" \
-        "\x24\x00\x00\x66\x8B\x05\x36\x24\x00\x00\xE9\xA5\xFA\xFF\xFF\x66" \
-        "\xC7\x05\x36\x24\x00\x00\x00\x00\x66\x8B\x05\x36\x24\x00\x00\x81" \
-        "\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x00\x00\x00\x00\x59\x39\xC8\x0F" \
-        "\x86\x29\x00\x00\x00\x66\x50\x66\x8B\xC7\xFB\x66\x53\x66\x51\x8A" \
-        "\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\x8B" \
-        "\x05\x36\x24\x00\x00\x66\xFF\x05\x36\x24\x00\x00\xEB\xBA\x66\xC7" \
-        "\x05\x30\x24\x00\x00\x19\x00\x66\xC7\xC7\x96\x02\x66\x8B\x05\x06" \
-        "\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x39\x00\x66\xC7\x05" \
-        "\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00" \
-        "\x00\x00\xF0\xFF\x66\x03\x05\x26\x47\x00\x00\x66\x89\x05\x90\x40" \
-        "\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00" \
-        "\x00\x00\x66\x2B\x05\x26\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB" \
-        "\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81" \
-        "\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81" \
-        "\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1" \
-        "\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00" \
-        "\x00\x40\x88\x05\x34\x80\x06\x40\x88\x05\x30\x80\x04\x40\x88\x05" \
-        "\x3C\x00\xD0\x40\x66\xC7\x05\x10\x22\x00\xC0\x0D\x00\x66\xC7\x05" \
-        "\x12\x22\x00\xC0\x03\x86\x66\xC7\x05\x1E\x00\x09\x00\x03\x86\x66" \
-        "\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80" \
-        "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-        "\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x1E\x00\x09\x00\x66" \
-        "\x81\xE0\xFF\xF3\x66\x89\x05\x12\x22\x00\xC0\x88\x05\x34\x00\x90" \
-        "\x40\x66\xC7\xC6\x0A\x00\x66\x8B\xC7\x81\xE0\xFF\xFF\x00\x00\x88" \
-        "\x05\x3C\x00\x10\x80\x66\xB9\x02\x00\x66\x8B\xC7\x66\xBA\x00\x00" \
-        "\x66\xF7\xF1\x66\x8B\xF8\x88\x05\x34\x00\xD0\x40\x88\x05\x34\x00" \
-        "\x90\x40\x66\xFF\xCE\x66\x8B\xC6\x66\x3D\x00\x00\x75\xC8\x88\x05" \
-        "\x3C\x00\x90\x40\x66\xC7\x05\x10\x22\x00\xC0\x0D\x00\x66\xC7\x05" \
-        "\x12\x22\x00\xC0\x03\x86\x66\xC7\x05\x1E\x00\x09\x00\x03\x86\x66" \
-        "\xB8\xE0\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80" \
-        "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-        "\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\xB9\x00\x00\xB2\x00\xFB\xFF" \
-        "\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x8A\x00", buff, "packet W: 657/658, R 1 to 659/660")
-    # Generated from packet 661/662
-    # bulk2 aggregate: packet W: 661/662, 1 to R 663/664
-    cmd.cmd_02(dev, "\x8B\x00\xE0\x19\x09\x00")
-    # Generated from packet 665/666
-    # bulk2 aggregate: packet W: 665/666, 5 to R 687/690
-    buff = cmd.bulk2b(dev, "\x08\x00\x57\x8A\x00")
-    fw_in = buff
-    # Generated from packet 691/692
-    # bulk2 aggregate: packet W: 691/692, 1 to R 693/694
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and 0 and validate_read("\x30\x01", buff,
-                              "packet W: 691/692, R 1 to 693/694")
-    # Generated from packet 695/696
-    # bulk2 aggregate: packet W: 695/696, 1 to R 697/698
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 695/696, R 1 to 697/698")
-    # Generated from packet 699/700
-    # bulk2 aggregate: packet W: 699/700, 1 to R 701/702
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and 0 and validate_read("\x40\x01", buff,
-                              "packet W: 699/700, R 1 to 701/702")
-    # Generated from packet 703/704
-    # bulk2 aggregate: packet W: 703/704, 1 to R 705/706
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 703/704, R 1 to 705/706")
-    # Generated from packet 707/708
-    # bulk2 aggregate: packet W: 707/708, 1 to R 709/710
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 707/708, R 1 to 709/710")
-    # Generated from packet 711/712
-    # bulk2 aggregate: packet W: 711/712, 1 to R 713/716
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 711/712, R 1 to 713/716")
-    # Generated from packet 717/718
-    # bulk2 aggregate: packet W: 717/718, 1 to R 719/720
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 717/718, R 1 to 719/720")
-    # Generated from packet 721/722
-    # bulk2 aggregate: packet W: 721/722, 1 to R 723/724
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 721/722, R 1 to 723/724")
-    # Generated from packet 725/726
-    # bulk2 aggregate: packet W: 725/726, 1 to R 727/728
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 725/726, R 1 to 727/728")
-    # Generated from packet 729/730
-    # bulk2 aggregate: packet W: 729/730, 1 to R 731/732
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 729/730, R 1 to 731/732")
-    # Generated from packet 733/734
-    # bulk2 aggregate: packet W: 733/734, 1 to R 735/736
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 733/734, R 1 to 735/736")
-    # Generated from packet 737/738
-    # bulk2 aggregate: packet W: 737/738, 1 to R 739/740
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 737/738, R 1 to 739/740")
-    # Generated from packet 741/742
-    # bulk2 aggregate: packet W: 741/742, 1 to R 743/744
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x30\x01", buff, "packet W: 741/742, R 1 to 743/744")
-    # Generated from packet 745/746
-    # bulk2 aggregate: packet W: 745/746, 1 to R 747/748
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 745/746, R 1 to 747/748")
-    # Generated from packet 749/750
-    # bulk2 aggregate: packet W: 749/750, 1 to R 751/752
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 749/750, R 1 to 751/752")
-    # Generated from packet 753/754
-    # bulk2 aggregate: packet W: 753/754, 1 to R 755/756
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 753/754, R 1 to 755/756")
-    # Generated from packet 757/758
-    # bulk2 aggregate: packet W: 757/758, 1 to R 759/762
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 757/758, R 1 to 759/762")
-    # Generated from packet 763/764
-    # bulk2 aggregate: packet W: 763/764, 1 to R 765/766
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 763/764, R 1 to 765/766")
-    # Generated from packet 767/768
-    # bulk2 aggregate: packet W: 767/768, 1 to R 769/770
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 767/768, R 1 to 769/770")
-    # Generated from packet 771/772
-    # bulk2 aggregate: packet W: 771/772, 1 to R 773/774
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 771/772, R 1 to 773/774")
-    # Generated from packet 775/776
-    # bulk2 aggregate: packet W: 775/776, 1 to R 777/778
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 775/776, R 1 to 777/778")
-    # Generated from packet 779/780
-    # bulk2 aggregate: packet W: 779/780, 1 to R 781/782
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 779/780, R 1 to 781/782")
-    # Generated from packet 783/784
-    # bulk2 aggregate: packet W: 783/784, 1 to R 785/786
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 783/784, R 1 to 785/786")
-    # Generated from packet 787/788
-    # bulk2 aggregate: packet W: 787/788, 1 to R 789/790
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 787/788, R 1 to 789/790")
-    # Generated from packet 791/792
-    # bulk2 aggregate: packet W: 791/792, 1 to R 793/794
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 791/792, R 1 to 793/794")
-    # Generated from packet 795/796
-    # bulk2 aggregate: packet W: 795/796, 1 to R 797/800
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 795/796, R 1 to 797/800")
-    # Generated from packet 801/802
-    # bulk2 aggregate: packet W: 801/802, 1 to R 803/804
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 801/802, R 1 to 803/804")
-    # Generated from packet 805/806
-    # bulk2 aggregate: packet W: 805/806, 1 to R 807/808
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 805/806, R 1 to 807/808")
-    # Generated from packet 809/810
-    # bulk2 aggregate: packet W: 809/810, 1 to R 811/812
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x30\x01", buff, "packet W: 809/810, R 1 to 811/812")
-    # Generated from packet 813/814
-    # bulk2 aggregate: packet W: 813/814, 1 to R 815/816
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 813/814, R 1 to 815/816")
-    # Generated from packet 817/818
-    # bulk2 aggregate: packet W: 817/818, 1 to R 819/820
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 817/818, R 1 to 819/820")
-    # Generated from packet 821/822
-    # bulk2 aggregate: packet W: 821/822, 1 to R 823/824
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 821/822, R 1 to 823/824")
-    # Generated from packet 825/826
-    # bulk2 aggregate: packet W: 825/826, 1 to R 827/828
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x30\x01", buff, "packet W: 825/826, R 1 to 827/828")
-    # Generated from packet 829/830
-    # bulk2 aggregate: packet W: 829/830, 1 to R 831/832
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 829/830, R 1 to 831/832")
-    # Generated from packet 833/834
-    # bulk2 aggregate: packet W: 833/834, 1 to R 835/836
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 833/834, R 1 to 835/836")
-    # Generated from packet 837/838
-    # bulk2 aggregate: packet W: 837/838, 1 to R 839/840
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 837/838, R 1 to 839/840")
-    # Generated from packet 841/842
-    # bulk2 aggregate: packet W: 841/842, 1 to R 843/846
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 841/842, R 1 to 843/846")
-    # Generated from packet 847/848
-    # bulk2 aggregate: packet W: 847/848, 1 to R 849/850
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 847/848, R 1 to 849/850")
-    # Generated from packet 851/852
-    # bulk2 aggregate: packet W: 851/852, 1 to R 853/854
-    buff = cmd.bulk2b(dev, "\x19\x0D\x00")
-    0 and validate_read("\x40\x01", buff, "packet W: 851/852, R 1 to 853/854")
-    # Generated from packet 855/856
-    # bulk2 aggregate: packet W: 855/856, 1 to R 857/858
-    buff = cmd.bulk2b(dev, "\x19\x11\x00")
-    validate_read("\x00\x00", buff, "packet W: 855/856, R 1 to 857/858")
-    # Generated from packet 859/860
-    # bulk2 aggregate: packet W: 859/860, 1 to R 861/864
-    cmd.cmd_57s(dev, "\x89", "\x00\x00")
-    # Generated from packet 865/866
-    cmd.cmd_50(dev, "\x0D\x00")
-    # Generated from packet 867/868
-    # bulk2 aggregate: packet W: 867/868, 1 to R 869/870
-    buff = cmd.bulk2b(dev,
-                      "\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00")
-    validate_read("\x8B\x00", buff, "packet W: 867/868, R 1 to 869/870")
-    # Generated from packet 871/872
-    # bulk2 aggregate: packet W: 871/872, 1 to R 873/874
-    cmd.cmd_02(dev, "\x8C\x00\xF0\x19\x09\x00")
-    # Generated from packet 875/876
-    bulkWrite(0x02, "\x57\x8B\x00\x50\x1A\x00\x00\x00")
-    # Generated from packet 877/878
-    # bulk2 aggregate: packet W: 877/878, 1 to R 879/880
-    buff = cmd.bulk2b(dev,
-        "\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00" \
-        "\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00"
-        )
-    validate_read("\x8C\x00", buff, "packet W: 877/878, R 1 to 879/880")
-    # Generated from packet 881/882
-    # bulk2 aggregate: packet W: 881/882, 1 to R 883/884
-    cmd.cmd_02(dev, "\x8D\x00\x10\x1A\x09\x00")
-    # Generated from packet 885/886
-    # bulk2 aggregate: packet W: 885/886, 1 to R 887/888
-    cmd.cmd_57s(dev, "\x8C", "\x00\x00")
-    # Generated from packet 889/890
-    # bulk2 aggregate: packet W: 889/890, 1 to R 891/894
-    cmd.led_mask(dev, "pass")
-    # Generated from packet 921/922
-    # bulk2 aggregate: packet W: 921/922, 1 to R 923/924
-    cmd.cmd_49(dev)
-    return {"code": fw_in}
+def dev_read(dev, cont, verbose=False):
+    # cont is ignored: the script was captured with continuity check off (cont-n)
+    # Generated from a capture, see s87c751_read.json
+    captures = proto.get(READ_SCRIPT).run(dev)
+    return {"code": captures['code']}
 
 
 class Device(bpmicro.device.Device):
@@ -862,7 +22,8 @@ class Device(bpmicro.device.Device):
                         cont=opts.get('cont', True),
                         verbose=opts.get('verbose', False))
 
-
-# my_fw.py
-# 0 new firmwares
-# 0 existing firmwares
+    def read_stream(self, opts, extra=None):
+        # Same options as read(), cont is ignored the same way
+        # There are no non buffer entries for extra
+        # Code is yielded as it comes off bulk 0x86
+        return proto.get(READ_SCRIPT).run_stream(self.dev)
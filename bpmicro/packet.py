@@ -0,0 +1,185 @@
+'''
+Compact capture packet records and an incremental usbrply JSON loader
+
+A usbrply JSON capture is one dict per packet with hex strings for payloads
+Packet keeps the same field names in a slotted object with raw byte payloads
+The loader parses the "data" list one packet at a time instead of json.load()ing
+the whole file
+'''
+
+import binascii
+import json
+
+# Characters a JSON number can continue with
+NUMBER_CHARS = '0123456789.eE+-'
+
+
+class Packet(object):
+    '''
+    One capture packet
+    type: bulkRead, bulkWrite, controlRead, controlWrite or comment
+    data: payload bytes (None for comments)
+    packn: (submit, complete) capture frame numbers
+    ts: (submit, complete) capture timestamps, None if the source has none
+    v: comment text
+    '''
+    __slots__ = ('type', 'endp', 'data', 'packn', 'ts', 'bRequestType',
+                 'bRequest', 'wValue', 'wIndex', 'wLength', 'v')
+
+    def __init__(self,
+                 type,
+                 data=None,
+                 packn=None,
+                 ts=None,
+                 endp=None,
+                 bRequestType=None,
+                 bRequest=None,
+                 wValue=None,
+                 wIndex=None,
+                 wLength=None,
+                 v=None):
+        self.type = type
+        self.data = data
+        self.packn = packn
+        self.ts = ts
+        self.endp = endp
+        self.bRequestType = bRequestType
+        self.bRequest = bRequest
+        self.wValue = wValue
+        self.wIndex = wIndex
+        self.wLength = wLength
+        self.v = v
+
+    def __repr__(self):
+        return 'Packet(%s, %s)' % (self.type, self.packn)
+
+
+def from_dict(d):
+    '''usbrply JSON packet => Packet'''
+    data = d.get('data')
+    if data is not None:
+        data = binascii.unhexlify(data)
+    packn = d.get('packn')
+    if packn is not None:
+        packn = tuple(packn)
+    ts = d.get('ts')
+    if ts is not None:
+        ts = tuple(ts)
+    return Packet(d['type'],
+                  data=data,
+                  packn=packn,
+                  ts=ts,
+                  endp=d.get('endp'),
+                  bRequestType=d.get('bRequestType'),
+                  bRequest=d.get('bRequest'),
+                  wValue=d.get('wValue'),
+                  wIndex=d.get('wIndex'),
+                  wLength=d.get('wLength'),
+                  v=d.get('v'))
+
+
+class JSONStream(object):
+    '''Decode consecutive JSON values from a file, reading only as needed'''
+
+    # Read size. Values larger than this are handled by reading more
+    chunk = 1 << 16
+
+    def __init__(self, f):
+        self.f = f
+        self.buff = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self):
+        if self.eof:
+            return False
+        data = self.f.read(self.chunk)
+        if not data:
+            self.eof = True
+            return False
+        self.buff = self.buff[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def skip_ws(self):
+        while True:
+            while self.pos < len(self.buff) and self.buff[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buff) or not self.fill():
+                return
+
+    def token(self):
+        '''Consume and return the next structural character'''
+        self.skip_ws()
+        if self.pos >= len(self.buff):
+            raise ValueError("Unexpected end of JSON")
+        c = self.buff[self.pos]
+        self.pos += 1
+        return c
+
+    def peek(self):
+        self.skip_ws()
+        if self.pos >= len(self.buff):
+            raise ValueError("Unexpected end of JSON")
+        return self.buff[self.pos]
+
+    def value(self):
+        '''Decode the next complete value'''
+        self.skip_ws()
+        while True:
+            try:
+                v, end = self.decoder.raw_decode(self.buff, self.pos)
+            except ValueError:
+                # Possibly truncated by the read size
+                if not self.fill():
+                    raise
+                continue
+            # A number may continue in the next read
+            # (ex: "2." decodes as 2 until the fraction arrives)
+            if not self.buff[end:].strip(NUMBER_CHARS) and self.fill():
+                continue
+            self.pos = end
+            return v
+
+    def items(self):
+        '''Yield the values of the array about to be read'''
+        if self.token() != '[':
+            raise ValueError("Expected array")
+        if self.peek() == ']':
+            self.token()
+            return
+        while True:
+            yield self.value()
+            c = self.token()
+            if c == ']':
+                return
+            if c != ',':
+                raise ValueError("Expected , or ] in array")
+
+
+def json_packets(fn, key='data'):
+    '''
+    Yield Packet records from a usbrply JSON file, one at a time
+    Other top level keys are decoded and discarded
+    '''
+    with open(fn) as f:
+        stream = JSONStream(f)
+        if stream.token() != '{':
+            raise ValueError("%s: expected a JSON object" % fn)
+        if stream.peek() == '}':
+            return
+        while True:
+            k = stream.value()
+            if stream.token() != ':':
+                raise ValueError("%s: expected :" % fn)
+            if k == key:
+                for d in stream.items():
+                    yield from_dict(d)
+            else:
+                stream.value()
+            c = stream.token()
+            if c == '}':
+                return
+            if c != ',':
+                raise ValueError("%s: expected , or }" % fn)
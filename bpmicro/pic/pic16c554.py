@@ -5,13 +5,10 @@ from bpmicro import cmd
 from bpmicro.usb import validate_read
 from bpmicro.usb import usb_wraps
 import bpmicro.device
+from bpmicro import fw
 import struct
 import binascii
 
-import bpmicro.pic.pic16f84_fw
-import bpmicro.pic.pic17c43_fw
-import bpmicro.pic.pic16c554_fw as my_fw
-
 
 def dev_read(dev, cont=False, verbose=False):
     bulkRead, bulkWrite, controlRead, controlWrite = usb_wraps(dev)
@@ -161,7 +158,7 @@ def dev_read(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x20\x01\x00\x50\x7D\x02\x00\x00")
     # Generated from packet 493/494
     # bulk2 aggregate: packet W: 493/494, 1 to R 495/496
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic16f84_fw.p651)
+    buff = cmd.bulk2b(dev, fw.hash2bin["7497e05e"])
     validate_read("\x82\x00", buff, "packet W: 493/494, R 1 to 495/496")
     # Generated from packet 497/498
     # bulk2 aggregate: packet W: 497/498, 1 to R 499/500
@@ -182,7 +179,7 @@ def dev_read(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x57\x83\x00\x50\x18\x3A\x00\x00")
     # Generated from packet 513/514
     # bulk2 aggregate: packet W: 513/514, 1 to R 515/516
-    buff = cmd.bulk2b(dev, my_fw.p513)
+    buff = cmd.bulk2b(dev, fw.hash2bin["88f9baa0"])
     validate_read("\x84\x00", buff, "packet W: 513/514, R 1 to 515/516")
     # Generated from packet 517/518
     # bulk2 aggregate: packet W: 517/518, 1 to R 519/520
@@ -198,7 +195,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\xDE\x03")
     # Generated from packet 525/526
     # bulk2 aggregate: packet W: 525/526, 1 to R 527/528
-    buff = cmd.bulk2b(dev, my_fw.p525)
+    buff = cmd.bulk2b(dev, fw.hash2bin["941e9ec9"])
     validate_read("\x85\x00", buff, "packet W: 525/526, R 1 to 527/528")
     # Generated from packet 529/530
     # bulk2 aggregate: packet W: 529/530, 1 to R 531/532
@@ -210,7 +207,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x71\x1B")
     # Generated from packet 539/540
     # bulk2 aggregate: packet W: 539/540, 1 to R 541/542
-    buff = cmd.bulk2b(dev, my_fw.p539)
+    buff = cmd.bulk2b(dev, fw.hash2bin["9d715d87"])
     validate_read("\x86\x00", buff, "packet W: 539/540, R 1 to 541/542")
     # Generated from packet 543/544
     # bulk2 aggregate: packet W: 543/544, 1 to R 545/546
@@ -254,7 +251,7 @@ def dev_read(dev, cont=False, verbose=False):
         )
     # Generated from packet 563/564
     # bulk2 aggregate: packet W: 563/564, 1 to R 565/566
-    buff = cmd.bulk2b(dev, my_fw.p563)
+    buff = cmd.bulk2b(dev, fw.hash2bin["e0f29bc2"])
     validate_read("\x88\x00", buff, "packet W: 563/564, R 1 to 565/566")
     # Generated from packet 567/568
     # bulk2 aggregate: packet W: 567/568, 1 to R 569/570
@@ -290,7 +287,7 @@ def dev_read(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x57\x8A\x00\x50\x3D\x09\x00\x00")
     # Generated from packet 597/598
     # bulk2 aggregate: packet W: 597/598, 1 to R 599/600
-    buff = cmd.bulk2b(dev, my_fw.p597)
+    buff = cmd.bulk2b(dev, fw.hash2bin["8d5fc051"])
     validate_read("\x8B\x00", buff, "packet W: 597/598, R 1 to 599/600")
     # Generated from packet 601/602
     # bulk2 aggregate: packet W: 601/602, 1 to R 603/604
@@ -302,7 +299,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x37\x06")
     # Generated from packet 611/612
     # bulk2 aggregate: packet W: 611/612, 1 to R 613/614
-    buff = cmd.bulk2b(dev, my_fw.p611)
+    buff = cmd.bulk2b(dev, fw.hash2bin["49120167"])
     validate_read("\x8C\x00", buff, "packet W: 611/612, R 1 to 613/614")
     # Generated from packet 615/616
     # bulk2 aggregate: packet W: 615/616, 1 to R 617/618
@@ -318,7 +315,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\xCE\x03")
     # Generated from packet 625/626
     # bulk2 aggregate: packet W: 625/626, 1 to R 627/628
-    buff = cmd.bulk2b(dev, my_fw.p625)
+    buff = cmd.bulk2b(dev, fw.hash2bin["35b45a85"])
     validate_read("\x8D\x00", buff, "packet W: 625/626, R 1 to 627/628")
     # Generated from packet 629/630
     # bulk2 aggregate: packet W: 629/630, 1 to R 631/632
@@ -336,7 +333,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x66\x26")
     # Generated from packet 773/774
     # bulk2 aggregate: packet W: 773/774, 1 to R 775/776
-    buff = cmd.bulk2b(dev, my_fw.p773)
+    buff = cmd.bulk2b(dev, fw.hash2bin["25935f35"])
     validate_read("\x8E\x00", buff, "packet W: 773/774, R 1 to 775/776")
     # Generated from packet 777/778
     # bulk2 aggregate: packet W: 777/778, 1 to R 779/780
@@ -345,7 +342,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 781/782
     # bulk2 aggregate: packet W: 781/782, 3 to R 817/818
     buff = cmd.bulk2b(dev, "\x08\x00\x09\x02\x57\x8E\x00")
-    #validate_read(my_fw.p817, buff, "packet W: 781/782, R 3 to 817/818")
+    #validate_read(fw.hash2bin["0f343b09"], buff, "packet W: 781/782, R 3 to 817/818")
     code = buff
 
     # Generated from packet 819/820
@@ -371,7 +368,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x46\x0C")
     # Generated from packet 843/844
     # bulk2 aggregate: packet W: 843/844, 1 to R 845/846
-    buff = cmd.bulk2b(dev, my_fw.p843)
+    buff = cmd.bulk2b(dev, fw.hash2bin["ed09dec6"])
     validate_read("\x90\x00", buff, "packet W: 843/844, R 1 to 845/846")
     # Generated from packet 847/848
     # bulk2 aggregate: packet W: 847/848, 1 to R 849/850
@@ -5,8 +5,8 @@ from bpmicro import cmd
 from bpmicro import util
 from bpmicro.usb import validate_read
 from bpmicro.usb import usb_wraps
-from . import pic16f84_fw
 import bpmicro.device
+from bpmicro import fw
 
 import binascii
 import struct
@@ -14,19 +14,17 @@ import time
 
 
 def read_eeprom(dev):
+    # One transfer per word as BPWin, packed into one with cmd.coalesce
+    # Generated from packet 2075/2076
+    # Generated from packet 2079/2080
+    # ...
+    # Generated from packet 2327/2328
+    groups = ["\x94"] + ["\x92\x94"] * 0x3F
+    # Convert little to big endian?
+    # no the data buff will be anyway
     ret = bytearray()
-    for dati in range(0x40):
-        if dati == 0:
-            # Generated from packet 2075/2076
-            this = cmd.cmd_57s(dev, "\x94", None)
-        else:
-            # Generated from packet 2079/2080
-            # ...
-            # Generated from packet 2327/2328
-            this = cmd.cmd_57s(dev, "\x92\x94", None)
-        # Convert little to big endian?
-        # no the data buff will be anyway
-        #ret += this[1] + this[0]
+    for this in cmd.cmd_57s_batch(dev, groups, reply_len=2,
+                                  msg="read_eeprom"):
         ret += this
 
     # Generated from packet 2331/2332
@@ -161,7 +159,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 1831/1832
     bulkWrite(0x02, "\x20\x01\x00\x50\x7D\x02\x00\x00")
     # Generated from packet 1833/1834
-    buff = cmd.bulk2b(dev, pic16f84_fw.p651)
+    buff = cmd.bulk2b(dev, fw.hash2bin["7497e05e"])
     validate_read("\x82\x00", buff, "packet W: 1833/1834, R 1 to 1835/1836")
     # Generated from packet 1837/1838
     cmd.cmd_02(dev, "\x83\x00\x90\x03\x09\x00")
@@ -178,7 +176,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 1851/1852
     bulkWrite(0x02, "\x57\x83\x00\x50\x18\x3A\x00\x00")
     # Generated from packet 1853/1854
-    buff = cmd.bulk2b(dev, pic16f84_fw.p533)
+    buff = cmd.bulk2b(dev, fw.hash2bin["06a7b55f"])
     validate_read("\x84\x00", buff, "packet W: 1853/1854, R 1 to 1855/1856")
     # Generated from packet 1857/1858
     cmd.cmd_02(dev, "\x85\x00\xD0\x3D\x09\x00")
@@ -192,7 +190,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 1863/1864
     cmd.cmd_50(dev, "\xDE\x03")
     # Generated from packet 1865/1866
-    buff = cmd.bulk2b(dev, pic16f84_fw.p555)
+    buff = cmd.bulk2b(dev, fw.hash2bin["f127b9be"])
     validate_read("\x85\x00", buff, "packet W: 1865/1866, R 1 to 1867/1868")
     # Generated from packet 1869/1870
     cmd.cmd_02(dev, "\x86\x00\xB0\x41\x09\x00")
@@ -209,7 +207,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 1877/1878
     cmd.cmd_50(dev, "\x71\x1B")
     # Generated from packet 1879/1880
-    buff = cmd.bulk2b(dev, pic16f84_fw.p591)
+    buff = cmd.bulk2b(dev, fw.hash2bin["609f1c53"])
     validate_read("\x86\x00", buff, "packet W: 1879/1880, R 1 to 1881/1882")
     # Generated from packet 1883/1884
     cmd.cmd_02(dev, "\x87\x00\x30\x5D\x09\x00")
@@ -251,7 +249,7 @@ def dev_read(dev, cont=False, verbose=False):
         "\x00\x50\x71\x09\x00\x00"
         )
     # Generated from packet 1903/1904
-    buff = cmd.bulk2b(dev, pic16f84_fw.p615)
+    buff = cmd.bulk2b(dev, fw.hash2bin["b6a5b484"])
     validate_read("\x88\x00", buff, "packet W: 1903/1904, R 1 to 1905/1906")
     # Generated from packet 1907/1908
     cmd.cmd_02(dev, "\x89\x00\xF0\x66\x09\x00")
@@ -280,7 +278,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 1935/1936
     bulkWrite(0x02, "\x57\x8A\x00\x50\xD1\x06\x00\x00")
     # Generated from packet 1937/1938
-    buff = cmd.bulk2b(dev, pic16f84_fw.p891)
+    buff = cmd.bulk2b(dev, fw.hash2bin["efb5256f"])
     validate_read("\x8B\x00", buff, "packet W: 1937/1938, R 1 to 1939/1940")
     # Generated from packet 1941/1942
     cmd.cmd_02(dev, "\x8C\x00\x10\x6E\x09\x00")
@@ -289,7 +287,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 1949/1950
     cmd.cmd_50(dev, "\xF2\x02")
     # Generated from packet 1951/1952
-    buff = cmd.bulk2b(dev, pic16f84_fw.p663)
+    buff = cmd.bulk2b(dev, fw.hash2bin["42404227"])
     validate_read("\x8C\x00", buff, "packet W: 1951/1952, R 1 to 1953/1954")
     # Generated from packet 1955/1956
     cmd.cmd_02(dev, "\x8D\x00\x10\x71\x09\x00")
@@ -307,7 +305,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 1963/1964
     cmd.cmd_50(dev, "\xCE\x03")
     # Generated from packet 1965/1966
-    buff = cmd.bulk2b(dev, pic16f84_fw.p919)
+    buff = cmd.bulk2b(dev, fw.hash2bin["975bce66"])
     validate_read("\x8D\x00", buff, "packet W: 1965/1966, R 1 to 1967/1968")
     # Generated from packet 1969/1970
     cmd.cmd_02(dev, "\x8E\x00\xE0\x74\x09\x00")
@@ -319,7 +317,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 1981/1982
     cmd.cmd_50(dev, "\x45\x03")
     # Generated from packet 1983/1984
-    buff = cmd.bulk2b(dev, pic16f84_fw.p697)
+    buff = cmd.bulk2b(dev, fw.hash2bin["bdaccd62"])
     validate_read("\x8E\x00", buff, "packet W: 1983/1984, R 1 to 1985/1986")
     # Generated from packet 1987/1988
     cmd.cmd_02(dev, "\x8F\x00\x30\x78\x09\x00")
@@ -330,7 +328,7 @@ def dev_read(dev, cont=False, verbose=False):
         "\x57\x8E\x00"
         )
     code = buff
-    #validate_read(pic16f84_fw.p2001, buff, "packet W: 1991/1992, R 5 to 2001/2002")
+    #validate_read(fw.hash2bin["f7449bfb"], buff, "packet W: 1991/1992, R 5 to 2001/2002")
 
     # Generated from packet 2003/2004
     cmd.cmd_50(dev, "\x5E\x00")
@@ -351,7 +349,7 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 2017/2018
     cmd.cmd_50(dev, "\x58\x06")
     # Generated from packet 2019/2020
-    buff = cmd.bulk2b(dev, pic16f84_fw.p759)
+    buff = cmd.bulk2b(dev, fw.hash2bin["e7568b3d"])
     validate_read("\x90\x00", buff, "packet W: 2019/2020, R 1 to 2021/2022")
     # Generated from packet 2023/2024
     cmd.cmd_02(dev, "\x91\x00\xF0\x7E\x09\x00")
@@ -412,16 +410,16 @@ def dev_read(dev, cont=False, verbose=False):
     # Generated from packet 2051/2052
     cmd.cmd_02(dev, "\x93\x00\x20\x80\x09\x00")
     # Generated from packet 2055/2056
-    bulkWrite(0x02, pic16f84_fw.p795)
+    bulkWrite(0x02, fw.hash2bin["2c9b39f7"])
     # Generated from packet 2057/2058
-    buff = cmd.bulk2b(dev, pic16f84_fw.p797)
+    buff = cmd.bulk2b(dev, fw.hash2bin["73860301"])
     validate_read("\x93\x00", buff, "packet W: 2057/2058, R 1 to 2059/2060")
     # Generated from packet 2061/2062
     cmd.cmd_02(dev, "\x94\x00\xA0\x81\x09\x00")
     # Generated from packet 2065/2066
     bulkWrite(0x02, "\x57\x93\x00\x50\x07\x01\x00\x00")
     # Generated from packet 2067/2068
-    buff = cmd.bulk2b(dev, pic16f84_fw.p807)
+    buff = cmd.bulk2b(dev, fw.hash2bin["d134dbe1"])
     validate_read("\x94\x00", buff, "packet W: 2067/2068, R 1 to 2069/2070")
     # Generated from packet 2071/2072
     cmd.cmd_02(dev, "\x95\x00\xB0\x82\x09\x00")
@@ -1,6792 +0,0 @@
-# mcmaster@phantom:~/doc/ext/uvscada/bpm$ python scrape.py pic16f84_pcap/08_prog_con-y_erase-y_blank-n_prog-y_verify-y_secure-n.json  >tmp.py
-# more added later
-
-p651 = \
-        "\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00" \
-        "\x05\x00\x00\x00\xBB\x01\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83" \
-        "\x74\x46\x00\x00\x0F\x00\x00\x00\xBB\x02\x00\x00\x00\xC1\xE3\x02" \
-        "\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x03\x00\x00" \
-        "\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00" \
-        "\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00" \
-        "\x00\x00\x00\x00\xFF\x15\x38\x11\x00\x00\x88\x05\x00\x24\x00\x40" \
-        "\x66\xB8\x00\xD4\x66\xBA\x30\x00\x66\x4A\x78\x1B\xFB\x90\xFA\x66" \
-        "\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05\x04\x22\x00" \
-        "\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53\x5B" \
-        "\xC7\x83\x74\x46\x00\x00\x06\x00\x00\x00\xBB\x01\x00\x00\x00\xC1" \
-        "\xE3\x02\x53\x66\xB8\x0F\x00\x66\xF7\xD0\x5B\x81\xE0\xFF\xFF\x00" \
-        "\x00\x89\x83\x74\x46\x00\x00\xBB\x02\x00\x00\x00\xC1\xE3\x02\x53" \
-        "\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x03\x00\x00\x00" \
-        "\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB" \
-        "\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00" \
-        "\x00\x00\x00\xFF\x15\x38\x11\x00\x00\xBB\x00\x00\x00\x00\xC1\xE3" \
-        "\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x04\x00\x00\x00\xBB\x01\x00" \
-        "\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x0F\x00\x00" \
-        "\x00\xBB\x02\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00" \
-        "\x00\x00\x00\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7" \
-        "\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3" \
-        "\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38" \
-        "\x11\x00\x00\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74" \
-        "\x46\x00\x00\x07\x00\x00\x00\xBB\x01\x00\x00\x00\xC1\xE3\x02\x53" \
-        "\x5B\xC7\x83\x74\x46\x00\x00\x0F\x00\x00\x00\xBB\x02\x00\x00\x00" \
-        "\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB" \
-        "\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00" \
-        "\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74" \
-        "\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11\x00\x00\xBB\x00\x00" \
-        "\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x08\x00\x00" \
-        "\x00\xBB\x01\x00\x00\x00\xC1\xE3\x02\x53\x66\xB8\x0F\x00\x66\xF7" \
-        "\xD0\x5B\x81\xE0\xFF\xFF\x00\x00\x89\x83\x74\x46\x00\x00\xBB\x02" \
-        "\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00" \
-        "\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46" \
-        "\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53\x5B" \
-        "\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11\x00\x00" \
-        "\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-
-p891 = \
-        "\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x00\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\xB4\x46\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\xB4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C" \
-        "\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52" \
-        "\x66\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66" \
-        "\x5A\x66\x81\xF8\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0" \
-        "\xFF\x66\x81\xC8\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66" \
-        "\xC7\x05\x50\x40\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66" \
-        "\xC7\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66" \
-        "\xC7\x05\x50\x40\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0" \
-        "\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66" \
-        "\x03\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72" \
-        "\x15\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D" \
-        "\x90\x40\x00\xC0\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81" \
-        "\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22" \
-        "\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-        "\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00" \
-        "\xC0\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00" \
-        "\x00\xD0\x07\x72\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22" \
-        "\x00\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB" \
-        "\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81" \
-        "\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81" \
-        "\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1" \
-        "\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00" \
-        "\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x30\x00" \
-        "\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7" \
-        "\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x14\x47\x00\x00\x66\x89" \
-        "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-        "\x81\x00\x00\x00\x00\x66\x2B\x05\x14\x47\x00\x00\xC6\x05\x14\x22" \
-        "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-        "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-        "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-        "\x82\x00\x00\x00\x40\x88\x05\x30\x04\x00\x40\x66\xB8\x00\xE2\x66" \
-        "\xBA\x04\x00\x66\x4A\x78\x1B\xFB\x90\xFA\x66\xF7\x05\x04\x22\x00" \
-        "\xC0\x00\x80\x74\xF2\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x75\xF5" \
-        "\xEB\xE1\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66" \
-        "\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76" \
-        "\xF7\x88\x05\x24\x80\x04\x40\x88\x05\x28\x80\x04\x40\x66\x8B\x05" \
-        "\x06\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C\x00\x66\x81" \
-        "\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52\x66\xBA\xD0" \
-        "\x07\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66\x5A\x66\x81" \
-        "\xF8\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0\xFF\x66\x81" \
-        "\xC8\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66\xC7\x05\x50" \
-        "\x40\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66\xC7\x05\x50" \
-        "\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66\xC7\x05\x50" \
-        "\x40\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9" \
-        "\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xEC" \
-        "\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x15\x89\xD9" \
-        "\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D\x90\x40\x00" \
-        "\xC0\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x81\x3D" \
-        "\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00\xC0\x02\x81" \
-        "\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00" \
-        "\x66\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07" \
-        "\x72\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22\x00\xC0\x1B" \
-        "\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00" \
-        "\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00" \
-        "\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00" \
-        "\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89" \
-        "\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66" \
-        "\xB8\x01\x82\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x30\x00\x66\xC7\x05" \
-        "\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00" \
-        "\x00\x00\xF0\xFF\x66\x03\x05\x14\x47\x00\x00\x66\x89\x05\x90\x40" \
-        "\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00" \
-        "\x00\x00\x66\x2B\x05\x14\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB" \
-        "\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81" \
-        "\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81" \
-        "\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1" \
-        "\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00" \
-        "\x00\x40\x66\xB8\x00\xE2\x66\xBA\x04\x00\x66\x4A\x78\x1B\xFB\x90" \
-        "\xFA\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05\x04" \
-        "\x22\x00\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9\x80" \
-        "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-        "\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x06\x00\x09\x00\x81" \
-        "\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-        "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-        "\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-        "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-        "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-        "\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-        "\x80\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A" \
-        "\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39" \
-        "\x05\x04\x22\x00\xC0\x76\xF7\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25" \
-        "\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00" \
-        "\x00"
-
-p905 = \
-        "\x88\x05\x24\x80\x04\x40\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66" \
-        "\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06" \
-        "\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB" \
-        "\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x56\x0B\x09" \
-        "\x00\x00\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x56\x0B\x09" \
-        "\x00\x66\x8B\x05\x56\x0B\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05" \
-        "\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40" \
-        "\xEB\xAF\x88\x05\x28\x80\x04\x40\x88\x05\x24\x80\x06\x40\x88\x05" \
-        "\x24\x80\x04\x40\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05" \
-        "\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x0E\x00\x00" \
-        "\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66" \
-        "\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9" \
-        "\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\xE4\x0B\x09\x00\x00" \
-        "\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\xE4\x0B\x09\x00\x66" \
-        "\x8B\x05\xE4\x0B\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80" \
-        "\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF" \
-        "\x88\x05\x28\x80\x04\x40\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80" \
-        "\x04\x40\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59" \
-        "\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05" \
-        "\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00" \
-        "\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x72\x0C\x09\x00\x02\x00\x66" \
-        "\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x72\x0C\x09\x00\x66\x8B\x05" \
-        "\x72\x0C\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05" \
-        "\x28\x80\x04\x40\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40" \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x0E\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00" \
-        "\x00\x00\x00\x00\x66\xC7\x05\x00\x0D\x09\x00\xFF\x3F\x66\x8B\x0D" \
-        "\x28\x24\x00\x00\x66\xD3\x2D\x00\x0D\x09\x00\x66\x8B\x05\x00\x0D" \
-        "\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80" \
-        "\x04\x40\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7" \
-        "\xC6\x07\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28" \
-        "\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00" \
-        "\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x52\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x05" \
-        "\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x94\x0D\x09\x00\x06" \
-        "\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x94\x0D\x09\x00\x66" \
-        "\x8B\x05\x94\x0D\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80" \
-        "\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAE" \
-        "\x66\xFF\xCE\x66\x8B\xC6\x66\x3D\x00\x00\x0F\x85\x73\xFF\xFF\xFF" \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00" \
-        "\x00\x00\x00\x00\x66\xC7\x05\x20\x0E\x09\x00\x01\x00\x66\x8B\x0D" \
-        "\x28\x24\x00\x00\x66\xD3\x2D\x20\x0E\x09\x00\x66\x8B\x05\x20\x0E" \
-        "\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x66\xC7\x05\x28" \
-        "\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00" \
-        "\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF" \
-        "\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00" \
-        "\x66\xC7\x05\x9C\x0E\x09\x00\x07\x00\x66\x8B\x0D\x28\x24\x00\x00" \
-        "\x66\xD3\x2D\x9C\x0E\x09\x00\x66\x8B\x05\x9C\x0E\x09\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40" \
-        "\x88\x05\x24\x80\x04\x40\xEB\xAF\x66\xC7\x05\x28\x24\x00\x00\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0" \
-        "\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00" \
-        "\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x18" \
-        "\x0F\x09\x00\x08\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x18" \
-        "\x0F\x09\x00\x66\x8B\x05\x18\x0F\x09\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80" \
-        "\x04\x40\xEB\xAF\x88\x05\x00\x24\x00\x40\x66\xB8\x00\xE2\x66\xBA" \
-        "\x04\x00\x66\x4A\x78\x1B\xFB\x90\xFA\x66\xF7\x05\x04\x22\x00\xC0" \
-        "\x00\x80\x74\xF2\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x75\xF5\xEB" \
-        "\xE1\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39" \
-        "\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7" \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00" \
-        "\x00\x00\x00\x00\x66\xC7\x05\xE0\x0F\x09\x00\x01\x00\x66\x8B\x0D" \
-        "\x28\x24\x00\x00\x66\xD3\x2D\xE0\x0F\x09\x00\x66\x8B\x05\xE0\x0F" \
-        "\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x66\xC7\x05\x28" \
-        "\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00" \
-        "\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF" \
-        "\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00" \
-        "\x66\xC7\x05\x5C\x10\x09\x00\x07\x00\x66\x8B\x0D\x28\x24\x00\x00" \
-        "\x66\xD3\x2D\x5C\x10\x09\x00\x66\x8B\x05\x5C\x10\x09\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40" \
-        "\x88\x05\x24\x80\x04\x40\xEB\xAF\x66\xB8\x01\x00\x81\xE3\xFF\xFF" \
-        "\x00\x00\x66\xBB\x30\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89" \
-        "\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05" \
-        "\x14\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00" \
-        "\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0" \
-        "\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9" \
-        "\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x14\x47" \
-        "\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66" \
-        "\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2" \
-        "\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2" \
-        "\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC" \
-        "\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x82\x81" \
-        "\xE3\xFF\xFF\x00\x00\x66\xBB\x30\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-        "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-        "\x66\x03\x05\x14\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-        "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-        "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-        "\x05\x14\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7" \
-        "\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87" \
-        "\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00" \
-        "\x00\x00\x66\xC7\x05\x3E\x12\x09\x00\x02\x00\x66\x8B\x0D\x28\x24" \
-        "\x00\x00\x66\xD3\x2D\x3E\x12\x09\x00\x66\x8B\x05\x3E\x12\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80" \
-        "\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x04\x40" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7\x05\x28" \
-        "\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\xFF\xF0\xB8\x0E\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00" \
-        "\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF" \
-        "\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00" \
-        "\x66\xC7\x05\xCC\x12\x09\x00\xFF\x3F\x66\x8B\x0D\x28\x24\x00\x00" \
-        "\x66\xD3\x2D\xCC\x12\x09\x00\x66\x8B\x05\xCC\x12\x09\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40" \
-        "\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x04\x40\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7\x05\x28\x24\x00" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00" \
-        "\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28" \
-        "\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7" \
-        "\x05\x5A\x13\x09\x00\x09\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3" \
-        "\x2D\x5A\x13\x09\x00\x66\x8B\x05\x5A\x13\x09\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05" \
-        "\x24\x80\x04\x40\xEB\xAF\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66" \
-        "\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06" \
-        "\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB" \
-        "\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\xD6\x13\x09" \
-        "\x00\x08\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\xD6\x13\x09" \
-        "\x00\x66\x8B\x05\xD6\x13\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05" \
-        "\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40" \
-        "\xEB\xAF\x88\x05\x00\x24\x00\x40\x66\xB8\x00\xE2\x66\xBA\x04\x00" \
-        "\x66\x4A\x78\x1B\xFB\x90\xFA\x66\xF7\x05\x04\x22\x00\xC0\x00\x80" \
-        "\x74\xF2\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x75\xF5\xEB\xE1\x66" \
-        "\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04" \
-        "\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\xB9" \
-        "\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2" \
-        "\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-p919 = \
-        "\x66\x8B\x05\x1E\x00\x09\x00\x66\x81\xE0\xFF\xF3\x66\x89\x05\x12" \
-        "\x22\x00\xC0\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x30" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x14\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x14\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x66\xB8\x80\x0C\x66\x2D\x07\x00\x72\x1F" \
-        "\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D" \
-        "\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66" \
-        "\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05" \
-        "\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00" \
-        "\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40" \
-        "\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00" \
-        "\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB" \
-        "\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81" \
-        "\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81" \
-        "\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1" \
-        "\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00" \
-        "\x00\x40\x88\x05\x20\x84\x00\x40\x88\x05\x24\x84\x00\x40\x88\x05" \
-        "\x28\x84\x00\x40\x88\x05\x2C\x04\x10\x40\x88\x05\x30\x84\x00\x40" \
-        "\x88\x05\x34\x84\x00\x40\x88\x05\x38\x84\x00\x40\x88\x05\x3C\x04" \
-        "\x10\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C\x00" \
-        "\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52\x66" \
-        "\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66\x5A" \
-        "\x66\x81\xF8\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0\xFF" \
-        "\x66\x81\xC8\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66\xC7" \
-        "\x05\x50\x40\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66\xC7" \
-        "\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66\xC7" \
-        "\x05\x50\x40\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-        "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03" \
-        "\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x15" \
-        "\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D\x90" \
-        "\x40\x00\xC0\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-        "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-        "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66" \
-        "\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00\xC0" \
-        "\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66\x89" \
-        "\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00" \
-        "\x00\x00\x66\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00" \
-        "\xD0\x07\x72\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22\x00" \
-        "\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-        "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-        "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-        "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-        "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-        "\x40\x66\xB8\x00\x71\x66\xBA\x02\x00\x66\x4A\x78\x1B\xFB\x90\xFA" \
-        "\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05\x04\x22" \
-        "\x00\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9\x80\x7A" \
-        "\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39" \
-        "\x05\x04\x22\x00\xC0\x76\xF7\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25" \
-        "\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00" \
-        "\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-# my_fw.py
-p759 = \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00" \
-        "\x00\x00\x00\x00\x66\xC7\x05\xD0\x78\x09\x00\x00\x00\x66\x8B\x0D" \
-        "\x28\x24\x00\x00\x66\xD3\x2D\xD0\x78\x09\x00\x66\x8B\x05\xD0\x78" \
-        "\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80" \
-        "\x04\x40\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7" \
-        "\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x0E\x00\x00\x00\x59\x39\xC8\x0F\x87" \
-        "\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00" \
-        "\x00\x00\x66\xC7\x05\x5E\x79\x09\x00\x00\x00\x66\x8B\x0D\x28\x24" \
-        "\x00\x00\x66\xD3\x2D\x5E\x79\x09\x00\x66\x8B\x05\x5E\x79\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80" \
-        "\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x04\x40" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7\x05\x32" \
-        "\x24\x00\x00\x00\x00\x66\x8B\x05\x32\x24\x00\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\xFF\xF0\xB8\x04\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00" \
-        "\x00\x00\xE9\xC2\x01\x00\x00\x66\x8B\x05\x32\x24\x00\x00\x66\xFF" \
-        "\x05\x32\x24\x00\x00\xEB\xCE\x66\xC7\x05\x28\x24\x00\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8" \
-        "\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x52\x00" \
-        "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00" \
-        "\xEB\xCE\xE9\x05\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x28" \
-        "\x7A\x09\x00\x04\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x28" \
-        "\x7A\x09\x00\x66\x8B\x05\x28\x7A\x09\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80" \
-        "\x04\x40\xEB\xAE\x88\x05\x28\x80\x00\x40\x66\x8B\x1D\x32\x24\x00" \
-        "\x00\x81\xE3\xFF\xFF\x00\x00\xC1\xE3\x01\x53\x5B\x66\xC7\x83\x38" \
-        "\x24\x00\x00\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x10\x00" \
-        "\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x68\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE" \
-        "\x66\x8B\x1D\x32\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\xC1\xE3\x01" \
-        "\x53\x5B\x66\xC1\xAB\x38\x24\x00\x00\x01\x31\xC0\x66\x0B\x05\x28" \
-        "\x80\x00\x80\xB4\x00\x66\x3D\x00\x00\x0F\x84\x1B\x00\x00\x00\x66" \
-        "\x8B\x1D\x32\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\xC1\xE3\x01\x53" \
-        "\x5B\x66\x81\x8B\x38\x24\x00\x00\x00\x20\x88\x05\x24\x80\x06\x40" \
-        "\x88\x05\x24\x80\x04\x40\xEB\x98\x66\xC7\x05\x28\x24\x00\x00\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0" \
-        "\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00" \
-        "\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x58" \
-        "\x7B\x09\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x58" \
-        "\x7B\x09\x00\x66\x8B\x05\x58\x7B\x09\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80" \
-        "\x04\x40\xEB\xAF\xE9\x3E\xFE\xFF\xFF\x66\xC7\x05\x28\x24\x00\x00" \
-        "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF" \
-        "\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9" \
-        "\x52\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24" \
-        "\x00\x00\xEB\xCE\xE9\x05\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7" \
-        "\x05\xDA\x7B\x09\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3" \
-        "\x2D\xDA\x7B\x09\x00\x66\x8B\x05\xDA\x7B\x09\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05" \
-        "\x24\x80\x04\x40\xEB\xAE\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66" \
-        "\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06" \
-        "\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB" \
-        "\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x56\x7C\x09" \
-        "\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x56\x7C\x09" \
-        "\x00\x66\x8B\x05\x56\x7C\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05" \
-        "\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40" \
-        "\xEB\xAF\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59" \
-        "\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05" \
-        "\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00" \
-        "\x00\x00\x00\x00\x00\x00\x66\xC7\x05\xD2\x7C\x09\x00\x06\x00\x66" \
-        "\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\xD2\x7C\x09\x00\x66\x8B\x05" \
-        "\xD2\x7C\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x66\xC7" \
-        "\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87" \
-        "\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00" \
-        "\x00\x00\x66\xC7\x05\x4E\x7D\x09\x00\x04\x00\x66\x8B\x0D\x28\x24" \
-        "\x00\x00\x66\xD3\x2D\x4E\x7D\x09\x00\x66\x8B\x05\x4E\x7D\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80" \
-        "\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x00\x40" \
-        "\x66\xC7\xC7\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x10\x00" \
-        "\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x3C\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE" \
-        "\x66\xC1\xEF\x01\x31\xC0\x66\x0B\x05\x28\x80\x00\x80\xB4\x00\x66" \
-        "\x3D\x00\x00\x0F\x84\x05\x00\x00\x00\x66\x81\xCF\x00\x20\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xC4\xBB\x04\x00\x00" \
-        "\x00\xC1\xE3\x01\x53\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\x89" \
-        "\x3D\x0A\x7E\x09\x00\x66\x81\x25\x0A\x7E\x09\x00\x03\x00\x5B\x66" \
-        "\x8B\x05\x0A\x7E\x09\x00\x66\x89\x83\x38\x24\x00\x00\xBB\x05\x00" \
-        "\x00\x00\xC1\xE3\x01\x53\xE9\x05\x00\x00\x00\x90\x00\x00\x00\x00" \
-        "\x66\x89\x3D\x3C\x7E\x09\x00\x66\xC1\x2D\x3C\x7E\x09\x00\x02\xE9" \
-        "\x04\x00\x00\x00\x00\x00\x00\x00\x66\x8B\x05\x3C\x7E\x09\x00\x66" \
-        "\x89\x05\x54\x7E\x09\x00\x66\x81\x25\x54\x7E\x09\x00\x01\x00\x5B" \
-        "\x66\x8B\x05\x54\x7E\x09\x00\x66\x89\x83\x38\x24\x00\x00\xBB\x06" \
-        "\x00\x00\x00\xC1\xE3\x01\x53\xE9\x04\x00\x00\x00\x00\x00\x00\x00" \
-        "\x66\x89\x3D\x8C\x7E\x09\x00\x66\xC1\x2D\x8C\x7E\x09\x00\x03\xE9" \
-        "\x04\x00\x00\x00\x00\x00\x00\x00\x66\x8B\x05\x8C\x7E\x09\x00\x66" \
-        "\x89\x05\xA4\x7E\x09\x00\x66\x81\x25\xA4\x7E\x09\x00\x01\x00\x5B" \
-        "\x66\x8B\x05\xA4\x7E\x09\x00\x66\x89\x83\x38\x24\x00\x00\x66\xB9" \
-        "\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2" \
-        "\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-p591 = \
-        "\xE9\x55\x00\x00\x00\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xE9\x55\x00\x00\x00\x90" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\xE9\x25\x01\x00\x00\x90\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xE9\x03" \
-        "\x00\x00\x00\x90\x00\x00\xE9\x03\x00\x00\x00\x90\x00\x00\xE9\x03" \
-        "\x00\x00\x00\x90\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66" \
-        "\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x53\x5B\xFB\x66" \
-        "\x53\xFF\x15\xC4\x1E\x00\x00\x66\x5B\xFA\x88\x83\xB6\x41\x09\x00" \
-        "\x66\xFF\x05\x28\x24\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x54\x00\x00\x00\x59\x39\xC8\x77\xBF" \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00" \
-        "\x81\xE3\xFF\xFF\x00\x00\x53\x5B\xFB\x66\x53\xFF\x15\xC4\x1E\x00" \
-        "\x00\x66\x5B\xFA\x88\x83\x10\x42\x09\x00\x66\xFF\x05\x28\x24\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0" \
-        "\xB8\x54\x00\x00\x00\x59\x39\xC8\x77\xBF\x66\xC7\x05\x28\x24\x00" \
-        "\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00" \
-        "\x53\x5B\xFB\x66\x53\xFF\x15\xC4\x1E\x00\x00\x66\x5B\xFA\x88\x83" \
-        "\x6A\x42\x09\x00\x66\xFF\x05\x28\x24\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x12\x00\x00\x00\x59" \
-        "\x39\xC8\x77\xBF\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB" \
-        "\x18\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02" \
-        "\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00" \
-        "\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00" \
-        "\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02" \
-        "\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05" \
-        "\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40" \
-        "\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00" \
-        "\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09" \
-        "\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00" \
-        "\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9" \
-        "\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC" \
-        "\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-        "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00" \
-        "\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89" \
-        "\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81" \
-        "\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03" \
-        "\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x80\x01\x66\x2D" \
-        "\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90" \
-        "\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00" \
-        "\xC0\x76\xF7\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D\x28" \
-        "\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xB6\x41\x09\x00\xB4" \
-        "\x00\x66\x3D\x00\x00\x0F\x84\xF6\x02\x00\x00\x66\x8B\x1D\x28\x24" \
-        "\x00\x00\x81\xE3\xFF\xFF\x00\x00\xE9\x05\x00\x00\x00\x90\x00\x00" \
-        "\x00\x00\x8A\x83\xB6\x41\x09\x00\xB4\x00\x66\x89\x05\x4E\x46\x09" \
-        "\x00\x66\x81\x2D\x4E\x46\x09\x00\x01\x00\x66\x8B\x05\x4E\x46\x09" \
-        "\x00\x66\x89\x05\x94\x43\x09\x00\x66\xB8\x01\x14\x81\xE3\xFF\xFF" \
-        "\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D" \
-        "\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F" \
-        "\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F" \
-        "\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02" \
-        "\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22" \
-        "\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20" \
-        "\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04" \
-        "\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C" \
-        "\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14" \
-        "\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C" \
-        "\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24" \
-        "\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C" \
-        "\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34" \
-        "\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C" \
-        "\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44" \
-        "\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C" \
-        "\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54" \
-        "\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C" \
-        "\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64" \
-        "\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C" \
-        "\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74" \
-        "\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C" \
-        "\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84" \
-        "\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C" \
-        "\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94" \
-        "\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C" \
-        "\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4" \
-        "\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC" \
-        "\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4" \
-        "\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC" \
-        "\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D" \
-        "\x94\x43\x09\x00\xD1\xE3\x66\x8B\x9B\x87\x46\x09\x00\x66\xC7\x05" \
-        "\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00" \
-        "\x00\x00\xF0\xFF\x66\x81\xC0\x80\x01\x66\x89\x05\x90\x40\x00\xC0" \
-        "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-        "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00" \
-        "\x66\x81\xE8\x80\x01\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xE9\xEB\xFC\xFF" \
-        "\xFF\x66\xC7\x05\x9C\x43\x09\x00\x00\x00\x66\xC7\x05\x28\x24\x00" \
-        "\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00" \
-        "\x8A\x83\x6A\x42\x09\x00\xB4\x00\x66\x3D\x00\x00\x0F\x84\x72\x04" \
-        "\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\xE9" \
-        "\x04\x00\x00\x00\x00\x00\x00\x00\x8A\x83\x6A\x42\x09\x00\xB4\x00" \
-        "\x66\x89\x05\x74\x49\x09\x00\x66\x81\x2D\x74\x49\x09\x00\x01\x00" \
-        "\x66\x8B\x05\x74\x49\x09\x00\x66\x89\x05\x18\x24\x00\x00\xE9\x05" \
-        "\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\xA4\x49\x09\x00\x00" \
-        "\x00\x66\xC7\xC6\x80\x00\x66\xC7\xC7\x00\x00\x66\x89\x35\x24\x24" \
-        "\x00\x00\x66\x01\x3D\x24\x24\x00\x00\x66\x8B\x05\x24\x24\x00\x00" \
-        "\x66\x81\xF8\xFF\x00\x75\x06\x66\xB8\x00\x00\xEB\x09\x66\xC1\xE0" \
-        "\x08\x66\x81\xC8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00" \
-        "\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7" \
-        "\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89" \
-        "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-        "\x81\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22" \
-        "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-        "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-        "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-        "\x82\x00\x00\x00\x40\x31\xC0\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01" \
-        "\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00" \
-        "\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00" \
-        "\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00" \
-        "\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00" \
-        "\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00" \
-        "\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00" \
-        "\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01" \
-        "\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01" \
-        "\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01" \
-        "\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01" \
-        "\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01" \
-        "\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01" \
-        "\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01" \
-        "\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01" \
-        "\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01" \
-        "\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01" \
-        "\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01" \
-        "\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01" \
-        "\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01" \
-        "\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01" \
-        "\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01" \
-        "\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01" \
-        "\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01" \
-        "\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01" \
-        "\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01" \
-        "\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01" \
-        "\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01" \
-        "\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01" \
-        "\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01" \
-        "\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01" \
-        "\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D\x18\x24\x00\x00\xD1" \
-        "\xE3\x66\x8B\x9B\xA2\x4A\x09\x00\x66\x50\x81\xE3\xFF\x03\x00\x00" \
-        "\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1\xC1\xE1\x02\x03\xCA\x81" \
-        "\xC1\x0A\x00\x00\x00\xB8\x01\x00\x00\x00\xD3\xE0\x81\xE3\xFC\x03" \
-        "\x00\x00\x03\xD8\x66\x58\x81\xC3\x00\x00\x00\x80\x66\x0B\x03\x66" \
-        "\x50\x66\x8B\x05\x0E\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB" \
-        "\x0C\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02" \
-        "\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00" \
-        "\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00" \
-        "\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02" \
-        "\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05" \
-        "\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40" \
-        "\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00" \
-        "\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09" \
-        "\xCA\x88\x82\x00\x00\x00\x40\x66\x58\xB4\x00\x66\x3D\x00\x00\x0F" \
-        "\x84\x07\x00\x00\x00\x66\x8B\x3D\x24\x24\x00\x00\x66\xB9\x02\x00" \
-        "\x66\x8B\xC6\x66\xBA\x00\x00\x66\xF7\xF1\x66\x8B\xF0\x66\x8B\xC6" \
-        "\x66\x3D\x00\x00\x0F\x85\x01\xFC\xFF\xFF\x66\x01\x3D\x9C\x43\x09" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xE9" \
-        "\x6F\xFB\xFF\xFF\x66\x8B\x0D\x28\x24\x00\x00\x66\x8B\x05\x9C\x43" \
-        "\x09\x00\x66\xBA\x00\x00\x66\xF7\xF1\x66\x89\x05\x9C\x43\x09\x00" \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00" \
-        "\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xB6\x41\x09\x00\xB4\x00\x66\x3D" \
-        "\x00\x00\x0F\x84\xF5\x02\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81" \
-        "\xE3\xFF\xFF\x00\x00\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x8A\x83" \
-        "\xB6\x41\x09\x00\xB4\x00\x66\x89\x05\x2A\x4E\x09\x00\x66\x81\x2D" \
-        "\x2A\x4E\x09\x00\x01\x00\x66\x8B\x05\x2A\x4E\x09\x00\x66\x89\x05" \
-        "\x94\x43\x09\x00\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\xE9\xE0" \
-        "\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35" \
-        "\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37" \
-        "\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17" \
-        "\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A" \
-        "\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A" \
-        "\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28" \
-        "\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04\x01\x05\x01\x06" \
-        "\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E" \
-        "\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16" \
-        "\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E" \
-        "\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26" \
-        "\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E" \
-        "\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36" \
-        "\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E" \
-        "\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44\x01\x45\x01\x46" \
-        "\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E" \
-        "\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56" \
-        "\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E" \
-        "\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66" \
-        "\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E" \
-        "\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76" \
-        "\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E" \
-        "\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86" \
-        "\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E" \
-        "\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96" \
-        "\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E" \
-        "\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6" \
-        "\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE" \
-        "\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6" \
-        "\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE" \
-        "\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D\x94\x43\x09\x00" \
-        "\xD1\xE3\x66\x8B\x9B\x63\x4E\x09\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-        "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-        "\x66\x81\xC0\x80\x01\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-        "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-        "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89" \
-        "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x81\xE8\x80" \
-        "\x01\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89" \
-        "\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81" \
-        "\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03" \
-        "\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\x8B\x05\x28\x24\x00" \
-        "\x00\x66\xFF\x05\x28\x24\x00\x00\xE9\xEC\xFC\xFF\xFF\x66\xC7\x05" \
-        "\x28\x24\x00\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF" \
-        "\xFF\x00\x00\x8A\x83\x10\x42\x09\x00\xB4\x00\x66\x3D\x00\x00\x0F" \
-        "\x84\xF6\x02\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF" \
-        "\x00\x00\xE9\x05\x00\x00\x00\x90\x00\x00\x00\x00\x8A\x83\x10\x42" \
-        "\x09\x00\xB4\x00\x66\x89\x05\x48\x51\x09\x00\x66\x81\x2D\x48\x51" \
-        "\x09\x00\x01\x00\x66\x8B\x05\x48\x51\x09\x00\x66\x89\x05\x94\x43" \
-        "\x09\x00\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00" \
-        "\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00\x31" \
-        "\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00\x33" \
-        "\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00\x13" \
-        "\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E" \
-        "\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E" \
-        "\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00\x2C" \
-        "\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07" \
-        "\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F" \
-        "\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17" \
-        "\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F" \
-        "\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27" \
-        "\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F" \
-        "\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37" \
-        "\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F" \
-        "\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47" \
-        "\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F" \
-        "\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57" \
-        "\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F" \
-        "\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67" \
-        "\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F" \
-        "\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77" \
-        "\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F" \
-        "\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87" \
-        "\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F" \
-        "\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97" \
-        "\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F" \
-        "\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7" \
-        "\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF" \
-        "\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7" \
-        "\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF" \
-        "\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D\x94\x43\x09\x00\xD1\xE3" \
-        "\x66\x8B\x9B\x81\x51\x09\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-        "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x81" \
-        "\xC0\x80\x01\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-        "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x81\xE8\x80\x01\xC6" \
-        "\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50" \
-        "\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01" \
-        "\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00" \
-        "\x09\xCA\x88\x82\x00\x00\x00\x40\x66\x8B\x05\x28\x24\x00\x00\x66" \
-        "\xFF\x05\x28\x24\x00\x00\xE9\xEB\xFC\xFF\xFF\x66\xC7\x05\xA4\x43" \
-        "\x09\x00\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D" \
-        "\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\x6A\x42\x09\x00" \
-        "\xB4\x00\x66\x3D\x00\x00\x0F\x84\x72\x04\x00\x00\x66\x8B\x1D\x28" \
-        "\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\xE9\x04\x00\x00\x00\x00\x00" \
-        "\x00\x00\x8A\x83\x6A\x42\x09\x00\xB4\x00\x66\x89\x05\x6E\x54\x09" \
-        "\x00\x66\x81\x2D\x6E\x54\x09\x00\x01\x00\x66\x8B\x05\x6E\x54\x09" \
-        "\x00\x66\x89\x05\x18\x24\x00\x00\xE9\x05\x00\x00\x00\x90\x00\x00" \
-        "\x00\x00\x66\xC7\x05\x9E\x54\x09\x00\x00\x00\x66\xC7\xC6\x80\x00" \
-        "\x66\xC7\xC7\x00\x00\x66\x89\x35\x24\x24\x00\x00\x66\x01\x3D\x24" \
-        "\x24\x00\x00\x66\x8B\x05\x24\x24\x00\x00\x66\x81\xF8\xFF\x00\x75" \
-        "\x06\x66\xB8\x00\x00\xEB\x09\x66\xC1\xE0\x08\x66\x81\xC8\x01\x00" \
-        "\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00\x66\xC7\x05\x30\x40\x00" \
-        "\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0" \
-        "\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89" \
-        "\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05" \
-        "\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66" \
-        "\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00" \
-        "\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00" \
-        "\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00" \
-        "\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89" \
-        "\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x31" \
-        "\xC0\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00" \
-        "\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00" \
-        "\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00" \
-        "\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00" \
-        "\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00" \
-        "\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00" \
-        "\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01" \
-        "\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01" \
-        "\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01" \
-        "\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01" \
-        "\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01" \
-        "\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01" \
-        "\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01" \
-        "\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01" \
-        "\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01" \
-        "\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01" \
-        "\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01" \
-        "\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01" \
-        "\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01" \
-        "\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01" \
-        "\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01" \
-        "\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01" \
-        "\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01" \
-        "\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01" \
-        "\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01" \
-        "\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01" \
-        "\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01" \
-        "\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01" \
-        "\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01" \
-        "\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01" \
-        "\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF" \
-        "\x00\x00\x66\x8B\x1D\x18\x24\x00\x00\xD1\xE3\x66\x8B\x9B\x9C\x55" \
-        "\x09\x00\x66\x50\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00" \
-        "\x00\x00\x89\xD1\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8" \
-        "\x01\x00\x00\x00\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x66\x58" \
-        "\x81\xC3\x00\x00\x00\x80\x66\x0B\x03\x66\x50\x66\x8B\x05\x0E\x00" \
-        "\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00\x66\xC7\x05\x30" \
-        "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-        "\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89\x05\x90\x40\x00" \
-        "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-        "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00" \
-        "\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-        "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-        "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-        "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-        "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-        "\x40\x66\x58\xB4\x00\x66\x3D\x00\x00\x0F\x84\x07\x00\x00\x00\x66" \
-        "\x8B\x3D\x24\x24\x00\x00\x66\xB9\x02\x00\x66\x8B\xC6\x66\xBA\x00" \
-        "\x00\x66\xF7\xF1\x66\x8B\xF0\x66\x8B\xC6\x66\x3D\x00\x00\x0F\x85" \
-        "\x01\xFC\xFF\xFF\x66\x01\x3D\xA4\x43\x09\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xE9\x6F\xFB\xFF\xFF\x66\x8B" \
-        "\x0D\x28\x24\x00\x00\x66\x8B\x05\xA4\x43\x09\x00\x66\xBA\x00\x00" \
-        "\x66\xF7\xF1\x66\x89\x05\xA4\x43\x09\x00\x66\xC7\x05\x28\x24\x00" \
-        "\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00" \
-        "\x8A\x83\x10\x42\x09\x00\xB4\x00\x66\x3D\x00\x00\x0F\x84\xF5\x02" \
-        "\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\xE9" \
-        "\x04\x00\x00\x00\x00\x00\x00\x00\x8A\x83\x10\x42\x09\x00\xB4\x00" \
-        "\x66\x89\x05\x24\x59\x09\x00\x66\x81\x2D\x24\x59\x09\x00\x01\x00" \
-        "\x66\x8B\x05\x24\x59\x09\x00\x66\x89\x05\x94\x43\x09\x00\x66\xB8" \
-        "\x01\x00\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38" \
-        "\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A" \
-        "\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A" \
-        "\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07" \
-        "\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27" \
-        "\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25" \
-        "\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01" \
-        "\x01\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09" \
-        "\x01\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11" \
-        "\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19" \
-        "\x01\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21" \
-        "\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29" \
-        "\x01\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31" \
-        "\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39" \
-        "\x01\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41" \
-        "\x01\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49" \
-        "\x01\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51" \
-        "\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59" \
-        "\x01\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61" \
-        "\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69" \
-        "\x01\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71" \
-        "\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79" \
-        "\x01\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81" \
-        "\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89" \
-        "\x01\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91" \
-        "\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99" \
-        "\x01\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1" \
-        "\x01\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9" \
-        "\x01\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1" \
-        "\x01\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9" \
-        "\x01\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF" \
-        "\xFF\x00\x00\x66\x8B\x1D\x94\x43\x09\x00\xD1\xE3\x66\x8B\x9B\x5D" \
-        "\x59\x09\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1" \
-        "\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x81\xC0\x80\x01\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x81\xE8\x80\x01\xC6\x05\x14\x22\x00" \
-        "\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89" \
-        "\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89" \
-        "\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82" \
-        "\x00\x00\x00\x40\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24" \
-        "\x00\x00\xE9\xEC\xFC\xFF\xFF\x66\xB8\x01\x2D\x81\xE3\xFF\xFF\x00" \
-        "\x00\x66\xBB\x18\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9" \
-        "\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xE4" \
-        "\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-        "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xE4\x46\x00" \
-        "\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89" \
-        "\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81" \
-        "\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03" \
-        "\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\x8B\x05\x9C\x43\x09" \
-        "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xA4\x43\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x83\x1D\x00\x00\x00\x66" \
-        "\x50\xB0\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00" \
-        "\x66\x59\x66\x5B\xFA\x66\x58\xE9\x18\x00\x00\x00\x66\x50\xB0\x01" \
-        "\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66" \
-        "\x5B\xFA\x66\x58\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00" \
-        "\x00"
-
-p533 = \
-        "\xE9\x03\x00\x00\x00\x90\x00\x00\xE9\x03\x00\x00\x00\x90\x00\x00" \
-        "\xE9\x1F\x00\x00\x00\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\xE9\x1F\x00\x00\x00\x90\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\xE9\x1F\x00\x00\x00\x90\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xFB\x66\x53\xFF" \
-        "\x15\xC4\x1E\x00\x00\x66\x5B\xFA\xB4\x00\x66\x89\x05\xB6\x03\x09" \
-        "\x00\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\x8B\x05\xB6\x03\x09" \
-        "\x00\x66\x89\x05\x46\x04\x09\x00\x66\x81\x05\x46\x04\x09\x00\x07" \
-        "\x00\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\x8B\x05\x46\x04\x09" \
-        "\x00\x66\x89\x05\x66\x04\x09\x00\x66\xB9\x08\x00\x66\x8B\x05\x66" \
-        "\x04\x09\x00\x66\xBA\x00\x00\x66\xF7\xF1\x66\x89\x05\x66\x04\x09" \
-        "\x00\x66\x8B\x05\x66\x04\x09\x00\x66\x89\x05\xBE\x03\x09\x00\x66" \
-        "\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81" \
-        "\xE3\xFF\xFF\x00\x00\x53\x5B\xFB\x66\x53\xFF\x15\xC4\x1E\x00\x00" \
-        "\x66\x5B\xFA\x88\x83\xC6\x03\x09\x00\x66\xFF\x05\x28\x24\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66" \
-        "\x8B\x05\xBE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x77" \
-        "\xB7\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D\x28\x24\x00" \
-        "\x00\x81\xE3\xFF\xFF\x00\x00\x53\x5B\xFB\x66\x53\xFF\x15\xC4\x1E" \
-        "\x00\x00\x66\x5B\xFA\x88\x83\xEA\x03\x09\x00\x66\xFF\x05\x28\x24" \
-        "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF" \
-        "\xF0\x66\x8B\x05\xBE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59\x39" \
-        "\xC8\x77\xB7\xE9\xCD\x00\x00\x00\x55\x8B\xEC\x81\xEC\x00\x00\x00" \
-        "\x00\x66\x50\xB0\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x40\x11" \
-        "\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x8B\x9D\x08\x00\x00\x00\x66" \
-        "\x50\x8A\x83\x00\x00\x00\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15" \
-        "\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x8B\x85\x08\x00\x00" \
-        "\x00\xFF\x85\x08\x00\x00\x00\x8B\xD8\x8A\x83\x00\x00\x00\x00\xB4" \
-        "\x00\x66\x3D\x00\x00\x75\xC2\xBB\x00\x00\x00\x00\xC1\xE3\x02\x53" \
-        "\x5B\xC7\x83\x74\x46\x00\x00\x0E\x00\x00\x00\xBB\x01\x00\x00\x00" \
-        "\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xBB" \
-        "\x02\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00" \
-        "\x00\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74" \
-        "\x46\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02\x53" \
-        "\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11\x00" \
-        "\x00\x8B\xE5\x5D\xC3\xE9\x95\x11\x00\x00\x55\x8B\xEC\x81\xEC\x5B" \
-        "\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x85\x09\x00\x00" \
-        "\x00\xB8\x00\x00\x00\x00\x8B\xE5\x5D\xC3\xE9\x01\x04\x00\x00\x90" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xE9\x0B\x00\x00\x00\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xB8\x40\x06\x09\x00\x89\x85\xFC\xFF\xFF\xFF\x66\xC7\x85\xF1\xFF" \
-        "\xFF\xFF\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00" \
-        "\xB4\x00\x66\x3D\x00\x00\x0F\x84\xF0\x0C\x00\x00\x8B\x9D\x08\x00" \
-        "\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0" \
-        "\xB8\x25\x00\x00\x00\x59\x39\xC8\x0F\x85\x9F\x0C\x00\x00\x8B\x85" \
-        "\x08\x00\x00\x00\xFF\x85\x08\x00\x00\x00\x66\xC7\x85\xED\xFF\xFF" \
-        "\xFF\x00\x00\x66\x8B\x85\xED\xFF\xFF\xFF\x66\x89\x85\xEF\xFF\xFF" \
-        "\xFF\x66\x8B\x85\xEF\xFF\xFF\xFF\x88\x85\xF3\xFF\xFF\xFF\x8A\x85" \
-        "\xF3\xFF\xFF\xFF\x88\x85\xF4\xFF\xFF\xFF\x8A\x85\xF4\xFF\xFF\xFF" \
-        "\x88\x85\xF5\xFF\xFF\xFF\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00" \
-        "\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x30\x00\x00\x00\x59" \
-        "\x39\xC8\x0F\x85\x15\x00\x00\x00\x66\xC7\x85\xEF\xFF\xFF\xFF\x01" \
-        "\x00\x8B\x85\x08\x00\x00\x00\xFF\x85\x08\x00\x00\x00\x8B\x9D\x08" \
-        "\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF" \
-        "\xF0\xB8\x30\x00\x00\x00\x59\x39\xC8\x0F\x87\x2F\x00\x00\x00\x8B" \
-        "\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00" \
-        "\x00\xFF\xF0\xB8\x39\x00\x00\x00\x59\x39\xC8\x0F\x82\x0D\x00\x00" \
-        "\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\xE9\x08\x00\x00\x00\x66\xB8" \
-        "\x00\x00\x66\x3D\x00\x00\x0F\x84\x46\x00\x00\x00\xB0\x0A\xF6\xA5" \
-        "\xF4\xFF\xFF\xFF\x88\x85\xF4\xFF\xFF\xFF\x8B\x85\x08\x00\x00\x00" \
-        "\xFF\x85\x08\x00\x00\x00\x8B\xD8\x8A\x83\x00\x00\x00\x00\xB4\x00" \
-        "\x66\x89\x85\xE5\xFF\xFF\xFF\x66\x81\xAD\xE5\xFF\xFF\xFF\x30\x00" \
-        "\x66\x8B\x85\xE5\xFF\xFF\xFF\x00\x85\xF4\xFF\xFF\xFF\xE9\x5B\xFF" \
-        "\xFF\xFF\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0" \
-        "\xFF\x00\x00\x00\xFF\xF0\xB8\x2E\x00\x00\x00\x59\x39\xC8\x0F\x85" \
-        "\xB6\x00\x00\x00\x8B\x85\x08\x00\x00\x00\xFF\x85\x08\x00\x00\x00" \
-        "\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00" \
-        "\x00\x00\xFF\xF0\xB8\x30\x00\x00\x00\x59\x39\xC8\x0F\x87\x2F\x00" \
-        "\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0" \
-        "\xFF\x00\x00\x00\xFF\xF0\xB8\x39\x00\x00\x00\x59\x39\xC8\x0F\x82" \
-        "\x0D\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\xE9\x08\x00\x00" \
-        "\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\x0F\x84\x46\x00\x00\x00\xB0" \
-        "\x0A\xF6\xA5\xF3\xFF\xFF\xFF\x88\x85\xF3\xFF\xFF\xFF\x8B\x85\x08" \
-        "\x00\x00\x00\xFF\x85\x08\x00\x00\x00\x8B\xD8\x8A\x83\x00\x00\x00" \
-        "\x00\xB4\x00\x66\x89\x85\xE1\xFF\xFF\xFF\x66\x81\xAD\xE1\xFF\xFF" \
-        "\xFF\x30\x00\x66\x8B\x85\xE1\xFF\xFF\xFF\x00\x85\xF3\xFF\xFF\xFF" \
-        "\xE9\x5B\xFF\xFF\xFF\xE9\x29\x00\x00\x00\x8B\x9D\x08\x00\x00\x00" \
-        "\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x76" \
-        "\x00\x00\x00\x59\x39\xC8\x0F\x85\x07\x00\x00\x00\xC6\x85\xF3\xFF" \
-        "\xFF\xFF\x02\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81" \
-        "\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x75\x00\x00\x00\x59\x39\xC8\x0F" \
-        "\x84\x2F\x00\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00" \
-        "\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x64\x00\x00\x00\x59\x39" \
-        "\xC8\x0F\x84\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9" \
-        "\x08\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x85\x2F\x00" \
-        "\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0" \
-        "\xFF\x00\x00\x00\xFF\xF0\xB8\x69\x00\x00\x00\x59\x39\xC8\x0F\x84" \
-        "\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9\x08\x00\x00" \
-        "\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x84\x0C\x00\x00\x00\xC6" \
-        "\x85\xF5\xFF\xFF\xFF\x0A\xE9\x06\x02\x00\x00\x8B\x9D\x08\x00\x00" \
-        "\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8" \
-        "\x6F\x00\x00\x00\x59\x39\xC8\x0F\x85\x0C\x00\x00\x00\xC6\x85\xF5" \
-        "\xFF\xFF\xFF\x08\xE9\xD8\x01\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A" \
-        "\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x78\x00" \
-        "\x00\x00\x59\x39\xC8\x0F\x85\x0C\x00\x00\x00\xC6\x85\xF5\xFF\xFF" \
-        "\xFF\x03\xE9\xAA\x01\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00" \
-        "\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x58\x00\x00\x00" \
-        "\x59\x39\xC8\x0F\x85\x0C\x00\x00\x00\xC6\x85\xF5\xFF\xFF\xFF\x04" \
-        "\xE9\x7C\x01\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00" \
-        "\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x76\x00\x00\x00\x59\x39" \
-        "\xC8\x0F\x85\x0C\x00\x00\x00\xC6\x85\xF5\xFF\xFF\xFF\x05\xE9\x4E" \
-        "\x01\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81" \
-        "\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x73\x00\x00\x00\x59\x39\xC8\x0F" \
-        "\x85\x77\x00\x00\x00\x66\x8B\x85\xF1\xFF\xFF\xFF\x66\xFF\x85\xF1" \
-        "\xFF\xFF\xFF\x66\x8B\xD8\x81\xE3\xFF\xFF\x00\x00\x81\xC3\x03\x00" \
-        "\x00\x00\xC1\xE3\x02\x03\xDD\x8B\x83\x00\x00\x00\x00\x89\x85\xF8" \
-        "\xFF\xFF\xFF\x8B\x9D\xF8\xFF\xFF\xFF\x8A\x83\x00\x00\x00\x00\xB4" \
-        "\x00\x66\x3D\x00\x00\x0F\x84\x2C\x00\x00\x00\x8B\x85\xFC\xFF\xFF" \
-        "\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\x8B\x85\xF8\xFF\xFF\xFF" \
-        "\xFF\x85\xF8\xFF\xFF\xFF\x8B\xD8\x8A\x83\x00\x00\x00\x00\x5B\x88" \
-        "\x83\x00\x00\x00\x00\xEB\xBC\xE9\xB5\x00\x00\x00\x8B\x9D\x08\x00" \
-        "\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0" \
-        "\xB8\x63\x00\x00\x00\x59\x39\xC8\x0F\x85\x43\x00\x00\x00\x8B\x85" \
-        "\xFC\xFF\xFF\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\x66\x8B\x85" \
-        "\xF1\xFF\xFF\xFF\x66\xFF\x85\xF1\xFF\xFF\xFF\x66\x8B\xD8\x81\xE3" \
-        "\xFF\xFF\x00\x00\x81\xC3\x03\x00\x00\x00\xC1\xE3\x02\x03\xDD\x8B" \
-        "\x83\x00\x00\x00\x00\x5B\x88\x83\x00\x00\x00\x00\xE9\x50\x00\x00" \
-        "\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF" \
-        "\x00\x00\x00\xFF\xF0\xB8\x25\x00\x00\x00\x59\x39\xC8\x0F\x85\x2E" \
-        "\x00\x00\x00\x8B\x85\xFC\xFF\xFF\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B" \
-        "\xD8\x53\x5B\xC6\x83\x00\x00\x00\x00\x25\x8B\x85\xFC\xFF\xFF\xFF" \
-        "\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\x5B\xC6\x83\x00\x00\x00\x00" \
-        "\x25\x8A\x85\xF5\xFF\xFF\xFF\xB4\x00\x66\x3D\x00\x00\x0F\x84\xA9" \
-        "\x07\x00\x00\x66\x8B\x85\xF1\xFF\xFF\xFF\x66\xFF\x85\xF1\xFF\xFF" \
-        "\xFF\x66\x8B\xD8\x81\xE3\xFF\xFF\x00\x00\x81\xC3\x03\x00\x00\x00" \
-        "\xC1\xE3\x02\x03\xDD\x8B\x83\x00\x00\x00\x00\x89\x85\xE9\xFF\xFF" \
-        "\xFF\xC6\x85\xF7\xFF\xFF\xFF\x00\x8A\x85\xF5\xFF\xFF\xFF\x81\xE0" \
-        "\xFF\x00\x00\x00\xFF\xF0\xB8\x05\x00\x00\x00\x59\x39\xC8\x0F\x85" \
-        "\x11\x03\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\xB4\x00\x66\x89\x85\xDD" \
-        "\xFF\xFF\xFF\x66\x81\x85\xDD\xFF\xFF\xFF\x02\x00\x66\x8B\x85\xDD" \
-        "\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x8A\x85\xF3\xFF\xFF" \
-        "\xFF\x81\xE0\xFF\x00\x00\x00\x59\x39\xC8\x0F\x86\x1F\x00\x00\x00" \
-        "\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81\xE3" \
-        "\xFF\x00\x00\x00\x53\x5B\xC6\x83\x46\x0A\x09\x00\x30\xEB\xA5\xC6" \
-        "\x85\xF5\xFF\xFF\xFF\x0A\x8B\x85\xE9\xFF\xFF\xFF\x89\x85\xD9\xFF" \
-        "\xFF\xFF\xC1\xAD\xD9\xFF\xFF\xFF\x04\x8B\x85\xD9\xFF\xFF\xFF\x89" \
-        "\x85\xD5\xFF\xFF\xFF\xB8\x05\x00\x00\x00\xF7\xA5\xD5\xFF\xFF\xFF" \
-        "\x89\x85\xD5\xFF\xFF\xFF\x8B\x85\xD5\xFF\xFF\xFF\x89\x85\xD1\xFF" \
-        "\xFF\xFF\x81\x85\xD1\xFF\xFF\xFF\x04\x00\x00\x00\x8B\x85\xD1\xFF" \
-        "\xFF\xFF\x89\x85\xCD\xFF\xFF\xFF\xB9\x08\x00\x00\x00\x8B\x85\xCD" \
-        "\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7\xF1\x89\x85\xCD\xFF\xFF\xFF" \
-        "\x8B\x85\xCD\xFF\xFF\xFF\x89\x85\xE9\xFF\xFF\xFF\x8A\x85\xF3\xFF" \
-        "\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x02\x00\x00\x00\x59" \
-        "\x39\xC8\x0F\x86\xBF\x00\x00\x00\x8A\x85\xF3\xFF\xFF\xFF\xB4\x00" \
-        "\x66\x3D\x00\x00\x0F\x85\x1F\x00\x00\x00\x8A\x8D\xF5\xFF\xFF\xFF" \
-        "\x81\xE1\xFF\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00" \
-        "\x00\xF7\xF1\x89\x85\xE9\xFF\xFF\xFF\x8B\x85\xE9\xFF\xFF\xFF\x89" \
-        "\x85\xC9\xFF\xFF\xFF\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1\xFF\x00\x00" \
-        "\x00\x8B\x85\xC9\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7\xF1\x89\x95" \
-        "\xC9\xFF\xFF\xFF\xFF\xB5\xC9\xFF\xFF\xFF\xB8\x05\x00\x00\x00\x59" \
-        "\x39\xC8\x0F\x87\x30\x00\x00\x00\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1" \
-        "\xFF\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7" \
-        "\xF1\x89\x85\xE9\xFF\xFF\xFF\x8B\x85\xE9\xFF\xFF\xFF\xFF\x85\xE9" \
-        "\xFF\xFF\xFF\xE9\x1F\x00\x00\x00\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1" \
-        "\xFF\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7" \
-        "\xF1\x89\x85\xE9\xFF\xFF\xFF\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7" \
-        "\xFF\xFF\xFF\x8A\xD8\x81\xE3\xFF\x00\x00\x00\x53\x8B\x85\xE9\xFF" \
-        "\xFF\xFF\x89\x85\xC5\xFF\xFF\xFF\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1" \
-        "\xFF\x00\x00\x00\x8B\x85\xC5\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7" \
-        "\xF1\x89\x95\xC5\xFF\xFF\xFF\x8B\x85\xC5\xFF\xFF\xFF\x89\x85\xC1" \
-        "\xFF\xFF\xFF\x81\x85\xC1\xFF\xFF\xFF\x30\x00\x00\x00\x5B\x8B\x85" \
-        "\xC1\xFF\xFF\xFF\x88\x83\x46\x0A\x09\x00\x8A\x85\xF7\xFF\xFF\xFF" \
-        "\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF3\xFF\xFF\xFF\x81\xE0" \
-        "\xFF\x00\x00\x00\x59\x39\xC8\x0F\x85\x1D\x00\x00\x00\x8A\x85\xF7" \
-        "\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81\xE3\xFF\x00\x00" \
-        "\x00\x53\x5B\xC6\x83\x46\x0A\x09\x00\x2E\x8A\x8D\xF5\xFF\xFF\xFF" \
-        "\x81\xE1\xFF\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00" \
-        "\x00\xF7\xF1\x89\x85\xE9\xFF\xFF\xFF\x8B\x85\xE9\xFF\xFF\xFF\x3D" \
-        "\x00\x00\x00\x00\x0F\x85\x2D\xFF\xFF\xFF\x8A\x85\xF7\xFF\xFF\xFF" \
-        "\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF3\xFF\xFF\xFF\xB4\x00" \
-        "\x66\x89\x85\xBD\xFF\xFF\xFF\x66\x81\x85\xBD\xFF\xFF\xFF\x01\x00" \
-        "\x66\x8B\x85\xBD\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8" \
-        "\x0F\x85\x1F\x00\x00\x00\x8A\x85\xF3\xFF\xFF\xFF\xB4\x00\x66\x3D" \
-        "\x00\x00\x0F\x84\x0D\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00" \
-        "\xE9\x08\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\x0F\x84\x1D" \
-        "\x00\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A" \
-        "\xD8\x81\xE3\xFF\x00\x00\x00\x53\x5B\xC6\x83\x46\x0A\x09\x00\x30" \
-        "\xE9\x1D\x03\x00\x00\x8A\x85\xF5\xFF\xFF\xFF\x81\xE0\xFF\x00\x00" \
-        "\x00\xFF\xF0\xB8\x03\x00\x00\x00\x59\x39\xC8\x0F\x84\x29\x00\x00" \
-        "\x00\x8A\x85\xF5\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8" \
-        "\x04\x00\x00\x00\x59\x39\xC8\x0F\x84\x0D\x00\x00\x00\x66\xB8\x00" \
-        "\x00\x66\x3D\x00\x00\xE9\x08\x00\x00\x00\x66\xB8\x01\x00\x66\x3D" \
-        "\x00\x00\x0F\x84\xF6\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\x89\x85" \
-        "\xB9\xFF\xFF\xFF\x81\xA5\xB9\xFF\xFF\xFF\x0F\x00\x00\x00\x8B\x85" \
-        "\xB9\xFF\xFF\xFF\x88\x85\xF6\xFF\xFF\xFF\x8A\x85\xF6\xFF\xFF\xFF" \
-        "\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x0A\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x86\x0C\x00\x00\x00\x80\x85\xF6\xFF\xFF\xFF\x30\xE9\x2F\x00" \
-        "\x00\x00\x8A\x85\xF5\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0" \
-        "\xB8\x03\x00\x00\x00\x59\x39\xC8\x0F\x85\x0C\x00\x00\x00\x80\x85" \
-        "\xF6\xFF\xFF\xFF\x57\xE9\x07\x00\x00\x00\x80\x85\xF6\xFF\xFF\xFF" \
-        "\x37\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81" \
-        "\xE3\xFF\x00\x00\x00\x53\x5B\x8A\x85\xF6\xFF\xFF\xFF\x88\x83\x46" \
-        "\x0A\x09\x00\xC1\xAD\xE9\xFF\xFF\xFF\x04\x8B\x85\xE9\xFF\xFF\xFF" \
-        "\x3D\x00\x00\x00\x00\x0F\x85\x30\x00\x00\x00\x8A\x85\xF7\xFF\xFF" \
-        "\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF3\xFF\xFF\xFF\x81" \
-        "\xE0\xFF\x00\x00\x00\x59\x39\xC8\x0F\x87\x0D\x00\x00\x00\x66\xB8" \
-        "\x00\x00\x66\x3D\x00\x00\xE9\x08\x00\x00\x00\x66\xB8\x01\x00\x66" \
-        "\x3D\x00\x00\x0F\x85\x0F\xFF\xFF\xFF\xE9\xD4\x01\x00\x00\x8A\x85" \
-        "\xF5\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x0A\x00\x00" \
-        "\x00\x59\x39\xC8\x0F\x84\x29\x00\x00\x00\x8A\x85\xF5\xFF\xFF\xFF" \
-        "\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x08\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x84\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9\x08" \
-        "\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x84\x81\x01\x00" \
-        "\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81\xE0\xFF" \
-        "\x00\x00\x00\xFF\xF0\xB8\x64\x00\x00\x00\x59\x39\xC8\x0F\x84\x2F" \
-        "\x00\x00\x00\x8B\x9D\x08\x00\x00\x00\x8A\x83\x00\x00\x00\x00\x81" \
-        "\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x69\x00\x00\x00\x59\x39\xC8\x0F" \
-        "\x84\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9\x08\x00" \
-        "\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x84\x51\x00\x00\x00" \
-        "\x8B\x85\xE9\xFF\xFF\xFF\x89\x85\xB5\xFF\xFF\xFF\xC1\xAD\xB5\xFF" \
-        "\xFF\xFF\x1F\x8B\x85\xB5\xFF\xFF\xFF\x3D\x00\x00\x00\x00\x0F\x84" \
-        "\x2D\x00\x00\x00\x8B\x85\xE9\xFF\xFF\xFF\xF7\xD0\x89\x85\xB1\xFF" \
-        "\xFF\xFF\x81\x85\xB1\xFF\xFF\xFF\x01\x00\x00\x00\x8B\x85\xB1\xFF" \
-        "\xFF\xFF\x89\x85\xE9\xFF\xFF\xFF\x66\xC7\x85\xED\xFF\xFF\xFF\x01" \
-        "\x00\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81" \
-        "\xE3\xFF\x00\x00\x00\x53\x8B\x85\xE9\xFF\xFF\xFF\x89\x85\xAD\xFF" \
-        "\xFF\xFF\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1\xFF\x00\x00\x00\x8B\x85" \
-        "\xAD\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7\xF1\x89\x95\xAD\xFF\xFF" \
-        "\xFF\x8B\x85\xAD\xFF\xFF\xFF\x89\x85\xA9\xFF\xFF\xFF\x81\x85\xA9" \
-        "\xFF\xFF\xFF\x30\x00\x00\x00\x5B\x8B\x85\xA9\xFF\xFF\xFF\x88\x83" \
-        "\x46\x0A\x09\x00\x8A\x8D\xF5\xFF\xFF\xFF\x81\xE1\xFF\x00\x00\x00" \
-        "\x8B\x85\xE9\xFF\xFF\xFF\xBA\x00\x00\x00\x00\xF7\xF1\x89\x85\xE9" \
-        "\xFF\xFF\xFF\x8B\x85\xE9\xFF\xFF\xFF\x3D\x00\x00\x00\x00\x0F\x85" \
-        "\x30\x00\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00" \
-        "\xFF\xF0\x8A\x85\xF3\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\x59\x39" \
-        "\xC8\x0F\x87\x0D\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00\xE9" \
-        "\x08\x00\x00\x00\x66\xB8\x01\x00\x66\x3D\x00\x00\x0F\x85\x2F\xFF" \
-        "\xFF\xFF\x66\x8B\x85\xEF\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\xFF" \
-        "\xF0\xB8\x01\x00\x00\x00\x59\x39\xC8\x0F\x85\x42\x00\x00\x00\x8A" \
-        "\x85\xF7\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF4" \
-        "\xFF\xFF\xFF\x81\xE0\xFF\x00\x00\x00\x59\x39\xC8\x0F\x86\x1F\x00" \
-        "\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8" \
-        "\x81\xE3\xFF\x00\x00\x00\x53\x5B\xC6\x83\x46\x0A\x09\x00\x30\xEB" \
-        "\xBE\x66\x8B\x85\xED\xFF\xFF\xFF\x66\x3D\x00\x00\x0F\x84\x1D\x00" \
-        "\x00\x00\x8A\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8" \
-        "\x81\xE3\xFF\x00\x00\x00\x53\x5B\xC6\x83\x46\x0A\x09\x00\x2D\x66" \
-        "\x8B\x85\xEF\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x01" \
-        "\x00\x00\x00\x59\x39\xC8\x0F\x84\x42\x00\x00\x00\x8A\x85\xF7\xFF" \
-        "\xFF\xFF\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x8A\x85\xF4\xFF\xFF\xFF" \
-        "\x81\xE0\xFF\x00\x00\x00\x59\x39\xC8\x0F\x86\x1F\x00\x00\x00\x8A" \
-        "\x85\xF7\xFF\xFF\xFF\xFE\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81\xE3\xFF" \
-        "\x00\x00\x00\x53\x5B\xC6\x83\x46\x0A\x09\x00\x20\xEB\xBE\x8B\x85" \
-        "\xFC\xFF\xFF\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\xFE\x8D\xF7" \
-        "\xFF\xFF\xFF\x8A\x85\xF7\xFF\xFF\xFF\x8A\xD8\x81\xE3\xFF\x00\x00" \
-        "\x00\x8A\x83\x46\x0A\x09\x00\x5B\x88\x83\x00\x00\x00\x00\x8A\x85" \
-        "\xF7\xFF\xFF\xFF\xB4\x00\x66\x3D\x00\x00\x75\xC2\x8B\x85\x08\x00" \
-        "\x00\x00\xFF\x85\x08\x00\x00\x00\xE9\x2A\x00\x00\x00\x8B\x85\xFC" \
-        "\xFF\xFF\xFF\xFF\x85\xFC\xFF\xFF\xFF\x8B\xD8\x53\x8B\x85\x08\x00" \
-        "\x00\x00\xFF\x85\x08\x00\x00\x00\x8B\xD8\x8A\x83\x00\x00\x00\x00" \
-        "\x5B\x88\x83\x00\x00\x00\x00\xE9\xF8\xF2\xFF\xFF\x8B\x9D\xFC\xFF" \
-        "\xFF\xFF\x53\x5B\xC6\x83\x00\x00\x00\x00\x00\x68\x40\x06\x09\x00" \
-        "\xE8\xC3\xED\xFF\xFF\x81\xC4\x04\x00\x00\x00\x8B\x85\xFC\xFF\xFF" \
-        "\xFF\x89\x85\xA5\xFF\xFF\xFF\x81\xAD\xA5\xFF\xFF\xFF\x40\x06\x09" \
-        "\x00\x8B\x85\xA5\xFF\xFF\xFF\x8B\xE5\x5D\xC3\x8B\xE5\x5D\xC3\xE9" \
-        "\xE1\x25\x00\x00\x55\x8B\xEC\x81\xEC\x26\x00\x00\x00\x66\x8B\x85" \
-        "\x08\x00\x00\x00\x66\x3D\x00\x00\x0F\x84\xB3\x00\x00\x00\x66\xB8" \
-        "\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30" \
-        "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-        "\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00" \
-        "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-        "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00" \
-        "\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-        "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-        "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-        "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-        "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-        "\x40\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-        "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x1E\x00\x00\x00\x59\x39" \
-        "\xC8\x0F\x87\x15\x00\x00\x00\xE9\x28\x00\x00\x00\x66\x8B\x05\x28" \
-        "\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\x66\x8B\x1D\x28" \
-        "\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x53\x5B\xC6\x83\x0E\x04\x09" \
-        "\x00\x00\xEB\xD8\x66\xC7\x85\xFE\xFF\xFF\xFF\x00\x00\x66\xB8\x01" \
-        "\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40" \
-        "\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00" \
-        "\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0" \
-        "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-        "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00" \
-        "\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB" \
-        "\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07" \
-        "\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03" \
-        "\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A" \
-        "\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40" \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xB6\x03\x09\x00\x81" \
-        "\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x48" \
-        "\x02\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00" \
-        "\x00\xEB\xC6\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00" \
-        "\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00" \
-        "\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00" \
-        "\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00" \
-        "\x07\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00" \
-        "\x27\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00" \
-        "\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01" \
-        "\x01\x01\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01" \
-        "\x09\x01\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01" \
-        "\x11\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01" \
-        "\x19\x01\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01" \
-        "\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01" \
-        "\x29\x01\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01" \
-        "\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01" \
-        "\x39\x01\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01" \
-        "\x41\x01\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01" \
-        "\x49\x01\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01" \
-        "\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01" \
-        "\x59\x01\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01" \
-        "\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01" \
-        "\x69\x01\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01" \
-        "\x71\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01" \
-        "\x79\x01\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01" \
-        "\x81\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01" \
-        "\x89\x01\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01" \
-        "\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01" \
-        "\x99\x01\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01" \
-        "\xA1\x01\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01" \
-        "\xA9\x01\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01" \
-        "\xB1\x01\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01" \
-        "\xB9\x01\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3" \
-        "\xFF\xFF\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B" \
-        "\xDE\x19\x09\x00\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00" \
-        "\x00\x00\x89\xD1\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8" \
-        "\x0D\x00\x00\x00\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3" \
-        "\x00\x00\x00\x40\x88\x03\xE9\xB8\xFD\xFF\xFF\x66\xB8\x01\x04\x81" \
-        "\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-        "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-        "\x66\x03\x05\xCC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-        "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-        "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-        "\x05\xCC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-        "\x01\x04\x66\x89\x05\x0E\x00\x09\x00\x66\xB8\x01\x00\x81\xE3\xFF" \
-        "\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-        "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03" \
-        "\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-        "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-        "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89" \
-        "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC" \
-        "\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00" \
-        "\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03" \
-        "\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1" \
-        "\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7\x05\x28" \
-        "\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\xFF\xF0\x66\x8B\x05\xB6\x03\x09\x00\x81\xE0\xFF\xFF\x00" \
-        "\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x8E\x07\x00\x00\x66" \
-        "\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6\x81" \
-        "\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00" \
-        "\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00" \
-        "\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00" \
-        "\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00" \
-        "\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00" \
-        "\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00" \
-        "\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01" \
-        "\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01" \
-        "\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01" \
-        "\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01" \
-        "\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01" \
-        "\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01" \
-        "\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01" \
-        "\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01" \
-        "\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01" \
-        "\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01" \
-        "\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01" \
-        "\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01" \
-        "\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01" \
-        "\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01" \
-        "\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01" \
-        "\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01" \
-        "\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01" \
-        "\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01" \
-        "\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01" \
-        "\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01" \
-        "\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01" \
-        "\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01" \
-        "\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01" \
-        "\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01" \
-        "\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00" \
-        "\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\xCA\x1D\x09\x00" \
-        "\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1" \
-        "\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00\x00\x00" \
-        "\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40" \
-        "\x88\x03\x66\xB8\x40\x06\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66" \
-        "\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0" \
-        "\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x81\xE3\xFF" \
-        "\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00" \
-        "\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00" \
-        "\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00" \
-        "\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00" \
-        "\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00" \
-        "\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00" \
-        "\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01" \
-        "\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01" \
-        "\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01" \
-        "\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01" \
-        "\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01" \
-        "\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01" \
-        "\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01" \
-        "\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01" \
-        "\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01" \
-        "\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01" \
-        "\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01" \
-        "\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01" \
-        "\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01" \
-        "\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01" \
-        "\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01" \
-        "\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01" \
-        "\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01" \
-        "\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01" \
-        "\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01" \
-        "\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01" \
-        "\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01" \
-        "\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01" \
-        "\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01" \
-        "\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01" \
-        "\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B" \
-        "\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\x28\x20\x09\x00\x66\x50" \
-        "\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1" \
-        "\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00\x00\x00" \
-        "\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x66\x58\x81\xC3\x00\x00" \
-        "\x00\x80\x66\x0B\x03\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x01\x00" \
-        "\x00\x00\x59\x39\xC8\x0F\x85\x71\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\x89\x85\xFA\xFF\xFF\xFF\x66\xB9\x08\x00\x66\x8B\x85" \
-        "\xFA\xFF\xFF\xFF\x66\xBA\x00\x00\x66\xF7\xF1\x66\x89\x85\xFA\xFF" \
-        "\xFF\xFF\x66\x8B\x9D\xFA\xFF\xFF\xFF\x81\xE3\xFF\xFF\x00\x00\x53" \
-        "\x66\xC7\x85\xF6\xFF\xFF\xFF\x01\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x66\x89\x85\xF2\xFF\xFF\xFF\x66\x81\xA5\xF2\xFF\xFF\xFF\x07\x00" \
-        "\x66\x8B\x8D\xF2\xFF\xFF\xFF\x66\xD3\xA5\xF6\xFF\xFF\xFF\x5B\x66" \
-        "\x8B\x85\xF6\xFF\xFF\xFF\x08\x83\x0E\x04\x09\x00\x81\xE3\xFF\xFF" \
-        "\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D" \
-        "\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F" \
-        "\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F" \
-        "\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02" \
-        "\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22" \
-        "\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20" \
-        "\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04" \
-        "\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C" \
-        "\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14" \
-        "\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C" \
-        "\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24" \
-        "\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C" \
-        "\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34" \
-        "\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C" \
-        "\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44" \
-        "\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C" \
-        "\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54" \
-        "\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C" \
-        "\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64" \
-        "\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C" \
-        "\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74" \
-        "\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C" \
-        "\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84" \
-        "\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C" \
-        "\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94" \
-        "\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C" \
-        "\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4" \
-        "\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC" \
-        "\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4" \
-        "\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC" \
-        "\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D" \
-        "\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\xE7\x22\x09\x00\x81\xE3\xFF" \
-        "\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1\xC1\xE1\x02" \
-        "\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x0D\x00\x00\x00\xD3\xE0\x81" \
-        "\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40\x88\x03\x66" \
-        "\xB8\x40\x06\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80" \
-        "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-        "\x39\x05\x04\x22\x00\xC0\x76\xF7\xE9\x72\xF8\xFF\xFF\x66\xB8\x01" \
-        "\x11\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00\x66\xC7\x05\x30\x40" \
-        "\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00" \
-        "\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0" \
-        "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-        "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00" \
-        "\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB" \
-        "\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07" \
-        "\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03" \
-        "\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A" \
-        "\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40" \
-        "\x66\xB8\x01\x11\x66\x89\x05\x0E\x00\x09\x00\x66\xB8\x01\x14\x81" \
-        "\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0" \
-        "\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF" \
-        "\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA" \
-        "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14" \
-        "\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00" \
-        "\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B" \
-        "\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7" \
-        "\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xB6\x03\x09\x00\x81\xE0\xFF" \
-        "\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x48\x02\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB" \
-        "\xC6\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00" \
-        "\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00" \
-        "\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00" \
-        "\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00" \
-        "\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00" \
-        "\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00" \
-        "\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01" \
-        "\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01" \
-        "\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01" \
-        "\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01" \
-        "\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01" \
-        "\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01" \
-        "\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01" \
-        "\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01" \
-        "\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01" \
-        "\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01" \
-        "\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01" \
-        "\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01" \
-        "\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01" \
-        "\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01" \
-        "\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01" \
-        "\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01" \
-        "\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01" \
-        "\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01" \
-        "\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01" \
-        "\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01" \
-        "\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01" \
-        "\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01" \
-        "\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01" \
-        "\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01" \
-        "\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF" \
-        "\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\xFC\x26" \
-        "\x09\x00\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00" \
-        "\x89\xD1\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00" \
-        "\x00\x00\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00" \
-        "\x00\x40\x88\x03\xE9\xB8\xFD\xFF\xFF\x66\xB8\x01\x00\x81\xE3\xFF" \
-        "\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-        "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03" \
-        "\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-        "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-        "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89" \
-        "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC" \
-        "\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00" \
-        "\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03" \
-        "\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1" \
-        "\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7\x05\x28" \
-        "\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\xFF\xF0\x66\x8B\x05\xB6\x03\x09\x00\x81\xE0\xFF\xFF\x00" \
-        "\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x48\x02\x00\x00\x66" \
-        "\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6\x81" \
-        "\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00" \
-        "\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00" \
-        "\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00" \
-        "\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00" \
-        "\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00" \
-        "\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00" \
-        "\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01" \
-        "\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01" \
-        "\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01" \
-        "\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01" \
-        "\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01" \
-        "\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01" \
-        "\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01" \
-        "\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01" \
-        "\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01" \
-        "\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01" \
-        "\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01" \
-        "\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01" \
-        "\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01" \
-        "\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01" \
-        "\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01" \
-        "\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01" \
-        "\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01" \
-        "\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01" \
-        "\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01" \
-        "\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01" \
-        "\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01" \
-        "\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01" \
-        "\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01" \
-        "\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01" \
-        "\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00" \
-        "\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\x2A\x2A\x09\x00" \
-        "\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1" \
-        "\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x09\x00\x00\x00" \
-        "\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40" \
-        "\x88\x03\xE9\xB8\xFD\xFF\xFF\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00" \
-        "\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9" \
-        "\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC" \
-        "\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-        "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00" \
-        "\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89" \
-        "\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81" \
-        "\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03" \
-        "\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7\x05\x28\x24\x00" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\xFF\xF0\x66\x8B\x05\xB6\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59" \
-        "\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x8E\x07\x00\x00\x66\x8B\x05" \
-        "\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6\x81\xE3\xFF" \
-        "\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00" \
-        "\x3D\x00\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00" \
-        "\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00" \
-        "\x1F\x00\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00" \
-        "\x02\x00\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00" \
-        "\x22\x00\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00" \
-        "\x20\x00\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01" \
-        "\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01" \
-        "\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01" \
-        "\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01" \
-        "\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01" \
-        "\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01" \
-        "\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01" \
-        "\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01" \
-        "\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01" \
-        "\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01" \
-        "\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01" \
-        "\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01" \
-        "\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01" \
-        "\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01" \
-        "\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01" \
-        "\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01" \
-        "\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01" \
-        "\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01" \
-        "\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01" \
-        "\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01" \
-        "\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01" \
-        "\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01" \
-        "\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01" \
-        "\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01" \
-        "\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B" \
-        "\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B\x9B\x58\x2D\x09\x00\x81\xE3" \
-        "\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1\xC1\xE1" \
-        "\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00\x00\x00\xD3\xE0" \
-        "\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40\x88\x03" \
-        "\x66\xB8\x40\x06\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9" \
-        "\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4" \
-        "\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x81\xE3\xFF\xFF\x00" \
-        "\x00\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00" \
-        "\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00" \
-        "\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00" \
-        "\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00" \
-        "\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00" \
-        "\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00" \
-        "\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04\x01" \
-        "\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01" \
-        "\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14\x01" \
-        "\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01" \
-        "\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24\x01" \
-        "\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C\x01" \
-        "\x2D\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34\x01" \
-        "\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C\x01" \
-        "\x3D\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44\x01" \
-        "\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C\x01" \
-        "\x4D\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01" \
-        "\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C\x01" \
-        "\x5D\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01" \
-        "\x65\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C\x01" \
-        "\x6D\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74\x01" \
-        "\x75\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C\x01" \
-        "\x7D\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84\x01" \
-        "\x85\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C\x01" \
-        "\x8D\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01" \
-        "\x95\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C\x01" \
-        "\x9D\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4\x01" \
-        "\xA5\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC\x01" \
-        "\xAD\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4\x01" \
-        "\xB5\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC\x01" \
-        "\xBD\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D\x28" \
-        "\x24\x00\x00\xD1\xE3\x66\x8B\x9B\xB6\x2F\x09\x00\x66\x50\x81\xE3" \
-        "\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1\xC1\xE1" \
-        "\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00\xB8\x01\x00\x00\x00\xD3\xE0" \
-        "\x81\xE3\xFC\x03\x00\x00\x03\xD8\x66\x58\x81\xC3\x00\x00\x00\x80" \
-        "\x66\x0B\x03\x81\xE0\xFF\x00\x00\x00\xFF\xF0\xB8\x00\x00\x00\x00" \
-        "\x59\x39\xC8\x0F\x85\x71\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x66\x89\x85\xEE\xFF\xFF\xFF\x66\xB9\x08\x00\x66\x8B\x85\xEE\xFF" \
-        "\xFF\xFF\x66\xBA\x00\x00\x66\xF7\xF1\x66\x89\x85\xEE\xFF\xFF\xFF" \
-        "\x66\x8B\x9D\xEE\xFF\xFF\xFF\x81\xE3\xFF\xFF\x00\x00\x53\x66\xC7" \
-        "\x85\xEA\xFF\xFF\xFF\x01\x00\x66\x8B\x05\x28\x24\x00\x00\x66\x89" \
-        "\x85\xE6\xFF\xFF\xFF\x66\x81\xA5\xE6\xFF\xFF\xFF\x07\x00\x66\x8B" \
-        "\x8D\xE6\xFF\xFF\xFF\x66\xD3\xA5\xEA\xFF\xFF\xFF\x5B\x66\x8B\x85" \
-        "\xEA\xFF\xFF\xFF\x08\x83\x0E\x04\x09\x00\x81\xE3\xFF\xFF\x00\x00" \
-        "\xE9\xE0\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39" \
-        "\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B" \
-        "\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B" \
-        "\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00\x06" \
-        "\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00\x26" \
-        "\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24" \
-        "\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04\x01\x05" \
-        "\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01\x0D" \
-        "\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14\x01\x15" \
-        "\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01\x1D" \
-        "\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x24\x01\x25" \
-        "\x01\x26\x01\x27\x01\x28\x01\x29\x01\x2A\x01\x2B\x01\x2C\x01\x2D" \
-        "\x01\x2E\x01\x2F\x01\x30\x01\x31\x01\x32\x01\x33\x01\x34\x01\x35" \
-        "\x01\x36\x01\x37\x01\x38\x01\x39\x01\x3A\x01\x3B\x01\x3C\x01\x3D" \
-        "\x01\x3E\x01\x3F\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44\x01\x45" \
-        "\x01\x46\x01\x47\x01\x48\x01\x49\x01\x4A\x01\x4B\x01\x4C\x01\x4D" \
-        "\x01\x4E\x01\x4F\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55" \
-        "\x01\x56\x01\x57\x01\x58\x01\x59\x01\x5A\x01\x5B\x01\x5C\x01\x5D" \
-        "\x01\x5E\x01\x5F\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65" \
-        "\x01\x66\x01\x67\x01\x68\x01\x69\x01\x6A\x01\x6B\x01\x6C\x01\x6D" \
-        "\x01\x6E\x01\x6F\x01\x70\x01\x71\x01\x72\x01\x73\x01\x74\x01\x75" \
-        "\x01\x76\x01\x77\x01\x78\x01\x79\x01\x7A\x01\x7B\x01\x7C\x01\x7D" \
-        "\x01\x7E\x01\x7F\x01\x80\x01\x81\x01\x82\x01\x83\x01\x84\x01\x85" \
-        "\x01\x86\x01\x87\x01\x88\x01\x89\x01\x8A\x01\x8B\x01\x8C\x01\x8D" \
-        "\x01\x8E\x01\x8F\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95" \
-        "\x01\x96\x01\x97\x01\x98\x01\x99\x01\x9A\x01\x9B\x01\x9C\x01\x9D" \
-        "\x01\x9E\x01\x9F\x01\xA0\x01\xA1\x01\xA2\x01\xA3\x01\xA4\x01\xA5" \
-        "\x01\xA6\x01\xA7\x01\xA8\x01\xA9\x01\xAA\x01\xAB\x01\xAC\x01\xAD" \
-        "\x01\xAE\x01\xAF\x01\xB0\x01\xB1\x01\xB2\x01\xB3\x01\xB4\x01\xB5" \
-        "\x01\xB6\x01\xB7\x01\xB8\x01\xB9\x01\xBA\x01\xBB\x01\xBC\x01\xBD" \
-        "\x01\xBE\x01\xBF\x01\x81\xE3\xFF\xFF\x00\x00\x66\x8B\x1D\x28\x24" \
-        "\x00\x00\xD1\xE3\x66\x8B\x9B\x75\x32\x09\x00\x81\xE3\xFF\x03\x00" \
-        "\x00\x89\xDA\x81\xE2\x03\x00\x00\x00\x89\xD1\xC1\xE1\x02\x03\xCA" \
-        "\x81\xC1\x0A\x00\x00\x00\xB8\x09\x00\x00\x00\xD3\xE0\x81\xE3\xFC" \
-        "\x03\x00\x00\x03\xD8\x81\xC3\x00\x00\x00\x40\x88\x03\x66\xB8\x40" \
-        "\x06\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\xE9\x72\xF8\xFF\xFF\x66\xC7\x05\x28\x24" \
-        "\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00" \
-        "\x00\xFF\xF0\x66\x8B\x05\xBE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x12\x01\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6\x66\x8B" \
-        "\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xC6\x03\x09" \
-        "\x00\xB4\x00\x66\x89\x85\xE2\xFF\xFF\xFF\x66\x8B\x1D\x28\x24\x00" \
-        "\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\x0E\x04\x09\x00\xF6\xD0\xB4" \
-        "\x00\x66\x21\x85\xE2\xFF\xFF\xFF\x66\x8B\x85\xE2\xFF\xFF\xFF\x66" \
-        "\x3D\x00\x00\x0F\x84\x0E\x00\x00\x00\x66\x81\x8D\xFE\xFF\xFF\xFF" \
-        "\x02\x00\xE9\x52\x00\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3" \
-        "\xFF\xFF\x00\x00\x8A\x83\xC6\x03\x09\x00\xB4\x00\x66\x89\x85\xDE" \
-        "\xFF\xFF\xFF\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00" \
-        "\x8A\x83\x0E\x04\x09\x00\xB4\x00\x66\x21\x85\xDE\xFF\xFF\xFF\x66" \
-        "\x8B\x85\xDE\xFF\xFF\xFF\x66\x3D\x00\x00\x0F\x84\x09\x00\x00\x00" \
-        "\x66\x81\x8D\xFE\xFF\xFF\xFF\x01\x00\x66\x8B\x1D\x28\x24\x00\x00" \
-        "\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xEA\x03\x09\x00\xB4\x00\x66\x89" \
-        "\x85\xDA\xFF\xFF\xFF\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF" \
-        "\x00\x00\x8A\x83\x0E\x04\x09\x00\xB4\x00\x66\x21\x85\xDA\xFF\xFF" \
-        "\xFF\x66\x8B\x85\xDA\xFF\xFF\xFF\x66\x3D\x00\x00\x0F\x84\x09\x00" \
-        "\x00\x00\x66\x81\x8D\xFE\xFF\xFF\xFF\x04\x00\xE9\xEE\xFE\xFF\xFF" \
-        "\x66\xB8\x00\x00\x66\x3D\x00\x00\x0F\x84\x2A\x00\x00\x00\x66\x8B" \
-        "\x85\xFE\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x01\x00" \
-        "\x00\x00\x59\x39\xC8\x0F\x84\x0D\x00\x00\x00\x66\xB8\x01\x00\x66" \
-        "\x3D\x00\x00\xE9\x08\x00\x00\x00\x66\xB8\x00\x00\x66\x3D\x00\x00" \
-        "\x0F\x84\x7A\x02\x00\x00\xE9\x23\x00\x00\x00\x90\x0A\x43\x6F\x6E" \
-        "\x74\x69\x6E\x75\x69\x74\x79\x20\x46\x61\x69\x6C\x75\x72\x65\x20" \
-        "\x6F\x6E\x20\x53\x6F\x63\x6B\x65\x74\x20\x25\x64\x0A\x00\x66\x8B" \
-        "\x05\x24\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x68\x5C\x36" \
-        "\x09\x00\xE8\x83\xCF\xFF\xFF\x81\xC4\x08\x00\x00\x00\xE9\x13\x00" \
-        "\x00\x00\x43\x4F\x4E\x54\x20\x3D\x20\x20\x20\x20\x20\x20\x20\x20" \
-        "\x20\x20\x30\x78\x00\x68\xA2\x36\x09\x00\xE8\x5B\xCF\xFF\xFF\x81" \
-        "\xC4\x04\x00\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05" \
-        "\xBE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15" \
-        "\x00\x00\x00\xE9\x48\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66" \
-        "\xFF\x05\x28\x24\x00\x00\xEB\xC6\xE9\x06\x00\x00\x00\x90\x25\x30" \
-        "\x32\x58\x00\x66\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00" \
-        "\x8A\x83\x0E\x04\x09\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x68\x0E" \
-        "\x37\x09\x00\xE8\xE2\xCE\xFF\xFF\x81\xC4\x08\x00\x00\x00\xEB\xB8" \
-        "\xE9\x03\x00\x00\x00\x90\x0A\x00\x68\x46\x37\x09\x00\xE8\xC8\xCE" \
-        "\xFF\xFF\x81\xC4\x04\x00\x00\x00\xE9\x14\x00\x00\x00\x90\x4D\x55" \
-        "\x53\x54\x20\x43\x4F\x4E\x4E\x20\x3D\x20\x20\x20\x20\x20\x30\x78" \
-        "\x00\x68\x5E\x37\x09\x00\xE8\x9F\xCE\xFF\xFF\x81\xC4\x04\x00\x00" \
-        "\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-        "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xBE\x03\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9" \
-        "\x48\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24" \
-        "\x00\x00\xEB\xC6\xE9\x06\x00\x00\x00\x90\x25\x30\x32\x58\x00\x66" \
-        "\x8B\x1D\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xC6\x03" \
-        "\x09\x00\x81\xE0\xFF\x00\x00\x00\xFF\xF0\x68\xCA\x37\x09\x00\xE8" \
-        "\x26\xCE\xFF\xFF\x81\xC4\x08\x00\x00\x00\xEB\xB8\xE9\x03\x00\x00" \
-        "\x00\x90\x0A\x00\x68\x02\x38\x09\x00\xE8\x0C\xCE\xFF\xFF\x81\xC4" \
-        "\x04\x00\x00\x00\xE9\x14\x00\x00\x00\x90\x4D\x55\x53\x54\x20\x4E" \
-        "\x4F\x54\x20\x43\x4F\x4E\x4E\x20\x3D\x20\x30\x78\x00\x68\x1A\x38" \
-        "\x09\x00\xE8\xE3\xCD\xFF\xFF\x81\xC4\x04\x00\x00\x00\x66\xC7\x05" \
-        "\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF" \
-        "\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xBE\x03\x09\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x48\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xC6" \
-        "\xE9\x06\x00\x00\x00\x90\x25\x30\x32\x58\x00\x66\x8B\x1D\x28\x24" \
-        "\x00\x00\x81\xE3\xFF\xFF\x00\x00\x8A\x83\xEA\x03\x09\x00\x81\xE0" \
-        "\xFF\x00\x00\x00\xFF\xF0\x68\x86\x38\x09\x00\xE8\x6A\xCD\xFF\xFF" \
-        "\x81\xC4\x08\x00\x00\x00\xEB\xB8\xE9\x03\x00\x00\x00\x90\x0A\x00" \
-        "\x68\xBE\x38\x09\x00\xE8\x50\xCD\xFF\xFF\x81\xC4\x04\x00\x00\x00" \
-        "\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB8\x01\x10\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x10\x66\x89\x05\x0E\x00\x09" \
-        "\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-        "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xB6\x03\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9" \
-        "\x48\x02\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24" \
-        "\x00\x00\xEB\xC6\x81\xE3\xFF\xFF\x00\x00\xE9\xE0\x01\x00\x00\x3C" \
-        "\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00\x31\x00\x3E" \
-        "\x00\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00\x33\x00\x1E" \
-        "\x00\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00\x13\x00\x03" \
-        "\x00\x07\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00\x0E\x00\x23" \
-        "\x00\x27\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00\x2E\x00\x21" \
-        "\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00\x2C\x00\x00" \
-        "\x01\x01\x01\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08" \
-        "\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01\x0D\x01\x0E\x01\x0F\x01\x10" \
-        "\x01\x11\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18" \
-        "\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01\x1D\x01\x1E\x01\x1F\x01\x20" \
-        "\x01\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28" \
-        "\x01\x29\x01\x2A\x01\x2B\x01\x2C\x01\x2D\x01\x2E\x01\x2F\x01\x30" \
-        "\x01\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38" \
-        "\x01\x39\x01\x3A\x01\x3B\x01\x3C\x01\x3D\x01\x3E\x01\x3F\x01\x40" \
-        "\x01\x41\x01\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48" \
-        "\x01\x49\x01\x4A\x01\x4B\x01\x4C\x01\x4D\x01\x4E\x01\x4F\x01\x50" \
-        "\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58" \
-        "\x01\x59\x01\x5A\x01\x5B\x01\x5C\x01\x5D\x01\x5E\x01\x5F\x01\x60" \
-        "\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68" \
-        "\x01\x69\x01\x6A\x01\x6B\x01\x6C\x01\x6D\x01\x6E\x01\x6F\x01\x70" \
-        "\x01\x71\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78" \
-        "\x01\x79\x01\x7A\x01\x7B\x01\x7C\x01\x7D\x01\x7E\x01\x7F\x01\x80" \
-        "\x01\x81\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88" \
-        "\x01\x89\x01\x8A\x01\x8B\x01\x8C\x01\x8D\x01\x8E\x01\x8F\x01\x90" \
-        "\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98" \
-        "\x01\x99\x01\x9A\x01\x9B\x01\x9C\x01\x9D\x01\x9E\x01\x9F\x01\xA0" \
-        "\x01\xA1\x01\xA2\x01\xA3\x01\xA4\x01\xA5\x01\xA6\x01\xA7\x01\xA8" \
-        "\x01\xA9\x01\xAA\x01\xAB\x01\xAC\x01\xAD\x01\xAE\x01\xAF\x01\xB0" \
-        "\x01\xB1\x01\xB2\x01\xB3\x01\xB4\x01\xB5\x01\xB6\x01\xB7\x01\xB8" \
-        "\x01\xB9\x01\xBA\x01\xBB\x01\xBC\x01\xBD\x01\xBE\x01\xBF\x01\x81" \
-        "\xE3\xFF\xFF\x00\x00\x66\x8B\x1D\x28\x24\x00\x00\xD1\xE3\x66\x8B" \
-        "\x9B\x8F\x3A\x09\x00\x81\xE3\xFF\x03\x00\x00\x89\xDA\x81\xE2\x03" \
-        "\x00\x00\x00\x89\xD1\xC1\xE1\x02\x03\xCA\x81\xC1\x0A\x00\x00\x00" \
-        "\xB8\x01\x00\x00\x00\xD3\xE0\x81\xE3\xFC\x03\x00\x00\x03\xD8\x81" \
-        "\xC3\x00\x00\x00\x40\x88\x03\xE9\xB8\xFD\xFF\xFF\x66\x8B\x85\x08" \
-        "\x00\x00\x00\x66\x3D\x00\x00\x0F\x84\xB3\x00\x00\x00\x66\xB8\x01" \
-        "\x2D\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30\x40" \
-        "\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00" \
-        "\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0" \
-        "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-        "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00" \
-        "\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB" \
-        "\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07" \
-        "\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03" \
-        "\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A" \
-        "\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40" \
-        "\x66\x8B\x85\xFE\xFF\xFF\xFF\x81\xE0\xFF\xFF\x00\x00\x8B\xE5\x5D" \
-        "\xC3\x8B\xE5\x5D\xC3\xE9\x21\x00\x00\x00\x55\x8B\xEC\x81\xEC\x00" \
-        "\x00\x00\x00\x68\x01\x00\x00\x00\xE8\x07\xDA\xFF\xFF\x81\xC4\x04" \
-        "\x00\x00\x00\x8B\xE5\x5D\xC3\x8B\xE5\x5D\xC3\x66\xB9\x00\x00\xB2" \
-        "\x00\xFB\xFF\x25\x44\x11\x00\x00"
-
-p663 = \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00" \
-        "\x00\x00\x00\x00\x66\xC7\x05\x50\x6E\x09\x00\x00\x00\x66\x8B\x0D" \
-        "\x28\x24\x00\x00\x66\xD3\x2D\x50\x6E\x09\x00\x66\x8B\x05\x50\x6E" \
-        "\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80" \
-        "\x04\x40\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7" \
-        "\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x0E\x00\x00\x00\x59\x39\xC8\x0F\x87" \
-        "\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00" \
-        "\x00\x00\x66\xC7\x05\xDE\x6E\x09\x00\x00\x00\x66\x8B\x0D\x28\x24" \
-        "\x00\x00\x66\xD3\x2D\xDE\x6E\x09\x00\x66\x8B\x05\xDE\x6E\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80" \
-        "\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x04\x40" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7\x05\x32" \
-        "\x24\x00\x00\x07\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00" \
-        "\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x52\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE" \
-        "\xE9\x05\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x76\x6F\x09" \
-        "\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x76\x6F\x09" \
-        "\x00\x66\x8B\x05\x76\x6F\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05" \
-        "\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40" \
-        "\xEB\xAE\x66\xFF\x0D\x32\x24\x00\x00\x66\x8B\x05\x32\x24\x00\x00" \
-        "\x66\x3D\x00\x00\x0F\x85\x6B\xFF\xFF\xFF\x66\xC7\x05\x28\x24\x00" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00" \
-        "\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28" \
-        "\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7" \
-        "\x05\x0A\x70\x09\x00\x04\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3" \
-        "\x2D\x0A\x70\x09\x00\x66\x8B\x05\x0A\x70\x09\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05" \
-        "\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x00\x40\x66\xC7\xC7\x00" \
-        "\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-        "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x10\x00\x00\x00\x59\x39" \
-        "\xC8\x0F\x87\x15\x00\x00\x00\xE9\x3C\x00\x00\x00\x66\x8B\x05\x28" \
-        "\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\x66\xC1\xEF\x01" \
-        "\x31\xC0\x66\x0B\x05\x28\x80\x00\x80\xB4\x00\x66\x3D\x00\x00\x0F" \
-        "\x84\x05\x00\x00\x00\x66\x81\xCF\x00\x20\x88\x05\x24\x80\x06\x40" \
-        "\x88\x05\x24\x80\x04\x40\xEB\xC4\x66\x81\xE7\xF0\x3F\x66\x8B\xC7" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\xF0\x3F\x00\x00\x59\x39\xC8" \
-        "\x0F\x85\x12\x00\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44" \
-        "\x11\x00\x00\xE9\x0D\x00\x00\x00\x66\xB9\x01\x00\xB2\x02\xFB\xFF" \
-        "\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11" \
-        "\x00\x00"
-
-p555 = \
-        "\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\xE9\x02\x00\x00\x00\x00\x00\x66\xC7\x05\x88\x3E\x09" \
-        "\x00\x0A\x00\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x98" \
-        "\x3E\x09\x00\x00\x00\x68\x00\x00\x00\x00\xE8\x05\xD9\xFF\xFF\x81" \
-        "\xC4\x04\x00\x00\x00\x66\x89\xC6\x66\x8B\xC6\x81\xE0\xFF\xFF\x00" \
-        "\x00\xFF\xF0\xB8\x01\x00\x00\x00\x59\x39\xC8\x0F\x85\x0E\x00\x00" \
-        "\x00\x66\xC7\x05\x88\x3E\x09\x00\x00\x00\xE9\x0E\x00\x00\x00\x66" \
-        "\x8B\x05\x88\x3E\x09\x00\x66\xFF\x0D\x88\x3E\x09\x00\x66\x8B\x05" \
-        "\x88\x3E\x09\x00\x66\x3D\x00\x00\x75\x99\x66\x8B\xC6\x81\xE0\xFF" \
-        "\xFF\x00\x00\xFF\xF0\xB8\x01\x00\x00\x00\x59\x39\xC8\x0F\x84\x4F" \
-        "\x01\x00\x00\x66\x8B\x05\x36\x00\x09\x00\x66\x3D\x00\x00\x0F\x84" \
-        "\x3E\x01\x00\x00\x66\x50\xB0\x10\xFB\x66\x53\x66\x51\x8A\xC8\xFF" \
-        "\x15\x40\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\x50\xB0\x00" \
-        "\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66" \
-        "\x5B\xFA\x66\x58\x66\x50\x66\x8B\xC6\xFB\x66\x53\x66\x51\x8A\xC8" \
-        "\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\x50\x66" \
-        "\x8B\x05\xBE\x03\x09\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C" \
-        "\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\xC7\x05\x28\x24\x00" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\xFF\xF0\x66\x8B\x05\xBE\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59" \
-        "\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x3B\x00\x00\x00\x66\xFF\x05" \
-        "\x28\x24\x00\x00\x66\x8B\x05\x28\x24\x00\x00\xEB\xC6\x66\x8B\x1D" \
-        "\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x66\x50\x8A\x83\x0E\x04" \
-        "\x09\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66" \
-        "\x59\x66\x5B\xFA\x66\x58\xEB\xC5\xBB\x00\x00\x00\x00\xC1\xE3\x02" \
-        "\x53\x5B\xC7\x83\x74\x46\x00\x00\x0E\x00\x00\x00\xBB\x01\x00\x00" \
-        "\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00" \
-        "\xBB\x02\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83\x74\x46\x00\x00" \
-        "\x00\x00\x00\x00\xBB\x03\x00\x00\x00\xC1\xE3\x02\x53\x5B\xC7\x83" \
-        "\x74\x46\x00\x00\x00\x00\x00\x00\xBB\x04\x00\x00\x00\xC1\xE3\x02" \
-        "\x53\x5B\xC7\x83\x74\x46\x00\x00\x00\x00\x00\x00\xFF\x15\x38\x11" \
-        "\x00\x00\x66\x50\x66\x8B\xC6\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15" \
-        "\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\x8B\xC6\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x01\x00\x00\x00\x59\x39\xC8\x0F\x84" \
-        "\x5A\x00\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x1D" \
-        "\x28\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\x66\x50\x8A\x83\x0E\x04" \
-        "\x09\x00\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66" \
-        "\x59\x66\x5B\xFA\x66\x58\x66\xFF\x05\x28\x24\x00\x00\x66\x8B\x05" \
-        "\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\x66\x8B\x05\xBE" \
-        "\x03\x09\x00\x81\xE0\xFF\xFF\x00\x00\x59\x39\xC8\x77\xAF\x66\xB8" \
-        "\x01\x2D\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30" \
-        "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-        "\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00" \
-        "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-        "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00" \
-        "\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-        "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-        "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-        "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-        "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-        "\x40\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11\x00\x00"
-
-p795 = \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92" \
-        "\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00" \
-        "\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x57" \
-        "\x92\x00\x57\x92\x00\x57\x92\x00\x57\x92\x00\x50\x73\x01\x00\x00"
-
-p615 = \
-        "\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB8\x58\x02\x66\x8B\x15\x3E\x25\x00\x00\x66\xF7" \
-        "\xE2\x66\x81\xFA\x01\x00\x73\x15\x66\x03\x05\x3C\x25\x00\x00\x72" \
-        "\x0C\x66\x81\xE0\xF0\xFF\x66\x81\xC8\x01\x00\xEB\x05\x66\xC7\xC0" \
-        "\xF1\xFF\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x14\x00\x66\xC7\x05\x30" \
-        "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-        "\x00\xF0\xFF\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-        "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00" \
-        "\x66\xBB\x1C\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C\x66" \
-        "\x50\x66\x52\x66\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7\x35\x40\x25" \
-        "\x00\x00\x66\x5A\x66\x81\xF8\x00\x00\x75\x04\x66\xB8\x01\x00\x66" \
-        "\x81\xE0\xF0\xFF\x66\x81\xC8\x01\x00\x66\x89\x05\x90\x40\x00\xC0" \
-        "\x66\x58\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\xC6\x05\x14\x22\x00" \
-        "\xC0\x7B\x66\xC7\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00" \
-        "\xC0\xBB\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\x66\xC7\x05\x30\x40" \
-        "\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00" \
-        "\xF0\xFF\x66\x03\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00" \
-        "\xD0\x07\x72\x15\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00\x00" \
-        "\x66\x89\x0D\x90\x40\x00\xC0\xEB\x07\x66\x89\x05\x90\x40\x00\xC0" \
-        "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-        "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05" \
-        "\x14\x22\x00\xC0\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40" \
-        "\x00\xC0\x66\x89\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D" \
-        "\x40\x25\x00\x00\xD0\x07\x72\x24\x66\x50\x66\x29\xC8\x73\x00\xC6" \
-        "\x05\x14\x22\x00\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00" \
-        "\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x58\xC6\x05\x14\x22" \
-        "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-        "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-        "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-        "\x82\x00\x00\x00\x40\x66\xB8\x80\x0C\x66\x2D\x07\x00\x72\x1F\x66" \
-        "\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04" \
-        "\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\xE9\x05" \
-        "\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x64\x61\x09\x00\x00" \
-        "\x00\x66\xB8\x01\x11\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00\x66" \
-        "\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81" \
-        "\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89\x05" \
-        "\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81" \
-        "\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22\x00" \
-        "\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89" \
-        "\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89" \
-        "\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82" \
-        "\x00\x00\x00\x40\x31\xC0\x66\x0B\x05\x1C\x04\x00\x80\x66\x50\x66" \
-        "\x8B\x05\x0E\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00" \
-        "\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7" \
-        "\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89" \
-        "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-        "\x81\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22" \
-        "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-        "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-        "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-        "\x82\x00\x00\x00\x40\x66\x58\xB4\x00\x66\x89\xC7\x66\xB8\x01\x00" \
-        "\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00" \
-        "\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0" \
-        "\xFF\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89" \
-        "\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05" \
-        "\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66" \
-        "\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00" \
-        "\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00" \
-        "\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00" \
-        "\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89" \
-        "\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66" \
-        "\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C\x00\x66\x81\x3D" \
-        "\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52\x66\xBA\xD0\x07" \
-        "\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66\x5A\x66\x81\xF8" \
-        "\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0\xFF\x66\x81\xC8" \
-        "\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66\xC7\x05\x50\x40" \
-        "\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66\xC7\x05\x50\x40" \
-        "\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66\xC7\x05\x50\x40" \
-        "\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1" \
-        "\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xEC\x46" \
-        "\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x15\x89\xD9\xC1" \
-        "\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D\x90\x40\x00\xC0" \
-        "\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81" \
-        "\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x81\x3D\x40" \
-        "\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00\xC0\x02\x81\xE2" \
-        "\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66\x89\x05\x90\x40" \
-        "\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66" \
-        "\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72" \
-        "\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22\x00\xC0\x1B\x66" \
-        "\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-        "\xB8\x0B\x66\x8B\x15\x3E\x25\x00\x00\x66\xF7\xE2\x66\x81\xFA\x01" \
-        "\x00\x73\x15\x66\x03\x05\x3C\x25\x00\x00\x72\x0C\x66\x81\xE0\xF0" \
-        "\xFF\x66\x81\xC8\x01\x00\xEB\x05\x66\xC7\xC0\xF1\xFF\x81\xE3\xFF" \
-        "\xFF\x00\x00\x66\xBB\x14\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-        "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x89" \
-        "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-        "\x81\x00\x00\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-        "\x01\x2D\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30" \
-        "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-        "\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00" \
-        "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-        "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00" \
-        "\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-        "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-        "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-        "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-        "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-        "\x40\x66\x8B\xC7\x66\x3D\x00\x00\x0F\x85\x09\x00\x00\x00\x66\xB9" \
-        "\x01\x00\xE9\x04\x00\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25" \
-        "\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00" \
-        "\x00"
-
-p797 = \
-        "\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x30\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\x14\x47\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\x14\x47\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB8\x01\x82\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x30" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x14\x47\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x14\x47\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44" \
-        "\x11\x00\x00"
-
-p807 = \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00" \
-        "\x00\x00\x00\x00\x66\xC7\x05\xE0\x81\x09\x00\x05\x00\x66\x8B\x0D" \
-        "\x28\x24\x00\x00\x66\xD3\x2D\xE0\x81\x09\x00\x66\x8B\x05\xE0\x81" \
-        "\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80" \
-        "\x00\x40\x66\xC7\xC7\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8" \
-        "\x10\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x3C\x00" \
-        "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00" \
-        "\xEB\xCE\x66\xC1\xEF\x01\x31\xC0\x66\x0B\x05\x28\x80\x00\x80\xB4" \
-        "\x00\x66\x3D\x00\x00\x0F\x84\x05\x00\x00\x00\x66\x81\xCF\x00\x20" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xC4\x66\x8B" \
-        "\xCF\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02" \
-        "\xFB\xFF\x25\x44\x11\x00\x00"
-
-p697 = \
-        "\xE9\x03\x00\x00\x00\x90\x00\x00\x66\xC7\x05\x20\x24\x00\x00\x00" \
-        "\x00\x88\x05\x24\x80\x04\x40\x88\x05\x28\x80\x00\x40\x66\x8B\x05" \
-        "\x12\x24\x00\x00\x66\x89\x05\x36\x24\x00\x00\x66\x8B\x05\x10\x24" \
-        "\x00\x00\x66\x89\x05\x18\x24\x00\x00\x66\x8B\x05\x18\x24\x00\x00" \
-        "\x66\x89\x05\xE6\x74\x09\x00\x66\x8B\x05\xE6\x74\x09\x00\x66\x3D" \
-        "\x00\x00\x0F\x84\x94\x00\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0" \
-        "\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00" \
-        "\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x78" \
-        "\x75\x09\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x78" \
-        "\x75\x09\x00\x66\x8B\x05\x78\x75\x09\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80" \
-        "\x04\x40\xEB\xAF\x66\xFF\x0D\x18\x24\x00\x00\x66\x8B\x05\x18\x24" \
-        "\x00\x00\x66\x3D\x00\x00\x0F\x85\x6C\xFF\xFF\xFF\x66\xC7\x05\x18" \
-        "\x24\x00\x00\x00\x00\x66\xC7\x05\xE6\x74\x09\x00\x01\x00\x66\x8B" \
-        "\x05\x36\x24\x00\x00\x66\xFF\x0D\x36\x24\x00\x00\x66\x3D\x00\x00" \
-        "\x0F\x85\x31\xFF\xFF\xFF\x66\x8B\x05\x16\x24\x00\x00\x66\x89\x05" \
-        "\x36\x24\x00\x00\x66\x8B\x05\x14\x24\x00\x00\x66\x89\x05\x18\x24" \
-        "\x00\x00\x66\x8B\x05\x18\x24\x00\x00\x66\x89\x05\xE6\x74\x09\x00" \
-        "\x66\x8B\x05\xE6\x74\x09\x00\x66\x3D\x00\x00\x0F\x84\xB7\x01\x00" \
-        "\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-        "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39" \
-        "\xC8\x0F\x87\x15\x00\x00\x00\xE9\x52\x00\x00\x00\x66\x8B\x05\x28" \
-        "\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x05\x00\x00" \
-        "\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x72\x76\x09\x00\x04\x00\x66" \
-        "\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x72\x76\x09\x00\x66\x8B\x05" \
-        "\x72\x76\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAE\x88\x05" \
-        "\x28\x80\x00\x40\x66\xC7\xC7\x00\x00\x66\xC7\x05\x28\x24\x00\x00" \
-        "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF" \
-        "\xF0\xB8\x10\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9" \
-        "\x3C\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24" \
-        "\x00\x00\xEB\xCE\x66\xC1\xEF\x01\x31\xC0\x66\x0B\x05\x28\x80\x00" \
-        "\x80\xB4\x00\x66\x3D\x00\x00\x0F\x84\x05\x00\x00\x00\x66\x81\xCF" \
-        "\x00\x20\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xC4" \
-        "\x66\x50\x66\x8B\xC7\xFB\x66\x50\x66\x53\x66\x51\x8A\xC8\xFF\x15" \
-        "\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\xC1\xE8\x08\xFB" \
-        "\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B" \
-        "\xFA\x66\x58\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28" \
-        "\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00" \
-        "\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x52\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x05" \
-        "\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x94\x77\x09\x00\x06" \
-        "\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x94\x77\x09\x00\x66" \
-        "\x8B\x05\x94\x77\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80" \
-        "\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAE" \
-        "\x66\xFF\x0D\x18\x24\x00\x00\x66\x8B\x05\x18\x24\x00\x00\x66\x3D" \
-        "\x00\x00\x0F\x85\x49\xFE\xFF\xFF\x66\xC7\x05\x18\x24\x00\x00\x00" \
-        "\x00\x66\xC7\x05\xE6\x74\x09\x00\x01\x00\x66\x8B\x05\x36\x24\x00" \
-        "\x00\x66\xFF\x0D\x36\x24\x00\x00\x66\x3D\x00\x00\x0F\x85\x0E\xFE" \
-        "\xFF\xFF\x88\x05\x24\x80\x04\x40\x66\xB9\x00\x00\xB2\x00\xFB\xFF" \
-        "\x25\x44\x11\x00\x00"
-
-# my_fw.py
-p637 = \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00" \
-        "\x00\x00\x00\x00\x66\xC7\x05\xD0\x15\x09\x00\x00\x00\x66\x8B\x0D" \
-        "\x28\x24\x00\x00\x66\xD3\x2D\xD0\x15\x09\x00\x66\x8B\x05\xD0\x15" \
-        "\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80" \
-        "\x04\x40\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7" \
-        "\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x0E\x00\x00\x00\x59\x39\xC8\x0F\x87" \
-        "\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00" \
-        "\x00\x00\x66\xC7\x05\x5E\x16\x09\x00\x00\x00\x66\x8B\x0D\x28\x24" \
-        "\x00\x00\x66\xD3\x2D\x5E\x16\x09\x00\x66\x8B\x05\x5E\x16\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80" \
-        "\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x04\x40" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7\x05\x32" \
-        "\x24\x00\x00\x00\x00\x66\x8B\x05\x32\x24\x00\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\xFF\xF0\xB8\x04\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00" \
-        "\x00\x00\xE9\xC2\x01\x00\x00\x66\x8B\x05\x32\x24\x00\x00\x66\xFF" \
-        "\x05\x32\x24\x00\x00\xEB\xCE\x66\xC7\x05\x28\x24\x00\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8" \
-        "\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x52\x00" \
-        "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00" \
-        "\xEB\xCE\xE9\x05\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x28" \
-        "\x17\x09\x00\x04\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x28" \
-        "\x17\x09\x00\x66\x8B\x05\x28\x17\x09\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80" \
-        "\x04\x40\xEB\xAE\x88\x05\x28\x80\x00\x40\x66\x8B\x1D\x32\x24\x00" \
-        "\x00\x81\xE3\xFF\xFF\x00\x00\xC1\xE3\x01\x53\x5B\x66\xC7\x83\x38" \
-        "\x24\x00\x00\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x10\x00" \
-        "\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x68\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE" \
-        "\x66\x8B\x1D\x32\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\xC1\xE3\x01" \
-        "\x53\x5B\x66\xC1\xAB\x38\x24\x00\x00\x01\x31\xC0\x66\x0B\x05\x28" \
-        "\x80\x00\x80\xB4\x00\x66\x3D\x00\x00\x0F\x84\x1B\x00\x00\x00\x66" \
-        "\x8B\x1D\x32\x24\x00\x00\x81\xE3\xFF\xFF\x00\x00\xC1\xE3\x01\x53" \
-        "\x5B\x66\x81\x8B\x38\x24\x00\x00\x00\x20\x88\x05\x24\x80\x06\x40" \
-        "\x88\x05\x24\x80\x04\x40\xEB\x98\x66\xC7\x05\x28\x24\x00\x00\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0" \
-        "\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00" \
-        "\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x58" \
-        "\x18\x09\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x58" \
-        "\x18\x09\x00\x66\x8B\x05\x58\x18\x09\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80" \
-        "\x04\x40\xEB\xAF\xE9\x3E\xFE\xFF\xFF\x66\xC7\x05\x28\x24\x00\x00" \
-        "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF" \
-        "\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9" \
-        "\x52\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24" \
-        "\x00\x00\xEB\xCE\xE9\x05\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7" \
-        "\x05\xDA\x18\x09\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3" \
-        "\x2D\xDA\x18\x09\x00\x66\x8B\x05\xDA\x18\x09\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05" \
-        "\x24\x80\x04\x40\xEB\xAE\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66" \
-        "\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06" \
-        "\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB" \
-        "\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x56\x19\x09" \
-        "\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x56\x19\x09" \
-        "\x00\x66\x8B\x05\x56\x19\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05" \
-        "\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40" \
-        "\xEB\xAF\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59" \
-        "\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05" \
-        "\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00" \
-        "\x00\x00\x00\x00\x00\x00\x66\xC7\x05\xD2\x19\x09\x00\x06\x00\x66" \
-        "\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\xD2\x19\x09\x00\x66\x8B\x05" \
-        "\xD2\x19\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x66\xC7" \
-        "\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87" \
-        "\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00" \
-        "\x00\x00\x66\xC7\x05\x4E\x1A\x09\x00\x04\x00\x66\x8B\x0D\x28\x24" \
-        "\x00\x00\x66\xD3\x2D\x4E\x1A\x09\x00\x66\x8B\x05\x4E\x1A\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80" \
-        "\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x00\x40" \
-        "\x66\xC7\xC7\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x10\x00" \
-        "\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x3C\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE" \
-        "\x66\xC1\xEF\x01\x31\xC0\x66\x0B\x05\x28\x80\x00\x80\xB4\x00\x66" \
-        "\x3D\x00\x00\x0F\x84\x05\x00\x00\x00\x66\x81\xCF\x00\x20\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xC4\xBB\x04\x00\x00" \
-        "\x00\xC1\xE3\x01\x53\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\x89" \
-        "\x3D\x0A\x1B\x09\x00\x66\x81\x25\x0A\x1B\x09\x00\x03\x00\x5B\x66" \
-        "\x8B\x05\x0A\x1B\x09\x00\x66\x89\x83\x38\x24\x00\x00\xBB\x05\x00" \
-        "\x00\x00\xC1\xE3\x01\x53\xE9\x05\x00\x00\x00\x90\x00\x00\x00\x00" \
-        "\x66\x89\x3D\x3C\x1B\x09\x00\x66\xC1\x2D\x3C\x1B\x09\x00\x02\xE9" \
-        "\x04\x00\x00\x00\x00\x00\x00\x00\x66\x8B\x05\x3C\x1B\x09\x00\x66" \
-        "\x89\x05\x54\x1B\x09\x00\x66\x81\x25\x54\x1B\x09\x00\x01\x00\x5B" \
-        "\x66\x8B\x05\x54\x1B\x09\x00\x66\x89\x83\x38\x24\x00\x00\xBB\x06" \
-        "\x00\x00\x00\xC1\xE3\x01\x53\xE9\x04\x00\x00\x00\x00\x00\x00\x00" \
-        "\x66\x89\x3D\x8C\x1B\x09\x00\x66\xC1\x2D\x8C\x1B\x09\x00\x03\xE9" \
-        "\x04\x00\x00\x00\x00\x00\x00\x00\x66\x8B\x05\x8C\x1B\x09\x00\x66" \
-        "\x89\x05\xA4\x1B\x09\x00\x66\x81\x25\xA4\x1B\x09\x00\x01\x00\x5B" \
-        "\x66\x8B\x05\xA4\x1B\x09\x00\x66\x89\x83\x38\x24\x00\x00\x66\xB9" \
-        "\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2" \
-        "\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-p679 = \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E" \
-        "\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00" \
-        "\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57" \
-        "\x8E\x00\x57\x8E\x00\x57\x8E\x00\x57\x8E\x00\x50\x73\x01\x00\x00"
-
-p691 = \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00" \
-        "\x00\x00\x00\x00\x66\xC7\x05\xE0\x1E\x09\x00\x05\x00\x66\x8B\x0D" \
-        "\x28\x24\x00\x00\x66\xD3\x2D\xE0\x1E\x09\x00\x66\x8B\x05\xE0\x1E" \
-        "\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80" \
-        "\x00\x40\x66\xC7\xC7\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8" \
-        "\x10\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x3C\x00" \
-        "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00" \
-        "\xEB\xCE\x66\xC1\xEF\x01\x31\xC0\x66\x0B\x05\x28\x80\x00\x80\xB4" \
-        "\x00\x66\x3D\x00\x00\x0F\x84\x05\x00\x00\x00\x66\x81\xCF\x00\x20" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xC4\x66\x8B" \
-        "\xCF\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02" \
-        "\xFB\xFF\x25\x44\x11\x00\x00"
-
-p535 = \
-        "\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8" \
-        "\x0F\x87\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24" \
-        "\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00" \
-        "\x00\x00\x00\x00\x66\xC7\x05\x50\x0B\x09\x00\x00\x00\x66\x8B\x0D" \
-        "\x28\x24\x00\x00\x66\xD3\x2D\x50\x0B\x09\x00\x66\x8B\x05\x50\x0B" \
-        "\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05" \
-        "\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80" \
-        "\x04\x40\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7" \
-        "\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0" \
-        "\xFF\xFF\x00\x00\xFF\xF0\xB8\x0E\x00\x00\x00\x59\x39\xC8\x0F\x87" \
-        "\x15\x00\x00\x00\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00" \
-        "\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00" \
-        "\x00\x00\x66\xC7\x05\xDE\x0B\x09\x00\x00\x00\x66\x8B\x0D\x28\x24" \
-        "\x00\x00\x66\xD3\x2D\xDE\x0B\x09\x00\x66\x8B\x05\xDE\x0B\x09\x00" \
-        "\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80" \
-        "\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x04\x40" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\x66\xC7\x05\x32" \
-        "\x24\x00\x00\x07\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00" \
-        "\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x52\x00\x00\x00" \
-        "\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE" \
-        "\xE9\x05\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x76\x0C\x09" \
-        "\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x76\x0C\x09" \
-        "\x00\x66\x8B\x05\x76\x0C\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05" \
-        "\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40" \
-        "\xEB\xAE\x66\xFF\x0D\x32\x24\x00\x00\x66\x8B\x05\x32\x24\x00\x00" \
-        "\x66\x3D\x00\x00\x0F\x85\x6B\xFF\xFF\xFF\x66\xC7\x05\x28\x24\x00" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00" \
-        "\xE9\x51\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28" \
-        "\x24\x00\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7" \
-        "\x05\x0A\x0D\x09\x00\x04\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3" \
-        "\x2D\x0A\x0D\x09\x00\x66\x8B\x05\x0A\x0D\x09\x00\x81\xE0\xFF\xFF" \
-        "\x00\x00\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05" \
-        "\x24\x80\x04\x40\xEB\xAF\x88\x05\x28\x80\x00\x40\x66\xC7\xC7\x00" \
-        "\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-        "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x10\x00\x00\x00\x59\x39" \
-        "\xC8\x0F\x87\x15\x00\x00\x00\xE9\x3C\x00\x00\x00\x66\x8B\x05\x28" \
-        "\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\x66\xC1\xEF\x01" \
-        "\x31\xC0\x66\x0B\x05\x28\x80\x00\x80\xB4\x00\x66\x3D\x00\x00\x0F" \
-        "\x84\x05\x00\x00\x00\x66\x81\xCF\x00\x20\x88\x05\x24\x80\x06\x40" \
-        "\x88\x05\x24\x80\x04\x40\xEB\xC4\x66\x81\xE7\xF0\x3F\x66\x8B\xC7" \
-        "\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\xF0\x3F\x00\x00\x59\x39\xC8" \
-        "\x0F\x85\x12\x00\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44" \
-        "\x11\x00\x00\xE9\x0D\x00\x00\x00\x66\xB9\x01\x00\xB2\x02\xFB\xFF" \
-        "\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11" \
-        "\x00\x00"
-
-p567 = \
-        "\xE9\x03\x00\x00\x00\x90\x00\x00\x66\xC7\x05\x20\x24\x00\x00\x00" \
-        "\x00\x88\x05\x24\x80\x04\x40\x88\x05\x28\x80\x00\x40\x66\x8B\x05" \
-        "\x12\x24\x00\x00\x66\x89\x05\x36\x24\x00\x00\x66\x8B\x05\x10\x24" \
-        "\x00\x00\x66\x89\x05\x18\x24\x00\x00\x66\x8B\x05\x18\x24\x00\x00" \
-        "\x66\x89\x05\xE6\x11\x09\x00\x66\x8B\x05\xE6\x11\x09\x00\x66\x3D" \
-        "\x00\x00\x0F\x84\x94\x00\x00\x00\x66\xC7\x05\x28\x24\x00\x00\x00" \
-        "\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0" \
-        "\xB8\x06\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x51" \
-        "\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00" \
-        "\x00\xEB\xCE\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\xC7\x05\x78" \
-        "\x12\x09\x00\x06\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x78" \
-        "\x12\x09\x00\x66\x8B\x05\x78\x12\x09\x00\x81\xE0\xFF\xFF\x00\x00" \
-        "\x88\x05\x28\x80\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80" \
-        "\x04\x40\xEB\xAF\x66\xFF\x0D\x18\x24\x00\x00\x66\x8B\x05\x18\x24" \
-        "\x00\x00\x66\x3D\x00\x00\x0F\x85\x6C\xFF\xFF\xFF\x66\xC7\x05\x18" \
-        "\x24\x00\x00\x00\x00\x66\xC7\x05\xE6\x11\x09\x00\x01\x00\x66\x8B" \
-        "\x05\x36\x24\x00\x00\x66\xFF\x0D\x36\x24\x00\x00\x66\x3D\x00\x00" \
-        "\x0F\x85\x31\xFF\xFF\xFF\x66\x8B\x05\x16\x24\x00\x00\x66\x89\x05" \
-        "\x36\x24\x00\x00\x66\x8B\x05\x14\x24\x00\x00\x66\x89\x05\x18\x24" \
-        "\x00\x00\x66\x8B\x05\x18\x24\x00\x00\x66\x89\x05\xE6\x11\x09\x00" \
-        "\x66\x8B\x05\xE6\x11\x09\x00\x66\x3D\x00\x00\x0F\x84\xB7\x01\x00" \
-        "\x00\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28\x24\x00" \
-        "\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00\x59\x39" \
-        "\xC8\x0F\x87\x15\x00\x00\x00\xE9\x52\x00\x00\x00\x66\x8B\x05\x28" \
-        "\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x05\x00\x00" \
-        "\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x72\x13\x09\x00\x04\x00\x66" \
-        "\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x72\x13\x09\x00\x66\x8B\x05" \
-        "\x72\x13\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80\x00\x80" \
-        "\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAE\x88\x05" \
-        "\x28\x80\x00\x40\x66\xC7\xC7\x00\x00\x66\xC7\x05\x28\x24\x00\x00" \
-        "\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF" \
-        "\xF0\xB8\x10\x00\x00\x00\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9" \
-        "\x3C\x00\x00\x00\x66\x8B\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24" \
-        "\x00\x00\xEB\xCE\x66\xC1\xEF\x01\x31\xC0\x66\x0B\x05\x28\x80\x00" \
-        "\x80\xB4\x00\x66\x3D\x00\x00\x0F\x84\x05\x00\x00\x00\x66\x81\xCF" \
-        "\x00\x20\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xC4" \
-        "\x66\x50\x66\x8B\xC7\xFB\x66\x50\x66\x53\x66\x51\x8A\xC8\xFF\x15" \
-        "\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\xC1\xE8\x08\xFB" \
-        "\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B" \
-        "\xFA\x66\x58\x66\xC7\x05\x28\x24\x00\x00\x00\x00\x66\x8B\x05\x28" \
-        "\x24\x00\x00\x81\xE0\xFF\xFF\x00\x00\xFF\xF0\xB8\x06\x00\x00\x00" \
-        "\x59\x39\xC8\x0F\x87\x15\x00\x00\x00\xE9\x52\x00\x00\x00\x66\x8B" \
-        "\x05\x28\x24\x00\x00\x66\xFF\x05\x28\x24\x00\x00\xEB\xCE\xE9\x05" \
-        "\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x94\x14\x09\x00\x06" \
-        "\x00\x66\x8B\x0D\x28\x24\x00\x00\x66\xD3\x2D\x94\x14\x09\x00\x66" \
-        "\x8B\x05\x94\x14\x09\x00\x81\xE0\xFF\xFF\x00\x00\x88\x05\x28\x80" \
-        "\x00\x80\x88\x05\x24\x80\x06\x40\x88\x05\x24\x80\x04\x40\xEB\xAE" \
-        "\x66\xFF\x0D\x18\x24\x00\x00\x66\x8B\x05\x18\x24\x00\x00\x66\x3D" \
-        "\x00\x00\x0F\x85\x49\xFE\xFF\xFF\x66\xC7\x05\x18\x24\x00\x00\x00" \
-        "\x00\x66\xC7\x05\xE6\x11\x09\x00\x01\x00\x66\x8B\x05\x36\x24\x00" \
-        "\x00\x66\xFF\x0D\x36\x24\x00\x00\x66\x3D\x00\x00\x0F\x85\x0E\xFE" \
-        "\xFF\xFF\x88\x05\x24\x80\x04\x40\x66\xB9\x00\x00\xB2\x00\xFB\xFF" \
-        "\x25\x44\x11\x00\x00"
-
-# my_fw.py
-p723 = \
-        "\x53\x55\x56\x57\x6A\x01\xE8\xB5\x1E\x00\x00\x8B\x5C\x24\x18\x8B" \
-        "\x7C\x24\x1C\x83\xC4\x04\x8D\x6B\xFF\x68\xE8\x03\x00\x00\xE8\x6D" \
-        "\x1E\x00\x00\x83\xC4\x04\x8B\xF5\x66\x85\xDB\x74\x47\x6A\x03\xE8" \
-        "\x8C\x1E\x00\x00\x8B\xC7\x66\x8B\xCE\x66\xD3\xE8\x24\x01\xF6\xD8" \
-        "\x1B\xC0\x25\xC2\x01\x00\x00\x05\x96\x00\x00\x00\x50\xE8\x3E\x1E" \
-        "\x00\x00\x6A\x01\xE8\x67\x1E\x00\x00\x68\xF4\x01\x00\x00\xE8\x2D" \
-        "\x1E\x00\x00\x66\x8B\xCE\x83\xC4\x10\x81\xC6\xFF\xFF\x00\x00\x66" \
-        "\x85\xC9\x75\xB9\x68\xE8\x03\x00\x00\xE8\x12\x1E\x00\x00\x83\xC4" \
-        "\x04\x66\x83\x7C\x24\x1C\x00\x74\x90\x5F\x5E\x5D\x5B\xC3\x90\x90" \
-        "\x6A\x00\x6A\x00\x6A\x03\xE8\x65\xFF\xFF\xFF\x83\xC4\x0C\xCF\x90" \
-        "\x6A\x00\x6A\x01\x6A\x03\xE8\x55\xFF\xFF\xFF\x83\xC4\x0C\xCF\x90" \
-        "\x6A\x00\x6A\x03\x6A\x03\xE8\x45\xFF\xFF\xFF\x83\xC4\x0C\xCF\x90" \
-        "\x60\x8B\xEC\x83\xEC\x10\x66\xA1\x30\x00\x00\x00\xB1\x01\x66\x89" \
-        "\x45\xF0\xE8\x79\x54\x00\x00\x66\x8B\x5D\x14\x8A\xCB\xE8\x6E\x54" \
-        "\x00\x00\x33\xC9\x8A\xCF\xE8\x65\x54\x00\x00\xB8\x01\x00\x00\x00" \
-        "\xBF\x0C\x80\x00\x00\x66\x39\x05\xCC\x1F\x00\x00\x89\x45\xF8\x0F" \
-        "\x82\x29\x01\x00\x00\x8B\x0D\x68\x25\x00\x00\x25\xFF\xFF\x00\x00" \
-        "\x66\x8B\x04\x41\x66\xD1\xE8\x25\xFF\xFF\x00\x00\x66\x8B\x14\x85" \
-        "\x00\x00\x00\x00\x8B\xC8\x83\xE1\x03\xBB\x01\x00\x00\x00\x83\xC1" \
-        "\x02\x33\xF6\x66\x89\x55\xF4\xBA\x00\x80\x00\x00\x8D\x0C\x89\x89" \
-        "\x55\xFC\xD3\xE3\xC1\xE8\x02\x89\x75\x14\x8D\x8C\x83\x00\x00\x00" \
-        "\x80\x8B\x1D\xD0\x10\x00\x00\x03\xD6\x8B\xC2\x25\xFF\xFF\x00\x00" \
-        "\x03\xD8\x83\xCB\x01\x66\x89\x1D\x90\x40\x00\xC0\x66\x89\x3D\x50" \
-        "\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x7B\x00\x66\xC7\x05\x50" \
-        "\x40\x00\xC0\x0C\xC0\x66\xC7\x05\x14\x22\x00\xC0\x7B\x00\x66\xC7" \
-        "\x05\x14\x22\x00\xC0\x3B\x00\x66\x89\x3D\x50\x40\x00\xC0\x8B\x1D" \
-        "\xD0\x10\x00\x00\x03\xD8\x83\xCB\x01\x66\x89\x1D\x90\x40\x00\xC0" \
-        "\x66\x89\x3D\x50\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x7B\x00" \
-        "\x66\xC7\x05\x50\x40\x00\xC0\x0C\xC0\x66\xC7\x05\x14\x22\x00\xC0" \
-        "\x7B\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\x89\x3D\x50\x40" \
-        "\x00\xC0\x8A\x01\x80\x39\x00\x74\x02\x8B\xF2\x66\xD1\x6D\xFC\x8B" \
-        "\x55\xFC\xF6\xC6\xFE\x0F\x85\x56\xFF\xFF\xFF\x8A\x45\xF4\x89\x75" \
-        "\x14\x66\xC1\x6D\x14\x09\xA8\x05\x74\x08\x8B\x45\x14\x0C\x80\x89" \
-        "\x45\x14\x8A\x4D\x14\xE8\x36\x53\x00\x00\x8B\x45\xF8\x40\x66\x3B" \
-        "\x05\xCC\x1F\x00\x00\x89\x45\xF8\x0F\x86\xD7\xFE\xFF\xFF\x66\x8B" \
-        "\x4D\xF0\x66\x89\x0D\x90\x40\x00\xC0\x66\x89\x3D\x50\x40\x00\xC0" \
-        "\x66\xC7\x05\x14\x22\x00\xC0\x7B\x00\x66\xC7\x05\x50\x40\x00\xC0" \
-        "\x0C\xC0\x66\xC7\x05\x14\x22\x00\xC0\x7B\x00\x66\xC7\x05\x14\x22" \
-        "\x00\xC0\x3B\x00\x66\x89\x3D\x50\x40\x00\xC0\x8B\xE5\x61\xCF\x90" \
-        "\x60\x8B\xEC\x83\xEC\x00\x66\x83\x3D\x52\x10\x00\x00\x01\x75\x20" \
-        "\xE8\x9B\x1C\x00\x00\xA8\x01\x74\x17\xB8\x02\x00\x00\x00\xA2\x0A" \
-        "\x22\x00\xC0\x80\x0D\x54\x10\x00\x00\x40\x66\xA3\x52\x10\x00\x00" \
-        "\xF6\x05\x00\x40\x00\xC0\x10\x75\x26\xA1\x0C\x11\x00\x00\x8A\x0D" \
-        "\x0C\x11\x00\x00\xC1\xE8\x09\x83\xE0\x04\x83\xE1\x03\x0B\xC1\x50" \
-        "\xE8\xFB\x1B\x00\x00\x83\xC4\x04\x66\xFF\x05\x0C\x11\x00\x00\xE8" \
-        "\x0C\x02\x00\x00\x33\xD2\x33\xC9\xBE\x00\x00\x00\x00\x8B\xC2\x83" \
-        "\xE0\x03\x66\x85\xC0\x74\x10\x66\x3D\x01\x00\x74\x4E\x66\x8B\x46" \
-        "\x02\x66\xA3\x30\x40\x00\xC0\x66\x8B\x06\x66\xA3\x90\x40\x00\xC0" \
-        "\x8B\xC1\x80\xCC\x80\x66\xA3\x50\x40\x00\xC0\x66\xC7\x05\x14\x22" \
-        "\x00\xC0\x7B\x00\x8B\xF9\x81\xCF\x00\xC0\x00\x00\x66\x89\x3D\x50" \
-        "\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x7B\x00\x66\xC7\x05\x14" \
-        "\x22\x00\xC0\x3B\x00\x66\xA3\x50\x40\x00\xC0\x42\x41\x83\xC6\x04" \
-        "\x66\x83\xFA\x20\x72\x97\xB9\x20\x00\x00\x00\xBA\x80\x00\x00\x00" \
-        "\x8B\xF1\x66\x8B\x42\x02\x66\xA3\x30\x40\x00\xC0\x66\x8B\x02\x66" \
-        "\xA3\x90\x40\x00\xC0\x8B\xC1\x80\xCC\x80\x66\xA3\x50\x40\x00\xC0" \
-        "\x66\xC7\x05\x14\x22\x00\xC0\x7B\x00\x8B\xF9\x81\xCF\x00\xC0\x00" \
-        "\x00\x66\x89\x3D\x50\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x7B" \
-        "\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xA3\x50\x40\x00\xC0" \
-        "\x41\x83\xC2\x04\x4E\x75\xAB\x33\xD2\x66\x39\x15\x76\x25\x00\x00" \
-        "\x76\x7E\x8B\xCA\x33\xC0\x81\xE1\xFF\xFF\x00\x00\x66\x8B\x04\x4D" \
-        "\x10\x20\x00\x00\x8D\x0C\x4D\x10\x20\x00\x00\x66\x8B\x34\x85\x02" \
-        "\x00\x00\x00\x66\x89\x35\x30\x40\x00\xC0\x66\x8B\x34\x85\x00\x00" \
-        "\x00\x00\x66\x89\x35\x90\x40\x00\xC0\x80\xCC\x80\x66\xA3\x50\x40" \
-        "\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x7B\x00\x66\x8B\x01\x80\xCC" \
-        "\xC0\x66\xA3\x50\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x7B\x00" \
-        "\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\x8B\x09\x80\xCD\x80\x66" \
-        "\x89\x0D\x50\x40\x00\xC0\x42\x66\x3B\x15\x76\x25\x00\x00\x72\x82" \
-        "\xE8\x0B\x00\x00\x00\x8B\xE5\x61\xCF\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA0\x72\x46\x00\x00\x24\x01\x3C\x01\x75\x72\x66\x83\x3D\x78\x25" \
-        "\x00\x00\x01\x74\x68\x66\x83\x3D\xC0\x45\x00\x00\x00\x75\x5E\x66" \
-        "\x83\x3D\x70\x46\x00\x00\x00\x74\x54\x66\x8B\x0D\x70\x46\x00\x00" \
-        "\x49\x66\x89\x0D\x70\x46\x00\x00\x66\x83\x3D\x70\x46\x00\x00\x00" \
-        "\x75\x3B\xE8\x39\x00\x00\x00\x85\xC0\x74\x2D\x8B\x15\xB8\x45\x00" \
-        "\x00\xA1\xBC\x45\x00\x00\x3B\xD0\x73\x0E\xE8\x11\x55\x00\x00\x85" \
-        "\xC0\x74\x05\xE8\x38\x55\x00\x00\xE8\x13\x00\x00\x00\x85\xC0\x74" \
-        "\x07\xB1\x0A\xE8\x98\x50\x00\x00\xE9\xB7\x32\x00\x00\xC3\x90\x90" \
-        "\xF6\x05\x03\x22\x00\xC0\x01\x74\x0F\xF6\x05\x01\x22\x00\xC0\x02" \
-        "\x75\x06\xB8\x01\x00\x00\x00\xC3\x33\xC0\xC3\x90\x90\x90\x90\x90" \
-        "\x66\xA1\xCE\x10\x00\x00\x40\x66\xA3\x90\x40\x00\xC0\x66\xC7\x05" \
-        "\x50\x40\x00\xC0\x00\x80\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66" \
-        "\xC7\x05\x10\x40\x00\xC0\x01\x00\x6A\x02\xE8\x51\x00\x00\x00\x66" \
-        "\xC7\x05\x10\x40\x00\xC0\x00\x00\x66\x8B\x0D\xCE\x10\x00\x00\x8B" \
-        "\x15\x58\x46\x00\x00\x03\xD1\x66\x89\x15\x90\x40\x00\xC0\x66\xC7" \
-        "\x05\x50\x40\x00\xC0\x00\x80\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00" \
-        "\x66\xC7\x05\x10\x40\x00\xC0\x02\x00\x6A\x01\xE8\x10\x00\x00\x00" \
-        "\x83\xC4\x08\x66\xC7\x05\x10\x40\x00\xC0\x00\x00\xC3\x90\x90\x90" \
-        "\x55\x8B\xEC\x33\xC0\x66\x8B\x45\x08\xB9\x14\x00\x00\x00\xF7\xE1" \
-        "\x8B\xC8\xC6\x05\x14\x22\x00\xC0\x9B\xE2\xF7\x5D\xC3\x90\x90\x90" \
-        "\x66\xA1\x7A\x47\x00\x00\x66\x3D\x10\x00\x74\x22\x66\x3D\x11\x00" \
-        "\x74\x1C\x66\x3D\x12\x00\x74\x16\x66\x3D\x13\x00\x74\x10\x66\x3D" \
-        "\x15\x00\x74\x0A\x66\x3D\x14\x00\x74\x04\x66\x33\xC0\xC3\x66\xB8" \
-        "\x01\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x51\x6A\x15\x66\xC7\x05\xD0\x10\x00\x00\x00\x00\xE8\xD6\x23\x00" \
-        "\x00\x25\xF0\xFF\x00\x00\x83\xC4\x04\x89\x44\x24\x00\x25\xFF\xFF" \
-        "\x00\x00\x8B\xC8\xC1\xE9\x04\xC1\xE8\x06\x8D\x0C\x49\x8D\x14\x48" \
-        "\x66\xA1\xCE\x10\x00\x00\x81\xFA\x2C\x01\x00\x00\x7F\x05\x66\x8B" \
-        "\x44\x24\x00\x66\xA3\xD0\x10\x00\x00\x59\xC3\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x08\x8B\x4C\x24\x04\xC1\xE0\x02\x66\x83\xF9\x04\x75" \
-        "\x04\x83\xC0\x02\xC3\x66\x83\xF9\x05\x75\x04\x83\xC0\x03\xC3\x8D" \
-        "\x44\x08\x20\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x55\x8B\xEC\x81\xEC\xE4\x02\x00\x00\x53\x56\x57\x66\xC7\x45\xF4" \
-        "\x00\x00\x66\xC7\x45\xE8\x02\x00\x66\xC7\x45\xFC\xBC\x02\x66\xA1" \
-        "\x20\x10\x00\x00\x66\xA3\x92\x10\x00\x00\x66\x8B\x0D\x22\x10\x00" \
-        "\x00\x66\x89\x0D\xE4\x10\x00\x00\x66\x8B\x15\x26\x10\x00\x00\x66" \
-        "\x89\x15\xE6\x10\x00\x00\xC6\x05\x80\x40\x00\xC0\x03\x6A\x06\x8D" \
-        "\x45\xA0\x50\x6A\x01\xE8\x19\x1C\x00\x00\x83\xC4\x0C\x66\x8B\x4D" \
-        "\xA0\x66\x89\x0D\x7A\x47\x00\x00\x6A\x06\x6A\x1F\x6A\x10\x8D\x55" \
-        "\xC4\x52\x6A\x01\xE8\xC7\x18\x00\x00\x83\xC4\x14\x8B\x45\xC4\x25" \
-        "\xFF\xFF\x00\x00\x3D\x0C\xC1\x00\x00\x75\x0B\x66\xC7\x05\x78\x47" \
-        "\x00\x00\xA4\x06\xEB\x09\x66\xC7\x05\x78\x47\x00\x00\x40\x06\xE8" \
-        "\x9C\xFE\xFF\xFF\x0F\xBF\xC8\x85\xC9\x74\x0B\x66\xC7\x05\x74\x47" \
-        "\x00\x00\x60\x00\xEB\x09\x66\xC7\x05\x74\x47\x00\x00\x58\x00\xE8" \
-        "\x9F\x1E\x00\x00\x25\xFF\xFF\x00\x00\x85\xC0\x74\x0E\x6A\x00\x6A" \
-        "\x02\x6A\x03\xE8\xE8\xF8\xFF\xFF\x83\xC4\x0C\x66\x8B\x15\xA6\x10" \
-        "\x00\x00\x52\x68\x50\x46\x00\x00\x6A\x00\xE8\x84\x1B\x00\x00\x83" \
-        "\xC4\x0C\x25\xFF\xFF\x00\x00\x85\xC0\x75\x20\x33\xC0\x66\xA1\x58" \
-        "\x46\x00\x00\x3D\x01\x90\x00\x00\x7C\x11\x33\xC9\x66\x8B\x0D\x58" \
-        "\x46\x00\x00\x81\xF9\x01\x9C\x00\x00\x7E\x3E\xB9\x08\x00\x00\x00" \
-        "\xBE\x18\x11\x00\x00\xBF\x50\x46\x00\x00\xF3\xA5\x83\x3D\x10\x11" \
-        "\x00\x00\x00\x74\x1A\x6A\x01\x6A\x01\x6A\x02\xE8\x80\xF8\xFF\xFF" \
-        "\x83\xC4\x0C\xC7\x05\x10\x11\x00\x00\x00\x00\x00\x00\xEB\x0A\x6A" \
-        "\x01\xE8\x2A\x17\x00\x00\x83\xC4\x04\xE8\x56\x2F\x00\x00\x33\xD2" \
-        "\x66\x8B\x15\x24\x10\x00\x00\x85\xD2\x0F\x84\x92\x00\x00\x00\x33" \
-        "\xC0\x66\xA1\x00\x40\x00\xC0\x83\xE0\x20\xF7\xD8\x1B\xC0\x40\x66" \
-        "\x89\x45\xF4\x8B\x4D\xF4\x81\xE1\xFF\xFF\x00\x00\x85\xC9\x75\x6F" \
-        "\x6A\x06\x8D\x95\x80\xFD\xFF\xFF\x52\x6A\x02\xE8\xD3\x1A\x00\x00" \
-        "\x83\xC4\x0C\x8B\x85\x80\xFD\xFF\xFF\x25\xFF\xFF\x00\x00\x33\xC9" \
-        "\x83\xF8\x2E\x0F\x94\xC1\x66\x89\x4D\xF4\x8B\x55\xF4\x81\xE2\xFF" \
-        "\xFF\x00\x00\x85\xD2\x74\x38\x8B\x85\x9E\xFD\xFF\xFF\x25\xFF\xFF" \
-        "\x00\x00\x3D\xFF\xFF\x00\x00\x74\x26\x8B\x8D\x9E\xFD\xFF\xFF\x81" \
-        "\xE1\xFF\xFF\x00\x00\x85\xC9\x74\x16\x66\x8B\x95\x9E\xFD\xFF\xFF" \
-        "\x66\x89\x55\xFC\x66\x8B\x85\x9C\xFD\xFF\xFF\x66\x89\x45\xE8\xEB" \
-        "\x06\x66\xC7\x45\xF4\x00\x00\x66\x8B\x4D\xF4\x51\xE8\xD3\x13\x00" \
-        "\x00\x83\xC4\x04\x66\xC7\x05\x98\x10\x00\x00\x30\x00\x66\xC7\x05" \
-        "\xA0\x10\x00\x00\xC0\x00\x66\xC7\x05\x80\x25\x00\x00\x00\x00\x8B" \
-        "\x55\xF4\x81\xE2\xFF\xFF\x00\x00\x85\xD2\x74\x12\x66\x8B\x45\xFC" \
-        "\x50\x66\x8B\x4D\xE8\x51\xE8\xF5\x40\x00\x00\x83\xC4\x08\x66\xC7" \
-        "\x05\x78\x25\x00\x00\x00\x00\x66\xC7\x05\x74\x25\x00\x00\x00\x00" \
-        "\x66\x8B\x15\x22\x10\x00\x00\x52\x66\xA1\x20\x10\x00\x00\x50\xE8" \
-        "\xAC\x4B\x00\x00\x83\xC4\x08\xE8\x07\x1E\x00\x00\xE8\x2F\x50\x00" \
-        "\x00\xC7\x05\xBC\x45\x00\x00\x00\x00\x00\x00\x6A\x00\x68\x34\x47" \
-        "\x00\x00\xE8\xFD\x57\x00\x00\x83\xC4\x08\x85\xC0\x74\x1F\x6A\x00" \
-        "\xE8\x3F\x13\x00\x00\x83\xC4\x04\x6A\x01\xE8\xD1\x15\x00\x00\x83" \
-        "\xC4\x04\x8A\x0D\x76\x47\x00\x00\xE8\x03\x46\x00\x00\x66\xC7\x05" \
-        "\x56\x10\x00\x00\x24\x00\xC7\x05\xC8\x1E\x00\x00\xD0\x4A\x01\x00" \
-        "\xC7\x05\xC4\x1E\x00\x00\xD0\x4A\x01\x00\xC7\x05\xCC\x1E\x00\x00" \
-        "\x00\x4F\x01\x00\xC7\x05\xD0\x1E\x00\x00\xD0\x4A\x01\x00\xE8\x61" \
-        "\x2E\x00\x00\x66\xC7\x05\x72\x46\x00\x00\x00\x00\x33\xC9\x66\x8B" \
-        "\x0D\x78\x47\x00\x00\x81\xF9\x40\x06\x00\x00\x75\x0C\xC7\x05\x84" \
-        "\x25\x00\x00\xB4\x36\x01\x00\xEB\x0A\xC7\x05\x84\x25\x00\x00\xD4" \
-        "\x36\x01\x00\xFF\x15\xC8\x1E\x00\x00\x66\x33\xD2\x8A\xD0\x66\x89" \
-        "\x95\x7C\xFD\xFF\xFF\x8B\x85\x7C\xFD\xFF\xFF\x25\xFF\xFF\x00\x00" \
-        "\x3D\x80\x00\x00\x00\x7C\x15\x66\x8B\x8D\x7C\xFD\xFF\xFF\x51\xE8" \
-        "\xC0\x14\x00\x00\x83\xC4\x04\xE9\x13\x0F\x00\x00\x8B\x95\x7C\xFD" \
-        "\xFF\xFF\x81\xE2\xFF\xFF\x00\x00\x89\x95\x28\xFD\xFF\xFF\x83\xBD" \
-        "\x28\xFD\xFF\xFF\x57\x0F\x87\xE6\x0E\x00\x00\x8B\x85\x28\xFD\xFF" \
-        "\xFF\xFF\x24\x85\xB4\x18\x01\x00\x66\x8B\x0D\x88\x10\x00\x00\x51" \
-        "\xE8\x1B\x46\x00\x00\x83\xC4\x04\xE9\xD2\x0E\x00\x00\x0F\x09\xB1" \
-        "\x84\xFF\x15\xCC\x1E\x00\x00\x66\xC7\x85\x7C\xFD\xFF\xFF\x00\x00" \
-        "\xEB\x12\x66\x8B\x95\x7C\xFD\xFF\xFF\x66\x83\xC2\x01\x66\x89\x95" \
-        "\x7C\xFD\xFF\xFF\x8B\x85\x7C\xFD\xFF\xFF\x25\xFF\xFF\x00\x00\x3D" \
-        "\x84\x00\x00\x00\x73\x1A\x8B\x8D\x7C\xFD\xFF\xFF\x81\xE1\xFF\xFF" \
-        "\x00\x00\x8A\x89\x88\x10\x00\x00\xFF\x15\xCC\x1E\x00\x00\xEB\xC2" \
-        "\xE9\x7A\x0E\x00\x00\xE8\x49\x1C\x00\x00\xE9\x70\x0E\x00\x00\xE8" \
-        "\xDC\x14\x00\x00\x50\xE8\xA6\x45\x00\x00\x83\xC4\x04\xE9\x5D\x0E" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x10\x24\x00\x00\xE9\x4D\x0E" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x11\x24\x00\x00\xE9\x3D\x0E" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x12\x24\x00\x00\xE9\x2D\x0E" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x13\x24\x00\x00\xE9\x1D\x0E" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x14\x24\x00\x00\xE9\x0D\x0E" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x15\x24\x00\x00\xE9\xFD\x0D" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x16\x24\x00\x00\xE9\xED\x0D" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x17\x24\x00\x00\xE9\xDD\x0D" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\x66\x33\xD2\x8A\xD0\x52\xE8\xDD" \
-        "\x13\x00\x00\x83\xC4\x04\xE9\xC4\x0D\x00\x00\xFF\x15\xC4\x1E\x00" \
-        "\x00\x66\x0F\xB6\xC0\x66\x89\x85\x7C\xFD\xFF\xFF\x8B\x8D\x7C\xFD" \
-        "\xFF\xFF\x81\xE1\xFF\xFF\x00\x00\x85\xC9\x75\x14\xC7\x45\xEC\x50" \
-        "\x46\x00\x00\x66\x8B\x15\xA6\x10\x00\x00\x66\x89\x55\xF8\xEB\x0F" \
-        "\x8D\x85\xA0\xFD\xFF\xFF\x89\x45\xEC\x66\xC7\x45\xF8\x06\x00\x66" \
-        "\x8B\x4D\xF8\x51\x8B\x55\xEC\x52\x66\x8B\x85\x7C\xFD\xFF\xFF\x50" \
-        "\xE8\x6E\x17\x00\x00\x83\xC4\x0C\x66\xC7\x45\xE4\x00\x00\xEB\x0C" \
-        "\x66\x8B\x4D\xE4\x66\x83\xC1\x01\x66\x89\x4D\xE4\x8B\x55\xE4\x81" \
-        "\xE2\xFF\xFF\x00\x00\x83\xFA\x10\x7D\x1A\x8B\x45\xE4\x25\xFF\xFF" \
-        "\x00\x00\x8B\x4D\xEC\x66\x8B\x14\x41\x52\xE8\x71\x44\x00\x00\x83" \
-        "\xC4\x04\xEB\xCC\xE9\x26\x0D\x00\x00\xFF\x15\xC4\x1E\x00\x00\x66" \
-        "\x0F\xB6\xC0\x50\xE8\x9A\x1C\x00\x00\x83\xC4\x04\xE9\x0E\x0D\x00" \
-        "\x00\xE8\x5D\x1B\x00\x00\xE9\x04\x0D\x00\x00\xFF\x15\xC4\x1E\x00" \
-        "\x00\x66\x33\xC9\x8A\xC8\x66\x89\x4D\xE4\x8B\x4D\xE4\x81\xE1\xFF" \
-        "\xFF\x00\x00\x83\xC1\x01\xFF\x15\xCC\x1E\x00\x00\xE9\xDE\x0C\x00" \
-        "\x00\xE8\x2A\x41\x00\x00\x89\x85\x74\xFD\xFF\xFF\xE8\xFF\x40\x00" \
-        "\x00\x66\x89\x85\x78\xFD\xFF\xFF\xE8\xF3\x40\x00\x00\x8B\x95\x74" \
-        "\xFD\xFF\xFF\x66\x89\x02\x8B\x85\x74\xFD\xFF\xFF\x83\xC0\x02\x89" \
-        "\x85\x74\xFD\xFF\xFF\x66\x8B\x8D\x78\xFD\xFF\xFF\x66\x83\xE9\x01" \
-        "\x66\x89\x8D\x78\xFD\xFF\xFF\x8B\x95\x78\xFD\xFF\xFF\x81\xE2\xFF" \
-        "\xFF\x00\x00\x85\xD2\x75\xC1\xE9\x83\x0C\x00\x00\xE8\xAF\x40\x00" \
-        "\x00\x66\xA3\x74\x47\x00\x00\x66\xC7\x45\xE4\x00\x00\xEB\x0C\x66" \
-        "\x8B\x45\xE4\x66\x05\x01\x00\x66\x89\x45\xE4\x8B\x4D\xE4\x81\xE1" \
-        "\xFF\xFF\x00\x00\x33\xD2\x66\x8B\x15\x74\x47\x00\x00\x8B\xC2\x83" \
-        "\xC0\x07\x99\x83\xE2\x07\x03\xC2\xC1\xF8\x03\x3B\xC8\x7D\x17\xFF" \
-        "\x15\xC4\x1E\x00\x00\x8B\x4D\xE4\x81\xE1\xFF\xFF\x00\x00\x88\x81" \
-        "\x10\x46\x00\x00\xEB\xB9\x68\x10\x46\x00\x00\x66\x8B\x15\x74\x47" \
-        "\x00\x00\x52\xE8\xCB\x1B\x00\x00\x83\xC4\x08\x66\xC7\x05\x7A\x25" \
-        "\x00\x00\x00\x00\xE9\x06\x0C\x00\x00\xE8\x32\x40\x00\x00\x66\x89" \
-        "\x85\x70\xFD\xFF\xFF\x66\xC7\x45\xE4\x00\x00\xEB\x0C\x66\x8B\x45" \
-        "\xE4\x66\x05\x01\x00\x66\x89\x45\xE4\x8B\x4D\xE4\x81\xE1\xFF\xFF" \
-        "\x00\x00\x8B\x85\x70\xFD\xFF\xFF\x25\xFF\xFF\x00\x00\x83\xC0\x07" \
-        "\x99\x83\xE2\x07\x03\xC2\xC1\xF8\x03\x3B\xC8\x7D\x17\xFF\x15\xC4" \
-        "\x1E\x00\x00\x8B\x55\xE4\x81\xE2\xFF\xFF\x00\x00\x88\x82\xD0\x1F" \
-        "\x00\x00\xEB\xB9\x68\xD0\x1F\x00\x00\x66\x8B\x85\x70\xFD\xFF\xFF" \
-        "\x50\xE8\x12\x1C\x00\x00\x83\xC4\x08\xE9\x91\x0B\x00\x00\xE8\xBD" \
-        "\x3F\x00\x00\x50\xE8\x7E\x1C\x00\x00\x83\xC4\x04\x50\xE8\xBE\x42" \
-        "\x00\x00\x83\xC4\x04\xE9\x75\x0B\x00\x00\xE8\xA1\x3F\x00\x00\x66" \
-        "\x89\x45\xE4\xE8\x98\x3F\x00\x00\x50\x66\x8B\x4D\xE4\x51\xE8\xC1" \
-        "\x1D\x00\x00\x83\xC4\x08\xE9\x54\x0B\x00\x00\xE8\xA0\x3F\x00\x00" \
-        "\xA3\x68\x25\x00\x00\xE8\x76\x3F\x00\x00\x66\xA3\xCC\x1F\x00\x00" \
-        "\xE9\x3A\x0B\x00\x00\xE8\x66\x3F\x00\x00\x66\xA3\x52\x10\x00\x00" \
-        "\x33\xD2\x66\x8B\x15\x52\x10\x00\x00\x89\x95\x24\xFD\xFF\xFF\x83" \
-        "\xBD\x24\xFD\xFF\xFF\x00\x7C\x22\x83\xBD\x24\xFD\xFF\xFF\x01\x7E" \
-        "\x0B\x83\xBD\x24\xFD\xFF\xFF\x02\x74\x09\xEB\x0E\xE8\x63\x0C\x00" \
-        "\x00\xEB\x07\xC6\x05\x0A\x22\x00\xC0\x02\x66\xC7\x05\x54\x10\x00" \
-        "\x00\x00\x00\xE9\xE7\x0A\x00\x00\xFF\x15\xC4\x1E\x00\x00\x66\x0F" \
-        "\xB6\xC0\x66\x89\x85\x7C\xFD\xFF\xFF\xE8\x02\x3F\x00\x00\x66\x89" \
-        "\x45\xC0\xE8\xF9\x3E\x00\x00\x66\x89\x45\xF0\xFF\x15\xC4\x1E\x00" \
-        "\x00\x66\x33\xC9\x8A\xC8\x66\x89\x4D\xF8\x8D\x95\xA0\xFD\xFF\xFF" \
-        "\x89\x55\xEC\x66\x8B\x45\xF8\x50\x66\x8B\x4D\xF0\x51\x66\x8B\x55" \
-        "\xC0\x52\x8B\x45\xEC\x50\x66\x8B\x8D\x7C\xFD\xFF\xFF\x51\xE8\x5D" \
-        "\x11\x00\x00\x83\xC4\x14\x66\x8B\x55\xC0\x66\x89\x55\xE4\xEB\x0C" \
-        "\x66\x8B\x45\xE4\x66\x05\x01\x00\x66\x89\x45\xE4\x8B\x4D\xE4\x81" \
-        "\xE1\xFF\xFF\x00\x00\x8B\x55\xF0\x81\xE2\xFF\xFF\x00\x00\x3B\xCA" \
-        "\x7F\x25\x8B\x45\xE4\x25\xFF\xFF\x00\x00\x8B\x4D\xC0\x81\xE1\xFF" \
-        "\xFF\x00\x00\x2B\xC1\x8B\x55\xEC\x66\x8B\x04\x42\x50\xE8\x7E\x41" \
-        "\x00\x00\x83\xC4\x04\xEB\xB9\xE9\x33\x0A\x00\x00\xB1\x01\xFF\x15" \
-        "\xCC\x1E\x00\x00\xE9\x26\x0A\x00\x00\xE8\x52\x3E\x00\x00\x66\x89" \
-        "\x85\x6C\xFD\xFF\xFF\x66\x8B\x8D\x6C\xFD\xFF\xFF\x66\x81\xE1\xF0" \
-        "\xFF\x66\x89\x8D\x6C\xFD\xFF\xFF\x66\x8B\x15\x6C\x25\x00\x00\x66" \
-        "\x83\xE2\x0F\x66\x89\x15\x6C\x25\x00\x00\x66\xA1\x6C\x25\x00\x00" \
-        "\x66\x0B\x85\x6C\xFD\xFF\xFF\x66\xA3\x6C\x25\x00\x00\x66\x8B\x0D" \
-        "\x6C\x25\x00\x00\x66\x89\x0D\x1C\x22\x00\xC0\xE9\xCF\x09\x00\x00" \
-        "\xE8\x1B\x3E\x00\x00\x89\x85\x64\xFD\xFF\xFF\xE8\xF0\x3D\x00\x00" \
-        "\x66\x89\x85\x68\xFD\xFF\xFF\x0F\x09\x8B\x95\x64\xFD\xFF\xFF\x66" \
-        "\x8B\x02\x66\x89\x85\x22\xFD\xFF\xFF\x66\x8B\x8D\x22\xFD\xFF\xFF" \
-        "\x51\x8B\x95\x64\xFD\xFF\xFF\x83\xC2\x02\x89\x95\x64\xFD\xFF\xFF" \
-        "\xE8\xCB\x40\x00\x00\x83\xC4\x04\x66\x8B\x85\x68\xFD\xFF\xFF\x66" \
-        "\x2D\x01\x00\x66\x89\x85\x68\xFD\xFF\xFF\x8B\x8D\x68\xFD\xFF\xFF" \
-        "\x81\xE1\xFF\xFF\x00\x00\x85\xC9\x75\xAF\xE9\x60\x09\x00\x00\x66" \
-        "\xC7\x45\xE4\x00\x00\xEB\x0C\x66\x8B\x55\xE4\x66\x83\xC2\x01\x66" \
-        "\x89\x55\xE4\x8B\x45\xE4\x25\xFF\xFF\x00\x00\x83\xF8\x10\x7D\x18" \
-        "\xE8\x6B\x3D\x00\x00\x8B\x4D\xE4\x81\xE1\xFF\xFF\x00\x00\x66\x89" \
-        "\x04\x4D\x50\x46\x00\x00\xEB\xCF\x66\x8B\x15\x50\x46\x00\x00\x52" \
-        "\xE8\xEF\x1B\x00\x00\x83\xC4\x04\xE9\x12\x09\x00\x00\xFF\x15\xC4" \
-        "\x1E\x00\x00\x66\x0F\xB6\xC0\x66\x89\x85\x7C\xFD\xFF\xFF\x8B\x8D" \
-        "\x7C\xFD\xFF\xFF\x81\xE1\xFF\xFF\x00\x00\x85\xC9\x75\x14\xC7\x45" \
-        "\xEC\x50\x46\x00\x00\x66\x8B\x15\xA6\x10\x00\x00\x66\x89\x55\xF8" \
-        "\xEB\x0F\x8D\x85\xA0\xFD\xFF\xFF\x89\x45\xEC\x66\xC7\x45\xF8\x06" \
-        "\x00\x66\xC7\x45\xE4\x00\x00\xEB\x0C\x66\x8B\x4D\xE4\x66\x83\xC1" \
-        "\x01\x66\x89\x4D\xE4\x8B\x55\xE4\x81\xE2\xFF\xFF\x00\x00\x83\xFA" \
-        "\x10\x7D\x17\xE8\xD8\x3C\x00\x00\x8B\x4D\xE4\x81\xE1\xFF\xFF\x00" \
-        "\x00\x8B\x55\xEC\x66\x89\x04\x4A\xEB\xCF\x66\xA1\x50\x46\x00\x00" \
-        "\x50\xE8\x5E\x1B\x00\x00\x83\xC4\x04\x66\x8B\x4D\xF8\x51\x8B\x55" \
-        "\xEC\x52\x66\x8B\x85\x7C\xFD\xFF\xFF\x50\xE8\x34\x15\x00\x00\x83" \
-        "\xC4\x0C\xE9\x68\x08\x00\x00\xE8\xB4\x3C\x00\x00\x89\x85\x60\xFD" \
-        "\xFF\xFF\x55\xFF\x95\x60\xFD\xFF\xFF\x5D\xE9\x50\x08\x00\x00\x66" \
-        "\xC7\x05\x0C\x40\x00\xC0\x01\x00\xE9\x42\x08\x00\x00\x66\xC7\x05" \
-        "\x0C\x40\x00\xC0\x00\x00\xE9\x34\x08\x00\x00\xC6\x05\x18\x22\x00" \
-        "\xC0\x02\xE9\x28\x08\x00\x00\xE8\x54\x3C\x00\x00\x66\xA3\x76\x25" \
-        "\x00\x00\x66\xC7\x45\xE4\x00\x00\xEB\x0C\x66\x8B\x4D\xE4\x66\x83" \
-        "\xC1\x01\x66\x89\x4D\xE4\x8B\x55\xE4\x81\xE2\xFF\xFF\x00\x00\x33" \
-        "\xC0\x66\xA1\x76\x25\x00\x00\x3B\xD0\x7D\x18\xE8\x20\x3C\x00\x00" \
-        "\x8B\x4D\xE4\x81\xE1\xFF\xFF\x00\x00\x66\x89\x04\x4D\x10\x20\x00" \
-        "\x00\xEB\xC7\xE9\xD7\x07\x00\x00\xFF\x15\xC4\x1E\x00\x00\x66\x33" \
-        "\xD2\x8A\xD0\x66\x89\x95\x7C\xFD\xFF\xFF\xE8\xF1\x3B\x00\x00\x66" \
-        "\x89\x45\xC0\xE8\xE8\x3B\x00\x00\x66\x89\x45\xF0\xFF\x15\xC4\x1E" \
-        "\x00\x00\x66\x0F\xB6\xC0\x66\x89\x45\xF8\x8D\x8D\xA0\xFD\xFF\xFF" \
-        "\x89\x4D\xEC\x66\x8B\x55\xC0\x66\x89\x55\xE4\xEB\x0C\x66\x8B\x45" \
-        "\xE4\x66\x05\x01\x00\x66\x89\x45\xE4\x8B\x4D\xE4\x81\xE1\xFF\xFF" \
-        "\x00\x00\x8B\x55\xF0\x81\xE2\xFF\xFF\x00\x00\x3B\xCA\x7F\x22\xE8" \
-        "\x9C\x3B\x00\x00\x8B\x4D\xE4\x81\xE1\xFF\xFF\x00\x00\x8B\x55\xC0" \
-        "\x81\xE2\xFF\xFF\x00\x00\x2B\xCA\x8B\x55\xEC\x66\x89\x04\x4A\xEB" \
-        "\xBC\xE8\x7A\x3B\x00\x00\x66\x89\x85\x5C\xFD\xFF\xFF\x66\x8B\x85" \
-        "\x5C\xFD\xFF\xFF\x50\x66\x8B\x4D\xF8\x51\x66\x8B\x55\xF0\x52\x66" \
-        "\x8B\x45\xC0\x50\x8B\x4D\xEC\x51\x66\x8B\x95\x7C\xFD\xFF\xFF\x52" \
-        "\xE8\x8E\x11\x00\x00\x83\xC4\x18\xE9\x12\x07\x00\x00\x33\xC0\x66" \
-        "\xA1\x56\x10\x00\x00\x83\xF8\x25\x75\x25\x33\xC9\x66\x8B\x0D\x78" \
-        "\x25\x00\x00\x83\xF9\x02\x74\x17\x33\xD2\x66\x8B\x15\x78\x25\x00" \
-        "\x00\x83\xFA\x03\x74\x09\x66\xC7\x05\x78\x25\x00\x00\x01\x00\x33" \
-        "\xC0\x66\xA1\x56\x10\x00\x00\x83\xF8\x27\x75\x09\x32\xC9\xE8\x1D" \
-        "\x3D\x00\x00\xEB\x05\xE8\x36\x39\x00\x00\x66\xC7\x05\x56\x10\x00" \
-        "\x00\x24\x00\xC7\x05\xC8\x1E\x00\x00\xD0\x4A\x01\x00\xC7\x05\xC4" \
-        "\x1E\x00\x00\xD0\x4A\x01\x00\xC7\x05\xCC\x1E\x00\x00\x00\x4F\x01" \
-        "\x00\xC7\x05\xD0\x1E\x00\x00\xD0\x4A\x01\x00\xE9\x8F\x06\x00\x00" \
-        "\x66\xC7\x05\x56\x10\x00\x00\x25\x00\x66\xC7\x05\x78\x25\x00\x00" \
-        "\x00\x00\xE8\x09\x42\x00\x00\xC7\x05\xC8\x1E\x00\x00\x30\x4B\x01" \
-        "\x00\xC7\x05\xC4\x1E\x00\x00\x10\x4C\x01\x00\xC7\x05\xCC\x1E\x00" \
-        "\x00\x20\x4D\x01\x00\xC7\x05\xD0\x1E\x00\x00\x00\x52\x01\x00\xE9" \
-        "\x4B\x06\x00\x00\x8A\x0D\x78\x25\x00\x00\xFF\x15\xCC\x1E\x00\x00" \
-        "\xE9\x3A\x06\x00\x00\x33\xC9\x66\x8B\x0D\x78\x25\x00\x00\x83\xF9" \
-        "\x01\x0F\x85\xB3\x00\x00\x00\x66\xC7\x05\x56\x10\x00\x00\x27\x00" \
-        "\xE8\x7B\x38\x00\x00\xE8\x76\x41\x00\x00\xC7\x05\xC8\x1E\x00\x00" \
-        "\xB0\x4C\x01\x00\xC7\x05\xC4\x1E\x00\x00\xB0\x4C\x01\x00\x33\xD2" \
-        "\x66\x8B\x15\x80\x25\x00\x00\x85\xD2\x74\x4B\x66\xA1\x7C\x25\x00" \
-        "\x00\x66\xA3\x7C\x47\x00\x00\x66\x8B\x0D\x7E\x25\x00\x00\x66\x89" \
-        "\x0D\x7E\x47\x00\x00\xC7\x05\xCC\x1E\x00\x00\x90\x4D\x01\x00\x6A" \
-        "\x00\x6A\x0F\xE8\x7E\x26\x00\x00\x83\xC4\x08\x6A\x02\x33\xD2\x66" \
-        "\x8B\x15\x7E\x25\x00\x00\xF7\xD2\x83\xE2\x0F\x52\xE8\x65\x26\x00" \
-        "\x00\x83\xC4\x08\xEB\x0A\xC7\x05\xCC\x1E\x00\x00\xB0\x4E\x01\x00" \
-        "\xC7\x05\xD0\x1E\x00\x00\x90\x52\x01\x00\x66\xC7\x05\x52\x10\x00" \
-        "\x00\x01\x00\xE8\xEC\x06\x00\x00\x66\xC7\x05\x54\x10\x00\x00\x00" \
-        "\x00\xC6\x05\x76\x47\x00\x00\x14\xEB\x08\xB1\x01\xFF\x15\xCC\x1E" \
-        "\x00\x00\xE9\x68\x05\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x76\x47" \
-        "\x00\x00\xE9\x58\x05\x00\x00\xE8\xD4\x3C\x00\x00\xE9\x4E\x05\x00" \
-        "\x00\xE8\x8A\x3D\x00\x00\xE9\x44\x05\x00\x00\xE8\x79\x18\x00\x00" \
-        "\xE9\x3A\x05\x00\x00\xE8\x9F\x1A\x00\x00\xE9\x30\x05\x00\x00\xE8" \
-        "\x3C\x3E\x00\x00\x6A\x01\xE8\x15\x3F\x00\x00\x83\xC4\x04\xE9\x1C" \
-        "\x05\x00\x00\xE8\xB8\x3F\x00\x00\xE9\x12\x05\x00\x00\xE8\x1E\x3E" \
-        "\x00\x00\xE9\x08\x05\x00\x00\xE8\x04\x0B\x00\x00\x50\xE8\x3E\x3C" \
-        "\x00\x00\x83\xC4\x04\xE9\xF5\x04\x00\x00\x6A\x01\xE8\xDF\x3E\x00" \
-        "\x00\x83\xC4\x04\xE9\xE6\x04\x00\x00\xE8\xE2\x40\x00\x00\xE9\xDC" \
-        "\x04\x00\x00\xE8\x18\x41\x00\x00\xE9\xD2\x04\x00\x00\x66\xC7\x05" \
-        "\x46\x40\x00\xC0\x01\x00\xE9\xC4\x04\x00\x00\x66\xC7\x05\x46\x40" \
-        "\x00\xC0\x00\x00\xE9\xB6\x04\x00\x00\xE8\x02\x39\x00\x00\x50\xE8" \
-        "\x0C\x41\x00\x00\x83\xC4\x04\xE9\xA3\x04\x00\x00\x6A\x00\xE8\x8D" \
-        "\x3E\x00\x00\x83\xC4\x04\xE9\x94\x04\x00\x00\xFF\x15\xC4\x1E\x00" \
-        "\x00\x66\x0F\xB6\xC0\x66\x89\x45\xE4\x8B\x4D\xE4\x81\xE1\xFF\xFF" \
-        "\x00\x00\x81\xF9\xFF\x00\x00\x00\x75\x10\x33\xD2\x66\x8B\x15\x00" \
-        "\x40\x00\xC0\xC1\xFA\x08\x66\x89\x55\xE4\x8A\x45\xE4\xA2\x60\x40" \
-        "\x00\xC0\xE9\x58\x04\x00\x00\xFF\x15\xC4\x1E\x00\x00\xA2\x70\x40" \
-        "\x00\xC0\xE9\x48\x04\x00\x00\xE8\x94\x38\x00\x00\x89\x85\x58\xFD" \
-        "\xFF\xFF\xE8\x69\x38\x00\x00\x8B\x8D\x58\xFD\xFF\xFF\x66\x89\x01" \
-        "\xE9\x2A\x04\x00\x00\xE8\xE6\x3C\x00\x00\xE9\x20\x04\x00\x00\xE8" \
-        "\x1C\x3F\x00\x00\xE9\x16\x04\x00\x00\x68\x10\x46\x00\x00\x66\x8B" \
-        "\x15\x74\x47\x00\x00\x52\xE8\xB8\x13\x00\x00\x83\xC4\x08\xE8\x4D" \
-        "\x38\x00\x00\x50\xE8\xD9\x1A\x00\x00\x83\xC4\x04\xE9\xEE\x03\x00" \
-        "\x00\x66\xA1\x6C\x25\x00\x00\x0C\x08\x66\xA3\x6C\x25\x00\x00\x66" \
-        "\x8B\x0D\x6C\x25\x00\x00\x66\x89\x0D\x1C\x22\x00\xC0\xE9\xCD\x03" \
-        "\x00\x00\x66\x8B\x15\x6C\x25\x00\x00\x66\x81\xE2\xF7\xFF\x66\x89" \
-        "\x15\x6C\x25\x00\x00\x66\xA1\x6C\x25\x00\x00\x66\xA3\x1C\x22\x00" \
-        "\xC0\xE9\xA9\x03\x00\x00\xE8\xF5\x37\x00\x00\xA3\x70\x25\x00\x00" \
-        "\x66\xC7\x05\x74\x25\x00\x00\x01\x00\xE8\xA5\x11\x00\x00\x66\x8B" \
-        "\x0D\x22\x10\x00\x00\x51\x66\x8B\x15\x20\x10\x00\x00\x52\xE8\x2D" \
-        "\x3F\x00\x00\x83\xC4\x08\xE9\x74\x03\x00\x00\xE8\x97\x2B\x00\x00" \
-        "\x50\xE8\xAA\x3A\x00\x00\x83\xC4\x04\xE9\x61\x03\x00\x00\xFF\x15" \
-        "\xC4\x1E\x00\x00\x66\x0F\xB6\xC0\x66\x89\x85\x7C\xFD\xFF\xFF\xE8" \
-        "\x7C\x37\x00\x00\x66\x89\x45\xC0\xE8\x73\x37\x00\x00\x66\x89\x45" \
-        "\xF0\xFF\x15\xC4\x1E\x00\x00\x66\x33\xC9\x8A\xC8\x66\x89\x4D\xF8" \
-        "\x8D\x95\xA0\xFD\xFF\xFF\x89\x55\xEC\x66\x8B\x45\xF8\x50\x66\x8B" \
-        "\x4D\xF0\x51\x66\x8B\x55\xC0\x52\x8B\x45\xEC\x50\x66\x8B\x8D\x7C" \
-        "\xFD\xFF\xFF\x51\xE8\x4E\x0C\x00\x00\x83\xC4\x14\x66\x8B\x55\xC0" \
-        "\x66\x89\x55\xE4\xEB\x0C\x66\x8B\x45\xE4\x66\x05\x01\x00\x66\x89" \
-        "\x45\xE4\x8B\x4D\xE4\x81\xE1\xFF\xFF\x00\x00\x8B\x55\xF0\x81\xE2" \
-        "\xFF\xFF\x00\x00\x3B\xCA\x7F\x25\x8B\x45\xE4\x25\xFF\xFF\x00\x00" \
-        "\x8B\x4D\xC0\x81\xE1\xFF\xFF\x00\x00\x2B\xC1\x8B\x55\xEC\x66\x8B" \
-        "\x04\x42\x50\xE8\xF8\x39\x00\x00\x83\xC4\x04\xEB\xB9\xE9\xAD\x02" \
-        "\x00\x00\xFF\x15\xC4\x1E\x00\x00\x66\x33\xC9\x8A\xC8\x66\x89\x8D" \
-        "\x7C\xFD\xFF\xFF\xE8\xC7\x36\x00\x00\x66\x89\x45\xC0\xE8\xBE\x36" \
-        "\x00\x00\x66\x89\x45\xF0\xFF\x15\xC4\x1E\x00\x00\x66\x33\xD2\x8A" \
-        "\xD0\x66\x89\x55\xF8\x8D\x85\xA0\xFD\xFF\xFF\x89\x45\xEC\x66\x8B" \
-        "\x4D\xC0\x66\x89\x4D\xE4\xEB\x0C\x66\x8B\x55\xE4\x66\x83\xC2\x01" \
-        "\x66\x89\x55\xE4\x8B\x45\xE4\x25\xFF\xFF\x00\x00\x8B\x4D\xF0\x81" \
-        "\xE1\xFF\xFF\x00\x00\x3B\xC1\x7F\x22\xE8\x72\x36\x00\x00\x8B\x55" \
-        "\xE4\x81\xE2\xFF\xFF\x00\x00\x8B\x4D\xC0\x81\xE1\xFF\xFF\x00\x00" \
-        "\x2B\xD1\x8B\x4D\xEC\x66\x89\x04\x51\xEB\xBD\xE8\x50\x36\x00\x00" \
-        "\x66\x89\x85\x54\xFD\xFF\xFF\x66\x8B\x95\x54\xFD\xFF\xFF\x52\x66" \
-        "\x8B\x45\xF8\x50\x66\x8B\x4D\xF0\x51\x66\x8B\x55\xC0\x52\x8B\x45" \
-        "\xEC\x50\x66\x8B\x8D\x7C\xFD\xFF\xFF\x51\xE8\x74\x0E\x00\x00\x83" \
-        "\xC4\x18\xE9\xE8\x01\x00\x00\xFF\x15\xC4\x1E\x00\x00\x88\x85\x50" \
-        "\xFD\xFF\xFF\xFF\x15\xC4\x1E\x00\x00\x88\x85\x4C\xFD\xFF\xFF\x66" \
-        "\x0F\xB6\x95\x4C\xFD\xFF\xFF\x52\x66\x0F\xB6\x85\x50\xFD\xFF\xFF" \
-        "\x50\xE8\x70\x22\x00\x00\x83\xC4\x08\xE9\xB1\x01\x00\x00\xFF\x15" \
-        "\xC4\x1E\x00\x00\x66\x33\xC9\x8A\xC8\x66\x89\x0D\x7A\x25\x00\x00" \
-        "\x33\xD2\x66\x8B\x15\x7A\x25\x00\x00\x85\xD2\x74\x23\x33\xC0\x66" \
-        "\xA1\x78\x47\x00\x00\x3D\xA4\x06\x00\x00\x75\x0A\x6A\x0F\xE8\xF4" \
-        "\x27\x00\x00\x83\xC4\x04\x6A\x0F\xE8\x5A\x29\x00\x00\x83\xC4\x04" \
-        "\xE9\x6A\x01\x00\x00\xE8\xBD\x2B\x00\x00\x50\xE8\xA0\x38\x00\x00" \
-        "\x83\xC4\x04\xE9\x57\x01\x00\x00\xE8\x83\x35\x00\x00\x66\x89\x85" \
-        "\x44\xFD\xFF\xFF\xE8\x77\x35\x00\x00\x66\x89\x85\x48\xFD\xFF\xFF" \
-        "\x66\x8B\x0D\x72\x46\x00\x00\x66\x0B\x8D\x44\xFD\xFF\xFF\x66\x89" \
-        "\x0D\x72\x46\x00\x00\x8B\x95\x48\xFD\xFF\xFF\x81\xE2\xFF\xFF\x00" \
-        "\x00\xF7\xD2\x66\xA1\x72\x46\x00\x00\x66\x23\xC2\x66\xA3\x72\x46" \
-        "\x00\x00\x66\x8B\x0D\x72\x46\x00\x00\x51\xE8\x41\x38\x00\x00\x83" \
-        "\xC4\x04\xE9\xF8\x00\x00\x00\xE8\x44\x35\x00\x00\x89\x85\x34\xFD" \
-        "\xFF\xFF\xFF\x15\xC4\x1E\x00\x00\x88\x85\x38\xFD\xFF\xFF\xFF\x15" \
-        "\xC4\x1E\x00\x00\x88\x85\x3C\xFD\xFF\xFF\x8B\x95\x38\xFD\xFF\xFF" \
-        "\x81\xE2\xFF\x00\x00\x00\x85\xD2\x74\x1E\x8A\x85\x3C\xFD\xFF\xFF" \
-        "\x50\x8B\x8D\x34\xFD\xFF\xFF\x51\xE8\x03\x3E\x00\x00\x83\xC4\x08" \
-        "\x89\x85\x1C\xFD\xFF\xFF\xEB\x15\x8B\x95\x34\xFD\xFF\xFF\x52\xE8" \
-        "\x7C\x3D\x00\x00\x83\xC4\x04\x89\x85\x1C\xFD\xFF\xFF\x8B\x85\x1C" \
-        "\xFD\xFF\xFF\x89\x85\x40\xFD\xFF\xFF\x8B\x8D\x40\xFD\xFF\xFF\x51" \
-        "\xE8\xDB\x37\x00\x00\x83\xC4\x04\xEB\x75\xE8\xA1\x34\x00\x00\x66" \
-        "\x89\x85\x2C\xFD\xFF\xFF\x8B\x95\x2C\xFD\xFF\xFF\x81\xE2\xFF\xFF" \
-        "\x00\x00\x83\xEA\x03\x89\x15\xB8\x45\x00\x00\xA1\xB8\x45\x00\x00" \
-        "\xA3\xBC\x45\x00\x00\xEB\x48\xE8\x94\x34\x00\x00\x89\x85\x30\xFD" \
-        "\xFF\xFF\x8B\x8D\x30\xFD\xFF\xFF\x51\xE8\x09\x2D\x00\x00\x83\xC4" \
-        "\x04\xEB\x2C\xE8\xF8\x42\x00\x00\xEB\x25\xE8\x84\x0F\x00\x00\xEB" \
-        "\x1E\xE8\x4A\x34\x00\x00\x50\xE8\xB8\x05\x00\x00\x83\xC4\x04\xEB" \
-        "\x0E\x6A\x01\x6A\x04\x6A\x03\xE8\x54\xE7\xFF\xFF\x83\xC4\x0C\xE9" \
-        "\xAF\xF0\xFF\xFF\xC8\x09\x01\x00\xDD\x09\x01\x00\x35\x0A\x01\x00" \
-        "\x3F\x0A\x01\x00\x52\x0A\x01\x00\x62\x0A\x01\x00\x72\x0A\x01\x00" \
-        "\x82\x0A\x01\x00\x92\x0A\x01\x00\xA2\x0A\x01\x00\xB2\x0A\x01\x00" \
-        "\xC2\x0A\x01\x00\xD2\x0A\x01\x00\x4F\x0F\x01\x00\xEB\x0A\x01\x00" \
-        "\x9D\x0F\x01\x00\x89\x0B\x01\x00\xA1\x0B\x01\x00\xAB\x0B\x01\x00" \
-        "\xE0\x0E\x01\x00\xD1\x0B\x01\x00\x2C\x0C\x01\x00\x47\x10\x01\x00" \
-        "\x5F\x10\x01\x00\x6D\x10\x01\x00\x1E\x0D\x01\x00\x3A\x0D\x01\x00" \
-        "\x7B\x10\x01\x00\xA9\x0C\x01\x00\x5B\x0D\x01\x00\xA1\x18\x01\x00" \
-        "\x87\x10\x01\x00\x75\x0D\x01\x00\xA1\x18\x01\x00\xC8\x0D\x01\x00" \
-        "\xD8\x10\x01\x00\x9D\x11\x01\x00\x20\x12\x01\x00\x64\x12\x01\x00" \
-        "\x75\x12\x01\x00\x47\x13\x01\x00\x57\x13\x01\x00\x61\x13\x01\x00" \
-        "\x6B\x13\x01\x00\x75\x13\x01\x00\x7F\x13\x01\x00\x93\x13\x01\x00" \
-        "\x9D\x13\x01\x00\xA7\x13\x01\x00\xBA\x13\x01\x00\xC9\x13\x01\x00" \
-        "\xD3\x13\x01\x00\xDD\x13\x01\x00\xEB\x13\x01\x00\xF9\x13\x01\x00" \
-        "\x0C\x14\x01\x00\x7C\x0E\x01\x00\x1B\x14\x01\x00\x57\x14\x01\x00" \
-        "\x67\x14\x01\x00\x85\x14\x01\x00\x8F\x14\x01\x00\x99\x14\x01\x00" \
-        "\xC1\x14\x01\x00\xE2\x14\x01\x00\x89\x0E\x01\x00\xA1\x18\x01\x00" \
-        "\x06\x15\x01\x00\x3B\x15\x01\x00\x4E\x15\x01\x00\x02\x16\x01\x00" \
-        "\xC7\x16\x01\x00\xFE\x16\x01\x00\x45\x17\x01\x00\x58\x17\x01\x00" \
-        "\xB7\x17\x01\x00\x3A\x18\x01\x00\x67\x18\x01\x00\x83\x18\x01\x00" \
-        "\xA1\x18\x01\x00\x8A\x18\x01\x00\xA1\x18\x01\x00\xA1\x18\x01\x00" \
-        "\xA1\x18\x01\x00\xA1\x18\x01\x00\xA1\x18\x01\x00\xA1\x18\x01\x00" \
-        "\x91\x18\x01\x00\x66\xA1\xCE\x10\x00\x00\x57\x0C\x01\x66\xA3\x10" \
-        "\x00\x00\x00\x50\x6A\x04\xE8\x7F\x10\x00\x00\x66\xC7\x05\x20\x00" \
-        "\x00\x00\xF1\xFF\x68\xF1\xFF\x00\x00\x6A\x08\xE8\x6A\x10\x00\x00" \
-        "\xA1\xD0\x10\x00\x00\x05\x01\x10\x00\x00\x66\xA3\x30\x00\x00\x00" \
-        "\x50\x6A\x0C\xE8\x52\x10\x00\x00\x66\xC7\x05\x40\x00\x00\x00\xF1" \
-        "\xFF\x68\xF1\xFF\x00\x00\x6A\x10\xE8\x3D\x10\x00\x00\x66\xC7\x05" \
-        "\x50\x00\x00\x00\xF1\xFF\x68\xF1\xFF\x00\x00\x6A\x14\xE8\x28\x10" \
-        "\x00\x00\x66\xA1\xCE\x10\x00\x00\x0C\x01\x66\xA3\x70\x00\x00\x00" \
-        "\x50\x6A\x1C\xE8\x12\x10\x00\x00\x66\xA1\xCE\x10\x00\x00\x66\x05" \
-        "\x01\x30\x66\xA3\x60\x00\x00\x00\x50\x6A\x18\xE8\xFA\x0F\x00\x00" \
-        "\xE8\x5F\x00\x00\x00\xE8\xDA\x00\x00\x00\xB9\x10\x00\x00\x00\x33" \
-        "\xC0\xBF\x10\x46\x00\x00\x68\x10\x46\x00\x00\xF3\xAB\xB9\x10\x00" \
-        "\x00\x00\xBF\xD0\x1F\x00\x00\xF3\xAB\x66\x8B\x0D\x74\x47\x00\x00" \
-        "\x66\xC7\x05\x50\x10\x00\x00\x04\x00\x51\xE8\x74\x0D\x00\x00\x83" \
-        "\xC4\x40\x68\xD0\x1F\x00\x00\x68\x00\x02\x00\x00\xE8\x27\x0E\x00" \
-        "\x00\xC6\x05\x0A\x22\x00\xC0\x03\x6A\x01\xE8\x81\x03\x00\x00\x83" \
-        "\xC4\x0C\x5F\xC3\x53\x56\x57\x33\xD2\x33\xF6\xBF\x0A\x00\x00\x00" \
-        "\xBB\x08\x00\x00\x00\x8B\xC7\xB9\x02\x00\x00\x00\x66\x89\x50\xFE" \
-        "\x66\xC7\x00\xF0\xFF\x83\xC0\x04\x49\x75\xF1\x8B\xC6\xC1\xE8\x02" \
-        "\x88\x14\x85\x00\x00\x10\x42\x83\xC6\x04\x83\xC7\x10\x4B\x75\xD5" \
-        "\xBE\x20\x00\x00\x00\xB8\x82\x00\x00\x00\xBF\x38\x00\x00\x00\xB9" \
-        "\x04\x00\x00\x00\x66\x89\x50\xFE\x66\xC7\x00\xF0\xFF\x83\xC0\x04" \
-        "\x49\x75\xF1\x8B\xCE\xC1\xE9\x02\x88\x14\x8D\x00\x84\x10\x42\x83" \
-        "\xC6\x04\x4F\x75\xDA\x5F\x5E\x5B\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x56\x57\xE8\xE5\xE9\xFF\xFF\x66\x85\xC0\x74\x10" \
-        "\xBF\xC0\x01\x00\x00\x66\xC7\x05\x50\x10\x00\x00\x01\x00\xEB\x0E" \
-        "\xBF\x00\x04\x00\x00\x66\xC7\x05\x50\x10\x00\x00\x04\x00\xBE\x00" \
-        "\x01\x00\x00\x66\x3B\xFE\x76\x4C\x53\x55\x8B\x2D\x50\x10\x00\x00" \
-        "\x33\xDB\x8B\xCE\xBA\x04\x00\x00\x00\x81\xE1\xFF\xFF\x00\x00\x8D" \
-        "\x04\x8D\x02\x00\x00\x00\x66\x89\x58\xFE\x66\xC7\x00\xF0\xFF\x83" \
-        "\xC0\x04\x4A\x75\xF1\xC1\xE9\x02\x88\x1C\x8D\x00\x84\x10\x42\x03" \
-        "\xF5\x66\x3B\xF7\x72\xCC\x5D\x5B\x5F\x66\xC7\x05\x50\x10\x00\x00" \
-        "\x04\x00\x5E\xC3\x5F\x66\xC7\x05\x50\x10\x00\x00\x04\x00\x5E\xC3" \
-        "\x90\x90\x90\x90\x55\x8B\xEC\x53\xFA\x33\xDB\x66\x39\x5D\x08\x75" \
-        "\x07\xC6\x05\x0A\x22\x00\xC0\x02\x66\xA1\x50\x46\x00\x00\x66\xC7" \
-        "\x05\x6C\x25\x00\x00\x03\x00\x50\xE8\x37\x0F\x00\x00\x83\xC4\x04" \
-        "\x66\x89\x1D\x12\x22\x00\xC0\x66\xC7\x05\x0C\x40\x00\xC0\x01\x00" \
-        "\x66\x89\x1D\x02\x40\x00\xC0\xE8\x14\xE9\xFF\xFF\x66\x85\xC0\x0F" \
-        "\x84\xE2\x00\x00\x00\x66\xA1\xCE\x10\x00\x00\x66\x05\x01\x30\x66" \
-        "\xA3\x60\x00\x00\x00\x50\x6A\x18\xE8\x1D\x0E\x00\x00\x83\xC4\x08" \
-        "\xB8\xC8\x00\x00\x00\xC6\x05\x14\x22\x00\xC0\x9B\x48\x75\xF6\xC6" \
-        "\x05\x0A\x22\x00\xC0\x02\x66\x89\x1D\x0C\x40\x00\xC0\xB8\x32\x00" \
-        "\x00\x00\xC6\x05\x14\x22\x00\xC0\x9B\x48\x75\xF6\x66\xC7\x05\x0C" \
-        "\x40\x00\xC0\x01\x00\xB8\x40\x9C\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\x9B\x48\x75\xF6\x66\xA1\x7A\x47\x00\x00\x66\x3D\x11\x00\x74\x39" \
-        "\x66\x3D\x12\x00\x74\x33\x66\x3D\x13\x00\x75\x0B\x66\xC7\x05\x88" \
-        "\x10\x00\x00\x7C\x0A\xEB\x2B\x66\x3D\x15\x00\x74\x11\x66\x3D\x14" \
-        "\x00\x74\x0B\x66\xC7\x05\x88\x10\x00\x00\xDC\x05\xEB\x14\x66\xC7" \
-        "\x05\x88\x10\x00\x00\xA4\x06\xEB\x09\x66\xC7\x05\x88\x10\x00\x00" \
-        "\x40\x06\xE8\xFD\x00\x00\x00\x66\x85\xC0\x74\x0B\x66\x81\x0D\x6C" \
-        "\x25\x00\x00\xF4\xFF\xEB\x09\x66\x81\x0D\x6C\x25\x00\x00\xF0\xFF" \
-        "\x66\x8B\x0D\x6C\x25\x00\x00\x66\x89\x0D\x1C\x22\x00\xC0\x66\xC7" \
-        "\x05\xD2\x10\x00\x00\x02\x00\x88\x1D\x0C\x22\x00\xC0\x88\x1D\x0E" \
-        "\x22\x00\xC0\xC6\x05\x1A\x22\x00\xC0\x18\x66\x8B\x15\x64\x46\x00" \
-        "\x00\x66\x89\x15\xD4\x10\x00\x00\xC7\x05\xD8\x10\x00\x00\x56\x10" \
-        "\x00\x00\xC7\x05\xDC\x10\x00\x00\xA0\x25\x00\x00\xC7\x05\xF0\x10" \
-        "\x00\x00\x80\x25\x00\x00\x66\xC7\x05\xCE\x10\x00\x00\x80\x01\xC7" \
-        "\x05\xE8\x10\x00\x00\x7C\x25\x00\x00\xC7\x05\xEC\x10\x00\x00\x7E" \
-        "\x25\x00\x00\x66\x89\x1D\x48\x40\x00\xC0\x66\x89\x1D\x46\x40\x00" \
-        "\xC0\x66\x89\x1D\x42\x40\x00\xC0\x66\x89\x1D\x44\x40\x00\xC0\x66" \
-        "\xC7\x05\x40\x40\x00\xC0\x01\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0" \
-        "\xFF\xE8\xFA\xE6\xFF\xFF\xE8\xF5\xE6\xFF\xFF\xE8\xD0\xE7\xFF\xFF" \
-        "\xE8\xC4\x0D\x00\x00\x33\xC0\xA3\x10\x24\x00\x00\xA3\x14\x24\x00" \
-        "\x00\xE8\x0E\xFC\xFF\xFF\xE8\x75\xE7\xFF\xFF\x66\x85\xC0\x5B\x74" \
-        "\x0D\x68\x40\x42\x0F\x00\xE8\x77\x11\x00\x00\x83\xC4\x04\xFB\x5D" \
-        "\xC3\x90\x90\x90\x66\xA1\x7A\x47\x00\x00\x66\x3D\x11\x00\x74\x1C" \
-        "\x66\x3D\x12\x00\x74\x16\x66\x3D\x13\x00\x74\x10\x66\x3D\x15\x00" \
-        "\x74\x0A\x66\x3D\x14\x00\x74\x04\x66\x33\xC0\xC3\x66\xB8\x01\x00" \
-        "\xC3\x90\x90\x90\x55\x8B\xEC\x51\x53\x56\x57\xE8\x63\x08\x00\x00" \
-        "\x8B\x45\x08\x25\xFF\xFF\x00\x00\x8B\x0C\x85\x48\x0F\x00\x00\x89" \
-        "\x4D\xFC\xE8\xFD\x18\x00\x00\xFA\x55\xFF\x55\xFC\x5D\xFB\x5F\x5E" \
-        "\x5B\x8B\xE5\x5D\xC3\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\x55\x8B\xEC\x33\xC0\x66\x8B\x45\x08\xB9\xC8\x00\x00\x00\xF7\xE1" \
-        "\x8B\xC8\xC6\x05\x14\x22\x00\xC0\x9B\xE2\xF7\x5D\xC3\x90\x90\x90" \
-        "\x66\xA1\x48\x19\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\x8B\x74\x24\x08\x8B\xC6\x66\x89\x35\x48\x19\x00\x00\x25\xFF" \
-        "\xFF\x00\x00\x8B\xC8\x83\xE0\x02\xC1\xE9\x02\x83\xE1\x01\x0B\xC8" \
-        "\x66\x89\x0D\x1A\x40\x00\xC0\x66\x89\x35\x18\x40\x00\xC0\x66\x8B" \
-        "\x15\x74\x47\x00\x00\x68\x10\x46\x00\x00\x52\xE8\x63\x09\x00\x00" \
-        "\x83\xC4\x08\x66\x83\x3D\x7A\x25\x00\x00\x00\x74\x0B\x56\x6A\x01" \
-        "\xE8\x51\x1A\x00\x00\x83\xC4\x08\x5E\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x33\xC9\xA0\x00\x40\x00\xC0\xA8\x02\x74\x05\xB9\x01\x00\x00\x00" \
-        "\xF6\x05\x03\x22\x00\xC0\x10\x74\x03\x83\xC9\x10\xF6\x05\x03\x22" \
-        "\x00\xC0\x20\x74\x03\x83\xC9\x20\x66\x83\x3D\x52\x10\x00\x00\x01" \
-        "\x75\x1C\x66\xA1\x02\x22\x00\xC0\x25\x00\x30\x00\x00\x3D\x00\x30" \
-        "\x00\x00\x74\x0A\x80\xCD\x02\xC6\x05\x76\x47\x00\x00\x04\x66\xA1" \
-        "\x54\x10\x00\x00\x66\x0B\xC1\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x14\x8B\x4C\x24\x10\x8B\x54\x24\x0C\x68\x37\x20\x01" \
-        "\x00\x68\xB0\x1F\x01\x00\x50\x8B\x44\x24\x14\x51\x8B\x4C\x24\x14" \
-        "\x52\x50\x51\xE8\xDF\x00\x00\x00\x83\xC4\x1C\xC3\x90\x90\x90\x90" \
-        "\x55\x8B\xEC\x66\xC7\x05\x1C\x40\x00\xC0\x02\x00\x8B\x45\x08\x25" \
-        "\xFF\xFF\x00\x00\x33\xC9\x66\x8B\x0C\x45\x4C\x19\x00\x00\x66\xC7" \
-        "\x04\x4D\x00\x40\x00\xC0\x00\x00\x6A\x00\xE8\x22\x00\x00\x00\x83" \
-        "\xC4\x04\x8B\x55\x08\x81\xE2\xFF\xFF\x00\x00\x33\xC0\x66\x8B\x04" \
-        "\x55\x4C\x19\x00\x00\x66\xC7\x04\x45\x00\x40\x00\xC0\x01\x00\x5D" \
-        "\xC3\x55\x8B\xEC\x53\x56\x57\x8B\x45\x08\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x8B\x4D\x08\x83" \
-        "\xC9\x02\x66\x89\x0D\x1C\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0" \
-        "\x3B\x00\x5F\x5E\x5B\x5D\xC3\x55\x8B\xEC\x33\xC0\x66\xA1\x4C\x19" \
-        "\x00\x00\x66\xC7\x04\x45\x00\x40\x00\xC0\x00\x00\x33\xC9\x66\x8B" \
-        "\x0D\x4E\x19\x00\x00\x66\xC7\x04\x4D\x00\x40\x00\xC0\x00\x00\x33" \
-        "\xD2\x66\x8B\x15\x50\x19\x00\x00\x66\xC7\x04\x55\x00\x40\x00\xC0" \
-        "\x00\x00\x66\xC7\x05\x1C\x40\x00\xC0\x00\x00\x6A\x00\xE8\x7F\xFF" \
-        "\xFF\xFF\x83\xC4\x04\x5D\xC3\x55\x57\xFF\x54\x24\x24\x8B\x44\x24" \
-        "\x0C\x50\xFF\x54\x24\x24\x8B\x6C\x24\x18\x83\xC4\x04\x66\x3B\x6C" \
-        "\x24\x18\x8B\xFD\x77\x3D\x81\xE5\xFF\xFF\x00\x00\x53\xD1\xE5\x56" \
-        "\x8B\xDD\x8B\x4C\x24\x28\x8B\x54\x24\x24\x8B\x44\x24\x14\x51\x52" \
-        "\x8B\xF3\x57\x50\x2B\xF5\xE8\x2C\x00\x00\x00\x8B\x4C\x24\x28\x83" \
-        "\xC4\x10\x47\x83\xC3\x02\x66\x3B\x7C\x24\x20\x66\x89\x04\x0E\x76" \
-        "\xD1\x5E\x5B\xFF\x54\x24\x24\x5F\x5D\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x0C\x8B\x4C\x24\x08\x53" \
-        "\x56\x57\x50\x51\x6A\x02\xE8\x6C\x00\x00\x00\x6A\x00\xE8\xEF\xFE" \
-        "\xFF\xFF\x8B\x5C\x24\x20\x83\xC4\x10\x33\xF6\xBF\x10\x00\x00\x00" \
-        "\x53\xE8\x21\x00\x00\x00\x8D\x14\x36\x83\xC4\x04\x0B\xC2\x4F\x8B" \
-        "\xF0\x75\xED\x53\xFF\x54\x24\x20\x83\xC4\x04\x66\x8B\xC6\x5F\x5E" \
-        "\x5B\xC3\x90\x90\x90\x90\x90\x56\x66\x8B\x74\x24\x08\x66\xF7\xDE" \
-        "\x1B\xF6\x83\xE6\x03\x46\x66\xA1\x00\x40\x00\xC0\x6A\x00\x23\xF0" \
-        "\xE8\x9C\xFE\xFF\xFF\x83\xC4\x04\x33\xC0\x66\x85\xF6\x0F\x95\xC0" \
-        "\x5E\xC3\x90\x90\x90\x90\x90\x56\x6A\x00\xE8\x82\xFE\xFF\xFF\x6A" \
-        "\x01\xE8\x7B\xFE\xFF\xFF\x8B\x74\x24\x10\x81\xE6\xFF\xFF\x00\x00" \
-        "\x8B\xC6\xD1\xE8\x50\xE8\x67\xFE\xFF\xFF\x56\xE8\x61\xFE\xFF\xFF" \
-        "\x8B\x44\x24\x20\x83\xC4\x10\x66\x85\xC0\x74\x36\x8B\x74\x24\x0C" \
-        "\x53\x81\xE6\xFF\xFF\x00\x00\x25\xFF\xFF\x00\x00\x57\x8B\xF8\x8D" \
-        "\x58\xFF\x8B\xD6\x8A\xCB\xD3\xEA\x52\xE8\x33\xFE\xFF\xFF\x83\xC4" \
-        "\x04\x4B\x4F\x75\xED\x66\xC7\x05\x1C\x40\x00\xC0\x02\x00\x5F\x5B" \
-        "\x5E\xC3\x66\xC7\x05\x1C\x40\x00\xC0\x02\x00\x5E\xC3\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x14\x8B\x4C\x24\x10\x8B" \
-        "\x54\x24\x0C\x68\x63\x22\x01\x00\x68\x27\x22\x01\x00\x50\x8B\x44" \
-        "\x24\x14\x51\x8B\x4C\x24\x14\x52\x50\x51\xE8\x68\xFE\xFF\xFF\x83" \
-        "\xC4\x1C\xC3\x90\x90\x90\x90\x55\x8B\xEC\x51\x33\xC0\x66\xA1\x78" \
-        "\x47\x00\x00\x33\xC9\x3D\xA4\x06\x00\x00\x0F\x94\xC1\x66\x89\x4D" \
-        "\xFC\x6A\x00\x6A\x00\x8B\x55\x08\x81\xE2\xFF\xFF\x00\x00\x83\xCA" \
-        "\x30\x52\x66\x8B\x45\xFC\x50\xE8\x48\x15\x00\x00\x83\xC4\x10\x8B" \
-        "\xE5\x5D\xC3\x55\x8B\xEC\x53\x56\x57\xE8\xC9\xFD\xFF\xFF\x66\xC7" \
-        "\x05\x14\x22\x00\xC0\x1B\x00\x33\xC0\x66\xA1\x50\x19\x00\x00\x66" \
-        "\xC7\x04\x45\x00\x40\x00\xC0\x01\x00\x66\xC7\x05\x14\x22\x00\xC0" \
-        "\x1B\x00\x33\xC9\x66\x8B\x0D\x50\x19\x00\x00\x66\xC7\x04\x4D\x00" \
-        "\x40\x00\xC0\x00\x00\x66\xC7\x05\x14\x22\x00\xC0\x1B\x00\x5F\x5E" \
-        "\x5B\x5D\xC3\x8B\x44\x24\x0C\x8B\x4C\x24\x04\x56\x8B\x74\x24\x0C" \
-        "\x50\x6A\x0F\x6A\x00\x56\x51\xE8\xB4\xFC\xFF\xFF\x68\x34\x12\x00" \
-        "\x00\x6A\x10\x56\xE8\x0A\x00\x00\x00\x83\xC4\x20\x5E\xC3\x90\x90" \
-        "\x90\x90\x90\x8B\x44\x24\x08\x66\x8B\xC8\x05\xFF\xFF\x00\x00\x66" \
-        "\x85\xC9\x74\x1B\x8B\x4C\x24\x04\x25\xFF\xFF\x00\x00\x40\x8B\xD0" \
-        "\x66\x8B\x44\x24\x0C\x66\x33\x01\x83\xC1\x02\x4A\x75\xF7\xC3\x66" \
-        "\x8B\x44\x24\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x8B\x44\x24\x18\x8B\x4C\x24\x14\x8B\x54\x24\x10\x68" \
-        "\x37\x20\x01\x00\x68\xB0\x1F\x01\x00\x50\x8B\x44\x24\x18\x51\x8B" \
-        "\x4C\x24\x18\x52\x8B\x54\x24\x18\x50\x51\x52\xE8\x13\x00\x00\x00" \
-        "\x83\xC4\x20\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x8B\x44\x24\x18\x53\x8B\x5C\x24\x14\x8B\x54\x24\x0C" \
-        "\x57\x8B\x7C\x24\x14\x8B\xCB\x50\x2B\xCF\x41\x51\x52\xE8\x61\xFF" \
-        "\xFF\xFF\x83\xC4\x0C\x66\x85\xC0\x75\x6D\x55\x56\xFF\x54\x24\x30" \
-        "\x8B\x6C\x24\x14\x8B\x74\x24\x2C\x55\xFF\xD6\x8B\x44\x24\x28\x56" \
-        "\x50\x53\x57\x55\xE8\x5A\x00\x00\x00\x83\xC4\x18\x66\x3B\xFB\x8B" \
-        "\xF7\x77\x3E\x81\xE7\xFF\xFF\x00\x00\xD1\xE7\x8B\xCF\x89\x4C\x24" \
-        "\x28\xEB\x04\x8B\x4C\x24\x28\x8B\x54\x24\x24\x8B\xC7\x2B\xC1\x8B" \
-        "\x4C\x24\x2C\x51\x8B\x4C\x24\x1C\x52\x56\x66\x8B\x14\x08\x52\x55" \
-        "\xE8\xEE\x00\x00\x00\x83\xC4\x14\x46\x83\xC7\x02\x66\x3B\xF3\x76" \
-        "\xD2\xFF\x54\x24\x30\x5E\x5D\x5F\x5B\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x53\x8B\x5C\x24\x14\x55\x8B\x6C\x24\x0C\x56\x57\x8B" \
-        "\x7C\x24\x24\x57\x53\x55\xE8\x38\x00\x00\x00\x8B\x74\x24\x24\x83" \
-        "\xC4\x0C\x66\x3B\x74\x24\x1C\x77\x1D\x53\x56\x6A\x03\xE8\x45\xFD" \
-        "\xFF\xFF\x57\x6A\x0A\x55\xE8\x38\x00\x00\x00\x83\xC4\x18\x46\x66" \
-        "\x3B\x74\x24\x1C\x76\xE3\x5F\x5E\x5D\x5B\xC3\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x8B\x44\x24\x08\x50\x68\xF0\x00\x00\x00\x6A\x00\xE8" \
-        "\x13\xFD\xFF\xFF\x8B\x4C\x24\x10\x51\xFF\x54\x24\x1C\x83\xC4\x10" \
-        "\xC3\x90\x90\x56\x8B\x74\x24\x08\x57\x8B\x7C\x24\x14\x56\xFF\xD7" \
-        "\x8B\x44\x24\x14\x83\xC4\x04\x66\x85\xC0\x74\x19\x50\xE8\xFE\xF9" \
-        "\xFF\xFF\x83\xC4\x04\x56\xFF\xD7\x6A\x00\xE8\x62\xFB\xFF\xFF\x83" \
-        "\xC4\x08\x5F\x5E\xC3\x56\xE8\x9C\xFC\xFF\xFF\x83\xC4\x04\x66\x85" \
-        "\xC0\x75\x0E\x56\xE8\x8E\xFC\xFF\xFF\x83\xC4\x04\x66\x85\xC0\x74" \
-        "\xF2\x56\xFF\xD7\x6A\x00\xE8\x36\xFB\xFF\xFF\x83\xC4\x08\x5F\x5E" \
-        "\xC3\x90\x90\x8B\x44\x24\x10\x8B\x4C\x24\x0C\x53\x56\x57\x50\x51" \
-        "\x6A\x01\xE8\x90\xFC\xFF\xFF\x8B\x74\x24\x20\x83\xC4\x0C\x81\xE6" \
-        "\xFF\xFF\x00\x00\xBB\x0F\x00\x00\x00\xBF\x10\x00\x00\x00\x8B\xD6" \
-        "\x8A\xCB\xD3\xEA\x52\xE8\xF7\xFA\xFF\xFF\x83\xC4\x04\x4B\x4F\x75" \
-        "\xED\x66\xC7\x05\x1C\x40\x00\xC0\x02\x00\x8B\x44\x24\x20\x8B\x4C" \
-        "\x24\x10\x50\x6A\x0A\x51\xE8\x48\xFF\xFF\xFF\x83\xC4\x0C\x5F\x5E" \
-        "\x5B\xC3\x90\x8B\x44\x24\x18\x8B\x4C\x24\x14\x8B\x54\x24\x10\x68" \
-        "\x63\x22\x01\x00\x68\x27\x22\x01\x00\x50\x8B\x44\x24\x18\x51\x8B" \
-        "\x4C\x24\x18\x52\x8B\x54\x24\x18\x50\x51\x52\xE8\x03\xFE\xFF\xFF" \
-        "\x83\xC4\x20\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x8B\x44\x24\x0C\x8B\x4C\x24\x08\x8B\x54\x24\x04\x68" \
-        "\x34\x12\x00\x00\x50\x6A\x0F\x6A\x00\x51\x52\xE8\x93\xFD\xFF\xFF" \
-        "\x83\xC4\x18\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x51\x56\x6A\x08\x68\xFF\x00\x00\x00\x8D\x44\x24\x0E" \
-        "\x33\xF6\x68\xFF\x00\x00\x00\x50\x56\xE8\xC2\xF9\xFF\xFF\x83\xC4" \
-        "\x14\x66\x81\x7C\x24\x06\xA4\xA5\x74\x73\x6A\x06\x6A\x3F\x8D\x4C" \
-        "\x24\x0E\x6A\x3F\x51\x6A\x00\xE8\xA4\xF9\xFF\xFF\x66\x8B\x44\x24" \
-        "\x1A\x83\xC4\x14\x66\x3D\x69\xE9\x74\x72\x66\x3D\xA4\xA5\x74\x6C" \
-        "\x68\xA4\xA5\x00\x00\x6A\x08\x68\xFF\x00\x00\x00\x8D\x54\x24\x12" \
-        "\x68\xFF\x00\x00\x00\x52\x6A\x00\xE8\x16\xFD\xFF\xFF\x83\xC4\x18" \
-        "\x66\x8B\xC6\x46\x66\x85\xC0\x75\x3C\x6A\x08\x68\xFF\x00\x00\x00" \
-        "\x8D\x4C\x24\x0E\x68\xFF\x00\x00\x00\x51\x6A\x00\xE8\x4F\xF9\xFF" \
-        "\xFF\x83\xC4\x14\x66\x81\x7C\x24\x06\xA4\xA5\x75\x8D\x66\xC7\x05" \
-        "\xA6\x10\x00\x00\x08\x00\x66\xC7\x05\xA8\x10\x00\x00\xFF\x00\x66" \
-        "\x33\xC0\x5E\x59\xC3\x66\xB8\x01\x00\x5E\x59\xC3\x66\xC7\x05\xA6" \
-        "\x10\x00\x00\x06\x00\x66\xC7\x05\xA8\x10\x00\x00\x3F\x00\x66\x33" \
-        "\xC0\x5E\x59\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x66\xA1\x9A\x10\x00\x00\x0F\xBF\xC8\x50\x8B\x14\x8D" \
-        "\x48\x0F\x00\x00\x89\x15\x9C\x10\x00\x00\xE8\x51\x29\x00\x00\x66" \
-        "\xA1\x9C\x10\x00\x00\x50\xE8\x45\x29\x00\x00\x8B\x0D\x9C\x10\x00" \
-        "\x00\xC1\xE9\x10\x51\xE8\x36\x29\x00\x00\x83\xC4\x0C\xC3\x90\x90" \
-        "\x90\x90\x90\x66\x83\x3D\x74\x25\x00\x00\x00\x74\x16\x66\x81\x3D" \
-        "\x9A\x10\x00\x00\x80\x00\x75\x20\xC7\x05\x48\x11\x00\x00\x00\x00" \
-        "\x09\x00\xC3\x66\x81\x3D\x9A\x10\x00\x00\x80\x00\x75\x0A\xC7\x05" \
-        "\x48\x11\x00\x00\x00\x00\x02\x00\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x6A\x01\xE8\xD6\x25\x00\x00\x25\xFF\xFF\x00\x00\x50" \
-        "\xE8\x0E\x00\x00\x00\x83\xC4\x08\x8A\xC8\xFF\x25\xCC\x1E\x00\x00" \
-        "\x90\x90\x90\x51\x0F\xBF\x05\x9A\x10\x00\x00\x53\x33\xDB\x66\x39" \
-        "\x1D\x74\x25\x00\x00\x56\x8B\x34\x85\x48\x0F\x00\x00\x57\x89\x5C" \
-        "\x24\x0C\x74\x32\x8B\x3D\x98\x25\x00\x00\x3B\xFB\x75\x2D\x8B\x3D" \
-        "\xE4\x10\x00\x00\x0F\xBF\x0D\x92\x10\x00\x00\x81\xE7\xFF\xFF\x00" \
-        "\x00\xC1\xE7\x10\x03\xF9\x8B\x0D\x70\x25\x00\x00\xC1\xE7\x0A\x2B" \
-        "\xF9\x83\xEF\x02\xEB\x05\xBF\x00\x00\x0A\x00\x8B\x44\x24\x14\x8B" \
-        "\xD0\x48\x85\xD2\x74\x32\x55\x8D\x68\x01\x3B\xF7\x73\x11\xFF\x15" \
-        "\xC4\x1E\x00\x00\x88\x06\x66\x0F\xB6\xC0\x03\xD8\x46\xEB\x15\xFF" \
-        "\x15\xC4\x1E\x00\x00\x66\x33\xC9\xC7\x44\x24\x10\x01\x00\x00\x00" \
-        "\x8A\xC8\x03\xD9\x4D\x75\xD3\x5D\x8A\x44\x24\x18\x84\xC0\x74\x1E" \
-        "\xFF\x15\xC4\x1E\x00\x00\x03\xC3\x84\xC0\x74\x12\xC7\x44\x24\x0C" \
-        "\x02\x00\x00\x00\x5F\x66\x8B\x44\x24\x08\x5E\x5B\x59\xC3\x66\x8B" \
-        "\x44\x24\x0C\x66\x85\xC0\x75\x23\x66\x8B\x0D\x9A\x10\x00\x00\x83" \
-        "\xC6\x0F\x66\x8B\xC1\x66\x41\x0F\xBF\xD1\x83\xE6\xF0\x66\x89\x0D" \
-        "\x9A\x10\x00\x00\x89\x34\x95\x48\x0F\x00\x00\x5F\x5E\x5B\x59\xC3" \
-        "\x90\x90\x90\x6A\x00\xE8\xE6\x24\x00\x00\x50\xE8\x03\xFF\xFF\xFF" \
-        "\x50\xE8\xCA\x27\x00\x00\x83\xC4\x0C\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x66\x8B\x44\x24\x04\x66\x3D\x80\x00\x66\xA3\x9A\x10" \
-        "\x00\x00\x75\x17\x66\xA1\xE4\x10\x00\x00\x66\x8B\x0D\x92\x10\x00" \
-        "\x00\x50\x51\xE8\x08\x2C\x00\x00\x83\xC4\x08\xC3\x90\x90\x90\x90" \
-        "\x90\x90\x90\x55\x8B\xEC\x51\x33\xC0\x66\xA1\x48\x19\x00\x00\x83" \
-        "\xE0\x01\x50\xE8\x89\xF7\xFF\xFF\x83\xC4\x04\x33\xC9\x66\x8B\x0D" \
-        "\x48\x19\x00\x00\xD1\xF9\x83\xE1\x01\x51\xE8\x72\xF7\xFF\xFF\x83" \
-        "\xC4\x04\x33\xD2\x66\x8B\x15\x48\x19\x00\x00\xC1\xFA\x02\x83\xE2" \
-        "\x01\x52\xE8\x5A\xF7\xFF\xFF\x83\xC4\x04\x66\x8B\x45\x08\x66\x89" \
-        "\x45\xFC\x8B\x4D\xFC\x81\xE1\xFF\xFF\x00\x00\x66\x8B\x55\xFC\x66" \
-        "\x83\xEA\x01\x66\x89\x55\xFC\x85\xC9\x74\x3D\x8B\x45\xFC\x25\xFF" \
-        "\xFF\x00\x00\x99\x83\xE2\x07\x03\xC2\xC1\xF8\x03\x8B\x4D\x0C\x33" \
-        "\xD2\x8A\x14\x01\x8B\x45\xFC\x25\xFF\xFF\x00\x00\x8B\xC8\x81\xE1" \
-        "\x07\x00\x00\x80\x79\x05\x49\x83\xC9\xF8\x41\xD3\xFA\x52\xE8\xFE" \
-        "\xF6\xFF\xFF\x83\xC4\x04\xEB\xAA\x66\xC7\x05\x02\x40\x00\xC0\x01" \
-        "\x00\x66\xC7\x05\x02\x40\x00\xC0\x00\x00\x6A\x03\xE8\x6F\xF5\xFF" \
-        "\xFF\x83\xC4\x04\x8B\xE5\x5D\xC3\x55\x8B\xEC\x51\x66\x8B\x45\x08" \
-        "\x66\x89\x45\xFC\x8B\x4D\xFC\x81\xE1\xFF\xFF\x00\x00\x66\x8B\x55" \
-        "\xFC\x66\x83\xEA\x01\x66\x89\x55\xFC\x85\xC9\x74\x4D\x66\xC7\x05" \
-        "\x0A\x40\x00\xC0\x00\x00\x8B\x45\xFC\x25\xFF\xFF\x00\x00\xC1\xF8" \
-        "\x03\x8B\x4D\x0C\x33\xD2\x8A\x14\x01\x8B\x45\xFC\x25\xFF\xFF\x00" \
-        "\x00\x83\xF0\x07\x8B\xC8\x81\xE1\x07\x00\x00\x80\x79\x05\x49\x83" \
-        "\xC9\xF8\x41\xD3\xFA\x83\xE2\x01\x66\x89\x15\x1C\x40\x00\xC0\x66" \
-        "\xC7\x05\x0A\x40\x00\xC0\x01\x00\xEB\x9A\x66\xC7\x05\x0A\x40\x00" \
-        "\xC0\x00\x00\x8B\xE5\x5D\xC3\x55\x8B\xEC\x83\xEC\x10\x53\x56\x57" \
-        "\x66\xC7\x45\xF8\x00\x80\x66\xC7\x45\xFC\x00\x00\xFA\x8B\x45\x08" \
-        "\x25\xFF\xFF\x00\x00\xC1\xF8\x02\x8B\x4D\x08\x81\xE1\xFF\xFF\x00" \
-        "\x00\x83\xE1\x03\x6B\xC9\x05\x83\xC1\x0A\xBA\x01\x00\x00\x00\xD3" \
-        "\xE2\x8A\x84\x82\x00\x00\x00\x80\x88\x45\xF3\x8B\x4D\xF8\x81\xE1" \
-        "\xFF\xFF\x00\x00\x8B\x55\xFC\x81\xE2\xFF\xFF\x00\x00\x03\xCA\x66" \
-        "\x89\x4D\xF4\x8B\x45\xF4\x25\xFF\xFF\x00\x00\x0F\xBF\x0D\xD0\x10" \
-        "\x00\x00\x03\xC1\x50\x6A\x0C\xE8\x8E\x00\x00\x00\x83\xC4\x08\xC6" \
-        "\x05\x14\x22\x00\xC0\x9B\x8B\x55\x08\x81\xE2\xFF\xFF\x00\x00\xC1" \
-        "\xFA\x02\x8B\x4D\x08\x81\xE1\xFF\xFF\x00\x00\x83\xE1\x03\x6B\xC9" \
-        "\x05\x83\xC1\x0A\xB8\x01\x00\x00\x00\xD3\xE0\x33\xC9\x8A\x8C\x90" \
-        "\x00\x00\x00\x80\x85\xC9\x74\x08\x66\x8B\x55\xF4\x66\x89\x55\xFC" \
-        "\x8B\x45\xF8\x25\xFF\xFF\x00\x00\x99\x2B\xC2\xD1\xF8\x66\x89\x45" \
-        "\xF8\x8B\x45\xF8\x25\xFF\xFF\x00\x00\x25\xF0\xFF\x00\x00\x85\xC0" \
-        "\x0F\x85\x65\xFF\xFF\xFF\x0F\xBF\x0D\xD0\x10\x00\x00\x81\xC1\x01" \
-        "\x10\x00\x00\x51\x6A\x0C\xE8\x0F\x00\x00\x00\x83\xC4\x08\xFB\x66" \
-        "\x8B\x45\xFC\x5F\x5E\x5B\x8B\xE5\x5D\xC3\x55\x8B\xEC\x53\x56\x57" \
-        "\x66\x8B\x45\x0C\x66\xA3\x90\x40\x00\xC0\x8B\x4D\x08\x81\xE1\xFF" \
-        "\xFF\x00\x00\x80\xCD\x80\x66\x89\x0D\x50\x40\x00\xC0\x66\xC7\x05" \
-        "\x14\x22\x00\xC0\x7B\x00\x8B\x55\x08\x81\xE2\xFF\xFF\x00\x00\x80" \
-        "\xCE\x40\x80\xCE\x80\x66\x89\x15\x50\x40\x00\xC0\x66\xC7\x05\x14" \
-        "\x22\x00\xC0\x7B\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x8B\x45" \
-        "\x08\x25\xFF\xFF\x00\x00\x80\xCC\x80\x66\xA3\x50\x40\x00\xC0\x5F" \
-        "\x5E\x5B\x5D\xC3\x55\x8B\xEC\x53\x56\xFA\x8B\x45\x08\x8B\x5D\x0C" \
-        "\x8B\xF0\x81\xE6\xFF\xFF\x00\x00\x66\x89\x1C\xB5\x00\x00\x00\x00" \
-        "\xB9\xF0\xFF\x00\x00\x66\x89\x0C\xB5\x02\x00\x00\x00\xF6\xC3\x01" \
-        "\x74\x11\x66\x89\x0D\x30\x40\x00\xC0\x53\x50\xE8\x5A\xFF\xFF\xFF" \
-        "\x83\xC4\x08\x8B\xC6\x83\xE3\x07\x83\xE0\x03\x83\xC0\x02\xD1\xE3" \
-        "\x83\xCB\x01\x8D\x0C\x80\xD3\xE3\xC1\xEE\x02\xC6\x84\xB3\x00\x00" \
-        "\x00\x40\x00\xFB\x5E\x5B\x5D\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x55\x8B\xEC\x66\x8B\x45\x08\x66\xA3\x12\x40\x00" \
-        "\xC0\x8B\x4D\x08\x81\xE1\xFF\xFF\x00\x00\xC1\xF9\x02\x66\x89\x0D" \
-        "\x14\x40\x00\xC0\x8B\x55\x08\x81\xE2\xFF\xFF\x00\x00\xC1\xFA\x04" \
-        "\x66\x89\x15\x16\x40\x00\xC0\x5D\xC3\x66\xA1\xCE\x10\x00\x00\x57" \
-        "\x66\x8B\xD0\xB9\x20\x00\x00\x00\xC1\xE2\x10\x66\x8B\xD0\xBF\xB4" \
-        "\x46\x00\x00\x8B\xC2\xF3\xAB\x66\xA1\xD0\x10\x00\x00\x5F\x66\xA3" \
-        "\xCC\x46\x00\x00\xC3\x90\x90\x90\x90\x53\x56\x57\xE8\xCF\xD9\xFF" \
-        "\xFF\xE8\xC3\xFF\xFF\xFF\x66\xA1\xCE\x10\x00\x00\x66\x05\x01\x1E" \
-        "\x50\x6A\x10\xE8\x0C\xFF\xFF\xFF\x66\x8B\x0D\xCE\x10\x00\x00\x66" \
-        "\x81\xC1\x81\x02\x51\x6A\x04\xE8\xF8\xFE\xFF\xFF\x83\xC4\x10\x33" \
-        "\xFF\xFA\xE8\xB9\xD8\xFF\xFF\xFB\x0F\xBF\x05\x98\x10\x00\x00\x99" \
-        "\x83\xE2\x07\x33\xDB\x03\xC2\xC1\xF8\x03\x85\xC0\x7E\x37\x33\xF6" \
-        "\x56\x53\xE8\xC9\xD9\xFF\xFF\x57\x50\xE8\x6B\x00\x00\x00\x83\xC4" \
-        "\x10\x46\x66\x83\xFE\x08\x72\xE8\x0F\xBF\x05\x98\x10\x00\x00\x99" \
-        "\x83\xE2\x07\x43\x03\xC2\x8B\xD3\xC1\xF8\x03\x81\xE2\xFF\xFF\x00" \
-        "\x00\x3B\xD0\x7C\xC9\x57\x6A\x04\xE8\x3C\x00\x00\x00\x57\x6A\x18" \
-        "\xE8\x34\x00\x00\x00\x57\x6A\x1C\xE8\x2C\x00\x00\x00\x83\xC4\x18" \
-        "\x47\x83\xFF\x04\x7C\x8B\x66\xA1\xCE\x10\x00\x00\x66\x2D\xFF\x05" \
-        "\x50\x6A\x10\xE8\x6C\xFE\xFF\xFF\x83\xC4\x08\x5F\x5E\x5B\xC3\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x90\x90\x53\x8B\x5C\x24\x08\x56\x66" \
-        "\x83\xFB\x18\x57\x75\x07\xBF\x01\x28\x00\x00\xEB\x18\x66\x8B\xFB" \
-        "\x66\x83\xEF\x1C\x66\xF7\xDF\x1B\xFF\x81\xE7\x80\xD0\xFF\xFF\x81" \
-        "\xC7\x01\x32\x00\x00\x8B\x44\x24\x14\x83\xF8\x03\x0F\x87\x08\x01" \
-        "\x00\x00\xFF\x24\x85\x00\x2E\x01\x00\x66\xA1\xCE\x10\x00\x00\x66" \
-        "\x03\xC7\x50\x53\xE8\x0B\xFE\xFF\xFF\x83\xC4\x08\x5F\x5E\x5B\xC3" \
-        "\x55\x33\xF6\xBD\x03\x00\x00\x00\x66\x8B\x0D\xCE\x10\x00\x00\x66" \
-        "\x03\xCF\x51\x53\xE8\xEB\xFD\xFF\xFF\x53\xE8\x78\xFC\xFF\xFF\x66" \
-        "\xC1\xE8\x04\x83\xC4\x0C\x03\xF0\x4D\x75\xDD\x81\xE6\xFF\xFF\x00" \
-        "\x00\xB8\x56\x55\x55\x55\xF7\xEE\x8B\xC2\xC1\xEA\x1F\x03\xC2\xC1" \
-        "\xE0\x04\x66\x8B\xC8\x66\x8B\xD0\x66\xC1\xE9\x04\x66\xC1\xEA\x06" \
-        "\x8D\x0C\x49\x8D\x34\x4A\x8B\xD7\x81\xE2\xFF\xFF\x00\x00\x81\xE6" \
-        "\xFF\xFF\x00\x00\x8B\xCA\xC1\xE9\x04\xC1\xEA\x06\x8D\x6C\x49\xB5" \
-        "\x8D\x2C\x6A\x3B\xF5\x5D\x7C\x2F\x8D\x4C\x49\x4B\x8D\x14\x4A\x3B" \
-        "\xF2\x7F\x24\x66\x8B\x0D\xCE\x10\x00\x00\x66\x2B\xC8\x03\xCF\x5F" \
-        "\x81\xE1\xF0\xFF\x00\x00\x81\xE3\xFF\xFF\x00\x00\x5E\x66\x89\x0C" \
-        "\x5D\xB4\x46\x00\x00\x5B\xC3\x66\x8B\x15\xCE\x10\x00\x00\x81\xE3" \
-        "\xFF\xFF\x00\x00\x5F\x5E\x66\x89\x14\x5D\xB4\x46\x00\x00\x5B\xC3" \
-        "\x66\x83\xFB\x18\x75\x19\x66\xA1\xCE\x10\x00\x00\x66\x05\x01\x30" \
-        "\x50\x6A\x18\xE8\x2C\xFD\xFF\xFF\x83\xC4\x08\x5F\x5E\x5B\xC3\x6A" \
-        "\x00\x53\xE8\x1D\xFD\xFF\xFF\x83\xC4\x08\x5F\x5E\x5B\xC3\x8B\xFF" \
-        "\xF9\x2C\x01\x00\xF9\x2C\x01\x00\x10\x2D\x01\x00\xD0\x2D\x01\x00" \
-        "\x90\x90\x90\x90\x90\x90\x90\x90\x90\x56\x57\x0F\x09\xB1\x40\xFF" \
-        "\x15\xCC\x1E\x00\x00\xBE\xB4\x46\x00\x00\xBF\x40\x00\x00\x00\x66" \
-        "\x8B\x06\x50\xE8\xB8\x21\x00\x00\x83\xC4\x04\x83\xC6\x02\x4F\x75" \
-        "\xEE\x5F\x5E\xC3\x90\x90\x90\x90\x90\x55\x8B\xEC\x53\x56\x57\x66" \
-        "\xC7\x05\x02\x40\x00\xC0\x00\x00\x66\xC7\x05\x14\x22\x00\xC0\x1B" \
-        "\x00\x8B\x45\x08\x25\xFF\xFF\x00\x00\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x1B\x00\x66\xC7\x05\x02\x40" \
-        "\x00\xC0\x01\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x5F\x5E\x5B" \
-        "\x5D\xC3\x56\x57\x33\xF6\xBF\x08\x00\x00\x00\xB8\x21\x00\x00\x00" \
-        "\x8B\xCE\xD3\xE8\x83\xE0\x01\x50\xE8\x9C\xFF\xFF\xFF\x83\xC4\x04" \
-        "\x46\x4F\x75\xE7\x33\xF6\xBF\x06\x00\x00\x00\xBA\x1E\x00\x00\x00" \
-        "\x8B\xCE\xD3\xEA\x83\xE2\x01\x52\xE8\x7C\xFF\xFF\xFF\x83\xC4\x04" \
-        "\x46\x4F\x75\xE7\x8B\x74\x24\x0C\x8B\x44\x24\x14\x8B\x4C\x24\x10" \
-        "\x83\xE6\x7F\x8B\x54\x24\x18\x83\xE0\x07\xC1\xE6\x04\x0B\xF0\x83" \
-        "\xE1\x7F\xC1\xE6\x07\x0B\xF1\x83\xE2\x0F\xC1\xE6\x04\x0B\xF2\x53" \
-        "\x55\x33\xFF\x81\xCE\x00\x40\x00\x00\x33\xDB\xBD\x16\x00\x00\x00" \
-        "\x8B\xC6\x8B\xCB\xD3\xE8\xA8\x01\x74\x11\x6A\x01\x47\xE8\x27\xFF" \
-        "\xFF\xFF\x83\xC4\x04\x66\x83\xFF\x03\x75\x0C\x6A\x00\xE8\x17\xFF" \
-        "\xFF\xFF\x83\xC4\x04\x33\xFF\x43\x4D\x75\xD5\x5D\x33\xF6\xBF\x08" \
-        "\x00\x00\x00\x5B\xBA\x20\x00\x00\x00\x8B\xCE\xD3\xEA\x83\xE2\x01" \
-        "\x52\xE8\xF3\xFE\xFF\xFF\x83\xC4\x04\x46\x4F\x75\xE7\x33\xF6\xBF" \
-        "\x06\x00\x00\x00\xB8\x1E\x00\x00\x00\x8B\xCE\xD3\xE8\x83\xE0\x01" \
-        "\x50\xE8\xD3\xFE\xFF\xFF\x83\xC4\x04\x46\x4F\x75\xE7\x66\xC7\x05" \
-        "\x02\x40\x00\xC0\x00\x00\x5F\x5E\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x83\xEC\x10\x8B\x44\x24\x14\x53\x55\x33\xED\x33\xDB\x3D" \
-        "\xE1\xF5\x05\x00\x89\x6C\x24\x0C\xB9\x01\x00\x00\x00\xC7\x44\x24" \
-        "\x08\x18\x0D\x0F\x4D\x0F\x82\xEB\x00\x00\x00\x3D\x00\xE1\xF5\x05" \
-        "\x0F\x87\xE0\x00\x00\x00\x3D\x7F\xF0\xFA\x02\x73\x22\x8D\x14\x00" \
-        "\x81\xFA\x80\xD1\xF0\x08\x73\x17\x03\xC9\x43\x66\x81\xF9\x80\x00" \
-        "\x8B\xC2\x0F\x87\xBE\x00\x00\x00\x3D\x7F\xF0\xFA\x02\x72\xDE\xB9" \
-        "\x00\xB4\xC4\x04\x56\x3B\xC8\x57\x1B\xFF\xBE\x04\x00\x00\x00\x89" \
-        "\x44\x24\x18\x89\x6C\x24\x1C\xDF\x6C\x24\x18\x83\xE7\x08\x89\x74" \
-        "\x24\x24\xDB\x44\x24\x24\xDC\x0D\x00\x1F\x00\x00\xD9\xC1\xD8\xF9" \
-        "\xDC\x05\xF0\x1E\x00\x00\xE8\x25\x31\x00\x00\x8B\xC8\x66\x83\xF9" \
-        "\x10\x76\x42\x66\x83\xF9\x50\x73\x3C\x8B\xD1\x81\xE2\xFF\xFF\x00" \
-        "\x00\x89\x54\x24\x18\xDA\x74\x24\x18\xD8\xE9\xD8\x15\xE4\x1E\x00" \
-        "\x00\xDF\xE0\xF6\xC4\x01\x74\x06\xD8\x0D\xE0\x1E\x00\x00\xD8\x54" \
-        "\x24\x10\xDF\xE0\xF6\xC4\x01\x74\x10\xD9\x5C\x24\x10\x8B\xEE\x89" \
-        "\x4C\x24\x14\xEB\x06\xDD\xD8\xEB\x02\xDD\xD8\x8B\x4C\x24\x24\x46" \
-        "\x41\x66\x81\xFE\x83\x00\x89\x4C\x24\x24\x72\x86\x8B\x44\x24\x14" \
-        "\x57\x83\xC0\xFE\x53\x83\xC5\xFD\x50\x55\xDD\xD8\xE8\xF1\xFD\xFF" \
-        "\xFF\x83\xC4\x10\x5F\x5E\x5D\x5B\x83\xC4\x10\xC3\x90\x90\x90\x90" \
-        "\x90\x90\x55\x8B\xEC\x53\x56\x57\x66\xC7\x05\x14\x22\x00\xC0\x3B" \
-        "\x00\x66\xC7\x05\x02\x40\x00\xC0\x01\x00\x66\xC7\x05\x14\x22\x00" \
-        "\xC0\x3B\x00\x66\xC7\x05\x02\x40\x00\xC0\x00\x00\x66\xC7\x05\x14" \
-        "\x22\x00\xC0\x3B\x00\x5F\x5E\x5B\x5D\xC3\x55\x8B\xEC\x51\x66\xC7" \
-        "\x45\xFC\x80\x00\xEB\x0B\x66\x8B\x45\xFC\x66\xD1\xE8\x66\x89\x45" \
-        "\xFC\x8B\x4D\xFC\x81\xE1\xFF\xFF\x00\x00\x85\xC9\x74\x32\x8B\x55" \
-        "\x08\x81\xE2\xFF\xFF\x00\x00\x8B\x45\xFC\x25\xFF\xFF\x00\x00\x23" \
-        "\xD0\x85\xD2\x74\x0B\x66\xC7\x05\x1C\x40\x00\xC0\x01\x00\xEB\x09" \
-        "\x66\xC7\x05\x1C\x40\x00\xC0\x00\x00\xE8\x74\xFF\xFF\xFF\xEB\xB6" \
-        "\x66\xC7\x05\x1C\x40\x00\xC0\x00\x00\xE8\x64\xFF\xFF\xFF\x8B\xE5" \
-        "\x5D\xC3\x55\x8B\xEC\x53\x56\x57\x66\xC7\x05\x1C\x40\x00\xC0\x01" \
-        "\x00\x66\xC7\x05\x02\x40\x00\xC0\x01\x00\x66\xC7\x05\x14\x22\x00" \
-        "\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14" \
-        "\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x1B\x00\x66\xC7" \
-        "\x05\x1C\x40\x00\xC0\x00\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00" \
-        "\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0" \
-        "\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x1B\x00\x66\xC7\x05\x02\x40" \
-        "\x00\xC0\x00\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05" \
-        "\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66" \
-        "\xC7\x05\x14\x22\x00\xC0\x1B\x00\x5F\x5E\x5B\x5D\xC3\x55\x8B\xEC" \
-        "\x53\x56\x57\x66\xC7\x05\x1C\x40\x00\xC0\x00\x00\x66\xC7\x05\x02" \
-        "\x40\x00\xC0\x00\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7" \
-        "\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00" \
-        "\x66\xC7\x05\x14\x22\x00\xC0\x1B\x00\x66\xC7\x05\x02\x40\x00\xC0" \
-        "\x01\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22" \
-        "\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05" \
-        "\x14\x22\x00\xC0\x1B\x00\x66\xC7\x05\x1C\x40\x00\xC0\x01\x00\x66" \
-        "\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B" \
-        "\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00" \
-        "\xC0\x1B\x00\x66\xC7\x05\x02\x40\x00\xC0\x00\x00\x66\xC7\x05\x14" \
-        "\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7" \
-        "\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x1B\x00" \
-        "\x66\xC7\x05\x1C\x40\x00\xC0\x00\x00\x66\xC7\x05\x14\x22\x00\xC0" \
-        "\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22" \
-        "\x00\xC0\x3B\x00\x66\xC7\x05\x14\x22\x00\xC0\x1B\x00\x5F\x5E\x5B" \
-        "\x5D\xC3\x55\x8B\xEC\xE8\x68\xFE\xFF\xFF\x68\xD2\x00\x00\x00\xE8" \
-        "\xF6\xFD\xFF\xFF\x83\xC4\x04\x6A\x09\xE8\xEC\xFD\xFF\xFF\x83\xC4" \
-        "\x04\x6A\x01\xE8\xE2\xFD\xFF\xFF\x83\xC4\x04\xE8\xDD\xFE\xFF\xFF" \
-        "\xE8\x3D\xFE\xFF\xFF\x68\xD2\x00\x00\x00\xE8\xCB\xFD\xFF\xFF\x83" \
-        "\xC4\x04\x6A\x0C\xE8\xC1\xFD\xFF\xFF\x83\xC4\x04\x8B\x45\x18\x83" \
-        "\xE0\x7F\x50\xE8\xB2\xFD\xFF\xFF\x83\xC4\x04\xE8\xAD\xFE\xFF\xFF" \
-        "\xE8\x0D\xFE\xFF\xFF\x68\xD2\x00\x00\x00\xE8\x9B\xFD\xFF\xFF\x83" \
-        "\xC4\x04\x6A\x12\xE8\x91\xFD\xFF\xFF\x83\xC4\x04\x6A\x00\xE8\x87" \
-        "\xFD\xFF\xFF\x83\xC4\x04\xE8\x82\xFE\xFF\xFF\xE8\xE2\xFD\xFF\xFF" \
-        "\x68\xD2\x00\x00\x00\xE8\x70\xFD\xFF\xFF\x83\xC4\x04\x6A\x13\xE8" \
-        "\x66\xFD\xFF\xFF\x83\xC4\x04\x6A\x40\xE8\x5C\xFD\xFF\xFF\x83\xC4" \
-        "\x04\xE8\x57\xFE\xFF\xFF\xE8\xB7\xFD\xFF\xFF\x68\xD2\x00\x00\x00" \
-        "\xE8\x45\xFD\xFF\xFF\x83\xC4\x04\x6A\x40\xE8\x3B\xFD\xFF\xFF\x83" \
-        "\xC4\x04\x8B\x4D\x14\x83\xE1\x07\xC1\xE1\x02\x80\xC9\xC0\x8B\x55" \
-        "\x08\xC1\xEA\x08\x83\xE2\x03\x0B\xCA\x51\xE8\x1B\xFD\xFF\xFF\x83" \
-        "\xC4\x04\xE8\x16\xFE\xFF\xFF\xE8\x76\xFD\xFF\xFF\x68\xD2\x00\x00" \
-        "\x00\xE8\x04\xFD\xFF\xFF\x83\xC4\x04\x6A\x41\xE8\xFA\xFC\xFF\xFF" \
-        "\x83\xC4\x04\x8B\x45\x08\x33\xD2\xB9\x00\x01\x00\x00\xF7\xF1\x52" \
-        "\xE8\xE5\xFC\xFF\xFF\x83\xC4\x04\xE8\xE0\xFD\xFF\xFF\xE8\x40\xFD" \
-        "\xFF\xFF\x68\xD2\x00\x00\x00\xE8\xCE\xFC\xFF\xFF\x83\xC4\x04\x6A" \
-        "\x42\xE8\xC4\xFC\xFF\xFF\x83\xC4\x04\x8B\x55\x0C\xC1\xE2\x07\x03" \
-        "\x55\x10\x81\xE2\xFF\x00\x00\x00\x52\xE8\xAC\xFC\xFF\xFF\x83\xC4" \
-        "\x04\xE8\xA7\xFD\xFF\xFF\xE8\x07\xFD\xFF\xFF\x68\xD2\x00\x00\x00" \
-        "\xE8\x95\xFC\xFF\xFF\x83\xC4\x04\x6A\x44\xE8\x8B\xFC\xFF\xFF\x83" \
-        "\xC4\x04\x6A\x20\xE8\x81\xFC\xFF\xFF\x83\xC4\x04\xE8\x7C\xFD\xFF" \
-        "\xFF\xE8\xDC\xFC\xFF\xFF\x68\xD2\x00\x00\x00\xE8\x6A\xFC\xFF\xFF" \
-        "\x83\xC4\x04\x6A\x45\xE8\x60\xFC\xFF\xFF\x83\xC4\x04\x6A\x00\xE8" \
-        "\x56\xFC\xFF\xFF\x83\xC4\x04\xE8\x51\xFD\xFF\xFF\xE8\xB1\xFC\xFF" \
-        "\xFF\x68\xD2\x00\x00\x00\xE8\x3F\xFC\xFF\xFF\x83\xC4\x04\x6A\x46" \
-        "\xE8\x35\xFC\xFF\xFF\x83\xC4\x04\x6A\x3F\xE8\x2B\xFC\xFF\xFF\x83" \
-        "\xC4\x04\xE8\x26\xFD\xFF\xFF\xE8\x86\xFC\xFF\xFF\x68\xD2\x00\x00" \
-        "\x00\xE8\x14\xFC\xFF\xFF\x83\xC4\x04\x6A\x47\xE8\x0A\xFC\xFF\xFF" \
-        "\x83\xC4\x04\x6A\x08\xE8\x00\xFC\xFF\xFF\x83\xC4\x04\xE8\xFB\xFC" \
-        "\xFF\xFF\x5D\xC3\x83\xEC\x1C\x53\x8B\x5C\x24\x24\x33\xC0\x56\x81" \
-        "\xFB\x00\x35\x0C\x00\x57\x89\x44\x24\x10\x89\x44\x24\x18\x89\x44" \
-        "\x24\x1C\xC7\x44\x24\x0C\x00\xC2\xEB\x0B\x0F\x82\x7F\x01\x00\x00" \
-        "\x81\xFB\x00\xC2\xEB\x0B\x0F\x87\x73\x01\x00\x00\xB8\x00\xE1\xF5" \
-        "\x05\x33\xD2\xF7\xF3\x33\xD2\x55\xBF\x02\x00\x00\x00\x89\x44\x24" \
-        "\x24\xB8\x00\x84\xD7\x17\xF7\xF3\x89\x44\x24\x28\x8D\x04\x1B\x89" \
-        "\x44\x24\x18\x8B\x74\x24\x24\x83\xFE\x04\x73\x05\xBE\x04\x00\x00" \
-        "\x00\x8B\x44\x24\x28\x83\xF8\x7F\x89\x44\x24\x30\x76\x0C\xC7\x44" \
-        "\x24\x30\x7F\x00\x00\x00\x8B\x44\x24\x30\x3B\xF0\x0F\x87\x9C\x00" \
-        "\x00\x00\x8B\xC7\x0F\xAF\xC6\x0F\xAF\xC3\x8B\xE8\xB8\x83\xDE\x1B" \
-        "\x43\xF7\xE5\x8B\xCA\x33\xD2\xC1\xE9\x16\x8D\x04\x89\x8D\x04\x80" \
-        "\x8D\x04\x80\x8D\x04\x80\x8D\x04\x80\x8D\x04\x80\xC1\xE0\x0A\xF7" \
-        "\xF7\x33\xD2\xF7\xF6\x2B\xC3\x79\x02\xF7\xD8\x3B\x44\x24\x10\x7D" \
-        "\x10\x89\x44\x24\x10\x89\x4C\x24\x14\x89\x7C\x24\x1C\x89\x74\x24" \
-        "\x20\x41\x33\xD2\x8D\x04\x89\x8D\x04\x80\x8D\x04\x80\x8D\x04\x80" \
-        "\x8D\x04\x80\x8D\x04\x80\xC1\xE0\x0A\xF7\xF7\x33\xD2\xF7\xF6\x2B" \
-        "\xC3\x79\x02\xF7\xD8\x3B\x44\x24\x10\x7D\x10\x89\x44\x24\x10\x89" \
-        "\x4C\x24\x14\x89\x7C\x24\x1C\x89\x74\x24\x20\x8B\x4C\x24\x18\x8B" \
-        "\x44\x24\x30\x46\x03\xE9\x3B\xF0\x0F\x86\x6E\xFF\xFF\xFF\x8B\x54" \
-        "\x24\x18\x03\xD3\x47\x89\x54\x24\x18\x8D\x4F\xFE\x83\xF9\x3E\x0F" \
-        "\x86\x1E\xFF\xFF\xFF\x8B\x44\x24\x10\x5D\x3D\x00\xC2\xEB\x0B\x74" \
-        "\x5E\x8B\x54\x24\x18\x8B\x4C\x24\x10\x83\xE1\x01\x8D\x72\xFE\x8B" \
-        "\x54\x24\x10\x8B\xC2\x2B\xC1\xD1\xE8\x83\xE8\x04\x83\xFA\x2D\x73" \
-        "\x04\x33\xD2\xEB\x29\x81\xFA\xE0\x01\x00\x00\x73\x07\xBA\x01\x00" \
-        "\x00\x00\xEB\x1A\x81\xFA\x80\x02\x00\x00\x73\x07\xBA\x02\x00\x00" \
-        "\x00\xEB\x0B\x81\xFA\x20\x03\x00\x00\x1B\xD2\x83\xC2\x04\x8B\x7C" \
-        "\x24\x1C\x57\x52\x56\x51\x50\xE8\x46\xFC\xFF\xFF\x83\xC4\x14\x5F" \
-        "\x5E\x5B\x83\xC4\x1C\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x66\xA1\x74\x47\x00\x00\x56\x68\x10\x46\x00\x00" \
-        "\x8B\xF1\x50\xE8\x9B\xF1\xFF\xFF\x56\xE8\xC4\xF8\xFF\xFF\x83\xC4" \
-        "\x0C\x5E\xC3\x90\x66\xA1\x74\x47\x00\x00\x56\x68\x10\x46\x00\x00" \
-        "\x8B\xF1\x50\xE8\x7B\xF1\xFF\xFF\x56\xE8\x06\xFE\xFF\xFF\x83\xC4" \
-        "\x0C\x5E\xC3\x90\x33\xC9\x66\x89\x0D\x1C\x40\x00\xC0\x66\xC7\x05" \
-        "\x14\x22\x00\xC0\x3B\x00\xB8\x04\x00\x00\x00\xBA\x02\x00\x00\x00" \
-        "\x66\x89\x0D\x1C\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00" \
-        "\x66\x89\x15\x1C\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00" \
-        "\x66\x89\x0D\x1C\x40\x00\xC0\x66\xC7\x05\x14\x22\x00\xC0\x3B\x00" \
-        "\x48\x75\xCD\x66\x89\x0D\x48\x40\x00\xC0\x66\xC7\x05\x14\x22\x00" \
-        "\xC0\x3B\x00\x66\xC7\x05\x48\x40\x00\xC0\x01\x00\x66\xC7\x05\x14" \
-        "\x22\x00\xC0\x3B\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\xA0\x72\x46\x00\x00\x24\x01\x3C\x01\x75\x09\x66" \
-        "\xC7\x05\x70\x46\x00\x00\x20\x00\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x66\xC7\x05\x70\x46\x00\x00\x00\x00\xC3\x90\x90" \
-        "\x90\x90\x90\x90\x66\x81\x3D\x78\x47\x00\x00\xA4\x06\x56\x8B\x74" \
-        "\x24\x08\x75\x06\x66\x83\xFE\x01\x75\x0D\xE8\x57\x01\x00\x00\x66" \
-        "\x3D\x0F\x00\x75\x02\x5E\xC3\x8B\x44\x24\x14\x8B\x4C\x24\x10\x8B" \
-        "\x54\x24\x0C\x50\x51\x52\x56\xE8\x08\x00\x00\x00\x83\xC4\x10\x5E" \
-        "\xC3\x90\x90\x90\x55\x8B\xEC\x83\xEC\x0C\x66\xC7\x45\xF8\x00\x00" \
-        "\x6A\x02\xE8\xB9\xE7\xFF\xFF\x83\xC4\x04\x6A\x00\xE8\x00\xE8\xFF" \
-        "\xFF\x83\xC4\x04\x6A\x00\xE8\xF6\xE7\xFF\xFF\x83\xC4\x04\x6A\x00" \
-        "\xE8\xEC\xE7\xFF\xFF\x83\xC4\x04\x8B\x45\x08\x25\xFF\xFF\x00\x00" \
-        "\x66\x8B\x4D\x08\x66\x83\xE9\x01\x66\x89\x4D\x08\x85\xC0\x74\x0C" \
-        "\x6A\x01\xE8\xCA\xE7\xFF\xFF\x83\xC4\x04\xEB\xDC\x6A\x01\xE8\xBE" \
-        "\xE7\xFF\xFF\x83\xC4\x04\x6A\x00\xE8\xB4\xE7\xFF\xFF\x83\xC4\x04" \
-        "\x66\xC7\x45\xFC\x80\x00\xEB\x0B\x66\x8B\x55\xFC\x66\xD1\xEA\x66" \
-        "\x89\x55\xFC\x8B\x45\xFC\x25\xFF\xFF\x00\x00\x85\xC0\x7E\x25\x8B" \
-        "\x4D\x0C\x81\xE1\xFF\xFF\x00\x00\x8B\x55\xFC\x81\xE2\xFF\xFF\x00" \
-        "\x00\x23\xCA\xF7\xD9\x1B\xC9\xF7\xD9\x51\xE8\x72\xE7\xFF\xFF\x83" \
-        "\xC4\x04\xEB\xC4\x8B\x45\x10\x25\xFF\xFF\x00\x00\x85\xC0\x7E\x64" \
-        "\x8B\x4D\x10\x81\xE1\xFF\xFF\x00\x00\x8B\x55\x14\x81\xE2\xFF\xFF" \
-        "\x00\x00\x23\xCA\xF7\xD9\x1B\xC9\xF7\xD9\x51\xE8\x41\xE7\xFF\xFF" \
-        "\x83\xC4\x04\x66\x8B\x45\x10\x66\xD1\xE8\x66\x89\x45\x10\x66\x8B" \
-        "\x4D\xF8\x66\xD1\xE1\x66\x89\x4D\xF8\x33\xD2\x66\x8B\x15\x00\x40" \
-        "\x00\xC0\x83\xE2\x04\xF7\xDA\x1B\xD2\xF7\xDA\x89\x55\xF4\x33\xC0" \
-        "\x83\x7D\xF4\x00\x0F\x95\xC0\x66\x8B\x4D\xF8\x66\x0B\xC8\x66\x89" \
-        "\x4D\xF8\xEB\x90\x6A\x00\xE8\xF6\xE6\xFF\xFF\x83\xC4\x04\x66\x8B" \
-        "\x45\xF8\x8B\xE5\x5D\xC3\x56\xE8\x47\xE9\xFF\xFF\x6A\x02\xE8\x8D" \
-        "\xE6\xFF\xFF\x6A\x06\x6A\x00\x6A\x00\xE8\x49\xE8\xFF\xFF\x33\xC0" \
-        "\x66\x81\x3D\x78\x47\x00\x00\xA4\x06\x6A\x00\x6A\x08\x0F\x94\xC0" \
-        "\x68\x81\x00\x00\x00\x50\xE8\x99\xFE\xFF\xFF\x83\xC4\x20\x8B\xF0" \
-        "\xE8\x0E\xE9\xFF\xFF\x66\x8B\xC6\x5E\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x04\x50\xE8\xE6\x00\x00\x00" \
-        "\x8B\x4C\x24\x0C\x83\xC4\x04\x8B\xD1\x81\xE2\xFF\xFF\x00\x00\x4A" \
-        "\x83\xFA\x05\x77\x47\xFF\x24\x95\xDC\x39\x01\x00\xB9\x04\x00\x00" \
-        "\x00\x0C\x20\x51\x51\x50\xE8\x5B\x00\x00\x00\x83\xC4\x0C\xC3\xB9" \
-        "\x06\x00\x00\x00\x0C\x20\x51\x6A\x04\x50\xE8\x47\x00\x00\x00\x83" \
-        "\xC4\x0C\xC3\xB9\x01\x00\x00\x00\x0C\x20\x51\x6A\x04\x50\xE8\x33" \
-        "\x00\x00\x00\x83\xC4\x0C\xC3\xB9\x03\x00\x00\x00\x51\x0C\x20\x6A" \
-        "\x04\x50\xE8\x1F\x00\x00\x00\x83\xC4\x0C\xC3\x90\x8C\x39\x01\x00" \
-        "\xCC\x39\x01\x00\x9F\x39\x01\x00\xB3\x39\x01\x00\xCC\x39\x01\x00" \
-        "\xC7\x39\x01\x00\x90\x90\x8B\x44\x24\x0C\x8B\x4C\x24\x08\x8B\x54" \
-        "\x24\x04\x50\x33\xC0\x66\x81\x3D\x78\x47\x00\x00\xA4\x06\x51\x52" \
-        "\x0F\x94\xC0\x50\xE8\x0D\x00\x00\x00\x83\xC4\x10\xC3\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x56\xE8\x37\xE8\xFF\xFF\x8B\x44\x24\x14" \
-        "\x8B\x4C\x24\x10\x8B\x54\x24\x0C\x50\x8B\x44\x24\x0C\x51\x52\x50" \
-        "\xE8\x5F\xFD\xFF\xFF\x83\xC4\x10\x8B\xF0\xE8\x14\xE8\xFF\xFF\x66" \
-        "\x8B\xC6\x5E\xC3\x90\x90\x66\x83\x3D\x80\x25\x00\x00\x02\x74\x06" \
-        "\x66\x8B\x44\x24\x04\xC3\x66\x8B\x4C\x24\x04\x8A\xC1\x83\xE1\x01" \
-        "\x83\xE0\x02\xD1\xE0\x0B\xC1\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x56\x57\x8B\x7C\x24\x0C\x66\x83\xFF\x3F" \
-        "\x76\x06\x5F\x66\x33\xC0\x5E\xC3\x66\x8B\x0D\x80\x25\x00\x00\x66" \
-        "\x85\xC9\x75\x06\x66\x8B\xC7\x5F\x5E\xC3\x8B\x44\x24\x10\x25\xFF" \
-        "\xFF\x00\x00\x83\xF8\x08\x77\x20\xFF\x24\x85\x38\x3B\x01\x00\x33" \
-        "\xF6\xEB\x1A\xBE\x01\x00\x00\x00\xEB\x13\xBE\x02\x00\x00\x00\xEB" \
-        "\x0C\xBE\x03\x00\x00\x00\xEB\x05\xBE\x04\x00\x00\x00\x66\x83\xF9" \
-        "\x02\x75\x29\x83\xFE\x01\x7E\x0E\x6A\x00\x6A\x07\x6A\x03\xE8\x0D" \
-        "\xC5\xFF\xFF\x83\xC4\x0C\xC1\xE6\x06\x81\xE7\xFF\xFF\x00\x00\x03" \
-        "\xF7\x5F\x66\x8B\x04\x75\x54\x1B\x00\x00\x5E\xC3\x83\xFE\x03\x7E" \
-        "\x0E\x6A\x00\x6A\x07\x6A\x03\xE8\xE4\xC4\xFF\xFF\x83\xC4\x0C\xC1" \
-        "\xE6\x06\x81\xE7\xFF\xFF\x00\x00\x03\xF7\x5F\x66\x8B\x04\x75\x54" \
-        "\x19\x00\x00\x5E\xC3\x8D\x49\x00\xBF\x3A\x01\x00\xBF\x3A\x01\x00" \
-        "\xC3\x3A\x01\x00\xD8\x3A\x01\x00\xCA\x3A\x01\x00\xD8\x3A\x01\x00" \
-        "\xD8\x3A\x01\x00\xD8\x3A\x01\x00\xD1\x3A\x01\x00\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x55\x8B\xEC\x83\xEC\x0C\x53\x56\x57\x66" \
-        "\xC7\x45\xFC\x00\x00\x8B\x45\x08\x25\xFF\xFF\x00\x00\x3D\x00\x01" \
-        "\x00\x00\x7D\x5F\x66\x8B\x4D\x0C\x51\x66\x8B\x55\x08\x52\xE8\xF3" \
-        "\xFE\xFF\xFF\x83\xC4\x08\x66\x89\x45\x08\x8B\x45\x08\x25\xFF\xFF" \
-        "\x00\x00\x83\xE0\x03\x66\x89\x45\xF8\x8B\x4D\xF8\x81\xE1\xFF\xFF" \
-        "\x00\x00\x6B\xC9\x05\x83\xC1\x0A\xBA\x01\x00\x00\x00\xD3\xE2\x8B" \
-        "\x45\x08\x25\xFF\xFF\x00\x00\x25\xFC\x03\x00\x00\x0B\xD0\x81\xCA" \
-        "\x00\x00\x00\x80\x89\x55\xF4\x8B\x45\xF4\x66\x8B\x08\x66\x89\x4D" \
-        "\xFC\xEB\x79\x8B\x4D\x08\x81\xE1\xFF\xFF\x00\x00\x83\xE1\x03\x66" \
-        "\x89\x4D\xF8\x8B\x4D\xF8\x81\xE1\xFF\xFF\x00\x00\x6B\xC9\x05\x83" \
-        "\xC1\x0A\xBA\x0D\x00\x00\x00\xD3\xE2\x8B\x45\x08\x25\xFF\xFF\x00" \
-        "\x00\x05\x00\x02\x00\x00\x25\xFC\x03\x00\x00\x0B\xD0\x81\xCA\x00" \
-        "\x00\x00\x40\x89\x55\xF4\x66\x3E\xC7\x05\xC4\x02\x10\x80\x08\x00" \
-        "\x8B\x45\xF4\x88\x00\x66\x3E\xA1\xDC\x03\x00\x82\x66\x23\x45\x0C" \
-        "\x66\x3B\x45\x0C\x74\x0C\x66\x8B\x4D\xFC\x66\x83\xC1\x01\x66\x89" \
-        "\x4D\xFC\x66\x3E\xC7\x05\xC4\x02\x10\x80\x00\x00\x66\x8B\x45\xFC" \
-        "\x5F\x5E\x5B\x8B\xE5\x5D\xC3\x55\x8B\xEC\x8B\x55\x08\x81\xFA\x00" \
-        "\x01\x00\x00\x73\x3D\x66\x83\x3D\x80\x25\x00\x00\x04\x8D\x45\x10" \
-        "\x8D\x4D\x0C\x50\x8B\x45\x10\x51\x8B\x4D\x0C\x50\x51\x52\x75\x07" \
-        "\xE8\x52\x00\x00\x00\xEB\x05\xE8\xFB\x00\x00\x00\x83\xC4\x14\x8B" \
-        "\x45\x0C\x88\x00\x8B\x45\x10\x85\xC0\x74\x2C\x8B\x45\x10\x88\x00" \
-        "\x5D\xC3\x8B\xC2\x81\xE2\xFC\x03\x00\x00\x83\xE0\x03\x83\xC0\x02" \
-        "\x8D\x0C\x80\x8B\x45\x10\xD3\xE0\x0B\xC2\x0D\x00\x00\x00\x40\x89" \
-        "\x45\x0C\x8B\x45\x0C\x88\x00\x5D\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x8B\x4C\x24\x04\xC1\xE9\x02\x81\xE1" \
-        "\xFF\x00\x00\x00\x83\xF9\x08\x73\x4C\x8B\x54\x24\x0C\x56\x8B\xC2" \
-        "\x8D\x34\x8D\x00\x00\x00\x00\x0C\x20\x57\xC1\xE0\x05\x0B\xC2\x8B" \
-        "\x54\x24\x10\xC1\xE0\x14\x8B\x3C\x95\x94\x1C\x00\x00\x0B\xF0\x23" \
-        "\xF7\x8B\x7C\x24\x18\xC1\xE1\x02\x89\x37\xBE\x1C\x00\x00\x00\x2B" \
-        "\xF1\x5F\x0B\xF0\x8B\x04\x95\xD4\x1C\x00\x00\x8B\x54\x24\x18\x23" \
-        "\xF0\x89\x32\x5E\xC3\x8B\x44\x24\x0C\x8B\xD0\x83\xCA\x20\xC1\xE2" \
-        "\x05\x0B\xD0\xC1\xE2\x05\x0B\xD0\xC1\xE2\x05\x0B\xD0\xC1\xE2\x08" \
-        "\x0B\xD1\x8B\x4C\x24\x10\x8D\x04\x95\x00\x00\x00\x00\x8B\x54\x24" \
-        "\x08\x89\x01\x8B\x14\x95\x54\x1C\x00\x00\x23\xD0\x8B\x44\x24\x14" \
-        "\x89\x11\xC7\x00\x00\x00\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x08\x53\x56\x57\x8B\x7C" \
-        "\x24\x10\x50\x8B\xF7\xC1\xEE\x02\x81\xE6\xFF\x00\x00\x00\xE8\x44" \
-        "\x01\x00\x00\x8B\xCF\x83\xC4\x04\x83\xE1\x03\x83\xF9\x03\x0F\x87" \
-        "\x0F\x01\x00\x00\xFF\x24\x8D\xD8\x3E\x01\x00\x8B\x4C\x24\x18\x25" \
-        "\xFF\xFF\x00\x00\x8B\xD1\x5F\x80\xCE\x04\xC1\xE2\x0A\x0B\xD1\xC1" \
-        "\xE2\x08\x0B\xD6\x5E\x5B\x8D\x0C\x95\x00\x00\x00\x00\x8B\x54\x24" \
-        "\x10\x89\x0A\x8B\x04\x85\x54\x1C\x00\x00\x23\xC1\x8B\x4C\x24\x14" \
-        "\x89\x02\xC7\x01\x00\x00\x00\x00\xC3\x8B\x4C\x24\x18\x25\xFF\xFF" \
-        "\x00\x00\x8B\xD1\x5F\x83\xCA\x20\xC1\xE2\x0A\x0B\xD1\xC1\xE2\x0D" \
-        "\x0B\xD6\x5E\x5B\x8D\x0C\x95\x00\x00\x00\x00\x8B\x54\x24\x10\x89" \
-        "\x0A\x8B\x04\x85\x54\x1C\x00\x00\x23\xC1\x8B\x4C\x24\x14\x89\x02" \
-        "\xC7\x01\x00\x00\x00\x00\xC3\x8B\x4C\x24\x18\x8B\x7C\x24\x1C\x80" \
-        "\xCD\x04\x25\xFF\xFF\x00\x00\x8B\xD1\xC1\xE2\x12\x0B\xD6\xC1\xE2" \
-        "\x02\xC1\xE0\x02\x89\x17\x8B\x98\x94\x1C\x00\x00\x23\xDA\x8D\x14" \
-        "\xB5\x00\x00\x00\x00\x8B\xF2\xBA\x1C\x00\x00\x00\x2B\xD6\x89\x1F" \
-        "\xC1\xE1\x14\xEB\x3C\x8B\x4C\x24\x18\x8B\x7C\x24\x1C\x83\xC9\x20" \
-        "\x25\xFF\xFF\x00\x00\x8B\xD1\xC1\xE2\x17\x0B\xD6\xC1\xE2\x02\xC1" \
-        "\xE0\x02\x89\x17\x8B\x98\x94\x1C\x00\x00\x23\xDA\x8D\x14\xB5\x00" \
-        "\x00\x00\x00\x8B\xF2\xBA\x1C\x00\x00\x00\x2B\xD6\x89\x1F\xC1\xE1" \
-        "\x19\x0B\xD1\x8B\x4C\x24\x20\x89\x11\x8B\x80\xD4\x1C\x00\x00\x23" \
-        "\xC2\x89\x01\x5F\x5E\x5B\xC3\x90\xCB\x3D\x01\x00\x09\x3E\x01\x00" \
-        "\x47\x3E\x01\x00\x85\x3E\x01\x00\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x66\x83\x3D\x80\x25\x00\x00\x02\x66" \
-        "\x8B\x44\x24\x04\x75\x1A\x8A\xC8\x80\xE1\x02\xF6\xD9\x1B\xC9\x24" \
-        "\x01\x83\xE1\x0C\xF6\xD8\x1B\xC0\x83\xE0\x03\x0B\xC8\x66\x8B\xC1" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x04\x50\xE8\xC6\xFF\xFF" \
-        "\xFF\x83\xC4\x04\xA8\x01\x74\x09\x66\x81\x25\x88\x25\x00\x00\xFC" \
-        "\x00\xA8\x02\x74\x09\x66\x81\x25\x88\x25\x00\x00\xF3\x00\xA8\x04" \
-        "\x74\x09\x66\x81\x25\x88\x25\x00\x00\xCF\x00\xA8\x08\x74\x08\x66" \
-        "\x83\x25\x88\x25\x00\x00\x3F\x66\x8B\x0D\x88\x25\x00\x00\x51\x68" \
-        "\x80\x00\x00\x00\x6A\x00\xE8\x0C\x00\x00\x00\x83\xC4\x0C\xC3\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x66\x81\x3D\x78\x47\x00\x00\xA4\x06" \
-        "\x75\x1A\x8B\x44\x24\x0C\x8B\x4C\x24\x08\x8B\x54\x24\x04\x50\x51" \
-        "\x52\x6A\x00\xE8\x7E\xFA\xFF\xFF\x83\xC4\x10\xC3\x66\x33\xC0\xC3" \
-        "\x90\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x04\x50\xE8\x36\xFF\xFF" \
-        "\xFF\x83\xC4\x04\xA8\x01\x74\x07\x80\x0D\x88\x25\x00\x00\x03\xA8" \
-        "\x02\x74\x07\x80\x0D\x88\x25\x00\x00\x0C\xA8\x04\x74\x07\x80\x0D" \
-        "\x88\x25\x00\x00\x30\xA8\x08\x74\x07\x80\x0D\x88\x25\x00\x00\xC0" \
-        "\x66\x8B\x0D\x88\x25\x00\x00\x51\x68\x80\x00\x00\x00\x6A\x00\xE8"
-
-p724 = \
-        "\x83\xFF\xFF\xFF\x83\xC4\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x04\x50\xE8\xD6\xFE\xFF" \
-        "\xFF\x83\xC4\x04\xA8\x01\x74\x18\x8A\x0D\x88\x25\x00\x00\x81\xE1" \
-        "\xFC\x00\x00\x00\x83\xC9\x01\x66\x89\x0D\x88\x25\x00\x00\xEB\x07" \
-        "\x66\x8B\x0D\x88\x25\x00\x00\xA8\x02\x74\x10\x81\xE1\xF3\x00\x00" \
-        "\x00\x83\xC9\x04\x66\x89\x0D\x88\x25\x00\x00\xA8\x04\x74\x10\x81" \
-        "\xE1\xCF\x00\x00\x00\x83\xC9\x10\x66\x89\x0D\x88\x25\x00\x00\xA8" \
-        "\x08\x74\x0D\x83\xE1\x3F\x83\xC9\x40\x66\x89\x0D\x88\x25\x00\x00" \
-        "\x51\x68\x80\x00\x00\x00\x6A\x00\xE8\xFA\xFE\xFF\xFF\x83\xC4\x0C" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x04\x50\xE8\x56\xFE\xFF" \
-        "\xFF\x6A\x00\x6A\x00\x50\xE8\x4B\xF9\xFF\xFF\x83\xC4\x10\xC3\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x04\x50\xE8\x36\xFE\xFF" \
-        "\xFF\x6A\x00\x0C\x10\x6A\x00\x50\xE8\x29\xF9\xFF\xFF\x83\xC4\x10" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x83\xEC\x18\xA1\x14\x1D\x00\x00\x8B" \
-        "\x0D\x18\x1D\x00\x00\x8B\x15\x1C\x1D\x00\x00\x89\x44\x24\x08\xA1" \
-        "\x20\x1D\x00\x00\x53\x89\x4C\x24\x10\x89\x44\x24\x18\x55\x33\xDB" \
-        "\xB0\xDC\xB1\x05\x56\x89\x54\x24\x1C\x57\x88\x44\x24\x10\x88\x4C" \
-        "\x24\x11\xC6\x44\x24\x12\x01\x88\x5C\x24\x13\x88\x44\x24\x14\x88" \
-        "\x4C\x24\x15\xC6\x44\x24\x16\x02\x88\x5C\x24\x17\x33\xED\xBA\x00" \
-        "\x00\xFF\xFF\x66\x85\xDB\x75\x1D\x80\x3A\x42\x75\x4E\xB9\x0F\x00" \
-        "\x00\x00\x8D\x7C\x24\x18\x8B\xF2\x33\xC0\xF3\xA6\x75\x3D\xBB\x01" \
-        "\x00\x00\x00\xEB\x06\x66\x83\xFB\x01\x75\x30\x80\x3A\xDC\x75\x2B" \
-        "\x8B\x02\x8D\x4C\x24\x10\x3B\x01\x74\x08\x8D\x4C\x24\x14\x3B\x01" \
-        "\x75\x19\x8A\x4A\x06\x80\xF9\x40\x76\x11\x80\xF9\x5B\x73\x0C\x80" \
-        "\x7A\x08\xC0\x75\x06\x80\x7A\x09\x03\x74\x0E\x45\x42\x78\xA4\x5F" \
-        "\x5E\x5D\x33\xC0\x5B\x83\xC4\x18\xC3\x66\x0F\xB6\x85\x02\x00\xFF" \
-        "\xFF\x66\x0F\xB6\x95\x04\x00\xFF\xFF\x8D\x04\x80\x5F\x5E\x5D\x8D" \
-        "\x0C\x80\x5B\x8D\x04\x8A\x83\xC4\x18\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x83\xEC\x08\x6A\x06\x6A\x13\x8D\x44" \
-        "\x24\x08\x6A\x10\x50\x6A\x02\xE8\xA4\xDD\xFF\xFF\x8B\x4C\x24\x14" \
-        "\x8B\x44\x24\x18\x41\x6A\x00\x89\x4C\x24\x18\x8D\x4C\x24\x18\x40" \
-        "\x6A\x04\x51\x89\x44\x24\x24\xE8\xE7\xE0\xFF\xFF\x50\x6A\x06\x6A" \
-        "\x13\x8D\x54\x24\x2C\x6A\x10\x52\x6A\x02\xE8\x14\xE1\xFF\xFF\x83" \
-        "\xC4\x38\x66\x83\x3D\x7A\x25\x00\x00\x00\x74\x48\x6A\x06\x6A\x15" \
-        "\x8D\x44\x24\x08\x6A\x12\x50\x6A\x01\xE8\xC9\xDF\xFF\xFF\x8B\x4C" \
-        "\x24\x14\x8B\x44\x24\x18\x41\x6A\x00\x89\x4C\x24\x18\x8D\x4C\x24" \
-        "\x18\x40\x6A\x04\x51\x89\x44\x24\x24\xE8\x95\xE0\xFF\xFF\x50\x6A" \
-        "\x06\x6A\x15\x8D\x54\x24\x2C\x6A\x12\x52\x6A\x01\xE8\xD2\xE2\xFF" \
-        "\xFF\x83\xC4\x38\x83\xC4\x08\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x83\xEC\x08\x56\x57\xBF\x01\x00\x00" \
-        "\x00\x33\xC0\x8B\xCF\x66\xA1\x7E\x25\x00\x00\x81\xE1\xFF\xFF\x00" \
-        "\x00\xF7\xD0\x85\xC1\x74\x4E\x57\xE8\xB9\xF7\xFF\xFF\x6A\x06\x6A" \
-        "\x15\x8D\x54\x24\x14\x8B\xF0\x6A\x12\x52\x56\xE8\x47\xDF\xFF\xFF" \
-        "\x8B\x54\x24\x20\x8B\x4C\x24\x24\x42\x6A\x00\x8D\x44\x24\x24\x41" \
-        "\x6A\x04\x50\x89\x54\x24\x2C\x89\x4C\x24\x30\xE8\x13\xE0\xFF\xFF" \
-        "\x50\x6A\x06\x6A\x15\x8D\x4C\x24\x38\x6A\x12\x51\x56\xE8\x51\xE2" \
-        "\xFF\xFF\x83\xC4\x3C\xD1\xE7\x66\x83\xFF\x10\x72\x94\xE8\xD5\xFE" \
-        "\xFF\xFF\x5F\x5E\x83\xC4\x08\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x6A\x00\x6A\x08\x68\x81\x00\x00\x00" \
-        "\xE8\xE1\xF6\xFF\xFF\x83\xC4\x0C\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45" \
-        "\x00\x00\x3B\xC1\x73\x0E\xE8\x75\x16\x00\x00\x85\xC0\x74\x05\xE9" \
-        "\x9C\x16\x00\x00\xC3\x90\x90\xE9\xE4\x13\x00\x00\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\xA1\x74\x46\x00\x00\x83\xF8\x0F\x0F" \
-        "\x87\x78\x01\x00\x00\xFF\x24\x85\xF8\x44\x01\x00\xA1\x80\x46\x00" \
-        "\x00\x8B\x0D\x7C\x46\x00\x00\x8B\x15\x78\x46\x00\x00\x50\x51\x52" \
-        "\xE8\xE2\xF8\xFF\xFF\x83\xC4\x0C\xC7\x05\x74\x46\x00\x00\xFF\xFF" \
-        "\xFF\xFF\xC3\x66\xA1\x7C\x46\x00\x00\x66\x8B\x0D\x78\x46\x00\x00" \
-        "\x50\x51\xE8\xBF\xF7\xFF\xFF\x83\xC4\x08\x25\xFF\xFF\x00\x00\xA3" \
-        "\x78\x46\x00\x00\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x66" \
-        "\x8B\x15\x78\x46\x00\x00\x52\xE8\x5B\xFB\xFF\xFF\x83\xC4\x04\xC7" \
-        "\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x66\xA1\x78\x46\x00\x00" \
-        "\x50\xE8\xD1\xFB\xFF\xFF\x83\xC4\x04\xC7\x05\x74\x46\x00\x00\xFF" \
-        "\xFF\xFF\xFF\xC3\x66\x8B\x0D\x78\x46\x00\x00\x51\xE8\x16\xFC\xFF" \
-        "\xFF\x83\xC4\x04\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x66" \
-        "\x8B\x15\x78\x46\x00\x00\x52\xE8\x7B\xFC\xFF\xFF\x83\xC4\x04\xC7" \
-        "\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x66\xA1\x78\x46\x00\x00" \
-        "\x50\xE8\x81\xFC\xFF\xFF\x83\xC4\x04\xC7\x05\x74\x46\x00\x00\xFF" \
-        "\xFF\xFF\xFF\xC3\xFB\x66\x8B\x0D\x7C\x46\x00\x00\x66\x8B\x15\x78" \
-        "\x46\x00\x00\x51\x52\xE8\x0C\xF5\xFF\xFF\x83\xC4\x08\xFA\xC7\x05" \
-        "\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xFB\x66\xA1\x78\x46\x00\x00" \
-        "\x6A\x00\x50\xE8\xEE\xF4\xFF\xFF\x83\xC4\x08\xFA\xC7\x05\x74\x46" \
-        "\x00\x00\xFF\xFF\xFF\xFF\xC3\xFB\xE8\x3A\xFD\xFF\xFF\xFA\xC7\x05" \
-        "\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xFB\xE8\xD8\xFD\xFF\xFF\xFA" \
-        "\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xE8\xE4\xF2\xFF\xFF" \
-        "\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xFB\xE8\x66\xFE\xFF" \
-        "\xFF\xFA\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xE8\x75\xFE" \
-        "\xFF\xFF\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x6A\x00\x6A" \
-        "\x06\x6A\x03\xE8\x18\xBB\xFF\xFF\x83\xC4\x0C\xC7\x05\x74\x46\x00" \
-        "\x00\xFF\xFF\xFF\xFF\xC3\x8B\xFF\xEB\x44\x01\x00\x6C\x43\x01\x00" \
-        "\xEB\x44\x01\x00\x93\x43\x01\x00\xBF\x43\x01\x00\xDA\x43\x01\x00" \
-        "\xF4\x43\x01\x00\x0F\x44\x01\x00\x2A\x44\x01\x00\x44\x44\x01\x00" \
-        "\x69\x44\x01\x00\x87\x44\x01\x00\x99\x44\x01\x00\xAB\x44\x01\x00" \
-        "\xBB\x44\x01\x00\xCD\x44\x01\x00\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x51\x53\x8A\xDA\x89\x4C\x24\x04\xE8" \
-        "\x40\xF2\xFF\xFF\xE8\x77\x13\x00\x00\x80\xFB\x01\x75\x0D\x8A\x4C" \
-        "\x24\x04\xFF\x15\xCC\x1E\x00\x00\x5B\x59\xC3\x80\xFB\x02\x75\x0D" \
-        "\x8B\x44\x24\x04\x50\xE8\x76\x0A\x00\x00\x83\xC4\x04\x5B\x59\xC3" \
-        "\x90\x90\x90\x90\x90\x90\x90\x55\x8B\xEC\x56\x57\x8B\x7D\x08\xBE" \
-        "\x00\x00\x09\x00\x3B\xFE\x76\x36\xF7\xC6\xFF\xFF\x00\x00\x89\x36" \
-        "\x75\x25\xB1\x01\xFF\x15\xCC\x1E\x00\x00\xA1\xB8\x45\x00\x00\x8B" \
-        "\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8\xF2\x13\x00\x00\x85\xC0" \
-        "\x74\x05\xE8\x19\x14\x00\x00\x83\xC6\x04\x3B\xF7\x72\xCA\x0F\x09" \
-        "\xBE\x00\x00\x09\x00\x3B\xFE\x76\x43\x39\x36\x74\x0B\x56\x6A\x01" \
-        "\xE8\xE2\x00\x00\x00\x83\xC4\x08\xF7\xC6\xFF\xFF\x00\x00\x75\x25" \
-        "\xB1\x02\xFF\x15\xCC\x1E\x00\x00\x8B\x0D\xB8\x45\x00\x00\xA1\xBC" \
-        "\x45\x00\x00\x3B\xC8\x73\x0E\xE8\xA4\x13\x00\x00\x85\xC0\x74\x05" \
-        "\xE8\xCB\x13\x00\x00\x83\xC6\x04\x3B\xF7\x72\xBD\xBE\x00\x00\x09" \
-        "\x00\x3B\xFE\x76\x3A\x8B\xD6\xF7\xD2\xF7\xC6\xFF\xFF\x00\x00\x89" \
-        "\x16\x75\x25\xB1\x03\xFF\x15\xCC\x1E\x00\x00\xA1\xB8\x45\x00\x00" \
-        "\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8\x61\x13\x00\x00\x85" \
-        "\xC0\x74\x05\xE8\x88\x13\x00\x00\x83\xC6\x04\x3B\xF7\x72\xC6\x0F" \
-        "\x09\xBE\x00\x00\x09\x00\x3B\xFE\x76\x49\x8B\x06\x8B\xCE\xF7\xD1" \
-        "\x3B\xC1\x74\x0B\x56\x6A\x00\xE8\x4B\x00\x00\x00\x83\xC4\x08\xF7" \
-        "\xC6\xFF\xFF\x00\x00\x75\x25\xB1\x04\xFF\x15\xCC\x1E\x00\x00\x8B" \
-        "\x15\xB8\x45\x00\x00\xA1\xBC\x45\x00\x00\x3B\xD0\x73\x0E\xE8\x0D" \
-        "\x13\x00\x00\x85\xC0\x74\x05\xE8\x34\x13\x00\x00\x83\xC6\x04\x3B" \
-        "\xF7\x72\xB7\x32\xC9\xFF\x15\xCC\x1E\x00\x00\x5F\x5E\x5D\xC3\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x56\xB1\x0F\xFF\x15\xCC\x1E\x00\x00" \
-        "\x8B\x44\x24\x08\x8B\x74\x24\x0C\x85\xC0\x8B\xC6\x75\x02\xF7\xD0" \
-        "\x50\xE8\x2A\x09\x00\x00\x8B\x06\x50\xE8\x22\x09\x00\x00\x56\xE8" \
-        "\x1C\x09\x00\x00\x83\xC4\x0C\x5E\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\x51\xA1\xD0\x10\x00\x00\x53\x55\x56\x05\x01\x10\x00\x00\x57\x50" \
-        "\x6A\x0C\xE8\xED\xE3\xFF\xFF\x68\x21\x7C\x00\x00\x6A\x14\xE8\xE1" \
-        "\xE3\xFF\xFF\x83\xC4\x10\xC7\x44\x24\x10\x0A\x00\x00\x00\x8B\x4C" \
-        "\x24\x18\x68\x10\x46\x00\x00\x8B\x11\x89\x15\x10\x46\x00\x00\x66" \
-        "\x8B\x15\x74\x47\x00\x00\x8B\x41\x04\x52\xA3\x14\x46\x00\x00\x8B" \
-        "\x49\x08\x89\x0D\x18\x46\x00\x00\xE8\xF6\xE0\xFF\xFF\x68\x01\x32" \
-        "\x00\x00\x6A\x1C\xE8\x9B\xE3\xFF\xFF\x6A\x64\xE8\x10\xD7\xFF\xFF" \
-        "\x8B\x6C\x24\x34\x83\xC4\x14\xBB\x01\x00\x00\x00\x8D\x75\x02\x8B" \
-        "\xFE\x33\xC0\xBA\x01\x00\x00\x00\x66\x8B\x07\x8B\xC8\x83\xE1\x03" \
-        "\x83\xC1\x02\xC1\xE8\x02\x8D\x0C\x89\xD3\xE2\x8A\x8C\x82\x00\x00" \
-        "\x00\x80\x84\xC9\x75\x0D\x6A\x00\x53\x6A\x07\xE8\x40\xB8\xFF\xFF" \
-        "\x83\xC4\x0C\x43\x83\xC7\x02\x66\x83\xFB\x2A\x7E\xC4\x83\xC5\x56" \
-        "\xBB\x2B\x00\x00\x00\x8B\xFD\x33\xC0\xBA\x01\x00\x00\x00\x66\x8B" \
-        "\x07\x8B\xC8\x83\xE1\x03\x83\xC1\x02\xC1\xE8\x02\x8D\x0C\x89\xD3" \
-        "\xE2\x8A\x8C\x82\x00\x00\x00\x80\x84\xC9\x74\x0D\x6A\x00\x6A\x07" \
-        "\x53\xE8\xFA\xB7\xFF\xFF\x83\xC4\x0C\x43\x83\xC7\x02\x66\x83\xFB" \
-        "\x54\x7E\xC4\x6A\x00\x6A\x1C\xE8\xF8\xE2\xFF\xFF\x6A\x64\xE8\x6D" \
-        "\xD6\xFF\xFF\x8B\x44\x24\x28\x68\x10\x46\x00\x00\x8B\x08\x89\x0D" \
-        "\x10\x46\x00\x00\x66\x8B\x0D\x74\x47\x00\x00\x8B\x50\x04\x51\x89" \
-        "\x15\x14\x46\x00\x00\x8B\x40\x08\xA3\x18\x46\x00\x00\xE8\x11\xE0" \
-        "\xFF\xFF\x68\x01\x32\x00\x00\x6A\x1C\xE8\xB6\xE2\xFF\xFF\x6A\x64" \
-        "\xE8\x2B\xD6\xFF\xFF\x83\xC4\x20\xBF\x01\x00\x00\x00\x33\xC0\xBA" \
-        "\x01\x00\x00\x00\x66\x8B\x06\x8B\xC8\x83\xE1\x03\x83\xC1\x02\xC1" \
-        "\xE8\x02\x8D\x0C\x89\xD3\xE2\x8A\x8C\x82\x00\x00\x00\x80\x84\xC9" \
-        "\x74\x0D\x6A\x00\x57\x6A\x07\xE8\x64\xB7\xFF\xFF\x83\xC4\x0C\x47" \
-        "\x83\xC6\x02\x66\x83\xFF\x2A\x7E\xC4\xBF\x2B\x00\x00\x00\x8B\xF5" \
-        "\x33\xC0\xBA\x01\x00\x00\x00\x66\x8B\x06\x8B\xC8\x83\xE1\x03\x83" \
-        "\xC1\x02\xC1\xE8\x02\x8D\x0C\x89\xD3\xE2\x8A\x8C\x82\x00\x00\x00" \
-        "\x80\x84\xC9\x75\x0D\x6A\x00\x57\x6A\x07\xE8\x21\xB7\xFF\xFF\x83" \
-        "\xC4\x0C\x47\x83\xC6\x02\x66\x83\xFF\x54\x7E\xC4\x6A\x00\x6A\x1C" \
-        "\xE8\x1F\xE2\xFF\xFF\x6A\x64\xE8\x94\xD5\xFF\xFF\x8B\x44\x24\x1C" \
-        "\x83\xC4\x0C\x48\x89\x44\x24\x10\x0F\x85\x30\xFE\xFF\xFF\x66\x8B" \
-        "\x0D\x74\x47\x00\x00\x33\xC0\xA3\x10\x46\x00\x00\x68\x10\x46\x00" \
-        "\x00\xA3\x14\x46\x00\x00\x51\xA3\x18\x46\x00\x00\xE8\x32\xDF\xFF" \
-        "\xFF\x83\xC4\x08\x5F\x5E\x5D\x5B\x59\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x68\x24\x1D\x00\x00\x68\x9C\x1E\x00\x00\x68\x90\x1E\x00\x00\xE8" \
-        "\xBC\xFD\xFF\xFF\x83\xC4\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x68\xD0\x1D\x00\x00\x68\xB4\x1E\x00\x00\x68\xA8\x1E\x00\x00\xE8" \
-        "\x9C\xFD\xFF\xFF\x83\xC4\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xE8\xFB\xBB\xFF\xFF\x66\x85\xC0\x74\x07\xE8\xB1\xFF\xFF\xFF\xEB" \
-        "\x05\xE8\xCA\xFF\xFF\xFF\x53\x55\x8B\x6C\x24\x0C\x56\x57\x33\xDB" \
-        "\x33\xF6\xBF\x07\x00\x00\x00\x56\x53\xE8\x62\xBC\xFF\xFF\x83\xC4" \
-        "\x08\x66\x3D\x31\x00\x74\x13\x8B\xCD\x81\xE1\xFF\xFF\x00\x00\x3B" \
-        "\xF9\x7D\x07\x68\x01\xFA\x00\x00\xEB\x02\x6A\x00\x50\xE8\x42\xE1" \
-        "\xFF\xFF\x83\xC4\x08\x46\x4F\x66\x83\xFE\x08\x72\xCA\x43\x66\x83" \
-        "\xFB\x06\x72\xBC\x8B\x7C\x24\x18\x66\x85\xFF\x74\x28\xE8\x6E\x00" \
-        "\x00\x00\x8D\x14\xBF\x8D\x04\xD5\xC0\x0E\x00\x00\x0C\x01\x50\x6A" \
-        "\x14\xE8\x0E\xE1\xFF\xFF\x68\x01\x32\x00\x00\x6A\x1C\xE8\x02\xE1" \
-        "\xFF\xFF\x83\xC4\x10\xBE\x06\x00\x00\x00\x6A\x06\xE8\x9F\xD4\xFF" \
-        "\xFF\x6A\x64\xE8\x68\xD4\xFF\xFF\x6A\x04\xE8\x91\xD4\xFF\xFF\x6A" \
-        "\x64\xE8\x5A\xD4\xFF\xFF\x83\xC4\x10\x4E\x75\xDE\x66\x85\xFF\x5F" \
-        "\x5E\x5D\x5B\x74\x13\x6A\x00\x6A\x1C\xE8\xC6\xE0\xFF\xFF\x6A\x64" \
-        "\xE8\x3B\xD4\xFF\xFF\x83\xC4\x0C\xE9\x53\x1A\x00\x00\x90\x90\x90" \
-        "\x68\x7C\x1E\x00\x00\x6A\x30\xE8\xBC\xDE\xFF\xFF\xE8\x0F\xBB\xFF" \
-        "\xFF\x8B\x0D\x84\x1E\x00\x00\x8B\x15\x88\x1E\x00\x00\x66\xF7\xD8" \
-        "\x1B\xC0\x89\x0D\x10\x46\x00\x00\x66\x8B\x0D\x8C\x1E\x00\x00\x83" \
-        "\xE0\x08\x83\xC0\x58\x89\x15\x14\x46\x00\x00\x8A\x15\x8E\x1E\x00" \
-        "\x00\x68\x10\x46\x00\x00\x50\x66\xA3\x74\x47\x00\x00\x66\x89\x0D" \
-        "\x18\x46\x00\x00\x88\x15\x1A\x46\x00\x00\xE8\xA4\xDD\xFF\xFF\x83" \
-        "\xC4\x10\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8" \
-        "\xCC\x0E\x00\x00\x85\xC0\x74\x05\xE8\xF3\x0E\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\x9C\x25\x00\x00\xA3\x94\x25\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\x94\x25\x00\x00\xA3\x98\x25\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8" \
-        "\x6C\x0E\x00\x00\x85\xC0\x74\x05\xE8\x93\x0E\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\x3C\x80\x72\x09\xC6\x05\x90\x25\x00\x00\x25\xEB\x3D" \
-        "\x3C\x58\x72\x11\xC6\x05\x90\x25\x00\x00\x02\x66\xC7\x05\x78\x25" \
-        "\x00\x00\x02\x00\xC3\x8B\xC8\x81\xE1\xFF\x00\x00\x00\x8A\x89\x08" \
-        "\x1F\x00\x00\x80\xF9\x02\x88\x0D\x90\x25\x00\x00\x75\x0A\x66\xC7" \
-        "\x05\x78\x25\x00\x00\x02\x00\xC3\x80\xF9\x25\x75\x2D\x66\x83\x3D" \
-        "\x74\x25\x00\x00\x00\x74\x24\x0F\xBF\x15\x9A\x10\x00\x00\x8B\x0D" \
-        "\x94\x25\x00\x00\x56\x8B\x34\x95\x48\x0F\x00\x00\x3B\xCE\x5E\x77" \
-        "\x2A\x66\xC7\x05\x78\x25\x00\x00\x03\x00\xC3\x8B\x0D\x94\x25\x00" \
-        "\x00\x8B\x15\xA0\x25\x00\x00\x3B\xD1\x76\xE6\x88\x01\x8B\x0D\x94" \
-        "\x25\x00\x00\x41\x89\x0D\x94\x25\x00\x00\xC3\x88\x01\x8B\x0D\x94" \
-        "\x25\x00\x00\x49\x89\x0D\x94\x25\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8" \
-        "\x8C\x0D\x00\x00\x85\xC0\x74\x05\xE8\xB3\x0D\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\x80\x3D\x90\x25\x00\x00\x25\x75\x2D\x66\x83\x3D\x74" \
-        "\x25\x00\x00\x00\x74\x24\x0F\xBF\x15\x9A\x10\x00\x00\x8B\x0D\x94" \
-        "\x25\x00\x00\x56\x8B\x34\x95\x48\x0F\x00\x00\x3B\xCE\x5E\x77\x2A" \
-        "\x66\xC7\x05\x78\x25\x00\x00\x03\x00\xC3\x8B\x0D\x94\x25\x00\x00" \
-        "\x8B\x15\xA0\x25\x00\x00\x3B\xD1\x76\xE6\x88\x01\x8B\x0D\x94\x25" \
-        "\x00\x00\x41\x89\x0D\x94\x25\x00\x00\xC3\x88\x01\x8B\x0D\x94\x25" \
-        "\x00\x00\x49\x89\x0D\x94\x25\x00\x00\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x0D\x94\x25\x00\x00\xA1\x98\x25\x00\x00\x3B\xC8\x74\x1C\x66" \
-        "\x83\x3D\x74\x25\x00\x00\x00\x8A\x01\x74\x08\x49\x89\x0D\x94\x25" \
-        "\x00\x00\xC3\x41\x89\x0D\x94\x25\x00\x00\xC3\xB0\x24\xC3\x90\x90" \
-        "\x56\xFF\x15\xC4\x1E\x00\x00\x66\x0F\xB6\xF0\xFF\x15\xC4\x1E\x00" \
-        "\x00\x25\xFF\x00\x00\x00\xC1\xE0\x08\x03\xC6\x5E\xC3\x90\x90\x90" \
-        "\x56\xE8\xDA\xFF\xFF\xFF\x66\x8B\xF0\x81\xE6\xFF\xFF\x00\x00\xE8" \
-        "\xCC\xFF\xFF\xFF\x25\xFF\xFF\x00\x00\xC1\xE0\x10\x03\xC6\x5E\xC3" \
-        "\x80\x3D\x90\x25\x00\x00\x25\x75\x2C\x66\x83\x3D\x74\x25\x00\x00" \
-        "\x00\x74\x27\x0F\xBF\x15\x9A\x10\x00\x00\xA1\x94\x25\x00\x00\x56" \
-        "\x8B\x34\x95\x48\x0F\x00\x00\x3B\xC6\x5E\x77\x2C\x66\xC7\x05\x78" \
-        "\x25\x00\x00\x03\x00\xE9\xA6\x01\x00\x00\xA1\x94\x25\x00\x00\x8B" \
-        "\x15\xA0\x25\x00\x00\x3B\xD0\x76\xE3\x88\x08\xA1\x94\x25\x00\x00" \
-        "\x40\xA3\x94\x25\x00\x00\xEB\xDD\x88\x08\xA1\x94\x25\x00\x00\x48" \
-        "\xA3\x94\x25\x00\x00\xEB\xCE\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x55\x8B\xEC\x51\x66\xA1\x7E\x25\x00\x00\x53\x57\x66\x33\x05\x7E" \
-        "\x47\x00\x00\x8B\xF9\x66\x8B\x0D\x7C\x25\x00\x00\x89\x45\xFC\x66" \
-        "\x8B\xD9\x66\x33\x1D\x7C\x47\x00\x00\x66\x85\xDB\x74\x40\x66\x85" \
-        "\xC9\x74\x3B\xB1\x66\xE8\x36\x01\x00\x00\x33\xC9\x8A\xCF\xE8\x2D" \
-        "\x01\x00\x00\x8A\xCB\xE8\x26\x01\x00\x00\x8A\x0D\x76\x47\x00\x00" \
-        "\xE8\x1B\x01\x00\x00\x83\xE3\x0F\x6A\x00\x53\xE8\x76\xEB\xFF\xFF" \
-        "\x6A\x01\x53\xE8\x6E\xEB\xFF\xFF\x8B\x45\xFC\x83\xC4\x10\x66\x85" \
-        "\xC0\x74\x3E\x66\x83\x3D\x7E\x25\x00\x00\x00\x74\x34\x56\xB1\x67" \
-        "\xE8\xEB\x00\x00\x00\x8B\x5D\xFC\x33\xC9\x8A\xCF\xE8\xDF\x00\x00" \
-        "\x00\x8A\xCB\xE8\xD8\x00\x00\x00\x8B\xF3\x83\xE6\x0F\x6A\x00\x56" \
-        "\xE8\x31\xEB\xFF\xFF\x6A\x04\x56\xE8\x29\xEB\xFF\xFF\x83\xC4\x10" \
-        "\x5E\x66\xA1\x7C\x25\x00\x00\x66\x8B\x0D\x7E\x25\x00\x00\x66\x83" \
-        "\x3D\x74\x25\x00\x00\x00\x66\xA3\x7C\x47\x00\x00\x66\x89\x0D\x7E" \
-        "\x47\x00\x00\x74\x0D\x8B\x0D\x94\x25\x00\x00\x33\xC0\x8A\x01\x49" \
-        "\xEB\x0B\x8B\x0D\x94\x25\x00\x00\x33\xC0\x8A\x01\x41\x81\xE7\xFF" \
-        "\x00\x00\x00\x89\x0D\x94\x25\x00\x00\x3B\xF8\x5F\x5B\x74\x0F\xFA" \
-        "\x90\xFC\x6A\x01\x68\x34\x47\x00\x00\xE8\xDA\x12\x00\x00\x8B\xE5" \
-        "\x5D\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x66\x83\x3D\x74\x25\x00\x00\x00\x74\x0D\x8B\x15\x94\x25\x00\x00" \
-        "\x33\xC0\x8A\x02\x4A\xEB\x0B\x8B\x15\x94\x25\x00\x00\x33\xC0\x8A" \
-        "\x02\x42\x81\xE1\xFF\x00\x00\x00\x89\x15\x94\x25\x00\x00\x3B\xC8" \
-        "\x74\x0F\xFA\x90\xFC\x6A\x01\x68\x34\x47\x00\x00\xE8\x87\x12\x00" \
-        "\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x15\xBC\x45\x00\x00\x85\xD2\x0F\x84\xB8\x00\x00\x00\x56\x66" \
-        "\xC7\x05\xC0\x45\x00\x00\x01\x00\xB8\x00\x01\x00\x00\x8B\x35\xB8" \
-        "\x45\x00\x00\x3B\xF2\x5E\x75\x19\x66\x85\x05\x02\x22\x00\xC0\x75" \
-        "\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\xC6\x05\x00\x22\x00\xC0" \
-        "\x08\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00" \
-        "\xC0\x74\xF7\x88\x0D\x00\x22\x00\xC0\x8B\x0D\xB8\x45\x00\x00\x49" \
-        "\x89\x0D\xB8\x45\x00\x00\x75\x54\x66\x85\x05\x02\x22\x00\xC0\x75" \
-        "\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x88\x15\x00\x22\x00\xC0" \
-        "\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0" \
-        "\x74\xF7\x8B\xCA\xC1\xE9\x08\x88\x0D\x00\x22\x00\xC0\x66\x85\x05" \
-        "\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\xC6" \
-        "\x05\x00\x22\x00\xC0\x99\x89\x15\xB8\x45\x00\x00\x66\xC7\x05\xC0" \
-        "\x45\x00\x00\x00\x00\xC3\xB8\x00\x01\x00\x00\x66\x85\x05\x02\x22" \
-        "\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x88\x0D\x00" \
-        "\x22\x00\xC0\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\x66\x8B\x5C\x24\x08\x8A\xCB\xFF\x15\xCC\x1E\x00\x00\x33\xC9" \
-        "\x8A\xCF\x5B\xFF\x25\xCC\x1E\x00\x00\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\x8B\x74\x24\x08\x56\xE8\xD5\xFF\xFF\xFF\xC1\xEE\x10\x56\xE8" \
-        "\xCC\xFF\xFF\xFF\x83\xC4\x08\x5E\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\x56\x57\x33\xFF\x32\xDB\xE8\xC4\xFC\xFF\xFF\x8B\xF0\x66\xC7" \
-        "\x05\x78\x25\x00\x00\x01\x00\xE8\xC4\xFA\xFF\xFF\x8B\xC6\x4E\x85" \
-        "\xC0\x74\x3A\x46\xFF\x15\xC4\x1E\x00\x00\x66\x33\xC9\x8A\xC8\x03" \
-        "\xF9\x66\x83\x3D\x74\x25\x00\x00\x00\x74\x4C\x0F\xBF\x15\x9A\x10" \
-        "\x00\x00\x8B\x0D\x94\x25\x00\x00\x3B\x0C\x95\x48\x0F\x00\x00\x77" \
-        "\x55\x66\xC7\x05\x78\x25\x00\x00\x03\x00\x4E\x75\xC7\xFF\x15\xC4" \
-        "\x1E\x00\x00\x03\xC7\x84\xC0\x74\x02\xB3\x02\x66\x83\x3D\x78\x25" \
-        "\x00\x00\x01\x74\x02\xB3\x01\xE8\x74\xFA\xFF\xFF\x5F\x8A\xCB\x5E" \
-        "\x5B\xFF\x25\xCC\x1E\x00\x00\x8B\x0D\x94\x25\x00\x00\x8B\x15\xA0" \
-        "\x25\x00\x00\x3B\xD1\x76\xBA\x88\x01\xA1\x94\x25\x00\x00\x40\xA3" \
-        "\x94\x25\x00\x00\xEB\xB4\x88\x01\xA1\x94\x25\x00\x00\x48\xA3\x94" \
-        "\x25\x00\x00\xEB\xA5\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\x56\x33\xDB\x0F\x09\x66\x39\x1D\x74\x25\x00\x00\x74\x0D\x8B" \
-        "\x35\x9C\x25\x00\x00\xA1\x98\x25\x00\x00\xEB\x0B\x8B\x35\x98\x25" \
-        "\x00\x00\xA1\x9C\x25\x00\x00\x2B\xF0\x56\xE8\xF1\xFE\xFF\xFF\x83" \
-        "\xC4\x04\xE8\xE9\xF9\xFF\xFF\x8B\xC6\x4E\x85\xC0\x74\x2B\x46\xA1" \
-        "\x94\x25\x00\x00\x66\x83\x3D\x74\x25\x00\x00\x00\x8A\x08\x74\x03" \
-        "\x48\xEB\x01\x40\x66\x33\xD2\xA3\x94\x25\x00\x00\x8A\xD1\x03\xDA" \
-        "\xFF\x15\xCC\x1E\x00\x00\x4E\x75\xD6\x8A\xCB\x5E\xF6\xD9\x5B\xFF" \
-        "\x25\xCC\x1E\x00\x00\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\xB8\x34\x12\x00\x00\x0F\x09\x8B\x0D\x9C\x25\x00\x00\x8B\x35" \
-        "\x98\x25\x00\x00\x3B\xCE\x73\x26\x53\x57\x8B\xD0\x8B\xF8\x81\xE2" \
-        "\x00\xFE\x01\x00\x33\xDB\x8A\x19\xC1\xEF\x0F\x33\xD7\xC1\xEA\x09" \
-        "\x33\xD3\xC1\xE0\x08\x03\xC2\x41\x3B\xCE\x72\xDE\x5F\x5B\x50\xE8" \
-        "\x5C\xFE\xFF\xFF\x83\xC4\x04\x5E\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\xA8\x25\x00\x00\xA3\xA0\x25\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\xA0\x25\x00\x00\xC7\x05\x8C\x25\x00\x00\x00\x00\x00\x00\xA3" \
-        "\xA4\x25\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xB1\x06\xE8\x59\x03\x00\x00\x8A\x4C\x24\x04\xE9\x00\xFD\xFF\xFF" \
-        "\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8" \
-        "\x9C\x07\x00\x00\x85\xC0\x74\x05\xE8\xC3\x07\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\x66\x83\x3D\x74\x25\x00\x00\x00\x74\x24\x8B\x15\xA8" \
-        "\x25\x00\x00\x8B\x0D\xA0\x25\x00\x00\x56\x8B\x35\x70\x25\x00\x00" \
-        "\x2B\xD1\x3B\xF2\x5E\x7F\x1A\x66\xC7\x05\x78\x25\x00\x00\x03\x00" \
-        "\xC3\x8B\x0D\xA0\x25\x00\x00\x8B\x15\x94\x25\x00\x00\x3B\xCA\x76" \
-        "\xE6\x88\x01\x8B\x0D\xA0\x25\x00\x00\x49\x89\x0D\xA0\x25\x00\x00" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x0D\xA0\x25\x00\x00\x8A\x01\x49\x89\x0D\xA0\x25\x00\x00\xC3" \
-        "\x53\x56\x33\xF6\x32\xDB\xE8\x55\xFA\xFF\xFF\x8B\xC8\x48\x85\xC9" \
-        "\x66\xC7\x05\x78\x25\x00\x00\x01\x00\x74\x3E\x57\x8D\x78\x01\xFF" \
-        "\x15\xC4\x1E\x00\x00\x66\x33\xD2\x8A\xD0\x03\xF2\x66\x83\x3D\x74" \
-        "\x25\x00\x00\x00\x74\x54\x8B\x15\xA8\x25\x00\x00\x8B\x0D\xA0\x25" \
-        "\x00\x00\x2B\xD1\x39\x15\x70\x25\x00\x00\x7F\x4E\x66\xC7\x05\x78" \
-        "\x25\x00\x00\x03\x00\x4F\x75\xC7\x5F\xFF\x15\xC4\x1E\x00\x00\x03" \
-        "\xC6\x84\xC0\x74\x02\xB3\x02\x66\x83\x3D\x78\x25\x00\x00\x01\x74" \
-        "\x02\xB3\x01\x66\x83\x7C\x24\x0C\x00\x74\x05\xE8\xB0\xFE\xFF\xFF" \
-        "\x8A\xCB\x5E\x5B\xFF\x25\xCC\x1E\x00\x00\x8B\x0D\xA0\x25\x00\x00" \
-        "\x8B\x15\x94\x25\x00\x00\x3B\xCA\x76\xB2\x88\x01\xA1\xA0\x25\x00" \
-        "\x00\x48\xA3\xA0\x25\x00\x00\xEB\xAC\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\x56\x33\xDB\x0F\x09\x8B\x35\xA8\x25\x00\x00\x8B\x15\xA4\x25" \
-        "\x00\x00\x2B\xF2\x56\xE8\xA6\xFC\xFF\xFF\x83\xC4\x04\xE8\x4E\xFE" \
-        "\xFF\xFF\x8B\xC6\x4E\x85\xC0\x74\x1E\x46\xA1\xA0\x25\x00\x00\x66" \
-        "\x33\xD2\x8A\x08\x8A\xD1\x03\xDA\x48\xA3\xA0\x25\x00\x00\xFF\x15" \
-        "\xCC\x1E\x00\x00\x4E\x75\xE3\x8A\xCB\x5E\xF6\xD9\x5B\xFF\x25\xCC" \
-        "\x1E\x00\x00\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xE8\x4B\xF9\xFF\xFF\x85\xC0\x75\x05\xE8\x12\x00\x00\x00\x50\xA3" \
-        "\x8C\x25\x00\x00\xE8\x47\xFC\xFF\xFF\x59\xC3\x90\x90\x90\x90\x90" \
-        "\x56\x83\xC8\xFF\x0F\x09\x8B\x0D\xA8\x25\x00\x00\x8B\x35\xA4\x25" \
-        "\x00\x00\x3B\xCE\x76\x21\x57\x33\xD2\x8B\xF8\x8A\x11\x81\xE7\xFF" \
-        "\x00\x00\x00\x33\xD7\xC1\xE8\x08\x8B\x14\x95\x80\x47\x00\x00\x33" \
-        "\xC2\x49\x3B\xCE\x77\xE1\x5F\xF7\xD0\x5E\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\x8C\x25\x00\x00\x85\xC0\x74\x20\xE8\xB2\xFF\xFF\xFF\x3B\x05" \
-        "\x8C\x25\x00\x00\x74\x13\x6A\x01\x68\x34\x47\x00\x00\xC6\x05\x76" \
-        "\x47\x00\x00\x94\xE8\x3F\x0D\x00\x00\xC3\x90\x90\x90\x90\x90\x90" \
-        "\xE8\xCB\xF6\xFF\xFF\xE8\x76\xFD\xFF\xFF\xE8\xD1\xF6\xFF\xFF\xE9" \
-        "\x7C\xFD\xFF\xFF\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x08\x8B\x4C\x24\x04\x25\xFF\xFF\x00\x00\x81\xE1\xFF" \
-        "\xFF\x00\x00\xC1\xE0\x10\x03\xC1\xC1\xE0\x0A\x48\x66\x83\x3D\x74" \
-        "\x25\x00\x00\x00\xA3\xA8\x25\x00\x00\x74\x0E\x2B\x05\x70\x25\x00" \
-        "\x00\x48\xA3\x9C\x25\x00\x00\xEB\x0A\xC7\x05\x9C\x25\x00\x00\x00" \
-        "\x00\x09\x00\xE9\x98\xFF\xFF\xFF\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x66\x83\x3D\x74\x25\x00\x00\x00\x74\x15\xA1\x9C\x25\x00\x00\x8B" \
-        "\x0D\x94\x25\x00\x00\x2B\xC1\x50\xE8\x43\xFB\xFF\xFF\x59\xC3\xA1" \
-        "\x94\x25\x00\x00\x8B\x0D\x9C\x25\x00\x00\x2B\xC1\x50\xE8\x2E\xFB" \
-        "\xFF\xFF\x59\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\xA8\x25\x00\x00\x8B\x15\xA0\x25\x00\x00\x2B\xC2\x50\xE8\x0D" \
-        "\xFB\xFF\xFF\x59\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xE8\xAB\xFC\xFF\xFF\x8B\x44\x24\x04\x8B\x0D\xA0\x25\x00\x00\x2B" \
-        "\xC8\x89\x0D\xA0\x25\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x33\xC0\x66\x83\x3D\x56\x10\x00\x00\x27\x56\x0F\x95\xC0\x8B\xF0" \
-        "\xE8\x7B\xFC\xFF\xFF\xE8\xE6\x01\x00\x00\x66\x8B\xC6\x5E\xC3\x90" \
-        "\xA1\xBC\x45\x00\x00\x85\xC0\x74\x0A\x51\xE8\x31\x05\x00\x00\x83" \
-        "\xC4\x04\xC3\xB8\x00\x01\x00\x00\x66\x85\x05\x02\x22\x00\xC0\x75" \
-        "\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x88\x0D\x02\x22\x00\xC0" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x04\x56\x83\xCE\xFF\x8B\xC8\x48\x85\xC9\x74\x56\x57" \
-        "\x8D\x78\x01\x8B\x15\xB8\x45\x00\x00\xA1\xBC\x45\x00\x00\x3B\xD0" \
-        "\x73\x0E\xE8\xF9\x03\x00\x00\x85\xC0\x74\x05\xE8\x20\x04\x00\x00" \
-        "\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00" \
-        "\xC0\xF6\xC4\x02\x74\xF5\x8B\xCE\x25\xFF\x00\x00\x00\x81\xE1\xFF" \
-        "\x00\x00\x00\x33\xC8\xC1\xEE\x08\x8B\x14\x8D\x80\x47\x00\x00\x33" \
-        "\xF2\x4F\x75\xAF\x5F\x8B\xC6\x5E\xF7\xD0\xC3\x90\x90\x90\x90\x90" \
-        "\x8B\x4C\x24\x04\x83\xC8\xFF\x8B\xD1\x49\x85\xD2\x0F\x84\x0F\x01" \
-        "\x00\x00\x53\x8B\x1D\xBC\x45\x00\x00\x41\x55\x56\x89\x4C\x24\x10" \
-        "\x8A\x4C\x24\x14\xBE\x00\x01\x00\x00\x8B\x6C\x24\x14\x8B\xD0\x81" \
-        "\xE2\xFF\x00\x00\x00\x81\xE5\xFF\x00\x00\x00\x33\xD5\xC1\xE8\x08" \
-        "\x8B\x14\x95\x80\x47\x00\x00\x33\xC2\x8A\xD1\xFE\xC1\x88\x4C\x24" \
-        "\x14\x66\xC7\x05\xC0\x45\x00\x00\x01\x00\x8B\x2D\xB8\x45\x00\x00" \
-        "\x3B\xEB\x75\x19\x66\x85\x35\x02\x22\x00\xC0\x75\x09\x66\x85\x35" \
-        "\x02\x22\x00\xC0\x74\xF7\xC6\x05\x00\x22\x00\xC0\x08\x66\x85\x35" \
-        "\x02\x22\x00\xC0\x75\x09\x66\x85\x35\x02\x22\x00\xC0\x74\xF7\x88" \
-        "\x15\x00\x22\x00\xC0\x8B\x15\xB8\x45\x00\x00\x4A\x89\x15\xB8\x45" \
-        "\x00\x00\x75\x5C\x66\x85\x35\x02\x22\x00\xC0\x75\x09\x66\x85\x35" \
-        "\x02\x22\x00\xC0\x74\xF7\x8B\x1D\xBC\x45\x00\x00\x88\x1D\x00\x22" \
-        "\x00\xC0\x66\x85\x35\x02\x22\x00\xC0\x75\x09\x66\x85\x35\x02\x22" \
-        "\x00\xC0\x74\xF7\x8B\xD3\xC1\xEA\x08\x88\x15\x00\x22\x00\xC0\x66" \
-        "\x85\x35\x02\x22\x00\xC0\x75\x09\x66\x85\x35\x02\x22\x00\xC0\x74" \
-        "\xF7\xC6\x05\x00\x22\x00\xC0\x99\x89\x1D\xB8\x45\x00\x00\xEB\x06" \
-        "\x8B\x1D\xBC\x45\x00\x00\x66\xC7\x05\xC0\x45\x00\x00\x00\x00\x8B" \
-        "\x54\x24\x10\x4A\x89\x54\x24\x10\x0F\x85\x0B\xFF\xFF\xFF\x5E\x5D" \
-        "\x5B\xF7\xD0\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x66\x83\x3D\x56\x10\x00\x00\x27\x74\x32\xA0\x72\x46\x00\x00\x24" \
-        "\x02\x3C\x02\x75\x27\xA1\xD0\x1E\x00\x00\x3D\x70\x57\x01\x00\x74" \
-        "\x0F\xA3\xD4\x1E\x00\x00\xC7\x05\xD0\x1E\x00\x00\x70\x57\x01\x00" \
-        "\x33\xC0\xA3\xAC\x25\x00\x00\xA3\xB0\x25\x00\x00\xC3\x90\x90\x90" \
-        "\xA1\xB0\x25\x00\x00\x8B\x0D\xAC\x25\x00\x00\x3B\xC1\x0F\x82\x32" \
-        "\x01\x00\x00\xE8\x0C\xE0\xFF\xFF\xB1\x0B\xE8\xC1\xFD\xFF\xFF\x8B" \
-        "\x0D\xB8\x45\x00\x00\xA1\xBC\x45\x00\x00\x3B\xC8\x73\x0E\xE8\x0D" \
-        "\x02\x00\x00\x85\xC0\x74\x05\xE8\x34\x02\x00\x00\x66\xA1\x00\x22" \
-        "\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02" \
-        "\x74\xF5\x8B\x15\xBC\x45\x00\x00\x56\x57\x66\x0F\xB6\xF8\xA1\xB8" \
-        "\x45\x00\x00\x3B\xC2\x73\x0E\xE8\xD4\x01\x00\x00\x85\xC0\x74\x05" \
-        "\xE8\xFB\x01\x00\x00\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x75\x0B" \
-        "\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x74\xF5\x33\xC9\x8A\xE8\xB8" \
-        "\xB4\x25\x00\x00\x0B\xF9\xA3\xAC\x25\x00\x00\xA3\xB0\x25\x00\x00" \
-        "\x8B\x15\xBC\x45\x00\x00\xA1\xB8\x45\x00\x00\x3B\xC2\x73\x0E\xE8" \
-        "\x8C\x01\x00\x00\x85\xC0\x74\x05\xE8\xB3\x01\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\x66\x0F\xB6\xF0\xA1\xBC\x45\x00\x00\x8B\x0D\xB8\x45" \
-        "\x00\x00\x3B\xC8\x73\x0E\xE8\x55\x01\x00\x00\x85\xC0\x74\x05\xE8" \
-        "\x7C\x01\x00\x00\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66" \
-        "\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x74\xF5\x8B\x15\xAC\x25\x00\x00" \
-        "\x33\xC9\x8A\xE8\x0B\xCE\x66\x89\x0A\xA1\xAC\x25\x00\x00\x8B\x35" \
-        "\xB0\x25\x00\x00\x8B\xCF\x81\xE1\xFF\xFF\x00\x00\x83\xC0\x02\x03" \
-        "\xCE\xA3\xAC\x25\x00\x00\x3B\xC1\x0F\x82\x62\xFF\xFF\xFF\xE8\xC1" \
-        "\xDE\xFF\xFF\x5F\x5E\x8B\x0D\xB0\x25\x00\x00\x8A\x01\x41\x89\x0D" \
-        "\xB0\x25\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x81\x3D\xD0\x1E\x00\x00\x70\x57\x01\x00\x75\x0A\xA1\xD4\x1E\x00" \
-        "\x00\xA3\xD0\x1E\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x51\xA0\xB4\x45\x00\x00\xC6\x44\x24\x00\x00\x84\xC0\x75\x61\x56" \
-        "\x57\x8B\x74\x24\x08\xB9\x08\x00\x00\x00\x81\xE6\xFF\x00\x00\x00" \
-        "\x8B\xC6\xC1\xE0\x18\xA9\x00\x00\x00\x80\x74\x09\x03\xC0\x35\xB7" \
-        "\x1D\xC1\x04\xEB\x02\xD1\xE0\x49\x75\xEB\x6A\x20\x50\xE8\x3E\x00" \
-        "\x00\x00\x6A\x08\x56\x8B\xF8\xE8\x34\x00\x00\x00\x25\xFF\x00\x00" \
-        "\x00\x83\xC4\x10\x89\x3C\x85\x80\x47\x00\x00\x8A\x44\x24\x08\xFE" \
-        "\xC0\x88\x44\x24\x08\x75\xAA\x5F\xC6\x05\xB4\x45\x00\x00\x01\x5E" \
-        "\x59\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x54\x24\x08\x33\xC0\x84\xD2\x76\x2F\x53\x8B\x5C\x24\x08\x55" \
-        "\x56\x33\xF6\x81\xE2\xFF\x00\x00\x00\x57\x8B\xFA\xF6\xC3\x01\x74" \
-        "\x0E\x8B\xCA\xBD\x01\x00\x00\x00\x2B\xCE\x49\xD3\xE5\x0B\xC5\x46" \
-        "\xD1\xEB\x4F\x75\xE7\x5F\x5E\x5D\x5B\xC3\x90\x90\x90\x90\x90\x90" \
-        "\xB8\x01\x00\x00\x00\x66\xA3\xC0\x45\x00\x00\x8B\x0D\xB8\x45\x00" \
-        "\x00\x3B\x0D\xBC\x45\x00\x00\x72\x0B\x66\xC7\x05\xC0\x45\x00\x00" \
-        "\x00\x00\x33\xC0\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\xA1\xB8\x45\x00\x00\x8B\x1D\xBC\x45\x00\x00\x2B\xD8\xE8\x6D" \
-        "\x00\x00\x00\xB8\x00\x01\x00\x00\x66\x85\x05\x02\x22\x00\xC0\x75" \
-        "\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x88\x1D\x00\x22\x00\xC0" \
-        "\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0" \
-        "\x74\xF7\xC1\xEB\x08\x88\x1D\x00\x22\x00\xC0\x5B\x66\x85\x05\x02" \
-        "\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\xC6\x05" \
-        "\x00\x22\x00\xC0\x99\x8B\x0D\xBC\x45\x00\x00\x89\x0D\xB8\x45\x00" \
-        "\x00\x66\xC7\x05\xC0\x45\x00\x00\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\xB8\x45\x00\x00\x8B\xC8\x48\x85\xC9\x74\x23\x40\xB9\x00\x01" \
-        "\x00\x00\x32\xD2\x66\x85\x0D\x02\x22\x00\xC0\x75\x09\x66\x85\x0D" \
-        "\x02\x22\x00\xC0\x74\xF7\x88\x15\x00\x22\x00\xC0\x48\x75\xE5\xC3" \
-        "\x8B\x0D\xBC\x45\x00\x00\xA1\xB8\x45\x00\x00\x3B\xC1\x73\x14\xE8" \
-        "\x0C\xFF\xFF\xFF\x85\xC0\x74\x05\xE8\x33\xFF\xFF\xFF\x8B\x0D\xBC" \
-        "\x45\x00\x00\x66\xC7\x05\xC0\x45\x00\x00\x01\x00\xB8\x00\x01\x00" \
-        "\x00\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00" \
-        "\xC0\x74\xF7\xC6\x05\x00\x22\x00\xC0\x18\x66\x85\x05\x02\x22\x00" \
-        "\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x8A\x54\x24\x04" \
-        "\x88\x15\x00\x22\x00\xC0\x8B\x15\xB8\x45\x00\x00\x4A\x89\x15\xB8" \
-        "\x45\x00\x00\x75\x54\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85" \
-        "\x05\x02\x22\x00\xC0\x74\xF7\x88\x0D\x00\x22\x00\xC0\x66\x85\x05" \
-        "\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x8B" \
-        "\xD1\xC1\xEA\x08\x88\x15\x00\x22\x00\xC0\x66\x85\x05\x02\x22\x00" \
-        "\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\xC6\x05\x00\x22" \
-        "\x00\xC0\x99\x89\x0D\xB8\x45\x00\x00\xA1\xB8\x45\x00\x00\x3B\xC1" \
-        "\x73\x0E\xE8\x49\xFE\xFF\xFF\x85\xC0\x74\x05\xE9\x70\xFE\xFF\xFF" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x55\x8B\xEC\x51\xA1\x9C\x10\x00\x00\x53\x56\x57\x89\x45\xFC\xE8" \
-        "\x6C\xF1\xFF\xFF\x8B\x3D\x60\x1F\x00\x00\x8B\xF0\x3B\x35\x64\x1F" \
-        "\x00\x00\x74\x06\x8B\x3D\x68\x1F\x00\x00\x6A\x02\x33\xDB\xE8\x0D" \
-        "\xC3\xFF\xFF\x8B\x4D\xFC\x56\x51\xE8\x83\x02\x00\x00\x0F\x20\xC0" \
-        "\x0D\x00\x00\x00\x60\x0F\x22\xC0\x0F\x09\xE8\x91\x00\x00\x00\x57" \
-        "\xE8\xDB\x00\x00\x00\x56\x57\xE8\xA4\x00\x00\x00\x83\xC4\x18\x85" \
-        "\xC0\x75\x0A\xB1\x03\xFF\x15\xCC\x1E\x00\x00\xEB\x45\x8B\x55\xFC" \
-        "\x52\x56\x57\xE8\x68\x01\x00\x00\x83\xC4\x0C\x85\xC0\x75\x0A\xB1" \
-        "\x04\xFF\x15\xCC\x1E\x00\x00\xEB\x29\x8B\x45\xFC\x50\x56\x57\xE8" \
-        "\xEC\x01\x00\x00\x83\xC4\x0C\x85\xC0\x75\x0A\xB1\x05\xFF\x15\xCC" \
-        "\x1E\x00\x00\xEB\x0D\x32\xC9\xFF\x15\xCC\x1E\x00\x00\xBB\x01\x00" \
-        "\x00\x00\x0F\x20\xC0\x25\xFF\xFF\xFF\x9F\x0F\x22\xC0\x0F\x09\xF7" \
-        "\xDB\x1B\xDB\x83\xE3\x03\x43\x53\xE8\x73\xC2\xFF\xFF\x83\xC4\x04" \
-        "\x5F\x5E\x5B\x8B\xE5\x5D\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\x6C\x1F\x00\x00\x66\x8B\x0D\x7E\x1F\x00\x00\x66\x89\x08\x6A" \
-        "\x01\xE8\x1A\xC2\xFF\xFF\x59\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xE8\xDB\xFF\xFF\xFF\x8B\x44\x24\x08\x8B\xC8\x48\x85\xC9\x74\x15" \
-        "\x8B\x4C\x24\x04\x66\x81\x39\xFF\xFF\x75\x10\x83\xC1\x02\x8B\xD0" \
-        "\x48\x85\xD2\x75\xEF\xB8\x01\x00\x00\x00\xC3\x33\xC0\xC3\x90\x90" \
-        "\x8B\x0D\x6C\x1F\x00\x00\x66\xA1\x78\x1F\x00\x00\x66\x89\x01\xA1" \
-        "\x70\x1F\x00\x00\x66\x8B\x15\x7A\x1F\x00\x00\x66\x89\x10\x8B\x0D" \
-        "\x74\x1F\x00\x00\x66\x8B\x15\x80\x1F\x00\x00\x66\x89\x11\xA1\x6C" \
-        "\x1F\x00\x00\x66\x8B\x0D\x78\x1F\x00\x00\x66\x89\x08\x8B\x15\x70" \
-        "\x1F\x00\x00\x66\xA1\x7A\x1F\x00\x00\x66\x89\x02\x8B\x44\x24\x04" \
-        "\x66\x8B\x0D\x82\x1F\x00\x00\x66\x89\x08\x50\xE8\x10\x00\x00\x00" \
-        "\x83\xC4\x04\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\x57\x8B\x7C\x24\x0C\xBE\x88\x13\x00\x00\xF6\x07\x80\x75\x1A" \
-        "\x6A\x01\xE8\x59\xC1\xFF\xFF\x81\xC6\xFF\xFF\x00\x00\x83\xC4\x04" \
-        "\x66\x85\xF6\x74\x0D\xF6\x07\x80\x74\xE6\x5F\xB8\x01\x00\x00\x00" \
-        "\x5E\xC3\x5F\x33\xC0\x5E\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x55\x8B\x6C\x24\x0C\x8B\xC5\x4D\x56\x57\x85\xC0\x74\x7F\x8B\x7C" \
-        "\x24\x18\x8B\x74\x24\x10\x8B\x0D\x6C\x1F\x00\x00\x66\x8B\x15\x78" \
-        "\x1F\x00\x00\x66\x89\x11\xA1\x70\x1F\x00\x00\x66\x8B\x0D\x7A\x1F" \
-        "\x00\x00\x66\x89\x08\x8B\x15\x74\x1F\x00\x00\x66\xA1\x84\x1F\x00" \
-        "\x00\x66\x89\x02\x66\x8B\x0F\x66\x89\x0E\x66\x8B\x0F\x66\x8B\x06" \
-        "\x8A\xD0\xF6\xD2\x32\xD1\xF6\xC2\x80\x75\x1D\xA8\x20\x74\x0B\x66" \
-        "\x8B\x06\xF6\xD0\x32\xC1\xA8\x80\x74\x1D\x66\x8B\x06\x8A\xD0\xF6" \
-        "\xD2\x32\xD1\xF6\xC2\x80\x74\xE3\x83\xC6\x02\x83\xC7\x02\x8B\xC5" \
-        "\x4D\x85\xC0\x74\x08\xEB\x8F\x5F\x5E\x33\xC0\x5D\xC3\x5F\x5E\xB8" \
-        "\x01\x00\x00\x00\x5D\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\xE8\x5A\xFE\xFF\xFF\x8B\x44\x24\x0C\x8B\xC8\x48\x85\xC9\x74" \
-        "\x1D\x8B\x54\x24\x10\x8B\x4C\x24\x08\x66\x8B\x31\x66\x3B\x32\x75" \
-        "\x14\x83\xC1\x02\x83\xC2\x02\x8B\xF0\x48\x85\xF6\x75\xEB\xB8\x01" \
-        "\x00\x00\x00\x5E\xC3\x33\xC0\x5E\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x08\x8B\xC8\x48\x85\xC9\x74\x19\x56\x8B\x74\x24\x08" \
-        "\x57\x8D\x78\x01\xE8\x87\xEE\xFF\xFF\x66\x89\x06\x83\xC6\x02\x4F" \
-        "\x75\xF2\x5F\x5E\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xC3\x55\x8B\xEC\x83\xEC\x08\x53\x56\x57\x55\x8B\x5D\x0C\x8B\x45" \
-        "\x08\xF7\x40\x04\x06\x00\x00\x00\x0F\x85\x81\x00\x00\x00\x89\x45" \
-        "\xF8\x8B\x45\x10\x89\x45\xFC\x8D\x45\xF8\x89\x43\x14\x8B\x73\x0C" \
-        "\x8B\x7B\x08\x83\xFE\xFF\x74\x5D\x8D\x0C\x76\x83\x7C\x8F\x04\x00" \
-        "\x74\x3E\x56\x55\x8B\x6B\x10\xFF\x54\x8F\x04\x5D\x5E\x8B\x5D\x0C" \
-        "\x83\xF8\xFF\x74\x36\x83\xF8\x00\x74\x26\x8B\x7B\x08\x53\xE8\x59" \
-        "\x00\x00\x00\x83\xC4\x04\x8B\x6B\x10\x56\x53\xE8\x8E\x00\x00\x00" \
-        "\x83\xC4\x08\x8D\x0C\x76\x8B\x04\x8F\x89\x43\x0C\xFF\x54\x8F\x08" \
-        "\x8B\x7B\x08\x8D\x0C\x76\x8B\x34\x8F\xEB\xA8\xB8\x00\x00\x00\x00" \
-        "\xEB\x22\x90\x90\x90\xB8\x01\x00\x00\x00\xEB\x18\x90\x90\x90\x55" \
-        "\x8B\x6B\x10\x6A\xFF\x53\xE8\x53\x00\x00\x00\x83\xC4\x08\x5D\xB8" \
-        "\x01\x00\x00\x00\x5D\x5F\x5E\x5B\x8B\xE5\x5D\xC3\x55\x8B\xEC\x53" \
-        "\x56\x57\x55\x6A\x00\x6A\x00\x68\x44\x5F\x01\x00\xFF\x75\x08\xE8" \
-        "\x2C\xFF\xFF\xFF\x5D\x5F\x5E\x5B\x8B\xE5\x5D\xC3\x8B\x4C\x24\x04" \
-        "\xF7\x41\x04\x06\x00\x00\x00\xB8\x01\x00\x00\x00\x74\x0F\x8B\x44" \
-        "\x24\x08\x8B\x54\x24\x10\x89\x02\xB8\x03\x00\x00\x00\xC3\x53\x56" \
-        "\x57\x8B\x44\x24\x10\x50\x6A\xFE\x68\x4C\x5F\x01\x00\xFF\x35\xDC" \
-        "\x1E\x00\x00\x89\x25\xDC\x1E\x00\x00\x8B\x44\x24\x20\x8B\x58\x08" \
-        "\x8B\x70\x0C\x83\xFE\xFF\x74\x20\x3B\x74\x24\x24\x74\x1A\x8D\x34" \
-        "\x76\x8B\x0C\xB3\x89\x4C\x24\x08\x89\x48\x0C\x83\x7C\xB3\x04\x00" \
-        "\x75\x04\xFF\x54\xB3\x08\xEB\xD1\x8F\x05\xDC\x1E\x00\x00\x83\xC4" \
-        "\x0C\x5F\x5E\x5B\xC3\x33\xC0\x8B\x0D\xDC\x1E\x00\x00\x81\x79\x04" \
-        "\x4C\x5F\x01\x00\x75\x10\x8B\x51\x0C\x8B\x52\x0C\x39\x51\x08\x75" \
-        "\x05\xB8\x01\x00\x00\x00\xC3\x55\x8B\xEC\x83\xEC\x24\x53\x56\x57" \
-        "\x89\x65\xF8\x89\x6D\xEC\xC7\x45\xE8\xFF\xFF\xFF\xFF\xC7\x45\xE4" \
-        "\x88\x1F\x00\x00\xC7\x45\xE0\x71\x5E\x01\x00\xA1\xDC\x1E\x00\x00" \
-        "\x89\x45\xDC\x8D\x45\xDC\xA3\xDC\x1E\x00\x00\xE8\xE0\x01\x00\x00" \
-        "\xE8\x1B\xA6\xFF\xFF\xE8\x06\x02\x00\x00\xEB\x33\x8B\x45\xF0\x8B" \
-        "\x00\x8B\x00\x89\x45\xFC\x8B\x45\xF6\x50\x8B\x45\xFC\x50\x83\xC4" \
-        "\x08\xC3\xB8\x08\x00\x00\x00\xEB\x07\xB8\x09\x00\x00\x00\xEB\x00" \
-        "\xF4\xEB\xFD\x8B\x65\xF8\x8B\x45\xFC\x50\xE8\xD1\x01\x00\x00\xC7" \
-        "\x45\xE8\xFF\xFF\xFF\xFF\x8B\x45\xDC\xA3\xDC\x1E\x00\x00\x5F\x5E" \
-        "\x5B\x8B\xE5\x5D\xC3\xE8\x1E\x00\x00\x00\xBF\xCC\x1F\x00\x00\xB9" \
-        "\x90\x4B\x00\x00\x2B\xCF\x2B\xC0\xF3\xAA\xE8\x58\xFF\xFF\xFF\x66" \
-        "\xB8\x00\x00\xE9\xEB\x1F\x00\x00\x5A\x66\xB8\x10\x00\x66\x8E\xD8" \
-        "\x66\x8E\xC0\x66\xB8\x10\x00\x66\x8E\xD0\xBC\x90\x5B\x00\x00\x66" \
-        "\xB8\x10\x00\x66\x8E\xE0\x52\xC3\xF4\xC3\xC3\xC2\x04\x00\xC2\x08" \
-        "\x00\xBB\x60\x01\x00\xBE\x60\x01\x00\xBA\x60\x01\x00\xF4\xEB\xFD" \
-        "\x2B\xC0\xC3\xFF\x8B\x54\x24\x04\x89\x2A\x89\x5A\x04\x89\x7A\x08" \
-        "\x89\x72\x0C\x89\x62\x10\x8B\x04\x24\x89\x42\x14\xC7\x42\x20\x30" \
-        "\x32\x43\x56\xC7\x42\x24\x00\x00\x00\x00\x64\xA1\xDC\x1E\x00\x00" \
-        "\x89\x42\x18\x83\xF8\xFF\x75\x09\xC7\x42\x1C\xFF\xFF\xFF\xFF\xEB" \
-        "\x3B\x8B\x4C\x24\x08\x0B\xC9\x74\x0A\x8B\x44\x24\x0C\x89\x42\x24" \
-        "\x49\x75\x08\x8B\x40\x0C\x89\x42\x1C\xEB\x21\x8B\x44\x24\x10\x89" \
-        "\x42\x1C\x49\x74\x17\x56\x57\x8D\x74\x24\x1C\x8D\x7A\x28\x83\xF9" \
-        "\x06\x76\x05\xB9\x06\x00\x00\x00\xF3\xA5\x5F\x5E\x2B\xC0\xC3\xFF" \
-        "\x55\x8B\xEC\x83\xC4\xF4\x9B\xD9\x7D\xFE\x9B\x66\x8B\x45\xFE\x80" \
-        "\xCC\x0C\x66\x89\x45\xFC\xD9\x6D\xFC\xDF\x7D\xF4\xD9\x6D\xFE\x8B" \
-        "\x45\xF4\x8B\x55\xF8\xC9\xC3\xFF\x8B\x5C\x24\x04\x8B\x2B\x8B\x73" \
-        "\x18\x64\x3B\x35\xDC\x1E\x00\x00\x74\x09\x56\xE8\x9C\xFD\xFF\xFF" \
-        "\x83\xC4\x04\x83\xFE\x00\x74\x30\x8D\x43\x20\x50\xE8\xBF\x01\x00" \
-        "\x00\x0B\xC0\x74\x16\x8B\x43\x20\x3D\x30\x32\x43\x56\x75\x0C\x8B" \
-        "\x43\x24\x0B\xC0\x74\x12\x53\xFF\xD0\xEB\x0D\x8B\x43\x1C\x50\x56" \
-        "\xE8\xA9\xFD\xFF\xFF\x83\xC4\x08\x6A\x00\x8B\x43\x14\xE8\xE9\xFE" \
-        "\xFF\xFF\x8B\xD3\x8B\x5A\x04\x8B\x7A\x08\x8B\x72\x0C\x8B\x44\x24" \
-        "\x08\x83\xF8\x01\x83\xD0\x00\x8B\x62\x10\x83\xC4\x04\xFF\x62\x14" \
-        "\xC3\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xA1\x84\x4B\x00\x00\x85\xC0\x74\x02\xFF\xD0\x68\xB8\x1F\x00\x00" \
-        "\x68\xB4\x1F\x00\x00\xE8\x26\x01\x00\x00\x83\xC4\x08\x68\xB0\x1F" \
-        "\x00\x00\x68\xAC\x1F\x00\x00\xE8\x14\x01\x00\x00\x83\xC4\x08\xC3" \
-        "\x8B\x44\x24\x04\x6A\x00\x6A\x00\x50\xE8\x52\x00\x00\x00\x83\xC4" \
-        "\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x04\x6A\x00\x6A\x01\x50\xE8\x32\x00\x00\x00\x83\xC4" \
-        "\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x6A\x01\x6A\x00\x6A\x00\xE8\x15\x00\x00\x00\x83\xC4\x0C\xC3\x90" \
-        "\x6A\x01\x6A\x01\x6A\x00\xE8\x05\x00\x00\x00\x83\xC4\x0C\xC3\x90" \
-        "\xA1\x0C\x46\x00\x00\x53\x55\x8B\x6C\x24\x0C\x83\xF8\x01\x56\x75" \
-        "\x0E\x55\xFF\x15\xC9\x60\x01\x00\x50\xFF\x15\xC5\x60\x01\x00\x8B" \
-        "\x44\x24\x14\x8B\x5C\x24\x18\x85\xC0\xC7\x05\x08\x46\x00\x00\x01" \
-        "\x00\x00\x00\x88\x1D\x04\x46\x00\x00\x75\x3E\x8B\x0D\x88\x4B\x00" \
-        "\x00\x85\xC9\x74\x22\x8B\x35\x8C\x4B\x00\x00\x83\xEE\x04\x3B\xF1" \
-        "\x72\x15\x8B\x06\x85\xC0\x74\x08\xFF\xD0\x8B\x0D\x88\x4B\x00\x00" \
-        "\x83\xEE\x04\x3B\xF1\x73\xEB\x68\xC0\x1F\x00\x00\x68\xBC\x1F\x00" \
-        "\x00\xE8\x3A\x00\x00\x00\x83\xC4\x08\x68\xC8\x1F\x00\x00\x68\xC4" \
-        "\x1F\x00\x00\xE8\x28\x00\x00\x00\x83\xC4\x08\x85\xDB\x75\x11\x55" \
-        "\xC7\x05\x0C\x46\x00\x00\x01\x00\x00\x00\xFF\x15\xC1\x60\x01\x00" \
-        "\x5E\x5D\x5B\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\x8B\x74\x24\x08\x57\x8B\x7C\x24\x10\x3B\xF7\x73\x0F\x8B\x06" \
-        "\x85\xC0\x74\x02\xFF\xD0\x83\xC6\x04\x3B\xF7\x72\xF1\x5F\x5E\xC3" \
-        "\x55\x8B\xEC\x6A\xFF\x68\xA0\x1F\x00\x00\x68\xD8\x63\x01\x00\x64" \
-        "\xA1\xDC\x1E\x00\x00\x50\x64\x89\x25\xDC\x1E\x00\x00\x83\xC4\xF0" \
-        "\x53\x56\x57\x89\x65\xE8\xC7\x45\xFC\x00\x00\x00\x00\x8B\x45\x08" \
-        "\x8B\x08\xB8\x01\x00\x00\x00\x89\x45\xE4\xEB\x19\x8B\x55\xEC\x8B" \
-        "\x02\x8B\x00\x33\xC9\x3D\x05\x00\x00\xC0\x0F\x94\xC1\x8B\xC1\xC3" \
-        "\x8B\x65\xE8\x33\xC0\xC7\x45\xFC\xFF\xFF\xFF\xFF\x8B\x4D\xF0\x64" \
-        "\x89\x0D\xDC\x1E\x00\x00\x5F\x5E\x5B\x8B\xE5\x5D\xC2\x04\x00\x90" \
-        "\x56\x43\x32\x30\x58\x43\x30\x30\x55\x8B\xEC\x83\xEC\x08\x53\x56" \
-        "\x57\x55\xFC\x8B\x5D\x0C\x8B\x45\x08\xF7\x40\x04\x06\x00\x00\x00" \
-        "\x0F\x85\x82\x00\x00\x00\x89\x45\xF8\x8B\x45\x10\x89\x45\xFC\x8D" \
-        "\x45\xF8\x89\x43\xFC\x8B\x73\x0C\x8B\x7B\x08\x83\xFE\xFF\x74\x61" \
-        "\x8D\x0C\x76\x83\x7C\x8F\x04\x00\x74\x45\x56\x55\x8D\x6B\x10\xFF" \
-        "\x54\x8F\x04\x5D\x5E\x8B\x5D\x0C\x0B\xC0\x74\x33\x78\x3C\x8B\x7B" \
-        "\x08\x53\xE8\xF5\xFA\xFF\xFF\x83\xC4\x04\x8D\x6B\x10\x56\x53\xE8" \
-        "\x2A\xFB\xFF\xFF\x83\xC4\x08\x8D\x0C\x76\x6A\x01\x8B\x44\x8F\x08" \
-        "\xE8\x66\xFC\xFF\xFF\x8B\x04\x8F\x89\x43\x0C\xFF\x54\x8F\x08\x8B" \
-        "\x7B\x08\x8D\x0C\x76\x8B\x34\x8F\xEB\xA1\xB8\x00\x00\x00\x00\xEB" \
-        "\x1C\xB8\x01\x00\x00\x00\xEB\x15\x55\x8D\x6B\x10\x6A\xFF\x53\xE8" \
-        "\xEA\xFA\xFF\xFF\x83\xC4\x08\x5D\xB8\x01\x00\x00\x00\x5D\x5F\x5E" \
-        "\x5B\x8B\xE5\x5D\xC3\x55\x8B\x4C\x24\x08\x8B\x29\x8B\x41\x1C\x50" \
-        "\x8B\x41\x18\x50\xE8\xC5\xFA\xFF\xFF\x83\xC4\x08\x5D\xC2\x04\x00" \
-        "\x66\xC7\x05\x80\x40\x00\xC0\x02\x00\xFA\x0F\x20\xC0\x0D\x00\x00" \
-        "\x00\x60\x0F\x22\xC0\x0F\x09\xE8\x9B\x1B\x00\x00\x66\xC7\x05\x80" \
-        "\x40\x00\xC0\x02\x00\xFA\xBA\xFC\xFF\xFF\x3F\x89\x12\x81\xEA\x00" \
-        "\x00\x20\x00\x73\xF6\x0F\x09\xBA\xFC\xFF\x1F\x00\x39\x12\x75\x08" \
-        "\x81\xC2\x00\x00\x20\x00\x71\xF4\x81\xEA\xFC\xFF\x1F\x00\xC1\xEA" \
-        "\x0A\x81\xFA\x00\x20\x00\x00\x75\x07\xBA\x00\x18\x00\x00\xEB\x1C" \
-        "\x81\xFA\x00\x80\x00\x00\x75\x07\xBA\x00\x48\x00\x00\xEB\x0D\x81" \
-        "\xFA\x00\x00\x02\x00\x75\x05\xBA\x00\x08\x01\x00\x81\xCA\x00\x00" \
-        "\x00\x80\x66\xC7\x05\x18\x40\x00\xC0\x00\x00\x66\xC7\x05\x1A\x40" \
-        "\x00\xC0\x01\x00\x0F\x20\xC0\x25\xFF\xFF\xFF\x9F\x0F\x22\xC0\x0F" \
-        "\x09\xE9\xB1\x1A\x00\x00\xB4\xD5\x9E\x73\x5B\x75\x59\x7B\x57\x79" \
-        "\x55\x9F\xB1\x05\xD2\xEC\x73\x4E\xB0\x40\xD0\xE0\x71\x48\x32\xE4" \
-        "\x9E\x76\x43\x78\x41\x7A\x3F\x9F\xB1\x05\xD2\xEC\x72\x38\xD0\xE4" \
-        "\x70\x34\x2B\xC0\x83\xE8\x01\xF9\x8B\xD8\x8B\xCB\x8B\xD1\x8B\xE2" \
-        "\x8B\xEC\x8B\xF5\x8B\xFE\x73\x07\x33\xC7\x75\x07\xF8\xEB\xE9\x0B" \
-        "\xC7\x74\x26\xB0\x63\x66\xF7\x05\x02\x22\x00\xC0\x00\x01\x74\xF5" \
-        "\xA2\x00\x22\x00\xC0\xF4\xB0\x66\x66\xF7\x05\x02\x22\x00\xC0\x00" \
-        "\x01\x74\xF5\xA2\x00\x22\x00\xC0\xF4\x66\xC7\x05\x18\x40\x00\xC0" \
-        "\x01\x00\x66\xC7\x05\x1A\x40\x00\xC0\x02\x00\x66\x33\xC0\x66\xA3" \
-        "\x04\x40\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66\xA3\x00\x40\x00\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01" \
-        "\x00\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04\x40\x00\xC0\x66\x33" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x33\xC0\x8B\xD8\xB9\x10\x00" \
-        "\x00\x00\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0\x66\xC1\xE8\x02\x66" \
-        "\x83\xE0\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\xE2\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\x83\xE0\x01" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x8B\xC3\x66\xB9\x63\x00\x66\x83\xF8\x10\x74" \
-        "\x22\x66\x83\xF8\x11\x74\x1C\x66\x83\xF8\x12\x74\x16\x66\x83\xF8" \
-        "\x13\x74\x10\x66\x83\xF8\x14\x74\x0A\x66\x83\xF8\x15\x74\x04\x66" \
-        "\xB9\x5B\x00\x66\xBB\x03\x00\x66\xBA\x3B\x00\x66\x8B\xC3\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22\x00\xC0\x66\xD1" \
-        "\xEB\xE2\xD8\xB8\x02\x40\x00\xC0\x66\xC7\x00\x01\x00\x66\xC7\x00" \
-        "\x00\x00\xFC\xBB\xFF\xFF\xFF\xFF\xB9\x00\x40\x00\x00\x2B\xC0\x02" \
-        "\x03\x4B\xE2\xFB\xA8\xFF\x74\x13\xB0\x65\x66\xF7\x05\x02\x22\x00" \
-        "\xC0\x00\x01\x74\xF5\xA2\x00\x22\x00\xC0\xF4\x66\xC7\x05\x18\x40" \
-        "\x00\xC0\x00\x00\x66\xC7\x05\x1A\x40\x00\xC0\x03\x00\x66\x33\xC0" \
-        "\x66\xA3\x04\x40\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66\xA3\x00\x40" \
-        "\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\xB8\x01\x00\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04\x40\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x33\xC0\x8B\xD8\xB9" \
-        "\x10\x00\x00\x00\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0\x66\xC1\xE8" \
-        "\x02\x66\x83\xE0\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\xE2\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x8B\xC3\x66\xB9\x63\x00\x66\x83\xF8" \
-        "\x10\x74\x22\x66\x83\xF8\x11\x74\x1C\x66\x83\xF8\x12\x74\x16\x66" \
-        "\x83\xF8\x13\x74\x10\x66\x83\xF8\x14\x74\x0A\x66\x83\xF8\x15\x74" \
-        "\x04\x66\xB9\x5B\x00\x66\xBB\x06\x00\x66\xBA\x3B\x00\x66\x8B\xC3" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22\x00\xC0" \
-        "\x66\xD1\xEB\xE2\xD8\xB8\x02\x40\x00\xC0\x66\xC7\x00\x01\x00\x66" \
-        "\xC7\x00\x00\x00\xC6\x05\x1C\x22\x00\xC0\x01\x0F\x20\xC0\x25\xFF" \
-        "\xFF\xFF\x9F\x0F\x22\xC0\x0F\x09\x66\xB8\x74\x00\xA2\x00\x22\x00" \
-        "\xC0\xBA\xFC\xFF\xFF\x3F\x89\x12\x81\xEA\x00\x00\x20\x00\x73\xF6" \
-        "\x0F\x09\xBA\xFC\xFF\x1F\x00\x39\x12\x75\x08\x81\xC2\x00\x00\x20" \
-        "\x00\x71\xF4\x81\xEA\xFC\xFF\x1F\x00\xC1\xEA\x0A\x81\xFA\x00\x20" \
-        "\x00\x00\x75\x07\xBA\x00\x18\x00\x00\xEB\x1C\x81\xFA\x00\x80\x00" \
-        "\x00\x75\x07\xBA\x00\x48\x00\x00\xEB\x0D\x81\xFA\x00\x00\x02\x00" \
-        "\x75\x05\xBA\x00\x08\x01\x00\x81\xFA\x00\x08\x01\x00\x77\x04\x8B" \
-        "\xF2\xEB\x08\xBE\x00\x00\x09\x00\xC1\xEE\x0A\x2B\xC9\x8B\xFE\xC1" \
-        "\xE7\x0A\x81\xEF\x00\x04\x00\x00\x72\x25\x81\xFF\x00\x10\x00\x00" \
-        "\x74\xF0\xBB\xFE\x03\x00\x00\x8B\xC7\xC1\xE8\x0A\x33\xC1\x66\xC1" \
-        "\xC8\x09\x33\xC3\x66\x89\x04\x3B\x83\xEB\x02\x73\xF1\xEB\xD3\x2B" \
-        "\xFF\x2B\xD2\xBB\xFE\x03\x00\x00\x8B\xC7\xC1\xE8\x0A\x33\xC1\x66" \
-        "\xC1\xC8\x09\x33\xC3\x66\x3B\x04\x3B\x75\x22\x83\xEB\x02\x73\xEF" \
-        "\x81\xC7\x00\x04\x00\x00\x42\x81\xFF\x00\x10\x00\x00\x74\xF1\x3B" \
-        "\xF2\x75\xD0\x83\xE9\x01\x72\x95\xE9\x7C\x03\x00\x00\x66\xC7\x05" \
-        "\x18\x40\x00\xC0\x01\x00\x66\xC7\x05\x1A\x40\x00\xC0\x03\x00\x66" \
-        "\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66\xA3" \
-        "\x00\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\xB8\x01\x00\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04\x40" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01" \
-        "\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x33\xC0\x8B" \
-        "\xD8\xB9\x10\x00\x00\x00\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0\x66" \
-        "\xC1\xE8\x02\x66\x83\xE0\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\xE2\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x8B\xC3\x66\xB9\x63\x00\x66" \
-        "\x83\xF8\x10\x74\x22\x66\x83\xF8\x11\x74\x1C\x66\x83\xF8\x12\x74" \
-        "\x16\x66\x83\xF8\x13\x74\x10\x66\x83\xF8\x14\x74\x0A\x66\x83\xF8" \
-        "\x15\x74\x04\x66\xB9\x5B\x00\x66\xBB\x07\x00\x66\xBA\x3B\x00\x66" \
-        "\x8B\xC3\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22" \
-        "\x00\xC0\x66\xD1\xEB\xE2\xD8\xB8\x02\x40\x00\xC0\x66\xC7\x00\x01" \
-        "\x00\x66\xC7\x00\x00\x00\xB0\x72\xF4\xBA\xFC\xFF\xFF\x3F\x89\x12" \
-        "\x81\xEA\x00\x00\x20\x00\x73\xF6\x0F\x09\xBA\xFC\xFF\x1F\x00\x39" \
-        "\x12\x75\x08\x81\xC2\x00\x00\x20\x00\x71\xF4\x81\xEA\xFC\xFF\x1F" \
-        "\x00\xC1\xEA\x0A\x81\xFA\x00\x20\x00\x00\x75\x07\xBA\x00\x18\x00" \
-        "\x00\xEB\x1C\x81\xFA\x00\x80\x00\x00\x75\x07\xBA\x00\x48\x00\x00" \
-        "\xEB\x0D\x81\xFA\x00\x00\x02\x00\x75\x05\xBA\x00\x08\x01\x00\x66" \
-        "\xC7\x05\x18\x40\x00\xC0\x00\x00\x66\xC7\x05\x1A\x40\x00\xC0\x01" \
-        "\x00\xE9\x41\x0E\x00\x00\xC6\x05\x1C\x22\x00\xC0\x03\x66\xB8\x10" \
-        "\x00\x66\x8E\xD8\x66\x8E\xC0\x8B\xC2\x25\x00\x00\x00\x80\x81\xE2" \
-        "\xFF\xFF\xFF\x7F\xC1\xE8\x1F\x66\xA3\x26\x10\x00\x00\x66\x89\x15" \
-        "\x20\x10\x00\x00\xC1\xEA\x10\x66\x89\x15\x22\x10\x00\x00\x66\xC7" \
-        "\x05\x18\x40\x00\xC0\x00\x00\x66\xC7\x05\x1A\x40\x00\xC0\x01\x00" \
-        "\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66" \
-        "\xA3\x00\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\xB8\x01\x00\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04" \
-        "\x40\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8" \
-        "\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x33\xC0" \
-        "\x8B\xD8\xB9\x10\x00\x00\x00\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0" \
-        "\x66\xC1\xE8\x02\x66\x83\xE0\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\xE2\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x8B\xC3\x66\xB9\x63\x00" \
-        "\x66\x83\xF8\x10\x74\x22\x66\x83\xF8\x11\x74\x1C\x66\x83\xF8\x12" \
-        "\x74\x16\x66\x83\xF8\x13\x74\x10\x66\x83\xF8\x14\x74\x0A\x66\x83" \
-        "\xF8\x15\x74\x04\x66\xB9\x5B\x00\x66\xBB\x04\x00\x66\xBA\x3B\x00" \
-        "\x66\x8B\xC3\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14" \
-        "\x22\x00\xC0\x66\xD1\xEB\xE2\xD8\xB8\x02\x40\x00\xC0\x66\xC7\x00" \
-        "\x01\x00\x66\xC7\x00\x00\x00\x66\xB8\x01\x00\xA2\x18\x22\x00\xC0" \
-        "\x66\xB8\x00\x00\xA2\x18\x22\x00\xC0\x66\x33\xC0\x66\xA3\x04\x40" \
-        "\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66\xA3\x00\x40\x00\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66" \
-        "\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04\x40\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x33\xC0\x8B\xD8\xB9\x10\x00\x00\x00" \
-        "\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0\x66\xC1\xE8\x02\x66\x83\xE0" \
-        "\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\xE2" \
-        "\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x8B\xC3\x66\x83\xF8\x11\x74\x22\x66\x83\xF8\x12\x74" \
-        "\x1C\x66\x83\xF8\x13\x74\x16\x66\x83\xF8\x14\x74\x10\x66\x83\xF8" \
-        "\x15\x74\x0A\x66\xB8\x15\x00\xA2\x00\x22\x00\xC0\xC3\x66\xC7\x05" \
-        "\x1C\x22\x00\xC0\xF7\xFF\x66\xB8\x16\x00\xA2\x00\x22\x00\xC0\xC3" \
-        "\xFA\xFC\x66\xB8\x10\x00\x66\x8E\xD8\x66\x8E\xC0\x66\x8E\xD0\xBC" \
-        "\x90\x5B\x00\x00\x66\xC7\x05\x24\x10\x00\x00\x00\x00\xB9\x00\x40" \
-        "\x00\x00\xBB\x00\x00\x01\x00\x33\xC0\x8B\x13\x02\xC2\x02\xC6\xC1" \
-        "\xEA\x10\x02\xC2\x02\xC6\x83\xC3\x04\xE2\xEE\x25\xFF\x00\x00\x00" \
-        "\x0F\x84\x68\x03\x00\x00\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66" \
-        "\xA3\x06\x40\x00\xC0\x66\xA3\x00\x40\x00\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x00\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\xB8\x01\x00\x66\xA3\x04\x40\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x33\xC0\x8B\xD8\xB9\x10\x00\x00\x00\x66\xD1\xE3" \
-        "\x66\xA1\x00\x40\x00\xC0\x66\xC1\xE8\x02\x66\x83\xE0\x01\x66\x0B" \
-        "\xD8\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\xE2\xBF\x66\x33" \
-        "\xC0\x66\xA3\x04\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x8B\xC3\x66\xB9\x63\x00\x66\x83\xF8\x10\x74\x22\x66\x83\xF8\x11" \
-        "\x74\x1C\x66\x83\xF8\x12\x74\x16\x66\x83\xF8\x13\x74\x10\x66\x83" \
-        "\xF8\x14\x74\x0A\x66\x83\xF8\x15\x74\x04\x66\xB9\x5B\x00\x66\xBB" \
-        "\x03\x00\x66\xBA\x3B\x00\x66\x8B\xC3\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x88\x15\x14\x22\x00\xC0\x66\xD1\xEB\xE2\xD8\xB8\x02" \
-        "\x40\x00\xC0\x66\xC7\x00\x01\x00\x66\xC7\x00\x00\x00\xF4\x66\xC7" \
-        "\x05\x0E\x40\x00\xC0\x00\x00\x66\xC7\x05\x0E\x40\x00\xC0\x01\x00" \
-        "\x66\xC7\x05\x0E\x40\x00\xC0\x00\x00\x66\xC7\x05\x0E\x40\x00\xC0" \
-        "\x01\x00\x66\xB8\x01\x00\xA2\x18\x22\x00\xC0\x66\xB8\x00\x00\xA2" \
-        "\x18\x22\x00\xC0\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\xA3\x06" \
-        "\x40\x00\xC0\x66\xA3\x00\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x00\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\xA3\x00" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01" \
-        "\x00\x66\xA3\x04\x40\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8" \
-        "\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x33\xC0\x8B\xD8\xB9\x10\x00\x00\x00\x66\xD1\xE3\x66\xA1" \
-        "\x00\x40\x00\xC0\x66\xC1\xE8\x02\x66\x83\xE0\x01\x66\x0B\xD8\x66" \
-        "\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\xE2\xBF\x66\x33\xC0\x66" \
-        "\xA3\x04\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x8B\xC3" \
-        "\x66\x83\xF8\x11\x74\x23\x66\x83\xF8\x12\x74\x1D\x66\x83\xF8\x13" \
-        "\x74\x17\x66\x83\xF8\x14\x74\x11\x66\x83\xF8\x15\x74\x0B\x66\xB8" \
-        "\x15\x00\xA2\x00\x22\x00\xC0\xEB\x09\x66\xB8\x16\x00\xA2\x00\x22" \
-        "\x00\xC0\x9C\x68\x08\x00\x00\x00\x68\x40\x06\x01\x00\xCF\x0F\x20" \
-        "\xC3\x83\xE3\xF7\x0F\x22\xC3\x66\xBB\x10\x00\x66\x8E\xDB\x66\x8E" \
-        "\xC3\x66\x8E\xD3\xBC\x90\x5B\x00\x00\x66\x2B\xDB\x66\x8E\xE3\x66"
-
-p726 = \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"
-
-p2001 = \
-        "\x00\x00\x02\x00\x04\x00\x06\x00\x08\x00\x0A\x00\x0C\x00\x0E\x00" \
-        "\x10\x00\x12\x00\x14\x00\x16\x00\x18\x00\x1A\x00\x1C\x00\x1E\x00" \
-        "\x20\x00\x22\x00\x24\x00\x26\x00\x28\x00\x2A\x00\x2C\x00\x2E\x00" \
-        "\x30\x00\x32\x00\x34\x00\x36\x00\x38\x00\x3A\x00\x3C\x00\x3E\x00" \
-        "\x40\x00\x42\x00\x44\x00\x46\x00\x48\x00\x4A\x00\x4C\x00\x4E\x00" \
-        "\x50\x00\x52\x00\x54\x00\x56\x00\x58\x00\x5A\x00\x5C\x00\x5E\x00" \
-        "\x60\x00\x62\x00\x64\x00\x66\x00\x68\x00\x6A\x00\x6C\x00\x6E\x00" \
-        "\x70\x00\x72\x00\x74\x00\x76\x00\x78\x00\x7A\x00\x7C\x00\x7E\x00" \
-        "\x80\x00\x82\x00\x84\x00\x86\x00\x88\x00\x8A\x00\x8C\x00\x8E\x00" \
-        "\x90\x00\x92\x00\x94\x00\x96\x00\x98\x00\x9A\x00\x9C\x00\x9E\x00" \
-        "\xA0\x00\xA2\x00\xA4\x00\xA6\x00\xA8\x00\xAA\x00\xAC\x00\xAE\x00" \
-        "\xB0\x00\xB2\x00\xB4\x00\xB6\x00\xB8\x00\xBA\x00\xBC\x00\xBE\x00" \
-        "\xC0\x00\xC2\x00\xC4\x00\xC6\x00\xC8\x00\xCA\x00\xCC\x00\xCE\x00" \
-        "\xD0\x00\xD2\x00\xD4\x00\xD6\x00\xD8\x00\xDA\x00\xDC\x00\xDE\x00" \
-        "\xE0\x00\xE2\x00\xE4\x00\xE6\x00\xE8\x00\xEA\x00\xEC\x00\xEE\x00" \
-        "\xF0\x00\xF2\x00\xF4\x00\xF6\x00\xF8\x00\xFA\x00\xFC\x00\xFE\x00" \
-        "\x00\x01\x02\x01\x04\x01\x06\x01\x08\x01\x0A\x01\x0C\x01\x0E\x01" \
-        "\x10\x01\x12\x01\x14\x01\x16\x01\x18\x01\x1A\x01\x1C\x01\x1E\x01" \
-        "\x20\x01\x22\x01\x24\x01\x26\x01\x28\x01\x2A\x01\x2C\x01\x2E\x01" \
-        "\x30\x01\x32\x01\x34\x01\x36\x01\x38\x01\x3A\x01\x3C\x01\x3E\x01" \
-        "\x40\x01\x42\x01\x44\x01\x46\x01\x48\x01\x4A\x01\x4C\x01\x4E\x01" \
-        "\x50\x01\x52\x01\x54\x01\x56\x01\x58\x01\x5A\x01\x5C\x01\x5E\x01" \
-        "\x60\x01\x62\x01\x64\x01\x66\x01\x68\x01\x6A\x01\x6C\x01\x6E\x01" \
-        "\x70\x01\x72\x01\x74\x01\x76\x01\x78\x01\x7A\x01\x7C\x01\x7E\x01" \
-        "\x80\x01\x82\x01\x84\x01\x86\x01\x88\x01\x8A\x01\x8C\x01\x8E\x01" \
-        "\x90\x01\x92\x01\x94\x01\x96\x01\x98\x01\x9A\x01\x9C\x01\x9E\x01" \
-        "\xA0\x01\xA2\x01\xA4\x01\xA6\x01\xA8\x01\xAA\x01\xAC\x01\xAE\x01" \
-        "\xB0\x01\xB2\x01\xB4\x01\xB6\x01\xB8\x01\xBA\x01\xBC\x01\xBE\x01" \
-        "\xC0\x01\xC2\x01\xC4\x01\xC6\x01\xC8\x01\xCA\x01\xCC\x01\xCE\x01" \
-        "\xD0\x01\xD2\x01\xD4\x01\xD6\x01\xD8\x01\xDA\x01\xDC\x01\xDE\x01" \
-        "\xE0\x01\xE2\x01\xE4\x01\xE6\x01\xE8\x01\xEA\x01\xEC\x01\xEE\x01" \
-        "\xF0\x01\xF2\x01\xF4\x01\xF6\x01\xF8\x01\xFA\x01\xFC\x01\xFE\x01" \
-        "\x00\x02\x02\x02\x04\x02\x06\x02\x08\x02\x0A\x02\x0C\x02\x0E\x02" \
-        "\x10\x02\x12\x02\x14\x02\x16\x02\x18\x02\x1A\x02\x1C\x02\x1E\x02" \
-        "\x20\x02\x22\x02\x24\x02\x26\x02\x28\x02\x2A\x02\x2C\x02\x2E\x02" \
-        "\x30\x02\x32\x02\x34\x02\x36\x02\x38\x02\x3A\x02\x3C\x02\x3E\x02" \
-        "\x40\x02\x42\x02\x44\x02\x46\x02\x48\x02\x4A\x02\x4C\x02\x4E\x02" \
-        "\x50\x02\x52\x02\x54\x02\x56\x02\x58\x02\x5A\x02\x5C\x02\x5E\x02" \
-        "\x60\x02\x62\x02\x64\x02\x66\x02\x68\x02\x6A\x02\x6C\x02\x6E\x02" \
-        "\x70\x02\x72\x02\x74\x02\x76\x02\x78\x02\x7A\x02\x7C\x02\x7E\x02" \
-        "\x80\x02\x82\x02\x84\x02\x86\x02\x88\x02\x8A\x02\x8C\x02\x8E\x02" \
-        "\x90\x02\x92\x02\x94\x02\x96\x02\x98\x02\x9A\x02\x9C\x02\x9E\x02" \
-        "\xA0\x02\xA2\x02\xA4\x02\xA6\x02\xA8\x02\xAA\x02\xAC\x02\xAE\x02" \
-        "\xB0\x02\xB2\x02\xB4\x02\xB6\x02\xB8\x02\xBA\x02\xBC\x02\xBE\x02" \
-        "\xC0\x02\xC2\x02\xC4\x02\xC6\x02\xC8\x02\xCA\x02\xCC\x02\xCE\x02" \
-        "\xD0\x02\xD2\x02\xD4\x02\xD6\x02\xD8\x02\xDA\x02\xDC\x02\xDE\x02" \
-        "\xE0\x02\xE2\x02\xE4\x02\xE6\x02\xE8\x02\xEA\x02\xEC\x02\xEE\x02" \
-        "\xF0\x02\xF2\x02\xF4\x02\xF6\x02\xF8\x02\xFA\x02\xFC\x02\xFE\x02" \
-        "\x00\x03\x02\x03\x04\x03\x06\x03\x08\x03\x0A\x03\x0C\x03\x0E\x03" \
-        "\x10\x03\x12\x03\x14\x03\x16\x03\x18\x03\x1A\x03\x1C\x03\x1E\x03" \
-        "\x20\x03\x22\x03\x24\x03\x26\x03\x28\x03\x2A\x03\x2C\x03\x2E\x03" \
-        "\x30\x03\x32\x03\x34\x03\x36\x03\x38\x03\x3A\x03\x3C\x03\x3E\x03" \
-        "\x40\x03\x42\x03\x44\x03\x46\x03\x48\x03\x4A\x03\x4C\x03\x4E\x03" \
-        "\x50\x03\x52\x03\x54\x03\x56\x03\x58\x03\x5A\x03\x5C\x03\x5E\x03" \
-        "\x60\x03\x62\x03\x64\x03\x66\x03\x68\x03\x6A\x03\x6C\x03\x6E\x03" \
-        "\x70\x03\x72\x03\x74\x03\x76\x03\x78\x03\x7A\x03\x7C\x03\x7E\x03" \
-        "\x80\x03\x82\x03\x84\x03\x86\x03\x88\x03\x8A\x03\x8C\x03\x8E\x03" \
-        "\x90\x03\x92\x03\x94\x03\x96\x03\x98\x03\x9A\x03\x9C\x03\x9E\x03" \
-        "\xA0\x03\xA2\x03\xA4\x03\xA6\x03\xA8\x03\xAA\x03\xAC\x03\xAE\x03" \
-        "\xB0\x03\xB2\x03\xB4\x03\xB6\x03\xB8\x03\xBA\x03\xBC\x03\xBE\x03" \
-        "\xC0\x03\xC2\x03\xC4\x03\xC6\x03\xC8\x03\xCA\x03\xCC\x03\xCE\x03" \
-        "\xD0\x03\xD2\x03\xD4\x03\xD6\x03\xD8\x03\xDA\x03\xDC\x03\xDE\x03" \
-        "\xE0\x03\xE2\x03\xE4\x03\xE6\x03\xE8\x03\xEA\x03\xEC\x03\xEE\x03" \
-        "\xF0\x03\xF2\x03\xF4\x03\xF6\x03\xF8\x03\xFA\x03\xFC\x03\xFE\x03" \
-        "\x00\x04\x02\x04\x04\x04\x06\x04\x08\x04\x0A\x04\x0C\x04\x0E\x04" \
-        "\x10\x04\x12\x04\x14\x04\x16\x04\x18\x04\x1A\x04\x1C\x04\x1E\x04" \
-        "\x20\x04\x22\x04\x24\x04\x26\x04\x28\x04\x2A\x04\x2C\x04\x2E\x04" \
-        "\x30\x04\x32\x04\x34\x04\x36\x04\x38\x04\x3A\x04\x3C\x04\x3E\x04" \
-        "\x40\x04\x42\x04\x44\x04\x46\x04\x48\x04\x4A\x04\x4C\x04\x4E\x04" \
-        "\x50\x04\x52\x04\x54\x04\x56\x04\x58\x04\x5A\x04\x5C\x04\x5E\x04" \
-        "\x60\x04\x62\x04\x64\x04\x66\x04\x68\x04\x6A\x04\x6C\x04\x6E\x04" \
-        "\x70\x04\x72\x04\x74\x04\x76\x04\x78\x04\x7A\x04\x7C\x04\x7E\x04" \
-        "\x80\x04\x82\x04\x84\x04\x86\x04\x88\x04\x8A\x04\x8C\x04\x8E\x04" \
-        "\x90\x04\x92\x04\x94\x04\x96\x04\x98\x04\x9A\x04\x9C\x04\x9E\x04" \
-        "\xA0\x04\xA2\x04\xA4\x04\xA6\x04\xA8\x04\xAA\x04\xAC\x04\xAE\x04" \
-        "\xB0\x04\xB2\x04\xB4\x04\xB6\x04\xB8\x04\xBA\x04\xBC\x04\xBE\x04" \
-        "\xC0\x04\xC2\x04\xC4\x04\xC6\x04\xC8\x04\xCA\x04\xCC\x04\xCE\x04" \
-        "\xD0\x04\xD2\x04\xD4\x04\xD6\x04\xD8\x04\xDA\x04\xDC\x04\xDE\x04" \
-        "\xE0\x04\xE2\x04\xE4\x04\xE6\x04\xE8\x04\xEA\x04\xEC\x04\xEE\x04" \
-        "\xF0\x04\xF2\x04\xF4\x04\xF6\x04\xF8\x04\xFA\x04\xFC\x04\xFE\x04" \
-        "\x00\x05\x02\x05\x04\x05\x06\x05\x08\x05\x0A\x05\x0C\x05\x0E\x05" \
-        "\x10\x05\x12\x05\x14\x05\x16\x05\x18\x05\x1A\x05\x1C\x05\x1E\x05" \
-        "\x20\x05\x22\x05\x24\x05\x26\x05\x28\x05\x2A\x05\x2C\x05\x2E\x05" \
-        "\x30\x05\x32\x05\x34\x05\x36\x05\x38\x05\x3A\x05\x3C\x05\x3E\x05" \
-        "\x40\x05\x42\x05\x44\x05\x46\x05\x48\x05\x4A\x05\x4C\x05\x4E\x05" \
-        "\x50\x05\x52\x05\x54\x05\x56\x05\x58\x05\x5A\x05\x5C\x05\x5E\x05" \
-        "\x60\x05\x62\x05\x64\x05\x66\x05\x68\x05\x6A\x05\x6C\x05\x6E\x05" \
-        "\x70\x05\x72\x05\x74\x05\x76\x05\x78\x05\x7A\x05\x7C\x05\x7E\x05" \
-        "\x80\x05\x82\x05\x84\x05\x86\x05\x88\x05\x8A\x05\x8C\x05\x8E\x05" \
-        "\x90\x05\x92\x05\x94\x05\x96\x05\x98\x05\x9A\x05\x9C\x05\x9E\x05" \
-        "\xA0\x05\xA2\x05\xA4\x05\xA6\x05\xA8\x05\xAA\x05\xAC\x05\xAE\x05" \
-        "\xB0\x05\xB2\x05\xB4\x05\xB6\x05\xB8\x05\xBA\x05\xBC\x05\xBE\x05" \
-        "\xC0\x05\xC2\x05\xC4\x05\xC6\x05\xC8\x05\xCA\x05\xCC\x05\xCE\x05" \
-        "\xD0\x05\xD2\x05\xD4\x05\xD6\x05\xD8\x05\xDA\x05\xDC\x05\xDE\x05" \
-        "\xE0\x05\xE2\x05\xE4\x05\xE6\x05\xE8\x05\xEA\x05\xEC\x05\xEE\x05" \
-        "\xF0\x05\xF2\x05\xF4\x05\xF6\x05\xF8\x05\xFA\x05\xFC\x05\xFE\x05" \
-        "\x00\x06\x02\x06\x04\x06\x06\x06\x08\x06\x0A\x06\x0C\x06\x0E\x06" \
-        "\x10\x06\x12\x06\x14\x06\x16\x06\x18\x06\x1A\x06\x1C\x06\x1E\x06" \
-        "\x20\x06\x22\x06\x24\x06\x26\x06\x28\x06\x2A\x06\x2C\x06\x2E\x06" \
-        "\x30\x06\x32\x06\x34\x06\x36\x06\x38\x06\x3A\x06\x3C\x06\x3E\x06" \
-        "\x40\x06\x42\x06\x44\x06\x46\x06\x48\x06\x4A\x06\x4C\x06\x4E\x06" \
-        "\x50\x06\x52\x06\x54\x06\x56\x06\x58\x06\x5A\x06\x5C\x06\x5E\x06" \
-        "\x60\x06\x62\x06\x64\x06\x66\x06\x68\x06\x6A\x06\x6C\x06\x6E\x06" \
-        "\x70\x06\x72\x06\x74\x06\x76\x06\x78\x06\x7A\x06\x7C\x06\x7E\x06" \
-        "\x80\x06\x82\x06\x84\x06\x86\x06\x88\x06\x8A\x06\x8C\x06\x8E\x06" \
-        "\x90\x06\x92\x06\x94\x06\x96\x06\x98\x06\x9A\x06\x9C\x06\x9E\x06" \
-        "\xA0\x06\xA2\x06\xA4\x06\xA6\x06\xA8\x06\xAA\x06\xAC\x06\xAE\x06" \
-        "\xB0\x06\xB2\x06\xB4\x06\xB6\x06\xB8\x06\xBA\x06\xBC\x06\xBE\x06" \
-        "\xC0\x06\xC2\x06\xC4\x06\xC6\x06\xC8\x06\xCA\x06\xCC\x06\xCE\x06" \
-        "\xD0\x06\xD2\x06\xD4\x06\xD6\x06\xD8\x06\xDA\x06\xDC\x06\xDE\x06" \
-        "\xE0\x06\xE2\x06\xE4\x06\xE6\x06\xE8\x06\xEA\x06\xEC\x06\xEE\x06" \
-        "\xF0\x06\xF2\x06\xF4\x06\xF6\x06\xF8\x06\xFA\x06\xFC\x06\xFE\x06" \
-        "\x00\x07\x02\x07\x04\x07\x06\x07\x08\x07\x0A\x07\x0C\x07\x0E\x07" \
-        "\x10\x07\x12\x07\x14\x07\x16\x07\x18\x07\x1A\x07\x1C\x07\x1E\x07" \
-        "\x20\x07\x22\x07\x24\x07\x26\x07\x28\x07\x2A\x07\x2C\x07\x2E\x07" \
-        "\x30\x07\x32\x07\x34\x07\x36\x07\x38\x07\x3A\x07\x3C\x07\x3E\x07" \
-        "\x40\x07\x42\x07\x44\x07\x46\x07\x48\x07\x4A\x07\x4C\x07\x4E\x07" \
-        "\x50\x07\x52\x07\x54\x07\x56\x07\x58\x07\x5A\x07\x5C\x07\x5E\x07" \
-        "\x60\x07\x62\x07\x64\x07\x66\x07\x68\x07\x6A\x07\x6C\x07\x6E\x07" \
-        "\x70\x07\x72\x07\x74\x07\x76\x07\x78\x07\x7A\x07\x7C\x07\x7E\x07" \
-        "\x80\x07\x82\x07\x84\x07\x86\x07\x88\x07\x8A\x07\x8C\x07\x8E\x07" \
-        "\x90\x07\x92\x07\x94\x07\x96\x07\x98\x07\x9A\x07\x9C\x07\x9E\x07" \
-        "\xA0\x07\xA2\x07\xA4\x07\xA6\x07\xA8\x07\xAA\x07\xAC\x07\xAE\x07" \
-        "\xB0\x07\xB2\x07\xB4\x07\xB6\x07\xB8\x07\xBA\x07\xBC\x07\xBE\x07" \
-        "\xC0\x07\xC2\x07\xC4\x07\xC6\x07\xC8\x07\xCA\x07\xCC\x07\xCE\x07" \
-        "\xD0\x07\xD2\x07\xD4\x07\xD6\x07\xD8\x07\xDA\x07\xDC\x07\xDE\x07" \
-        "\xE0\x07\xE2\x07\xE4\x07\xE6\x07\xE8\x07\xEA\x07\xEC\x07\xEE\x07" \
-        "\xF0\x07\xF2\x07\xF4\x07\xF6\x07\xF8\x07\xFA\x07\xFC\x07\xFE\x07"
-
-p725 = \
-        "\x8E\xEB\xE9\x4F\xE5\xFF\xFF\x66\xBB\x10\x00\x66\x8E\xDB\x66\x8E" \
-        "\xC3\x66\x8E\xD3\xBC\x90\x5B\x00\x00\xBB\x00\x82\x01\x00\x8B\x43" \
-        "\x04\x0B\xC0\x74\x09\x03\xC3\x9A\x3C\x81\x01\x00\x08\x00\x0F\x01" \
-        "\x53\x08\x0F\x01\x5B\x0E\xB8\x00\x00\x00\x00\x0B\xC0\x74\x03\x0F" \
-        "\x00\xD0\xEA\xB2\x80\x01\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\xFF\xFF\x00\x00\x00\x9B\xCF\x00\xFF\xFF\x00\x00\x00\x93\xCF" \
-        "\x00\x17\x00\x49\x80\x01\x00\xFA\x2E\x0F\x01\x1D\x49\x80\x01\x00" \
-        "\x2E\x0F\x01\x15\x61\x80\x01\x00\x66\xB8\x00\x00\xEA\xDE\x7F\x01" \
-        "\x00\x08\x00\x66\xA9\x00\x80\x75\x18\x66\x8B\xC8\xB8\x00\x00\x00" \
-        "\x00\x0B\xC0\x74\x03\x0F\x00\xD0\x66\x89\x0D\x28\x10\x00\x00\xEB" \
-        "\x0C\xBB\x28\x10\x00\x00\x66\x25\xFF\x7F\x66\x89\x03\xE9\x02\x01" \
-        "\x00\x00\xE8\x3A\x00\x00\x00\xB8\x00\x00\x00\x00\x0B\xC0\x74\x03" \
-        "\x0F\x00\xD0\x66\xB8\x10\x00\x66\x8E\xD8\x66\x8E\xC0\xB8\x40\x82" \
-        "\x01\x00\x9A\x3C\x81\x01\x00\x08\x00\xE8\xE8\xF0\xFF\xFF\xB8\x00" \
-        "\x00\x00\x00\x0B\xC0\x74\x03\x0F\x00\xD0\xEA\x75\x60\x01\x00\x08" \
-        "\x00\x66\x8C\xC8\x0F\x00\xE0\x74\x09\x66\xB8\x0F\x00\xE9\x81\xFF" \
-        "\xFF\xFF\x66\x8E\xC0\xB8\x30\x81\x01\x00\xB9\x03\x00\x00\x00\x9A" \
-        "\xB9\x81\x01\x00\x08\x00\x0B\xC0\x75\x15\xB8\x00\x00\x00\x00\x0B" \
-        "\xC0\x74\x03\x0F\x00\xD0\x66\xB8\x10\x00\xE9\x54\xFF\xFF\xFF\xC3" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x51\x52\x56" \
-        "\x57\x06\x55\x0F\x00\xC3\x66\x53\x8B\xF0\xFC\xAC\x3C\x02\x74\x20" \
-        "\x3C\x03\x74\x2A\x3C\x01\x74\x0E\x3C\x06\x74\x2F\x3C\x00\x74\x02" \
-        "\xEB\x40\x2B\xC0\xEB\x41\x66\x8B\x1E\x66\x8E\xC3\x46\x46\xEB\xDB" \
-        "\x8B\x3E\x0F\xB7\x4E\x04\x2B\xD2\x42\x83\xC6\x06\xEB\x15\x8B\x3E" \
-        "\x8B\x56\x04\x8B\x4E\x08\x83\xC6\x0C\xEB\x08\x0F\x00\x16\x83\xC6" \
-        "\x02\xEB\xB8\x8B\xEE\x8B\xD9\xF3\xA4\x4A\x74\xAF\x8B\xF5\x8B\xCB" \
-        "\xEB\xF5\xB8\x01\x00\x00\x00\x66\x5B\x0F\x00\xD3\x5D\x07\x5F\x5E" \
-        "\x5A\x59\x5B\xCB\xE9\x39\x00\x00\x00\x53\x56\x8B\xF0\x83\xF9\x01" \
-        "\x76\x1D\x26\x8B\x06\x83\xC6\x04\x49\x74\x14\x26\x8B\x1E\x83\xC6" \
-        "\x04\x3B\xC3\x74\xF3\x0B\xC0\x74\xEF\x0B\xDB\x74\xEB\xEB\x05\x2B" \
-        "\xC0\x40\xEB\x02\x2B\xC0\x5E\x5B\xCB\xFF\xFF\xFF\x00\x00\x00\x00" \
-        "\x00\x00\xFA\x2E\x0F\x01\x1D\xEC\x81\x01\x00\x2B\xC0\x66\xF7\xF0" \
-        "\x49\x4E\x49\x31\x18\x00\x00\x00\x1F\x00\x00\x10\x00\x00\x0F\x01" \
-        "\x80\x92\x01\x00\x00\x00\x00\x00\x02\x00\x10\x00\x00\x20\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\xFF\xFF\x00\x00\x00\x9A\xCF\x00\xFF" \
-        "\xFF\x00\x00\x00\x92\xCF\x00\x3E\x10\x40\x82\x01\x90\x40\x00\x00" \
-        "\x01\x10\x00\x02\x20\x10\x00\x00\x08\x00\x00\x00\x00\x00\x01\x00" \
-        "\x00\x00\x02\x50\x10\x00\x00\xE8\x00\x04\x00\x01\x00\x00\x04\x24" \
-        "\x00\x20\x20\x43\x6F\x70\x79\x72\x69\x67\x68\x74\x20\x28\x43\x29" \
-        "\x20\x32\x30\x30\x34\x20\x42\x50\x20\x4D\x69\x63\x72\x6F\x73\x79" \
-        "\x73\x74\x65\x6D\x73\x2C\x20\x49\x6E\x63\x2E\x20\x20\x00\x00\x00" \
-        "\x00\xDC\x05\x02\x00\x26\x00\x43\x00\xC0\x03\x00\x00\x10\x24\x00" \
-        "\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x00\x08" \
-        "\x00\xFF\x00\xC4\x1E\x00\x00\xCC\x1E\x00\x00\xB4\x46\x00\x00\xD0" \
-        "\x1E\x00\x00\xC0\x1E\x01\x00\xB0\x1E\x01\x00\x00\x00\x30\x55\x01" \
-        "\x00\x00\x00\x00\x00\x02\x00\x80\x01\x80\x01\x01\x00\x01\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x84\x25\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x74\x46\x00" \
-        "\x00\x38\x11\x00\x00\x3C\x11\x00\x00\x40\x11\x00\x00\x44\x11\x00" \
-        "\x00\xC0\x1E\x00\x00\x07\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x96\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x02\x38\x11\x00\x00\xF6\x03\x57\x43\x01\x00\x00\x4F\x01\x00" \
-        "\x50\x55\x01\x00\x47\x45\x01\x00\x00\x00\x02\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x2E" \
-        "\x15\x00\x00\xF6\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x24\x19\x00\x00" \
-        "\xF6\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x03\x00\x02\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x00\x00\x00\x16\x00" \
-        "\x00\x00\x00\x00\x00\x00\x1A\x00\x00\x00\x00\x00\x00\x00\x1E\x00" \
-        "\x00\x00\x20\x00\x00\x00\x00\x00\x00\x00\x24\x00\x00\x00\x00\x00" \
-        "\x00\x00\x28\x00\x00\x00\x00\x00\x00\x00\x2C\x00\x00\x00\x00\x00" \
-        "\x00\x00\x30\x00\x00\x00\x00\x00\x00\x00\x34\x00\x00\x00\x00\x00" \
-        "\x00\x00\x38\x00\x00\x00\x00\x00\x00\x00\x3C\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x13\x00\x00\x00\x00\x00\x00\x00\x17\x00" \
-        "\x00\x00\x00\x00\x00\x00\x1B\x00\x00\x00\x00\x00\x00\x00\x1F\x00" \
-        "\x00\x00\x21\x00\x00\x00\x00\x00\x00\x00\x25\x00\x00\x00\x00\x00" \
-        "\x00\x00\x29\x00\x00\x00\x00\x00\x00\x00\x2D\x00\x00\x00\x00\x00" \
-        "\x00\x00\x31\x00\x00\x00\x00\x00\x00\x00\x35\x00\x00\x00\x00\x00" \
-        "\x00\x00\x39\x00\x00\x00\x00\x00\x00\x00\x3D\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x0E\x00\x00\x00\x00\x00\x00\x00\x0A\x00" \
-        "\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x02\x00" \
-        "\x00\x00\x22\x00\x00\x00\x00\x00\x00\x00\x26\x00\x00\x00\x00\x00" \
-        "\x00\x00\x2A\x00\x00\x00\x00\x00\x00\x00\x2E\x00\x00\x00\x00\x00" \
-        "\x00\x00\x32\x00\x00\x00\x00\x00\x00\x00\x36\x00\x00\x00\x00\x00" \
-        "\x00\x00\x3A\x00\x00\x00\x00\x00\x00\x00\x3E\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x0F\x00\x00\x00\x00\x00\x00\x00\x0B\x00" \
-        "\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x03\x00" \
-        "\x00\x00\x23\x00\x00\x00\x00\x00\x00\x00\x27\x00\x00\x00\x00\x00" \
-        "\x00\x00\x2B\x00\x00\x00\x00\x00\x00\x00\x2F\x00\x00\x00\x00\x00" \
-        "\x00\x00\x33\x00\x00\x00\x00\x00\x00\x00\x37\x00\x00\x00\x00\x00" \
-        "\x00\x00\x3B\x00\x00\x00\x00\x00\x00\x00\x3F\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x12\x00\x13\x00\x00\x00\x00\x00\x16\x00" \
-        "\x17\x00\x00\x00\x00\x00\x1A\x00\x1B\x00\x00\x00\x00\x00\x1E\x00" \
-        "\x1F\x00\x20\x00\x21\x00\x00\x00\x00\x00\x24\x00\x25\x00\x00\x00" \
-        "\x00\x00\x28\x00\x29\x00\x00\x00\x00\x00\x2C\x00\x2D\x00\x00\x00" \
-        "\x00\x00\x30\x00\x31\x00\x00\x00\x00\x00\x34\x00\x35\x00\x00\x00" \
-        "\x00\x00\x38\x00\x39\x00\x00\x00\x00\x00\x3C\x00\x3D\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x0E\x00\x0F\x00\x00\x00\x00\x00\x0A\x00" \
-        "\x0B\x00\x00\x00\x00\x00\x06\x00\x07\x00\x00\x00\x00\x00\x02\x00" \
-        "\x03\x00\x22\x00\x23\x00\x00\x00\x00\x00\x26\x00\x27\x00\x00\x00" \
-        "\x00\x00\x2A\x00\x2B\x00\x00\x00\x00\x00\x2E\x00\x2F\x00\x00\x00" \
-        "\x00\x00\x32\x00\x33\x00\x00\x00\x00\x00\x36\x00\x37\x00\x00\x00" \
-        "\x00\x00\x3A\x00\x3B\x00\x00\x00\x00\x00\x3E\x00\x3F\x00\x00\x00" \
-        "\x00\x00\xFF\x7B\xEF\xFD\xFF\x7F\xEF\xFD\xFF\xFB\xEF\xFD\xFF\xFF" \
-        "\xEF\xFD\xFF\x7B\xFF\xFD\xFF\x7F\xFF\xFD\xFF\xFB\xFF\xFD\xFF\xFF" \
-        "\xFF\xFD\xFF\x7B\xEF\xFF\xFF\x7F\xEF\xFF\xFF\xFB\xEF\xFF\xFF\xFF" \
-        "\xEF\xFF\xFF\x7B\xFF\xFF\xFF\x7F\xFF\xFF\xFF\xFB\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xEF\xFD\xFF\xFF\xEF\xFD\xFF\xFF" \
-        "\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xFF\xFD\xFF\xFF" \
-        "\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF\xEF\xFF\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xEF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\x42\x50\x20\x4D\x69\x63\x02\x1A\x1D\x00\x00\x0A\x00\x72" \
-        "\x6F\x73\x79\x73\x74\x65\x6D\x73\x00\x02\xE0\x1E\x00\x00\x04\x00" \
-        "\x00\x00\x80\xBF\x02\xE4\x1E\x00\x00\x04\x00\x00\x00\x00\x00\x02" \
-        "\xF0\x1E\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\xE0\x3F\x02\x00" \
-        "\x1F\x00\x00\x08\x00\x00\x00\x00\x00\x80\x84\x7E\x41\x02\x24\x1D" \
-        "\x00\x00\x9C\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00" \
-        "\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00" \
-        "\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00" \
-        "\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00" \
-        "\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00" \
-        "\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00" \
-        "\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04\x01" \
-        "\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01" \
-        "\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14\x01" \
-        "\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01" \
-        "\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x00\x00" \
-        "\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00" \
-        "\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00" \
-        "\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00" \
-        "\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00" \
-        "\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00" \
-        "\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00" \
-        "\x2C\x00\x04\x01\x0C\x01\x14\x01\x1C\x01\x24\x01\x2C\x01\x34\x01" \
-        "\x3C\x01\x44\x01\x4C\x01\x54\x01\x5C\x01\x20\x02\x28\x02\x30\x02" \
-        "\x38\x02\x40\x02\x48\x02\xF0\x01\xF8\x01\x00\x02\x08\x02\x10\x02" \
-        "\x18\x02\x60\x01\x68\x01\x70\x01\x78\x01\x80\x01\x88\x01\x90\x01" \
-        "\x98\x01\xA0\x01\xA8\x01\xB0\x01\xB8\x01\x00\x00\x80\x00\x00\x00" \
-        "\x00\x00\x00\x00\x08\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xFE\x01\x00\xFE\x01\x00\xFE\x07\x00\xFE\xFF\x01\x00\xFE\x3F\x00" \
-        "\xFE\x3F\x00\xF8\x3F\x00\x00\x3E\xF0\xFF\xFF\xFF\xFF\x3F\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\xC0\xFF\xFF\xFF\xFF\xFF\x00" \
-        "\x02\xC0\x1E\x00\x00\x14\x00\xD0\x4A\x01\x00\xD0\x4A\x01\x00\xD0" \
-        "\x4A\x01\x00\x00\x4F\x01\x00\xD0\x4A\x01\x00\x02\x08\x1F\x00\x00" \
-        "\x58\x00\x24\x24\x24\x25\x25\x25\x25\x25\x25\x25\x25\x25\x25\x02" \
-        "\x24\x02\x02\x24\x24\x24\x24\x25\x25\x25\x25\x24\x24\x24\x25\x25" \
-        "\x25\x24\x25\x25\x24\x02\x24\x24\x24\x24\x25\x24\x24\x25\x24\x24" \
-        "\x24\x25\x25\x24\x24\x24\x25\x25\x24\x24\x24\x02\x02\x25\x25\x24" \
-        "\x25\x25\x25\x25\x25\x25\x24\x24\x02\x24\x25\x24\x25\x02\x02\x02" \
-        "\x02\x24\x24\x02\x24\x25\x25\x02\x02\x25\x02\xD4\x1E\x00\x00\x04" \
-        "\x00\xD0\x4A\x01\x00\x02\x60\x1F\x00\x00\x26\x00\x00\x00\xFF\xFF" \
-        "\x00\x40\x00\x00\x00\xC0\xFF\xFF\xAA\xAA\xFC\xFF\x54\x55\xFC\xFF" \
-        "\xAA\xAA\xFC\xFF\xAA\xAA\x55\x55\x90\x00\xF0\x00\x80\x00\x30\x00" \
-        "\xA0\x00\x02\x90\x5B\x00\x00\x04\x00\x00\x00\x00\x00\x02\xD8\x1E" \
-        "\x00\x00\x04\x00\x30\x62\x01\x00\x02\xDC\x1E\x00\x00\x04\x00\x00" \
-        "\x00\x00\x00\x02\x88\x1F\x00\x00\x0C\x00\xFF\xFF\xFF\xFF\x2C\x60" \
-        "\x01\x00\x53\x60\x01\x00\x02\x42\x10\x00\x00\x06\x00\x17\x00\x2A" \
-        "\x10\x00\x00\x02\xA0\x1F\x00\x00\x0C\x00\xFF\xFF\xFF\xFF\x9C\x63" \
-        "\x01\x00\xB0\x63\x01\x00\x02\xC8\x1F\x00\x00\x04\x00\x00\x00\x00" \
-        "\x00\x02\xC4\x1F\x00\x00\x04\x00\x00\x00\x00\x00\x02\xC0\x1F\x00" \
-        "\x00\x04\x00\x00\x00\x00\x00\x02\xBC\x1F\x00\x00\x04\x00\x00\x00" \
-        "\x00\x00\x02\xB0\x1F\x00\x00\x04\x00\x00\x00\x00\x00\x02\xAC\x1F" \
-        "\x00\x00\x04\x00\x00\x00\x00\x00\x02\xB8\x1F\x00\x00\x04\x00\x00" \
-        "\x00\x00\x00\x02\xB4\x1F\x00\x00\x04\x00\x00\x00\x00\x00\x00\xFF" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xC0\x78\x08\x00\x00\x8E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xA0\x00\x08\x00\x00\x8E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x90\x00\x08\x00\x00\x8E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xB0\x00\x08\x00\x00\x8E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x70\x02\x08\x00\x00\x8E\x01\x00\xC0\x00\x08\x00\x00\x8E\x01\x00" \
-        "\xFA\xBA\x80\x40\xB8\x02\x00\xEF\xB8\x07\x00\x8A\xE0\x0F\xBA\xF0" \
-        "\x02\xD0\xD0\x80\xE4\x01\xBA\x1A\x40\xEF\x8A\xC4\xBA\x18\x40\xEF" \
-        "\x33\xC0\xBA\x04\x40\xEF\xBA\x06\x40\xEF\xBA\x00\x40\xEF\x83\xE0" \
-        "\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x58\x83\xC8" \
-        "\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x33\xC0\x83\xE0" \
-        "\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x58\x83\xC8" \
-        "\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\xBA\x14\x22\xB8" \
-        "\x3B\x00\xEF\xB8\x01\x00\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x33\xC0" \
-        "\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\xB8\x01\x00\xBA\x04\x40\xEF\xB8" \
-        "\x01\x00\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF" \
-        "\xB8\x01\x00\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x66\x33\xC0\x66\x8B\xD8\x66\xB9\x10\x00\x00\x00\xD1\xE3\xBA" \
-        "\x00\x40\xED\xC1\xE8\x02\x83\xE0\x01\x0B\xD8\x33\xC0\x83\xE0\x01" \
-        "\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x58\x83\xC8\x02" \
-        "\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\xE2\xD0\x33\xC0\xBA" \
-        "\x04\x40\xEF\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x8B\xC3\xB9\x63\x00\x83\xF8\x10\x74\x1C\x83\xF8\x11\x74\x17" \
-        "\x83\xF8\x12\x74\x12\x83\xF8\x13\x74\x0D\x83\xF8\x14\x74\x08\x83" \
-        "\xF8\x15\x74\x03\xB9\x5B\x00\xBB\x07\x00\x8B\xC3\x83\xE0\x01\xBA" \
-        "\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x8B\xC3\x83\xE0\x01\x83" \
-        "\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\xD1\xEB\xE2" \
-        "\xD9\xBA\x02\x40\xB8\x01\x00\xEF\xB8\x00\x00\xEF\xBA\x00\x40\xED" \
-        "\x86\xE0\xBA\x60\x40\xEF\xB8\x00\x00\xBA\x70\x40\xEF\xB8\x01\x00" \
-        "\xBA\x18\x22\xEE\xB8\x00\x00\xBA\x18\x22\xEE\xB8\x01\x00\xBA\x0E" \
-        "\x40\xEF\xE9\x25\x00\xFF\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xFF\xFF\x00\x00\x00\x9B\xCF\x00\xFF\xFF\x00\x00\x00\x93\xCF\x00" \
-        "\x17\x00\x48\x96\x01\x00\xFA\xE9\x26\xFD\x66\xB8\x2A\x10\x00\x00" \
-        "\x66\x8B\xC8\x8B\xD8\x83\xE3\x0F\x66\xC1\xE8\x04\x8E\xD8\x66\xB8" \
-        "\x00\x00\x00\x00\x66\x89\x07\x66\x89\x47\x04\x66\xB8\xFF\xFF\x00" \
-        "\x00\x66\x89\x47\x08\x66\xB8\x00\x9B\xCF\x00\x66\x89\x47\x0C\x66" \
-        "\xB8\xFF\xFF\x00\x00\x66\x89\x47\x10\x66\xB8\x00\x93\xCF\x00\x66" \
-        "\x89\x47\x14\xB8\x17\x00\x89\x47\x18\x66\x89\x4F\x1A\x66\x0F\x01" \
-        "\x1F\x66\x0F\x01\x57\x18\xEB\x0E\x66\x2E\x0F\x01\x1E\xB8\x02\x66" \
-        "\x2E\x0F\x01\x16\xD0\x02\x0F\x20\xC0\x66\x83\xC8\x01\x0F\x22\xC0" \
-        "\xEB\x00\xB8\x01\x00\x66\xEA\xDE\x7F\x01\x00\x08\x00\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"
-
-p_p2n = {}
-for k, v in dict(globals()).items():
-    if k[0] != 'p' or k == 'p_p2n':
-        continue
-    p_p2n[v] = k
-
-if __name__ == '__main__':
-    for k, v in dict(globals()).items():
-        if k[0] != 'p' or type(v) is not str:
-            continue
-        open('i87c51_read_fw/%s.bin' % k, 'w').write(v)
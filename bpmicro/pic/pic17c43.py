@@ -5,12 +5,10 @@ from bpmicro import cmd
 from bpmicro.usb import validate_read
 from bpmicro.usb import usb_wraps
 import bpmicro.device
+from bpmicro import fw
 import struct
 import binascii
 
-import bpmicro.pic.pic16f84_fw
-import bpmicro.pic.pic17c43_fw
-
 
 def dev_read(dev, cont=False, verbose=False):
     bulkRead, bulkWrite, controlRead, controlWrite = usb_wraps(dev)
@@ -155,7 +153,7 @@ def dev_read(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x20\x01\x00\x50\x7D\x02\x00\x00")
     # Generated from packet 2463/2464
     # bulk2 aggregate: packet W: 2463/2464, 1 to R 2465/2466
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic16f84_fw.p651)
+    buff = cmd.bulk2b(dev, fw.hash2bin["7497e05e"])
     validate_read("\x82\x00", buff, "packet W: 2463/2464, R 1 to 2465/2466")
     # Generated from packet 2467/2468
     # bulk2 aggregate: packet W: 2467/2468, 1 to R 2469/2470
@@ -176,7 +174,7 @@ def dev_read(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x57\x83\x00\x50\x18\x3A\x00\x00")
     # Generated from packet 2483/2484
     # bulk2 aggregate: packet W: 2483/2484, 1 to R 2485/2486
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic16f84_fw.p533)
+    buff = cmd.bulk2b(dev, fw.hash2bin["06a7b55f"])
     validate_read("\x84\x00", buff, "packet W: 2483/2484, R 1 to 2485/2486")
     # Generated from packet 2487/2488
     # bulk2 aggregate: packet W: 2487/2488, 1 to R 2489/2490
@@ -192,7 +190,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\xDE\x03")
     # Generated from packet 2495/2496
     # bulk2 aggregate: packet W: 2495/2496, 1 to R 2497/2498
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic16f84_fw.p555)
+    buff = cmd.bulk2b(dev, fw.hash2bin["f127b9be"])
     validate_read("\x85\x00", buff, "packet W: 2495/2496, R 1 to 2497/2498")
     # Generated from packet 2499/2500
     # bulk2 aggregate: packet W: 2499/2500, 1 to R 2501/2502
@@ -228,7 +226,7 @@ def dev_read(dev, cont=False, verbose=False):
         )
     # Generated from packet 2519/2520
     # bulk2 aggregate: packet W: 2519/2520, 1 to R 2521/2522
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic17c43_fw.p2519)
+    buff = cmd.bulk2b(dev, fw.hash2bin["ba828e4e"])
     validate_read("\x87\x00", buff, "packet W: 2519/2520, R 1 to 2521/2522")
     # Generated from packet 2523/2524
     # bulk2 aggregate: packet W: 2523/2524, 1 to R 2525/2526
@@ -264,7 +262,7 @@ def dev_read(dev, cont=False, verbose=False):
     bulkWrite(0x02, "\x57\x89\x00\x50\x04\x0A\x00\x00")
     # Generated from packet 2555/2556
     # bulk2 aggregate: packet W: 2555/2556, 1 to R 2557/2558
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic17c43_fw.p2555)
+    buff = cmd.bulk2b(dev, fw.hash2bin["79cfec25"])
     validate_read("\x8A\x00", buff, "packet W: 2555/2556, R 1 to 2557/2558")
     # Generated from packet 2559/2560
     # bulk2 aggregate: packet W: 2559/2560, 1 to R 2561/2562
@@ -276,7 +274,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\xBE\x03")
     # Generated from packet 2569/2570
     # bulk2 aggregate: packet W: 2569/2570, 1 to R 2571/2572
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic17c43_fw.p2569)
+    buff = cmd.bulk2b(dev, fw.hash2bin["87cc5104"])
     validate_read("\x8B\x00", buff, "packet W: 2569/2570, R 1 to 2571/2572")
     # Generated from packet 2573/2574
     # bulk2 aggregate: packet W: 2573/2574, 1 to R 2575/2576
@@ -292,7 +290,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x1B\x04")
     # Generated from packet 2585/2586
     # bulk2 aggregate: packet W: 2585/2586, 1 to R 2587/2588
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic17c43_fw.p2585)
+    buff = cmd.bulk2b(dev, fw.hash2bin["1897156c"])
     validate_read("\x8C\x00", buff, "packet W: 2585/2586, R 1 to 2587/2588")
     # Generated from packet 2589/2590
     # bulk2 aggregate: packet W: 2589/2590, 1 to R 2591/2592
@@ -307,7 +305,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x12\x03")
     # Generated from packet 2611/2612
     # bulk2 aggregate: packet W: 2611/2612, 1 to R 2613/2614
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic17c43_fw.p2611)
+    buff = cmd.bulk2b(dev, fw.hash2bin["f52d144d"])
     validate_read("\x8D\x00", buff, "packet W: 2611/2612, R 1 to 2613/2614")
     # Generated from packet 2617/2618
     # bulk2 aggregate: packet W: 2617/2618, 1 to R 2619/2620
@@ -318,7 +316,7 @@ def dev_read(dev, cont=False, verbose=False):
         "\x04\x00\x05\x00\x06\x00\x07\x00\x08\x00\x09\x10\x0A\x00\x0B\x00" \
         "\x57\x8D\x00"
         )
-    #validate_read(bpmicro.pic.pic17c43_fw.p2681, buff, "packet W: 2621/2622, R 17 to 2681/2682")
+    #validate_read(fw.hash2bin["5663b987"], buff, "packet W: 2621/2622, R 17 to 2681/2682")
     # Generated from packet 2683/2684
     cmd.cmd_50(dev, "\x5E\x00")
     # Generated from packet 2685/2686
@@ -342,7 +340,7 @@ def dev_read(dev, cont=False, verbose=False):
     cmd.cmd_50(dev, "\x96\x06")
     # Generated from packet 2699/2700
     # bulk2 aggregate: packet W: 2699/2700, 1 to R 2701/2702
-    buff = cmd.bulk2b(dev, bpmicro.pic.pic17c43_fw.p2699)
+    buff = cmd.bulk2b(dev, fw.hash2bin["b53fa664"])
     validate_read("\x8F\x00", buff, "packet W: 2699/2700, R 1 to 2701/2702")
     # Generated from packet 2703/2704
     # bulk2 aggregate: packet W: 2703/2704, 1 to R 2705/2706
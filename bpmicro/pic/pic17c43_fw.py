@@ -1,4475 +0,0 @@
-# my_fw.py
-p1215 = \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"
-
-p2585 = \
-        "\x66\x8B\x05\x1E\x00\x09\x00\x66\x81\xE0\xFF\xF3\x66\x89\x05\x12" \
-        "\x22\x00\xC0\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00" \
-        "\x66\xBB\x2E\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1" \
-        "\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x10\x47" \
-        "\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81" \
-        "\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1" \
-        "\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x10\x47\x00\x00" \
-        "\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D" \
-        "\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA" \
-        "\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00" \
-        "\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x00\xE2\x66\xBA\x04" \
-        "\x00\x66\x4A\x78\x1B\xFB\x90\xFA\x66\xF7\x05\x04\x22\x00\xC0\x00" \
-        "\x80\x74\xF2\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x75\xF5\xEB\xE1" \
-        "\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D" \
-        "\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x88" \
-        "\x05\x00\x00\x10\x40\x88\x05\x04\x00\x10\x40\x88\x05\x08\x00\x10" \
-        "\x40\x88\x05\x0C\x00\x10\x40\x88\x05\x10\x00\x10\x40\x88\x05\x14" \
-        "\x00\x10\x40\x88\x05\x18\x00\x10\x40\x88\x05\x1C\x00\x10\x40\x88" \
-        "\x05\x20\x84\x10\x42\x88\x05\x24\x84\x10\x42\x88\x05\x28\x84\x00" \
-        "\x42\x88\x05\x2C\x84\x00\x42\x88\x05\x30\x84\x10\x42\x88\x05\x34" \
-        "\x84\x10\x42\x88\x05\x38\x84\x00\x42\x88\x05\x3C\x80\x10\x42\x66" \
-        "\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C\x00\x66\x81\x3D" \
-        "\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52\x66\xBA\xD0\x07" \
-        "\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66\x5A\x66\x81\xF8" \
-        "\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0\xFF\x66\x81\xC8" \
-        "\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66\xC7\x05\x50\x40" \
-        "\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66\xC7\x05\x50\x40" \
-        "\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66\xC7\x05\x50\x40" \
-        "\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1" \
-        "\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xEC\x46" \
-        "\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x15\x89\xD9\xC1" \
-        "\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D\x90\x40\x00\xC0" \
-        "\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81" \
-        "\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x81\x3D\x40" \
-        "\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00\xC0\x02\x81\xE2" \
-        "\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66\x89\x05\x90\x40" \
-        "\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66" \
-        "\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72" \
-        "\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22\x00\xC0\x1B\x66" \
-        "\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-        "\x00\x71\x66\xBA\x02\x00\x66\x4A\x78\x1B\xFB\x90\xFA\x66\xF7\x05" \
-        "\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05\x04\x22\x00\xC0\x00" \
-        "\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-        "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-        "\x00\xC0\x76\xF7\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00" \
-        "\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9" \
-        "\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-p1212 = \
-        "\x83\xFF\xFF\xFF\x83\xC4\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x04\x50\xE8\xD6\xFE\xFF" \
-        "\xFF\x83\xC4\x04\xA8\x01\x74\x18\x8A\x0D\x88\x25\x00\x00\x81\xE1" \
-        "\xFC\x00\x00\x00\x83\xC9\x01\x66\x89\x0D\x88\x25\x00\x00\xEB\x07" \
-        "\x66\x8B\x0D\x88\x25\x00\x00\xA8\x02\x74\x10\x81\xE1\xF3\x00\x00" \
-        "\x00\x83\xC9\x04\x66\x89\x0D\x88\x25\x00\x00\xA8\x04\x74\x10\x81" \
-        "\xE1\xCF\x00\x00\x00\x83\xC9\x10\x66\x89\x0D\x88\x25\x00\x00\xA8" \
-        "\x08\x74\x0D\x83\xE1\x3F\x83\xC9\x40\x66\x89\x0D\x88\x25\x00\x00" \
-        "\x51\x68\x80\x00\x00\x00\x6A\x00\xE8\xFA\xFE\xFF\xFF\x83\xC4\x0C" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x04\x50\xE8\x56\xFE\xFF" \
-        "\xFF\x6A\x00\x6A\x00\x50\xE8\x4B\xF9\xFF\xFF\x83\xC4\x10\xC3\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x8B\x44\x24\x04\x50\xE8\x36\xFE\xFF" \
-        "\xFF\x6A\x00\x0C\x10\x6A\x00\x50\xE8\x29\xF9\xFF\xFF\x83\xC4\x10" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x83\xEC\x18\xA1\x14\x1D\x00\x00\x8B" \
-        "\x0D\x18\x1D\x00\x00\x8B\x15\x1C\x1D\x00\x00\x89\x44\x24\x08\xA1" \
-        "\x20\x1D\x00\x00\x53\x89\x4C\x24\x10\x89\x44\x24\x18\x55\x33\xDB" \
-        "\xB0\xDC\xB1\x05\x56\x89\x54\x24\x1C\x57\x88\x44\x24\x10\x88\x4C" \
-        "\x24\x11\xC6\x44\x24\x12\x01\x88\x5C\x24\x13\x88\x44\x24\x14\x88" \
-        "\x4C\x24\x15\xC6\x44\x24\x16\x02\x88\x5C\x24\x17\x33\xED\xBA\x00" \
-        "\x00\xFF\xFF\x66\x85\xDB\x75\x1D\x80\x3A\x42\x75\x4E\xB9\x0F\x00" \
-        "\x00\x00\x8D\x7C\x24\x18\x8B\xF2\x33\xC0\xF3\xA6\x75\x3D\xBB\x01" \
-        "\x00\x00\x00\xEB\x06\x66\x83\xFB\x01\x75\x30\x80\x3A\xDC\x75\x2B" \
-        "\x8B\x02\x8D\x4C\x24\x10\x3B\x01\x74\x08\x8D\x4C\x24\x14\x3B\x01" \
-        "\x75\x19\x8A\x4A\x06\x80\xF9\x40\x76\x11\x80\xF9\x5B\x73\x0C\x80" \
-        "\x7A\x08\xC0\x75\x06\x80\x7A\x09\x03\x74\x0E\x45\x42\x78\xA4\x5F" \
-        "\x5E\x5D\x33\xC0\x5B\x83\xC4\x18\xC3\x66\x0F\xB6\x85\x02\x00\xFF" \
-        "\xFF\x66\x0F\xB6\x95\x04\x00\xFF\xFF\x8D\x04\x80\x5F\x5E\x5D\x8D" \
-        "\x0C\x80\x5B\x8D\x04\x8A\x83\xC4\x18\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x83\xEC\x08\x6A\x06\x6A\x13\x8D\x44" \
-        "\x24\x08\x6A\x10\x50\x6A\x02\xE8\xA4\xDD\xFF\xFF\x8B\x4C\x24\x14" \
-        "\x8B\x44\x24\x18\x41\x6A\x00\x89\x4C\x24\x18\x8D\x4C\x24\x18\x40" \
-        "\x6A\x04\x51\x89\x44\x24\x24\xE8\xE7\xE0\xFF\xFF\x50\x6A\x06\x6A"
-
-p1213 = \
-        "\x13\x8D\x54\x24\x2C\x6A\x10\x52\x6A\x02\xE8\x14\xE1\xFF\xFF\x83" \
-        "\xC4\x38\x66\x83\x3D\x7A\x25\x00\x00\x00\x74\x48\x6A\x06\x6A\x15" \
-        "\x8D\x44\x24\x08\x6A\x12\x50\x6A\x01\xE8\xC9\xDF\xFF\xFF\x8B\x4C" \
-        "\x24\x14\x8B\x44\x24\x18\x41\x6A\x00\x89\x4C\x24\x18\x8D\x4C\x24" \
-        "\x18\x40\x6A\x04\x51\x89\x44\x24\x24\xE8\x95\xE0\xFF\xFF\x50\x6A" \
-        "\x06\x6A\x15\x8D\x54\x24\x2C\x6A\x12\x52\x6A\x01\xE8\xD2\xE2\xFF" \
-        "\xFF\x83\xC4\x38\x83\xC4\x08\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x83\xEC\x08\x56\x57\xBF\x01\x00\x00" \
-        "\x00\x33\xC0\x8B\xCF\x66\xA1\x7E\x25\x00\x00\x81\xE1\xFF\xFF\x00" \
-        "\x00\xF7\xD0\x85\xC1\x74\x4E\x57\xE8\xB9\xF7\xFF\xFF\x6A\x06\x6A" \
-        "\x15\x8D\x54\x24\x14\x8B\xF0\x6A\x12\x52\x56\xE8\x47\xDF\xFF\xFF" \
-        "\x8B\x54\x24\x20\x8B\x4C\x24\x24\x42\x6A\x00\x8D\x44\x24\x24\x41" \
-        "\x6A\x04\x50\x89\x54\x24\x2C\x89\x4C\x24\x30\xE8\x13\xE0\xFF\xFF" \
-        "\x50\x6A\x06\x6A\x15\x8D\x4C\x24\x38\x6A\x12\x51\x56\xE8\x51\xE2" \
-        "\xFF\xFF\x83\xC4\x3C\xD1\xE7\x66\x83\xFF\x10\x72\x94\xE8\xD5\xFE" \
-        "\xFF\xFF\x5F\x5E\x83\xC4\x08\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x6A\x00\x6A\x08\x68\x81\x00\x00\x00" \
-        "\xE8\xE1\xF6\xFF\xFF\x83\xC4\x0C\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45" \
-        "\x00\x00\x3B\xC1\x73\x0E\xE8\x75\x16\x00\x00\x85\xC0\x74\x05\xE9" \
-        "\x9C\x16\x00\x00\xC3\x90\x90\xE9\xE4\x13\x00\x00\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\xA1\x74\x46\x00\x00\x83\xF8\x0F\x0F" \
-        "\x87\x78\x01\x00\x00\xFF\x24\x85\xF8\x44\x01\x00\xA1\x80\x46\x00" \
-        "\x00\x8B\x0D\x7C\x46\x00\x00\x8B\x15\x78\x46\x00\x00\x50\x51\x52" \
-        "\xE8\xE2\xF8\xFF\xFF\x83\xC4\x0C\xC7\x05\x74\x46\x00\x00\xFF\xFF" \
-        "\xFF\xFF\xC3\x66\xA1\x7C\x46\x00\x00\x66\x8B\x0D\x78\x46\x00\x00" \
-        "\x50\x51\xE8\xBF\xF7\xFF\xFF\x83\xC4\x08\x25\xFF\xFF\x00\x00\xA3" \
-        "\x78\x46\x00\x00\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x66" \
-        "\x8B\x15\x78\x46\x00\x00\x52\xE8\x5B\xFB\xFF\xFF\x83\xC4\x04\xC7" \
-        "\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x66\xA1\x78\x46\x00\x00" \
-        "\x50\xE8\xD1\xFB\xFF\xFF\x83\xC4\x04\xC7\x05\x74\x46\x00\x00\xFF" \
-        "\xFF\xFF\xFF\xC3\x66\x8B\x0D\x78\x46\x00\x00\x51\xE8\x16\xFC\xFF" \
-        "\xFF\x83\xC4\x04\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x66" \
-        "\x8B\x15\x78\x46\x00\x00\x52\xE8\x7B\xFC\xFF\xFF\x83\xC4\x04\xC7" \
-        "\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x66\xA1\x78\x46\x00\x00" \
-        "\x50\xE8\x81\xFC\xFF\xFF\x83\xC4\x04\xC7\x05\x74\x46\x00\x00\xFF" \
-        "\xFF\xFF\xFF\xC3\xFB\x66\x8B\x0D\x7C\x46\x00\x00\x66\x8B\x15\x78" \
-        "\x46\x00\x00\x51\x52\xE8\x0C\xF5\xFF\xFF\x83\xC4\x08\xFA\xC7\x05" \
-        "\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xFB\x66\xA1\x78\x46\x00\x00" \
-        "\x6A\x00\x50\xE8\xEE\xF4\xFF\xFF\x83\xC4\x08\xFA\xC7\x05\x74\x46" \
-        "\x00\x00\xFF\xFF\xFF\xFF\xC3\xFB\xE8\x3A\xFD\xFF\xFF\xFA\xC7\x05" \
-        "\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xFB\xE8\xD8\xFD\xFF\xFF\xFA" \
-        "\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xE8\xE4\xF2\xFF\xFF" \
-        "\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xFB\xE8\x66\xFE\xFF" \
-        "\xFF\xFA\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\xE8\x75\xFE" \
-        "\xFF\xFF\xC7\x05\x74\x46\x00\x00\xFF\xFF\xFF\xFF\xC3\x6A\x00\x6A" \
-        "\x06\x6A\x03\xE8\x18\xBB\xFF\xFF\x83\xC4\x0C\xC7\x05\x74\x46\x00" \
-        "\x00\xFF\xFF\xFF\xFF\xC3\x8B\xFF\xEB\x44\x01\x00\x6C\x43\x01\x00" \
-        "\xEB\x44\x01\x00\x93\x43\x01\x00\xBF\x43\x01\x00\xDA\x43\x01\x00" \
-        "\xF4\x43\x01\x00\x0F\x44\x01\x00\x2A\x44\x01\x00\x44\x44\x01\x00" \
-        "\x69\x44\x01\x00\x87\x44\x01\x00\x99\x44\x01\x00\xAB\x44\x01\x00" \
-        "\xBB\x44\x01\x00\xCD\x44\x01\x00\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x51\x53\x8A\xDA\x89\x4C\x24\x04\xE8" \
-        "\x40\xF2\xFF\xFF\xE8\x77\x13\x00\x00\x80\xFB\x01\x75\x0D\x8A\x4C" \
-        "\x24\x04\xFF\x15\xCC\x1E\x00\x00\x5B\x59\xC3\x80\xFB\x02\x75\x0D" \
-        "\x8B\x44\x24\x04\x50\xE8\x76\x0A\x00\x00\x83\xC4\x04\x5B\x59\xC3" \
-        "\x90\x90\x90\x90\x90\x90\x90\x55\x8B\xEC\x56\x57\x8B\x7D\x08\xBE" \
-        "\x00\x00\x09\x00\x3B\xFE\x76\x36\xF7\xC6\xFF\xFF\x00\x00\x89\x36" \
-        "\x75\x25\xB1\x01\xFF\x15\xCC\x1E\x00\x00\xA1\xB8\x45\x00\x00\x8B" \
-        "\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8\xF2\x13\x00\x00\x85\xC0" \
-        "\x74\x05\xE8\x19\x14\x00\x00\x83\xC6\x04\x3B\xF7\x72\xCA\x0F\x09" \
-        "\xBE\x00\x00\x09\x00\x3B\xFE\x76\x43\x39\x36\x74\x0B\x56\x6A\x01" \
-        "\xE8\xE2\x00\x00\x00\x83\xC4\x08\xF7\xC6\xFF\xFF\x00\x00\x75\x25" \
-        "\xB1\x02\xFF\x15\xCC\x1E\x00\x00\x8B\x0D\xB8\x45\x00\x00\xA1\xBC" \
-        "\x45\x00\x00\x3B\xC8\x73\x0E\xE8\xA4\x13\x00\x00\x85\xC0\x74\x05" \
-        "\xE8\xCB\x13\x00\x00\x83\xC6\x04\x3B\xF7\x72\xBD\xBE\x00\x00\x09" \
-        "\x00\x3B\xFE\x76\x3A\x8B\xD6\xF7\xD2\xF7\xC6\xFF\xFF\x00\x00\x89" \
-        "\x16\x75\x25\xB1\x03\xFF\x15\xCC\x1E\x00\x00\xA1\xB8\x45\x00\x00" \
-        "\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8\x61\x13\x00\x00\x85" \
-        "\xC0\x74\x05\xE8\x88\x13\x00\x00\x83\xC6\x04\x3B\xF7\x72\xC6\x0F" \
-        "\x09\xBE\x00\x00\x09\x00\x3B\xFE\x76\x49\x8B\x06\x8B\xCE\xF7\xD1" \
-        "\x3B\xC1\x74\x0B\x56\x6A\x00\xE8\x4B\x00\x00\x00\x83\xC4\x08\xF7" \
-        "\xC6\xFF\xFF\x00\x00\x75\x25\xB1\x04\xFF\x15\xCC\x1E\x00\x00\x8B" \
-        "\x15\xB8\x45\x00\x00\xA1\xBC\x45\x00\x00\x3B\xD0\x73\x0E\xE8\x0D" \
-        "\x13\x00\x00\x85\xC0\x74\x05\xE8\x34\x13\x00\x00\x83\xC6\x04\x3B" \
-        "\xF7\x72\xB7\x32\xC9\xFF\x15\xCC\x1E\x00\x00\x5F\x5E\x5D\xC3\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\x56\xB1\x0F\xFF\x15\xCC\x1E\x00\x00" \
-        "\x8B\x44\x24\x08\x8B\x74\x24\x0C\x85\xC0\x8B\xC6\x75\x02\xF7\xD0" \
-        "\x50\xE8\x2A\x09\x00\x00\x8B\x06\x50\xE8\x22\x09\x00\x00\x56\xE8" \
-        "\x1C\x09\x00\x00\x83\xC4\x0C\x5E\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x90\x90\x90\x90\x90\x90\x90\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\x51\xA1\xD0\x10\x00\x00\x53\x55\x56\x05\x01\x10\x00\x00\x57\x50" \
-        "\x6A\x0C\xE8\xED\xE3\xFF\xFF\x68\x21\x7C\x00\x00\x6A\x14\xE8\xE1" \
-        "\xE3\xFF\xFF\x83\xC4\x10\xC7\x44\x24\x10\x0A\x00\x00\x00\x8B\x4C" \
-        "\x24\x18\x68\x10\x46\x00\x00\x8B\x11\x89\x15\x10\x46\x00\x00\x66" \
-        "\x8B\x15\x74\x47\x00\x00\x8B\x41\x04\x52\xA3\x14\x46\x00\x00\x8B" \
-        "\x49\x08\x89\x0D\x18\x46\x00\x00\xE8\xF6\xE0\xFF\xFF\x68\x01\x32" \
-        "\x00\x00\x6A\x1C\xE8\x9B\xE3\xFF\xFF\x6A\x64\xE8\x10\xD7\xFF\xFF" \
-        "\x8B\x6C\x24\x34\x83\xC4\x14\xBB\x01\x00\x00\x00\x8D\x75\x02\x8B" \
-        "\xFE\x33\xC0\xBA\x01\x00\x00\x00\x66\x8B\x07\x8B\xC8\x83\xE1\x03" \
-        "\x83\xC1\x02\xC1\xE8\x02\x8D\x0C\x89\xD3\xE2\x8A\x8C\x82\x00\x00" \
-        "\x00\x80\x84\xC9\x75\x0D\x6A\x00\x53\x6A\x07\xE8\x40\xB8\xFF\xFF" \
-        "\x83\xC4\x0C\x43\x83\xC7\x02\x66\x83\xFB\x2A\x7E\xC4\x83\xC5\x56" \
-        "\xBB\x2B\x00\x00\x00\x8B\xFD\x33\xC0\xBA\x01\x00\x00\x00\x66\x8B" \
-        "\x07\x8B\xC8\x83\xE1\x03\x83\xC1\x02\xC1\xE8\x02\x8D\x0C\x89\xD3" \
-        "\xE2\x8A\x8C\x82\x00\x00\x00\x80\x84\xC9\x74\x0D\x6A\x00\x6A\x07" \
-        "\x53\xE8\xFA\xB7\xFF\xFF\x83\xC4\x0C\x43\x83\xC7\x02\x66\x83\xFB" \
-        "\x54\x7E\xC4\x6A\x00\x6A\x1C\xE8\xF8\xE2\xFF\xFF\x6A\x64\xE8\x6D" \
-        "\xD6\xFF\xFF\x8B\x44\x24\x28\x68\x10\x46\x00\x00\x8B\x08\x89\x0D" \
-        "\x10\x46\x00\x00\x66\x8B\x0D\x74\x47\x00\x00\x8B\x50\x04\x51\x89" \
-        "\x15\x14\x46\x00\x00\x8B\x40\x08\xA3\x18\x46\x00\x00\xE8\x11\xE0" \
-        "\xFF\xFF\x68\x01\x32\x00\x00\x6A\x1C\xE8\xB6\xE2\xFF\xFF\x6A\x64" \
-        "\xE8\x2B\xD6\xFF\xFF\x83\xC4\x20\xBF\x01\x00\x00\x00\x33\xC0\xBA" \
-        "\x01\x00\x00\x00\x66\x8B\x06\x8B\xC8\x83\xE1\x03\x83\xC1\x02\xC1" \
-        "\xE8\x02\x8D\x0C\x89\xD3\xE2\x8A\x8C\x82\x00\x00\x00\x80\x84\xC9" \
-        "\x74\x0D\x6A\x00\x57\x6A\x07\xE8\x64\xB7\xFF\xFF\x83\xC4\x0C\x47" \
-        "\x83\xC6\x02\x66\x83\xFF\x2A\x7E\xC4\xBF\x2B\x00\x00\x00\x8B\xF5" \
-        "\x33\xC0\xBA\x01\x00\x00\x00\x66\x8B\x06\x8B\xC8\x83\xE1\x03\x83" \
-        "\xC1\x02\xC1\xE8\x02\x8D\x0C\x89\xD3\xE2\x8A\x8C\x82\x00\x00\x00" \
-        "\x80\x84\xC9\x75\x0D\x6A\x00\x57\x6A\x07\xE8\x21\xB7\xFF\xFF\x83" \
-        "\xC4\x0C\x47\x83\xC6\x02\x66\x83\xFF\x54\x7E\xC4\x6A\x00\x6A\x1C" \
-        "\xE8\x1F\xE2\xFF\xFF\x6A\x64\xE8\x94\xD5\xFF\xFF\x8B\x44\x24\x1C" \
-        "\x83\xC4\x0C\x48\x89\x44\x24\x10\x0F\x85\x30\xFE\xFF\xFF\x66\x8B" \
-        "\x0D\x74\x47\x00\x00\x33\xC0\xA3\x10\x46\x00\x00\x68\x10\x46\x00" \
-        "\x00\xA3\x14\x46\x00\x00\x51\xA3\x18\x46\x00\x00\xE8\x32\xDF\xFF" \
-        "\xFF\x83\xC4\x08\x5F\x5E\x5D\x5B\x59\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x68\x24\x1D\x00\x00\x68\x9C\x1E\x00\x00\x68\x90\x1E\x00\x00\xE8" \
-        "\xBC\xFD\xFF\xFF\x83\xC4\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x68\xD0\x1D\x00\x00\x68\xB4\x1E\x00\x00\x68\xA8\x1E\x00\x00\xE8" \
-        "\x9C\xFD\xFF\xFF\x83\xC4\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xE8\xFB\xBB\xFF\xFF\x66\x85\xC0\x74\x07\xE8\xB1\xFF\xFF\xFF\xEB" \
-        "\x05\xE8\xCA\xFF\xFF\xFF\x53\x55\x8B\x6C\x24\x0C\x56\x57\x33\xDB" \
-        "\x33\xF6\xBF\x07\x00\x00\x00\x56\x53\xE8\x62\xBC\xFF\xFF\x83\xC4" \
-        "\x08\x66\x3D\x31\x00\x74\x13\x8B\xCD\x81\xE1\xFF\xFF\x00\x00\x3B" \
-        "\xF9\x7D\x07\x68\x01\xFA\x00\x00\xEB\x02\x6A\x00\x50\xE8\x42\xE1" \
-        "\xFF\xFF\x83\xC4\x08\x46\x4F\x66\x83\xFE\x08\x72\xCA\x43\x66\x83" \
-        "\xFB\x06\x72\xBC\x8B\x7C\x24\x18\x66\x85\xFF\x74\x28\xE8\x6E\x00" \
-        "\x00\x00\x8D\x14\xBF\x8D\x04\xD5\xC0\x0E\x00\x00\x0C\x01\x50\x6A" \
-        "\x14\xE8\x0E\xE1\xFF\xFF\x68\x01\x32\x00\x00\x6A\x1C\xE8\x02\xE1" \
-        "\xFF\xFF\x83\xC4\x10\xBE\x06\x00\x00\x00\x6A\x06\xE8\x9F\xD4\xFF" \
-        "\xFF\x6A\x64\xE8\x68\xD4\xFF\xFF\x6A\x04\xE8\x91\xD4\xFF\xFF\x6A" \
-        "\x64\xE8\x5A\xD4\xFF\xFF\x83\xC4\x10\x4E\x75\xDE\x66\x85\xFF\x5F" \
-        "\x5E\x5D\x5B\x74\x13\x6A\x00\x6A\x1C\xE8\xC6\xE0\xFF\xFF\x6A\x64" \
-        "\xE8\x3B\xD4\xFF\xFF\x83\xC4\x0C\xE9\x53\x1A\x00\x00\x90\x90\x90" \
-        "\x68\x7C\x1E\x00\x00\x6A\x30\xE8\xBC\xDE\xFF\xFF\xE8\x0F\xBB\xFF" \
-        "\xFF\x8B\x0D\x84\x1E\x00\x00\x8B\x15\x88\x1E\x00\x00\x66\xF7\xD8" \
-        "\x1B\xC0\x89\x0D\x10\x46\x00\x00\x66\x8B\x0D\x8C\x1E\x00\x00\x83" \
-        "\xE0\x08\x83\xC0\x58\x89\x15\x14\x46\x00\x00\x8A\x15\x8E\x1E\x00" \
-        "\x00\x68\x10\x46\x00\x00\x50\x66\xA3\x74\x47\x00\x00\x66\x89\x0D" \
-        "\x18\x46\x00\x00\x88\x15\x1A\x46\x00\x00\xE8\xA4\xDD\xFF\xFF\x83" \
-        "\xC4\x10\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8" \
-        "\xCC\x0E\x00\x00\x85\xC0\x74\x05\xE8\xF3\x0E\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\x9C\x25\x00\x00\xA3\x94\x25\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\x94\x25\x00\x00\xA3\x98\x25\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8" \
-        "\x6C\x0E\x00\x00\x85\xC0\x74\x05\xE8\x93\x0E\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\x3C\x80\x72\x09\xC6\x05\x90\x25\x00\x00\x25\xEB\x3D" \
-        "\x3C\x58\x72\x11\xC6\x05\x90\x25\x00\x00\x02\x66\xC7\x05\x78\x25" \
-        "\x00\x00\x02\x00\xC3\x8B\xC8\x81\xE1\xFF\x00\x00\x00\x8A\x89\x08" \
-        "\x1F\x00\x00\x80\xF9\x02\x88\x0D\x90\x25\x00\x00\x75\x0A\x66\xC7" \
-        "\x05\x78\x25\x00\x00\x02\x00\xC3\x80\xF9\x25\x75\x2D\x66\x83\x3D" \
-        "\x74\x25\x00\x00\x00\x74\x24\x0F\xBF\x15\x9A\x10\x00\x00\x8B\x0D" \
-        "\x94\x25\x00\x00\x56\x8B\x34\x95\x48\x0F\x00\x00\x3B\xCE\x5E\x77" \
-        "\x2A\x66\xC7\x05\x78\x25\x00\x00\x03\x00\xC3\x8B\x0D\x94\x25\x00" \
-        "\x00\x8B\x15\xA0\x25\x00\x00\x3B\xD1\x76\xE6\x88\x01\x8B\x0D\x94" \
-        "\x25\x00\x00\x41\x89\x0D\x94\x25\x00\x00\xC3\x88\x01\x8B\x0D\x94" \
-        "\x25\x00\x00\x49\x89\x0D\x94\x25\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8" \
-        "\x8C\x0D\x00\x00\x85\xC0\x74\x05\xE8\xB3\x0D\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\x80\x3D\x90\x25\x00\x00\x25\x75\x2D\x66\x83\x3D\x74" \
-        "\x25\x00\x00\x00\x74\x24\x0F\xBF\x15\x9A\x10\x00\x00\x8B\x0D\x94" \
-        "\x25\x00\x00\x56\x8B\x34\x95\x48\x0F\x00\x00\x3B\xCE\x5E\x77\x2A" \
-        "\x66\xC7\x05\x78\x25\x00\x00\x03\x00\xC3\x8B\x0D\x94\x25\x00\x00" \
-        "\x8B\x15\xA0\x25\x00\x00\x3B\xD1\x76\xE6\x88\x01\x8B\x0D\x94\x25" \
-        "\x00\x00\x41\x89\x0D\x94\x25\x00\x00\xC3\x88\x01\x8B\x0D\x94\x25" \
-        "\x00\x00\x49\x89\x0D\x94\x25\x00\x00\xC3\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x0D\x94\x25\x00\x00\xA1\x98\x25\x00\x00\x3B\xC8\x74\x1C\x66" \
-        "\x83\x3D\x74\x25\x00\x00\x00\x8A\x01\x74\x08\x49\x89\x0D\x94\x25" \
-        "\x00\x00\xC3\x41\x89\x0D\x94\x25\x00\x00\xC3\xB0\x24\xC3\x90\x90" \
-        "\x56\xFF\x15\xC4\x1E\x00\x00\x66\x0F\xB6\xF0\xFF\x15\xC4\x1E\x00" \
-        "\x00\x25\xFF\x00\x00\x00\xC1\xE0\x08\x03\xC6\x5E\xC3\x90\x90\x90" \
-        "\x56\xE8\xDA\xFF\xFF\xFF\x66\x8B\xF0\x81\xE6\xFF\xFF\x00\x00\xE8" \
-        "\xCC\xFF\xFF\xFF\x25\xFF\xFF\x00\x00\xC1\xE0\x10\x03\xC6\x5E\xC3" \
-        "\x80\x3D\x90\x25\x00\x00\x25\x75\x2C\x66\x83\x3D\x74\x25\x00\x00" \
-        "\x00\x74\x27\x0F\xBF\x15\x9A\x10\x00\x00\xA1\x94\x25\x00\x00\x56" \
-        "\x8B\x34\x95\x48\x0F\x00\x00\x3B\xC6\x5E\x77\x2C\x66\xC7\x05\x78" \
-        "\x25\x00\x00\x03\x00\xE9\xA6\x01\x00\x00\xA1\x94\x25\x00\x00\x8B" \
-        "\x15\xA0\x25\x00\x00\x3B\xD0\x76\xE3\x88\x08\xA1\x94\x25\x00\x00" \
-        "\x40\xA3\x94\x25\x00\x00\xEB\xDD\x88\x08\xA1\x94\x25\x00\x00\x48" \
-        "\xA3\x94\x25\x00\x00\xEB\xCE\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x55\x8B\xEC\x51\x66\xA1\x7E\x25\x00\x00\x53\x57\x66\x33\x05\x7E" \
-        "\x47\x00\x00\x8B\xF9\x66\x8B\x0D\x7C\x25\x00\x00\x89\x45\xFC\x66" \
-        "\x8B\xD9\x66\x33\x1D\x7C\x47\x00\x00\x66\x85\xDB\x74\x40\x66\x85" \
-        "\xC9\x74\x3B\xB1\x66\xE8\x36\x01\x00\x00\x33\xC9\x8A\xCF\xE8\x2D" \
-        "\x01\x00\x00\x8A\xCB\xE8\x26\x01\x00\x00\x8A\x0D\x76\x47\x00\x00" \
-        "\xE8\x1B\x01\x00\x00\x83\xE3\x0F\x6A\x00\x53\xE8\x76\xEB\xFF\xFF" \
-        "\x6A\x01\x53\xE8\x6E\xEB\xFF\xFF\x8B\x45\xFC\x83\xC4\x10\x66\x85" \
-        "\xC0\x74\x3E\x66\x83\x3D\x7E\x25\x00\x00\x00\x74\x34\x56\xB1\x67" \
-        "\xE8\xEB\x00\x00\x00\x8B\x5D\xFC\x33\xC9\x8A\xCF\xE8\xDF\x00\x00" \
-        "\x00\x8A\xCB\xE8\xD8\x00\x00\x00\x8B\xF3\x83\xE6\x0F\x6A\x00\x56" \
-        "\xE8\x31\xEB\xFF\xFF\x6A\x04\x56\xE8\x29\xEB\xFF\xFF\x83\xC4\x10" \
-        "\x5E\x66\xA1\x7C\x25\x00\x00\x66\x8B\x0D\x7E\x25\x00\x00\x66\x83" \
-        "\x3D\x74\x25\x00\x00\x00\x66\xA3\x7C\x47\x00\x00\x66\x89\x0D\x7E" \
-        "\x47\x00\x00\x74\x0D\x8B\x0D\x94\x25\x00\x00\x33\xC0\x8A\x01\x49" \
-        "\xEB\x0B\x8B\x0D\x94\x25\x00\x00\x33\xC0\x8A\x01\x41\x81\xE7\xFF" \
-        "\x00\x00\x00\x89\x0D\x94\x25\x00\x00\x3B\xF8\x5F\x5B\x74\x0F\xFA" \
-        "\x90\xFC\x6A\x01\x68\x34\x47\x00\x00\xE8\xDA\x12\x00\x00\x8B\xE5" \
-        "\x5D\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x66\x83\x3D\x74\x25\x00\x00\x00\x74\x0D\x8B\x15\x94\x25\x00\x00" \
-        "\x33\xC0\x8A\x02\x4A\xEB\x0B\x8B\x15\x94\x25\x00\x00\x33\xC0\x8A" \
-        "\x02\x42\x81\xE1\xFF\x00\x00\x00\x89\x15\x94\x25\x00\x00\x3B\xC8" \
-        "\x74\x0F\xFA\x90\xFC\x6A\x01\x68\x34\x47\x00\x00\xE8\x87\x12\x00" \
-        "\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x15\xBC\x45\x00\x00\x85\xD2\x0F\x84\xB8\x00\x00\x00\x56\x66" \
-        "\xC7\x05\xC0\x45\x00\x00\x01\x00\xB8\x00\x01\x00\x00\x8B\x35\xB8" \
-        "\x45\x00\x00\x3B\xF2\x5E\x75\x19\x66\x85\x05\x02\x22\x00\xC0\x75" \
-        "\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\xC6\x05\x00\x22\x00\xC0" \
-        "\x08\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00" \
-        "\xC0\x74\xF7\x88\x0D\x00\x22\x00\xC0\x8B\x0D\xB8\x45\x00\x00\x49" \
-        "\x89\x0D\xB8\x45\x00\x00\x75\x54\x66\x85\x05\x02\x22\x00\xC0\x75" \
-        "\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x88\x15\x00\x22\x00\xC0" \
-        "\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0" \
-        "\x74\xF7\x8B\xCA\xC1\xE9\x08\x88\x0D\x00\x22\x00\xC0\x66\x85\x05" \
-        "\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\xC6" \
-        "\x05\x00\x22\x00\xC0\x99\x89\x15\xB8\x45\x00\x00\x66\xC7\x05\xC0" \
-        "\x45\x00\x00\x00\x00\xC3\xB8\x00\x01\x00\x00\x66\x85\x05\x02\x22" \
-        "\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x88\x0D\x00" \
-        "\x22\x00\xC0\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\x66\x8B\x5C\x24\x08\x8A\xCB\xFF\x15\xCC\x1E\x00\x00\x33\xC9" \
-        "\x8A\xCF\x5B\xFF\x25\xCC\x1E\x00\x00\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\x8B\x74\x24\x08\x56\xE8\xD5\xFF\xFF\xFF\xC1\xEE\x10\x56\xE8" \
-        "\xCC\xFF\xFF\xFF\x83\xC4\x08\x5E\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\x56\x57\x33\xFF\x32\xDB\xE8\xC4\xFC\xFF\xFF\x8B\xF0\x66\xC7" \
-        "\x05\x78\x25\x00\x00\x01\x00\xE8\xC4\xFA\xFF\xFF\x8B\xC6\x4E\x85" \
-        "\xC0\x74\x3A\x46\xFF\x15\xC4\x1E\x00\x00\x66\x33\xC9\x8A\xC8\x03" \
-        "\xF9\x66\x83\x3D\x74\x25\x00\x00\x00\x74\x4C\x0F\xBF\x15\x9A\x10" \
-        "\x00\x00\x8B\x0D\x94\x25\x00\x00\x3B\x0C\x95\x48\x0F\x00\x00\x77" \
-        "\x55\x66\xC7\x05\x78\x25\x00\x00\x03\x00\x4E\x75\xC7\xFF\x15\xC4" \
-        "\x1E\x00\x00\x03\xC7\x84\xC0\x74\x02\xB3\x02\x66\x83\x3D\x78\x25" \
-        "\x00\x00\x01\x74\x02\xB3\x01\xE8\x74\xFA\xFF\xFF\x5F\x8A\xCB\x5E" \
-        "\x5B\xFF\x25\xCC\x1E\x00\x00\x8B\x0D\x94\x25\x00\x00\x8B\x15\xA0" \
-        "\x25\x00\x00\x3B\xD1\x76\xBA\x88\x01\xA1\x94\x25\x00\x00\x40\xA3" \
-        "\x94\x25\x00\x00\xEB\xB4\x88\x01\xA1\x94\x25\x00\x00\x48\xA3\x94" \
-        "\x25\x00\x00\xEB\xA5\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\x56\x33\xDB\x0F\x09\x66\x39\x1D\x74\x25\x00\x00\x74\x0D\x8B" \
-        "\x35\x9C\x25\x00\x00\xA1\x98\x25\x00\x00\xEB\x0B\x8B\x35\x98\x25" \
-        "\x00\x00\xA1\x9C\x25\x00\x00\x2B\xF0\x56\xE8\xF1\xFE\xFF\xFF\x83" \
-        "\xC4\x04\xE8\xE9\xF9\xFF\xFF\x8B\xC6\x4E\x85\xC0\x74\x2B\x46\xA1" \
-        "\x94\x25\x00\x00\x66\x83\x3D\x74\x25\x00\x00\x00\x8A\x08\x74\x03" \
-        "\x48\xEB\x01\x40\x66\x33\xD2\xA3\x94\x25\x00\x00\x8A\xD1\x03\xDA" \
-        "\xFF\x15\xCC\x1E\x00\x00\x4E\x75\xD6\x8A\xCB\x5E\xF6\xD9\x5B\xFF" \
-        "\x25\xCC\x1E\x00\x00\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\xB8\x34\x12\x00\x00\x0F\x09\x8B\x0D\x9C\x25\x00\x00\x8B\x35" \
-        "\x98\x25\x00\x00\x3B\xCE\x73\x26\x53\x57\x8B\xD0\x8B\xF8\x81\xE2" \
-        "\x00\xFE\x01\x00\x33\xDB\x8A\x19\xC1\xEF\x0F\x33\xD7\xC1\xEA\x09" \
-        "\x33\xD3\xC1\xE0\x08\x03\xC2\x41\x3B\xCE\x72\xDE\x5F\x5B\x50\xE8" \
-        "\x5C\xFE\xFF\xFF\x83\xC4\x04\x5E\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\xA8\x25\x00\x00\xA3\xA0\x25\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\xA0\x25\x00\x00\xC7\x05\x8C\x25\x00\x00\x00\x00\x00\x00\xA3" \
-        "\xA4\x25\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xB1\x06\xE8\x59\x03\x00\x00\x8A\x4C\x24\x04\xE9\x00\xFD\xFF\xFF" \
-        "\xA1\xB8\x45\x00\x00\x8B\x0D\xBC\x45\x00\x00\x3B\xC1\x73\x0E\xE8" \
-        "\x9C\x07\x00\x00\x85\xC0\x74\x05\xE8\xC3\x07\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\x66\x83\x3D\x74\x25\x00\x00\x00\x74\x24\x8B\x15\xA8" \
-        "\x25\x00\x00\x8B\x0D\xA0\x25\x00\x00\x56\x8B\x35\x70\x25\x00\x00" \
-        "\x2B\xD1\x3B\xF2\x5E\x7F\x1A\x66\xC7\x05\x78\x25\x00\x00\x03\x00" \
-        "\xC3\x8B\x0D\xA0\x25\x00\x00\x8B\x15\x94\x25\x00\x00\x3B\xCA\x76" \
-        "\xE6\x88\x01\x8B\x0D\xA0\x25\x00\x00\x49\x89\x0D\xA0\x25\x00\x00" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x0D\xA0\x25\x00\x00\x8A\x01\x49\x89\x0D\xA0\x25\x00\x00\xC3" \
-        "\x53\x56\x33\xF6\x32\xDB\xE8\x55\xFA\xFF\xFF\x8B\xC8\x48\x85\xC9" \
-        "\x66\xC7\x05\x78\x25\x00\x00\x01\x00\x74\x3E\x57\x8D\x78\x01\xFF" \
-        "\x15\xC4\x1E\x00\x00\x66\x33\xD2\x8A\xD0\x03\xF2\x66\x83\x3D\x74" \
-        "\x25\x00\x00\x00\x74\x54\x8B\x15\xA8\x25\x00\x00\x8B\x0D\xA0\x25" \
-        "\x00\x00\x2B\xD1\x39\x15\x70\x25\x00\x00\x7F\x4E\x66\xC7\x05\x78" \
-        "\x25\x00\x00\x03\x00\x4F\x75\xC7\x5F\xFF\x15\xC4\x1E\x00\x00\x03" \
-        "\xC6\x84\xC0\x74\x02\xB3\x02\x66\x83\x3D\x78\x25\x00\x00\x01\x74" \
-        "\x02\xB3\x01\x66\x83\x7C\x24\x0C\x00\x74\x05\xE8\xB0\xFE\xFF\xFF" \
-        "\x8A\xCB\x5E\x5B\xFF\x25\xCC\x1E\x00\x00\x8B\x0D\xA0\x25\x00\x00" \
-        "\x8B\x15\x94\x25\x00\x00\x3B\xCA\x76\xB2\x88\x01\xA1\xA0\x25\x00" \
-        "\x00\x48\xA3\xA0\x25\x00\x00\xEB\xAC\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\x56\x33\xDB\x0F\x09\x8B\x35\xA8\x25\x00\x00\x8B\x15\xA4\x25" \
-        "\x00\x00\x2B\xF2\x56\xE8\xA6\xFC\xFF\xFF\x83\xC4\x04\xE8\x4E\xFE" \
-        "\xFF\xFF\x8B\xC6\x4E\x85\xC0\x74\x1E\x46\xA1\xA0\x25\x00\x00\x66" \
-        "\x33\xD2\x8A\x08\x8A\xD1\x03\xDA\x48\xA3\xA0\x25\x00\x00\xFF\x15" \
-        "\xCC\x1E\x00\x00\x4E\x75\xE3\x8A\xCB\x5E\xF6\xD9\x5B\xFF\x25\xCC" \
-        "\x1E\x00\x00\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xE8\x4B\xF9\xFF\xFF\x85\xC0\x75\x05\xE8\x12\x00\x00\x00\x50\xA3" \
-        "\x8C\x25\x00\x00\xE8\x47\xFC\xFF\xFF\x59\xC3\x90\x90\x90\x90\x90" \
-        "\x56\x83\xC8\xFF\x0F\x09\x8B\x0D\xA8\x25\x00\x00\x8B\x35\xA4\x25" \
-        "\x00\x00\x3B\xCE\x76\x21\x57\x33\xD2\x8B\xF8\x8A\x11\x81\xE7\xFF" \
-        "\x00\x00\x00\x33\xD7\xC1\xE8\x08\x8B\x14\x95\x80\x47\x00\x00\x33" \
-        "\xC2\x49\x3B\xCE\x77\xE1\x5F\xF7\xD0\x5E\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\x8C\x25\x00\x00\x85\xC0\x74\x20\xE8\xB2\xFF\xFF\xFF\x3B\x05" \
-        "\x8C\x25\x00\x00\x74\x13\x6A\x01\x68\x34\x47\x00\x00\xC6\x05\x76" \
-        "\x47\x00\x00\x94\xE8\x3F\x0D\x00\x00\xC3\x90\x90\x90\x90\x90\x90" \
-        "\xE8\xCB\xF6\xFF\xFF\xE8\x76\xFD\xFF\xFF\xE8\xD1\xF6\xFF\xFF\xE9" \
-        "\x7C\xFD\xFF\xFF\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x08\x8B\x4C\x24\x04\x25\xFF\xFF\x00\x00\x81\xE1\xFF" \
-        "\xFF\x00\x00\xC1\xE0\x10\x03\xC1\xC1\xE0\x0A\x48\x66\x83\x3D\x74" \
-        "\x25\x00\x00\x00\xA3\xA8\x25\x00\x00\x74\x0E\x2B\x05\x70\x25\x00" \
-        "\x00\x48\xA3\x9C\x25\x00\x00\xEB\x0A\xC7\x05\x9C\x25\x00\x00\x00" \
-        "\x00\x09\x00\xE9\x98\xFF\xFF\xFF\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x66\x83\x3D\x74\x25\x00\x00\x00\x74\x15\xA1\x9C\x25\x00\x00\x8B" \
-        "\x0D\x94\x25\x00\x00\x2B\xC1\x50\xE8\x43\xFB\xFF\xFF\x59\xC3\xA1" \
-        "\x94\x25\x00\x00\x8B\x0D\x9C\x25\x00\x00\x2B\xC1\x50\xE8\x2E\xFB" \
-        "\xFF\xFF\x59\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\xA8\x25\x00\x00\x8B\x15\xA0\x25\x00\x00\x2B\xC2\x50\xE8\x0D" \
-        "\xFB\xFF\xFF\x59\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xE8\xAB\xFC\xFF\xFF\x8B\x44\x24\x04\x8B\x0D\xA0\x25\x00\x00\x2B" \
-        "\xC8\x89\x0D\xA0\x25\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x33\xC0\x66\x83\x3D\x56\x10\x00\x00\x27\x56\x0F\x95\xC0\x8B\xF0" \
-        "\xE8\x7B\xFC\xFF\xFF\xE8\xE6\x01\x00\x00\x66\x8B\xC6\x5E\xC3\x90" \
-        "\xA1\xBC\x45\x00\x00\x85\xC0\x74\x0A\x51\xE8\x31\x05\x00\x00\x83" \
-        "\xC4\x04\xC3\xB8\x00\x01\x00\x00\x66\x85\x05\x02\x22\x00\xC0\x75" \
-        "\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x88\x0D\x02\x22\x00\xC0" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x04\x56\x83\xCE\xFF\x8B\xC8\x48\x85\xC9\x74\x56\x57" \
-        "\x8D\x78\x01\x8B\x15\xB8\x45\x00\x00\xA1\xBC\x45\x00\x00\x3B\xD0" \
-        "\x73\x0E\xE8\xF9\x03\x00\x00\x85\xC0\x74\x05\xE8\x20\x04\x00\x00" \
-        "\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00" \
-        "\xC0\xF6\xC4\x02\x74\xF5\x8B\xCE\x25\xFF\x00\x00\x00\x81\xE1\xFF" \
-        "\x00\x00\x00\x33\xC8\xC1\xEE\x08\x8B\x14\x8D\x80\x47\x00\x00\x33" \
-        "\xF2\x4F\x75\xAF\x5F\x8B\xC6\x5E\xF7\xD0\xC3\x90\x90\x90\x90\x90" \
-        "\x8B\x4C\x24\x04\x83\xC8\xFF\x8B\xD1\x49\x85\xD2\x0F\x84\x0F\x01" \
-        "\x00\x00\x53\x8B\x1D\xBC\x45\x00\x00\x41\x55\x56\x89\x4C\x24\x10" \
-        "\x8A\x4C\x24\x14\xBE\x00\x01\x00\x00\x8B\x6C\x24\x14\x8B\xD0\x81" \
-        "\xE2\xFF\x00\x00\x00\x81\xE5\xFF\x00\x00\x00\x33\xD5\xC1\xE8\x08" \
-        "\x8B\x14\x95\x80\x47\x00\x00\x33\xC2\x8A\xD1\xFE\xC1\x88\x4C\x24" \
-        "\x14\x66\xC7\x05\xC0\x45\x00\x00\x01\x00\x8B\x2D\xB8\x45\x00\x00" \
-        "\x3B\xEB\x75\x19\x66\x85\x35\x02\x22\x00\xC0\x75\x09\x66\x85\x35" \
-        "\x02\x22\x00\xC0\x74\xF7\xC6\x05\x00\x22\x00\xC0\x08\x66\x85\x35" \
-        "\x02\x22\x00\xC0\x75\x09\x66\x85\x35\x02\x22\x00\xC0\x74\xF7\x88" \
-        "\x15\x00\x22\x00\xC0\x8B\x15\xB8\x45\x00\x00\x4A\x89\x15\xB8\x45" \
-        "\x00\x00\x75\x5C\x66\x85\x35\x02\x22\x00\xC0\x75\x09\x66\x85\x35" \
-        "\x02\x22\x00\xC0\x74\xF7\x8B\x1D\xBC\x45\x00\x00\x88\x1D\x00\x22" \
-        "\x00\xC0\x66\x85\x35\x02\x22\x00\xC0\x75\x09\x66\x85\x35\x02\x22" \
-        "\x00\xC0\x74\xF7\x8B\xD3\xC1\xEA\x08\x88\x15\x00\x22\x00\xC0\x66" \
-        "\x85\x35\x02\x22\x00\xC0\x75\x09\x66\x85\x35\x02\x22\x00\xC0\x74" \
-        "\xF7\xC6\x05\x00\x22\x00\xC0\x99\x89\x1D\xB8\x45\x00\x00\xEB\x06" \
-        "\x8B\x1D\xBC\x45\x00\x00\x66\xC7\x05\xC0\x45\x00\x00\x00\x00\x8B" \
-        "\x54\x24\x10\x4A\x89\x54\x24\x10\x0F\x85\x0B\xFF\xFF\xFF\x5E\x5D" \
-        "\x5B\xF7\xD0\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x66\x83\x3D\x56\x10\x00\x00\x27\x74\x32\xA0\x72\x46\x00\x00\x24" \
-        "\x02\x3C\x02\x75\x27\xA1\xD0\x1E\x00\x00\x3D\x70\x57\x01\x00\x74" \
-        "\x0F\xA3\xD4\x1E\x00\x00\xC7\x05\xD0\x1E\x00\x00\x70\x57\x01\x00" \
-        "\x33\xC0\xA3\xAC\x25\x00\x00\xA3\xB0\x25\x00\x00\xC3\x90\x90\x90" \
-        "\xA1\xB0\x25\x00\x00\x8B\x0D\xAC\x25\x00\x00\x3B\xC1\x0F\x82\x32" \
-        "\x01\x00\x00\xE8\x0C\xE0\xFF\xFF\xB1\x0B\xE8\xC1\xFD\xFF\xFF\x8B" \
-        "\x0D\xB8\x45\x00\x00\xA1\xBC\x45\x00\x00\x3B\xC8\x73\x0E\xE8\x0D" \
-        "\x02\x00\x00\x85\xC0\x74\x05\xE8\x34\x02\x00\x00\x66\xA1\x00\x22" \
-        "\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02" \
-        "\x74\xF5\x8B\x15\xBC\x45\x00\x00\x56\x57\x66\x0F\xB6\xF8\xA1\xB8" \
-        "\x45\x00\x00\x3B\xC2\x73\x0E\xE8\xD4\x01\x00\x00\x85\xC0\x74\x05" \
-        "\xE8\xFB\x01\x00\x00\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x75\x0B" \
-        "\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x74\xF5\x33\xC9\x8A\xE8\xB8" \
-        "\xB4\x25\x00\x00\x0B\xF9\xA3\xAC\x25\x00\x00\xA3\xB0\x25\x00\x00" \
-        "\x8B\x15\xBC\x45\x00\x00\xA1\xB8\x45\x00\x00\x3B\xC2\x73\x0E\xE8" \
-        "\x8C\x01\x00\x00\x85\xC0\x74\x05\xE8\xB3\x01\x00\x00\x66\xA1\x00" \
-        "\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66\xA1\x00\x22\x00\xC0\xF6\xC4" \
-        "\x02\x74\xF5\x66\x0F\xB6\xF0\xA1\xBC\x45\x00\x00\x8B\x0D\xB8\x45" \
-        "\x00\x00\x3B\xC8\x73\x0E\xE8\x55\x01\x00\x00\x85\xC0\x74\x05\xE8" \
-        "\x7C\x01\x00\x00\x66\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x75\x0B\x66" \
-        "\xA1\x00\x22\x00\xC0\xF6\xC4\x02\x74\xF5\x8B\x15\xAC\x25\x00\x00" \
-        "\x33\xC9\x8A\xE8\x0B\xCE\x66\x89\x0A\xA1\xAC\x25\x00\x00\x8B\x35" \
-        "\xB0\x25\x00\x00\x8B\xCF\x81\xE1\xFF\xFF\x00\x00\x83\xC0\x02\x03" \
-        "\xCE\xA3\xAC\x25\x00\x00\x3B\xC1\x0F\x82\x62\xFF\xFF\xFF\xE8\xC1" \
-        "\xDE\xFF\xFF\x5F\x5E\x8B\x0D\xB0\x25\x00\x00\x8A\x01\x41\x89\x0D" \
-        "\xB0\x25\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x81\x3D\xD0\x1E\x00\x00\x70\x57\x01\x00\x75\x0A\xA1\xD4\x1E\x00" \
-        "\x00\xA3\xD0\x1E\x00\x00\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x51\xA0\xB4\x45\x00\x00\xC6\x44\x24\x00\x00\x84\xC0\x75\x61\x56" \
-        "\x57\x8B\x74\x24\x08\xB9\x08\x00\x00\x00\x81\xE6\xFF\x00\x00\x00" \
-        "\x8B\xC6\xC1\xE0\x18\xA9\x00\x00\x00\x80\x74\x09\x03\xC0\x35\xB7" \
-        "\x1D\xC1\x04\xEB\x02\xD1\xE0\x49\x75\xEB\x6A\x20\x50\xE8\x3E\x00" \
-        "\x00\x00\x6A\x08\x56\x8B\xF8\xE8\x34\x00\x00\x00\x25\xFF\x00\x00" \
-        "\x00\x83\xC4\x10\x89\x3C\x85\x80\x47\x00\x00\x8A\x44\x24\x08\xFE" \
-        "\xC0\x88\x44\x24\x08\x75\xAA\x5F\xC6\x05\xB4\x45\x00\x00\x01\x5E" \
-        "\x59\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x54\x24\x08\x33\xC0\x84\xD2\x76\x2F\x53\x8B\x5C\x24\x08\x55" \
-        "\x56\x33\xF6\x81\xE2\xFF\x00\x00\x00\x57\x8B\xFA\xF6\xC3\x01\x74" \
-        "\x0E\x8B\xCA\xBD\x01\x00\x00\x00\x2B\xCE\x49\xD3\xE5\x0B\xC5\x46" \
-        "\xD1\xEB\x4F\x75\xE7\x5F\x5E\x5D\x5B\xC3\x90\x90\x90\x90\x90\x90" \
-        "\xB8\x01\x00\x00\x00\x66\xA3\xC0\x45\x00\x00\x8B\x0D\xB8\x45\x00" \
-        "\x00\x3B\x0D\xBC\x45\x00\x00\x72\x0B\x66\xC7\x05\xC0\x45\x00\x00" \
-        "\x00\x00\x33\xC0\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x53\xA1\xB8\x45\x00\x00\x8B\x1D\xBC\x45\x00\x00\x2B\xD8\xE8\x6D" \
-        "\x00\x00\x00\xB8\x00\x01\x00\x00\x66\x85\x05\x02\x22\x00\xC0\x75" \
-        "\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x88\x1D\x00\x22\x00\xC0" \
-        "\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0" \
-        "\x74\xF7\xC1\xEB\x08\x88\x1D\x00\x22\x00\xC0\x5B\x66\x85\x05\x02" \
-        "\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\xC6\x05" \
-        "\x00\x22\x00\xC0\x99\x8B\x0D\xBC\x45\x00\x00\x89\x0D\xB8\x45\x00" \
-        "\x00\x66\xC7\x05\xC0\x45\x00\x00\x00\x00\xC3\x90\x90\x90\x90\x90" \
-        "\xA1\xB8\x45\x00\x00\x8B\xC8\x48\x85\xC9\x74\x23\x40\xB9\x00\x01" \
-        "\x00\x00\x32\xD2\x66\x85\x0D\x02\x22\x00\xC0\x75\x09\x66\x85\x0D" \
-        "\x02\x22\x00\xC0\x74\xF7\x88\x15\x00\x22\x00\xC0\x48\x75\xE5\xC3" \
-        "\x8B\x0D\xBC\x45\x00\x00\xA1\xB8\x45\x00\x00\x3B\xC1\x73\x14\xE8" \
-        "\x0C\xFF\xFF\xFF\x85\xC0\x74\x05\xE8\x33\xFF\xFF\xFF\x8B\x0D\xBC" \
-        "\x45\x00\x00\x66\xC7\x05\xC0\x45\x00\x00\x01\x00\xB8\x00\x01\x00" \
-        "\x00\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00" \
-        "\xC0\x74\xF7\xC6\x05\x00\x22\x00\xC0\x18\x66\x85\x05\x02\x22\x00" \
-        "\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x8A\x54\x24\x04" \
-        "\x88\x15\x00\x22\x00\xC0\x8B\x15\xB8\x45\x00\x00\x4A\x89\x15\xB8" \
-        "\x45\x00\x00\x75\x54\x66\x85\x05\x02\x22\x00\xC0\x75\x09\x66\x85" \
-        "\x05\x02\x22\x00\xC0\x74\xF7\x88\x0D\x00\x22\x00\xC0\x66\x85\x05" \
-        "\x02\x22\x00\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\x8B" \
-        "\xD1\xC1\xEA\x08\x88\x15\x00\x22\x00\xC0\x66\x85\x05\x02\x22\x00" \
-        "\xC0\x75\x09\x66\x85\x05\x02\x22\x00\xC0\x74\xF7\xC6\x05\x00\x22" \
-        "\x00\xC0\x99\x89\x0D\xB8\x45\x00\x00\xA1\xB8\x45\x00\x00\x3B\xC1" \
-        "\x73\x0E\xE8\x49\xFE\xFF\xFF\x85\xC0\x74\x05\xE9\x70\xFE\xFF\xFF" \
-        "\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x55\x8B\xEC\x51\xA1\x9C\x10\x00\x00\x53\x56\x57\x89\x45\xFC\xE8" \
-        "\x6C\xF1\xFF\xFF\x8B\x3D\x60\x1F\x00\x00\x8B\xF0\x3B\x35\x64\x1F" \
-        "\x00\x00\x74\x06\x8B\x3D\x68\x1F\x00\x00\x6A\x02\x33\xDB\xE8\x0D" \
-        "\xC3\xFF\xFF\x8B\x4D\xFC\x56\x51\xE8\x83\x02\x00\x00\x0F\x20\xC0" \
-        "\x0D\x00\x00\x00\x60\x0F\x22\xC0\x0F\x09\xE8\x91\x00\x00\x00\x57" \
-        "\xE8\xDB\x00\x00\x00\x56\x57\xE8\xA4\x00\x00\x00\x83\xC4\x18\x85" \
-        "\xC0\x75\x0A\xB1\x03\xFF\x15\xCC\x1E\x00\x00\xEB\x45\x8B\x55\xFC" \
-        "\x52\x56\x57\xE8\x68\x01\x00\x00\x83\xC4\x0C\x85\xC0\x75\x0A\xB1" \
-        "\x04\xFF\x15\xCC\x1E\x00\x00\xEB\x29\x8B\x45\xFC\x50\x56\x57\xE8" \
-        "\xEC\x01\x00\x00\x83\xC4\x0C\x85\xC0\x75\x0A\xB1\x05\xFF\x15\xCC" \
-        "\x1E\x00\x00\xEB\x0D\x32\xC9\xFF\x15\xCC\x1E\x00\x00\xBB\x01\x00" \
-        "\x00\x00\x0F\x20\xC0\x25\xFF\xFF\xFF\x9F\x0F\x22\xC0\x0F\x09\xF7" \
-        "\xDB\x1B\xDB\x83\xE3\x03\x43\x53\xE8\x73\xC2\xFF\xFF\x83\xC4\x04" \
-        "\x5F\x5E\x5B\x8B\xE5\x5D\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xA1\x6C\x1F\x00\x00\x66\x8B\x0D\x7E\x1F\x00\x00\x66\x89\x08\x6A" \
-        "\x01\xE8\x1A\xC2\xFF\xFF\x59\xC3\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xE8\xDB\xFF\xFF\xFF\x8B\x44\x24\x08\x8B\xC8\x48\x85\xC9\x74\x15" \
-        "\x8B\x4C\x24\x04\x66\x81\x39\xFF\xFF\x75\x10\x83\xC1\x02\x8B\xD0" \
-        "\x48\x85\xD2\x75\xEF\xB8\x01\x00\x00\x00\xC3\x33\xC0\xC3\x90\x90" \
-        "\x8B\x0D\x6C\x1F\x00\x00\x66\xA1\x78\x1F\x00\x00\x66\x89\x01\xA1" \
-        "\x70\x1F\x00\x00\x66\x8B\x15\x7A\x1F\x00\x00\x66\x89\x10\x8B\x0D" \
-        "\x74\x1F\x00\x00\x66\x8B\x15\x80\x1F\x00\x00\x66\x89\x11\xA1\x6C" \
-        "\x1F\x00\x00\x66\x8B\x0D\x78\x1F\x00\x00\x66\x89\x08\x8B\x15\x70" \
-        "\x1F\x00\x00\x66\xA1\x7A\x1F\x00\x00\x66\x89\x02\x8B\x44\x24\x04" \
-        "\x66\x8B\x0D\x82\x1F\x00\x00\x66\x89\x08\x50\xE8\x10\x00\x00\x00" \
-        "\x83\xC4\x04\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\x57\x8B\x7C\x24\x0C\xBE\x88\x13\x00\x00\xF6\x07\x80\x75\x1A" \
-        "\x6A\x01\xE8\x59\xC1\xFF\xFF\x81\xC6\xFF\xFF\x00\x00\x83\xC4\x04" \
-        "\x66\x85\xF6\x74\x0D\xF6\x07\x80\x74\xE6\x5F\xB8\x01\x00\x00\x00" \
-        "\x5E\xC3\x5F\x33\xC0\x5E\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x55\x8B\x6C\x24\x0C\x8B\xC5\x4D\x56\x57\x85\xC0\x74\x7F\x8B\x7C" \
-        "\x24\x18\x8B\x74\x24\x10\x8B\x0D\x6C\x1F\x00\x00\x66\x8B\x15\x78" \
-        "\x1F\x00\x00\x66\x89\x11\xA1\x70\x1F\x00\x00\x66\x8B\x0D\x7A\x1F" \
-        "\x00\x00\x66\x89\x08\x8B\x15\x74\x1F\x00\x00\x66\xA1\x84\x1F\x00" \
-        "\x00\x66\x89\x02\x66\x8B\x0F\x66\x89\x0E\x66\x8B\x0F\x66\x8B\x06" \
-        "\x8A\xD0\xF6\xD2\x32\xD1\xF6\xC2\x80\x75\x1D\xA8\x20\x74\x0B\x66" \
-        "\x8B\x06\xF6\xD0\x32\xC1\xA8\x80\x74\x1D\x66\x8B\x06\x8A\xD0\xF6" \
-        "\xD2\x32\xD1\xF6\xC2\x80\x74\xE3\x83\xC6\x02\x83\xC7\x02\x8B\xC5" \
-        "\x4D\x85\xC0\x74\x08\xEB\x8F\x5F\x5E\x33\xC0\x5D\xC3\x5F\x5E\xB8" \
-        "\x01\x00\x00\x00\x5D\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\xE8\x5A\xFE\xFF\xFF\x8B\x44\x24\x0C\x8B\xC8\x48\x85\xC9\x74" \
-        "\x1D\x8B\x54\x24\x10\x8B\x4C\x24\x08\x66\x8B\x31\x66\x3B\x32\x75" \
-        "\x14\x83\xC1\x02\x83\xC2\x02\x8B\xF0\x48\x85\xF6\x75\xEB\xB8\x01" \
-        "\x00\x00\x00\x5E\xC3\x33\xC0\x5E\xC3\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x08\x8B\xC8\x48\x85\xC9\x74\x19\x56\x8B\x74\x24\x08" \
-        "\x57\x8D\x78\x01\xE8\x87\xEE\xFF\xFF\x66\x89\x06\x83\xC6\x02\x4F" \
-        "\x75\xF2\x5F\x5E\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\xC3\x55\x8B\xEC\x83\xEC\x08\x53\x56\x57\x55\x8B\x5D\x0C\x8B\x45" \
-        "\x08\xF7\x40\x04\x06\x00\x00\x00\x0F\x85\x81\x00\x00\x00\x89\x45" \
-        "\xF8\x8B\x45\x10\x89\x45\xFC\x8D\x45\xF8\x89\x43\x14\x8B\x73\x0C" \
-        "\x8B\x7B\x08\x83\xFE\xFF\x74\x5D\x8D\x0C\x76\x83\x7C\x8F\x04\x00" \
-        "\x74\x3E\x56\x55\x8B\x6B\x10\xFF\x54\x8F\x04\x5D\x5E\x8B\x5D\x0C" \
-        "\x83\xF8\xFF\x74\x36\x83\xF8\x00\x74\x26\x8B\x7B\x08\x53\xE8\x59" \
-        "\x00\x00\x00\x83\xC4\x04\x8B\x6B\x10\x56\x53\xE8\x8E\x00\x00\x00" \
-        "\x83\xC4\x08\x8D\x0C\x76\x8B\x04\x8F\x89\x43\x0C\xFF\x54\x8F\x08" \
-        "\x8B\x7B\x08\x8D\x0C\x76\x8B\x34\x8F\xEB\xA8\xB8\x00\x00\x00\x00" \
-        "\xEB\x22\x90\x90\x90\xB8\x01\x00\x00\x00\xEB\x18\x90\x90\x90\x55" \
-        "\x8B\x6B\x10\x6A\xFF\x53\xE8\x53\x00\x00\x00\x83\xC4\x08\x5D\xB8" \
-        "\x01\x00\x00\x00\x5D\x5F\x5E\x5B\x8B\xE5\x5D\xC3\x55\x8B\xEC\x53" \
-        "\x56\x57\x55\x6A\x00\x6A\x00\x68\x44\x5F\x01\x00\xFF\x75\x08\xE8" \
-        "\x2C\xFF\xFF\xFF\x5D\x5F\x5E\x5B\x8B\xE5\x5D\xC3\x8B\x4C\x24\x04" \
-        "\xF7\x41\x04\x06\x00\x00\x00\xB8\x01\x00\x00\x00\x74\x0F\x8B\x44" \
-        "\x24\x08\x8B\x54\x24\x10\x89\x02\xB8\x03\x00\x00\x00\xC3\x53\x56" \
-        "\x57\x8B\x44\x24\x10\x50\x6A\xFE\x68\x4C\x5F\x01\x00\xFF\x35\xDC" \
-        "\x1E\x00\x00\x89\x25\xDC\x1E\x00\x00\x8B\x44\x24\x20\x8B\x58\x08" \
-        "\x8B\x70\x0C\x83\xFE\xFF\x74\x20\x3B\x74\x24\x24\x74\x1A\x8D\x34" \
-        "\x76\x8B\x0C\xB3\x89\x4C\x24\x08\x89\x48\x0C\x83\x7C\xB3\x04\x00" \
-        "\x75\x04\xFF\x54\xB3\x08\xEB\xD1\x8F\x05\xDC\x1E\x00\x00\x83\xC4" \
-        "\x0C\x5F\x5E\x5B\xC3\x33\xC0\x8B\x0D\xDC\x1E\x00\x00\x81\x79\x04" \
-        "\x4C\x5F\x01\x00\x75\x10\x8B\x51\x0C\x8B\x52\x0C\x39\x51\x08\x75" \
-        "\x05\xB8\x01\x00\x00\x00\xC3\x55\x8B\xEC\x83\xEC\x24\x53\x56\x57" \
-        "\x89\x65\xF8\x89\x6D\xEC\xC7\x45\xE8\xFF\xFF\xFF\xFF\xC7\x45\xE4" \
-        "\x88\x1F\x00\x00\xC7\x45\xE0\x71\x5E\x01\x00\xA1\xDC\x1E\x00\x00" \
-        "\x89\x45\xDC\x8D\x45\xDC\xA3\xDC\x1E\x00\x00\xE8\xE0\x01\x00\x00" \
-        "\xE8\x1B\xA6\xFF\xFF\xE8\x06\x02\x00\x00\xEB\x33\x8B\x45\xF0\x8B" \
-        "\x00\x8B\x00\x89\x45\xFC\x8B\x45\xF6\x50\x8B\x45\xFC\x50\x83\xC4" \
-        "\x08\xC3\xB8\x08\x00\x00\x00\xEB\x07\xB8\x09\x00\x00\x00\xEB\x00" \
-        "\xF4\xEB\xFD\x8B\x65\xF8\x8B\x45\xFC\x50\xE8\xD1\x01\x00\x00\xC7" \
-        "\x45\xE8\xFF\xFF\xFF\xFF\x8B\x45\xDC\xA3\xDC\x1E\x00\x00\x5F\x5E" \
-        "\x5B\x8B\xE5\x5D\xC3\xE8\x1E\x00\x00\x00\xBF\xCC\x1F\x00\x00\xB9" \
-        "\x90\x4B\x00\x00\x2B\xCF\x2B\xC0\xF3\xAA\xE8\x58\xFF\xFF\xFF\x66" \
-        "\xB8\x00\x00\xE9\xEB\x1F\x00\x00\x5A\x66\xB8\x10\x00\x66\x8E\xD8" \
-        "\x66\x8E\xC0\x66\xB8\x10\x00\x66\x8E\xD0\xBC\x90\x5B\x00\x00\x66" \
-        "\xB8\x10\x00\x66\x8E\xE0\x52\xC3\xF4\xC3\xC3\xC2\x04\x00\xC2\x08" \
-        "\x00\xBB\x60\x01\x00\xBE\x60\x01\x00\xBA\x60\x01\x00\xF4\xEB\xFD" \
-        "\x2B\xC0\xC3\xFF\x8B\x54\x24\x04\x89\x2A\x89\x5A\x04\x89\x7A\x08" \
-        "\x89\x72\x0C\x89\x62\x10\x8B\x04\x24\x89\x42\x14\xC7\x42\x20\x30" \
-        "\x32\x43\x56\xC7\x42\x24\x00\x00\x00\x00\x64\xA1\xDC\x1E\x00\x00" \
-        "\x89\x42\x18\x83\xF8\xFF\x75\x09\xC7\x42\x1C\xFF\xFF\xFF\xFF\xEB" \
-        "\x3B\x8B\x4C\x24\x08\x0B\xC9\x74\x0A\x8B\x44\x24\x0C\x89\x42\x24" \
-        "\x49\x75\x08\x8B\x40\x0C\x89\x42\x1C\xEB\x21\x8B\x44\x24\x10\x89" \
-        "\x42\x1C\x49\x74\x17\x56\x57\x8D\x74\x24\x1C\x8D\x7A\x28\x83\xF9" \
-        "\x06\x76\x05\xB9\x06\x00\x00\x00\xF3\xA5\x5F\x5E\x2B\xC0\xC3\xFF" \
-        "\x55\x8B\xEC\x83\xC4\xF4\x9B\xD9\x7D\xFE\x9B\x66\x8B\x45\xFE\x80" \
-        "\xCC\x0C\x66\x89\x45\xFC\xD9\x6D\xFC\xDF\x7D\xF4\xD9\x6D\xFE\x8B" \
-        "\x45\xF4\x8B\x55\xF8\xC9\xC3\xFF\x8B\x5C\x24\x04\x8B\x2B\x8B\x73" \
-        "\x18\x64\x3B\x35\xDC\x1E\x00\x00\x74\x09\x56\xE8\x9C\xFD\xFF\xFF" \
-        "\x83\xC4\x04\x83\xFE\x00\x74\x30\x8D\x43\x20\x50\xE8\xBF\x01\x00" \
-        "\x00\x0B\xC0\x74\x16\x8B\x43\x20\x3D\x30\x32\x43\x56\x75\x0C\x8B" \
-        "\x43\x24\x0B\xC0\x74\x12\x53\xFF\xD0\xEB\x0D\x8B\x43\x1C\x50\x56" \
-        "\xE8\xA9\xFD\xFF\xFF\x83\xC4\x08\x6A\x00\x8B\x43\x14\xE8\xE9\xFE" \
-        "\xFF\xFF\x8B\xD3\x8B\x5A\x04\x8B\x7A\x08\x8B\x72\x0C\x8B\x44\x24" \
-        "\x08\x83\xF8\x01\x83\xD0\x00\x8B\x62\x10\x83\xC4\x04\xFF\x62\x14" \
-        "\xC3\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xA1\x84\x4B\x00\x00\x85\xC0\x74\x02\xFF\xD0\x68\xB8\x1F\x00\x00" \
-        "\x68\xB4\x1F\x00\x00\xE8\x26\x01\x00\x00\x83\xC4\x08\x68\xB0\x1F" \
-        "\x00\x00\x68\xAC\x1F\x00\x00\xE8\x14\x01\x00\x00\x83\xC4\x08\xC3" \
-        "\x8B\x44\x24\x04\x6A\x00\x6A\x00\x50\xE8\x52\x00\x00\x00\x83\xC4" \
-        "\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x8B\x44\x24\x04\x6A\x00\x6A\x01\x50\xE8\x32\x00\x00\x00\x83\xC4" \
-        "\x0C\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x6A\x01\x6A\x00\x6A\x00\xE8\x15\x00\x00\x00\x83\xC4\x0C\xC3\x90" \
-        "\x6A\x01\x6A\x01\x6A\x00\xE8\x05\x00\x00\x00\x83\xC4\x0C\xC3\x90" \
-        "\xA1\x0C\x46\x00\x00\x53\x55\x8B\x6C\x24\x0C\x83\xF8\x01\x56\x75" \
-        "\x0E\x55\xFF\x15\xC9\x60\x01\x00\x50\xFF\x15\xC5\x60\x01\x00\x8B" \
-        "\x44\x24\x14\x8B\x5C\x24\x18\x85\xC0\xC7\x05\x08\x46\x00\x00\x01" \
-        "\x00\x00\x00\x88\x1D\x04\x46\x00\x00\x75\x3E\x8B\x0D\x88\x4B\x00" \
-        "\x00\x85\xC9\x74\x22\x8B\x35\x8C\x4B\x00\x00\x83\xEE\x04\x3B\xF1" \
-        "\x72\x15\x8B\x06\x85\xC0\x74\x08\xFF\xD0\x8B\x0D\x88\x4B\x00\x00" \
-        "\x83\xEE\x04\x3B\xF1\x73\xEB\x68\xC0\x1F\x00\x00\x68\xBC\x1F\x00" \
-        "\x00\xE8\x3A\x00\x00\x00\x83\xC4\x08\x68\xC8\x1F\x00\x00\x68\xC4" \
-        "\x1F\x00\x00\xE8\x28\x00\x00\x00\x83\xC4\x08\x85\xDB\x75\x11\x55" \
-        "\xC7\x05\x0C\x46\x00\x00\x01\x00\x00\x00\xFF\x15\xC1\x60\x01\x00" \
-        "\x5E\x5D\x5B\xC3\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90" \
-        "\x56\x8B\x74\x24\x08\x57\x8B\x7C\x24\x10\x3B\xF7\x73\x0F\x8B\x06" \
-        "\x85\xC0\x74\x02\xFF\xD0\x83\xC6\x04\x3B\xF7\x72\xF1\x5F\x5E\xC3" \
-        "\x55\x8B\xEC\x6A\xFF\x68\xA0\x1F\x00\x00\x68\xD8\x63\x01\x00\x64" \
-        "\xA1\xDC\x1E\x00\x00\x50\x64\x89\x25\xDC\x1E\x00\x00\x83\xC4\xF0" \
-        "\x53\x56\x57\x89\x65\xE8\xC7\x45\xFC\x00\x00\x00\x00\x8B\x45\x08" \
-        "\x8B\x08\xB8\x01\x00\x00\x00\x89\x45\xE4\xEB\x19\x8B\x55\xEC\x8B" \
-        "\x02\x8B\x00\x33\xC9\x3D\x05\x00\x00\xC0\x0F\x94\xC1\x8B\xC1\xC3" \
-        "\x8B\x65\xE8\x33\xC0\xC7\x45\xFC\xFF\xFF\xFF\xFF\x8B\x4D\xF0\x64" \
-        "\x89\x0D\xDC\x1E\x00\x00\x5F\x5E\x5B\x8B\xE5\x5D\xC2\x04\x00\x90" \
-        "\x56\x43\x32\x30\x58\x43\x30\x30\x55\x8B\xEC\x83\xEC\x08\x53\x56" \
-        "\x57\x55\xFC\x8B\x5D\x0C\x8B\x45\x08\xF7\x40\x04\x06\x00\x00\x00" \
-        "\x0F\x85\x82\x00\x00\x00\x89\x45\xF8\x8B\x45\x10\x89\x45\xFC\x8D" \
-        "\x45\xF8\x89\x43\xFC\x8B\x73\x0C\x8B\x7B\x08\x83\xFE\xFF\x74\x61" \
-        "\x8D\x0C\x76\x83\x7C\x8F\x04\x00\x74\x45\x56\x55\x8D\x6B\x10\xFF" \
-        "\x54\x8F\x04\x5D\x5E\x8B\x5D\x0C\x0B\xC0\x74\x33\x78\x3C\x8B\x7B" \
-        "\x08\x53\xE8\xF5\xFA\xFF\xFF\x83\xC4\x04\x8D\x6B\x10\x56\x53\xE8" \
-        "\x2A\xFB\xFF\xFF\x83\xC4\x08\x8D\x0C\x76\x6A\x01\x8B\x44\x8F\x08" \
-        "\xE8\x66\xFC\xFF\xFF\x8B\x04\x8F\x89\x43\x0C\xFF\x54\x8F\x08\x8B" \
-        "\x7B\x08\x8D\x0C\x76\x8B\x34\x8F\xEB\xA1\xB8\x00\x00\x00\x00\xEB" \
-        "\x1C\xB8\x01\x00\x00\x00\xEB\x15\x55\x8D\x6B\x10\x6A\xFF\x53\xE8" \
-        "\xEA\xFA\xFF\xFF\x83\xC4\x08\x5D\xB8\x01\x00\x00\x00\x5D\x5F\x5E" \
-        "\x5B\x8B\xE5\x5D\xC3\x55\x8B\x4C\x24\x08\x8B\x29\x8B\x41\x1C\x50" \
-        "\x8B\x41\x18\x50\xE8\xC5\xFA\xFF\xFF\x83\xC4\x08\x5D\xC2\x04\x00" \
-        "\x66\xC7\x05\x80\x40\x00\xC0\x02\x00\xFA\x0F\x20\xC0\x0D\x00\x00" \
-        "\x00\x60\x0F\x22\xC0\x0F\x09\xE8\x9B\x1B\x00\x00\x66\xC7\x05\x80" \
-        "\x40\x00\xC0\x02\x00\xFA\xBA\xFC\xFF\xFF\x3F\x89\x12\x81\xEA\x00" \
-        "\x00\x20\x00\x73\xF6\x0F\x09\xBA\xFC\xFF\x1F\x00\x39\x12\x75\x08" \
-        "\x81\xC2\x00\x00\x20\x00\x71\xF4\x81\xEA\xFC\xFF\x1F\x00\xC1\xEA" \
-        "\x0A\x81\xFA\x00\x20\x00\x00\x75\x07\xBA\x00\x18\x00\x00\xEB\x1C" \
-        "\x81\xFA\x00\x80\x00\x00\x75\x07\xBA\x00\x48\x00\x00\xEB\x0D\x81" \
-        "\xFA\x00\x00\x02\x00\x75\x05\xBA\x00\x08\x01\x00\x81\xCA\x00\x00" \
-        "\x00\x80\x66\xC7\x05\x18\x40\x00\xC0\x00\x00\x66\xC7\x05\x1A\x40" \
-        "\x00\xC0\x01\x00\x0F\x20\xC0\x25\xFF\xFF\xFF\x9F\x0F\x22\xC0\x0F" \
-        "\x09\xE9\xB1\x1A\x00\x00\xB4\xD5\x9E\x73\x5B\x75\x59\x7B\x57\x79" \
-        "\x55\x9F\xB1\x05\xD2\xEC\x73\x4E\xB0\x40\xD0\xE0\x71\x48\x32\xE4" \
-        "\x9E\x76\x43\x78\x41\x7A\x3F\x9F\xB1\x05\xD2\xEC\x72\x38\xD0\xE4" \
-        "\x70\x34\x2B\xC0\x83\xE8\x01\xF9\x8B\xD8\x8B\xCB\x8B\xD1\x8B\xE2" \
-        "\x8B\xEC\x8B\xF5\x8B\xFE\x73\x07\x33\xC7\x75\x07\xF8\xEB\xE9\x0B" \
-        "\xC7\x74\x26\xB0\x63\x66\xF7\x05\x02\x22\x00\xC0\x00\x01\x74\xF5" \
-        "\xA2\x00\x22\x00\xC0\xF4\xB0\x66\x66\xF7\x05\x02\x22\x00\xC0\x00" \
-        "\x01\x74\xF5\xA2\x00\x22\x00\xC0\xF4\x66\xC7\x05\x18\x40\x00\xC0" \
-        "\x01\x00\x66\xC7\x05\x1A\x40\x00\xC0\x02\x00\x66\x33\xC0\x66\xA3" \
-        "\x04\x40\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66\xA3\x00\x40\x00\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01" \
-        "\x00\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04\x40\x00\xC0\x66\x33" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x33\xC0\x8B\xD8\xB9\x10\x00" \
-        "\x00\x00\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0\x66\xC1\xE8\x02\x66" \
-        "\x83\xE0\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\xE2\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\x83\xE0\x01" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x8B\xC3\x66\xB9\x63\x00\x66\x83\xF8\x10\x74" \
-        "\x22\x66\x83\xF8\x11\x74\x1C\x66\x83\xF8\x12\x74\x16\x66\x83\xF8" \
-        "\x13\x74\x10\x66\x83\xF8\x14\x74\x0A\x66\x83\xF8\x15\x74\x04\x66" \
-        "\xB9\x5B\x00\x66\xBB\x03\x00\x66\xBA\x3B\x00\x66\x8B\xC3\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22\x00\xC0\x66\xD1" \
-        "\xEB\xE2\xD8\xB8\x02\x40\x00\xC0\x66\xC7\x00\x01\x00\x66\xC7\x00" \
-        "\x00\x00\xFC\xBB\xFF\xFF\xFF\xFF\xB9\x00\x40\x00\x00\x2B\xC0\x02" \
-        "\x03\x4B\xE2\xFB\xA8\xFF\x74\x13\xB0\x65\x66\xF7\x05\x02\x22\x00" \
-        "\xC0\x00\x01\x74\xF5\xA2\x00\x22\x00\xC0\xF4\x66\xC7\x05\x18\x40" \
-        "\x00\xC0\x00\x00\x66\xC7\x05\x1A\x40\x00\xC0\x03\x00\x66\x33\xC0" \
-        "\x66\xA3\x04\x40\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66\xA3\x00\x40" \
-        "\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\xB8\x01\x00\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04\x40\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x33\xC0\x8B\xD8\xB9" \
-        "\x10\x00\x00\x00\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0\x66\xC1\xE8" \
-        "\x02\x66\x83\xE0\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\xE2\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x8B\xC3\x66\xB9\x63\x00\x66\x83\xF8" \
-        "\x10\x74\x22\x66\x83\xF8\x11\x74\x1C\x66\x83\xF8\x12\x74\x16\x66" \
-        "\x83\xF8\x13\x74\x10\x66\x83\xF8\x14\x74\x0A\x66\x83\xF8\x15\x74" \
-        "\x04\x66\xB9\x5B\x00\x66\xBB\x06\x00\x66\xBA\x3B\x00\x66\x8B\xC3" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22\x00\xC0" \
-        "\x66\xD1\xEB\xE2\xD8\xB8\x02\x40\x00\xC0\x66\xC7\x00\x01\x00\x66" \
-        "\xC7\x00\x00\x00\xC6\x05\x1C\x22\x00\xC0\x01\x0F\x20\xC0\x25\xFF" \
-        "\xFF\xFF\x9F\x0F\x22\xC0\x0F\x09\x66\xB8\x74\x00\xA2\x00\x22\x00" \
-        "\xC0\xBA\xFC\xFF\xFF\x3F\x89\x12\x81\xEA\x00\x00\x20\x00\x73\xF6" \
-        "\x0F\x09\xBA\xFC\xFF\x1F\x00\x39\x12\x75\x08\x81\xC2\x00\x00\x20" \
-        "\x00\x71\xF4\x81\xEA\xFC\xFF\x1F\x00\xC1\xEA\x0A\x81\xFA\x00\x20" \
-        "\x00\x00\x75\x07\xBA\x00\x18\x00\x00\xEB\x1C\x81\xFA\x00\x80\x00" \
-        "\x00\x75\x07\xBA\x00\x48\x00\x00\xEB\x0D\x81\xFA\x00\x00\x02\x00" \
-        "\x75\x05\xBA\x00\x08\x01\x00\x81\xFA\x00\x08\x01\x00\x77\x04\x8B" \
-        "\xF2\xEB\x08\xBE\x00\x00\x09\x00\xC1\xEE\x0A\x2B\xC9\x8B\xFE\xC1" \
-        "\xE7\x0A\x81\xEF\x00\x04\x00\x00\x72\x25\x81\xFF\x00\x10\x00\x00" \
-        "\x74\xF0\xBB\xFE\x03\x00\x00\x8B\xC7\xC1\xE8\x0A\x33\xC1\x66\xC1" \
-        "\xC8\x09\x33\xC3\x66\x89\x04\x3B\x83\xEB\x02\x73\xF1\xEB\xD3\x2B" \
-        "\xFF\x2B\xD2\xBB\xFE\x03\x00\x00\x8B\xC7\xC1\xE8\x0A\x33\xC1\x66" \
-        "\xC1\xC8\x09\x33\xC3\x66\x3B\x04\x3B\x75\x22\x83\xEB\x02\x73\xEF" \
-        "\x81\xC7\x00\x04\x00\x00\x42\x81\xFF\x00\x10\x00\x00\x74\xF1\x3B" \
-        "\xF2\x75\xD0\x83\xE9\x01\x72\x95\xE9\x7C\x03\x00\x00\x66\xC7\x05" \
-        "\x18\x40\x00\xC0\x01\x00\x66\xC7\x05\x1A\x40\x00\xC0\x03\x00\x66" \
-        "\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66\xA3" \
-        "\x00\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\xB8\x01\x00\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04\x40" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01" \
-        "\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x33\xC0\x8B" \
-        "\xD8\xB9\x10\x00\x00\x00\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0\x66" \
-        "\xC1\xE8\x02\x66\x83\xE0\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\xE2\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x8B\xC3\x66\xB9\x63\x00\x66" \
-        "\x83\xF8\x10\x74\x22\x66\x83\xF8\x11\x74\x1C\x66\x83\xF8\x12\x74" \
-        "\x16\x66\x83\xF8\x13\x74\x10\x66\x83\xF8\x14\x74\x0A\x66\x83\xF8" \
-        "\x15\x74\x04\x66\xB9\x5B\x00\x66\xBB\x07\x00\x66\xBA\x3B\x00\x66" \
-        "\x8B\xC3\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14\x22" \
-        "\x00\xC0\x66\xD1\xEB\xE2\xD8\xB8\x02\x40\x00\xC0\x66\xC7\x00\x01" \
-        "\x00\x66\xC7\x00\x00\x00\xB0\x72\xF4\xBA\xFC\xFF\xFF\x3F\x89\x12" \
-        "\x81\xEA\x00\x00\x20\x00\x73\xF6\x0F\x09\xBA\xFC\xFF\x1F\x00\x39" \
-        "\x12\x75\x08\x81\xC2\x00\x00\x20\x00\x71\xF4\x81\xEA\xFC\xFF\x1F" \
-        "\x00\xC1\xEA\x0A\x81\xFA\x00\x20\x00\x00\x75\x07\xBA\x00\x18\x00" \
-        "\x00\xEB\x1C\x81\xFA\x00\x80\x00\x00\x75\x07\xBA\x00\x48\x00\x00" \
-        "\xEB\x0D\x81\xFA\x00\x00\x02\x00\x75\x05\xBA\x00\x08\x01\x00\x66" \
-        "\xC7\x05\x18\x40\x00\xC0\x00\x00\x66\xC7\x05\x1A\x40\x00\xC0\x01" \
-        "\x00\xE9\x41\x0E\x00\x00\xC6\x05\x1C\x22\x00\xC0\x03\x66\xB8\x10" \
-        "\x00\x66\x8E\xD8\x66\x8E\xC0\x8B\xC2\x25\x00\x00\x00\x80\x81\xE2" \
-        "\xFF\xFF\xFF\x7F\xC1\xE8\x1F\x66\xA3\x26\x10\x00\x00\x66\x89\x15" \
-        "\x20\x10\x00\x00\xC1\xEA\x10\x66\x89\x15\x22\x10\x00\x00\x66\xC7" \
-        "\x05\x18\x40\x00\xC0\x00\x00\x66\xC7\x05\x1A\x40\x00\xC0\x01\x00" \
-        "\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66" \
-        "\xA3\x00\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\xB8\x01\x00\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04" \
-        "\x40\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8" \
-        "\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x33\xC0" \
-        "\x8B\xD8\xB9\x10\x00\x00\x00\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0" \
-        "\x66\xC1\xE8\x02\x66\x83\xE0\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\xE2\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x8B\xC3\x66\xB9\x63\x00" \
-        "\x66\x83\xF8\x10\x74\x22\x66\x83\xF8\x11\x74\x1C\x66\x83\xF8\x12" \
-        "\x74\x16\x66\x83\xF8\x13\x74\x10\x66\x83\xF8\x14\x74\x0A\x66\x83" \
-        "\xF8\x15\x74\x04\x66\xB9\x5B\x00\x66\xBB\x04\x00\x66\xBA\x3B\x00" \
-        "\x66\x8B\xC3\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x88\x15\x14" \
-        "\x22\x00\xC0\x66\xD1\xEB\xE2\xD8\xB8\x02\x40\x00\xC0\x66\xC7\x00" \
-        "\x01\x00\x66\xC7\x00\x00\x00\x66\xB8\x01\x00\xA2\x18\x22\x00\xC0" \
-        "\x66\xB8\x00\x00\xA2\x18\x22\x00\xC0\x66\x33\xC0\x66\xA3\x04\x40" \
-        "\x00\xC0\x66\xA3\x06\x40\x00\xC0\x66\xA3\x00\x40\x00\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66" \
-        "\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x33\xC0\x66\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\xB8\x01\x00\x66\xA3\x04\x40\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x33\xC0\x8B\xD8\xB9\x10\x00\x00\x00" \
-        "\x66\xD1\xE3\x66\xA1\x00\x40\x00\xC0\x66\xC1\xE8\x02\x66\x83\xE0" \
-        "\x01\x66\x0B\xD8\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\xE2" \
-        "\xBF\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x8B\xC3\x66\x83\xF8\x11\x74\x22\x66\x83\xF8\x12\x74" \
-        "\x1C\x66\x83\xF8\x13\x74\x16\x66\x83\xF8\x14\x74\x10\x66\x83\xF8" \
-        "\x15\x74\x0A\x66\xB8\x15\x00\xA2\x00\x22\x00\xC0\xC3\x66\xC7\x05" \
-        "\x1C\x22\x00\xC0\xF7\xFF\x66\xB8\x16\x00\xA2\x00\x22\x00\xC0\xC3" \
-        "\xFA\xFC\x66\xB8\x10\x00\x66\x8E\xD8\x66\x8E\xC0\x66\x8E\xD0\xBC" \
-        "\x90\x5B\x00\x00\x66\xC7\x05\x24\x10\x00\x00\x00\x00\xB9\x00\x40" \
-        "\x00\x00\xBB\x00\x00\x01\x00\x33\xC0\x8B\x13\x02\xC2\x02\xC6\xC1" \
-        "\xEA\x10\x02\xC2\x02\xC6\x83\xC3\x04\xE2\xEE\x25\xFF\x00\x00\x00" \
-        "\x0F\x84\x68\x03\x00\x00\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66" \
-        "\xA3\x06\x40\x00\xC0\x66\xA3\x00\x40\x00\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x00\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\xA3\x00\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\xB8\x01\x00\x66\xA3\x04\x40\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0" \
-        "\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33" \
-        "\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15" \
-        "\x14\x22\x00\xC0\x33\xC0\x8B\xD8\xB9\x10\x00\x00\x00\x66\xD1\xE3" \
-        "\x66\xA1\x00\x40\x00\xC0\x66\xC1\xE8\x02\x66\x83\xE0\x01\x66\x0B" \
-        "\xD8\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\xE2\xBF\x66\x33" \
-        "\xC0\x66\xA3\x04\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66" \
-        "\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66" \
-        "\x8B\xC3\x66\xB9\x63\x00\x66\x83\xF8\x10\x74\x22\x66\x83\xF8\x11" \
-        "\x74\x1C\x66\x83\xF8\x12\x74\x16\x66\x83\xF8\x13\x74\x10\x66\x83" \
-        "\xF8\x14\x74\x0A\x66\x83\xF8\x15\x74\x04\x66\xB9\x5B\x00\x66\xBB" \
-        "\x03\x00\x66\xBA\x3B\x00\x66\x8B\xC3\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x88\x15\x14\x22\x00\xC0\x66\xD1\xEB\xE2\xD8\xB8\x02" \
-        "\x40\x00\xC0\x66\xC7\x00\x01\x00\x66\xC7\x00\x00\x00\xF4\x66\xC7" \
-        "\x05\x0E\x40\x00\xC0\x00\x00\x66\xC7\x05\x0E\x40\x00\xC0\x01\x00" \
-        "\x66\xC7\x05\x0E\x40\x00\xC0\x00\x00\x66\xC7\x05\x0E\x40\x00\xC0" \
-        "\x01\x00\x66\xB8\x01\x00\xA2\x18\x22\x00\xC0\x66\xB8\x00\x00\xA2" \
-        "\x18\x22\x00\xC0\x66\x33\xC0\x66\xA3\x04\x40\x00\xC0\x66\xA3\x06" \
-        "\x40\x00\xC0\x66\xA3\x00\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\xB8\x01\x00\x66\xA3\x00\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\xA3\x00" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8\x01" \
-        "\x00\x66\xA3\x04\x40\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\xB8\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\xB8" \
-        "\x01\x00\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0" \
-        "\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88" \
-        "\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02" \
-        "\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0" \
-        "\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00" \
-        "\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83" \
-        "\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8" \
-        "\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00" \
-        "\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA" \
-        "\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40" \
-        "\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66" \
-        "\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14" \
-        "\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B" \
-        "\x00\x88\x15\x14\x22\x00\xC0\x66\x33\xC0\x66\x83\xE0\x01\x66\xA3" \
-        "\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83" \
-        "\xC8\x02\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22" \
-        "\x00\xC0\x33\xC0\x8B\xD8\xB9\x10\x00\x00\x00\x66\xD1\xE3\x66\xA1" \
-        "\x00\x40\x00\xC0\x66\xC1\xE8\x02\x66\x83\xE0\x01\x66\x0B\xD8\x66" \
-        "\x33\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66\xBA\x3B\x00" \
-        "\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C\x40\x00\xC0" \
-        "\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\xE2\xBF\x66\x33\xC0\x66" \
-        "\xA3\x04\x40\x00\xC0\x66\x83\xE0\x01\x66\xA3\x1C\x40\x00\xC0\x66" \
-        "\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x83\xC8\x02\x66\xA3\x1C" \
-        "\x40\x00\xC0\x66\xBA\x3B\x00\x88\x15\x14\x22\x00\xC0\x66\x8B\xC3" \
-        "\x66\x83\xF8\x11\x74\x23\x66\x83\xF8\x12\x74\x1D\x66\x83\xF8\x13" \
-        "\x74\x17\x66\x83\xF8\x14\x74\x11\x66\x83\xF8\x15\x74\x0B\x66\xB8" \
-        "\x15\x00\xA2\x00\x22\x00\xC0\xEB\x09\x66\xB8\x16\x00\xA2\x00\x22" \
-        "\x00\xC0\x9C\x68\x08\x00\x00\x00\x68\x40\x06\x01\x00\xCF\x0F\x20" \
-        "\xC3\x83\xE3\xF7\x0F\x22\xC3\x66\xBB\x10\x00\x66\x8E\xDB\x66\x8E" \
-        "\xC3\x66\x8E\xD3\xBC\x90\x5B\x00\x00\x66\x2B\xDB\x66\x8E\xE3\x66" \
-        "\x8E\xEB\xE9\x4F\xE5\xFF\xFF\x66\xBB\x10\x00\x66\x8E\xDB\x66\x8E" \
-        "\xC3\x66\x8E\xD3\xBC\x90\x5B\x00\x00\xBB\x00\x82\x01\x00\x8B\x43" \
-        "\x04\x0B\xC0\x74\x09\x03\xC3\x9A\x3C\x81\x01\x00\x08\x00\x0F\x01" \
-        "\x53\x08\x0F\x01\x5B\x0E\xB8\x00\x00\x00\x00\x0B\xC0\x74\x03\x0F" \
-        "\x00\xD0\xEA\xB2\x80\x01\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\xFF\xFF\x00\x00\x00\x9B\xCF\x00\xFF\xFF\x00\x00\x00\x93\xCF" \
-        "\x00\x17\x00\x49\x80\x01\x00\xFA\x2E\x0F\x01\x1D\x49\x80\x01\x00" \
-        "\x2E\x0F\x01\x15\x61\x80\x01\x00\x66\xB8\x00\x00\xEA\xDE\x7F\x01" \
-        "\x00\x08\x00\x66\xA9\x00\x80\x75\x18\x66\x8B\xC8\xB8\x00\x00\x00" \
-        "\x00\x0B\xC0\x74\x03\x0F\x00\xD0\x66\x89\x0D\x28\x10\x00\x00\xEB" \
-        "\x0C\xBB\x28\x10\x00\x00\x66\x25\xFF\x7F\x66\x89\x03\xE9\x02\x01" \
-        "\x00\x00\xE8\x3A\x00\x00\x00\xB8\x00\x00\x00\x00\x0B\xC0\x74\x03" \
-        "\x0F\x00\xD0\x66\xB8\x10\x00\x66\x8E\xD8\x66\x8E\xC0\xB8\x40\x82" \
-        "\x01\x00\x9A\x3C\x81\x01\x00\x08\x00\xE8\xE8\xF0\xFF\xFF\xB8\x00" \
-        "\x00\x00\x00\x0B\xC0\x74\x03\x0F\x00\xD0\xEA\x75\x60\x01\x00\x08" \
-        "\x00\x66\x8C\xC8\x0F\x00\xE0\x74\x09\x66\xB8\x0F\x00\xE9\x81\xFF" \
-        "\xFF\xFF\x66\x8E\xC0\xB8\x30\x81\x01\x00\xB9\x03\x00\x00\x00\x9A" \
-        "\xB9\x81\x01\x00\x08\x00\x0B\xC0\x75\x15\xB8\x00\x00\x00\x00\x0B" \
-        "\xC0\x74\x03\x0F\x00\xD0\x66\xB8\x10\x00\xE9\x54\xFF\xFF\xFF\xC3" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x51\x52\x56" \
-        "\x57\x06\x55\x0F\x00\xC3\x66\x53\x8B\xF0\xFC\xAC\x3C\x02\x74\x20" \
-        "\x3C\x03\x74\x2A\x3C\x01\x74\x0E\x3C\x06\x74\x2F\x3C\x00\x74\x02" \
-        "\xEB\x40\x2B\xC0\xEB\x41\x66\x8B\x1E\x66\x8E\xC3\x46\x46\xEB\xDB" \
-        "\x8B\x3E\x0F\xB7\x4E\x04\x2B\xD2\x42\x83\xC6\x06\xEB\x15\x8B\x3E" \
-        "\x8B\x56\x04\x8B\x4E\x08\x83\xC6\x0C\xEB\x08\x0F\x00\x16\x83\xC6" \
-        "\x02\xEB\xB8\x8B\xEE\x8B\xD9\xF3\xA4\x4A\x74\xAF\x8B\xF5\x8B\xCB" \
-        "\xEB\xF5\xB8\x01\x00\x00\x00\x66\x5B\x0F\x00\xD3\x5D\x07\x5F\x5E" \
-        "\x5A\x59\x5B\xCB\xE9\x39\x00\x00\x00\x53\x56\x8B\xF0\x83\xF9\x01" \
-        "\x76\x1D\x26\x8B\x06\x83\xC6\x04\x49\x74\x14\x26\x8B\x1E\x83\xC6" \
-        "\x04\x3B\xC3\x74\xF3\x0B\xC0\x74\xEF\x0B\xDB\x74\xEB\xEB\x05\x2B" \
-        "\xC0\x40\xEB\x02\x2B\xC0\x5E\x5B\xCB\xFF\xFF\xFF\x00\x00\x00\x00" \
-        "\x00\x00\xFA\x2E\x0F\x01\x1D\xEC\x81\x01\x00\x2B\xC0\x66\xF7\xF0"
-
-p2681 = \
-        "\x01\x02\x03\x04\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xF0\x1F\xF2\x1F\xF4\x1F\xF6\x1F\xF8\x1F\xFA\x1F\xFC\x1F\xFE\x1F"
-
-p2555 = \
-        "\x66\x8B\x05\x06\x00\x09\x00\x66\x81\xF8\x01\x2D\x7E\x04\x66\xB8" \
-        "\x01\x2D\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30" \
-        "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-        "\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00" \
-        "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-        "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00" \
-        "\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-        "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-        "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-        "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-        "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-        "\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x00\x00\x66" \
-        "\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81" \
-        "\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xB4\x46\x00\x00\x66\x89\x05" \
-        "\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81" \
-        "\x00\x00\x00\x00\x66\x2B\x05\xB4\x46\x00\x00\xC6\x05\x14\x22\x00" \
-        "\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89" \
-        "\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89" \
-        "\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82" \
-        "\x00\x00\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB" \
-        "\x00\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02" \
-        "\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xB4\x46\x00\x00" \
-        "\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00" \
-        "\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02" \
-        "\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xB4\x46\x00\x00\xC6\x05" \
-        "\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40" \
-        "\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00" \
-        "\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09" \
-        "\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00" \
-        "\x00\x66\xBB\x1C\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C" \
-        "\x66\x50\x66\x52\x66\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7\x35\x40" \
-        "\x25\x00\x00\x66\x5A\x66\x81\xF8\x00\x00\x75\x04\x66\xB8\x01\x00" \
-        "\x66\x81\xE0\xF0\xFF\x66\x81\xC8\x01\x00\x66\x89\x05\x90\x40\x00" \
-        "\xC0\x66\x58\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\xC6\x05\x14\x22" \
-        "\x00\xC0\x7B\x66\xC7\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22" \
-        "\x00\xC0\xBB\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\x66\xC7\x05\x30" \
-        "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-        "\x00\xF0\xFF\x66\x03\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00" \
-        "\x00\xD0\x07\x72\x15\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00" \
-        "\x00\x66\x89\x0D\x90\x40\x00\xC0\xEB\x07\x66\x89\x05\x90\x40\x00" \
-        "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-        "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6" \
-        "\x05\x14\x22\x00\xC0\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x66\x89\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02" \
-        "\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xEC\x46\x00\x00\x66\x81" \
-        "\x3D\x40\x25\x00\x00\xD0\x07\x72\x24\x66\x50\x66\x29\xC8\x73\x00" \
-        "\xC6\x05\x14\x22\x00\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA" \
-        "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x58\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00" \
-        "\x66\xBB\x2E\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1" \
-        "\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x10\x47" \
-        "\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81" \
-        "\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1" \
-        "\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x10\x47\x00\x00" \
-        "\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D" \
-        "\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA" \
-        "\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00" \
-        "\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x88\x05\x04\x00\x90\x40\x88" \
-        "\x05\x08\x00\x90\x40\x88\x05\x0C\x00\x90\x40\x88\x05\x20\x00\x00" \
-        "\x52\x88\x05\x24\x00\x00\x52\x88\x05\x28\x00\x00\x52\x66\xB8\x80" \
-        "\x0C\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\x66\x8B\x05\x06\x00\x09\x00\x81\xE3\xFF" \
-        "\xFF\x00\x00\x66\xBB\x1C\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07" \
-        "\x72\x5C\x66\x50\x66\x52\x66\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7" \
-        "\x35\x40\x25\x00\x00\x66\x5A\x66\x81\xF8\x00\x00\x75\x04\x66\xB8" \
-        "\x01\x00\x66\x81\xE0\xF0\xFF\x66\x81\xC8\x01\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x66\x58\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\xC6\x05" \
-        "\x14\x22\x00\xC0\x7B\x66\xC7\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05" \
-        "\x14\x22\x00\xC0\xBB\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\xEC\x46\x00\x00\x66\x81\x3D\x40" \
-        "\x25\x00\x00\xD0\x07\x72\x15\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00" \
-        "\x00\x00\x00\x66\x89\x0D\x90\x40\x00\xC0\xEB\x07\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72" \
-        "\x1B\xC6\x05\x14\x22\x00\xC0\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89" \
-        "\x15\x50\x40\x00\xC0\x66\x89\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1" \
-        "\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xEC\x46\x00\x00" \
-        "\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x24\x66\x50\x66\x29\xC8" \
-        "\x73\x00\xC6\x05\x14\x22\x00\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2" \
-        "\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x58\xC6" \
-        "\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50" \
-        "\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01" \
-        "\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00" \
-        "\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xC7\x05\x10\x22\x00\xC0\x05" \
-        "\x00\x66\xC7\x05\x12\x22\x00\xC0\x03\x86\x66\xC7\x05\x1E\x00\x09" \
-        "\x00\x03\x86\x66\xB8\x00\xE2\x66\xBA\x04\x00\x66\x4A\x78\x1B\xFB" \
-        "\x90\xFA\x66\xF7\x05\x04\x22\x00\xC0\x00\x80\x74\xF2\x66\xF7\x05" \
-        "\x04\x22\x00\xC0\x00\x80\x75\xF5\xEB\xE1\x66\x8B\xC8\x66\x81\xE9" \
-        "\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4" \
-        "\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\xB8\x01\x1E\x81\xE3\xFF" \
-        "\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-        "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03" \
-        "\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA" \
-        "\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00" \
-        "\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89" \
-        "\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC" \
-        "\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00" \
-        "\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03" \
-        "\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1" \
-        "\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x80\x01" \
-        "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-        "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-        "\x22\x00\xC0\x76\xF7\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66" \
-        "\xBB\x2E\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1" \
-        "\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x10\x47\x00" \
-        "\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA" \
-        "\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1" \
-        "\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x10\x47\x00\x00\xC6" \
-        "\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50" \
-        "\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01" \
-        "\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00" \
-        "\x09\xCA\x88\x82\x00\x00\x00\x40\x88\x05\x04\x00\x90\x40\x88\x05" \
-        "\x08\x00\x90\x40\x88\x05\x0C\x00\x90\x40\x88\x05\x20\x00\x00\x52" \
-        "\x88\x05\x24\x00\x00\x52\x88\x05\x28\x00\x00\x52\x88\x05\x04\x00" \
-        "\xD0\x40\x88\x05\x28\x00\x00\x5A\x88\x05\x18\x00\xD0\x40\x88\x05" \
-        "\x1C\x00\xD0\x40\x88\x05\x30\x00\x90\x5A\x88\x05\x34\x00\xD0\x52" \
-        "\x88\x05\x38\x00\x00\x52\x88\x05\x3C\x00\x00\x52\x66\xB8\x01\x82" \
-        "\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2E\x00\x66\xC7\x05\x30\x40\x00" \
-        "\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0" \
-        "\xFF\x66\x03\x05\x10\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89" \
-        "\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05" \
-        "\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66" \
-        "\x2B\x05\x10\x47\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00" \
-        "\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00" \
-        "\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00" \
-        "\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89" \
-        "\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66" \
-        "\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80" \
-        "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-        "\x39\x05\x04\x22\x00\xC0\x76\xF7\x88\x05\x18\x00\x90\x40\x88\x05" \
-        "\x1C\x00\x90\x40\x88\x05\x30\xA4\x94\x52\x88\x05\x34\xA4\x94\x52" \
-        "\x88\x05\x38\xA4\x04\x52\x88\x05\x3C\x80\x94\x52\x88\x05\x20\x00" \
-        "\x00\x5A\x66\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66" \
-        "\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0" \
-        "\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x88\x05\x20\x00\x00" \
-        "\x52\x66\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81" \
-        "\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72" \
-        "\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\xB9\x00\x00\xB2\x02" \
-        "\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25" \
-        "\x44\x11\x00\x00"
-
-p2569 = \
-        "\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2E\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\x10\x47\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\x10\x47\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x88\x05\x04\x00\x90\x40\x88\x05\x08\x00\x90\x40\x88" \
-        "\x05\x0C\x00\x90\x40\x88\x05\x20\x00\x00\x52\x88\x05\x24\x00\x00" \
-        "\x52\x88\x05\x28\x00\x00\x52\x88\x05\x04\x00\xD0\x40\x88\x05\x28" \
-        "\x00\x00\x5A\x88\x05\x18\x00\xD0\x40\x88\x05\x1C\x00\xD0\x40\x88" \
-        "\x05\x30\x00\x90\x5A\x88\x05\x34\x00\xD0\x52\x88\x05\x38\x00\x00" \
-        "\x52\x88\x05\x3C\x00\x00\x52\x66\xB8\x01\x82\x81\xE3\xFF\xFF\x00" \
-        "\x00\x66\xBB\x2E\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9" \
-        "\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x10" \
-        "\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-        "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x10\x47\x00" \
-        "\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89" \
-        "\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81" \
-        "\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03" \
-        "\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x40\x01\x66\x2D" \
-        "\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90" \
-        "\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00" \
-        "\xC0\x76\xF7\x88\x05\x18\x00\xD0\x40\x88\x05\x1C\x00\xD0\x40\x88" \
-        "\x05\x30\xB4\xD4\x5A\x88\x05\x34\xB4\x94\x5A\x88\x05\x38\xB4\x04" \
-        "\x5A\x88\x05\x3C\x80\x96\x5A\x88\x05\x20\x00\x00\x5A\x66\xB8\x40" \
-        "\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01" \
-        "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-        "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-        "\x22\x00\xC0\x76\xF7\x88\x05\x18\x00\x10\x40\x88\x05\x1C\x00\x10" \
-        "\x40\x88\x05\x30\x84\x10\x42\x88\x05\x34\x84\x10\x42\x88\x05\x38" \
-        "\x84\x00\x42\x88\x05\x3C\x80\x10\x42\x88\x05\x20\x00\x00\x5A\x66" \
-        "\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80" \
-        "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-        "\x39\x05\x04\x22\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8" \
-        "\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A" \
-        "\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39" \
-        "\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x18\x00\xF0\x81" \
-        "\x66\x0B\x05\x1C\x00\xD0\x81\x66\x0B\x05\x30\x94\x36\xB7\x66\x0B" \
-        "\x05\x34\x8C\x15\xB3\x66\x0B\x05\x38\x84\x04\xAE\x66\x0B\x05\x3C" \
-        "\x80\xF3\xAA\x66\x8B\xF8\x88\x05\x20\x00\x00\x5A\x66\xB8\x40\x01" \
-        "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-        "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-        "\x22\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01\x66" \
-        "\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-        "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-        "\x00\xC0\x76\xF7\x66\x81\xE7\x80\x00\x66\x8B\xC7\x81\xE0\xFF\xFF" \
-        "\x00\x00\xFF\xF0\xB8\x80\x00\x00\x00\x59\x39\xC8\x0F\x85\x12\x00" \
-        "\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\xE9" \
-        "\x0D\x00\x00\x00\x66\xB9\x01\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00" \
-        "\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00"
-
-p2519 = \
-        "\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB8\x58\x02\x66\x8B\x15\x3E\x25\x00\x00\x66\xF7" \
-        "\xE2\x66\x81\xFA\x01\x00\x73\x15\x66\x03\x05\x3C\x25\x00\x00\x72" \
-        "\x0C\x66\x81\xE0\xF0\xFF\x66\x81\xC8\x01\x00\xEB\x05\x66\xC7\xC0" \
-        "\xF1\xFF\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x14\x00\x66\xC7\x05\x30" \
-        "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-        "\x00\xF0\xFF\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-        "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04" \
-        "\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66" \
-        "\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xBC\x46\x00\x00\x66" \
-        "\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89" \
-        "\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14" \
-        "\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00" \
-        "\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00" \
-        "\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA" \
-        "\x88\x82\x00\x00\x00\x40\x66\xB8\x01\x14\x81\xE3\xFF\xFF\x00\x00" \
-        "\x66\xBB\x1C\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x5C\x66" \
-        "\x50\x66\x52\x66\xBA\xD0\x07\x66\xB8\x00\x00\x66\xF7\x35\x40\x25" \
-        "\x00\x00\x66\x5A\x66\x81\xF8\x00\x00\x75\x04\x66\xB8\x01\x00\x66" \
-        "\x81\xE0\xF0\xFF\x66\x81\xC8\x01\x00\x66\x89\x05\x90\x40\x00\xC0" \
-        "\x66\x58\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\xC6\x05\x14\x22\x00" \
-        "\xC0\x7B\x66\xC7\x05\x50\x40\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00" \
-        "\xC0\xBB\x66\xC7\x05\x50\x40\x00\xC0\x08\x80\x66\xC7\x05\x30\x40" \
-        "\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00" \
-        "\xF0\xFF\x66\x03\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00" \
-        "\xD0\x07\x72\x15\x89\xD9\xC1\xE1\x02\x66\x8B\x89\x00\x00\x00\x00" \
-        "\x66\x89\x0D\x90\x40\x00\xC0\xEB\x07\x66\x89\x05\x90\x40\x00\xC0" \
-        "\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6" \
-        "\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05" \
-        "\x14\x22\x00\xC0\x02\x81\xE2\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40" \
-        "\x00\xC0\x66\x89\x05\x90\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66" \
-        "\x89\x81\x00\x00\x00\x00\x66\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D" \
-        "\x40\x25\x00\x00\xD0\x07\x72\x24\x66\x50\x66\x29\xC8\x73\x00\xC6" \
-        "\x05\x14\x22\x00\xC0\x1B\x66\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00" \
-        "\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x58\xC6\x05\x14\x22" \
-        "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-        "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-        "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-        "\x82\x00\x00\x00\x40\x66\xB8\x80\x0C\x66\x2D\x07\x00\x72\x1F\x66" \
-        "\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04" \
-        "\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\xE9\x05" \
-        "\x00\x00\x00\x90\x00\x00\x00\x00\x66\xC7\x05\x14\x46\x09\x00\x00" \
-        "\x00\x66\xB8\x01\x11\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00\x66" \
-        "\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81" \
-        "\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89\x05" \
-        "\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00" \
-        "\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81" \
-        "\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22\x00" \
-        "\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89" \
-        "\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89" \
-        "\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3" \
-        "\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82" \
-        "\x00\x00\x00\x40\x31\xC0\x66\x0B\x05\x1C\x04\x00\x80\x66\x50\x66" \
-        "\x8B\x05\x0E\x00\x09\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x0C\x00" \
-        "\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7" \
-        "\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xCC\x46\x00\x00\x66\x89" \
-        "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-        "\x81\x00\x00\x00\x00\x66\x2B\x05\xCC\x46\x00\x00\xC6\x05\x14\x22" \
-        "\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0" \
-        "\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00" \
-        "\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88" \
-        "\x82\x00\x00\x00\x40\x66\x58\xB4\x00\x66\x89\xC7\x66\xB8\x01\x00" \
-        "\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x04\x00\x66\xC7\x05\x30\x40\x00" \
-        "\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0" \
-        "\xFF\x66\x03\x05\xBC\x46\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89" \
-        "\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05" \
-        "\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66" \
-        "\x2B\x05\xBC\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00" \
-        "\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00" \
-        "\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00" \
-        "\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89" \
-        "\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66" \
-        "\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x1C\x00\x66\x81\x3D" \
-        "\x40\x25\x00\x00\xD0\x07\x72\x5C\x66\x50\x66\x52\x66\xBA\xD0\x07" \
-        "\x66\xB8\x00\x00\x66\xF7\x35\x40\x25\x00\x00\x66\x5A\x66\x81\xF8" \
-        "\x00\x00\x75\x04\x66\xB8\x01\x00\x66\x81\xE0\xF0\xFF\x66\x81\xC8" \
-        "\x01\x00\x66\x89\x05\x90\x40\x00\xC0\x66\x58\x66\xC7\x05\x50\x40" \
-        "\x00\xC0\x08\x80\xC6\x05\x14\x22\x00\xC0\x7B\x66\xC7\x05\x50\x40" \
-        "\x00\xC0\x08\xC0\xC6\x05\x14\x22\x00\xC0\xBB\x66\xC7\x05\x50\x40" \
-        "\x00\xC0\x08\x80\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1" \
-        "\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\xEC\x46" \
-        "\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72\x15\x89\xD9\xC1" \
-        "\xE1\x02\x66\x8B\x89\x00\x00\x00\x00\x66\x89\x0D\x90\x40\x00\xC0" \
-        "\xEB\x07\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81" \
-        "\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x66\x81\x3D\x40" \
-        "\x25\x00\x00\xD0\x07\x72\x1B\xC6\x05\x14\x22\x00\xC0\x02\x81\xE2" \
-        "\xFF\x7F\xFF\xFF\x66\x89\x15\x50\x40\x00\xC0\x66\x89\x05\x90\x40" \
-        "\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66" \
-        "\x2B\x05\xEC\x46\x00\x00\x66\x81\x3D\x40\x25\x00\x00\xD0\x07\x72" \
-        "\x24\x66\x50\x66\x29\xC8\x73\x00\xC6\x05\x14\x22\x00\xC0\x1B\x66" \
-        "\x81\xE8\x00\x12\x73\xF2\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50" \
-        "\x40\x00\xC0\x66\x58\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-        "\xB8\x0B\x66\x8B\x15\x3E\x25\x00\x00\x66\xF7\xE2\x66\x81\xFA\x01" \
-        "\x00\x73\x15\x66\x03\x05\x3C\x25\x00\x00\x72\x0C\x66\x81\xE0\xF0" \
-        "\xFF\x66\x81\xC8\x01\x00\xEB\x05\x66\xC7\xC0\xF1\xFF\x81\xE3\xFF" \
-        "\xFF\x00\x00\x66\xBB\x14\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF" \
-        "\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x89" \
-        "\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00" \
-        "\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89" \
-        "\x81\x00\x00\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80" \
-        "\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00" \
-        "\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00" \
-        "\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9" \
-        "\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8" \
-        "\x01\x2D\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x18\x00\x66\xC7\x05\x30" \
-        "\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00" \
-        "\x00\xF0\xFF\x66\x03\x05\xE4\x46\x00\x00\x66\x89\x05\x90\x40\x00" \
-        "\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40\x00\xC0" \
-        "\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66\x89\x15" \
-        "\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00\x00\x00" \
-        "\x00\x66\x2B\x05\xE4\x46\x00\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81" \
-        "\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2" \
-        "\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1" \
-        "\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2" \
-        "\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00\x00\x00" \
-        "\x40\x66\x8B\xC7\x66\x3D\x00\x00\x0F\x85\x09\x00\x00\x00\x66\xB9" \
-        "\x01\x00\xE9\x04\x00\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25" \
-        "\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB\xFF\x25\x44\x11\x00" \
-        "\x00"
-
-p1214 = \
-        "\x49\x4E\x49\x31\x18\x00\x00\x00\x1F\x00\x00\x10\x00\x00\x0F\x01" \
-        "\x80\x92\x01\x00\x00\x00\x00\x00\x02\x00\x10\x00\x00\x20\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\xFF\xFF\x00\x00\x00\x9A\xCF\x00\xFF" \
-        "\xFF\x00\x00\x00\x92\xCF\x00\x3E\x10\x40\x82\x01\x90\x40\x00\x00" \
-        "\x01\x10\x00\x02\x20\x10\x00\x00\x08\x00\x00\x00\x00\x00\x01\x00" \
-        "\x00\x00\x02\x50\x10\x00\x00\xE8\x00\x04\x00\x01\x00\x00\x04\x24" \
-        "\x00\x20\x20\x43\x6F\x70\x79\x72\x69\x67\x68\x74\x20\x28\x43\x29" \
-        "\x20\x32\x30\x30\x34\x20\x42\x50\x20\x4D\x69\x63\x72\x6F\x73\x79" \
-        "\x73\x74\x65\x6D\x73\x2C\x20\x49\x6E\x63\x2E\x20\x20\x00\x00\x00" \
-        "\x00\xDC\x05\x02\x00\x26\x00\x43\x00\xC0\x03\x00\x00\x10\x24\x00" \
-        "\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x00\x08" \
-        "\x00\xFF\x00\xC4\x1E\x00\x00\xCC\x1E\x00\x00\xB4\x46\x00\x00\xD0" \
-        "\x1E\x00\x00\xC0\x1E\x01\x00\xB0\x1E\x01\x00\x00\x00\x30\x55\x01" \
-        "\x00\x00\x00\x00\x00\x02\x00\x80\x01\x80\x01\x01\x00\x01\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x84\x25\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x74\x46\x00" \
-        "\x00\x38\x11\x00\x00\x3C\x11\x00\x00\x40\x11\x00\x00\x44\x11\x00" \
-        "\x00\xC0\x1E\x00\x00\x07\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x96\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x02\x38\x11\x00\x00\xF6\x03\x57\x43\x01\x00\x00\x4F\x01\x00" \
-        "\x50\x55\x01\x00\x47\x45\x01\x00\x00\x00\x02\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x2E" \
-        "\x15\x00\x00\xF6\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x24\x19\x00\x00" \
-        "\xF6\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x03\x00\x02\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x00\x00\x00\x16\x00" \
-        "\x00\x00\x00\x00\x00\x00\x1A\x00\x00\x00\x00\x00\x00\x00\x1E\x00" \
-        "\x00\x00\x20\x00\x00\x00\x00\x00\x00\x00\x24\x00\x00\x00\x00\x00" \
-        "\x00\x00\x28\x00\x00\x00\x00\x00\x00\x00\x2C\x00\x00\x00\x00\x00" \
-        "\x00\x00\x30\x00\x00\x00\x00\x00\x00\x00\x34\x00\x00\x00\x00\x00" \
-        "\x00\x00\x38\x00\x00\x00\x00\x00\x00\x00\x3C\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x13\x00\x00\x00\x00\x00\x00\x00\x17\x00" \
-        "\x00\x00\x00\x00\x00\x00\x1B\x00\x00\x00\x00\x00\x00\x00\x1F\x00" \
-        "\x00\x00\x21\x00\x00\x00\x00\x00\x00\x00\x25\x00\x00\x00\x00\x00" \
-        "\x00\x00\x29\x00\x00\x00\x00\x00\x00\x00\x2D\x00\x00\x00\x00\x00" \
-        "\x00\x00\x31\x00\x00\x00\x00\x00\x00\x00\x35\x00\x00\x00\x00\x00" \
-        "\x00\x00\x39\x00\x00\x00\x00\x00\x00\x00\x3D\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x0E\x00\x00\x00\x00\x00\x00\x00\x0A\x00" \
-        "\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x02\x00" \
-        "\x00\x00\x22\x00\x00\x00\x00\x00\x00\x00\x26\x00\x00\x00\x00\x00" \
-        "\x00\x00\x2A\x00\x00\x00\x00\x00\x00\x00\x2E\x00\x00\x00\x00\x00" \
-        "\x00\x00\x32\x00\x00\x00\x00\x00\x00\x00\x36\x00\x00\x00\x00\x00" \
-        "\x00\x00\x3A\x00\x00\x00\x00\x00\x00\x00\x3E\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x0F\x00\x00\x00\x00\x00\x00\x00\x0B\x00" \
-        "\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x03\x00" \
-        "\x00\x00\x23\x00\x00\x00\x00\x00\x00\x00\x27\x00\x00\x00\x00\x00" \
-        "\x00\x00\x2B\x00\x00\x00\x00\x00\x00\x00\x2F\x00\x00\x00\x00\x00" \
-        "\x00\x00\x33\x00\x00\x00\x00\x00\x00\x00\x37\x00\x00\x00\x00\x00" \
-        "\x00\x00\x3B\x00\x00\x00\x00\x00\x00\x00\x3F\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x12\x00\x13\x00\x00\x00\x00\x00\x16\x00" \
-        "\x17\x00\x00\x00\x00\x00\x1A\x00\x1B\x00\x00\x00\x00\x00\x1E\x00" \
-        "\x1F\x00\x20\x00\x21\x00\x00\x00\x00\x00\x24\x00\x25\x00\x00\x00" \
-        "\x00\x00\x28\x00\x29\x00\x00\x00\x00\x00\x2C\x00\x2D\x00\x00\x00" \
-        "\x00\x00\x30\x00\x31\x00\x00\x00\x00\x00\x34\x00\x35\x00\x00\x00" \
-        "\x00\x00\x38\x00\x39\x00\x00\x00\x00\x00\x3C\x00\x3D\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x0E\x00\x0F\x00\x00\x00\x00\x00\x0A\x00" \
-        "\x0B\x00\x00\x00\x00\x00\x06\x00\x07\x00\x00\x00\x00\x00\x02\x00" \
-        "\x03\x00\x22\x00\x23\x00\x00\x00\x00\x00\x26\x00\x27\x00\x00\x00" \
-        "\x00\x00\x2A\x00\x2B\x00\x00\x00\x00\x00\x2E\x00\x2F\x00\x00\x00" \
-        "\x00\x00\x32\x00\x33\x00\x00\x00\x00\x00\x36\x00\x37\x00\x00\x00" \
-        "\x00\x00\x3A\x00\x3B\x00\x00\x00\x00\x00\x3E\x00\x3F\x00\x00\x00" \
-        "\x00\x00\xFF\x7B\xEF\xFD\xFF\x7F\xEF\xFD\xFF\xFB\xEF\xFD\xFF\xFF" \
-        "\xEF\xFD\xFF\x7B\xFF\xFD\xFF\x7F\xFF\xFD\xFF\xFB\xFF\xFD\xFF\xFF" \
-        "\xFF\xFD\xFF\x7B\xEF\xFF\xFF\x7F\xEF\xFF\xFF\xFB\xEF\xFF\xFF\xFF" \
-        "\xEF\xFF\xFF\x7B\xFF\xFF\xFF\x7F\xFF\xFF\xFF\xFB\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xEF\xFD\xFF\xFF\xEF\xFD\xFF\xFF\xEF\xFD\xFF\xFF" \
-        "\xEF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xFF\xFD\xFF\xFF\xFF\xFD\xFF\xFF" \
-        "\xFF\xFD\xFF\xFF\xEF\xFF\xFF\xFF\xEF\xFF\xFF\xFF\xEF\xFF\xFF\xFF" \
-        "\xEF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\x42\x50\x20\x4D\x69\x63\x02\x1A\x1D\x00\x00\x0A\x00\x72" \
-        "\x6F\x73\x79\x73\x74\x65\x6D\x73\x00\x02\xE0\x1E\x00\x00\x04\x00" \
-        "\x00\x00\x80\xBF\x02\xE4\x1E\x00\x00\x04\x00\x00\x00\x00\x00\x02" \
-        "\xF0\x1E\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\xE0\x3F\x02\x00" \
-        "\x1F\x00\x00\x08\x00\x00\x00\x00\x00\x80\x84\x7E\x41\x02\x24\x1D" \
-        "\x00\x00\x9C\x01\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00" \
-        "\x39\x00\x35\x00\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00" \
-        "\x3B\x00\x37\x00\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00" \
-        "\x1B\x00\x17\x00\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00" \
-        "\x06\x00\x0A\x00\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00" \
-        "\x26\x00\x2A\x00\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00" \
-        "\x24\x00\x28\x00\x2C\x00\x00\x01\x01\x01\x02\x01\x03\x01\x04\x01" \
-        "\x05\x01\x06\x01\x07\x01\x08\x01\x09\x01\x0A\x01\x0B\x01\x0C\x01" \
-        "\x0D\x01\x0E\x01\x0F\x01\x10\x01\x11\x01\x12\x01\x13\x01\x14\x01" \
-        "\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\x1A\x01\x1B\x01\x1C\x01" \
-        "\x1D\x01\x1E\x01\x1F\x01\x20\x01\x21\x01\x22\x01\x23\x01\x00\x00" \
-        "\x00\x00\x3C\x00\x38\x00\x34\x00\x30\x00\x3D\x00\x39\x00\x35\x00" \
-        "\x31\x00\x3E\x00\x3A\x00\x36\x00\x32\x00\x3F\x00\x3B\x00\x37\x00" \
-        "\x33\x00\x1E\x00\x1A\x00\x16\x00\x12\x00\x1F\x00\x1B\x00\x17\x00" \
-        "\x13\x00\x03\x00\x07\x00\x0B\x00\x0F\x00\x02\x00\x06\x00\x0A\x00" \
-        "\x0E\x00\x23\x00\x27\x00\x2B\x00\x2F\x00\x22\x00\x26\x00\x2A\x00" \
-        "\x2E\x00\x21\x00\x25\x00\x29\x00\x2D\x00\x20\x00\x24\x00\x28\x00" \
-        "\x2C\x00\x04\x01\x0C\x01\x14\x01\x1C\x01\x24\x01\x2C\x01\x34\x01" \
-        "\x3C\x01\x44\x01\x4C\x01\x54\x01\x5C\x01\x20\x02\x28\x02\x30\x02" \
-        "\x38\x02\x40\x02\x48\x02\xF0\x01\xF8\x01\x00\x02\x08\x02\x10\x02" \
-        "\x18\x02\x60\x01\x68\x01\x70\x01\x78\x01\x80\x01\x88\x01\x90\x01" \
-        "\x98\x01\xA0\x01\xA8\x01\xB0\x01\xB8\x01\x00\x00\x80\x00\x00\x00" \
-        "\x00\x00\x00\x00\x08\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xFE\x01\x00\xFE\x01\x00\xFE\x07\x00\xFE\xFF\x01\x00\xFE\x3F\x00" \
-        "\xFE\x3F\x00\xF8\x3F\x00\x00\x3E\xF0\xFF\xFF\xFF\xFF\x3F\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\xC0\xFF\xFF\xFF\xFF\xFF\x00" \
-        "\x02\xC0\x1E\x00\x00\x14\x00\xD0\x4A\x01\x00\xD0\x4A\x01\x00\xD0" \
-        "\x4A\x01\x00\x00\x4F\x01\x00\xD0\x4A\x01\x00\x02\x08\x1F\x00\x00" \
-        "\x58\x00\x24\x24\x24\x25\x25\x25\x25\x25\x25\x25\x25\x25\x25\x02" \
-        "\x24\x02\x02\x24\x24\x24\x24\x25\x25\x25\x25\x24\x24\x24\x25\x25" \
-        "\x25\x24\x25\x25\x24\x02\x24\x24\x24\x24\x25\x24\x24\x25\x24\x24" \
-        "\x24\x25\x25\x24\x24\x24\x25\x25\x24\x24\x24\x02\x02\x25\x25\x24" \
-        "\x25\x25\x25\x25\x25\x25\x24\x24\x02\x24\x25\x24\x25\x02\x02\x02" \
-        "\x02\x24\x24\x02\x24\x25\x25\x02\x02\x25\x02\xD4\x1E\x00\x00\x04" \
-        "\x00\xD0\x4A\x01\x00\x02\x60\x1F\x00\x00\x26\x00\x00\x00\xFF\xFF" \
-        "\x00\x40\x00\x00\x00\xC0\xFF\xFF\xAA\xAA\xFC\xFF\x54\x55\xFC\xFF" \
-        "\xAA\xAA\xFC\xFF\xAA\xAA\x55\x55\x90\x00\xF0\x00\x80\x00\x30\x00" \
-        "\xA0\x00\x02\x90\x5B\x00\x00\x04\x00\x00\x00\x00\x00\x02\xD8\x1E" \
-        "\x00\x00\x04\x00\x30\x62\x01\x00\x02\xDC\x1E\x00\x00\x04\x00\x00" \
-        "\x00\x00\x00\x02\x88\x1F\x00\x00\x0C\x00\xFF\xFF\xFF\xFF\x2C\x60" \
-        "\x01\x00\x53\x60\x01\x00\x02\x42\x10\x00\x00\x06\x00\x17\x00\x2A" \
-        "\x10\x00\x00\x02\xA0\x1F\x00\x00\x0C\x00\xFF\xFF\xFF\xFF\x9C\x63" \
-        "\x01\x00\xB0\x63\x01\x00\x02\xC8\x1F\x00\x00\x04\x00\x00\x00\x00" \
-        "\x00\x02\xC4\x1F\x00\x00\x04\x00\x00\x00\x00\x00\x02\xC0\x1F\x00" \
-        "\x00\x04\x00\x00\x00\x00\x00\x02\xBC\x1F\x00\x00\x04\x00\x00\x00" \
-        "\x00\x00\x02\xB0\x1F\x00\x00\x04\x00\x00\x00\x00\x00\x02\xAC\x1F" \
-        "\x00\x00\x04\x00\x00\x00\x00\x00\x02\xB8\x1F\x00\x00\x04\x00\x00" \
-        "\x00\x00\x00\x02\xB4\x1F\x00\x00\x04\x00\x00\x00\x00\x00\x00\xFF" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xC0\x78\x08\x00\x00\x8E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xA0\x00\x08\x00\x00\x8E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x90\x00\x08\x00\x00\x8E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xB0\x00\x08\x00\x00\x8E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\x70\x02\x08\x00\x00\x8E\x01\x00\xC0\x00\x08\x00\x00\x8E\x01\x00" \
-        "\xFA\xBA\x80\x40\xB8\x02\x00\xEF\xB8\x07\x00\x8A\xE0\x0F\xBA\xF0" \
-        "\x02\xD0\xD0\x80\xE4\x01\xBA\x1A\x40\xEF\x8A\xC4\xBA\x18\x40\xEF" \
-        "\x33\xC0\xBA\x04\x40\xEF\xBA\x06\x40\xEF\xBA\x00\x40\xEF\x83\xE0" \
-        "\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x58\x83\xC8" \
-        "\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x33\xC0\x83\xE0" \
-        "\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x58\x83\xC8" \
-        "\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\xBA\x14\x22\xB8" \
-        "\x3B\x00\xEF\xB8\x01\x00\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x33\xC0" \
-        "\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\xB8\x01\x00\xBA\x04\x40\xEF\xB8" \
-        "\x01\x00\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF" \
-        "\xB8\x01\x00\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x33\xC0\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x66\x33\xC0\x66\x8B\xD8\x66\xB9\x10\x00\x00\x00\xD1\xE3\xBA" \
-        "\x00\x40\xED\xC1\xE8\x02\x83\xE0\x01\x0B\xD8\x33\xC0\x83\xE0\x01" \
-        "\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x58\x83\xC8\x02" \
-        "\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\xE2\xD0\x33\xC0\xBA" \
-        "\x04\x40\xEF\x83\xE0\x01\x50\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B" \
-        "\x00\xEF\x58\x83\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00" \
-        "\xEF\x8B\xC3\xB9\x63\x00\x83\xF8\x10\x74\x1C\x83\xF8\x11\x74\x17" \
-        "\x83\xF8\x12\x74\x12\x83\xF8\x13\x74\x0D\x83\xF8\x14\x74\x08\x83" \
-        "\xF8\x15\x74\x03\xB9\x5B\x00\xBB\x07\x00\x8B\xC3\x83\xE0\x01\xBA" \
-        "\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\x8B\xC3\x83\xE0\x01\x83" \
-        "\xC8\x02\xBA\x1C\x40\xEF\xBA\x14\x22\xB8\x3B\x00\xEF\xD1\xEB\xE2" \
-        "\xD9\xBA\x02\x40\xB8\x01\x00\xEF\xB8\x00\x00\xEF\xBA\x00\x40\xED" \
-        "\x86\xE0\xBA\x60\x40\xEF\xB8\x00\x00\xBA\x70\x40\xEF\xB8\x01\x00" \
-        "\xBA\x18\x22\xEE\xB8\x00\x00\xBA\x18\x22\xEE\xB8\x01\x00\xBA\x0E" \
-        "\x40\xEF\xE9\x25\x00\xFF\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00" \
-        "\xFF\xFF\x00\x00\x00\x9B\xCF\x00\xFF\xFF\x00\x00\x00\x93\xCF\x00" \
-        "\x17\x00\x48\x96\x01\x00\xFA\xE9\x26\xFD\x66\xB8\x2A\x10\x00\x00" \
-        "\x66\x8B\xC8\x8B\xD8\x83\xE3\x0F\x66\xC1\xE8\x04\x8E\xD8\x66\xB8" \
-        "\x00\x00\x00\x00\x66\x89\x07\x66\x89\x47\x04\x66\xB8\xFF\xFF\x00" \
-        "\x00\x66\x89\x47\x08\x66\xB8\x00\x9B\xCF\x00\x66\x89\x47\x0C\x66" \
-        "\xB8\xFF\xFF\x00\x00\x66\x89\x47\x10\x66\xB8\x00\x93\xCF\x00\x66" \
-        "\x89\x47\x14\xB8\x17\x00\x89\x47\x18\x66\x89\x4F\x1A\x66\x0F\x01" \
-        "\x1F\x66\x0F\x01\x57\x18\xEB\x0E\x66\x2E\x0F\x01\x1E\xB8\x02\x66" \
-        "\x2E\x0F\x01\x16\xD0\x02\x0F\x20\xC0\x66\x83\xC8\x01\x0F\x22\xC0" \
-        "\xEB\x00\xB8\x01\x00\x66\xEA\xDE\x7F\x01\x00\x08\x00\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF" \
-        "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"
-
-p2611 = \
-        "\xE9\x03\x00\x00\x00\x90\x00\x00\x66\xC7\x05\x20\x24\x00\x00\x00" \
-        "\x00\x88\x05\x18\x00\x10\x40\x88\x05\x1C\x00\x10\x40\x88\x05\x30" \
-        "\x84\x10\x42\x88\x05\x34\x84\x10\x42\x88\x05\x38\x84\x00\x42\x88" \
-        "\x05\x3C\x80\x10\x42\x66\x8B\x05\x12\x24\x00\x00\x66\x89\x05\x36" \
-        "\x24\x00\x00\x66\x8B\x05\x10\x24\x00\x00\x66\x89\x05\x18\x24\x00" \
-        "\x00\x66\x8B\x05\x18\x24\x00\x00\x66\x89\x05\xD6\x5D\x09\x00\x66" \
-        "\x8B\x05\xD6\x5D\x09\x00\x66\x3D\x00\x00\x0F\x84\x72\x00\x00\x00" \
-        "\x88\x05\x20\x00\x00\x5A\x66\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F" \
-        "\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D" \
-        "\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x88" \
-        "\x05\x20\x00\x00\x52\x66\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F\x66" \
-        "\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04" \
-        "\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x66\xFF" \
-        "\x0D\x18\x24\x00\x00\x66\x8B\x05\x18\x24\x00\x00\x66\x3D\x00\x00" \
-        "\x75\x8E\x66\xC7\x05\x18\x24\x00\x00\x00\x00\x66\xC7\x05\xD6\x5D" \
-        "\x09\x00\x01\x00\x66\x8B\x05\x36\x24\x00\x00\x66\xFF\x0D\x36\x24" \
-        "\x00\x00\x66\x3D\x00\x00\x0F\x85\x53\xFF\xFF\xFF\x66\x8B\x05\x16" \
-        "\x24\x00\x00\x66\x89\x05\x36\x24\x00\x00\x66\x8B\x05\x14\x24\x00" \
-        "\x00\x66\x89\x05\x18\x24\x00\x00\x66\x8B\x05\x18\x24\x00\x00\x66" \
-        "\x89\x05\xD6\x5D\x09\x00\x66\x8B\x05\xD6\x5D\x09\x00\x66\x3D\x00" \
-        "\x00\x0F\x84\x94\x01\x00\x00\x88\x05\x20\x00\x00\x5A\x66\xB8\x40" \
-        "\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01" \
-        "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-        "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-        "\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x18\x00\xF0\x81\x66\x0B" \
-        "\x05\x1C\x00\xD0\x81\x66\x0B\x05\x30\x94\x36\xB7\x66\x0B\x05\x34" \
-        "\x8C\x15\xB3\x66\x0B\x05\x38\x84\x04\xAE\x66\x0B\x05\x3C\x80\xF3" \
-        "\xAA\x66\x8B\xF8\x88\x05\x20\x00\x00\x5A\x66\xB8\x40\x01\x66\x2D" \
-        "\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90" \
-        "\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00" \
-        "\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01\x66\x2D\x07" \
-        "\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA" \
-        "\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0" \
-        "\x76\xF7\x66\x50\x66\x8B\xC7\xFB\x66\x50\x66\x53\x66\x51\x8A\xC8" \
-        "\xFF\x15\x3C\x11\x00\x00\x66\x59\x66\x5B\xFA\x66\x58\x66\xC1\xE8" \
-        "\x08\xFB\x66\x53\x66\x51\x8A\xC8\xFF\x15\x3C\x11\x00\x00\x66\x59" \
-        "\x66\x5B\xFA\x66\x58\x88\x05\x20\x00\x00\x5A\x66\xB8\x40\x01\x66" \
-        "\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-        "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-        "\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01\x66\x2D" \
-        "\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90" \
-        "\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00" \
-        "\xC0\x76\xF7\x66\xFF\x0D\x18\x24\x00\x00\x66\x8B\x05\x18\x24\x00" \
-        "\x00\x66\x3D\x00\x00\x0F\x85\x6C\xFE\xFF\xFF\x66\xC7\x05\x18\x24" \
-        "\x00\x00\x00\x00\x66\xC7\x05\xD6\x5D\x09\x00\x01\x00\x66\x8B\x05" \
-        "\x36\x24\x00\x00\x66\xFF\x0D\x36\x24\x00\x00\x66\x3D\x00\x00\x0F" \
-        "\x85\x31\xFE\xFF\xFF\x66\xB9\x00\x00\xB2\x00\xFB\xFF\x25\x44\x11" \
-        "\x00\x00"
-
-p2699 = \
-        "\x66\xB8\x01\x00\x81\xE3\xFF\xFF\x00\x00\x66\xBB\x2E\x00\x66\xC7" \
-        "\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9\xC1\xE1\x02\x66\xC7\x81\x02" \
-        "\x00\x00\x00\xF0\xFF\x66\x03\x05\x10\x47\x00\x00\x66\x89\x05\x90" \
-        "\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80\x00\x00\x66\x89\x15\x50\x40" \
-        "\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B\x81\xCA\x00\x40\x00\x00\x66" \
-        "\x89\x15\x50\x40\x00\xC0\x89\xD9\x66\xC1\xE1\x02\x66\x89\x81\x00" \
-        "\x00\x00\x00\x66\x2B\x05\x10\x47\x00\x00\xC6\x05\x14\x22\x00\xC0" \
-        "\xBB\x81\xCB\x00\x80\x00\x00\x66\x89\x1D\x50\x40\x00\xC0\x89\xC2" \
-        "\x81\xE2\x07\x00\x00\x00\x03\xD2\x81\xCA\x01\x00\x00\x00\x89\xD9" \
-        "\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xD3\xE2" \
-        "\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03\x00\x00\x09\xCA\x88\x82\x00" \
-        "\x00\x00\x40\x88\x05\x04\x00\x90\x40\x88\x05\x08\x00\x90\x40\x88" \
-        "\x05\x0C\x00\x90\x40\x88\x05\x20\x00\x00\x52\x88\x05\x24\x00\x00" \
-        "\x52\x88\x05\x28\x00\x00\x52\x88\x05\x04\x00\xD0\x40\x88\x05\x28" \
-        "\x00\x00\x5A\x88\x05\x18\x00\xD0\x40\x88\x05\x1C\x00\xD0\x40\x88" \
-        "\x05\x30\x00\x90\x5A\x88\x05\x34\x00\xD0\x52\x88\x05\x38\x00\x00" \
-        "\x52\x88\x05\x3C\x00\x00\x52\x66\xB8\x01\x82\x81\xE3\xFF\xFF\x00" \
-        "\x00\x66\xBB\x2E\x00\x66\xC7\x05\x30\x40\x00\xC0\xF0\xFF\x89\xD9" \
-        "\xC1\xE1\x02\x66\xC7\x81\x02\x00\x00\x00\xF0\xFF\x66\x03\x05\x10" \
-        "\x47\x00\x00\x66\x89\x05\x90\x40\x00\xC0\x89\xDA\x81\xCA\x00\x80" \
-        "\x00\x00\x66\x89\x15\x50\x40\x00\xC0\xC6\x05\x14\x22\x00\xC0\x7B" \
-        "\x81\xCA\x00\x40\x00\x00\x66\x89\x15\x50\x40\x00\xC0\x89\xD9\x66" \
-        "\xC1\xE1\x02\x66\x89\x81\x00\x00\x00\x00\x66\x2B\x05\x10\x47\x00" \
-        "\x00\xC6\x05\x14\x22\x00\xC0\xBB\x81\xCB\x00\x80\x00\x00\x66\x89" \
-        "\x1D\x50\x40\x00\xC0\x89\xC2\x81\xE2\x07\x00\x00\x00\x03\xD2\x81" \
-        "\xCA\x01\x00\x00\x00\x89\xD9\x81\xE1\x03\x00\x00\x00\xD3\xE2\xD3" \
-        "\xE2\xD3\xE2\xD3\xE2\xD3\xE2\xC1\xE2\x0A\x89\xD9\x81\xE1\xFC\x03" \
-        "\x00\x00\x09\xCA\x88\x82\x00\x00\x00\x40\x66\xB8\x40\x01\x66\x2D" \
-        "\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90" \
-        "\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00" \
-        "\xC0\x76\xF7\x88\x05\x18\x00\xD0\x40\x88\x05\x1C\x00\xD0\x40\x88" \
-        "\x05\x30\xA4\xD4\x5A\x88\x05\x34\xA4\x94\x5A\x88\x05\x38\xA4\x04" \
-        "\x5A\x88\x05\x3C\x80\x94\x5A\x88\x05\x20\x00\x00\x5A\x66\xB8\x40" \
-        "\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01" \
-        "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-        "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-        "\x22\x00\xC0\x76\xF7\x88\x05\x18\x00\x10\x40\x88\x05\x1C\x00\x10" \
-        "\x40\x88\x05\x30\x84\x10\x42\x88\x05\x34\x84\x10\x42\x88\x05\x38" \
-        "\x84\x00\x42\x88\x05\x3C\x80\x10\x42\x88\x05\x20\x00\x00\x5A\x66" \
-        "\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80" \
-        "\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66" \
-        "\x39\x05\x04\x22\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8" \
-        "\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A" \
-        "\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39" \
-        "\x05\x04\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x18\x00\xF0\x81" \
-        "\x66\x0B\x05\x1C\x00\xD0\x81\x66\x0B\x05\x30\x94\x36\xB7\x66\x0B" \
-        "\x05\x34\x8C\x15\xB3\x66\x0B\x05\x38\x84\x04\xAE\x66\x0B\x05\x3C" \
-        "\x80\xF3\xAA\x66\x8B\xF8\x88\x05\x20\x00\x00\x5A\x66\xB8\x40\x01" \
-        "\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C" \
-        "\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04" \
-        "\x22\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01\x66" \
-        "\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-        "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-        "\x00\xC0\x76\xF7\xBB\x00\x00\x00\x00\xC1\xE3\x01\x53\xE9\x04\x00" \
-        "\x00\x00\x00\x00\x00\x00\x66\x89\x3D\xD2\x64\x09\x00\x66\x81\x25" \
-        "\xD2\x64\x09\x00\xFF\x00\x5B\x66\x8B\x05\xD2\x64\x09\x00\x66\x89" \
-        "\x83\x38\x24\x00\x00\x88\x05\x20\x00\x00\x5A\x66\xB8\x40\x01\x66" \
-        "\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-        "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-        "\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01\x66\x2D" \
-        "\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90" \
-        "\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00" \
-        "\xC0\x76\xF7\x66\xC7\xC6\x07\x00\x88\x05\x20\x00\x00\x5A\x66\xB8" \
-        "\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A" \
-        "\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39" \
-        "\x05\x04\x22\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40" \
-        "\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72" \
-        "\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05" \
-        "\x04\x22\x00\xC0\x76\xF7\x31\xC0\x66\x0B\x05\x18\x00\xF0\x81\x66" \
-        "\x0B\x05\x1C\x00\xD0\x81\x66\x0B\x05\x30\x94\x36\xB7\x66\x0B\x05" \
-        "\x34\x8C\x15\xB3\x66\x0B\x05\x38\x84\x04\xAE\x66\x0B\x05\x3C\x80" \
-        "\xF3\xAA\x66\x8B\xF8\x88\x05\x20\x00\x00\x5A\x66\xB8\x40\x01\x66" \
-        "\x2D\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB" \
-        "\x90\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22" \
-        "\x00\xC0\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01\x66\x2D" \
-        "\x07\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90" \
-        "\xFA\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00" \
-        "\xC0\x76\xF7\x88\x05\x20\x00\x00\x5A\x66\xB8\x40\x01\x66\x2D\x07" \
-        "\x00\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA" \
-        "\x66\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0" \
-        "\x76\xF7\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01\x66\x2D\x07\x00" \
-        "\x72\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66" \
-        "\x39\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76" \
-        "\xF7\x66\xFF\xCE\x66\x8B\xC6\x66\x3D\x00\x00\x0F\x85\xA7\xFE\xFF" \
-        "\xFF\x88\x05\x20\x00\x00\x5A\x66\xB8\x40\x01\x66\x2D\x07\x00\x72" \
-        "\x1F\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39" \
-        "\x0D\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7" \
-        "\x88\x05\x20\x00\x00\x52\x66\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F" \
-        "\x66\x8B\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D" \
-        "\x04\x22\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x31" \
-        "\xC0\x66\x0B\x05\x18\x00\xF0\x81\x66\x0B\x05\x1C\x00\xD0\x81\x66" \
-        "\x0B\x05\x30\x94\x36\xB7\x66\x0B\x05\x34\x8C\x15\xB3\x66\x0B\x05" \
-        "\x38\x84\x04\xAE\x66\x0B\x05\x3C\x80\xF3\xAA\x66\x8B\xF8\x88\x05" \
-        "\x20\x00\x00\x5A\x66\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B" \
-        "\xC8\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22" \
-        "\x00\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\x88\x05\x20" \
-        "\x00\x00\x52\x66\xB8\x40\x01\x66\x2D\x07\x00\x72\x1F\x66\x8B\xC8" \
-        "\x66\x81\xE9\x80\x7A\x72\x0C\xFB\x90\xFA\x66\x39\x0D\x04\x22\x00" \
-        "\xC0\x72\xF4\x66\x39\x05\x04\x22\x00\xC0\x76\xF7\xBB\x00\x00\x00" \
-        "\x00\xC1\xE3\x01\x53\xE9\x04\x00\x00\x00\x00\x00\x00\x00\x66\x89" \
-        "\x3D\xAA\x67\x09\x00\x66\xC1\x25\xAA\x67\x09\x00\x08\x5B\x66\x8B" \
-        "\x05\xAA\x67\x09\x00\x66\x09\x83\x38\x24\x00\x00\x66\xB9\x00\x00" \
-        "\xB2\x02\xFB\xFF\x25\x44\x11\x00\x00\x66\xB9\x00\x00\xB2\x02\xFB" \
-        "\xFF\x25\x44\x11\x00\x00"
-
-p1141 = \
-        "\x44\x20\xF0\x80\x45\xE5\x30\x24\xFE\xB5\x34\x07\x90\xE6\x78\xE0" \
-        "\x44\x20\xF0\xE5\x30\x14\xB5\x34\x0A\x90\xE6\x78\xE0\x44\x40\xF0" \
-        "\x75\x35\x00\x90\xE6\x79\xE0\xAB\x31\xAA\x32\xA9\x33\xAE\x34\x8E" \
-        "\x82\x75\x83\x00\x12\x05\x8B\x05\x34\x80\x0F\x90\xE6\x78\xE0\x44" \
-        "\x40\xF0\x75\x35\x00\x80\x03\x75\x35\x00\x53\x91\xDF\xD0\x07\xD0" \
-        "\x06\xD0\x03\xD0\x02\xD0\x01\xD0\x00\xD0\xD0\xD0\x86\xD0\x84\xD0" \
-        "\x85\xD0\x82\xD0\x83\xD0\xE0\x32\x01\x20\x00\x50\x1C\x97\xC0\xF9" \
-        "\xA4\xB0\x99\x92\x82\xF8\x80\x98\x88\x83\xC6\xA1\x86\x8E\x50\x1C" \
-        "\x87\x30\x31\x32\x33\x34\x35\x36\x37\x38\x39\x41\x42\x43\x44\x45" \
-        "\x46\x60\x80\x1C\x00\x01\x11\x01\x1F\x01\x01\x01\x07\x01\x01\x02" \
-        "\x01\x00\x00\x00\x00\xFF\xFE\xFE\xFF\xFF\xFF\xFF\xFF\x40\x40\x12" \
-        "\x40\x00\x2D\x12\x3F\x01\x01\x1A\x1C\x3F\x01\x01\x07\x01\x02\x03" \
-        "\x03\x05\x00\x00\x00\xFF\xFD\xFC\xFD\xFD\xFF\xFF\xFF\x41\x09\x40" \
-        "\x40\x40\x2D\x36\x3F\x01\x11\x01\x1F\x01\x01\x01\x07\x01\x01\x02" \
-        "\x01\x00\x00\x10\x00\xFF\xFE\xFE\xFF\xFF\xFF\xFF\xFF\x40\x40\x12" \
-        "\x40\x00\x2D\x12\x3F\x01\x01\x1A\x1F\x01\x01\x01\x07\x01\x02\x03" \
-        "\x03\x00\x00\x00\x00\xFF\xFD\xF9\xFD\xFF\xFF\xFF\xFF\x40\x09\x40" \
-        "\x40\x40\x2D\x36\x3F\x47\x1C\x80\x80\x00\x00\xFF\x06\xE4\x31\x01" \
-        "\x41\x00\x01\x3E\x51\x02\x3F\x1F\xC0\x47\x1C\xAF\x42\x50\x4D\x32" \
-        "\x6B\x36\x00\x00\xBB\x01\x06\x89\x82\x8A\x83\xE0\x22\x50\x02\xE7" \
-        "\x22\xBB\xFE\x02\xE3\x22\x89\x82\x8A\x83\xE4\x93\x22\xBB\x01\x0C" \
-        "\xE5\x82\x29\xF5\x82\xE5\x83\x3A\xF5\x83\xE0\x22\x50\x06\xE9\x25" \
-        "\x82\xF8\xE6\x22\xBB\xFE\x06\xE9\x25\x82\xF8\xE2\x22\xE5\x82\x29" \
-        "\xF5\x82\xE5\x83\x3A\xF5\x83\xE4\x93\x22\xBB\x01\x06\x89\x82\x8A" \
-        "\x83\xF0\x22\x50\x02\xF7\x22\xBB\xFE\x01\xF3\x22\xF8\xBB\x01\x0D" \
-        "\xE5\x82\x29\xF5\x82\xE5\x83\x3A\xF5\x83\xE8\xF0\x22\x50\x06\xE9" \
-        "\x25\x82\xC8\xF6\x22\xBB\xFE\x05\xE9\x25\x82\xC8\xF2\x22\xD0\x83" \
-        "\xD0\x82\xF8\xE4\x93\x70\x12\x74\x01\x93\x70\x0D\xA3\xA3\x93\xF8" \
-        "\x74\x01\x93\xF5\x82\x88\x83\xE4\x73\x74\x02\x93\x68\x60\xEF\xA3" \
-        "\xA3\xA3\x80\xDF\x8A\x83\x89\x82\xE4\x73\xC0\xE0\xC0\x83\xC0\x82" \
-        "\x85\x2A\x26\x85\x2B\x27\x12\x00\x1D\x85\x22\x28\x85\x23\x29\x12" \
-        "\x00\x28\x12\x00\x16\x74\x10\xF0\xD0\x82\xD0\x83\xD0\xE0\x32\xD3" \
-        "\x22\x02\x0D\x67\x00\x02\x0E\xE9\x00\x02\x0E\xD6\x00\x02\x0E\x83" \
-        "\x00\x02\x05\xD9\x00\x02\x0B\xE8\x00\x02\x00\x12\x00\x02\x00\x52" \
-        "\x00\x02\x00\x7F\x00\x02\x0F\xC2\x00\x02\x0F\xC3\x00\x02\x0F\xC4" \
-        "\x00\x02\x0F\xC5\x00\x02\x0F\xC6\x00\x02\x0F\xC7\x00\x02\x0F\xC8" \
-        "\x00\x02\x00\x56\x00\x02\x00\x52\x00\x02\x0F\xC9\x00\x02\x0F\xCA" \
-        "\x00\x02\x0F\xCB\x00\x02\x0F\xCC\x00\x02\x0F\xCD\x00\x02\x0F\xCE" \
-        "\x00\x02\x0F\xCF\x00\x02\x00\x52\x00\x02\x00\x52\x00\x02\x00\x52" \
-        "\x00\x02\x0F\xD0\x00\x02\x0F\xD1\x00\x02\x0F\xD2\x00\x02\x0F\xD3" \
-        "\x00\x02\x0F\xD4\x00\x02\x0F\xD5\x00\x02\x0F\xD6\x00\x02\x0F\xD7" \
-        "\x00\x02\x0F\xD8\x00\x02\x0F\xD9\x00\x02\x0F\xDA\x00\x02\x0F\xDB" \
-        "\x00\x02\x0F\xDC\x00\x02\x0F\xDD\x00\x02\x0F\xDE\x00\x02\x0F\xDF" \
-        "\x00\x02\x0F\xE0\x00\x02\x0F\xE1\x00\xE4\xF5\x14\xF5\x15\xE5\x37" \
-        "\x24\xFD\xF5\x17\xE5\x36\x34\xFF\xF5\x16\x75\x18\x00\x75\x19\x80" \
-        "\x7A\xF8\x79\x00\x7E\xF8\x7F\x00\x74\xF8\xF5\x9A\x74\x00\xF5\x9B" \
-        "\x12\x0D\xBB\x90\xE6\x7B\xEF\xF0\x20\x80\x31\x90\xE6\xF4\xE0\x20" \
-        "\xE0\x2A\x30\x82\x06\xE5\x15\x45\x14\x70\x21\x90\xE6\xF1\xE0\xF5" \
-        "\x1A\x75\x18\x00\x75\x19\x80\x05\x15\xE5\x15\x70\x02\x05\x14\xE5" \
-        "\xBB\x30\xE7\xFB\x90\xE6\xF2\xE0\x90\xE6\x7B\xF0\xE5\x19\x15\x19" \
-        "\xAE\x18\x70\x02\x15\x18\x4E\x60\x0B\xC3\xE5\x15\x95\x17\xE5\x14" \
-        "\x95\x16\x40\xB4\xE5\x15\x90\xE6\x7B\xF0\xE5\x14\xF0\xE5\x15\x24" \
-        "\x03\xF5\x1C\xE4\x35\x14\xF5\x1B\x90\xE6\x98\xF0\xE5\x1C\x90\xE6" \
-        "\x99\xF0\x22\x78\x7F\xE4\xF6\xD8\xFD\x75\x81\x41\x02\x07\x99\x02" \
-        "\x09\x49\xE4\x93\xA3\xF8\xE4\x93\xA3\x40\x03\xF6\x80\x01\xF2\x08" \
-        "\xDF\xF4\x80\x29\xE4\x93\xA3\xF8\x54\x07\x24\x0C\xC8\xC3\x33\xC4" \
-        "\x54\x0F\x44\x20\xC8\x83\x40\x04\xF4\x56\x80\x01\x46\xF6\xDF\xE4" \
-        "\x80\x0B\x01\x02\x04\x08\x10\x20\x40\x80\x90\x04\x67\xE4\x7E\x01" \
-        "\x93\x60\xBC\xA3\xFF\x54\x3F\x30\xE5\x09\x54\x1F\xFE\xE4\x93\xA3" \
-        "\x60\x01\x0E\xCF\x54\xC0\x25\xE0\x60\xA8\x40\xB8\xE4\x93\xA3\xFA" \
-        "\xE4\x93\xA3\xF8\xE4\x93\xA3\xC8\xC5\x82\xC8\xCA\xC5\x83\xCA\xF0" \
-        "\xA3\xC8\xC5\x82\xC8\xCA\xC5\x83\xCA\xDF\xE9\xDE\xE7\x80\xBE\x90" \
-        "\xE6\x01\x74\xCE\xF0\x90\xE6\xF5\x74\xFF\xF0\x90\x1C\x80\xE0\x90" \
-        "\xE6\xF3\xF0\x90\x1C\x81\xE0\x90\xE6\xC3\xF0\x90\x1C\x82\xE0"
-
-p1143 = \
-        "\x90\xE6\xC1\xF0\x90\x1C\x83\xE0\x90\xE6\xC2\xF0\x90\x1C\x85\xE0" \
-        "\x90\xE6\xC0\xF0\x90\x1C\x86\xE0\x90\xE6\xF4\xF0\x75\xAF\x07\x74" \
-        "\x1C\xF5\x9A\x74\x00\xF5\x9B\x75\x9D\xE4\xE4\xF5\x9E\xFF\x90\xE6" \
-        "\x7B\xE0\x90\xE6\x7C\xF0\x0F\xBF\x80\xF4\xE4\x90\xE6\x71\xF0\xF5" \
-        "\xB4\x90\xE6\x72\xE0\x54\x7F\xF0\x53\xB6\x7F\x00\x00\x00\xE4\x90" \
-        "\xE6\xC4\xF0\x00\x00\x00\x90\xE6\xC5\xF0\x22\x90\xE6\x00\x74\x10" \
-        "\xF0\xE4\xF5\xB2\x90\xE6\x70\xF0\x75\x80\xFF\x75\xB2\x30\x00\x00" \
-        "\x00\x90\xE6\x12\x74\xA2\xF0\x00\x00\x00\xE4\x90\xE6\x18\xF0\x00" \
-        "\x00\x00\x90\xE6\xD2\x04\xF0\x00\x00\x00\xE4\x90\xE6\x20\xF0\x00" \
-        "\x00\x00\x90\xE6\x21\xF0\x00\x00\x00\x90\xE6\x14\x74\xE2\xF0\x90" \
-        "\xE6\x80\xE0\x30\xE7\x06\x7E\x02\x7F\x00\x80\x04\x7E\x00\x7F\x40" \
-        "\x8E\x36\x8F\x37\x00\x00\x00\xE4\x90\xE6\x1A\xF0\x00\x00\x00\x90" \
-        "\xE6\xE2\xF0\x00\x00\x00\xE5\x36\x90\xE6\x24\xF0\x00\x00\x00\xEF" \
-        "\x90\xE6\x25\xF0\x22\x8B\x0E\x8A\x0F\x89\x10\x75\x11\x01\x75\x12" \
-        "\x2C\xE4\xF5\x13\x74\xFF\x12\x05\x79\x12\x0F\x65\x7F\xFF\x12\x0C" \
-        "\x65\xEF\x60\x03\x7F\x01\x22\xC2\x85\x7F\x0A\x7E\x00\x12\x0E\x56" \
-        "\xD2\x85\x7F\x3C\x7E\x00\x12\x0E\x56\x12\x09\xA9\x8F\x13\xE5\x13" \
-        "\xB4\xFF\x03\x7F\x03\x22\x20\x81\x13\x12\x0F\x44\xE5\x12\x15\x12" \
-        "\x70\x02\x15\x11\x14\x45\x11\x70\xED\x7F\x04\x22\x00\x00\x00\xE5" \
-        "\xAA\x20\xE0\x03\x7F\x05\x22\xD2\x0E\xC2\x0D\xC2\x0C\xAB\x0E\xAA" \
-        "\x0F\xA9\x10\xE5\x13\x12\x05\x79\x7F\x00\x22\xE4\xF5\x0B\xF5\x0A" \
-        "\xF5\x09\xF5\x08\xC2\x0B\xC2\x08\xD2\x0A\xC2\x09\x12\x0D\x0A\x75" \
-        "\x24\x00\x75\x25\x80\x75\x2C\x00\x75\x2D\x92\x75\x22\x00\x75\x23" \
-        "\x9C\x75\x2A\x00\x75\x2B\xCA\x75\x2E\x00\x75\x2F\xF8\xD2\xE8\x43" \
-        "\xD8\x20\x90\xE6\x68\xE0\x44\x0B\xF0\x90\xE6\x5C\xE0\x44\x3D\xF0" \
-        "\xD2\xEA\xD2\xAF\x90\xE6\x80\xE0\x54\xF7\xF0\x53\x8E\xF8\x30\x09" \
-        "\x05\x12\x01\x4C\xC2\x09\x12\x0F\x7E\x80\xF3\x75\x14\x01\x75\x15" \
-        "\x2C\x12\x0E\xAD\x8E\x16\x8F\x17\xE4\xF5\x18\x80\x25\x30\x80\x29" \
-        "\x12\x0F\x44\xE5\x15\x15\x15\x70\x02\x15\x14\x14\x45\x14\x70\x05" \
-        "\x7E\xFF\x7F\xFF\x22\xAF\x18\x05\x18\xEF\xD3\x94\x40\x40\x03\xE4" \
-        "\xF5\x18\xAF\x18\x12\x0C\x65\x80\xD4\xE5\x17\xF4\x70\x03\xE5\x16" \
-        "\xF4\x60\x05\xAE\x16\xAF\x17\x22\xAF\x18\x7E\x00\x22\x8E\x19\x8F" \
-        "\x1A\x8D\x1B\x8A\x1C\x8B\x1D\xE4\xFD\xE5\x19\xFF\x7E\x00\x0D\xEE" \
-        "\x24\xAD\xF5\x82\xE4\x34\x1C\xF5\x83\xEF\xF0\x0E\x0D\x74\xAD\x2E" \
-        "\xF5\x82\xE4\x34\x1C\xF5\x83\xE5\x1A\xF0\x7A\x1C\x7B\xAD\xAF\x3E" \
-        "\x12\x0D\x9F\xAB\x1D\xAA\x1C\xAD\x1B\xAF\x3E\x02\x0D\x83\x7A\x1C" \
-        "\x7B\xA7\x7D\x06\xAF\x40\xAE\x3F\x12\x09\xFB\xE4\xFE\xFF\x74\xAF" \
-        "\x2F\xF5\x82\xE4\x34\x1C\xF5\x83\xE0\xFD\x74\xA7\x2F\xF5\x82\xE4" \
-        "\x34\x1C\xF5\x83\xE0\x6D\x60\x04\xE4\xFE\xFF\x22\x0F\xBF\x00\x01" \
-        "\x0E\xEF\x64\x06\x4E\x70\xD7\x7E\x00\x7F\x01\x22\x85\x3F\x0C\x85" \
-        "\x40\x0D\x7A\x1C\x7B\xAF\x7D\x06\xAF\x0D\xAE\x0C\x12\x0A\xE9\xE5" \
-        "\x40\x24\x06\xF5\x0D\xE4\x35\x3F\xF5\x0C\xC3\xE5\x0C\x94\x20\x50" \
-        "\x13\x7D\xFF\xAF\x0D\xAE\x0C\x12\x0B\x52\x05\x0D\xE5\x0D\x70\xEA" \
-        "\x05\x0C\x80\xE6\x22\x90\xE6\x78\xE0\x20\xE6\xF9\xC2\xE9\x90\xE6" \
-        "\x78\xE0\x44\x80\xF0\xEF\x25\xE0\x90\xE6\x79\xF0\x90\xE6\x78\xE0" \
-        "\x30\xE0\xF9\x90\xE6\x78\xE0\x44\x40\xF0\x90\xE6\x78\xE0\x20\xE6" \
-        "\xF9\x90\xE6\x78\xE0\x30\xE1\xD6\xD2\xE9\x22\x8E\x0E\x8F\x0F\x8D" \
-        "\x10\x8A\x11\x8B\x12\xE4\xF5\x13\xE5\x13\xC3\x95\x10\x50\x20\x05" \
-        "\x0F\xE5\x0F\xAE\x0E\x70\x02\x05\x0E\x14\xFF\xE5\x12\x25\x13\xF5" \
-        "\x82\xE4\x35\x11\xF5\x83\xE0\xFD\x12\x0B\x52\x05\x13\x80\xD9\x22" \
-        "\xA9\x07\x90\xE6\x78\xE0\x20\xE6\xF9\xE5\x35\x70\x25\x90\xE6\x78" \
-        "\xE0\x44\x80\xF0\xE9\x25\xE0\x44\x01\x90\xE6\x79\xF0\x8D\x30\xAF" \
-        "\x03\xA9\x07\x75\x31\x01\x8A\x32\x89\x33\xE4\xF5\x34\x75\x35\x03" \
-        "\xD3\x22\xC3\x22\xAA\x06\xAC\x05\xE4\xFD\x7E\x00\x0D\xEE\x24\xA7" \
-        "\x12\x0F\x21\xEA\xF0\x0E\x0D\x74\xA7\x2E\x12\x0F\x21\xEF\xF0\x0D" \
-        "\x74\xA7\x24\x02\x12\x0F\x21\xEC\xF0\x7A\x1C\x7B\xA7\xAF\x3E\x12" \
-        "\x0D\x9F\xAF\x3E\x02\x0A\xB3\xA9\x07\x90\xE6\x78\xE0\x20\xE6\xF9" \
-        "\xE5\x35\x70\x23\x90\xE6\x78\xE0\x44\x80\xF0\xE9\x25\xE0\x90\xE6" \
-        "\x79\xF0\x8D\x30\xAF\x03\xA9\x07\x75\x31\x01\x8A\x32\x89\x33\xE4" \
-        "\xF5\x34\x75\x35\x01\xD3\x22\xC3\x22\xEC\x4E\xFE\xED\x4F\x24\x74" \
-        "\xF5\x82\x74\x0F\x3E\xF5\x83\xE4\x93\xFF\x33\x95\xE0\xFE\xEF\x24" \
-        "\xA1\xFF\xEE\x34\xE6\x8F\x82\xF5\x83\x22\x90\xE6\xBC\xE0\x54\x7E" \
-        "\xFF\x7E\x00\xE0\xD3\x94\x80\x7C\x00\x22\xC0\xE0\xC0\x83\xC0\x82" \
-        "\x90\xE6\x80\xE0\x30\xE7\x12\x85\x22\x26\x85\x23\x27\x12\x00"
-
-p1145 = \
-        "\x1D\x85\x2A\x28\x85\x2B\x29\x12\x00\x28\x12\x00\x16\x74\x20\xF0" \
-        "\xD0\x82\xD0\x83\xD0\xE0\x32\xA9\x07\xAE\x2E\xAF\x2F\x8F\x82\x8E" \
-        "\x83\xA3\xE0\x64\x03\x70\x17\xAD\x01\x19\xED\x70\x01\x22\x8F\x82" \
-        "\x8E\x83\xE0\x7C\x00\x2F\xFD\xEC\x3E\xFE\xAF\x05\x80\xDF\x7E\x00" \
-        "\x7F\x00\x22\x8B\x3B\x8A\x3C\x89\x3D\xAB\x3B\xAA\x3C\xA9\x3D\x12" \
-        "\x05\x33\x60\x13\x05\x3D\xE5\x3D\x70\x02\x05\x3C\x14\xF9\x12\x05" \
-        "\x33\xFF\x12\x00\x46\x80\xE2\x22\x8F\x19\x7F\x32\x7E\x00\x12\x0D" \
-        "\x29\x40\x03\x7F\x01\x22\x90\xE6\xF1\xE5\x19\xF0\x7F\x32\x7E\x00" \
-        "\x12\x0D\x29\x40\x03\x7F\x02\x22\x7F\x00\x22\x30\x0C\x0E\x90\xE6" \
-        "\xF1\xE0\xF5\x0E\xE5\xBB\x30\xE7\xFB\xC2\x0C\x22\xE5\x36\x90\xE6" \
-        "\xD0\xF0\xE5\x37\x90\xE6\xD1\xF0\x75\xBB\x06\xD2\x0C\x22\xE5\xBB" \
-        "\x54\x84\x60\x03\x7F\x00\x22\x30\x82\x03\x7F\x00\x22\x90\xE6\xF4" \
-        "\xE0\x20\xE1\x03\x7F\x00\x22\xD2\x0D\x12\x0F\x88\x7F\x01\x22\x00" \
-        "\x00\x00\x90\xE6\x04\x74\x80\xF0\x74\x02\xF0\xE4\xF0\x00\x00\x00" \
-        "\x00\x00\x00\x90\xE6\x49\x74\x82\xF0\x00\x00\x00\xF0\x22\x00\x00" \
-        "\x00\x90\xE6\x04\x74\x80\xF0\x74\x06\xF0\xE4\xF0\x00\x00\x00\x00" \
-        "\x00\x00\x90\xE6\x48\x74\x86\xF0\x00\x00\x00\xF0\x22\x12\x08\x59" \
-        "\x12\x07\xDE\x00\x00\x00\x90\xE6\x0B\x74\x03\xF0\x12\x0C\xCC\xC2" \
-        "\x0E\x12\x0F\xA1\x12\x00\x36\xE4\xFF\x02\x0F\xE2\x8E\x1A\x8F\x1B" \
-        "\xE5\xBB\x20\xE7\x14\xE5\x1B\x15\x1B\x70\x02\x15\x1A\x14\x45\x1A" \
-        "\x70\x02\xC3\x22\x12\x0F\x44\x80\xE7\xD3\x22\xE5\xAA\x20\xE5\x19" \
-        "\x12\x00\x06\xEF\x70\x13\x12\x0E\x25\xEF\x60\x0D\x12\x0C\xAB\xEF" \
-        "\x70\x07\xAA\x39\xA9\x3A\x12\x05\xD3\x22\xC0\xE0\xC0\x83\xC0\x82" \
-        "\x90\xE6\xB5\xE0\x44\x01\xF0\xD2\x09\x12\x00\x16\x74\x01\xF0\xD0" \
-        "\x82\xD0\x83\xD0\xE0\x32\x12\x0B\x1E\xE5\x35\x24\xFA\x60\x0E\x14" \
-        "\x60\x06\x24\x07\x70\xF3\xD3\x22\xE4\xF5\x35\xD3\x22\xE4\xF5\x35" \
-        "\xD3\x22\x12\x0B\x85\xE5\x35\x24\xFA\x60\x0E\x14\x60\x06\x24\x07" \
-        "\x70\xF3\xD3\x22\xE4\xF5\x35\xD3\x22\xE4\xF5\x35\xD3\x22\x90\xE6" \
-        "\xF4\xE0\xA2\xE1\x92\x05\xA2\x80\x92\x06\xA2\x81\x92\x03\xA2\x82" \
-        "\x92\x04\xA2\x0D\x92\x02\xAF\x20\x22\x8E\x0E\x8F\x0F\x12\x0F\x29" \
-        "\xE5\x0E\xFD\x12\x0B\x52\xE5\x40\x24\x07\xFF\xE4\x35\x3F\xFE\xAD" \
-        "\x0F\x02\x0B\x52\x90\xE6\x90\xE0\x90\xE6\xD0\xF0\x90\xE6\x91\xE0" \
-        "\x90\xE6\xD1\xF0\x90\xE6\x49\x74\x02\xF0\xE4\xF5\xBB\x22\xC2\x9F" \
-        "\xD2\x9E\xD2\x9D\xD2\x9C\x53\x87\x7F\x90\xE6\x08\x74\x03\xF0\xC2" \
-        "\x99\xC2\xC1\xC2\x98\xC2\xC0\x22\xE5\xBB\x54\x84\x64\x04\x60\x0E" \
-        "\x20\x80\x0B\x90\xE6\xF4\xE0\x20\xE0\x04\x7F\x01\x80\x02\x7F\x00" \
-        "\x22\x12\x0D\xBB\x90\xF8\x00\xEF\xF0\xE4\xA3\xF0\xA3\xF0\x90\xE6" \
-        "\x98\xF0\x90\xE6\x99\x74\x03\xF0\x22\x8E\x14\x8F\x15\xE5\x15\x15" \
-        "\x15\xAE\x14\x70\x02\x15\x14\x4E\x60\x05\x12\x0F\x44\x80\xEE\x22" \
-        "\x12\x0F\xA9\x40\x10\x12\x0F\x0F\x40\x0B\xE5\xBB\x30\xE7\x06\x20" \
-        "\x0C\x03\x12\x0D\xF1\x22\xC0\xE0\xC0\x83\xC0\x82\xD2\x0B\x12\x00" \
-        "\x16\x74\x08\xF0\xD0\x82\xD0\x83\xD0\xE0\x32\x90\xE6\xF1\xE0\xF5" \
-        "\x41\xE5\xBB\x30\xE7\xFB\x90\xE6\xF2\xE0\x8F\x82\x8E\x83\xF0\x22" \
-        "\x12\x0F\x29\x7A\x1C\x7B\xA7\x7D\x02\x12\x09\xFB\x90\x1C\xA7\xE0" \
-        "\xFE\xA3\xE0\xFF\x22\x7F\x10\x7E\x27\xEF\x1F\xAC\x06\x70\x01\x1E" \
-        "\x4C\x60\x03\x30\x99\xF3\xC2\x99\x22\xC0\xE0\xC0\x83\xC0\x82\x12" \
-        "\x00\x16\x74\x04\xF0\xD0\x82\xD0\x83\xD0\xE0\x32\xC0\xE0\xC0\x83" \
-        "\xC0\x82\x12\x00\x16\x74\x02\xF0\xD0\x82\xD0\x83\xD0\xE0\x32\x90" \
-        "\xE6\x1A\xE0\x44\x08\xF0\xC2\x0C\x75\x38\xFF\x75\x39\x0C\x75\x3A" \
-        "\x88\x22\x30\x81\x03\x30\x0D\x0A\x7F\x04\x12\x0F\xE2\x12\x0C\xCC" \
-        "\xD3\x22\xC3\x22\xF5\x82\xE4\x34\x1C\xF5\x83\x22\xE5\x40\x24\x06" \
-        "\xFF\xE4\x35\x3F\xFE\x22\x90\xE6\x1A\xE0\x54\xF7\xF0\x75\x38\xFF" \
-        "\x75\x39\x06\x75\x3A\xB8\x22\x74\x00\xF5\x86\x90\xFD\xA5\x7C\x05" \
-        "\xA3\xE5\x82\x45\x83\x70\xF9\x22\x90\xE7\x40\xF0\xE4\x90\xE6\x8A" \
-        "\xF0\x90\xE6\x8B\x04\xF0\xD3\x22\x12\x0C\xCC\x12\x0C\xEB\x90\xE6" \
-        "\xF5\x74\xFF\xF0\x02\x0F\x33\x00\x01\x02\x02\x03\x03\x04\x04\x05" \
-        "\x05\x30\x0E\x06\x12\x0E\x6D\x12\x0D\x48\x22\x90\xE6\xF5\x74\xFF" \
-        "\xF0\x02\x0E\x3E\x90\xE6\xBA\xE0\xF5\x1F\xD3\x22\x90\xE6\xBA\xE0" \
-        "\xF5\x1E\xD3\x22\xE4\xF5\x35\xD2\xE9\xD2\xAF\x22\x00\x00\x00\xE5" \
-        "\xAA\x13\x22\xE5\x1F\x12\x0F\x55\x22\xE5\x1E\x12\x0F\x55\x22\xD3" \
-        "\x22\xD3\x22\xD3\x22\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32" \
-        "\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32" \
-        "\x32\x32\x32\x32\x32\x22\x32\x32"
-
-p1139 = \
-        "\x02\x07\x52\x02\x0F\xE3\x20\x81\x06\x12\x0F\x88\x7F\x01\x22\x7F" \
-        "\x00\x22\x32\x02\x0F\xE4\x53\x91\xEF\x90\xE6\x5D\x22\x85\x27\x82" \
-        "\x85\x26\x83\xA3\x74\x02\xF0\x22\x85\x29\x82\x85\x28\x83\xA3\x74" \
-        "\x07\xF0\x22\x02\x00\x4E\x12\x0A\x3C\xEF\x4E\x70\x03\x12\x0A\x7A" \
-        "\x22\xD3\x22\x02\x06\x00\x8F\x99\x02\x0E\xC2\x02\x03\x5F\x53\xD8" \
-        "\xEF\x32\x32\x02\x06\x00\xC0\xE0\xC0\x83\xC0\x82\x90\xE6\x58\xE4" \
-        "\xF0\x53\x91\xEF\x90\xE6\x5B\xE0\x44\x01\xF0\x90\xE6\x59\x74\x10" \
-        "\xF0\x90\xE6\x58\xE0\x44\x10\xF0\xD0\x82\xD0\x83\xD0\xE0\x32\x32" \
-        "\x12\x01\x00\x02\xFF\xFF\xFF\x40\xB9\x14\x01\x00\x00\x00\x01\x02" \
-        "\x00\x01\x0A\x06\x00\x02\xFF\xFF\xFF\x40\x01\x00\x09\x02\x2E\x00" \
-        "\x01\x01\x00\xC0\x00\x09\x04\x00\x00\x04\xFF\xFF\xFF\x00\x07\x05" \
-        "\x02\x02\x00\x02\x00\x07\x05\x04\x02\x00\x02\x00\x07\x05\x86\x02" \
-        "\x00\x02\x00\x07\x05\x88\x03\x40\x00\x05\x09\x02\x2E\x00\x01\x01" \
-        "\x00\xC0\x00\x09\x04\x00\x00\x04\xFF\xFF\xFF\x00\x07\x05\x02\x02" \
-        "\x40\x00\x00\x07\x05\x04\x02\x40\x00\x00\x07\x05\x86\x02\x40\x00" \
-        "\x00\x07\x05\x88\x03\x40\x00\x05\x04\x03\x09\x04\x20\x03\x42\x00" \
-        "\x50\x00\x20\x00\x4D\x00\x69\x00\x63\x00\x72\x00\x6F\x00\x73\x00" \
-        "\x79\x00\x73\x00\x74\x00\x65\x00\x6D\x00\x73\x00\x20\x03\x50\x00" \
-        "\x72\x00\x6F\x00\x67\x00\x72\x00\x61\x00\x6D\x00\x6D\x00\x65\x00" \
-        "\x72\x00\x20\x00\x53\x00\x69\x00\x74\x00\x65\x00\x0E\x03\x42\x00" \
-        "\x57\x00\x32\x00\x30\x00\x30\x00\x34\x00\x00\x00\x90\xE6\xB9\xE0" \
-        "\x12\x05\xAD\x02\x06\x00\x02\x58\x01\x02\xB4\x03\x01\x7B\x06\x02" \
-        "\x00\x08\x01\xFA\x09\x01\xEE\x0A\x01\xF4\x0B\x02\xE9\xB0\x03\x11" \
-        "\xB1\x03\x29\xB2\x03\x2E\xB3\x00\x00\x03\x46\x12\x00\x41\x40\x03" \
-        "\x02\x03\x57\x90\xE6\xBB\xE0\x24\xFE\x60\x28\x14\x60\x3F\x24\xFD" \
-        "\x60\x14\x14\x60\x2B\x24\x06\x70\x52\xE5\x24\x90\xE6\xB3\xF0\xE5" \
-        "\x25\xA3\xF0\x02\x03\x57\xE5\x2C\x90\xE6\xB3\xF0\xE5\x2D\xA3\xF0" \
-        "\x02\x03\x57\xE5\x26\x90\xE6\xB3\xF0\xE5\x27\xA3\xF0\x02\x03\x57" \
-        "\xE5\x28\x90\xE6\xB3\xF0\xE5\x29\xA3\xF0\x02\x03\x57\x90\xE6\xBA" \
-        "\xE0\xFF\x12\x0C\x14\xAA\x06\xA9\x07\xEA\x49\x60\x0E\xEE\x90\xE6" \
-        "\xB3\xF0\xEF\xA3\xF0\x02\x03\x57\x02\x03\x50\x02\x03\x50\x12\x0F" \
-        "\xB6\x02\x03\x57\x12\x0F\x99\x02\x03\x57\x12\x0F\x91\x02\x03\x57" \
-        "\x12\x0F\xB0\x02\x03\x57\x12\x05\xFE\x40\x03\x02\x03\x57\x90\xE6" \
-        "\xB8\xE0\x24\x7F\x60\x15\x14\x60\x19\x24\x02\x70\x38\xA2\x08\xE4" \
-        "\x33\x25\xE0\xFF\xA2\x0A\xE4\x33\x4F\x80\x18\xE4\x90\xE7\x40\xF0" \
-        "\x80\x16\x12\x0B\xD8\x40\x04\x7D\x01\x80\x02\x7D\x00\x12\x0B\xB7" \
-        "\xE0\x54\x01\x90\xE7\x40\xF0\xE4\xA3\xF0\x90\xE6\x8A\xF0\xA3\x74" \
-        "\x02\xF0\x02\x03\x57\x02\x03\x50\x12\x0F\xBC\x40\x03\x02\x03\x57" \
-        "\x90\xE6\xB8\xE0\x24\xFE\x60\x16\x24\x02\x60\x03\x02\x03\x57\x90" \
-        "\xE6\xBA\xE0\xB4\x01\x05\xC2\x08\x02\x03\x57\x02\x03\x50\x90\xE6" \
-        "\xBA\xE0\x70\x2D\x12\x0B\xD8\x40\x04\x7D\x01\x80\x02\x7D\x00\x12" \
-        "\x0B\xB7\xE0\x54\xFE\xF0\x90\xE6\xBC\xE0\x54\x80\x13\x13\x13\x54" \
-        "\x1F\xFF\xE0\x54\x0F\x2F\x90\xE6\x83\xF0\xE0\x44\x20\xF0\x02\x03" \
-        "\x57\x02\x03\x50\x12\x0F\xBE\x40\x03\x02\x03\x57\x90\xE6\xB8\xE0" \
-        "\x24\xFE\x60\x15\x24\x02\x60\x03\x02\x03\x57\x90\xE6\xBA\xE0\x64" \
-        "\x02\x70\x03\x02\x03\x57\x02\x03\x50\x12\x0B\xD8\x40\x04\x7D\x01" \
-        "\x80\x02\x7D\x00\x12\x0B\xB7\x80\x6A\x75\x0C\xFF\x7B\x00\x7A\x00" \
-        "\x79\x0C\x12\x08\xD3\x90\xE7\x40\xEF\xF0\xA3\xE5\x0C\xF0\xE4\xA3" \
-        "\xF0\x00\x00\x00\x90\xE6\x8A\xF0\x00\x00\x00\xA3\x74\x03\xF0\x80" \
-        "\x46\x12\x0D\xBB\x90\xE7\x40\xEF\xF0\x00\x00\x00\xE4\x90\xE6\x8A" \
-        "\xF0\x00\x00\x00\xA3\x04\xF0\x80\x2E\x12\x0E\xFC\x80\x29\x90\xE6" \
-        "\xBA\xE0\x75\x0C\x00\xF5\x0D\xA3\xE0\xFE\xEE\x42\x0C\xAF\x0D\xAE" \
-        "\x0C\x12\x0D\xD6\x80\x11\x12\x0F\xC0\x50\x0C\x7F\x0D\x12\x0F\xE2" \
-        "\x90\xE6\xA0\xE0\x44\x01\xF0\x90\xE6\xA0\xE0\x44\x80\xF0\x22\xC0" \
-        "\xE0\xC0\x83\xC0\x82\xC0\x85\xC0\x84\xC0\x86\x75\x86\x00\xC0\xD0" \
-        "\x75\xD0\x00\xC0\x00\xC0\x01\xC0\x02\xC0\x03\xC0\x06\xC0\x07\x90" \
-        "\xE6\x78\xE0\x30\xE2\x06\x75\x35\x06\x02\x04\x49\x90\xE6\x78\xE0" \
-        "\x20\xE1\x0C\xE5\x35\x64\x02\x60\x06\x75\x35\x07\x02\x04\x49\xE5" \
-        "\x35\x24\xFE\x60\x5F\x14\x60\x36\x24\xFE\x70\x03\x02\x04\x3A\x24" \
-        "\xFC\x70\x03\x02\x04\x46\x24\x08\x60\x03\x02\x04\x49\xAB\x31\xAA" \
-        "\x32\xA9\x33\xAF\x34\x05\x34\x8F\x82\x75\x83\x00\x12\x05\x4C\x90" \
-        "\xE6\x79\xF0\xE5\x34\x65\x30\x70\x70\x75\x35\x05\x80\x6B\x90\xE6" \
-        "\x79\xE0\xAB\x31\xAA\x32\xA9\x33\xAE\x34\x8E\x82\x75\x83\x00\x12" \
-        "\x05\x8B\x75\x35\x02\xE5\x30\x64\x01\x70\x4E\x90\xE6\x78\xE0"
-
-p_p2n = {}
-for k, v in dict(globals()).items():
-    if k[0] != 'p' or k == 'p_p2n':
-        continue
-    p_p2n[v] = k
-
-if __name__ == '__main__':
-    for k, v in dict(globals()).items():
-        if k[0] != 'p' or type(v) is not str:
-            continue
-        open('i87c51_read_fw/%s.bin' % k, 'w').write(v)
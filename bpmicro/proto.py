@@ -0,0 +1,400 @@
+'''
+Protocol scripts: device support as data instead of unrolled generated code
+
+A script is a JSON object {"version": 1, "ops": [...]}
+Each op is a list, first element is the op name:
+-["w", data]: bulkWrite(0x02, data)
+-["wr", data, expect, label(, "warn")]: cmd.bulk2b() then check reply
+-["r", expect, label]: read one bulk 0x86 frame (cmd.bulk86_next_read) then check
+-["cr", request_type, request, value, index, length, expect, label]: controlRead
+-["cw", request_type, request, value, index, data]: controlWrite
+-["cap", key, data]: cmd.bulk2b(), reply is returned by run() as captures[key]
+    or streamed by run_stream()
+-["cmd", name, arg...]: cmd.<name>(dev, arg...)
+-["repeat", count, [op...]]: run the ops count times. "cap" can't repeat
+    Labels are those of the first iteration (see fold)
+
+data / expect: hex string, "fw:<hash>" for a fw.hash2bin blob
+expect may be null to not check the reply
+cmd args: JSON values, {"hex": "..."} for binary strings
+"warn": a mismatch only prints a warning (ex: continuity / security status)
+'''
+
+from bpmicro import cmd
+from bpmicro import fw
+from bpmicro.usb import usb_wraps, validate_read
+
+import binascii
+import json
+import time
+
+VERSION = 1
+
+# Reply checking
+# all: raise on mismatch, except ops marked warn
+# warn: print a warning on mismatch
+# none: don't check replies
+VALIDATE_ALL = 'all'
+VALIDATE_WARN = 'warn'
+VALIDATE_NONE = 'none'
+
+# Fewest repeats worth a "repeat" op (see fold)
+REPEAT_MIN = 4
+# Longest repeating op sequence looked for
+REPEAT_PERIOD_MAX = 8
+
+
+class FwRef(object):
+    '''Blob resolved on first use'''
+    def __init__(self, h):
+        self.h = h
+
+    def get(self):
+        return fw.hash2bin[self.h]
+
+
+def data_dec(s):
+    if s is None:
+        return None
+    if s.startswith('fw:'):
+        return FwRef(s[3:])
+    return binascii.unhexlify(s)
+
+
+def data_enc(data):
+    if data is None:
+        return None
+    if isinstance(data, FwRef):
+        return 'fw:' + data.h
+    return binascii.hexlify(data).decode('ascii')
+
+
+def data_get(data):
+    if isinstance(data, FwRef):
+        return data.get()
+    return data
+
+
+def arg_dec(v):
+    if isinstance(v, dict):
+        return binascii.unhexlify(v['hex'])
+    return v
+
+
+def arg_enc(v):
+    if isinstance(v, bytes):
+        return {'hex': binascii.hexlify(v).decode('ascii')}
+    return v
+
+
+class Interpreter(object):
+    '''Executes ops against one device. Op methods are named op_<name>'''
+    def __init__(self, dev, validate=VALIDATE_ALL):
+        self.dev = dev
+        self.validate = validate
+        self.bulkRead, self.bulkWrite, self.controlRead, self.controlWrite = usb_wraps(
+            dev)
+        self.captures = {}
+
+    def check(self, expect, buff, label, warn=False):
+        if expect is None or self.validate == VALIDATE_NONE:
+            return
+        if buff == expect:
+            return
+        if warn or self.validate == VALIDATE_WARN:
+            print(('WARNING: unexpected reply, %s' % label))
+            return
+        validate_read(expect, buff, label)
+
+    def op_w(self, data):
+        self.bulkWrite(0x02, data_get(data))
+
+    def op_wr(self, data, expect, label, warn=False):
+        buff = cmd.bulk2b(self.dev, data_get(data))
+        self.check(data_get(expect), buff, label, warn)
+
+    def op_r(self, expect, label):
+        _prefix, buff, _size = cmd.bulk86_next_read(self.dev)
+        self.check(data_get(expect), buff, label)
+
+    def op_cr(self, request_type, request, value, index, length, expect,
+              label):
+        buff = self.controlRead(request_type, request, value, index, length)
+        self.check(data_get(expect), buff, label)
+
+    def op_cw(self, request_type, request, value, index, data):
+        self.controlWrite(request_type, request, value, index, data_get(data))
+
+    def op_cap(self, key, data):
+        self.captures[key] = cmd.bulk2b(self.dev, data_get(data))
+
+    def op_cmd(self, f, *args):
+        f(self.dev, *args)
+
+    def op_repeat(self, count, ops):
+        steps = [(getattr(self, 'op_' + name), args) for name, args in ops]
+        for _i in range(count):
+            for f, args in steps:
+                f(*args)
+
+
+def op_dec(op):
+    '''JSON op => (name, decoded args)'''
+    name = op[0]
+    args = op[1:]
+    if name == 'w':
+        args = (data_dec(args[0]), )
+    elif name == 'wr':
+        args = (data_dec(args[0]), data_dec(args[1]), args[2],
+                len(args) > 3 and args[3] == 'warn')
+    elif name == 'r':
+        args = (data_dec(args[0]), args[1])
+    elif name == 'cr':
+        args = tuple(args[0:5]) + (data_dec(args[5]), args[6])
+    elif name == 'cw':
+        args = tuple(args[0:4]) + (data_dec(args[4]), )
+    elif name == 'cap':
+        args = (args[0], data_dec(args[1]))
+    elif name == 'cmd':
+        f = getattr(cmd, args[0], None)
+        if f is None:
+            raise ValueError("Unknown command %s" % args[0])
+        args = (f, ) + tuple(arg_dec(v) for v in args[1:])
+    elif name == 'repeat':
+        ops = tuple(op_dec(v) for v in args[1])
+        if 'cap' in [op[0] for op in ops]:
+            raise ValueError("cap can't repeat")
+        args = (args[0], ops)
+    else:
+        raise ValueError("Unknown op %s" % name)
+    return (name, args)
+
+
+def op_enc(name, args):
+    '''(name, decoded args) => JSON op'''
+    if name == 'w':
+        return [name, data_enc(args[0])]
+    elif name == 'wr':
+        ret = [name, data_enc(args[0]), data_enc(args[1]), args[2]]
+        if args[3]:
+            ret.append('warn')
+        return ret
+    elif name == 'r':
+        return [name, data_enc(args[0]), args[1]]
+    elif name == 'cr':
+        return [name] + list(args[0:5]) + [data_enc(args[5]), args[6]]
+    elif name == 'cw':
+        return [name] + list(args[0:4]) + [data_enc(args[4])]
+    elif name == 'cap':
+        return [name, args[0], data_enc(args[1])]
+    elif name == 'cmd':
+        return [name, args[0].__name__] + [arg_enc(v) for v in args[1:]]
+    elif name == 'repeat':
+        return [name, args[0], [op_enc(*op) for op in args[1]]]
+    else:
+        raise ValueError("Unknown op %s" % name)
+
+
+def op_key(name, args):
+    '''
+    What must be equal for two ops to be repeats of each other
+    Labels may differ. None: never repeats
+    '''
+    if name in ('cap', 'repeat'):
+        return None
+    op = op_enc(name, args)
+    # Drop the label
+    if name == 'wr':
+        del op[3]
+    elif name == 'r':
+        del op[2]
+    elif name == 'cr':
+        del op[7]
+    return json.dumps(op)
+
+
+def repeat_find(keys, i, period_max=REPEAT_PERIOD_MAX, reps_min=REPEAT_MIN):
+    '''
+    Longest run of repeats starting at keys[i]
+    Return (period, repeats), fewest keys per iteration on ties
+    A false key never repeats
+    '''
+    best = (1, 1)
+    if not keys[i]:
+        return best
+    for period in range(1, period_max + 1):
+        pattern = keys[i:i + period]
+        if len(pattern) < period or not all(pattern):
+            break
+        reps = 1
+        while keys[i + reps * period:i + (reps + 1) * period] == pattern:
+            reps += 1
+        if reps >= reps_min and period * reps > best[0] * best[1]:
+            best = (period, reps)
+    return best
+
+
+def fold(ops):
+    '''Collapse repeated runs of (name, decoded args) into "repeat" ops'''
+    keys = [op_key(name, args) for name, args in ops]
+    ret = []
+    i = 0
+    while i < len(ops):
+        period, reps = repeat_find(keys, i)
+        if reps < REPEAT_MIN:
+            ret.append(ops[i])
+            i += 1
+            continue
+        ret.append(('repeat', (reps, tuple(ops[i:i + period]))))
+        i += period * reps
+    return ret
+
+
+class Script(object):
+    def __init__(self, ops, name=None):
+        self.name = name
+        # (name, decoded args)
+        self.ops = [op_dec(op) for op in ops]
+
+    @staticmethod
+    def load(fn):
+        j = json.load(open(fn))
+        if j.get('version') != VERSION:
+            raise ValueError("%s: unsupported script version" % fn)
+        return Script(j['ops'], name=fn)
+
+    def fold(self):
+        '''Copy with repeated runs collapsed into "repeat" ops'''
+        return Script([op_enc(name, args) for name, args in fold(self.ops)],
+                      name=self.name)
+
+    def to_json(self):
+        return {
+            'version': VERSION,
+            'ops': [op_enc(name, args) for name, args in self.ops]
+        }
+
+    def save(self, fn):
+        with open(fn, 'w') as f:
+            f.write('{"version": %u, "ops": [\n' % VERSION)
+            ops = self.to_json()['ops']
+            for opi, op in enumerate(ops):
+                f.write(json.dumps(op))
+                f.write(',\n' if opi + 1 < len(ops) else '\n')
+            f.write(']}\n')
+
+    def run(self, dev, validate=VALIDATE_ALL, batch=None, times=None):
+        '''
+        Execute the script, returning captures (see "cap" op)
+
+        batch: coalesce write only commands (see cmd.Batch). None => cmd.coalesce
+        times: list of per op seconds to add this run into (see new_times)
+        '''
+        with cmd.Batch(dev, enabled=batch) as dev:
+            interp = Interpreter(dev, validate=validate)
+            steps = [(getattr(interp, 'op_' + name), args)
+                     for name, args in self.ops]
+            if times is None:
+                for f, args in steps:
+                    f(*args)
+            else:
+                # Flush each step: time is charged to the op that caused it
+                for opi, (f, args) in enumerate(steps):
+                    tstart = time.time()
+                    f(*args)
+                    dev.flush()
+                    times[opi] += time.time() - tstart
+        return interp.captures
+
+    def run_stream(self, dev, validate=VALIDATE_ALL, batch=None):
+        '''
+        Like run() but a generator: "cap" replies are yielded as
+        (key, offset, memoryview) as each bulk 0x86 frame arrives
+        instead of being collected
+        '''
+        with cmd.Batch(dev, enabled=batch) as dev:
+            interp = Interpreter(dev, validate=validate)
+            for name, args in self.ops:
+                if name == 'cap':
+                    key, data = args
+                    offset = 0
+                    for buff in cmd.bulk2b_stream(dev, data_get(data)):
+                        yield key, offset, buff
+                        offset += len(buff)
+                else:
+                    getattr(interp, 'op_' + name)(*args)
+
+    def new_times(self):
+        return [0.0] * len(self.ops)
+
+    def print_times(self, times, top=10):
+        '''Print total time and the top slowest ops'''
+        print(('%s: %u ops, %0.3f sec' %
+               (self.name, len(self.ops), sum(times))))
+        order = sorted(range(len(times)), key=lambda i: times[i], reverse=True)
+        for opi in order[0:top]:
+            name, args = self.ops[opi]
+            # Abbreviate payloads
+            label = ' '.join(
+                str(v) if len(str(v)) <= 32 else str(v)[0:29] + '...'
+                for v in op_enc(name, args))
+            print(('  %4u %8.4f sec  %s' % (opi, times[opi], label)))
+
+
+# file name => Script
+scripts = {}
+
+
+def get(fn):
+    '''Load a script on first use and keep it'''
+    script = scripts.get(fn)
+    if script is None:
+        script = Script.load(fn)
+        scripts[fn] = script
+    return script
+
+
+def from_usbrply(ps):
+    '''
+    Translate a capture into a Script, op for op
+    ps: iterable of packet.Packet (see scrape.load_packets)
+    Replies following a bulk write are aggregated into a "wr" op
+    '''
+    ps = [p for p in ps if p.type != 'comment']
+    ops = []
+    pi = 0
+    while pi < len(ps):
+        p = ps[pi]
+        t = p.type
+        label = 'packet %s/%s' % tuple(p.packn[0:2])
+        if t == 'controlRead':
+            ops.append([
+                'cr', p.bRequestType, p.bRequest, p.wValue, p.wIndex,
+                p.wLength,
+                data_enc(p.data), label
+            ])
+        elif t == 'controlWrite':
+            ops.append([
+                'cw', p.bRequestType, p.bRequest, p.wValue, p.wIndex,
+                data_enc(p.data)
+            ])
+        elif t == 'bulkWrite':
+            rs = []
+            while pi + 1 < len(ps) and ps[pi + 1].type == 'bulkRead':
+                pi += 1
+                rs.append(ps[pi])
+            if p.endp != 0x02:
+                raise ValueError("Unexpected endpoint 0x%02X" % p.endp)
+            if rs:
+                reply = b''.join(
+                    cmd.frame_decode(r.data)[1].tobytes() for r in rs)
+                ops.append(['wr', data_enc(p.data), data_enc(reply), label])
+            else:
+                ops.append(['w', data_enc(p.data)])
+        elif t == 'bulkRead':
+            reply = cmd.frame_decode(p.data)[1].tobytes()
+            ops.append(['r', data_enc(reply), label])
+        else:
+            raise ValueError("Unknown type: %s" % t)
+        pi += 1
+    return Script(ops)
@@ -0,0 +1,195 @@
+'''
+Simulated programmer that answers from a usbrply JSON capture
+Lets device code run with no hardware attached (ex: CI, benchmarking)
+
+Each bulk 0x02 write / control request is looked up in the capture
+and the bulk 0x86 frames that followed it are queued for bulkRead()
+Repeated requests are answered in capture order. Once the captured answers
+for a request run out the last one is repeated
+'''
+
+import binascii
+import hashlib
+import json
+from collections import deque
+
+import usb1
+
+from bpmicro import cmd
+from bpmicro.cmd import wo_cmd_lens
+
+
+class ReplayMismatch(Exception):
+    pass
+
+
+def load_json(fn):
+    return json.load(open(fn))
+
+
+def packet_key(p):
+    t = p['type']
+    if t == 'bulkWrite':
+        return (t, p['endp'], binascii.unhexlify(p['data']))
+    elif t == 'controlRead':
+        return (t, p['bRequestType'], p['bRequest'], p['wValue'],
+                p['wIndex'])
+    elif t == 'controlWrite':
+        return (t, p['bRequestType'], p['bRequest'], p['wValue'],
+                p['wIndex'], binascii.unhexlify(p['data']))
+    else:
+        raise Exception("Unknown type: %s" % t)
+
+
+def key_str(key):
+    if key[0] == 'controlRead':
+        return '%s(0x%02X, 0x%02X, 0x%04X, 0x%04X)' % key
+    elif key[0] == 'controlWrite':
+        return '%s(0x%02X, 0x%02X, 0x%04X, 0x%04X, %s)' % (
+            key[0:5] + (binascii.hexlify(key[5]), ))
+    else:
+        return '%s(0x%02X, %s)' % (key[0], key[1], binascii.hexlify(key[2]))
+
+
+class ReplayEntry(object):
+    def __init__(self, data=None):
+        # controlRead response
+        self.data = data
+        # Raw bulk 0x86 frames, including prefix and size trailer
+        self.frames = []
+
+
+class ReplayDev(object):
+    '''
+    Same bulkRead / bulkWrite / controlRead / controlWrite interface as a raw usb1 handle
+    Wrap in a usb.Transport (see startup.get_replay)
+
+    j: usbrply JSON (as loaded) or file name
+    strict: raise ReplayMismatch on requests not in the capture
+        Otherwise writes are accepted silently and control reads return zeros
+    '''
+    def __init__(self, j, strict=True, verbose=False):
+        if not isinstance(j, dict):
+            j = load_json(j)
+        self.strict = strict
+        self.verbose = verbose
+        self.ps = j['data']
+        self.reset()
+
+    def reset(self):
+        '''Rewind to the start of the capture and clear statistics'''
+        # key => deque of ReplayEntry
+        self.replies = {}
+        # Frames waiting to be read from 0x86
+        self.frames = deque()
+        # Statistics
+        self.transactions = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.misses = 0
+        # Everything written outside of cmd.readonly steps
+        # Compares what reached the part across runs with / without cmd.fast
+        self.write_digest = hashlib.md5()
+
+        # Frames sent before any request
+        entry = ReplayEntry()
+        startup = entry
+        for p in self.ps:
+            t = p['type']
+            if t == 'comment':
+                continue
+            elif t == 'bulkRead':
+                if p['endp'] != 0x86:
+                    raise Exception("Unexpected endpoint 0x%02X" % p['endp'])
+                entry.frames.append(binascii.unhexlify(p['data']))
+            elif t in ('bulkWrite', 'controlRead', 'controlWrite'):
+                data = None
+                if t == 'controlRead':
+                    data = binascii.unhexlify(p['data'])
+                entry = ReplayEntry(data)
+                self.replies.setdefault(packet_key(p), deque()).append(entry)
+            else:
+                raise Exception("Unknown type: %s" % t)
+        self.frames.extend(startup.frames)
+
+    def lookup(self, key):
+        entries = self.replies.get(key)
+        if not entries:
+            self.misses += 1
+            if self.strict:
+                raise ReplayMismatch("Request not in capture: %s" %
+                                     key_str(key))
+            return None
+        entry = entries[0]
+        if len(entries) > 1:
+            entries.popleft()
+        return entry
+
+    def answer(self, key):
+        entry = self.lookup(key)
+        if entry is not None:
+            self.frames.extend(entry.frames)
+        return entry
+
+    def bulkRead(self, endpoint, length, timeout=None):
+        if endpoint != 0x86:
+            raise Exception("Unexpected endpoint 0x%02X" % endpoint)
+        self.transactions += 1
+        if not self.frames:
+            raise usb1.USBErrorTimeout()
+        ret = self.frames.popleft()[0:length]
+        self.bytes_in += len(ret)
+        return ret
+
+    def strip_wo(self, endpoint, data):
+        '''
+        Undo cmd.Batch coalescing: drop leading write only commands
+        until the rest is something the capture knows about
+        They have no reply so there is nothing to answer for them
+        '''
+        while ('bulkWrite', endpoint, data) not in self.replies:
+            n = wo_cmd_lens.get(bytearray(data[0:1])[0]) if data else None
+            if n is None or n >= len(data):
+                break
+            data = data[n:]
+        return data
+
+    def bulkWrite(self, endpoint, data, timeout=None):
+        data = bytes(data)
+        self.transactions += 1
+        self.bytes_out += len(data)
+        if not cmd.ro_depth:
+            self.write_digest.update(data)
+        self.answer(('bulkWrite', endpoint, self.strip_wo(endpoint, data)))
+
+    def controlRead(self,
+                    request_type,
+                    request,
+                    value,
+                    index,
+                    length,
+                    timeout=None):
+        self.transactions += 1
+        entry = self.answer(
+            ('controlRead', request_type, request, value, index))
+        if entry is None:
+            ret = "\x00" * length
+        else:
+            ret = entry.data[0:length]
+        self.bytes_in += len(ret)
+        return ret
+
+    def controlWrite(self,
+                     request_type,
+                     request,
+                     value,
+                     index,
+                     data,
+                     timeout=None):
+        self.transactions += 1
+        self.bytes_out += len(data)
+        if not cmd.ro_depth:
+            self.write_digest.update(bytes(data))
+        self.answer(
+            ('controlWrite', request_type, request, value, index,
+             bytes(data)))
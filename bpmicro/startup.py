@@ -4,10 +4,12 @@
 from bpmicro import fx2
 from bpmicro import bp1410
 from bpmicro import bp1600
+from bpmicro import sim
 from . import cmd
 import time
 import binascii
-from bpmicro.usb import usb_wraps, validate_read, USBAdapt
+from bpmicro.usb import usb_wraps, validate_read, Transport, transport
+from bpmicro.usb import transport_close
 
 import usb1
 
@@ -35,9 +37,79 @@ def wait_post(dev, timeout=15.0):
         print(('POST: ok after %0.1f sec' % (time.time() - tstart)))
 
 
-def init_adapter(dev):
+# Payload of the 0x86 frame posted after a 0xB0 status read
+devsigs = (
+    "\x08\x16\x01\x00",
+    "\x16",
+)
+
+
+def drain86(dev, timeout=10, limit=16):
+    '''Discard frames already waiting on 0x86 (ex: a signature nobody read)'''
+    for _i in range(limit):
+        try:
+            dev.bulkRead(0x86, 0x0200, timeout=timeout)
+        except usb1.USBError:
+            return
+
+
+def fx2_probe(dev, timeout=100, tries=2):
+    '''
+    Return the device signature if our FX2 firmware is already running
+    Otherwise (boot ROM, stale or unknown firmware) return None
+
+    The FX2 boot ROM doesn't implement vendor request 0xB0 and stalls it
+    Our firmware answers with status and then posts a signature frame on 0x86
+    A previous session may have read the signature already or left one
+    behind: stale frames are drained and the status read is retried if
+    no signature follows
+    '''
+    # Bypass transport extras (ex: async reads) in case we need to reload
+    dev = transport(dev).dev
+    drain86(dev)
+    for _try in range(tries):
+        try:
+            buff = dev.controlRead(0xC0,
+                                   0xB0,
+                                   0x0000,
+                                   0x0000,
+                                   4096,
+                                   timeout=timeout)
+        except usb1.USBError:
+            return None
+        if buff == "\x01\xFF\x00":
+            # Firmware is up but still in POST (ex: adapter just plugged in)
+            wait_post(dev)
+        elif buff != "\x00\x00\x00":
+            return None
+        try:
+            _prefix, buff, _size = cmd.frame_decode(
+                dev.bulkRead(0x86, 0x0200, timeout=timeout))
+        except usb1.USBError:
+            continue
+        devsig = buff.tobytes()
+        if devsig not in devsigs:
+            return None
+        # Don't leave extra signatures (ex: one per POST poll) for the next command
+        drain86(dev)
+        return devsig
+    return None
+
+
+def init_adapter(dev, reload=False, verbose=False):
+    '''
+    Load adapter firmware and wait for POST
+    Skipped if the firmware is already running unless reload is set
+    '''
     bulkRead, bulkWrite, controlRead, controlWrite = usb_wraps(dev)
 
+    if not reload:
+        devsig = fx2_probe(dev)
+        if devsig:
+            if verbose:
+                print('FX2: firmware already running, skipping load')
+            return devsig
+
     fx2.load_fx2(dev)
     wait_post(dev)
 
@@ -46,11 +118,11 @@ def init_adapter(dev):
 
     # buff = bulkRead(0x86, 0x0200)
     _prefix, buff, _size = cmd.bulk86_next_read(dev)
-    return str(buff)
+    return bytes(buff)
 
 
-def init_dev(dev, verbose=False):
-    devsig = init_adapter(dev)
+def init_dev(dev, verbose=False, reload=False):
+    devsig = init_adapter(dev, reload=reload, verbose=verbose)
     init_dev = {
         "\x08\x16\x01\x00": bp1410.init_dev,
         "\x16": bp1600.init_dev,
@@ -58,6 +130,8 @@ def init_dev(dev, verbose=False):
 
     init_dev = bp1410.init_dev
     init_dev(dev, verbose=verbose)
+    # SM may have been swapped while we weren't watching gpio
+    cmd.eeprom_cache.invalidate()
 
 
 def open_dev(usbcontext=None, verbose=False):
@@ -78,11 +152,49 @@ def open_dev(usbcontext=None, verbose=False):
     raise Exception("Failed to find a device")
 
 
-def get(init=True, verbose=False):
-    '''Connect to USB device and return a BP1410 object'''
+def get(init=True, verbose=False, async_depth=0, stats=None, reload=False):
+    '''
+    Connect to USB device and return a BP1410 object
+    reload: load adapter firmware even if it is already running
+    async_depth: number of bulk 0x86 reads to keep queued (0 => synchronous)
+    stats: usb.USBStats to record command timing into
+    '''
     usbcontext = usb1.USBContext()
     dev = open_dev(usbcontext, verbose=verbose)
     dev.claimInterface(0)
+    # Created up front so init gets the same transport as everything else
+    bp = Transport(dev,
+                   usbcontext,
+                   verbose=verbose,
+                   async_depth=async_depth,
+                   stats=stats)
+    if init:
+        init_dev(bp, verbose=verbose, reload=reload)
+    return bp
+
+
+def get_replay(fn, init=False, verbose=False, strict=True, stats=None):
+    '''
+    Return a BP1410 object backed by a usbrply JSON capture instead of hardware
+    init: replay adapter / programmer init (capture must include it)
+    '''
+    dev = sim.ReplayDev(fn, strict=strict, verbose=verbose)
+    bp = Transport(dev, None, verbose=verbose, stats=stats)
     if init:
-        init_dev(dev, verbose=verbose)
-    return USBAdapt(dev, usbcontext, verbose=verbose)
+        init_dev(bp, verbose=verbose)
+    return bp
+
+
+def close(bp):
+    '''Undo get(): stop queued reads, release the interface, close the handle and context'''
+    bp.close()
+    # Raw handle users (usb_wraps(bp.dev)) may have cached a Transport of their own
+    transport_close(bp.dev)
+    try:
+        bp.dev.releaseInterface(0)
+    except usb1.USBError:
+        # ex: device already gone after a bus error
+        pass
+    bp.dev.close()
+    if bp.usbcontext is not None:
+        bp.usbcontext.close()
@@ -0,0 +1,232 @@
+'''
+Where does the time go: timing profile of a capture (see scrape.py --timing)
+
+Built from capture timestamps (packet.Packet.ts: submit, complete)
+-Per opcode: bulk 0x02 write submit => first bulk 0x86 reply frame (usb.USBStats)
+-Phases:
+    -upload: algorithm upload, a cmd_50() announce and the payload it announces
+        announce submit => payload ack
+    -write: code / data image write (cmd.upload_chunks() style chunk runs)
+        first chunk submit => final ack
+    -cont: continuity check (cmd.check_cont(), 0x57 0x85)
+    -readback: commands replying with more than one frame
+        write submit => last frame. Rate is payload bytes / this time
+
+Profiles of a BPWin capture and a capture of our driver doing the same
+operation can be compared side by side (compare())
+'''
+
+from bpmicro.cmd import frame_decode, wo_cmd_lens
+from bpmicro.usb import USBStats
+
+import struct
+import sys
+
+CONT_CMD = b"\x57\x85\x00"
+
+phase_names = ('upload', 'write', 'cont', 'readback')
+
+
+class TimingError(Exception):
+    pass
+
+
+class Phase(object):
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.time = 0.0
+
+    def add(self, dt, nbytes=0):
+        self.count += 1
+        self.bytes += nbytes
+        self.time += dt
+
+
+def is_upload_chunk(data):
+    '''Length prefixed upload chunk, see cmd.upload_chunks()'''
+    data = bytearray(data)
+    return len(data) >= 3 and data[0] == len(data) - 2 and data[1] == 0
+
+
+def announced(data):
+    '''
+    Payload size if the write ends in a cmd_50() announce, otherwise None
+    The announce may follow other write only commands (ex: cmd_20, cmd_57_50)
+    '''
+    data = bytearray(data)
+    pos = 0
+    while pos < len(data):
+        op = data[pos]
+        if op == 0x50:
+            if pos + 5 != len(data):
+                return None
+            return struct.unpack('<H', bytes(data[pos + 1:pos + 3]))[0]
+        # cmd_57_50: a 0x57 sub command prefixes the announce
+        n = 3 if op == 0x57 else wo_cmd_lens.get(op)
+        if n is None:
+            return None
+        pos += n
+    return None
+
+
+class Profile(object):
+    def __init__(self, name=None):
+        self.name = name
+        self.stats = USBStats()
+        self.phases = dict((k, Phase()) for k in phase_names)
+        # Capture span
+        self.tstart = None
+        self.tend = None
+        # Current command:
+        # [data, write submit, frames, payload bytes, last frame, upload start]
+        # upload start: announce submit time if this is an announced payload
+        self.cur = None
+        # Pending cmd_50() announce: (submit, size)
+        self.announce = None
+        # Chunked write in progress: [start, bytes]
+        self.chunks = None
+
+    def add(self, p):
+        '''Account one packet.Packet'''
+        if p.type == 'comment':
+            return
+        if p.ts is None:
+            raise TimingError("%s: capture has no timestamps" % self.name)
+        tsubmit, tcomplete = p.ts[0:2]
+        if self.tstart is None:
+            self.tstart = tsubmit
+        self.tend = tcomplete
+        if p.type == 'bulkWrite':
+            self.stats.write(p.endp, p.data, t=tsubmit)
+            if p.endp == 0x02:
+                self.finish()
+                self.write(p.data, tsubmit)
+        elif p.type == 'bulkRead':
+            self.stats.read(p.endp, t=tcomplete)
+            cur = self.cur
+            if p.endp == 0x86 and cur is not None:
+                prefix, _payload, size = frame_decode(p.data)
+                cur[2] += 1
+                cur[3] += size
+                cur[4] = tcomplete
+                self.chunk_ack(cur, prefix)
+
+    def write(self, data, tsubmit):
+        announce, self.announce = self.announce, None
+        tupload = None
+        if announce is not None and len(data) == announce[1]:
+            tupload = announce[0]
+        else:
+            size = announced(data)
+            if size:
+                self.announce = (tsubmit, size)
+        self.cur = [data, tsubmit, 0, 0, None, tupload]
+
+    def chunk_ack(self, cur, prefix):
+        if cur[2] != 1 or cur[5] is not None or not is_upload_chunk(cur[0]):
+            return
+        if self.chunks is None:
+            self.chunks = [cur[1], 0]
+        self.chunks[1] += len(cur[0]) - 2
+        # Final chunk is acked with prefix 0x08, others 0x18
+        if prefix == 0x08:
+            self.phases['write'].add(cur[4] - self.chunks[0], self.chunks[1])
+            self.chunks = None
+
+    def finish(self):
+        '''Close out the current command'''
+        cur = self.cur
+        self.cur = None
+        if cur is None:
+            return
+        data, tsubmit, frames, nbytes, tlast, tupload = cur
+        # Any other command ends a chunked write
+        if self.chunks is not None and (tupload is not None
+                                        or not is_upload_chunk(data)):
+            self.chunks = None
+        if not frames:
+            return
+        if tupload is not None:
+            self.phases['upload'].add(tlast - tupload, len(data))
+        if bytes(data) == CONT_CMD:
+            self.phases['cont'].add(tlast - tsubmit)
+        if frames > 1:
+            self.phases['readback'].add(tlast - tsubmit, nbytes)
+
+    def elapsed(self):
+        if self.tstart is None:
+            return 0.0
+        return self.tend - self.tstart
+
+    def dump(self, f=sys.stdout):
+        self.finish()
+        f.write('%s: %0.3f sec\n' % (self.name, self.elapsed()))
+        self.stats.dump(f)
+        f.write('Phases\n')
+        f.write('  phase      count   total s    avg ms   bytes  KiB/s\n')
+        for k in phase_names:
+            phase = self.phases[k]
+            f.write('  %-9s %6u %9.3f %9s %7u %6s\n' %
+                    (k, phase.count, phase.time,
+                     '%0.2f' % (1000.0 * phase.time / phase.count)
+                     if phase.count else '-', phase.bytes,
+                     '%0.1f' % (phase.bytes / 1024.0 / phase.time)
+                     if phase.bytes and phase.time else '-'))
+
+
+def load(ps, name=None):
+    '''Profile an iterable of packet.Packet'''
+    profile = Profile(name)
+    for p in ps:
+        profile.add(p)
+    profile.finish()
+    return profile
+
+
+def fmt_ratio(ref, ours):
+    if not ref or ours is None:
+        return '-'
+    return '%0.2fx' % (ours / ref)
+
+
+def compare(ref, ours, f=sys.stdout):
+    '''
+    Print ours against ref (ex: BPWin) per opcode and phase
+    ratio > 1: ours is slower
+    '''
+    ref.finish()
+    ours.finish()
+    f.write('Timing: %s (ref) vs %s (ours)\n' % (ref.name, ours.name))
+    f.write('  total     %9.3f %9.3f s  %s\n' %
+            (ref.elapsed(), ours.elapsed(),
+             fmt_ratio(ref.elapsed(), ours.elapsed())))
+    f.write('  Write => first reply, avg ms\n')
+    f.write('    op   ref n    ref ms  ours n   ours ms  ratio\n')
+
+    def avg(stats, opcode):
+        opstats = stats.opcodes.get(opcode)
+        if opstats is None or not opstats.replies:
+            return 0, None
+        return opstats.replies, 1000.0 * opstats.latency / opstats.replies
+
+    opcodes = set(ref.stats.opcodes) | set(ours.stats.opcodes)
+    for opcode in sorted(opcodes, key=lambda k: -1 if k is None else k):
+        ref_n, ref_ms = avg(ref.stats, opcode)
+        ours_n, ours_ms = avg(ours.stats, opcode)
+        if not ref_n and not ours_n:
+            continue
+        f.write('    %-4s %5u %9s %7u %9s  %s\n' %
+                ('%02X' % opcode if opcode is not None else '-', ref_n,
+                 '%0.2f' % ref_ms if ref_n else '-', ours_n,
+                 '%0.2f' % ours_ms if ours_n else '-',
+                 fmt_ratio(ref_ms, ours_ms)))
+    f.write('  Phases, total s\n')
+    f.write('    phase      ref n     ref s  ours n    ours s  ratio\n')
+    for k in phase_names:
+        ref_phase = ref.phases[k]
+        ours_phase = ours.phases[k]
+        f.write('    %-9s %6u %9.3f %7u %9.3f  %s\n' %
+                (k, ref_phase.count, ref_phase.time, ours_phase.count,
+                 ours_phase.time, fmt_ratio(ref_phase.time,
+                                            ours_phase.time)))
@@ -1,22 +1,304 @@
 import libusb1
+import usb1
 import binascii
+import sys
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+import time
+from collections import deque
 
 from bpmicro.util import hexdump, str2hex
 
+# Transfer status => exception raised to the bulkRead caller
+async_status2exc = {
+    usb1.TRANSFER_TIMED_OUT: usb1.USBErrorTimeout,
+    usb1.TRANSFER_STALL: usb1.USBErrorPipe,
+    usb1.TRANSFER_NO_DEVICE: usb1.USBErrorNoDevice,
+    usb1.TRANSFER_OVERFLOW: usb1.USBErrorOverflow,
+}
 
-class USBAdapt(object):
-    def __init__(self, dev, usbcontext, verbose=False):
+
+class AsyncBulkReader(object):
+    '''
+    Keep several bulk IN transfers queued on an endpoint
+
+    The adapter only sends on 0x86 in reply to a command, so transfers can be
+    left pending indefinitely. Completed frames are kept in order and handed
+    out one at a time by read(), which makes this a drop in replacement for a
+    synchronous bulkRead() loop
+    Frames that arrive before anyone asks for them are simply buffered
+    '''
+    def __init__(self, dev, usbcontext, endpoint, length=0x0200, depth=4):
+        self.usbcontext = usbcontext
+        self.endpoint = endpoint
+        self.length = length
+        self.frames = deque()
+        self.error = None
+        self.closing = False
+        self.transfers = []
+        for _i in range(depth):
+            transfer = dev.getTransfer()
+            # timeout=0: wait forever, read() enforces the timeout instead
+            transfer.setBulk(endpoint,
+                             length,
+                             callback=self._callback,
+                             timeout=0)
+            transfer.submit()
+            self.transfers.append(transfer)
+
+    def _callback(self, transfer):
+        status = transfer.getStatus()
+        if status == usb1.TRANSFER_COMPLETED:
+            self.frames.append(
+                bytes(transfer.getBuffer()[:transfer.getActualLength()]))
+            if not self.closing:
+                transfer.submit()
+        elif status != usb1.TRANSFER_CANCELLED:
+            self.error = status
+
+    def read(self, length, timeout=1000):
+        if length > self.length:
+            raise ValueError("Read 0x%04X > queued transfer size 0x%04X" %
+                             (length, self.length))
+        tend = time.time() + timeout / 1000.0
+        while not self.frames:
+            if self.error is not None:
+                exc = async_status2exc.get(self.error, usb1.USBErrorIO)
+                self.error = None
+                raise exc()
+            remain = tend - time.time()
+            if remain <= 0:
+                raise usb1.USBErrorTimeout()
+            self.usbcontext.handleEventsTimeout(remain)
+        return self.frames.popleft()
+
+    def close(self):
+        self.closing = True
+        for transfer in self.transfers:
+            if transfer.isSubmitted():
+                try:
+                    transfer.cancel()
+                except usb1.USBErrorNotFound:
+                    pass
+        while any(transfer.isSubmitted() for transfer in self.transfers):
+            self.usbcontext.handleEventsTimeout(0.1)
+        for transfer in self.transfers:
+            transfer.close()
+        self.transfers = []
+
+
+# Reply latency histogram bucket upper bounds in seconds
+# Last bucket catches everything slower
+latency_buckets = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2,
+                   0.5, 1.0)
+
+
+class OpcodeStats(object):
+    def __init__(self):
+        # bulk 0x02 writes starting with this opcode
+        self.count = 0
+        self.bytes = 0
+        # Writes that got at least one 0x86 frame back
+        self.replies = 0
+        # Write => first reply frame
+        self.latency = 0.0
+        self.latency_min = None
+        self.latency_max = 0.0
+        self.latency_hist = [0] * (len(latency_buckets) + 1)
+        # Reply frames => count
+        self.frames_hist = {}
+        self.timeouts = 0
+
+    def add_latency(self, dt):
+        self.replies += 1
+        self.latency += dt
+        if self.latency_min is None or dt < self.latency_min:
+            self.latency_min = dt
+        self.latency_max = max(self.latency_max, dt)
+        for i, bucket in enumerate(latency_buckets):
+            if dt <= bucket:
+                break
+        else:
+            i = len(latency_buckets)
+        self.latency_hist[i] += 1
+
+    def splits(self):
+        '''Replies that took more than one frame'''
+        return sum(n for frames, n in self.frames_hist.items() if frames > 1)
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'bytes': self.bytes,
+            'replies': self.replies,
+            'latency': self.latency,
+            'latency_min': self.latency_min,
+            'latency_max': self.latency_max,
+            'latency_hist': self.latency_hist,
+            'frames_hist': dict(
+                (str(k), v) for k, v in self.frames_hist.items()),
+            'timeouts': self.timeouts,
+        }
+
+
+class USBStats(object):
+    '''
+    Per opcode accounting of bulk 0x02 commands and their bulk 0x86 replies
+    A reply is every 0x86 frame read before the next 0x02 write
+    The opcode is the command at cmd_pos, not write only commands
+    merged in front of it (see cmd.Batch)
+    '''
+    def __init__(self):
+        # opcode (first command byte) => OpcodeStats
+        self.opcodes = {}
+        # [OpcodeStats, write time, frames read]
+        self.cur = None
+        # Timeouts not following any command
+        self.timeouts = 0
+
+    def write(self, endpoint, data, t=None, cmd_pos=0):
+        '''
+        t: event time, None => now (a capture passes its timestamps)
+        cmd_pos: offset of the command the reply belongs to
+        '''
+        if endpoint != 0x02:
+            return
+        if t is None:
+            t = time.time()
+        self.finish()
+        opcode = bytearray(data[cmd_pos:cmd_pos + 1])[0] if len(
+            data) > cmd_pos else None
+        opstats = self.opcodes.get(opcode)
+        if opstats is None:
+            opstats = self.opcodes[opcode] = OpcodeStats()
+        opstats.count += 1
+        opstats.bytes += len(data)
+        self.cur = [opstats, t, 0]
+
+    def read(self, endpoint, t=None):
+        cur = self.cur
+        if endpoint != 0x86 or cur is None:
+            return
+        if cur[2] == 0:
+            if t is None:
+                t = time.time()
+            cur[0].add_latency(t - cur[1])
+        cur[2] += 1
+
+    def timeout(self, endpoint):
+        if self.cur is None:
+            self.timeouts += 1
+        else:
+            self.cur[0].timeouts += 1
+
+    def finish(self):
+        cur = self.cur
+        if cur is not None and cur[2]:
+            frames_hist = cur[0].frames_hist
+            frames_hist[cur[2]] = frames_hist.get(cur[2], 0) + 1
+        self.cur = None
+
+    def to_dict(self):
+        self.finish()
+        return {
+            'opcodes': dict(('%02X' % k if k is not None else 'none',
+                             v.to_dict()) for k, v in self.opcodes.items()),
+            'timeouts': self.timeouts,
+        }
+
+    def dump(self, f=sys.stdout):
+        self.finish()
+        f.write('USB statistics\n')
+        f.write('  op   count  bytes   reply  avg ms  min ms  max ms  '
+                'split  tmo\n')
+        replies = 0
+        splits = 0
+        for opcode, opstats in sorted(self.opcodes.items()):
+            replies += opstats.replies
+            splits += opstats.splits()
+            if opstats.replies:
+                lat = '%7.2f %7.2f %7.2f' % (
+                    1000.0 * opstats.latency / opstats.replies,
+                    1000.0 * opstats.latency_min, 1000.0 * opstats.latency_max)
+            else:
+                lat = ' ' * 23
+            f.write('  %-4s %5u %6u %7u %s %6u %4u\n' %
+                    ('%02X' % opcode if opcode is not None else '-',
+                     opstats.count, opstats.bytes, opstats.replies, lat,
+                     opstats.splits(), opstats.timeouts))
+        if replies:
+            f.write('  Split replies: %u / %u (%0.1f%%)\n' %
+                    (splits, replies, 100.0 * splits / replies))
+        if self.timeouts:
+            f.write('  Timeouts outside of a command: %u\n' % self.timeouts)
+        f.write('  Latency histogram (ms <=)\n')
+        f.write('    op  ' + ''.join('%6s' % ('%g' % (1000 * b))
+                                     for b in latency_buckets) + '  more\n')
+        for opcode, opstats in sorted(self.opcodes.items()):
+            if not opstats.replies:
+                continue
+            f.write('    %-4s' % ('%02X' % opcode if opcode is not None else '-') +
+                    ''.join('%6u' % n for n in opstats.latency_hist) + '\n')
+
+
+class Transport(object):
+    '''
+    Long lived handle to an opened programmer
+    Everything the command layer needs per transfer lives here
+    so the hot path does no per call setup
+
+    timeout: default timeout in ms when a call doesn't give one
+    async_depth: if set, keep this many reads queued on bulk endpoint 0x86
+    instead of posting one synchronous read at a time
+    stats: USBStats to record per opcode timing into
+    '''
+    def __init__(self,
+                 dev,
+                 usbcontext,
+                 verbose=False,
+                 async_depth=0,
+                 stats=None):
         self.dev = dev
         self.usbcontext = usbcontext
         self.timeout = 1000
         self.verbose = verbose
+        self.async_depth = async_depth
+        # Created on first use so firmware load / POST are not disturbed
+        self.reader86 = None
+        self.stats = stats
+        # What usb_wraps() returns. Bound once instead of per command
+        self.wraps = (self.bulkRead, self.bulkWrite, self.controlRead,
+                      self.controlWrite)
 
     def bulkRead(self, endpoint, length, timeout=None):
         timeout = timeout if timeout is not None else self.timeout
+        if self.stats is None:
+            return self._bulkRead(endpoint, length, timeout)
+        try:
+            ret = self._bulkRead(endpoint, length, timeout)
+        except usb1.USBErrorTimeout:
+            self.stats.timeout(endpoint)
+            raise
+        self.stats.read(endpoint)
+        return ret
+
+    def _bulkRead(self, endpoint, length, timeout):
+        if self.async_depth and endpoint == 0x86:
+            if self.reader86 is None:
+                self.reader86 = AsyncBulkReader(self.dev,
+                                                self.usbcontext,
+                                                0x86,
+                                                depth=self.async_depth)
+            return self.reader86.read(length, timeout=timeout)
         return self.dev.bulkRead(endpoint, length, timeout=timeout)
 
-    def bulkWrite(self, endpoint, data, timeout=None):
+    def bulkWrite(self, endpoint, data, timeout=None, cmd_pos=0):
+        '''cmd_pos: where the command after merged write only ones starts'''
         timeout = timeout if timeout is not None else self.timeout
+        if self.stats is not None:
+            self.stats.write(endpoint, data, cmd_pos=cmd_pos)
         self.dev.bulkWrite(endpoint, data, timeout=timeout)
 
     def controlRead(self,
@@ -49,51 +331,113 @@ class USBAdapt(object):
                               data,
                               timeout=timeout)
 
+    def close(self):
+        if self.reader86:
+            self.reader86.close()
+            self.reader86 = None
+        if transports.get(self.dev) is self:
+            del transports[self.dev]
+
+
+# Backwards compatible name
+USBAdapt = Transport
+
+# Raw usb1 handle => Transport
+# The Transport references its handle, so entries are removed explicitly
+# (Transport.close / transport_close), not by garbage collection
+transports = {}
+
+
+def transport(dev):
+    '''
+    Return the Transport for dev
+    dev may already be a Transport (or anything else providing wraps)
+    Raw usb1 handles get a Transport created once and cached
+    '''
+    if hasattr(dev, 'wraps'):
+        return dev
+    ret = transports.get(dev)
+    if ret is None:
+        ret = transports[dev] = Transport(dev, None)
+    return ret
+
+
+def transport_close(dev):
+    '''Close and forget the cached Transport of raw handle dev, if any'''
+    ret = transports.get(dev)
+    if ret is not None:
+        ret.close()
+
 
 def usb_wraps(dev):
-    # Shorten stack traces to simplify errors
-    def bulkRead(endpoint, length, timeout=None):
-        if timeout is None:
-            timeout = 1000
-        return dev.bulkRead(endpoint, length, timeout=timeout)
-
-    def bulkWrite(endpoint, data, timeout=None):
-        if timeout is None:
-            timeout = 1000
-        dev.bulkWrite(endpoint, data, timeout=timeout)
-
-    def controlRead(request_type, request, value, index, length, timeout=None):
-        if timeout is None:
-            timeout = 1000
-        return dev.controlRead(request_type,
-                               request,
-                               value,
-                               index,
-                               length,
-                               timeout=timeout)
-
-    def controlWrite(request_type, request, value, index, data, timeout=None):
-        if timeout is None:
-            timeout = 1000
-        dev.controlWrite(request_type,
-                         request,
-                         value,
-                         index,
-                         data,
-                         timeout=timeout)
-
-    return bulkRead, bulkWrite, controlRead, controlWrite
+    '''Return bulkRead, bulkWrite, controlRead, controlWrite for dev'''
+    return transport(dev).wraps
 
 
 do_exception = True
 do_hexdump = True
 do_str2hex = True
 
+# Most recent validation failure (Mismatch), if any
+last_mismatch = None
+
+
+class Mismatch(object):
+    '''Validation failure details. Only formatted when printed'''
+    def __init__(self, msg, expecteds, actual):
+        self.msg = msg
+        self.expecteds = expecteds
+        self.actual = actual
+
+    def fmt_buff(self, label, buff):
+        if type(buff) is int:
+            return ['  %s; %d 0x%04X' % (label, buff, buff)]
+        ret = []
+        if do_str2hex:
+            ret.append('  %s; %d' % (label, len(buff)))
+            ret.append(str2hex(buff, prefix='    '))
+        else:
+            ret.append('  %s:   %d %s' %
+                       (label, len(buff), binascii.hexlify(buff)))
+        if do_hexdump:
+            f = StringIO()
+            hexdump(buff, indent='    ', f=f)
+            ret.append(f.getvalue().rstrip('\n'))
+        return ret
+
+    def __str__(self):
+        lines = ['Failed %s' % self.msg]
+        for expected in self.expecteds:
+            lines += self.fmt_buff('Expected', expected)
+        lines += self.fmt_buff('Actual', self.actual)
+        return '\n'.join(lines)
+
+
+class ValidateError(Exception):
+    def __init__(self, mismatch):
+        Exception.__init__(self, 'failed validate: %s' % mismatch.msg)
+        self.mismatch = mismatch
+
+    def __str__(self):
+        return '%s\n%s' % (self.args[0], self.mismatch)
+
+
+def validate_fail(mismatch):
+    global last_mismatch
+
+    last_mismatch = mismatch
+    if do_exception:
+        raise ValidateError(mismatch)
+    print(mismatch)
+
 
 def validate_read(expected, actual, msg):
-    if expected is None:
+    # Fast path: a single comparison
+    if expected is None or actual == expected:
         return
-    validate_readv([expected], actual, msg)
+    if type(actual) is int:
+        return validate_readiv([expected], actual, msg)
+    validate_fail(Mismatch(msg, [expected], actual))
 
 
 def validate_readv(expecteds, actual, msg):
@@ -101,35 +445,10 @@ def validate_readv(expecteds, actual, msg):
         return
     if type(actual) is int:
         return validate_readiv(expecteds, actual, msg)
-
     if actual not in expecteds:
-        print(('Failed %s' % msg))
-        for expected in expecteds:
-            if do_str2hex:
-                print(('  Expected; %d' % (len(expected), )))
-                print((str2hex(expected, prefix='    ')))
-            else:
-                print(('  Expected:   %d %s' %
-                       (len(expected), binascii.hexlify(expected))))
-            if do_hexdump:
-                hexdump(expected, indent='    ')
-        if do_str2hex:
-            print(('  Actual; %d' % (len(actual), )))
-            print((str2hex(actual, prefix='    ')))
-        else:
-            print(('  Actual:   %d %s' %
-                   (len(actual), binascii.hexlify(actual))))
-        if do_hexdump:
-            hexdump(actual, indent='    ')
-        if do_exception:
-            raise Exception('failed validate: %s' % msg)
+        validate_fail(Mismatch(msg, expecteds, actual))
 
 
 def validate_readiv(expecteds, actual, msg):
     if actual not in expecteds:
-        print(('Failed %s' % msg))
-        for expected in expecteds:
-            print(('  Expected; %d 0x%04X' % (expected, expected)))
-        print(('  Actual; %d 0x%04X' % (actual, actual)))
-        if do_exception:
-            raise Exception('failed validate: %s' % msg)
+        validate_fail(Mismatch(msg, expecteds, actual))
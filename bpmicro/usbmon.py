@@ -0,0 +1,212 @@
+'''
+Linux usbmon capture reader (pcap / pcapng as saved by Wireshark or tcpdump)
+
+Replaces the usbrply -j round trip for scrape.py: packets are produced
+while the file is read, one frame in memory at a time
+
+Packets are packet.Packet records, in URB completion order
+-packn: (submit, complete) capture frame numbers (1 based, as Wireshark shows them)
+-ts: (submit, complete) capture timestamps, seconds
+
+Only the selected device is kept (default: highest device number, which is
+the FX2 after it re-enumerates with firmware loaded)
+Standard (enumeration) control requests are dropped, as with usbrply --no-setup
+'''
+
+from bpmicro.packet import Packet
+
+import struct
+from collections import namedtuple
+
+LINKTYPE_USB_LINUX = 189
+LINKTYPE_USB_LINUX_MMAPPED = 220
+
+# struct usbmon_packet, host (little) endian
+# The mmapped variant adds interval, start_frame, xfer_flags, ndesc
+usbmon_hdr = struct.Struct('<QcBBBHccqiiII8s')
+usbmon_hdr_lens = {
+    LINKTYPE_USB_LINUX: 48,
+    LINKTYPE_USB_LINUX_MMAPPED: 64,
+}
+setup_fmt = struct.Struct('<BBHHH')
+
+XFER_ISO = 0
+XFER_INTR = 1
+XFER_CONTROL = 2
+XFER_BULK = 3
+
+PCAPNG_SHB = b'\x0A\x0D\x0D\x0A'
+PCAPNG_IDB = 1
+PCAPNG_SPB = 3
+PCAPNG_EPB = 6
+
+Urb = namedtuple('Urb', ('id', 'event', 'xfer', 'endp', 'dev', 'ts', 'status',
+                         'setup', 'data'))
+
+
+class CaptureError(Exception):
+    pass
+
+
+def pcap_frames(f, magic):
+    '''Yield (linktype, frame) from a classic pcap file'''
+    if magic in (b'\xD4\xC3\xB2\xA1', b'\x4D\x3C\xB2\xA1'):
+        e = '<'
+    elif magic in (b'\xA1\xB2\xC3\xD4', b'\xA1\xB2\x3C\x4D'):
+        e = '>'
+    else:
+        raise CaptureError("Not a pcap or pcapng file")
+    linktype = struct.unpack(e + 'HHiIII', f.read(20))[5]
+    rec = struct.Struct(e + 'IIII')
+    while True:
+        hdr = f.read(rec.size)
+        if len(hdr) < rec.size:
+            return
+        _ts_sec, _ts_usec, caplen, _origlen = rec.unpack(hdr)
+        yield linktype, f.read(caplen)
+
+
+def pcapng_frames(f):
+    '''Yield (linktype, frame) from a pcapng file'''
+    e = '<'
+    # Interface index => link type, per section
+    linktypes = []
+    while True:
+        btype = f.read(4)
+        if len(btype) < 4:
+            return
+        if btype == PCAPNG_SHB:
+            blen = f.read(4)
+            bom = f.read(4)
+            if bom == b'\x4D\x3C\x2B\x1A':
+                e = '<'
+            elif bom == b'\x1A\x2B\x3C\x4D':
+                e = '>'
+            else:
+                raise CaptureError("Bad pcapng byte order magic")
+            f.read(struct.unpack(e + 'I', blen)[0] - 12)
+            linktypes = []
+            continue
+        btype, blen = struct.unpack(e + 'II', btype + f.read(4))
+        body = f.read(blen - 12)
+        f.read(4)
+        if btype == PCAPNG_IDB:
+            linktypes.append(struct.unpack_from(e + 'H', body, 0)[0])
+        elif btype == PCAPNG_EPB:
+            ifid, _ts_hi, _ts_lo, caplen, _origlen = struct.unpack_from(
+                e + 'IIIII', body, 0)
+            yield linktypes[ifid], body[20:20 + caplen]
+        elif btype == PCAPNG_SPB:
+            origlen = struct.unpack_from(e + 'I', body, 0)[0]
+            yield linktypes[0], body[4:4 + origlen]
+
+
+def frames(f):
+    '''Yield (linktype, frame) from an open pcap or pcapng file'''
+    magic = f.read(4)
+    if magic == PCAPNG_SHB:
+        f.seek(0)
+        return pcapng_frames(f)
+    return pcap_frames(f, magic)
+
+
+def urb_decode(linktype, frame):
+    hdr_len = usbmon_hdr_lens.get(linktype)
+    if hdr_len is None:
+        raise CaptureError("Link type %u is not usbmon" % linktype)
+    (urb_id, event, xfer, endp, devnum, busnum, _flag_setup, _flag_data,
+     ts_sec, ts_usec, status, _length, _len_cap,
+     setup) = usbmon_hdr.unpack_from(frame, 0)
+    return Urb(urb_id, event, xfer, endp, (busnum, devnum),
+               ts_sec + ts_usec / 1e6, status, setup, frame[hdr_len:])
+
+
+def urbs(fn):
+    '''Yield (frame number, Urb) for every usbmon event in a capture'''
+    with open(fn, 'rb') as f:
+        for framen, (linktype, frame) in enumerate(frames(f), 1):
+            yield framen, urb_decode(linktype, frame)
+
+
+def device_hi(fn):
+    '''
+    (bus, device) with the highest device number
+    Header only scan, used when no device is given
+    '''
+    ret = None
+    for _framen, urb in urbs(fn):
+        if urb.xfer in (XFER_CONTROL, XFER_BULK) and (ret is None
+                                                     or urb.dev[1] > ret[1]):
+            ret = urb.dev
+    return ret
+
+
+def urb_packet(submit, submitn, complete, completen):
+    '''Paired submit / complete => Packet, None to drop'''
+    packn = (submitn, completen)
+    ts = (submit.ts, complete.ts)
+    if submit.xfer == XFER_BULK:
+        if submit.endp & 0x80:
+            if complete.status or not complete.data:
+                # Cancelled / failed read
+                return None
+            return Packet('bulkRead',
+                          data=complete.data,
+                          packn=packn,
+                          ts=ts,
+                          endp=submit.endp)
+        return Packet('bulkWrite',
+                      data=submit.data,
+                      packn=packn,
+                      ts=ts,
+                      endp=submit.endp)
+
+    request_type, request, value, index, length = setup_fmt.unpack(
+        submit.setup)
+    # Standard requests: enumeration etc
+    if not request_type & 0x60:
+        return None
+    if request_type & 0x80:
+        t = 'controlRead'
+        data = complete.data
+    else:
+        t = 'controlWrite'
+        data = submit.data
+    return Packet(t,
+                  data=data,
+                  packn=packn,
+                  ts=ts,
+                  bRequestType=request_type,
+                  bRequest=request,
+                  wValue=value,
+                  wIndex=index,
+                  wLength=length)
+
+
+def packets(fn, device=None, bus=None):
+    '''
+    Yield Packet records from a usbmon capture
+    device / bus: device number / bus to keep. None => highest device number
+    '''
+    if device is None:
+        dev = device_hi(fn)
+        if dev is None:
+            return
+        bus, device = dev
+    # URB id => (frame number, submit Urb)
+    pending = {}
+    for framen, urb in urbs(fn):
+        if urb.dev[1] != device or (bus is not None and urb.dev[0] != bus):
+            continue
+        if urb.xfer not in (XFER_CONTROL, XFER_BULK):
+            continue
+        if urb.event == b'S':
+            pending[urb.id] = (framen, urb)
+            continue
+        submit = pending.pop(urb.id, None)
+        # Completion of a URB submitted before the capture started, or submit error
+        if submit is None or urb.event != b'C':
+            continue
+        p = urb_packet(submit[1], submit[0], urb, framen)
+        if p is not None:
+            yield p
@@ -8,10 +8,10 @@ import sys
 import struct
 
 from bpmicro.cmd import *
-from bpmicro.mcs51 import i87c51_fw
 from bpmicro.util import hexdump, add_bool_arg
 from bpmicro.util import str2hex
 from bpmicro import startup
+from bpmicro import fw
 import subprocess
 
 
@@ -202,7 +202,7 @@ def replay(dev):
     bulkWrite(0x02, cmd_20_mk() + cmd_50_mk("\x7D\x02"))
 
     # Generated from packet 201/202
-    buff = bulk2(dev, i87c51_fw.p201, target=0x02, truncate=True)
+    buff = bulk2(dev, fw.hash2bin["7497e05e"], target=0x02, truncate=True)
     # Discarded 510 / 512 bytes => 2 bytes
     validate_read("\x82\x00", buff, "packet W: 201/202, R: 203/204")
 
@@ -231,7 +231,7 @@ def replay(dev):
 
     # p221.bin: DOS executable (COM)
     # Generated from packet 221/222
-    buff = bulk2(dev, i87c51_fw.p221, target=0x02, truncate=True)
+    buff = bulk2(dev, fw.hash2bin["88f9baa0"], target=0x02, truncate=True)
     # Discarded 510 / 512 bytes => 2 bytes
     validate_read("\x84\x00", buff, "packet W: 221/222, R: 223/224")
 
@@ -250,7 +250,7 @@ def replay(dev):
     cmd_50(dev, "\xDE\x03")
 
     # Generated from packet 233/234
-    buff = bulk2(dev, i87c51_fw.p233, target=0x02, truncate=True)
+    buff = bulk2(dev, fw.hash2bin["941e9ec9"], target=0x02, truncate=True)
     # Discarded 510 / 512 bytes => 2 bytes
     validate_read("\x85\x00", buff, "packet W: 233/234, R: 235/236")
 
@@ -0,0 +1,61 @@
+from bpmicro import daemon
+from bpmicro.util import add_bool_arg, hexdump
+
+import json
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Keep the programmer initialized between jobs')
+    parser.add_argument('--socket',
+                        default=daemon.DEFAULT_SOCKET,
+                        help='Unix socket to serve / connect to')
+    add_bool_arg(parser, '--cont', default=True, help='Continuity check')
+    add_bool_arg(parser, '--verbose', default=False, help='More verbose output')
+    parser.add_argument(
+        'operation',
+        help='serve, read, program, list_device, init, shutdown')
+    parser.add_argument('device', nargs='?', help='Device to use')
+    parser.add_argument('code', nargs='?', help='Read/write code file')
+    parser.add_argument('data', nargs='?', help='Read/write data file')
+    args = parser.parse_args()
+
+    if args.operation == 'serve':
+        daemon.Server(args.socket, verbose=args.verbose).serve()
+        return
+
+    client = daemon.Client(args.socket)
+    opts = {'cont': args.cont, 'verbose': args.verbose}
+    if args.operation == 'read':
+        devcfg = client.read(args.device, opts)
+        if args.code:
+            open(args.code, 'wb').write(devcfg['code'])
+            if args.data and devcfg.get('data') is not None:
+                open(args.data, 'wb').write(devcfg['data'])
+            if devcfg.get('config') is not None:
+                print(json.dumps(devcfg['config'], sort_keys=True))
+        else:
+            hexdump(devcfg['code'], indent='  ', label='Code')
+    elif args.operation == 'program':
+        devcfg = {'code': open(args.code, 'rb').read()}
+        if args.data:
+            devcfg['data'] = open(args.data, 'rb').read()
+        client.program(args.device, devcfg, opts)
+    elif args.operation == 'list_device':
+        print('Devices:')
+        for device in client.list_device():
+            print(device)
+    elif args.operation == 'init':
+        client.init()
+    elif args.operation == 'shutdown':
+        client.shutdown()
+    else:
+        raise Exception("Bad operation %s" % args.operation)
+    client.close()
+    print('Complete')
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,50 @@
 from bpmicro import startup
 from bpmicro import devices
+from bpmicro import cmd
+from bpmicro import bench
+from bpmicro import batch
+from bpmicro.usb import USBStats
 from bpmicro.util import hexdump, add_bool_arg
 
+import hashlib
 import json
 import os
 
 
+def read_stream(device, opts, fns, extra):
+    '''
+    Write device regions to files as they are read
+    fns: region => file name. Regions with no file are only digested
+    extra: receives non buffer devcfg entries (ex: config)
+    Return region => (size, md5 hex, sha256 hex)
+    '''
+    fs = {}
+    # region => [size, md5, sha256]
+    digests = {}
+    try:
+        for region, offset, buff in device.read_stream(opts, extra=extra):
+            d = digests.get(region)
+            if d is None:
+                d = [0, hashlib.md5(), hashlib.sha256()]
+                digests[region] = d
+                if fns.get(region):
+                    fs[region] = open(fns[region], 'wb')
+            if offset != d[0]:
+                raise Exception("%s: expected offset 0x%04X, got 0x%04X" %
+                                (region, d[0], offset))
+            d[0] += len(buff)
+            d[1].update(buff)
+            d[2].update(buff)
+            f = fs.get(region)
+            if f:
+                f.write(buff)
+    finally:
+        for f in fs.values():
+            f.close()
+    return dict((region, (d[0], d[1].hexdigest(), d[2].hexdigest()))
+                for region, d in digests.items())
+
+
 def run(operation,
         device,
         code_fn,
@@ -16,83 +55,162 @@ def run(operation,
         verify,
         verbose,
         dir_,
-        init=True):
+        init=True,
+        async_depth=0,
+        coalesce=False,
+        replay=None,
+        capture_dir='captures',
+        bench_out=None,
+        baseline=None,
+        stats=False,
+        reload=False,
+        fast=False,
+        cache_eeprom=False,
+        batch_log=None,
+        upload_window=1):
     device_str = device
     '''
     Device: chip model
     '''
     bp = None
     device = None
-    if operation != 'list_device':
-        bp = startup.get(verbose=verbose, init=init)
-        if operation != 'nop':
-            device = devices.get(bp, device_str, verbose=verbose)
-
-    opts = {
-        'cont': cont,
-        'erase': erase,
-        'verify': verify,
-        'verbose': verbose,
-    }
-
-    if operation == 'list_device':
-        print('Devices:')
-        for device in sorted(devices.class_s2c.keys()):
-            print(device)
-    elif operation == 'nop':
-        pass
-    elif operation == 'program':
-        devcfg = {}
-        devcfg['code'] = open(code_fn, 'r').read()
-        if data_fn:
-            devcfg['data'] = open(data_fn, 'r').read()
-        if config_fn:
-            devcfg['config'] = open(config_fn, 'r').read()
-        device.program(devcfg, opts)
-    elif operation == 'verify':
-        raise Exception('FIXME')
-    elif operation == 'compare':
-        raise Exception('FIXME')
-    elif operation == 'read':
-        devcfg = device.read(opts)
-        code = devcfg['code']
-        data = devcfg.get('data', None)
-        config = devcfg.get('config', None)
-        if not code_fn:
-            print("")
-            hexdump(code, indent='  ', label='Code')
+    cmd.coalesce = coalesce
+    cmd.fast = fast
+    cmd.cache_eeprom = cache_eeprom
+    cmd.upload_window = upload_window
+    usb_stats = USBStats() if stats else None
+    try:
+        if operation not in ('list_device', 'bench'):
+            if replay:
+                bp = startup.get_replay(replay,
+                                        verbose=verbose,
+                                        stats=usb_stats)
+            else:
+                bp = startup.get(verbose=verbose,
+                                 init=init,
+                                 async_depth=async_depth,
+                                 stats=usb_stats,
+                                 reload=reload)
+            if operation not in ('nop', 'batch'):
+                device = devices.get(bp, device_str, verbose=verbose)
 
-            if data:
-                print("")
-                hexdump(data, indent='  ', label='Data')
+        opts = {
+            'cont': cont,
+            'erase': erase,
+            'verify': verify,
+            'verbose': verbose,
+        }
 
-            if config:
+        if operation == 'list_device':
+            print('Devices:')
+            for device in sorted(devices.class_s2c.keys()):
+                info = devices.device_s2info[device]
+                print(('  %-12s %-48s %s' % (device, info.desc, ', '.join(info.ops))))
+        elif operation == 'nop':
+            pass
+        elif operation == 'bench':
+            device_names = None
+            if device_str and device_str != 'all':
+                device_names = [device_str]
+            if fast:
+                _normal, results, diffs = bench.run_fast(
+                    capture_dir,
+                    device_names=device_names,
+                    opts={'cont': cont},
+                    verbose=True)
+                for name, k in diffs:
+                    print(('FAST MISMATCH %s: %s differs' % (name, k)))
+                if diffs:
+                    raise Exception("fast mode changed %u results" %
+                                    len(diffs))
+            else:
+                results = bench.run(capture_dir,
+                                    device_names=device_names,
+                                    opts={'cont': cont},
+                                    verbose=True)
+            if bench_out:
+                bench.save(results, bench_out)
+            if baseline:
+                regressions = bench.compare(bench.load(baseline), results)
+                for name, k, base, cur in regressions:
+                    print(('REGRESSION %s %s: %s => %s' %
+                           (name, k, base, cur)))
+                if regressions:
+                    raise Exception("%u regressions" % len(regressions))
+        elif operation == 'batch':
+            # device: job manifest
+            batch.Station(bp, log_fn=batch_log,
+                          verbose=verbose).run(batch.load_manifest(device_str))
+        elif operation == 'program':
+            devcfg = {}
+            devcfg['code'] = open(code_fn, 'r').read()
+            if data_fn:
+                devcfg['data'] = open(data_fn, 'r').read()
+            if config_fn:
+                devcfg['config'] = open(config_fn, 'r').read()
+            device.program(devcfg, opts)
+        elif operation == 'verify':
+            raise Exception('FIXME')
+        elif operation == 'compare':
+            raise Exception('FIXME')
+        elif operation == 'read':
+            if not code_fn:
+                devcfg = device.read(opts)
+                code = devcfg['code']
+                data = devcfg.get('data', None)
+                config = devcfg.get('config', None)
                 print("")
-                print('Configuration')
-                device.print_config(config)
-        else:
-            if dir_:
-                if not os.path.exists(code_fn):
-                    os.mkdir(code_fn)
-                open(os.path.join(code_fn, 'code.bin'), 'w').write(code)
-                open(os.path.join(code_fn, 'data.bin'), 'w').write(data)
-                open(os.path.join(code_fn, 'config.json'),
-                     'w').write(json.dumps(config))
+                hexdump(code, indent='  ', label='Code')
+
+                if data:
+                    print("")
+                    hexdump(data, indent='  ', label='Data')
+
+                if config:
+                    print("")
+                    print('Configuration')
+                    device.print_config(config)
             else:
-                print(('Writing to %s' % code_fn))
-                open(code_fn, 'w').write(code)
-
-        print('Complete')
-    elif operation == 'sum':
-        raise Exception('FIXME')
-    elif operation == 'blank':
-        raise Exception('FIXME')
-    elif operation == 'erase':
-        raise Exception('FIXME')
-    elif operation == 'secure':
-        raise Exception('FIXME')
-    else:
-        raise Exception("Bad operation %s" % operation)
+                if dir_:
+                    if not os.path.exists(code_fn):
+                        os.mkdir(code_fn)
+                    fns = {
+                        'code': os.path.join(code_fn, 'code.bin'),
+                        'data': os.path.join(code_fn, 'data.bin'),
+                    }
+                else:
+                    print(('Writing to %s' % code_fn))
+                    fns = {'code': code_fn, 'data': data_fn}
+                extra = {}
+                digests = read_stream(device, opts, fns, extra)
+                if dir_:
+                    open(os.path.join(code_fn, 'config.json'),
+                         'w').write(json.dumps(extra.get('config')))
+                if verbose:
+                    for region, (size, md5, sha256) in sorted(digests.items()):
+                        print(('%s: %u bytes, md5 %s, sha256 %s' %
+                               (region, size, md5, sha256)))
+
+            print('Complete')
+        elif operation == 'sum':
+            raise Exception('FIXME')
+        elif operation == 'blank':
+            raise Exception('FIXME')
+        elif operation == 'erase':
+            raise Exception('FIXME')
+        elif operation == 'secure':
+            raise Exception('FIXME')
+        else:
+            raise Exception("Bad operation %s" % operation)
+
+        if fast and verbose and cmd.ro_skipped:
+            print(('Skipped read only steps: %s' % ', '.join(
+                '%s x%u' % (k, v) for k, v in sorted(cmd.ro_skipped.items()))))
+    finally:
+        # Failed runs are the ones worth profiling
+        if usb_stats:
+            print("")
+            usb_stats.dump()
 
 
 def main():
@@ -118,10 +236,62 @@ def main():
                  '--init',
                  default=True,
                  help='Advanced / developer only')
+    add_bool_arg(parser,
+                 '--reload',
+                 default=False,
+                 help='Load adapter firmware even if it is already running')
+    add_bool_arg(
+        parser,
+        '--fast',
+        default=False,
+        help='Trusted mode: skip read only verification steps. bench: check against normal mode'
+    )
+    add_bool_arg(parser,
+                 '--stats',
+                 default=False,
+                 help='Print per opcode USB timing statistics when done')
+    add_bool_arg(parser,
+                 '--coalesce',
+                 default=False,
+                 help='Pack write only commands and 0x57 groups into fewer USB transfers')
+    add_bool_arg(parser,
+                 '--cache-eeprom',
+                 default=False,
+                 help='Read socket module / adapter EEPROMs once per SM insertion')
+    parser.add_argument(
+        '--async-depth',
+        type=int,
+        default=0,
+        help='Keep this many bulk reads queued (0: synchronous reads)')
+    parser.add_argument(
+        '--upload-window',
+        type=int,
+        default=1,
+        help='Upload chunks kept in flight (1: stop-and-wait as BPWin. Experimental)')
+    parser.add_argument(
+        '--replay',
+        default=None,
+        help='Simulate the programmer from a usbrply JSON capture')
+    parser.add_argument('--capture-dir',
+                        default='captures',
+                        help='bench: directory of replay captures')
+    parser.add_argument('--bench-out',
+                        default=None,
+                        help='bench: save results JSON')
+    parser.add_argument('--baseline',
+                        default=None,
+                        help='bench: flag regressions against results JSON')
+    parser.add_argument('--batch-log',
+                        default='batch.jsonl',
+                        help='batch: per part results log (JSON lines)')
     parser.add_argument(
         'operation',
-        help='Operation: read, program, erase, protect, list_device, nop')
-    parser.add_argument('device', nargs='?', help='Device to use')
+        help=
+        'Operation: read, program, erase, protect, list_device, nop, bench, batch'
+    )
+    parser.add_argument('device',
+                        nargs='?',
+                        help='Device to use. batch: job manifest')
     parser.add_argument(
         'code',
         nargs='?',
@@ -149,7 +319,19 @@ def main():
         verify=args.verify,
         verbose=args.verbose,
         dir_=args.dir,
-        init=args.init)
+        init=args.init,
+        async_depth=args.async_depth,
+        coalesce=args.coalesce,
+        replay=args.replay,
+        capture_dir=args.capture_dir,
+        bench_out=args.bench_out,
+        baseline=args.baseline,
+        stats=args.stats,
+        reload=args.reload,
+        fast=args.fast,
+        cache_eeprom=args.cache_eeprom,
+        batch_log=args.batch_log,
+        upload_window=args.upload_window)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,19 @@
 from bpmicro.util import str2hex
 
-import json
-import binascii
-import subprocess
+import multiprocessing
 import os
+import re
 import sys
+import traceback
+from collections import deque
 
 from bpmicro.cmd import led_i2s
 from bpmicro.util import hexdump
 from bpmicro.util import add_bool_arg
 from bpmicro import fw
+from bpmicro import packet
+from bpmicro import proto
+from bpmicro import usbmon
 
 fout = sys.stdout
 args = None
@@ -17,6 +21,9 @@ args = None
 prefix = ' ' * 8
 indent = ''
 line_buff = []
+# When not None, lines_commit() appends each committed block (list of lines)
+# here instead of writing it. See Scraper.dump / loop_emit
+blocks = None
 
 
 def lines_clear():
@@ -24,6 +31,10 @@ def lines_clear():
 
 
 def lines_commit():
+    if blocks is not None:
+        blocks.append(list(line_buff))
+        del line_buff[:]
+        return
     for line in line_buff:
         fout.write(line + '\n')
     del line_buff[:]
@@ -45,6 +56,17 @@ def dec_indent():
 
 dumb = False
 omit_ro = True
+# Payloads at least this big are stored as new fw blobs. None: never
+big_thresh = None
+# Collapse repeated statements into loops (see loop_emit)
+loops = True
+# Emit varying cmd_57s() runs as one cmd_57s_batch() call
+# Fewer transfers with cmd.coalesce, but no longer replays against the capture
+batch57 = False
+# Fewest repeats worth a loop
+LOOP_MIN = 4
+# Longest repeating statement sequence looked for
+LOOP_PERIOD_MAX = 8
 
 
 def emit_ro():
@@ -69,7 +91,7 @@ def fmt_terse(data, pktn=None):
         hash_used.add(h)
         return 'fw.hash2bin["%s"]' % h
 
-    if args and args.big_thresh and pktn and len(data) >= args.big_thresh:
+    if big_thresh and pktn and len(data) >= big_thresh:
         fw.hash2bin[h] = data
         hash_used.add(h)
         return 'fw.hash2bin["%s"]' % h
@@ -107,6 +129,101 @@ def pkt_strip(p):
         raise Exception("Bad size")
 
 
+# Statements whose expected reply may vary between loop iterations
+re_validate = re.compile(r'(\s*)validate_read\((.*), buff, "([^"]*)"\)$', re.S)
+re_57s = re.compile(r'(\s*)cmd\.cmd_57s\(dev, ("[^"]*"), (.*)\)$', re.S)
+
+
+def stmt_parse(block):
+    '''
+    Committed block of lines => (key, stmts)
+    stmts: (kind, line, match) per non comment line
+    -kind None: must repeat verbatim
+    -kind "validate" / "57s": expected reply may vary
+    key: what must be equal for two blocks to be repeats of each other
+    '''
+    stmts = []
+    key = []
+    for l in block:
+        s = l.strip()
+        if not s or s.startswith('#'):
+            continue
+        m = re_validate.match(l)
+        if m:
+            stmts.append(('validate', l, m))
+            key.append(('validate', ))
+            continue
+        m = re_57s.match(l)
+        if m:
+            stmts.append(('57s', l, m))
+            key.append(('57s', m.group(2)))
+            continue
+        stmts.append((None, l, None))
+        key.append((None, l))
+    return tuple(key), stmts
+
+
+def loop_find(keys, i):
+    '''
+    Longest run of repeats starting at block i
+    Return (period, repeats), fewest statements per iteration on ties
+    '''
+    return proto.repeat_find(keys, i, LOOP_PERIOD_MAX, LOOP_MIN)
+
+
+def loop_write(parsed, period, reps):
+    '''
+    Write reps iterations of period blocks as one loop
+    Replies that are the same every iteration are still checked
+    Varying cmd_57s() replies are not checked. With batch57 a run of a lone
+    cmd_57s() becomes a cmd_57s_batch() call instead
+    '''
+    body = parsed[0:period]
+
+    def varies(j, k):
+        exps = set()
+        for rep in range(reps):
+            m = parsed[rep * period + j][1][k][2]
+            exps.add(m.group(2) if m.re is re_validate else m.group(3))
+        return len(exps) > 1
+
+    stmts = body[0][1]
+    if batch57 and period == 1 and len(
+            stmts) == 1 and stmts[0][0] == '57s' and varies(0, 0):
+        m = stmts[0][2]
+        line('# %u repeats' % reps)
+        line('cmd.cmd_57s_batch(dev, [%s] * %u)' % (m.group(2), reps))
+        lines_commit()
+        return
+
+    line('# %u repeats of %u statement(s)' % (reps, period))
+    line('for _i in range(%u):' % reps)
+    for j, (_key, stmts) in enumerate(body):
+        for k, (kind, l, m) in enumerate(stmts):
+            if kind == 'validate' and varies(j, k):
+                l = '%s# Reply varies: not checked' % m.group(1)
+            elif kind == '57s' and varies(j, k):
+                l = '%scmd.cmd_57s(dev, %s, None)' % (m.group(1), m.group(2))
+            line_buff.append('    ' + l)
+    lines_commit()
+
+
+def loop_emit(blocks_):
+    '''Write committed blocks, collapsing repeated runs into loops'''
+    parsed = [stmt_parse(block) for block in blocks_]
+    keys = [key for key, _stmts in parsed]
+    i = 0
+    while i < len(blocks_):
+        period, reps = loop_find(keys, i)
+        if reps < LOOP_MIN:
+            line_buff.extend(blocks_[i])
+            lines_commit()
+            i += 1
+            continue
+        loop_write(parsed[i:i + period * reps], period, reps)
+        i += period * reps
+
+
 class CmpFail(Exception):
     pass
 
@@ -136,42 +253,72 @@ class OutOfPackets(Exception):
     pass
 
 
+class Lookahead(object):
+    '''Packet iterator with a small peek buffer'''
+    def __init__(self, ps):
+        self.it = iter(ps)
+        self.buff = deque()
+
+    def peek(self, n=0):
+        '''n packets ahead, None past the end'''
+        while len(self.buff) <= n:
+            try:
+                self.buff.append(next(self.it))
+            except StopIteration:
+                return None
+        return self.buff[n]
+
+    def pop(self):
+        '''Next packet, None past the end'''
+        if self.peek() is None:
+            return None
+        return self.buff.popleft()
+
+
 class Scraper(object):
     def __init__(self):
-        # Packets
+        # Packets (Lookahead)
         self.ps = None
-        # Packets index
+        # Packets consumed
         self.pi = None
 
     def nextp(self):
-        ppi = self.pi + 1
+        '''Consume and return the next non comment packet'''
+        started = self.pi
         while True:
-            if ppi >= len(self.ps):
+            p = self.ps.pop()
+            if p is None:
                 raise OutOfPackets("Out of packets, started packet %d, at %d" %
-                                   (self.pi, ppi))
-            p = self.ps[ppi]
-            if p['type'] != 'comment':
-                return ppi, p
-            ppi = ppi + 1
+                                   (started, self.pi))
+            self.pi += 1
+            if p.type != 'comment':
+                return p
 
     def peekp(self):
-        return self.nextp()[1]
+        n = 0
+        while True:
+            p = self.ps.peek(n)
+            if p is None:
+                raise OutOfPackets("Out of packets at %d" % (self.pi, ))
+            if p.type != 'comment':
+                return p
+            n += 1
 
     def eat_packet(self, type=None, req=None, val=None, ind=None, len=None):
-        p = self.ps[self.pi + 1]
+        p = self.nextp()
 
-        if type and type != p['type']:
+        if type and type != p.type:
             raise Exception()
-        if req and type != p['bRequest']:
+        if req and req != p.bRequest:
             raise Exception()
-        if val and type != p['wValue']:
+        if val and val != p.wValue:
             raise Exception()
-        if ind and type != p['wIndex']:
+        if ind and ind != p.wIndex:
             raise Exception()
-        if len and len != p['wLength']:
+        if len and len != p.wLength:
             raise Exception()
 
-        return self.pi + 1
+        return p
 
     def check_bulk2(self, cmd):
         # Sample
@@ -179,19 +326,18 @@ class Scraper(object):
         return True
 
     def bulk2(self, p_w, p_rs):
-        cmd = binascii.unhexlify(p_w['data'])
+        cmd = p_w.data
         reply_all = self.bulk2_combine_packets(p_rs)
 
         pack_str = 'packet W: %s/%s, R %d to %s/%s' % (
-            p_w['packn'][0], p_w['packn'][1], len(p_rs), p_rs[-1]['packn'][0],
-            p_rs[-1]['packn'][1])
-        line('buff = cmd.bulk2b(dev, %s)' %
-             (fmt_terse(cmd, p_w['packn'][0]), ))
+            p_w.packn[0], p_w.packn[1], len(p_rs), p_rs[-1].packn[0],
+            p_rs[-1].packn[1])
+        line('buff = cmd.bulk2b(dev, %s)' % (fmt_terse(cmd, p_w.packn[0]), ))
 
         if self.check_bulk2(cmd):
             #line('# Discarded %d / %d bytes => %d bytes' % (len(reply_full) - len(reply), len(reply_full), len(reply)))
             line('validate_read(%s, buff, "%s")' %
-                 (fmt_terse(reply_all, p_rs[-1]['packn'][0]), pack_str))
+                 (fmt_terse(reply_all, p_rs[-1].packn[0]), pack_str))
 
         startup_end_cmd = \
             "\x1D\x10\x01\x09\x00\x00\x00\x15\x60\x00\x00\x00\x00\x00\x00\x00" \
@@ -212,24 +358,22 @@ class Scraper(object):
             p_rs.append(p_r)
         while True:
             try:
-                if self.peekp()['type'] != 'bulkRead':
+                if self.peekp().type != 'bulkRead':
                     break
             except OutOfPackets:
                 break
-            self.pi, p_r = self.nextp()
-            p_rs.append(p_r)
+            p_rs.append(self.nextp())
         return p_rs
 
     def bulk2_combine_packets(self, p_rs):
-        reply_all = ''
+        replies = []
         for p_r in p_rs:
-            reply_full = binascii.unhexlify(p_r['data'])
-            reply, _truncate, pprefix = pkt_strip(reply_full)
-            reply_all += reply
+            reply, _truncate, pprefix = pkt_strip(p_r.data)
+            replies.append(reply)
             if pprefix != 0x08:
                 pprefix_str = ', prefix=0x%02X' % pprefix
                 raise Exception(pprefix_str)
-        return reply_all
+        return ''.join(replies)
 
     def bulk2_get_reply(self, p_r=None):
         '''
@@ -248,9 +392,9 @@ class Scraper(object):
         # Should have at least one reply
         prl = p_rs[-1]
 
-        cmd = binascii.unhexlify(p_w['data'])
+        cmd = p_w.data
         '''
-        reply_full = binascii.unhexlify(p_r['data'])
+        reply_full = p_r.data
         reply, _truncate, pprefix = pkt_strip(reply_full)
         if pprefix != 0x08:
             pprefix_str = ', prefix=0x%02X' % pprefix
@@ -258,8 +402,8 @@ class Scraper(object):
         '''
 
         line('# bulk2 aggregate: packet W: %s/%s, %d to R %s/%s' %
-             (p_w['packn'][0], p_w['packn'][1], len(p_rs), prl['packn'][0],
-              prl['packn'][1]))
+             (p_w.packn[0], p_w.packn[1], len(p_rs), prl.packn[0],
+              prl.packn[1]))
 
         if cmd == "\x01":
             if emit_ro():
@@ -356,20 +500,19 @@ class Scraper(object):
             self.bulk2(p_w, p_rs)
 
     def bulk86_next_read(self, p):
-        if p['type'] != 'bulkRead':
+        if p.type != 'bulkRead':
             raise Exception("Unexpected type")
-        if p['endp'] != 0x86:
+        if p.endp != 0x86:
             raise Exception("Unexpected endpoint")
-        reply_full = binascii.unhexlify(p['data'])
-        reply, _truncate, pprefix = pkt_strip(reply_full)
+        reply, _truncate, pprefix = pkt_strip(p.data)
         if pprefix != 0x08:
             pprefix_str = ', prefix=0x%02X' % pprefix
             raise Exception(pprefix_str)
         #line('# Discarded %d / %d bytes => %d bytes' % (len(reply_full) - len(reply), len(reply_full), len(reply)))
-        pack_str = 'packet %s/%s' % (p['packn'][0], p['packn'][1])
+        pack_str = 'packet %s/%s' % (p.packn[0], p.packn[1])
         line('_prefix, buff, _size = cmd.bulk86_next_read(dev)')
         line('validate_read(%s, buff, "%s")' %
-             (fmt_terse(reply, p['packn'][0]), pack_str))
+             (fmt_terse(reply, p.packn[0]), pack_str))
 
     def bulk_write(self, p):
         '''
@@ -377,19 +520,19 @@ class Scraper(object):
         '''
         # Not all 0x02 have readback
         # bulkWrite(0x%02X
-        if p['endp'] != 0x02:
-            cmd = binascii.unhexlify(p['data'])
+        if p.endp != 0x02:
+            cmd = p.data
             line('bulkWrite(0x%02X, %s)' %
-                 (p['endp'], fmt_terse(cmd, p['packn'][0])))
+                 (p.endp, fmt_terse(cmd, p.packn[0])))
         # Write followed by response read?
         # bulk2(
-        elif not dumb and self.peekp()['type'] == 'bulkRead':
+        elif not dumb and self.peekp().type == 'bulkRead':
             self.peek_bulk2(p)
         # Write without following readback
         else:
-            cmd = binascii.unhexlify(p['data'])
+            cmd = p.data
             if dumb:
-                line('bulkWrite(0x02, %s)' % (fmt_terse(cmd, p['packn'][0])))
+                line('bulkWrite(0x02, %s)' % (fmt_terse(cmd, p.packn[0])))
                 # peked not actually fetched
                 #bulk86_next_read(p)
             elif cmd == "\x09\x10\x57\x81\x00":
@@ -422,7 +565,7 @@ class Scraper(object):
                 cmp_mask("\x50\x00\x00\x00\x00", "\xFF\x00\x00\xFF\xFF", cmd)
                 line('cmd.cmd_50(dev, %s)' % (fmt_terse(cmd[1:3])))
             else:
-                line('bulkWrite(0x02, %s)' % (fmt_terse(cmd, p['packn'][0])))
+                line('bulkWrite(0x02, %s)' % (fmt_terse(cmd, p.packn[0])))
 
     def file_postfix(self):
 
@@ -502,7 +645,7 @@ if __name__ == "__main__":
 
         # remove all comments to make processing easier
         # we'll add our own anyway
-        # ps = filter(lambda p: p['type'] != 'comment', ps)
+        # ps = filter(lambda p: p.type != 'comment', ps)
 
         line('def replay(dev):')
         inc_indent()
@@ -511,13 +654,13 @@ if __name__ == "__main__":
 
     def parse_next(self, p):
         comment = False
-        if p['type'] == 'comment':
-            line('# %s' % p['v'])
+        if p.type == 'comment':
+            line('# %s' % p.v)
             comment = True
-        elif p['type'] == 'controlRead':
-            if not dumb and (p['bRequest'], p['wValue'], p['wIndex'],
-                             p['wLength']) == (0xC0, 0xB0, 0x0000, 0x0000):
-                pi = self.eat_packet('bulkRead')
+        elif p.type == 'controlRead':
+            if not dumb and (p.bRequest, p.wValue, p.wIndex,
+                             p.wLength) == (0xC0, 0xB0, 0x0000, 0x0000):
+                self.eat_packet('bulkRead')
                 line('cmd.readB0(dev)')
             else:
                 '''
@@ -528,45 +671,57 @@ if __name__ == "__main__":
                 validate_read("\x00\x00\x00", buff, "packet 6/7")
                 '''
                 line('buff = controlRead(0x%02X, 0x%02X, 0x%04X, 0x%04X, %d)' %
-                     (p['bRequestType'], p['bRequest'], p['wValue'],
-                      p['wIndex'], p['wLength']))
-                data = binascii.unhexlify(p['data'])
-                #line('# Req: %d, got: %d' % (p['wLength'], len(data)))
-                line('validate_read(%s, buff, "packet %s/%s")' % (fmt_terse(
-                    data, p['packn'][0]), p['packn'][0], p['packn'][1]))
-        elif p['type'] == 'controlWrite':
+                     (p.bRequestType, p.bRequest, p.wValue, p.wIndex,
+                      p.wLength))
+                data = p.data
+                #line('# Req: %d, got: %d' % (p.wLength, len(data)))
+                line('validate_read(%s, buff, "packet %s/%s")' %
+                     (fmt_terse(data, p.packn[0]), p.packn[0], p.packn[1]))
+        elif p.type == 'controlWrite':
             '''
             controlWrite(0x40, 0xB2, 0x0000, 0x0000, "")
             '''
-            data = binascii.unhexlify(p['data'])
             line('buff = controlWrite(0x%02X, 0x%02X, 0x%04X, 0x%04X, %s)' %
-                 (p['bRequestType'], p['bRequest'], p['wValue'], p['wIndex'],
-                  fmt_terse(data, pktn=p['packn'][0])))
-        elif p['type'] == 'bulkRead':
+                 (p.bRequestType, p.bRequest, p.wValue, p.wIndex,
+                  fmt_terse(p.data, pktn=p.packn[0])))
+        elif p.type == 'bulkRead':
             self.bulk86_next_read(p)
-        elif p['type'] == 'bulkWrite':
+        elif p.type == 'bulkWrite':
             self.bulk_write(p)
         else:
-            raise Exception("Unknown type: %s" % p['type'])
+            raise Exception("Unknown type: %s" % p.type)
         if not comment:
             lines_commit()
 
     def loop_postfix(self):
         pass
 
-    def dump(self, j, save=False):
+    def dump(self, ps, save=False):
+        '''ps: iterable of packet.Packet, consumed as it is scraped'''
         self.pi = 0
-        self.ps = j['data']
+        self.ps = Lookahead(ps)
 
         self.file_prefix()
+        lines_commit()
 
-        while self.pi < len(self.ps):
-            p = self.ps[self.pi]
-            self.parse_next(p)
-            self.pi += 1
+        global blocks
+        # dumb output stays one statement per packet
+        if loops and not dumb:
+            blocks = []
+        try:
+            while True:
+                p = self.ps.pop()
+                if p is None:
+                    break
+                self.pi += 1
+                self.parse_next(p)
 
-        self.loop_postfix()
-        lines_commit()
+            self.loop_postfix()
+            lines_commit()
+        finally:
+            blocks_, blocks = blocks, None
+        if blocks_ is not None:
+            loop_emit(blocks_)
         dec_indent()
 
         self.file_postfix()
@@ -578,21 +733,129 @@ if __name__ == "__main__":
         self.dump_fw(save)
 
 
-def load_json(fin, usbrply="", dumb=False):
-    if fin.find('.cap') >= 0 or fin.find('.pcapng') >= 0:
-        json_fn = '/tmp/scrape.json'
-        if dumb:
-            cmd = 'usbrply --no-packet-numbers --no-setup --no-comment --fx2 --device-hi %s -j %s >%s' % (
-                usbrply, fin, json_fn)
-        else:
-            cmd = 'usbrply --no-setup --comment --fx2 --device-hi %s -j %s >%s' % (
-                usbrply, fin, json_fn)
-        subprocess.check_call(cmd, shell=True)
-    else:
-        json_fn = fin
+def load_packets(fin, device=None):
+    '''
+    Iterate packet.Packet records from a usbmon capture (.cap, .pcap, .pcapng)
+    or usbrply JSON. Both are read incrementally
+    '''
+    if os.path.splitext(fin)[1] in ('.cap', '.pcap', '.pcapng'):
+        return usbmon.packets(fin, device=device)
+    return packet.json_packets(fin)
+
 
-    j = json.load(open(json_fn))
-    return j, json_fn
+# Capture extensions, preferred first when a directory has several per name
+capture_exts = ('.pcapng', '.pcap', '.cap', '.json')
+
+
+def batch_inputs(din):
+    '''Captures in din, one per base name'''
+    bases = {}
+    for fn in sorted(os.listdir(din)):
+        base, ext = os.path.splitext(fn)
+        if ext not in capture_exts:
+            continue
+        cur = bases.get(base)
+        if cur is None or capture_exts.index(ext) < capture_exts.index(
+                os.path.splitext(cur)[1]):
+            bases[base] = fn
+    return [os.path.join(din, fn) for _base, fn in sorted(bases.items())]
+
+
+def scrape_file(fin, fnout, device=None, dumb_=False, omit_ro_=True,
+                big_thresh_=None, loops_=True, batch57_=False):
+    '''
+    Scrape one capture into fnout
+    Return new fw blobs found (hash => data). They are not kept in fw.hash2bin
+    so results don't depend on what else this process scraped
+    '''
+    global fout, dumb, omit_ro, big_thresh, loops, batch57, indent
+
+    dumb = dumb_
+    loops = loops_
+    batch57 = batch57_
+    omit_ro = omit_ro_
+    big_thresh = big_thresh_
+    indent = ''
+    lines_clear()
+    hash_used.clear()
+    fout = open(fnout, 'w')
+    try:
+        Scraper().dump(load_packets(fin, device), save=False)
+    finally:
+        fout.close()
+        fout = sys.stdout
+        new = {}
+        for h in set(fw.hash2bin.loose) - hash_orig:
+            new[h] = fw.hash2bin.loose.pop(h)
+    return new
+
+
+def batch_job(job):
+    '''Pool worker: return (new fw blobs, error text or None)'''
+    try:
+        return scrape_file(*job), None
+    except Exception:
+        return {}, traceback.format_exc()
+
+
+def batch(din, device=None, omit_ro_=True, big_thresh_=None, save=False,
+          procs=None, loops_=True, batch57_=False):
+    '''
+    Scrape every capture in din to <name>.py and <name>_dumb.py in parallel
+    New fw blobs are merged once all jobs finish
+    A hash seen with two different contents is a collision: nothing is saved
+    '''
+    jobs = []
+    for fin in batch_inputs(din):
+        base = os.path.splitext(fin)[0]
+        for dumb_, fnout in ((False, base + '.py'), (True, base + '_dumb.py')):
+            jobs.append(
+                (fin, fnout, device, dumb_, omit_ro_, big_thresh_, loops_,
+                 batch57_))
+    pool = multiprocessing.Pool(procs)
+    try:
+        results = pool.map(batch_job, jobs)
+    finally:
+        pool.close()
+        pool.join()
+
+    # hash => (data, first capture seen in)
+    merged = {}
+    collisions = []
+    errors = 0
+    for job, (new, err) in zip(jobs, results):
+        fin, fnout = job[0:2]
+        if err:
+            errors += 1
+            print(('%s: FAILED' % fnout))
+            print(err)
+            continue
+        print(('%s: %u new firmwares' % (fnout, len(new))))
+        for h, data in sorted(new.items()):
+            cur = merged.get(h)
+            if cur is None:
+                merged[h] = (data, fin)
+            elif cur[0] != data and (h, cur[1], fin) not in collisions:
+                # Both jobs of a capture see the same blobs: report once
+                collisions.append((h, cur[1], fin))
+
+    print(('%u captures, %u outputs, %u failed, %u new firmwares' %
+           (len(jobs) // 2, len(jobs), errors, len(merged))))
+    for h, fin_a, fin_b in collisions:
+        print(('Hash collision! %s: %s vs %s' % (h, fin_a, fin_b)))
+    if collisions:
+        raise Exception("%u hash collisions, firmware not saved" %
+                        len(collisions))
+    if save and merged:
+        fw_dir = os.path.join(fw.FW_DIR, 'tmp')
+        if not os.path.exists(fw_dir):
+            os.mkdir(fw_dir)
+        for h, (data, _fin) in sorted(merged.items()):
+            fn = os.path.join(fw_dir, '%s.bin' % h)
+            assert not os.path.exists(fn), fn
+            open(fn, 'wb').write(data)
+        print(('Saved %u firmwares to %s' % (len(merged), fw_dir)))
+    return errors
 
 
 if __name__ == "__main__":
@@ -605,22 +868,91 @@ if __name__ == "__main__":
                  default=True,
                  help='Omit read only requests (ex: get SM info)')
     parser.add_argument('--big-thresh', type=int, default=256)
-    parser.add_argument('--usbrply', default='')
+    add_bool_arg(parser,
+                 '--loops',
+                 default=True,
+                 help='Collapse repeated commands into loops')
+    add_bool_arg(parser,
+                 '--batch57',
+                 default=False,
+                 help='loops: varying cmd_57s runs become cmd_57s_batch calls'
+                 ' (not wire identical to the capture)')
+    parser.add_argument(
+        '--device',
+        type=int,
+        default=None,
+        help='Capture device number (default: highest, the re-enumerated FX2)')
     parser.add_argument('--save', action='store_true', help='Save firmware')
     parser.add_argument('-w', action='store_true', help='Write python file')
-    parser.add_argument('fin')
+    parser.add_argument('--ops',
+                        default=None,
+                        help='Write a protocol script (see bpmicro/proto.py)')
+    parser.add_argument(
+        '--batch',
+        default=None,
+        help='Scrape all captures in this directory (normal and dumb outputs)')
+    parser.add_argument(
+        '--timing',
+        action='store_true',
+        help='Print a timing profile of the capture instead of scraping')
+    parser.add_argument(
+        '--compare',
+        default=None,
+        help='timing: capture of our driver to compare against fin')
+    parser.add_argument('--procs',
+                        type=int,
+                        default=None,
+                        help='batch: worker processes (default: CPU count)')
+    parser.add_argument('fin', nargs='?')
     args = parser.parse_args()
 
-    j, json_fn = load_json(args.fin, args.usbrply, args.dumb)
+    if args.batch:
+        sys.exit(1 if batch(args.batch,
+                            device=args.device,
+                            omit_ro_=args.omit_ro,
+                            big_thresh_=args.big_thresh,
+                            save=args.save,
+                            procs=args.procs,
+                            loops_=args.loops,
+                            batch57_=args.batch57) else 0)
+    if not args.fin:
+        parser.error('fin required')
+
+    ps = load_packets(args.fin, args.device)
+
+    if args.timing:
+        from bpmicro import timing
+        ref = timing.load(ps, args.fin)
+        if args.compare:
+            # Our driver: the default (highest) device number
+            ours = timing.load(load_packets(args.compare), args.compare)
+            ref.dump()
+            print("")
+            ours.dump()
+            print("")
+            timing.compare(ref, ours)
+        else:
+            ref.dump()
+        sys.exit(0)
+
+    if args.ops:
+        script = proto.from_usbrply(ps)
+        if args.loops:
+            script = script.fold()
+        script.save(args.ops)
+        sys.exit(0)
 
     if args.w:
         filename, file_extension = os.path.splitext(args.fin)
         fnout = filename + '.py'
         print(('Selected output file %s' % fnout))
-        assert fnout != args.fin and fnout != json_fn
+        assert fnout != args.fin
         fout = open(fnout, 'w')
 
     dumb = args.dumb
     omit_ro = args.omit_ro
+    big_thresh = args.big_thresh
+    loops = args.loops
+    batch57 = args.batch57
     scraper = Scraper()
-    scraper.dump(j, save=args.save)
+    scraper.dump(ps, save=args.save)
@@ -73,23 +73,31 @@ if __name__ == "__main__":
                  default=True,
                  help='Omit read only requests (ex: get SM info)')
     parser.add_argument('--big-thresh', type=int, default=255)
-    parser.add_argument('--usbrply', default='')
+    add_bool_arg(parser,
+                 '--loops',
+                 default=True,
+                 help='Collapse repeated commands into loops / batched calls')
+    parser.add_argument('--device',
+                        type=int,
+                        default=None,
+                        help='Capture device number (default: highest)')
     parser.add_argument('--save', action='store_true', help='Save firmware')
     parser.add_argument('-w', action='store_true', help='Write python file')
     parser.add_argument('fin')
     args = parser.parse_args()
 
-    j, json_fn = scrape.load_json(args.fin)
+    ps = scrape.load_packets(args.fin, args.device)
     # j = usbrply.parsers.pcap2json(args)
 
     if args.w:
         filename, file_extension = os.path.splitext(args.fin)
         fnout = filename + '.py'
         print(('Selected output file %s' % fnout))
-        assert fnout != args.fin and fnout != json_fn
+        assert fnout != args.fin
         scrape.fout = open(fnout, 'w')
 
     dumb = args.dumb
     omit_ro = args.omit_ro
+    scrape.loops = args.loops
     scraper = Scraper()
-    scraper.dump(j, save=args.save)
+    scraper.dump(ps, save=args.save)
@@ -16,6 +16,7 @@ if not os.path.exists('build'):
 scripts = (
     'main.py',
     'status.py',
+    'daemon.py',
 )
 scripts_dist = []
 for script in scripts:
@@ -43,6 +44,7 @@ setup(
     keywords="EPROM flash programmer BPMicrosystems",
     url='https://github.com/JohnDMcMaster/bpmicro',
     packages=['bpmicro'],
+    package_data={'bpmicro': ['fw/*.pack', '*/*.json']},
     scripts=scripts_dist,
     install_requires=[
         'libusb1',
@@ -0,0 +1,94 @@
+'''Synthetic usbrply JSON captures for sim.ReplayDev'''
+
+from bpmicro import proto
+
+import binascii
+import struct
+
+
+def hexs(data):
+    return binascii.hexlify(bytes(data)).decode('ascii')
+
+
+def frames(reply):
+    '''Reply payload => raw bulk 0x86 frames, as the adapter sends them'''
+    ret = []
+    while True:
+        chunk = reply[0:0x1FD]
+        reply = reply[0x1FD:]
+        ret.append(b'\x08' + chunk + b'\x00' * (0x1FD - len(chunk)) +
+                   struct.pack('<H', len(chunk)))
+        if len(chunk) < 0x1FD:
+            return ret
+
+
+class Capture(object):
+    def __init__(self):
+        self.ps = []
+
+    def packet(self, d):
+        n = 2 * len(self.ps) + 1
+        d['packn'] = [n, n + 1]
+        self.ps.append(d)
+
+    def w(self, data):
+        self.packet({'type': 'bulkWrite', 'endp': 0x02, 'data': hexs(data)})
+
+    def r(self, reply):
+        for frame in frames(bytes(reply)):
+            self.packet({'type': 'bulkRead', 'endp': 0x86,
+                         'data': hexs(frame)})
+
+    def wr(self, data, reply):
+        self.w(data)
+        self.r(reply)
+
+    def json(self):
+        return {'data': self.ps}
+
+
+def from_script(script, caps):
+    '''
+    Capture of a device answering a proto.Script as it expects
+    caps: "cap" key => reply data
+    "cmd" ops aren't supported: their traffic is only known to cmd.py
+    '''
+    cap = Capture()
+    ops_capture(cap, script.ops, caps)
+    return cap.json()
+
+
+def ops_capture(cap, ops, caps):
+    for name, args in ops:
+        if name == 'w':
+            cap.w(proto.data_get(args[0]))
+        elif name == 'wr':
+            cap.wr(proto.data_get(args[0]), proto.data_get(args[1]) or b'')
+        elif name == 'r':
+            cap.r(proto.data_get(args[0]))
+        elif name == 'cap':
+            cap.wr(proto.data_get(args[1]), caps[args[0]])
+        elif name == 'cr':
+            cap.packet({
+                'type': 'controlRead',
+                'bRequestType': args[0],
+                'bRequest': args[1],
+                'wValue': args[2],
+                'wIndex': args[3],
+                'wLength': args[4],
+                'data': hexs(proto.data_get(args[5]))
+            })
+        elif name == 'cw':
+            cap.packet({
+                'type': 'controlWrite',
+                'bRequestType': args[0],
+                'bRequest': args[1],
+                'wValue': args[2],
+                'wIndex': args[3],
+                'data': hexs(proto.data_get(args[4]))
+            })
+        elif name == 'repeat':
+            for _i in range(args[0]):
+                ops_capture(cap, args[1], caps)
+        else:
+            raise ValueError("Can't capture op %s" % name)
@@ -0,0 +1,260 @@
+'''Production batch runner (batch.py)'''
+
+from bpmicro import batch
+from bpmicro import cmd
+from bpmicro.usb import Transport, USBStats
+
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import unittest
+
+import usb1
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+def frame(payload, prefix=0x08):
+    return (struct.pack('<B', prefix) + payload + b'\x00' *
+            (509 - len(payload)) + struct.pack('<H', len(payload)))
+
+
+class SenseDev(object):
+    '''Answers gpio_readi (0x03) and check_cont (0x57 0x85) from a table'''
+    def __init__(self, replies):
+        self.replies = replies
+        self.frames = []
+
+    def bulkWrite(self, endpoint, data, timeout=None):
+        reply = self.replies.get(bytes(data))
+        if reply is not None:
+            self.frames.append(reply)
+
+    def bulkRead(self, endpoint, length, timeout=None):
+        if not self.frames:
+            raise usb1.USBErrorTimeout()
+        return self.frames.pop(0)
+
+
+def station(replies, stats=None):
+    return batch.Station(Transport(SenseDev(replies), None, stats=stats))
+
+
+class TestSense(unittest.TestCase):
+    def test_present(self):
+        stats = USBStats()
+        st = station(
+            {
+                b'\x03': frame(b'\x30\x00'),
+                b'\x57\x85\x00': frame(b'\x01'),
+            }, stats=stats)
+        self.assertTrue(st.sense())
+        # Goes through the transport
+        self.assertEqual(sorted(stats.opcodes), [0x03, 0x57])
+
+    def test_no_sm(self):
+        st = station({b'\x03': frame(b'\x31\x00')})
+        self.assertFalse(st.sense())
+
+    def test_no_part(self):
+        st = station({b'\x03': frame(b'\x30\x00')})
+        self.assertFalse(st.sense())
+
+    def test_bad_replies(self):
+        '''Garbage while a part is seated is not a crash'''
+        st = station({b'\x03': frame(b'\x99\x99')})
+        self.assertFalse(st.sense())
+        st = station({b'\x03': frame(b'\x30\x00', prefix=0x18)})
+        self.assertFalse(st.sense())
+
+
+class FakeDevice(object):
+    '''
+    Programs into memory and reads it back
+    mangle: corrupt the readback
+    error: raised by program()
+    '''
+    def __init__(self, mangle=False, error=None):
+        self.mangle = mangle
+        self.error = error
+        self.code = b''
+        self.opts = []
+
+    def program(self, devcfg, opts):
+        self.opts.append(opts)
+        if self.error:
+            raise self.error
+        self.code = devcfg['code']
+
+    def read(self, opts):
+        self.opts.append(opts)
+        code = self.code or b'\xFF' * 4
+        if self.mangle:
+            code = b'\x00' + code[1:]
+        return {'code': code}
+
+
+JOB = {'device': 'fake', 'op': 'program', 'count': 1, 'cont': True}
+DEVCFG = {'code': b'\x01\x02\x03\x04'}
+
+
+class Quiet(unittest.TestCase):
+    def setUp(self):
+        self.stdout = sys.stdout
+        sys.stdout = StringIO()
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+
+
+class TestPart(Quiet):
+    def setUp(self):
+        Quiet.setUp(self)
+        self.tmp = tempfile.mkdtemp()
+        self.log_fn = os.path.join(self.tmp, 'parts.log')
+        self.st = batch.Station(None, log_fn=self.log_fn)
+
+    def tearDown(self):
+        self.st.log_f.close()
+        shutil.rmtree(self.tmp)
+        Quiet.tearDown(self)
+
+    def test_pass(self):
+        device = FakeDevice()
+        entry = self.st.do_part(0, JOB, device, DEVCFG)
+        self.assertTrue(entry['ok'])
+        self.assertEqual(entry['md5'],
+                         hashlib.md5(DEVCFG['code']).hexdigest())
+        self.assertEqual(sorted(entry['times']), ['program', 'verify'])
+        self.assertEqual(sorted(self.st.phase_times), ['program', 'verify'])
+        self.assertEqual((self.st.parts, self.st.fails), (1, 0))
+        self.assertEqual(device.opts[0]['verify'], False)
+        self.assertEqual(device.opts[0]['cont'], True)
+        logged = json.loads(open(self.log_fn).read())
+        self.assertEqual((logged['part'], logged['ok']), (1, True))
+
+    def test_verify_error(self):
+        entry = self.st.do_part(0, JOB, FakeDevice(mangle=True), DEVCFG)
+        self.assertFalse(entry['ok'])
+        self.assertEqual(entry['error'], 'VerifyError')
+        self.assertEqual((self.st.parts, self.st.fails), (1, 1))
+        self.assertIn('Part 1: FAIL (VerifyError', sys.stdout.getvalue())
+
+    def test_part_errors(self):
+        '''Part errors fail the part, anything else stops the station'''
+        device = FakeDevice(error=cmd.ContFail('open pin'))
+        entry = self.st.do_part(0, JOB, device, DEVCFG)
+        self.assertEqual((entry['ok'], entry['error'], entry['msg']),
+                         (False, 'ContFail', 'open pin'))
+        # Phase time is still charged
+        self.assertIn('program', entry['times'])
+        device = FakeDevice(error=ValueError('bug'))
+        self.assertRaises(ValueError, self.st.do_part, 0, JOB, device,
+                          DEVCFG)
+        self.assertEqual((self.st.parts, self.st.fails), (1, 1))
+
+    def test_read(self):
+        job = dict(JOB, op='read', cont=False)
+        device = FakeDevice()
+        entry = self.st.do_part(1, job, device, None)
+        self.assertTrue(entry['ok'])
+        self.assertEqual(list(entry['times']), ['read'])
+        self.assertEqual(device.opts, [{'cont': False, 'verbose': False}])
+
+
+class TestWaitPart(unittest.TestCase):
+    def setUp(self):
+        self.poll = batch.POLL
+        batch.POLL = 0
+
+    def tearDown(self):
+        batch.POLL = self.poll
+
+    def test_debounce(self):
+        senses = [True, False, True, True, False, True, True, True, False]
+        st = batch.Station(None)
+        st.sense = lambda: senses.pop(0)
+        st.wait_part(True)
+        # A glitch restarts the count
+        self.assertEqual(senses, [False])
+        senses[:] = [False, False, True, False, False, False]
+        st.wait_part(False)
+        self.assertEqual(senses, [])
+
+
+class TestManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.fn = os.path.join(self.tmp, 'jobs.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def load(self, jobs):
+        with open(self.fn, 'w') as f:
+            json.dump({'jobs': jobs}, f)
+        return batch.load_manifest(self.fn)
+
+    def test_defaults(self):
+        jobs = self.load([{
+            'device': 'pic16f84',
+            'image': 'code.bin',
+            'data': 'eeprom.bin'
+        }, {
+            'device': 'i87c51',
+            'op': 'read',
+            'count': 5,
+            'cont': False
+        }])
+        self.assertEqual(jobs[0]['op'], 'program')
+        self.assertEqual(jobs[0]['count'], 0)
+        self.assertEqual(jobs[0]['cont'], True)
+        # Relative to the manifest
+        self.assertEqual(jobs[0]['image'], os.path.join(self.tmp, 'code.bin'))
+        self.assertEqual(jobs[0]['data'], os.path.join(self.tmp,
+                                                       'eeprom.bin'))
+        self.assertEqual((jobs[1]['count'], jobs[1]['cont']), (5, False))
+        self.assertNotIn('image', jobs[1])
+
+    def test_bad(self):
+        self.assertRaises(ValueError, self.load, [{
+            'device': 'pic16f84',
+            'op': 'erase'
+        }])
+        self.assertRaises(ValueError, self.load, [{'device': 'pic16f84'}])
+
+
+class TestReport(Quiet):
+    def test_report(self):
+        st = batch.Station(None)
+        st.tstart = time.time() - 3600.0
+        st.parts = 2
+        st.fails = 1
+        st.phase_times = {'program': 3.0, 'verify': 1.0}
+        st.report()
+        lines = sys.stdout.getvalue().split('\n')
+        self.assertEqual(lines[1], 'Parts: 2, pass: 1, fail: 1')
+        self.assertTrue(lines[2].endswith(' sec, 2.0 parts / hour'))
+        self.assertEqual(lines[3:5], ['  program  1.50 sec / part',
+                                      '  verify   0.50 sec / part'])
+
+    def test_report_no_parts(self):
+        st = batch.Station(None)
+        st.tstart = time.time() - 10.0
+        st.phase_times['program'] = 1.0
+        st.report()
+        lines = sys.stdout.getvalue().split('\n')
+        self.assertEqual(lines[1], 'Parts: 0, pass: 0, fail: 0')
+        self.assertTrue(lines[2].endswith(' sec, 0.0 parts / hour'))
+        self.assertEqual(lines[3:], [''])
+
+if __name__ == '__main__':
+    unittest.main()
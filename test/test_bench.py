@@ -0,0 +1,101 @@
+'''Replay benchmark (bench.py)'''
+
+from bpmicro import bench
+from bpmicro import proto
+from bpmicro.mcs51 import s87c751
+from test import capture
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+CODE = bytes(bytearray(i & 0xFF for i in range(2048)))
+
+# Stand in for s87c751_read.json: its "cmd" ops can't be synthesized
+OPS = [
+    ["w", "4500"],
+    ["repeat", 4, [["wr", "0e02", "0000", "setup"]]],
+    ["cap", "code", "0b0008"],
+    ["wr", "4900", "00", "done"],
+]
+
+
+class TestBench(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.script_fn = s87c751.READ_SCRIPT
+        s87c751.READ_SCRIPT = os.path.join(self.tmp, 'read_script.json')
+        proto.Script(OPS).save(s87c751.READ_SCRIPT)
+        self.save_capture(capture.from_script(proto.Script(OPS),
+                                              {'code': CODE}))
+        self.stdout = sys.stdout
+        sys.stdout = StringIO()
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+        proto.scripts.pop(s87c751.READ_SCRIPT, None)
+        s87c751.READ_SCRIPT = self.script_fn
+        shutil.rmtree(self.tmp)
+
+    def save_capture(self, j):
+        with open(os.path.join(self.tmp, 's87c751_read.json'), 'w') as f:
+            json.dump(j, f)
+
+    def run_bench(self):
+        return bench.run(self.tmp, device_names=['s87c751'], iters=2)
+
+    def test_run(self):
+        results = self.run_bench()
+        self.assertEqual(sorted(results['results']), ['s87c751.read'])
+        result = results['results']['s87c751.read']
+        self.assertNotIn('error', result)
+        # 1 + 4 + 1 + 1 writes, 4 + 5 + 1 reply frames
+        self.assertEqual(result['transactions'], 17)
+        self.assertEqual(result['bytes_in'], 10 * 512)
+        self.assertEqual(result['result'],
+                         bench.result_digest({'code': CODE}))
+
+    def test_compare(self):
+        fn = os.path.join(self.tmp, 'baseline.json')
+        bench.save(self.run_bench(), fn)
+        baseline = bench.load(fn)
+        current = self.run_bench()
+        # Timing noise within tolerance
+        for k in ('wall', 'cpu'):
+            baseline['results']['s87c751.read'][k] = 1.0
+        self.assertEqual(bench.compare(baseline, current), [])
+
+        # More transfers than the baseline
+        baseline['results']['s87c751.read']['transactions'] -= 1
+        self.assertEqual([r[0:2] for r in bench.compare(baseline, current)],
+                         [('s87c751.read', 'transactions')])
+
+    def test_compare_error(self):
+        '''A job that stops matching its capture is a regression'''
+        baseline = self.run_bench()
+        ops = [list(op) for op in OPS]
+        ops[-1] = ["wr", "4a00", "00", "done"]
+        self.save_capture(capture.from_script(proto.Script(ops),
+                                              {'code': CODE}))
+        current = self.run_bench()
+        self.assertIn('ReplayMismatch',
+                      current['results']['s87c751.read']['error'])
+        self.assertEqual([r[0:2] for r in bench.compare(baseline, current)],
+                         [('s87c751.read', 'error')])
+
+    def test_no_captures(self):
+        shutil.rmtree(self.tmp)
+        os.mkdir(self.tmp)
+        self.assertRaises(bench.NoCaptures, self.run_bench)
+
+
+if __name__ == '__main__':
+    unittest.main()
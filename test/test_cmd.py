@@ -0,0 +1,266 @@
+'''Command layer (cmd.py)'''
+
+from bpmicro import cmd
+from bpmicro.usb import Transport, USBStats
+
+import struct
+import unittest
+
+import usb1
+
+
+def frame(payload, prefix=0x08):
+    return (struct.pack('<B', prefix) + payload + b'\x00' *
+            (509 - len(payload)) + struct.pack('<H', len(payload)))
+
+
+class LogDev(object):
+    '''
+    Logs transfers as ('w', data) / ('r', )
+    reply(data): 0x86 frames queued for a write
+    '''
+    def __init__(self, reply):
+        self.reply = reply
+        self.frames = []
+        self.log = []
+
+    def bulkWrite(self, endpoint, data, timeout=None):
+        self.log.append(('w', bytes(data)))
+        self.frames += self.reply(bytes(data))
+
+    def bulkRead(self, endpoint, length, timeout=None):
+        if not self.frames:
+            raise usb1.USBErrorTimeout()
+        self.log.append(('r', ))
+        return self.frames.pop(0)
+
+
+def upload_ack(data):
+    '''Chunks of 2 bytes: a 2 byte chunk continues, shorter is the last'''
+    if len(data) - 2 == 2:
+        return [frame(b'\x0B', prefix=0x18)]
+    return [frame(b'\x00')]
+
+
+class TestUpload(unittest.TestCase):
+    def test_stop_and_wait(self):
+        self.assertEqual(cmd.upload_window, 1)
+        dev = LogDev(upload_ack)
+        cmd.upload_windowed(Transport(dev, None), b'\xAA' * 5, chunk_size=2)
+        self.assertEqual([e[0] for e in dev.log], ['w', 'r'] * 3)
+
+    def test_window(self):
+        dev = LogDev(upload_ack)
+        cmd.upload_windowed(Transport(dev, None),
+                            b'\xAA' * 5,
+                            window=2,
+                            chunk_size=2)
+        self.assertEqual([e[0] for e in dev.log],
+                         ['w', 'w', 'r', 'w', 'r', 'r'])
+
+    def test_bad_window(self):
+        self.assertRaises(ValueError, cmd.upload_windowed, None, b'\xAA', 0)
+
+
+def eeprom_reply(data):
+    '''Each 0x57 sub command group (3 bytes per sub command) replies 2 bytes'''
+    n = data.count(b'\x57\x94\x00')
+    return [frame(b''.join(struct.pack('<H', i) for i in range(n)))]
+
+
+class TestBatch57(unittest.TestCase):
+    def tearDown(self):
+        cmd.coalesce = False
+
+    def test_default(self):
+        '''One group per transfer, as BPWin'''
+        self.assertFalse(cmd.coalesce)
+        dev = LogDev(eeprom_reply)
+        groups = ["\x94"] + ["\x92\x94"] * 3
+        ret = cmd.cmd_57s_batch(Transport(dev, None), groups, reply_len=2)
+        self.assertEqual([e[0] for e in dev.log], ['w', 'r'] * 4)
+        self.assertEqual([len(e[1]) for e in dev.log if e[0] == 'w'],
+                         [3, 6, 6, 6])
+        self.assertEqual(len(ret), 4)
+
+    def test_one_transfer(self):
+        '''Packed into one USB packet with coalesce'''
+        cmd.coalesce = True
+        dev = LogDev(eeprom_reply)
+        groups = ["\x94"] + ["\x92\x94"] * 0x3F
+        ret = cmd.cmd_57s_batch(Transport(dev, None), groups, reply_len=2)
+        self.assertEqual([e[0] for e in dev.log], ['w', 'r'])
+        self.assertEqual(len(dev.log[0][1]), 3 + 6 * 0x3F)
+        self.assertEqual(len(ret), 0x40)
+        self.assertEqual(ret[1], struct.pack('<H', 1))
+
+    def test_split(self):
+        '''A transfer limit splits the groups'''
+        dev = LogDev(eeprom_reply)
+        ret = cmd.cmd_57s_batch(Transport(dev, None), ["\x94"] * 5,
+                                reply_len=2,
+                                max_size=6)
+        self.assertEqual([e[0] for e in dev.log], ['w', 'r'] * 3)
+        self.assertEqual(len(ret), 5)
+
+    def test_bad_reply_len(self):
+        dev = LogDev(eeprom_reply)
+        self.assertRaises(Exception, cmd.cmd_57s_batch,
+                          Transport(dev, None), ["\x94"] * 2,
+                          reply_len=3)
+
+
+SM_READ = b"\x22\x02\x00\x00\x3F\x00\x06"
+
+
+class TestFastEepromCache(unittest.TestCase):
+    '''--fast --cache-eeprom: SM swaps are still seen'''
+    def setUp(self):
+        self.gpio = b"\x30\x00"
+        cmd.eeprom_cache.invalidate()
+        cmd.cache_eeprom = True
+
+    def tearDown(self):
+        cmd.fast = False
+        cmd.cache_eeprom = False
+        cmd.ro_skipped.clear()
+        cmd.eeprom_cache.invalidate()
+
+    def reply(self, data):
+        if data == b"\x03":
+            return [frame(self.gpio)]
+        if data == SM_READ:
+            return [frame(b"\x11\x00" + b"\x00" * 0x7E)]
+        return []
+
+    def test_sm_swap(self):
+        dev = Transport(LogDev(self.reply), None)
+        cmd.gpio_readi(dev)
+        cmd.sm_r(dev, 0x00, 0x0F)
+        self.assertIsNotNone(cmd.eeprom_cache.sm)
+
+        cmd.fast = True
+        # SM pulled
+        self.gpio = b"\x31\x00"
+        cmd.sm_info0(dev)
+        self.assertEqual(cmd.ro_skipped, {'sm_info0_check': 1})
+        self.assertIsNone(cmd.eeprom_cache.sm)
+
+
+class TestBatchStats(unittest.TestCase):
+    def test_merged(self):
+        '''A merged transfer is charged to the command that replies'''
+        def reply(data):
+            return [frame(b'\x0f\x00')] if data.endswith(b'\x49') else []
+
+        stats = USBStats()
+        dev = LogDev(reply)
+        batch = cmd.Batch(Transport(dev, None, stats=stats), enabled=True)
+        batch.bulkWrite(0x02, b'\x41\x00\x00')
+        batch.bulkWrite(0x02, b'\x4c\x00\x00')
+        batch.bulkWrite(0x02, b'\x49')
+        batch.bulkRead(0x86, 512)
+        self.assertEqual(dev.log, [('w', b'\x41\x00\x00\x4c\x00\x00\x49'),
+                                   ('r', )])
+        self.assertEqual(sorted(stats.opcodes), [0x49])
+        self.assertEqual(stats.opcodes[0x49].replies, 1)
+        self.assertEqual(stats.opcodes[0x49].bytes, 7)
+
+
+def reply_49(data):
+    return [frame(b'\x0f\x00')] if data.endswith(b'\x49') else []
+
+
+class TestBatch(unittest.TestCase):
+    def batch(self, enabled=True):
+        self.dev = LogDev(reply_49)
+        return cmd.Batch(Transport(self.dev, None), enabled=enabled)
+
+    def test_merge(self):
+        '''Write only commands go out in front of the next command'''
+        batch = self.batch()
+        batch.bulkWrite(0x02, b'\x41\x00\x00')
+        batch.bulkWrite(0x02, b'\x09\x00\x00\x00\x00\x4c\x00\x00')
+        self.assertEqual(self.dev.log, [])
+        self.assertEqual(cmd.bulk2b(batch, b'\x49'), b'\x0f\x00')
+        self.assertEqual(self.dev.log,
+                         [('w', b'\x41\x00\x00\x09\x00\x00\x00\x00'
+                           b'\x4c\x00\x00\x49'), ('r', )])
+        self.assertEqual((batch.cmds, batch.transfers), (3, 1))
+
+    def test_flush_before_read(self):
+        '''Anything else touching the bus sends held back commands first'''
+        batch = self.batch()
+        batch.bulkWrite(0x02, b'\x4c\x00\x00')
+        self.assertRaises(usb1.USBErrorTimeout, batch.bulkRead, 0x86, 512)
+        self.assertEqual(self.dev.log, [('w', b'\x4c\x00\x00')])
+
+    def test_payload(self):
+        '''A cmd_50 payload is not merged with its announcement'''
+        batch = self.batch()
+        batch.bulkWrite(0x02, b'\x50\x03\x00\x00\x00')
+        batch.bulkWrite(0x02, b'\x41\x00\x00')
+        batch.flush()
+        self.assertEqual(self.dev.log, [('w', b'\x50\x03\x00\x00\x00'),
+                                        ('w', b'\x41\x00\x00')])
+
+    def test_max_size(self):
+        batch = self.batch()
+        batch.max_size = 8
+        for _i in range(3):
+            batch.bulkWrite(0x02, b'\x41\x00\x00')
+        batch.bulkWrite(0x02, b'\x49')
+        self.assertEqual([e[1] for e in self.dev.log],
+                         [b'\x41\x00\x00' * 2, b'\x41\x00\x00\x49'])
+
+    def test_disabled(self):
+        batch = self.batch(enabled=False)
+        batch.bulkWrite(0x02, b'\x41\x00\x00')
+        self.assertEqual(self.dev.log, [('w', b'\x41\x00\x00')])
+
+    def test_exit(self):
+        with self.batch() as batch:
+            batch.bulkWrite(0x02, b'\x41\x00\x00')
+        self.assertEqual(self.dev.log, [('w', b'\x41\x00\x00')])
+
+    def test_exit_error(self):
+        '''Held back commands are still sent when the caller fails'''
+        def f(batch):
+            with batch:
+                batch.bulkWrite(0x02, b'\x41\x00\x00')
+                raise ValueError()
+
+        self.assertRaises(ValueError, f, self.batch())
+        self.assertEqual(self.dev.log, [('w', b'\x41\x00\x00')])
+
+    def test_exit_error_discard(self):
+        '''A failing flush is dropped so the first error is the one raised'''
+        batch = self.batch()
+
+        def write(endpoint, data, timeout=None):
+            raise usb1.USBErrorNoDevice()
+
+        def f():
+            with batch:
+                batch.bulkWrite(0x02, b'\x41\x00\x00')
+                self.dev.bulkWrite = write
+                raise ValueError()
+
+        self.assertRaises(ValueError, f)
+        self.assertEqual(batch.pending, [])
+
+    def test_batched(self):
+        @cmd.batched
+        def f(dev, data):
+            '''doc'''
+            dev.bulkWrite(0x02, data)
+            return dev
+
+        ret = f(Transport(LogDev(reply_49), None), b'\x41\x00\x00')
+        self.assertIsInstance(ret, cmd.Batch)
+        self.assertEqual(ret.dev.dev.log, [('w', b'\x41\x00\x00')])
+        self.assertEqual((f.__name__, f.__doc__), ('f', 'doc'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+'''Programmer daemon (daemon.py)'''
+
+from bpmicro import daemon
+from bpmicro import startup
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+class FakeBP(object):
+    def __init__(self):
+        self.closed = False
+
+
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.fn = os.path.join(self.tmp, 'bpmicro.sock')
+        self.get = startup.get
+        self.close = startup.close
+        self.opened = []
+        startup.get = lambda **kwargs: self.opened.append(FakeBP()) or \
+            self.opened[-1]
+        startup.close = lambda bp: setattr(bp, 'closed', True)
+        self.stdout = sys.stdout
+        sys.stdout = StringIO()
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+        startup.get = self.get
+        startup.close = self.close
+        shutil.rmtree(self.tmp)
+
+    def test_socket_private(self):
+        sock = daemon.Server(self.fn).listen()
+        try:
+            mode = stat.S_IMODE(os.stat(self.fn).st_mode)
+            self.assertEqual(mode & 0o077, 0)
+        finally:
+            sock.close()
+
+    def test_reinit_closes(self):
+        server = daemon.Server(self.fn)
+        server.init()
+        ret = server.handle_line('{"op": "init"}')
+        self.assertTrue(ret['ok'])
+        self.assertEqual(len(self.opened), 2)
+        self.assertTrue(self.opened[0].closed)
+        self.assertFalse(self.opened[1].closed)
+        server.close_bp()
+        self.assertTrue(self.opened[1].closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
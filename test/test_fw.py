@@ -0,0 +1,126 @@
+'''Firmware blob store (fw.py)'''
+
+from bpmicro import fw
+
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class TestPack(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, blobs):
+        fn = os.path.join(self.tmp, 'test.pack')
+        fw.write_pack(fn, blobs)
+        return fn
+
+    def test_roundtrip(self):
+        blobs = {}
+        for data in (b'\x00\x01\x02', b'\xFF' * 300, b'x'):
+            blobs[fw.hstr(fw.fwhash(data))] = data
+        pack = fw.Pack(self.write(blobs))
+        try:
+            self.assertEqual(sorted(pack.index), sorted(blobs))
+            for h, data in blobs.items():
+                self.assertIn(h, pack)
+                self.assertEqual(pack[h], data)
+                self.assertEqual(pack.view(h).tobytes(), data)
+            self.assertNotIn('00000000', pack)
+        finally:
+            pack.close()
+
+    def test_bad_magic(self):
+        fn = os.path.join(self.tmp, 'bad.pack')
+        open(fn, 'wb').write(b'NOTAPACK' + b'\x00' * 8)
+        self.assertRaises(Exception, fw.Pack, fn)
+
+    def test_truncated(self):
+        data = b'\xAA' * 64
+        fn = self.write({fw.hstr(fw.fwhash(data)): data})
+        raw = open(fn, 'rb').read()
+        open(fn, 'wb').write(raw[:-1])
+        self.assertRaises(Exception, fw.Pack, fn)
+
+    def test_store(self):
+        '''Loose blobs are served before packs, packs are read only'''
+        packed = b'packed'
+        h = fw.hstr(fw.fwhash(packed))
+        store = fw.FwStore()
+        store.add_pack(fw.Pack(self.write({h: packed})))
+        try:
+            self.assertEqual(store[h], packed)
+            self.assertEqual(store.view(h).tobytes(), packed)
+            store[h] = b'loose'
+            self.assertEqual(store[h], b'loose')
+            del store[h]
+            self.assertEqual(store[h], packed)
+            self.assertEqual(list(store), [h])
+            self.assertRaises(KeyError, store.__getitem__, '00000000')
+        finally:
+            store.clear()
+
+
+def collision():
+    '''Two different blobs with the same (32 bit) fwhash'''
+    seen = {}
+    i = 0
+    while True:
+        data = ('blob %u' % i).encode('ascii')
+        h = fw.fwhash(data)
+        if h in seen:
+            return seen[h], data
+        seen[h] = data
+        i += 1
+
+
+class TestReindex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.orig = (fw.FW_DIR, fw.INDEX_FN)
+        fw.FW_DIR = self.tmp
+        fw.INDEX_FN = os.path.join(self.tmp, '.index.json')
+
+    def tearDown(self):
+        fw.FW_DIR, fw.INDEX_FN = self.orig
+        fw.hash2bin.clear()
+        fw.hash2fns.clear()
+        fw.hash2bin.index = fw.reindex
+        shutil.rmtree(self.tmp)
+
+    def write(self, fn, data):
+        with open(os.path.join(self.tmp, fn), 'wb') as f:
+            f.write(data)
+
+    def test_duplicate(self):
+        self.write('a.bin', b'same')
+        self.write('b.bin', b'same')
+        fw.reindex()
+        h = fw.hstr(fw.fwhash(b'same'))
+        self.assertEqual(fw.hash2bin[h], b'same')
+        self.assertEqual(len(fw.hash2fns[h]), 2)
+        # Cached index is used the second time
+        fw.reindex()
+        self.assertEqual(fw.hash2bin[h], b'same')
+
+    def test_collision(self):
+        a, b = collision()
+        self.write('a.bin', a)
+        self.write('b.bin', b)
+        self.assertRaises(Exception, fw.reindex)
+
+    def test_collision_pack(self):
+        a, b = collision()
+        fw.write_pack(os.path.join(self.tmp, 'a.pack'),
+                      {fw.hstr(fw.fwhash(a)): a})
+        self.write('b.bin', b)
+        self.assertRaises(Exception, fw.reindex)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+'''Command line entry point (main.py)'''
+
+from bpmicro.usb import USBStats
+import main
+
+import sys
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+class DumpStats(USBStats):
+    dumps = 0
+
+    def dump(self, f=None):
+        DumpStats.dumps += 1
+
+
+class TestRun(unittest.TestCase):
+    def setUp(self):
+        self.stdout = sys.stdout
+        sys.stdout = StringIO()
+        main.USBStats = DumpStats
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+        main.USBStats = USBStats
+
+    def test_stats_on_failure(self):
+        '''USB statistics are printed when the operation fails'''
+        self.assertRaises(Exception,
+                          main.run,
+                          'erase',
+                          's87c751',
+                          None,
+                          None,
+                          None,
+                          cont=False,
+                          erase=False,
+                          verify=False,
+                          verbose=False,
+                          dir_=False,
+                          replay={'data': []},
+                          stats=True)
+        self.assertEqual(DumpStats.dumps, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+'''Packet records and the incremental JSON loader (packet.py)'''
+
+from bpmicro import packet
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+CAPTURE = {
+    'fn': 'cap.cap',
+    'args': ['usbrply', {'j': True, 'n': [1, 2.5e3]}],
+    'data': [
+        {'type': 'comment', 'v': 'init'},
+        {'type': 'controlRead', 'bRequestType': 0xC0, 'bRequest': 0xB0,
+         'wValue': 0, 'wIndex': 0, 'wLength': 4096, 'data': '0816',
+         'packn': [3, 4]},
+        {'type': 'bulkWrite', 'endp': 0x02, 'data': '03', 'packn': [5, 6],
+         'ts': [100.5, 100.501]},
+        {'type': 'bulkRead', 'endp': 0x86, 'data': '08' + '00' * 511,
+         'packn': [7, 8]},
+    ],
+    'trailer': {'packets': 12345},
+}
+
+
+def fields(p):
+    return tuple(getattr(p, k) for k in packet.Packet.__slots__)
+
+
+class TestPacket(unittest.TestCase):
+    def test_from_dict(self):
+        p = packet.from_dict(CAPTURE['data'][2])
+        self.assertEqual((p.type, p.endp, p.data), ('bulkWrite', 0x02, b'\x03'))
+        self.assertEqual(p.packn, (5, 6))
+        self.assertEqual(p.ts, (100.5, 100.501))
+        self.assertIsNone(p.wValue)
+        p = packet.from_dict(CAPTURE['data'][0])
+        self.assertEqual((p.type, p.v, p.data, p.ts), ('comment', 'init',
+                                                       None, None))
+
+    def test_slots(self):
+        p = packet.Packet('bulkWrite')
+        self.assertRaises(AttributeError, setattr, p, 'extra', 1)
+
+
+class TestJSONStream(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.chunk = packet.JSONStream.chunk
+
+    def tearDown(self):
+        packet.JSONStream.chunk = self.chunk
+        shutil.rmtree(self.tmp)
+
+    def save(self, j, indent=None):
+        fn = os.path.join(self.tmp, 'cap.json')
+        with open(fn, 'w') as f:
+            json.dump(j, f, indent=indent)
+        return fn
+
+    def test_items(self):
+        for chunk in (1, 2, 3, 1 << 16):
+            packet.JSONStream.chunk = chunk
+            stream = packet.JSONStream(
+                StringIO(u' [1, 23456 , {"a": [1, "]"]}, "x,y", -2.5e3]'))
+            self.assertEqual(list(stream.items()),
+                             [1, 23456, {'a': [1, ']']}, 'x,y', -2500.0])
+
+    def test_json_packets(self):
+        '''Same as json.load() for any read size'''
+        want = [fields(packet.from_dict(d)) for d in CAPTURE['data']]
+        for indent in (None, 1):
+            fn = self.save(CAPTURE, indent=indent)
+            for chunk in (1, 7, 64, 1 << 16):
+                packet.JSONStream.chunk = chunk
+                got = [fields(p) for p in packet.json_packets(fn)]
+                self.assertEqual(got, want)
+
+    def test_empty(self):
+        self.assertEqual(list(packet.json_packets(self.save({}))), [])
+        self.assertEqual(list(packet.json_packets(self.save({'data': []}))),
+                         [])
+
+    def test_bad(self):
+        fn = self.save([1, 2])
+        self.assertRaises(ValueError, list, packet.json_packets(fn))
+        fn = os.path.join(self.tmp, 'cut.json')
+        with open(fn, 'w') as f:
+            f.write('{"data": [{"type": "comment"}, ')
+        self.assertRaises(ValueError, list, packet.json_packets(fn))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+'''Protocol scripts (proto.py)'''
+
+from bpmicro import cmd
+from bpmicro import packet
+from bpmicro import proto
+from bpmicro import startup
+from bpmicro.usb import ValidateError
+from test import capture
+
+import unittest
+
+OPS = [
+    ["cw", 0x40, 0xA0, 0xE600, 0x0000, "01"],
+    ["cr", 0xC0, 0xB0, 0x0000, 0x0000, 2, "0816", "packet 3/4"],
+    ["w", "4500"],
+    ["wr", "0e02", "1100", "packet 7/8"],
+    ["wr", "5785", "0000", "packet 9/10", "warn"],
+    ["cap", "code", "0b0008"],
+    ["r", "00", "packet 13/14"],
+    ["cmd", "led_mask", {"hex": "70617373"}],
+]
+
+CODE = b'\x5A' * 0x800
+
+
+def device():
+    '''Capture matching OPS. led_mask is write only: 0x0C <mask>'''
+    cap = capture.Capture()
+    cap.packet({'type': 'controlWrite', 'bRequestType': 0x40,
+                'bRequest': 0xA0, 'wValue': 0xE600, 'wIndex': 0x0000,
+                'data': '01'})
+    cap.packet({'type': 'controlRead', 'bRequestType': 0xC0,
+                'bRequest': 0xB0, 'wValue': 0x0000, 'wIndex': 0x0000,
+                'wLength': 2, 'data': '0816'})
+    cap.w(b'\x45\x00')
+    cap.wr(b'\x0e\x02', b'\x11\x00')
+    cap.wr(b'\x57\x85', b'\x01\x00')
+    cap.wr(b'\x0b\x00\x08', CODE)
+    cap.r(b'\x00')
+    cap.w(b'\x0c\x04')
+    return startup.get_replay(cap.json())
+
+
+class TestOps(unittest.TestCase):
+    def test_round_trip(self):
+        for op in OPS:
+            name, args = proto.op_dec(op)
+            self.assertEqual(proto.op_enc(name, args), op)
+
+    def test_dec(self):
+        name, args = proto.op_dec(["cmd", "led_mask", {"hex": "70617373"}])
+        self.assertEqual(name, 'cmd')
+        self.assertEqual(args, (cmd.led_mask, b'pass'))
+        self.assertEqual(proto.op_dec(["wr", "00", None, "x"])[1],
+                         (b'\x00', None, "x", False))
+        ref = proto.op_dec(["w", "fw:1234abcd"])[1][0]
+        self.assertEqual(ref.h, '1234abcd')
+
+    def test_bad(self):
+        self.assertRaises(ValueError, proto.op_dec, ["nop"])
+        self.assertRaises(ValueError, proto.op_dec, ["cmd", "cmd_nop"])
+
+    def test_script_json(self):
+        j = proto.Script(OPS).to_json()
+        self.assertEqual(j, {'version': proto.VERSION, 'ops': OPS})
+
+    def test_from_usbrply(self):
+        '''A capture translates back op for op (control / bulk only)'''
+        ops = OPS[0:5]
+        j = capture.from_script(proto.Script(ops), {})
+        ps = [packet.from_dict(d) for d in j['data']]
+        script = proto.from_usbrply(ps)
+        self.assertEqual([op[0:3] for op in script.to_json()['ops']],
+                         [op[0:3] for op in ops])
+
+
+class TestRepeat(unittest.TestCase):
+    def test_round_trip(self):
+        op = ["repeat", 3, [["w", "00"], ["wr", "01", "02", "x", "warn"]]]
+        name, args = proto.op_dec(op)
+        self.assertEqual(args[0], 3)
+        self.assertEqual(proto.op_enc(name, args), op)
+        self.assertRaises(ValueError, proto.op_dec,
+                          ["repeat", 2, [["cap", "code", "00"]]])
+
+    def test_fold(self):
+        '''Labels may differ between iterations, replies may not'''
+        ops = [["w", "aa"]]
+        for i in range(5):
+            ops += [["wr", "190d00", None, None],
+                    ["wr", "191100", "0000", "packet %u" % i]]
+        ops += [["wr", "191100", "0100", "packet 5"]] * 3
+        got = proto.Script(ops).fold().to_json()['ops']
+        self.assertEqual(got, [
+            ["w", "aa"],
+            ["repeat", 5, [["wr", "190d00", None, None],
+                           ["wr", "191100", "0000", "packet 0"]]],
+        ] + [["wr", "191100", "0100", "packet 5"]] * 3)
+
+    def test_run(self):
+        ops = [["repeat", 4, [["wr", "49", "0f00", "x"]]],
+               ["cap", "code", "0b0008"]]
+        cap = capture.Capture()
+        for _i in range(4):
+            cap.wr(b'\x49', b'\x0f\x00')
+        cap.wr(b'\x0b\x00\x08', CODE)
+        bp = startup.get_replay(cap.json())
+        captures = proto.Script(ops).run(bp)
+        self.assertEqual(bytes(captures['code']), CODE)
+        self.assertEqual(bp.dev.misses, 0)
+        self.assertEqual(bp.dev.transactions, 4 * 2 + 1 + 5)
+
+    def test_s87c751(self):
+        from bpmicro.mcs51 import s87c751
+        script = proto.Script.load(s87c751.READ_SCRIPT)
+        self.assertIn('repeat', [name for name, _args in script.ops])
+
+
+class TestRun(unittest.TestCase):
+    def test_run(self):
+        bp = device()
+        # 0x57 0x85 reply differs but is only a warning
+        captures = proto.Script(OPS).run(bp)
+        self.assertEqual(bytes(captures['code']), CODE)
+        self.assertEqual(bp.dev.misses, 0)
+        self.assertFalse(bp.dev.frames)
+
+    def test_stream(self):
+        bp = device()
+        got = [(key, offset, len(buff))
+               for key, offset, buff in proto.Script(OPS).run_stream(bp)]
+        self.assertEqual(got, [('code', 0, 0x1FD), ('code', 0x1FD, 0x1FD),
+                               ('code', 0x3FA, 0x1FD), ('code', 0x5F7, 0x1FD),
+                               ('code', 0x7F4, 0x0C)])
+        self.assertEqual(bp.dev.misses, 0)
+
+    def test_validate(self):
+        ops = [list(op) for op in OPS]
+        ops[3][2] = "1200"
+        self.assertRaises(ValidateError, proto.Script(ops).run, device())
+        captures = proto.Script(ops).run(device(),
+                                         validate=proto.VALIDATE_NONE)
+        self.assertEqual(bytes(captures['code']), CODE)
+
+
+if __name__ == '__main__':
+    unittest.main()
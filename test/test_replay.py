@@ -0,0 +1,56 @@
+'''
+Device code replayed against captures (sim.ReplayDev)
+
+Captures are not shipped: set BPMICRO_CAPTURES to a capture directory
+laid out as for main.py bench (see bench.py)
+'''
+
+from bpmicro import bench
+from bpmicro import devices
+from bpmicro import startup
+from bpmicro.mcs51 import i87c51
+
+import os
+import unittest
+
+capture_dir = os.getenv('BPMICRO_CAPTURES')
+
+
+def replay_job(fn, f):
+    bp = startup.get_replay(fn)
+    f(bp)
+    return bp.dev
+
+
+@unittest.skipIf(not capture_dir, 'BPMICRO_CAPTURES not set')
+class TestReplay(unittest.TestCase):
+    def test_jobs(self):
+        '''Every capture in the directory replays to completion'''
+        n = 0
+        for name, fn, f in bench.jobs(capture_dir):
+            dev = replay_job(fn, f)
+            self.assertEqual(dev.misses, 0, name)
+            n += 1
+        if not n:
+            self.skipTest('no captures in %s' % capture_dir)
+
+    def test_i87c51_program(self):
+        fn = os.path.join(capture_dir, 'i87c51_program.json')
+        code_fn = os.path.join(capture_dir, 'i87c51_program.bin')
+        if not os.path.exists(fn) or not os.path.exists(code_fn):
+            self.skipTest('no i87c51 program capture')
+        devcfg = {'code': open(code_fn, 'rb').read()}
+        dev = replay_job(
+            fn, lambda bp: devices.get(bp, 'i87c51').program(devcfg, {}))
+        self.assertEqual(dev.misses, 0)
+
+
+class TestI87C51(unittest.TestCase):
+    def test_dev_write_fw_module(self):
+        '''dev_write must not shadow the fw module it looks blobs up in'''
+        code = i87c51.dev_write.__wrapped__.__code__
+        self.assertNotIn('fw', code.co_varnames)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+'''S87C751 script driven read (mcs51/s87c751.py)'''
+
+from bpmicro import proto
+from bpmicro import startup
+from bpmicro.mcs51 import s87c751
+from test import capture
+
+import os
+import shutil
+import tempfile
+import unittest
+
+CODE = bytes(bytearray(i & 0xFF for i in range(2048)))
+
+# Stand in for s87c751_read.json: its "cmd" ops can't be synthesized
+OPS = [
+    ["w", "4500"],
+    ["wr", "0e02", "0000", "setup"],
+    ["cap", "code", "0b0008"],
+    ["wr", "4900", "00", "done"],
+]
+
+
+class TestRead(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.script_fn = s87c751.READ_SCRIPT
+        s87c751.READ_SCRIPT = os.path.join(self.tmp, 'read.json')
+        proto.Script(OPS).save(s87c751.READ_SCRIPT)
+
+    def tearDown(self):
+        proto.scripts.pop(s87c751.READ_SCRIPT, None)
+        s87c751.READ_SCRIPT = self.script_fn
+        shutil.rmtree(self.tmp)
+
+    def device(self):
+        j = capture.from_script(proto.Script(OPS), {'code': CODE})
+        self.bp = startup.get_replay(j)
+        return s87c751.Device(self.bp)
+
+    def test_read(self):
+        code = self.device().read({'cont': False})['code']
+        self.assertEqual(bytes(code), CODE)
+        self.assertEqual(self.bp.dev.misses, 0)
+
+    def test_read_stream(self):
+        extra = {}
+        buff = b''
+        for region, offset, this in self.device().read_stream(
+                {'cont': False}, extra=extra):
+            self.assertEqual(region, 'code')
+            self.assertEqual(offset, len(buff))
+            buff += this.tobytes()
+        self.assertEqual(buff, CODE)
+        self.assertEqual(extra, {})
+        self.assertEqual(self.bp.dev.misses, 0)
+
+    def test_cont(self):
+        '''cont (the default) runs the captured cont-n script on both paths'''
+        code = self.device().read({})['code']
+        self.assertEqual(bytes(code), CODE)
+        buff = b''.join(this.tobytes()
+                        for _region, _offset, this in self.device().read_stream(
+                            {'cont': True}))
+        self.assertEqual(buff, CODE)
+        self.assertEqual(self.bp.dev.misses, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,208 @@
+'''Code generation from captures (scrape.py)'''
+
+from bpmicro import fw
+from test import capture
+from test.test_fw import collision
+import scrape
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+I = ' ' * 8
+
+
+def s57(reply):
+    return [I + 'cmd.cmd_57s(dev, "\\x94", "%s")' % reply]
+
+
+def gpio(reply, n):
+    return [
+        I + '# Generated from packet %u/%u' % (n, n + 1),
+        I + 'buff = bulk2(dev, "\\x03", target=2)',
+        I + 'validate_read("%s", buff, "packet %u/%u")' % (reply, n + 2,
+                                                          n + 3),
+    ]
+
+
+class TestLoopFind(unittest.TestCase):
+    def test_find(self):
+        a = ((None, 'a'), )
+        b = ((None, 'b'), )
+        self.assertEqual(scrape.loop_find([a] * 4 + [b], 0), (1, 4))
+        # Too few repeats
+        self.assertEqual(scrape.loop_find([a] * 3 + [b], 0), (1, 1))
+        self.assertEqual(scrape.loop_find([b] + [a, b] * 4, 1), (2, 4))
+        # Ties go to the shortest period
+        self.assertEqual(scrape.loop_find([a] * 8, 0), (1, 8))
+        # Comment only block
+        self.assertEqual(scrape.loop_find([()] * 5, 0), (1, 1))
+
+
+class TestLoopEmit(unittest.TestCase):
+    def setUp(self):
+        self.fout = scrape.fout
+        scrape.fout = StringIO()
+        # Generated function body
+        scrape.indent = I
+        scrape.blocks = None
+        scrape.lines_clear()
+
+    def tearDown(self):
+        scrape.fout = self.fout
+        scrape.indent = ''
+        scrape.batch57 = False
+
+    def emit(self, blocks):
+        scrape.loop_emit(blocks)
+        return scrape.fout.getvalue().split('\n')[:-1]
+
+    def test_57s_varies(self):
+        '''Wire identical to the capture by default'''
+        blocks = [s57('\\x%02X\\x00' % i) for i in range(5)] + [[I + 'x()']]
+        self.assertEqual(self.emit(blocks), [
+            I + '# 5 repeats of 1 statement(s)',
+            I + 'for _i in range(5):',
+            I + '    cmd.cmd_57s(dev, "\\x94", None)',
+            I + 'x()',
+        ])
+
+    def test_57s_batch(self):
+        scrape.batch57 = True
+        blocks = [s57('\\x%02X\\x00' % i) for i in range(5)] + [[I + 'x()']]
+        self.assertEqual(self.emit(blocks), [
+            I + '# 5 repeats',
+            I + 'cmd.cmd_57s_batch(dev, ["\\x94"] * 5)',
+            I + 'x()',
+        ])
+
+    def test_57s_same(self):
+        '''Same reply every time: still checked'''
+        self.assertEqual(self.emit([s57('\\x01\\x00')] * 4), [
+            I + '# 4 repeats of 1 statement(s)',
+            I + 'for _i in range(4):',
+            I + '    cmd.cmd_57s(dev, "\\x94", "\\x01\\x00")',
+        ])
+
+    def test_validate_varies(self):
+        '''Comments are dropped from the loop body'''
+        replies = ['\\x30\\x00', '\\x31\\x00', '\\x30\\x00', '\\x31\\x00']
+        blocks = [[I + 'y()']]
+        blocks += [gpio(reply, 10 + 4 * i) for i, reply in enumerate(replies)]
+        self.assertEqual(self.emit(blocks), [
+            I + 'y()',
+            I + '# 4 repeats of 1 statement(s)',
+            I + 'for _i in range(4):',
+            I + '    buff = bulk2(dev, "\\x03", target=2)',
+            I + '    # Reply varies: not checked',
+        ])
+
+    def test_no_loop(self):
+        blocks = [s57('\\x01\\x00')] * 3
+        self.assertEqual(self.emit(blocks), s57('\\x01\\x00') * 3)
+
+
+def write_capture(fn, blobs):
+    '''Capture writing each of blobs between two status requests'''
+    cap = capture.Capture()
+    cap.wr(b'\x01', b'\x11\x22')
+    for blob in blobs:
+        cap.w(blob)
+    cap.wr(b'\x01', b'\x11\x22')
+    with open(fn, 'w') as f:
+        json.dump(cap.json(), f)
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.din = os.path.join(self.tmp, 'captures')
+        os.mkdir(self.din)
+        self.fw_dir = fw.FW_DIR
+        fw.FW_DIR = self.tmp
+        self.stdout = sys.stdout
+        sys.stdout = StringIO()
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+        fw.FW_DIR = self.fw_dir
+        shutil.rmtree(self.tmp)
+
+    def fn(self, name):
+        return os.path.join(self.din, name)
+
+    def batch(self):
+        return scrape.batch(self.din, big_thresh_=8, save=True, procs=1)
+
+    def saved(self):
+        fw_dir = os.path.join(self.tmp, 'tmp')
+        if not os.path.exists(fw_dir):
+            return {}
+        ret = {}
+        for fn in os.listdir(fw_dir):
+            with open(os.path.join(fw_dir, fn), 'rb') as f:
+                ret[os.path.splitext(fn)[0]] = f.read()
+        return ret
+
+    def test_inputs(self):
+        '''One capture per name, preferring raw captures over JSON'''
+        for name in ('a.json', 'a.pcap', 'b.json', 'b.cap', 'b.pcapng',
+                     'c.json', 'c.py', 'notes.txt'):
+            open(self.fn(name), 'w').close()
+        self.assertEqual(scrape.batch_inputs(self.din),
+                         [self.fn('a.pcap'),
+                          self.fn('b.pcapng'),
+                          self.fn('c.json')])
+
+    def test_merge(self):
+        '''Blobs seen by several jobs are saved once'''
+        shared = b'\x0E\x02shared blob'
+        write_capture(self.fn('a.json'), [shared, b'\x0E\x02only in a'])
+        write_capture(self.fn('b.json'), [shared, b'\x0E\x02only in b'])
+        self.assertEqual(self.batch(), 0)
+        for name in ('a.py', 'a_dumb.py', 'b.py', 'b_dumb.py'):
+            self.assertTrue(os.path.exists(self.fn(name)), name)
+        with open(self.fn('a.py')) as f:
+            self.assertIn('fw.hash2bin["%s"]' % fw.fwhash(shared), f.read())
+        self.assertEqual(
+            self.saved(),
+            dict((fw.fwhash(data), data)
+                 for data in (shared, b'\x0E\x02only in a',
+                              b'\x0E\x02only in b')))
+        self.assertIn('2 captures, 4 outputs, 0 failed, 3 new firmwares',
+                      sys.stdout.getvalue())
+
+    def test_collision(self):
+        '''Same hash, different contents: abort without saving anything'''
+        blob_a, blob_b = collision()
+        write_capture(self.fn('a.json'), [blob_a])
+        write_capture(self.fn('b.json'), [blob_b])
+        with self.assertRaises(Exception) as cm:
+            self.batch()
+        self.assertIn('1 hash collisions', str(cm.exception))
+        self.assertIn(
+            'Hash collision! %s: %s vs %s' %
+            (fw.fwhash(blob_a), self.fn('a.json'), self.fn('b.json')),
+            sys.stdout.getvalue())
+        self.assertEqual(self.saved(), {})
+
+    def test_failed(self):
+        '''A capture that can't be scraped fails its jobs, not the batch'''
+        write_capture(self.fn('a.json'), [b'\x0E\x02only in a'])
+        with open(self.fn('b.json'), 'w') as f:
+            f.write('{"data": [{"type": "bogus"}]}')
+        self.assertEqual(self.batch(), 2)
+        self.assertIn('b.py: FAILED', sys.stdout.getvalue())
+        self.assertEqual(list(self.saved().values()), [b'\x0E\x02only in a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
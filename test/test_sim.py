@@ -0,0 +1,137 @@
+'''Replay simulator (sim.py)'''
+
+from bpmicro import cmd
+from bpmicro import sim
+from test import capture
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import usb1
+
+
+def sample():
+    cap = capture.Capture()
+    # Sent before any request
+    cap.r(b'\x08\x16\x01\x00')
+    cap.packet({
+        'type': 'controlRead',
+        'bRequestType': 0xC0,
+        'bRequest': 0xB0,
+        'wValue': 0,
+        'wIndex': 0,
+        'wLength': 4096,
+        'data': capture.hexs(b'\x00\x00\x00')
+    })
+    # Answered in capture order, then the last one repeats
+    cap.wr(b'\x01', b'\x11')
+    cap.wr(b'\x01', b'\x22')
+    cap.w(b'\x0C\x04')
+    return cap.json()
+
+
+class TestReplayDev(unittest.TestCase):
+    def test_replay(self):
+        dev = sim.ReplayDev(sample())
+        self.assertEqual(dev.bulkRead(0x86, 0x200),
+                         capture.frames(b'\x08\x16\x01\x00')[0])
+        self.assertEqual(dev.controlRead(0xC0, 0xB0, 0, 0, 4096),
+                         b'\x00\x00\x00')
+        replies = []
+        for _i in range(3):
+            dev.bulkWrite(0x02, b'\x01')
+            replies.append(dev.bulkRead(0x86, 0x200))
+        self.assertEqual(
+            replies, capture.frames(b'\x11') + capture.frames(b'\x22') * 2)
+        self.assertEqual(dev.misses, 0)
+
+    def test_counters(self):
+        dev = sim.ReplayDev(sample())
+        dev.bulkRead(0x86, 0x200)
+        dev.controlRead(0xC0, 0xB0, 0, 0, 4096)
+        dev.bulkWrite(0x02, b'\x01')
+        # Truncated to the requested length
+        self.assertEqual(len(dev.bulkRead(0x86, 0x10)), 0x10)
+        self.assertEqual(dev.transactions, 4)
+        self.assertEqual(dev.bytes_out, 1)
+        self.assertEqual(dev.bytes_in, 0x200 + 3 + 0x10)
+        self.assertEqual(dev.misses, 0)
+
+    def test_timeout(self):
+        dev = sim.ReplayDev(sample())
+        dev.bulkRead(0x86, 0x200)
+        self.assertRaises(usb1.USBErrorTimeout, dev.bulkRead, 0x86, 0x200)
+        self.assertEqual(dev.transactions, 2)
+
+    def test_strict(self):
+        dev = sim.ReplayDev(sample())
+        with self.assertRaises(sim.ReplayMismatch) as cm:
+            dev.bulkWrite(0x02, b'\x02\x03')
+        self.assertIn('bulkWrite(0x02, 0203)', str(cm.exception))
+        self.assertRaises(sim.ReplayMismatch, dev.controlRead, 0xC0, 0xB1,
+                          0, 0, 4)
+        self.assertEqual(dev.misses, 2)
+
+    def test_lax(self):
+        dev = sim.ReplayDev(sample(), strict=False)
+        dev.bulkRead(0x86, 0x200)
+        dev.bulkWrite(0x02, b'\x02\x03')
+        self.assertEqual(dev.controlRead(0xC0, 0xB1, 0, 0, 4), b'\x00' * 4)
+        self.assertEqual(dev.misses, 2)
+        self.assertEqual(dev.transactions, 3)
+        # Nothing was queued for the unknown requests
+        self.assertRaises(usb1.USBErrorTimeout, dev.bulkRead, 0x86, 0x200)
+
+    def test_coalesced(self):
+        '''Write only commands merged in front of a request are skipped'''
+        dev = sim.ReplayDev(sample())
+        dev.bulkRead(0x86, 0x200)
+        dev.bulkWrite(0x02, b'\x0C\x04\x01')
+        self.assertEqual(dev.bulkRead(0x86, 0x200),
+                         capture.frames(b'\x11')[0])
+        self.assertEqual(dev.misses, 0)
+
+    def test_reset(self):
+        dev = sim.ReplayDev(sample(), strict=False)
+        dev.bulkRead(0x86, 0x200)
+        dev.bulkWrite(0x02, b'\x01')
+        dev.bulkWrite(0x02, b'\x02')
+        dev.reset()
+        self.assertEqual((dev.transactions, dev.bytes_in, dev.bytes_out,
+                          dev.misses), (0, 0, 0, 0))
+        self.assertEqual(dev.bulkRead(0x86, 0x200),
+                         capture.frames(b'\x08\x16\x01\x00')[0])
+        dev.bulkWrite(0x02, b'\x01')
+        self.assertEqual(dev.bulkRead(0x86, 0x200),
+                         capture.frames(b'\x11')[0])
+
+    def test_write_digest(self):
+        '''Writes from readonly steps don't count as reaching the part'''
+        dev = sim.ReplayDev(sample())
+        digest = dev.write_digest.hexdigest()
+        cmd.ro_depth += 1
+        try:
+            dev.bulkWrite(0x02, b'\x01')
+        finally:
+            cmd.ro_depth -= 1
+        self.assertEqual(dev.write_digest.hexdigest(), digest)
+        dev.bulkWrite(0x02, b'\x01')
+        self.assertNotEqual(dev.write_digest.hexdigest(), digest)
+
+    def test_file(self):
+        d = tempfile.mkdtemp()
+        try:
+            fn = os.path.join(d, 'cap.json')
+            with open(fn, 'w') as f:
+                json.dump(sample(), f)
+            dev = sim.ReplayDev(fn)
+            self.assertEqual(len(dev.bulkRead(0x86, 0x200)), 0x200)
+        finally:
+            shutil.rmtree(d)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+'''Adapter startup (startup.py)'''
+
+from bpmicro import startup
+from bpmicro import usb
+
+from collections import deque
+import struct
+import unittest
+
+import usb1
+
+
+def frame(payload, prefix=0x08):
+    return (struct.pack('<B', prefix) + payload + b'\x00' *
+            (509 - len(payload)) + struct.pack('<H', len(payload)))
+
+
+class ProbeDev(object):
+    '''
+    status: 0xB0 reply, None to stall as the boot ROM does
+    sig: signature payload posted on 0x86 after each 0xB0 read, None for none
+    '''
+    def __init__(self, status=b'\x00\x00\x00', sig=b'\x08\x16\x01\x00',
+                 pending=()):
+        self.status = status
+        self.sig = sig
+        self.frames = deque(pending)
+        self.b0_reads = 0
+
+    def controlRead(self, request_type, request, value, index, length,
+                    timeout=None):
+        self.b0_reads += 1
+        if self.status is None:
+            raise usb1.USBErrorPipe()
+        if self.sig is not None:
+            self.frames.append(frame(self.sig))
+        return self.status
+
+    def bulkRead(self, endpoint, length, timeout=None):
+        if not self.frames:
+            raise usb1.USBErrorTimeout()
+        return self.frames.popleft()
+
+
+class TestProbe(unittest.TestCase):
+    def test_running(self):
+        dev = ProbeDev()
+        self.assertEqual(startup.fx2_probe(dev), b'\x08\x16\x01\x00')
+        self.assertFalse(dev.frames)
+
+    def test_boot_rom(self):
+        self.assertEqual(startup.fx2_probe(ProbeDev(status=None)), None)
+
+    def test_unknown_sig(self):
+        self.assertEqual(startup.fx2_probe(ProbeDev(sig=b'\x99')), None)
+
+    def test_stale_frames(self):
+        '''Frames left by an earlier session are not taken as the signature'''
+        dev = ProbeDev(pending=[frame(b'\x99'), frame(b'\x16')])
+        self.assertEqual(startup.fx2_probe(dev), b'\x08\x16\x01\x00')
+        self.assertFalse(dev.frames)
+
+    def test_sig_consumed(self):
+        '''No signature after the first status read: retried'''
+        dev = ProbeDev(sig=None)
+        orig = dev.controlRead
+
+        def control_read(*args, **kwargs):
+            ret = orig(*args, **kwargs)
+            dev.sig = b'\x16'
+            return ret
+
+        dev.controlRead = control_read
+        self.assertEqual(startup.fx2_probe(dev), b'\x16')
+        self.assertEqual(dev.b0_reads, 2)
+
+    def test_no_sig(self):
+        self.assertEqual(startup.fx2_probe(ProbeDev(sig=None)), None)
+
+
+class HandleDev(object):
+    '''Raw usb1 handle stand in'''
+    def __init__(self):
+        self.calls = []
+
+    def releaseInterface(self, interface):
+        self.calls.append('release')
+
+    def close(self):
+        self.calls.append('close')
+
+
+class TestClose(unittest.TestCase):
+    def test_close(self):
+        dev = HandleDev()
+        bp = usb.Transport(dev, None)
+        # Raw handle user
+        usb.usb_wraps(dev)
+        self.assertIn(dev, usb.transports)
+        startup.close(bp)
+        self.assertNotIn(dev, usb.transports)
+        self.assertEqual(dev.calls, ['release', 'close'])
+
+    def test_transport_close(self):
+        dev = HandleDev()
+        cached = usb.transport(dev)
+        self.assertIs(usb.transport(dev), cached)
+        cached.close()
+        self.assertNotIn(dev, usb.transports)
+        self.assertIsNot(usb.transport(dev), cached)
+        usb.transport_close(dev)
+        self.assertNotIn(dev, usb.transports)
+
+
+if __name__ == '__main__':
+    unittest.main()
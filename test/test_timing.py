@@ -0,0 +1,105 @@
+'''Capture timing profile (timing.py)'''
+
+from bpmicro import timing
+from bpmicro.packet import Packet
+
+import struct
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+def frame(payload, prefix=0x08):
+    return (struct.pack('<B', prefix) + payload + b'\x00' *
+            (509 - len(payload)) + struct.pack('<H', len(payload)))
+
+
+class Capture(object):
+    '''Builds a packet list, each transfer taking dt seconds'''
+    def __init__(self):
+        self.t = 100.0
+        self.ps = []
+
+    def xfer(self, t, data, dt):
+        endp = 0x02 if t == 'bulkWrite' else 0x86
+        self.ps.append(Packet(t, data=data, endp=endp,
+                              ts=(self.t, self.t + dt)))
+        self.t += dt
+
+    def w(self, data, dt=0.001):
+        self.xfer('bulkWrite', data, dt)
+
+    def r(self, payload, dt=0.001, prefix=0x08):
+        self.xfer('bulkRead', frame(payload, prefix), dt)
+
+
+class TestTiming(unittest.TestCase):
+    def assertPhase(self, profile, name, count, time, nbytes=0):
+        phase = profile.phases[name]
+        self.assertEqual(phase.count, count, name)
+        self.assertAlmostEqual(phase.time, time, 6)
+        self.assertEqual(phase.bytes, nbytes, name)
+
+    def test_announced(self):
+        self.assertEqual(timing.announced(b'\x50\x18\x00\x00\x00'), 0x18)
+        self.assertEqual(
+            timing.announced(b'\x20\x01\x00\x50\x0A\x06\x00\x00'), 0x060A)
+        self.assertEqual(
+            timing.announced(b'\x57\x82\x00\x50\x1D\x00\x00\x00'), 0x1D)
+        self.assertEqual(timing.announced(b'\x57\x85\x00'), None)
+        self.assertEqual(timing.announced(b'\x02'), None)
+
+    def test_phases(self):
+        cap = Capture()
+        # Algorithm upload: announce, payload, ack
+        cap.w(b'\x20\x01\x00\x50\x04\x00\x00\x00')
+        cap.w(b'\x66\xB8\x01\x2D', 0.002)
+        cap.r(b'\x8F\x00', 0.003)
+        # A payload that doesn't match the announced size is not an upload
+        cap.w(b'\x50\x08\x00\x00\x00')
+        cap.w(b'\x01\x02', 0.001)
+        cap.r(b'\x00\x00')
+        # Image write: two chunks
+        cap.w(b'\x02\x00\xAA\xAA')
+        cap.r(b'\x0B', prefix=0x18)
+        cap.w(b'\x01\x00\xAA')
+        cap.r(b'\x00')
+        # Continuity
+        cap.w(b'\x57\x85\x00')
+        cap.r(b'\x01', 0.05)
+        # Readback: 2 frames
+        cap.w(b'\x08\x00\x57\x8A\x00')
+        cap.r(b'\x5A' * 0x1FD)
+        cap.r(b'\x5A' * 0x10)
+        profile = timing.load(cap.ps, 'test')
+        self.assertPhase(profile, 'upload', 1, 0.006, 4)
+        self.assertPhase(profile, 'write', 1, 0.004, 3)
+        self.assertPhase(profile, 'cont', 1, 0.051)
+        self.assertPhase(profile, 'readback', 1, 0.003, 0x1FD + 0x10)
+        opstats = profile.stats.opcodes[0x57]
+        self.assertEqual(opstats.replies, 1)
+        self.assertAlmostEqual(opstats.latency, 0.051, 6)
+
+    def test_compare(self):
+        ref = Capture()
+        ref.w(b'\x57\x85\x00')
+        ref.r(b'\x01', 0.05)
+        ours = Capture()
+        ours.w(b'\x57\x85\x00')
+        ours.r(b'\x01', 0.1)
+        f = StringIO()
+        timing.compare(timing.load(ref.ps, 'ref'), timing.load(ours.ps, 'ours'),
+                       f=f)
+        self.assertIn('cont', f.getvalue())
+        self.assertIn('1.98x', f.getvalue())
+
+    def test_no_timestamps(self):
+        self.assertRaises(timing.TimingError, timing.load,
+                          [Packet('bulkWrite', data=b'\x01', endp=0x02)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+'''USB helpers (usb.py)'''
+
+from bpmicro import usb
+
+from collections import deque
+import sys
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import usb1
+
+
+class FakeTransfer(object):
+    def __init__(self, handle):
+        self.handle = handle
+        self.submitted = False
+        self.cancelled = False
+        self.closed = False
+        self.status = None
+        self.buff = b''
+
+    def setBulk(self, endpoint, length, callback, timeout):
+        self.endpoint = endpoint
+        self.length = length
+        self.callback = callback
+
+    def submit(self):
+        self.submitted = True
+        self.handle.queue.append(self)
+
+    def cancel(self):
+        self.cancelled = True
+
+    def isSubmitted(self):
+        return self.submitted
+
+    def getStatus(self):
+        return self.status
+
+    def getBuffer(self):
+        return bytearray(self.buff) + bytearray(self.length - len(self.buff))
+
+    def getActualLength(self):
+        return len(self.buff)
+
+    def close(self):
+        self.closed = True
+
+    def complete(self, status, buff=b''):
+        self.handle.queue.remove(self)
+        self.submitted = False
+        self.status = status
+        self.buff = buff
+        self.callback(self)
+
+
+class FakeHandle(object):
+    '''
+    frames: what the device will send on 0x86
+    errors: transfer status to fail the next transfer with instead
+    '''
+    def __init__(self, frames=()):
+        self.frames = deque(frames)
+        self.errors = deque()
+        # Submitted transfers, oldest first
+        self.queue = []
+        self.transfers = []
+        self.events = 0
+
+    def getTransfer(self):
+        transfer = FakeTransfer(self)
+        self.transfers.append(transfer)
+        return transfer
+
+    def bulkRead(self, endpoint, length, timeout=None):
+        raise AssertionError("Synchronous read with async reads enabled")
+
+    # usbcontext
+    def handleEventsTimeout(self, timeout):
+        self.events += 1
+        for transfer in [t for t in self.queue if t.cancelled]:
+            transfer.complete(usb1.TRANSFER_CANCELLED)
+        if self.queue and self.errors:
+            self.queue[0].complete(self.errors.popleft())
+        elif self.queue and self.frames:
+            self.queue[0].complete(usb1.TRANSFER_COMPLETED,
+                                   self.frames.popleft())
+
+
+class TestAsyncBulkReader(unittest.TestCase):
+    def test_submit(self):
+        handle = FakeHandle()
+        usb.AsyncBulkReader(handle, handle, 0x86, depth=3)
+        self.assertEqual(len(handle.queue), 3)
+        for transfer in handle.transfers:
+            self.assertEqual(transfer.endpoint, 0x86)
+            self.assertEqual(transfer.length, 0x200)
+
+    def test_order(self):
+        handle = FakeHandle([b'a', b'bb', b'ccc', b'dddd', b'e'])
+        reader = usb.AsyncBulkReader(handle, handle, 0x86, depth=2)
+        self.assertEqual(reader.read(0x200), b'a')
+        # Completed transfers go back on the queue
+        self.assertEqual(len(handle.queue), 2)
+        # Frames that arrive early are buffered, not dropped
+        handle.handleEventsTimeout(0)
+        handle.handleEventsTimeout(0)
+        self.assertEqual(list(reader.frames), [b'bb', b'ccc'])
+        self.assertEqual([reader.read(0x200) for _i in range(4)],
+                         [b'bb', b'ccc', b'dddd', b'e'])
+
+    def test_length(self):
+        handle = FakeHandle([b'a'])
+        reader = usb.AsyncBulkReader(handle, handle, 0x86, depth=1)
+        self.assertRaises(ValueError, reader.read, 0x201)
+
+    def test_timeout(self):
+        handle = FakeHandle()
+        reader = usb.AsyncBulkReader(handle, handle, 0x86, depth=1)
+        self.assertRaises(usb1.USBErrorTimeout, reader.read, 0x200, timeout=10)
+        self.assertTrue(handle.events > 0)
+        # Nothing is lost by a timeout
+        handle.frames.append(b'late')
+        self.assertEqual(reader.read(0x200), b'late')
+
+    def test_error(self):
+        handle = FakeHandle([b'a'])
+        handle.errors.append(usb1.TRANSFER_STALL)
+        reader = usb.AsyncBulkReader(handle, handle, 0x86, depth=2)
+        self.assertRaises(usb1.USBErrorPipe, reader.read, 0x200)
+        self.assertIsNone(reader.error)
+        self.assertEqual(reader.read(0x200), b'a')
+
+    def test_close(self):
+        handle = FakeHandle([b'a'])
+        reader = usb.AsyncBulkReader(handle, handle, 0x86, depth=3)
+        reader.read(0x200)
+        reader.close()
+        self.assertEqual(handle.queue, [])
+        self.assertEqual(reader.transfers, [])
+        for transfer in handle.transfers:
+            self.assertTrue(transfer.cancelled)
+            self.assertTrue(transfer.closed)
+            self.assertFalse(transfer.submitted)
+
+    def test_close_completed(self):
+        # A frame landing while closing is kept but not resubmitted
+        handle = FakeHandle()
+        reader = usb.AsyncBulkReader(handle, handle, 0x86, depth=1)
+        reader.closing = True
+        handle.frames.append(b'a')
+        handle.handleEventsTimeout(0)
+        self.assertEqual(handle.queue, [])
+        reader.close()
+        self.assertEqual(list(reader.frames), [b'a'])
+
+    def test_transport(self):
+        handle = FakeHandle([b'a', b'b'])
+        transport = usb.Transport(handle, handle, async_depth=2)
+        self.assertEqual(transport.bulkRead(0x86, 0x200), b'a')
+        self.assertEqual(transport.bulkRead(0x86, 0x200), b'b')
+        transport.close()
+        self.assertIsNone(transport.reader86)
+        self.assertEqual(handle.queue, [])
+
+
+class TestValidate(unittest.TestCase):
+    def setUp(self):
+        usb.last_mismatch = None
+
+    def tearDown(self):
+        usb.do_exception = True
+
+    def test_match(self):
+        usb.validate_read(b'\x08\x16', b'\x08\x16', 'sig')
+        usb.validate_read(None, b'\x01', 'unchecked')
+        usb.validate_read(3, 3, 'count')
+        usb.validate_readv([b'\x01', b'\x02'], b'\x02', 'either')
+        self.assertIsNone(usb.last_mismatch)
+
+    def test_mismatch(self):
+        with self.assertRaises(usb.ValidateError) as cm:
+            usb.validate_read(b'\x08\x16', b'\x08\x17', 'packet 1/2')
+        mismatch = cm.exception.mismatch
+        self.assertIs(usb.last_mismatch, mismatch)
+        self.assertEqual(mismatch.msg, 'packet 1/2')
+        self.assertEqual(mismatch.expecteds, [b'\x08\x16'])
+        self.assertEqual(mismatch.actual, b'\x08\x17')
+        s = str(cm.exception)
+        self.assertTrue(s.startswith('failed validate: packet 1/2\n'))
+        self.assertIn('Failed packet 1/2', s)
+        self.assertIn('Expected; 2', s)
+        self.assertIn('Actual; 2', s)
+
+    def test_mismatch_int(self):
+        with self.assertRaises(usb.ValidateError) as cm:
+            usb.validate_read(3, 4, 'count')
+        self.assertIn('Actual; 4 0x0004', str(cm.exception.mismatch))
+
+    def test_mismatchv(self):
+        with self.assertRaises(usb.ValidateError) as cm:
+            usb.validate_readv([b'\x01', b'\x02'], b'\x03', 'either')
+        self.assertEqual(str(cm.exception.mismatch).count('Expected'), 2)
+
+    def test_no_exception(self):
+        usb.do_exception = False
+        stdout, sys.stdout = sys.stdout, StringIO()
+        try:
+            usb.validate_read(b'\x01', b'\x02', 'soft')
+            out = sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+        self.assertEqual(usb.last_mismatch.msg, 'soft')
+        self.assertIn('Failed soft', out)
+
+
+if __name__ == '__main__':
+    unittest.main()
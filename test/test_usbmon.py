@@ -0,0 +1,145 @@
+'''usbmon capture reader (usbmon.py)'''
+
+from bpmicro import usbmon
+
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+hdr = struct.Struct('<QcBBBHccqiiII8s')
+NO_SETUP = b'\x00' * 8
+
+
+def event(urb_id, e, xfer, endp, dev, t, data=b'', setup=NO_SETUP, status=0,
+          linktype=usbmon.LINKTYPE_USB_LINUX_MMAPPED):
+    ret = hdr.pack(urb_id, e, xfer, endp, dev, 1,
+                   b'\x00' if setup != NO_SETUP else b'-', b'=', int(t),
+                   int(round((t % 1) * 1e6)), status, len(data), len(data),
+                   setup)
+    ret += b'\x00' * (usbmon.usbmon_hdr_lens[linktype] - hdr.size)
+    return ret + data
+
+
+def frame(payload, prefix=0x08):
+    return (struct.pack('<B', prefix) + payload + b'\x00' *
+            (509 - len(payload)) + struct.pack('<H', len(payload)))
+
+
+def events(linktype=usbmon.LINKTYPE_USB_LINUX_MMAPPED):
+    '''
+    Device 3: boot FX2 (firmware load)
+    Device 5: re-enumerated with firmware
+    '''
+    X_CTL = usbmon.XFER_CONTROL
+    X_BULK = usbmon.XFER_BULK
+
+    def ev(*args, **kwargs):
+        kwargs['linktype'] = linktype
+        return event(*args, **kwargs)
+
+    return [
+        ev(1, b'S', X_CTL, 0x00, 3, 100.0, b'\x01',
+           struct.pack('<BBHHH', 0x40, 0xA0, 0xE600, 0, 1)),
+        ev(1, b'C', X_CTL, 0x00, 3, 100.001),
+        # Standard request: dropped
+        ev(2, b'S', X_CTL, 0x80, 5, 100.1, b'',
+           struct.pack('<BBHHH', 0x80, 6, 0x100, 0, 18)),
+        ev(2, b'C', X_CTL, 0x80, 5, 100.101, b'\x12' * 18),
+        ev(3, b'S', X_CTL, 0x80, 5, 100.2, b'',
+           struct.pack('<BBHHH', 0xC0, 0xB0, 0, 0, 4096)),
+        ev(3, b'C', X_CTL, 0x80, 5, 100.201, b'\x00\x00\x00'),
+        ev(4, b'S', X_BULK, 0x02, 5, 100.3, b'\x03'),
+        ev(4, b'C', X_BULK, 0x02, 5, 100.301),
+        ev(5, b'S', X_BULK, 0x86, 5, 100.302),
+        ev(5, b'C', X_BULK, 0x86, 5, 100.305, frame(b'\x31\x00')),
+        # Cancelled read: dropped
+        ev(6, b'S', X_BULK, 0x86, 5, 100.5),
+        ev(6, b'C', X_BULK, 0x86, 5, 100.6, status=-2),
+    ]
+
+
+def pad(b):
+    return b + b'\x00' * (-len(b) % 4)
+
+
+def block(btype, body):
+    body = pad(body)
+    n = len(body) + 12
+    return struct.pack('<II', btype, n) + body + struct.pack('<I', n)
+
+
+class TestUsbmon(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def pcap(self, linktype=usbmon.LINKTYPE_USB_LINUX_MMAPPED):
+        fn = os.path.join(self.tmp, 'cap.pcap')
+        with open(fn, 'wb') as f:
+            f.write(
+                struct.pack('<IHHiIII', 0xa1b2c3d4, 2, 4, 0, 0, 65535,
+                            linktype))
+            for e in events(linktype):
+                f.write(struct.pack('<IIII', 0, 0, len(e), len(e)) + e)
+        return fn
+
+    def pcapng(self):
+        fn = os.path.join(self.tmp, 'cap.pcapng')
+        with open(fn, 'wb') as f:
+            f.write(
+                block(0x0A0D0D0A, struct.pack('<IHHq', 0x1A2B3C4D, 1, 0, -1)))
+            f.write(
+                block(usbmon.PCAPNG_IDB,
+                      struct.pack('<HHI', usbmon.LINKTYPE_USB_LINUX_MMAPPED,
+                                  0, 65535)))
+            for e in events():
+                f.write(
+                    block(usbmon.PCAPNG_EPB,
+                          struct.pack('<IIIII', 0, 0, 0, len(e), len(e)) + e))
+        return fn
+
+    def check(self, fn):
+        ps = list(usbmon.packets(fn))
+        self.assertEqual([p.type for p in ps],
+                         ['controlRead', 'bulkWrite', 'bulkRead'])
+        cr, w, r = ps
+        self.assertEqual((cr.bRequestType, cr.bRequest, cr.wLength),
+                         (0xC0, 0xB0, 4096))
+        self.assertEqual(cr.data, b'\x00\x00\x00')
+        self.assertEqual(cr.packn, (5, 6))
+        self.assertEqual((w.endp, w.data), (0x02, b'\x03'))
+        self.assertEqual(w.packn, (7, 8))
+        self.assertAlmostEqual(w.ts[0], 100.3, places=5)
+        self.assertAlmostEqual(w.ts[1], 100.301, places=5)
+        self.assertEqual((r.endp, r.data), (0x86, frame(b'\x31\x00')))
+
+    def test_pcap(self):
+        self.check(self.pcap())
+
+    def test_pcap_legacy(self):
+        self.check(self.pcap(linktype=usbmon.LINKTYPE_USB_LINUX))
+
+    def test_pcapng(self):
+        self.check(self.pcapng())
+
+    def test_device(self):
+        fn = self.pcap()
+        self.assertEqual(usbmon.device_hi(fn), (1, 5))
+        ps = list(usbmon.packets(fn, device=3))
+        self.assertEqual([(p.type, p.wValue, p.data) for p in ps],
+                         [('controlWrite', 0xE600, b'\x01')])
+        self.assertEqual(list(usbmon.packets(fn, device=3, bus=2)), [])
+
+    def test_not_pcap(self):
+        fn = os.path.join(self.tmp, 'cap.json')
+        with open(fn, 'wb') as f:
+            f.write(b'{"data": []}')
+        self.assertRaises(usbmon.CaptureError, list, usbmon.packets(fn))
+
+
+if __name__ == '__main__':
+    unittest.main()